@@ -1,20 +1,114 @@
+# Startup timeline, printed with --profile-startup
+
+import time
+STARTED = time.perf_counter()
+
 from PyQt5.QtWidgets import QMainWindow, QVBoxLayout, QWidget
 from PyQt5.QtWidgets import QToolBar, QMessageBox, QFileDialog 
 from PyQt5.QtWidgets import QDesktopWidget, QSplitter
 from PyQt5.QtWidgets import QPlainTextEdit, QStatusBar 
 from PyQt5.QtWidgets import QApplication, QAction, QLabel, QActionGroup
-from PyQt5.QtGui import QFontDatabase, QIcon, QFont
-from PyQt5.QtCore import Qt
-from PyQt5.QtPrintSupport import QPrintDialog
+from PyQt5.QtWidgets import QTabWidget, QListWidget, QListWidgetItem
+from PyQt5.QtWidgets import QProgressBar, QPushButton
+from PyQt5.QtWidgets import QDialog, QFormLayout, QDoubleSpinBox, QCheckBox, QDialogButtonBox
+from PyQt5.QtGui import QFontDatabase, QIcon, QFont, QTextCursor
+from PyQt5.QtCore import Qt, QThread, QTimer, QResource, pyqtSignal
 import os
-import sys
-import imgqrc
 import re
-from pythonosc.udp_client import SimpleUDPClient 
-from time import sleep
-import netifaces
+import sys
+import sbcompiler
+import sbhighlight
+import sblog
+import sbworkers
+
+# Print support, the upload engine (asyncio and python-osc) and netifaces
+# are imported where they are first used, after the window is up.
+
+PROFILE = '--profile-startup' in sys.argv
+last_mark = STARTED
+
+def mark(phase):
+    # One line of the startup timeline: time since start, time since the
+    # previous mark and the phase that just ended
+    global last_mark
+    now = time.perf_counter()
+    if PROFILE:
+        print('%8.1f ms %+8.1f ms  %s' % ((now - STARTED) * 1000,
+                                         (now - last_mark) * 1000, phase),
+              file=sys.stderr)
+    last_mark = now
+
+mark('imports')
+
+# Icons, compiled from img.qrc into the binary img.rcc, which Qt maps from
+# disk on registration instead of Python parsing it as a module
+
+RESOURCES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'img.rcc')
+
+def register_resources():
+    if not QResource.registerResource(RESOURCES):
+        print('Warning: cannot load ' + RESOURCES, file=sys.stderr)
+
+class PacingDialog(QDialog):
+    # Rate limits of the installation, see sbupload.Pacing
+    
+    def __init__(self, pacing, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Upload pacing")
+        layout = QFormLayout(self)
+        
+        self.rate = self.spinbox(pacing.rate, 0.1, 10000)
+        self.ack_rate = self.spinbox(pacing.ack_rate, 0.1, 10000)
+        self.global_rate = self.spinbox(pacing.global_rate, 0, 100000)
+        self.global_rate.setSpecialValueText("Unlimited")
+        self.minimum = self.spinbox(pacing.minimum, 0.1, 10000)
+        self.adaptive = QCheckBox("Adapt to losses and round trip time")
+        self.adaptive.setChecked(pacing.adaptive)
+        
+        layout.addRow("Messages/s per module", self.rate)
+        layout.addRow("Messages/s per module with acks", self.ack_rate)
+        layout.addRow("Messages/s in total", self.global_rate)
+        layout.addRow("Minimum messages/s", self.minimum)
+        layout.addRow(self.adaptive)
+        
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel |
+                                   QDialogButtonBox.RestoreDefaults)
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        buttons.button(QDialogButtonBox.RestoreDefaults).clicked.connect(self.defaults)
+        layout.addRow(buttons)
+    
+    def spinbox(self, value, minimum, maximum):
+        spinbox = QDoubleSpinBox()
+        spinbox.setDecimals(1)
+        spinbox.setRange(minimum, maximum)
+        spinbox.setValue(value)
+        return spinbox
+    
+    def defaults(self):
+        import sbupload
+        pacing = sbupload.Pacing()
+        self.rate.setValue(pacing.rate)
+        self.ack_rate.setValue(pacing.ack_rate)
+        self.global_rate.setValue(pacing.global_rate)
+        self.minimum.setValue(pacing.minimum)
+        self.adaptive.setChecked(pacing.adaptive)
+    
+    def pacing(self):
+        import sbupload
+        return sbupload.Pacing(self.rate.value(), self.ack_rate.value(),
+                               self.global_rate.value(), self.minimum.value(),
+                               self.adaptive.isChecked())
 
 class MainWindow(QMainWindow):
+    # Requests to the validation worker
+    reset_requested = pyqtSignal(list)
+    splice_requested = pyqtSignal(int, int, list)
+    compile_requested = pyqtSignal(int)
+    # Request to the upload worker
+    upload_requested = pyqtSignal(object, object, object, object)
+    discover_requested = pyqtSignal(str, str, float)
+
     def __init__(self):
         super().__init__()
 
@@ -26,6 +120,7 @@ class MainWindow(QMainWindow):
         qtRectangle.moveCenter(centerPoint)
         self.move(qtRectangle.topLeft())
         
+        register_resources()
         self.setWindowIcon(QIcon(":/img/icon.jpg"))
 
         # Layout
@@ -49,19 +144,72 @@ class MainWindow(QMainWindow):
         self.console.setFont(fixedfont)
         
         self.console.setReadOnly(True)
+        self.console.cursorPositionChanged.connect(self.console_clicked)
         self.console.setStyleSheet('QPlainTextEdit {background-color: black; color: white;}')
         
+        # Messages reach the console in batches, through the log sink
+        
+        self.log = sblog.ConsoleLog(self.console)
+        
+        # Syntax coloring and error underlines, line by line as they change
+        
+        self.highlighter = sbhighlight.Highlighter(self.editor.document(), self.editor)
+        
         # Path of the currently open file.
 
         self.path = None
 
+        # Compiled lines of the editor, kept in step with every edit so
+        # verify only compiles the lines that changed.
+
+        self.compiler = sbcompiler.IncrementalCompiler([''])
+        self.blockcount = 1
+        self.editor.document().contentsChange.connect(self.editor_changed)
+
+        # Background validation: the worker keeps its own copy of the
+        # compiled lines and compiles them once typing pauses.
+
+        self.revision = 0
+        self.validation_thread = QThread(self)
+        self.validation_worker = sbworkers.ValidationWorker()
+        self.validation_worker.moveToThread(self.validation_thread)
+        self.reset_requested.connect(self.validation_worker.reset)
+        self.splice_requested.connect(self.validation_worker.splice)
+        self.compile_requested.connect(self.validation_worker.compile)
+        self.validation_worker.compiled.connect(self.validated)
+        self.validation_thread.start()
+
+        self.validation_timer = QTimer(self)
+        self.validation_timer.setSingleShot(True)
+        self.validation_timer.setInterval(400)
+        self.validation_timer.timeout.connect(
+            lambda: self.compile_requested.emit(self.revision))
+
+        # Uploads run in their own thread, started by the first upload or
+        # discovery; self.uploader is the upload in progress, if any.
+
+        self.uploader = None
+        self.upload_thread = None
+        self.upload_worker = None
+
+        # Problems found by the background validation
+
+        self.problems = QListWidget()
+        self.problems.setFont(fixedfont)
+        self.problems.itemActivated.connect(self.goto_problem)
+        self.problems.itemClicked.connect(self.goto_problem)
+
         # Add editors to splitter and layout
         
         splitter = QSplitter(Qt.Vertical)
         splitter.setChildrenCollapsible(False)
 
+        self.tabs = QTabWidget()
+        self.tabs.addTab(self.console, 'Console')
+        self.tabs.addTab(self.problems, 'Problems')
+
         splitter.addWidget(self.editor)
-        splitter.addWidget(self.console)
+        splitter.addWidget(self.tabs)
 
         layout.addWidget(splitter)
 
@@ -84,18 +232,30 @@ class MainWindow(QMainWindow):
         self.status.setSizeGripEnabled(False)
         self.status.addWidget(self.statuslabel, 1)
         
-        interfaces = netifaces.interfaces()
-        self.ips = list()
-        for interface in interfaces:
-            addrs = netifaces.ifaddresses(interface)
-            if netifaces.AF_INET in addrs.keys():
-                ip = addrs[netifaces.AF_INET][0]['addr']
-                if ip != '127.0.0.1':
-                    self.ips.append(ip)
+        self.progressbar = QProgressBar()
+        self.progressbar.setMaximumWidth(200)
+        self.progressbar.hide()
+        self.status.addPermanentWidget(self.progressbar)
+        
+        self.cancel_button = QPushButton('Cancel')
+        self.cancel_button.clicked.connect(self.upload_cancel)
+        self.cancel_button.hide()
+        self.status.addPermanentWidget(self.cancel_button)
+        
+        # Network interfaces, scanned and then watched for changes on their
+        # own thread once the window is shown
         
-        self.iplocal = self.ips[0]
-        self.network = self.iplocal[0:self.iplocal.rfind('.')+1]
-        self.statuslabel.setText('NETWORK ' + self.network + '0 ' + '  IP ' + self.iplocal + "    ")
+        self.interfaces = list()
+        self.iplocal = ''
+        self.network = ''
+        self.online = ''
+        self.statuslabel.setText('Scanning network interfaces...    ')
+        
+        self.interface_thread = QThread(self)
+        self.interface_worker = sbworkers.InterfaceWorker()
+        self.interface_worker.moveToThread(self.interface_thread)
+        self.interface_thread.started.connect(self.interface_worker.watch)
+        self.interface_worker.changed.connect(self.interfaces_changed)
 
         # Menus
         
@@ -201,24 +361,61 @@ class MainWindow(QMainWindow):
         verify_action.triggered.connect(self.verify)
         config_menu.addAction(verify_action)
         
-        upload_action = QAction("Upload", self)
-        upload_action.setShortcut('Ctrl+U')
-        upload_action.triggered.connect(self.upload)
-        config_menu.addAction(upload_action)
+        self.upload_action = QAction("Upload", self)
+        self.upload_action.setShortcut('Ctrl+U')
+        self.upload_action.triggered.connect(self.upload)
+        config_menu.addAction(self.upload_action)
         
-        config_menu.addSeparator()
-        ip_menu = config_menu.addMenu("IP Address (Network)")
+        discover_action = QAction("Discover modules", self)
+        discover_action.setShortcut('Ctrl+D')
+        discover_action.triggered.connect(self.discover)
+        config_menu.addAction(discover_action)
         
+        config_menu.addSeparator()
+        self.ip_menu = config_menu.addMenu("IP Address (Network)")
         self.ip_action = list()
-        IPGroup = QActionGroup(self)
-        for n,ip in enumerate(self.ips):
-            self.ip_action.append(QAction(ip + ' (' + ip[0:ip.rfind('.')+1] + '0)', self))
-            self.ip_action[n].setCheckable(True)
-            self.ip_action[n].setChecked(False)
-            self.ip_action[n].triggered.connect(self.edit_toggle_ip)
-            ip_menu.addAction(self.ip_action[n])
-            IPGroup.addAction(self.ip_action[n])
-        self.ip_action[0].setChecked(True)
+        self.ip_group = None
+        
+        # Filled when first opened, the default comes from the upload engine
+        
+        self.jobs_menu = config_menu.addMenu("Parallel uploads")
+        self.jobs_menu.aboutToShow.connect(self.fill_jobs_menu)
+        self.jobs = None
+        self.jobs_action = list()
+        
+        self.ack_action = QAction("Wait for acknowledgements", self)
+        self.ack_action.setCheckable(True)
+        self.ack_action.setChecked(False)
+        config_menu.addAction(self.ack_action)
+        
+        self.bundle_action = QAction("Send programs as OSC bundles", self)
+        self.bundle_action.setCheckable(True)
+        self.bundle_action.setChecked(False)
+        config_menu.addAction(self.bundle_action)
+        
+        self.discover_action = QAction("Skip offline modules", self)
+        self.discover_action.setCheckable(True)
+        self.discover_action.setChecked(False)
+        config_menu.addAction(self.discover_action)
+        
+        self.force_action = QAction("Force full upload", self)
+        self.force_action.setCheckable(True)
+        self.force_action.setChecked(False)
+        config_menu.addAction(self.force_action)
+        
+        self.log_action = QAction("Keep a console log (.sblog)", self)
+        self.log_action.setCheckable(True)
+        self.log_action.setChecked(False)
+        self.log_action.triggered.connect(self.update_log_file)
+        config_menu.addAction(self.log_action)
+        
+        # Pacing of the installation, kept next to its .sbc file
+        
+        self.pacing = None
+        self.pacing_changed = False
+        pacing_action = QAction("Pacing...", self)
+        pacing_action.triggered.connect(self.edit_pacing)
+        config_menu.addAction(pacing_action)
         
         # uploadvalidate_action = QAction("Upload and verify", self)
         # uploadvalidate_action.setCheckable(True)
@@ -242,14 +439,21 @@ class MainWindow(QMainWindow):
         verify_toolbar_action.triggered.connect(self.verify)
         toolbar.addAction(verify_toolbar_action)
         
-        upload_toolbar_action = QAction(QIcon(":/img/arrow_icon.png"), "Upload", self)
-        upload_toolbar_action.triggered.connect(self.upload)
-        toolbar.addAction(upload_toolbar_action)
+        self.upload_toolbar_action = QAction(QIcon(":/img/arrow_icon.png"), "Upload", self)
+        self.upload_toolbar_action.triggered.connect(self.upload)
+        toolbar.addAction(self.upload_toolbar_action)
         
         # Show window
         
         self.update_title()
+        # Upload is off until the interface scan finds an address
+        self.update_upload_actions()
+        
         self.show()
+        
+        # The rest of the startup runs once the window is painted
+        
+        QTimer.singleShot(0, self.startup)
 
         # Set split window sizes 
         
@@ -292,13 +496,15 @@ class MainWindow(QMainWindow):
             else:
                 # update path value
                 self.path = path
+                self.pacing = None
+                self.pacing_changed = False
 
                 # update the text
                 self.editor.setPlainText(text)
             
-                self.console.clear()
-                self.console.setPlainText('File ' + os.path.basename(self.path) +
-                                          ' loaded.'  + '\n')                
+                self.log.clear()
+                self.update_log_file()
+                self.log.write('File ' + os.path.basename(self.path) + ' loaded.')
     
                 # update the title
                 self.update_title()
@@ -350,10 +556,16 @@ class MainWindow(QMainWindow):
         else:
             # change path
             self.path = path
+            if self.pacing_changed:
+                self.save_pacing()
+            self.update_log_file()
             # update the title
             self.update_title()
 
     def file_print(self):
+        from PyQt5.QtPrintSupport import QPrintDialog
+        mark('print support')
+        
         # creating a QPrintDialog
         dlg = QPrintDialog()
 
@@ -366,6 +578,22 @@ class MainWindow(QMainWindow):
     def file_quit(self):
         self.close()
 
+    def closeEvent(self, event):
+        # Modules in progress are left as they were; waiting for them could
+        # take tens of seconds at the slower rates
+        if self.uploader:
+            self.uploader.abort()
+        if self.upload_thread:
+            self.upload_thread.quit()
+            self.upload_thread.wait()
+        self.interface_worker.stop()
+        self.interface_thread.quit()
+        self.interface_thread.wait()
+        self.validation_thread.quit()
+        self.validation_thread.wait()
+        self.log.close()
+        super().closeEvent(event)
+
     def update_title(self):
         # setting window title with prefix as file name
         # suffix as PyQt5 Notepad
@@ -377,287 +605,370 @@ class MainWindow(QMainWindow):
         self.editor.setLineWrapMode(1 if self.editor.lineWrapMode() == 0 else 0 )
 
     def edit_toggle_ip(self):
-        for n,action in enumerate(self.ip_action):
+        for action in self.ip_action:
             if action.isChecked():
-                self.iplocal = self.ips[n]
+                self.iplocal = action.data()
                 self.network = self.iplocal[0:self.iplocal.rfind('.')+1]
-                self.statuslabel.setText('NETWORK ' + self.network + '0 ' + '  IP ' + self.iplocal + "    ")
+                self.online = ''
+                self.update_status()
                 break
 
+    def update_status(self):
+        if not self.iplocal:
+            self.statuslabel.setText('NO NETWORK    ')
+            return
+        self.statuslabel.setText('NETWORK ' + self.network + '0 ' + '  IP ' + self.iplocal +
+                                 self.online + "    ")
+
+    def startup(self):
+        mark('first paint')
+        self.interface_thread.start()
+
+    def interfaces_changed(self, interfaces):
+        # New inventory from the watcher: rebuild the IP menu, keeping the
+        # selected address if it is still there
+        first = not self.interfaces and self.statuslabel.text().startswith('Scanning')
+        self.interfaces = interfaces
+        addresses = [interface.address for interface in interfaces]
+        if self.iplocal not in addresses:
+            if self.iplocal and not first:
+                self.printerror('\n' + 'Interface ' + self.iplocal + ' is gone.')
+            self.iplocal = addresses[0] if addresses else ''
+            self.network = self.iplocal[0:self.iplocal.rfind('.')+1]
+            self.online = ''
+        
+        self.ip_menu.clear()
+        self.ip_action = list()
+        self.ip_group = QActionGroup(self)
+        for n,interface in enumerate(interfaces):
+            ip = interface.address
+            self.ip_action.append(QAction(interface.name + ': ' + ip + ' (' + interface.network + '0)', self))
+            self.ip_action[n].setCheckable(True)
+            self.ip_action[n].setChecked(ip == self.iplocal)
+            self.ip_action[n].setData(ip)
+            self.ip_action[n].triggered.connect(self.edit_toggle_ip)
+            self.ip_menu.addAction(self.ip_action[n])
+            self.ip_group.addAction(self.ip_action[n])
+        if not interfaces:
+            none_action = self.ip_menu.addAction('No IPv4 network')
+            none_action.setEnabled(False)
+        self.update_status()
+        self.update_upload_actions()
+        if first:
+            mark('interfaces')
+
+    def fill_jobs_menu(self):
+        if self.jobs_action:
+            return
+        import sbupload
+        
+        JobsGroup = QActionGroup(self)
+        for n,jobs in enumerate([1, 4, 8, 16, 32, 64]):
+            self.jobs_action.append(QAction(str(jobs), self))
+            self.jobs_action[n].setCheckable(True)
+            self.jobs_action[n].setChecked(jobs == (self.jobs or sbupload.JOBS))
+            self.jobs_action[n].setData(jobs)
+            self.jobs_action[n].triggered.connect(self.edit_toggle_jobs)
+            self.jobs_menu.addAction(self.jobs_action[n])
+            JobsGroup.addAction(self.jobs_action[n])
+
+    def edit_toggle_jobs(self):
+        for action in self.jobs_action:
+            if action.isChecked():
+                self.jobs = action.data()
+                break
+
+    def current_pacing(self):
+        # The pacing edited in this session, else the one saved next to the
+        # file, else the defaults
+        import sbupload
+        if self.pacing is None:
+            self.pacing = sbupload.load_pacing(self.path) if self.path else sbupload.Pacing()
+        return self.pacing
+
+    def edit_pacing(self):
+        dialog = PacingDialog(self.current_pacing(), self)
+        if dialog.exec():
+            self.pacing = dialog.pacing()
+            self.pacing_changed = True
+            if self.path:
+                self.save_pacing()
+    
+    def save_pacing(self):
+        import sbupload
+        try:
+            sbupload.save_pacing(self.path, self.pacing)
+        except OSError as e:
+            self.printerror('Error: ' + str(e))
+        else:
+            self.pacing_changed = False
+
+    def editor_changed(self, position, removed, added):
+        document = self.editor.document()
+        end = min(position + added, document.characterCount() - 1)
+        first = document.findBlock(position).blockNumber()
+        last = document.findBlock(end).blockNumber()
+        count = document.blockCount()
+        texts = [document.findBlockByNumber(n).text() for n in range(first, last + 1)]
+        removed = len(texts) - (count - self.blockcount)
+        self.compiler.splice(first, removed, texts)
+        self.blockcount = count
+        if len(self.compiler.texts) == count:
+            self.splice_requested.emit(first, removed, texts)
+        else:
+            self.compiler.reset(self.editor.toPlainText().split('\n'))
+            self.reset_requested.emit(self.compiler.texts)
+        self.revision += 1
+        self.validation_timer.start()
+
+    def validated(self, revision, program):
+        # Results of an older revision would put markers in the wrong place
+        if revision != self.revision:
+            return
+        
+        # The highlighter underlines the errors in the editor
+        self.problems.clear()
+        for diagnostic in program.diagnostics:
+            item = QListWidgetItem(str(diagnostic))
+            item.setData(Qt.UserRole, diagnostic)
+            self.problems.addItem(item)
+        count = str(len(program.diagnostics))
+        if program.truncated:
+            # Same note as verify; the item has no diagnostic to go to
+            self.problems.addItem('Too many errors, stopped after ' + count + '.')
+            count += '+'
+        
+        self.tabs.setTabText(1, 'Problems (' + count + ')' if program.diagnostics else 'Problems')
+
+    def goto_problem(self, item):
+        diagnostic = item.data(Qt.UserRole)
+        if diagnostic is not None and diagnostic.line > 0:
+            self.goto(diagnostic.line, diagnostic.start)
+
+    def console_clicked(self):
+        # Only clicks move the console cursor while it has the focus
+        if not self.console.hasFocus():
+            return
+        text = self.console.textCursor().block().text()
+        result = re.search('In line (\\d+), column (\\d+)', text)
+        if result:
+            self.goto(int(result.group(1)), int(result.group(2)) - 1)
+
+    def goto(self, line, column):
+        block = self.editor.document().findBlockByNumber(line - 1)
+        if not block.isValid():
+            return
+        cursor = QTextCursor(block)
+        cursor.setPosition(block.position() + min(column, block.length() - 1))
+        self.editor.setTextCursor(cursor)
+        self.editor.centerCursor()
+        self.editor.setFocus()
+        
     def verify(self):
         self.file_save()
-        self.console.clear()
-        self.console.insertPlainText('Parsing...\n')
-        error = False
-        send = dict()
-        receive = dict()
-        keylist = list()
+        self.tabs.setCurrentWidget(self.console)
+        self.log.clear()
+        self.log.write('Parsing...')
         
-        lines = self.editor.toPlainText().splitlines(keepends=False)
-        if len(lines) == 0:
-            error = True
-            self.printerror('Error: empty file.')
-            return error, send, receive, keylist 
+        # An unchanged file comes from its .sbcc cache without parsing
         
-        sens = ['t1','t2','t3','t4','t5','t6','t7','ax','ay','az','gx','gy','gz','yaw','pitch','roll']
-        acts = ['dfPlay', 'dfPause', 'dfStop', 'dfResume', 'dfSetEq', 'dfVolume', 'dfPlayStop', 'dfPlayPause', 'dfPlayTouch']
-
-        # Parse
-
-        for n,line in enumerate(lines):
-            
-            if (re.search('^\\w+$', line)):
-                error = True
-                self.printerror('Error: syntax error in line ' + str(n+1) + ' "' + line + '"')
-                return error, send, receive, keylist
-            
-
-            # Comments
-            
-            if (re.search('^\\s*#', line)):
-                continue
-
-            # Send
-              
-            if (re.search("->", line)):
-                
-                result = re.search("^(\\d{1,3})->(.*):(.*)$", line)
-                # print(result)
-                if not result:
-                    error = True
-                    self.printerror('Error: Send ID must be a number. In line ' + str(n+1) + ' "' + line + '"')
-                    return error, send, receive, keylist
-                
-                id_in = int(result.group(1))
-
-                if result.group(2) == '':
-                    error = True
-                    self.printerror('Error: sensor list cannot be empty in line ' + str(n+1) + ' "' + line + '"')
-                    return error, send, receive, keylist
-                else:
-                    sensores = result.group(2).split(",")
-                    for sensor in sensores:
-                        if sensor not in sens:
-                            error = True
-                            self.printerror('Error: sensor must be valid. In line ' + str(n+1) + ' "' + line + '"')
-                            return error, send, receive, keylist
-
-                if result.group(3) == '':
-                    error = True
-                    self.printerror('Error: Receive ID must be a number. In line ' + str(n+1) + ' "' + line + '"')
-                    return error, send, receive, keylist
-                
-                id_out = result.group(3).split("#")[0].strip()
-                
-                listsend = []
-                
-                bits = 0
-                for s in sensores:
-                    bits += 2**sens.index(s)
-                
-                bits = list(bits.to_bytes(2,'big'))    
-                listsend.append(bits[0])
-                listsend.append(bits[1]) 
-                
-                id_out = id_out.split(",")
-                
-                if len(id_out) > 3:
-                    error = True
-                    self.printerror('Error: maximum 3 ID ranges for ' + 
-                                    str(id_in) + '-> ' + '.')
-                    return error, send, receive, keylist
-                    
-                listids = [0,0,0,0,0,0]
-                for i in range(0,len(id_out)):   
-                    out = id_out[i].split("-")
-                    if len(out) == 1:
-                        if not str.isdigit(out[0]):
-                            error = True
-                            self.printerror('Error: Receive ID must be a number. In line ' + str(n+1) + ' "' + line + '"')
-                            return error, send, receive, keylist
-                        if int(out[0]) < 2 or int(out[0]) > 254:
-                            error = True
-                            self.printerror('Error: IP must be between 2-254. In line ' + str(n+1) + ' "' + line + '"')
-                            return error, send, receive, keylist
-                        out1 = int(out[0])
-                        out2 = out1
-                    else:
-                        if (not str.isdigit(out[0]) or not str.isdigit(out[1])):
-                            error = True
-                            self.printerror('Error: syntax error in line ' + str(n+1) + ' "' + line + '"')
-                            return error, send, receive, keylist
-                        if int(out[0]) < 2 or int(out[0]) > 254:
-                            error = True
-                            self.printerror('Error: IP must be between 2-254. In line ' + str(n+1) + ' "' + line + '"')
-                            return error, send, receive, keylist
-                        if int(out[1]) < 2 or int(out[1]) > 254:
-                            error = True
-                            self.printerror('Error: IP must be between 2-254. In line ' + str(n+1) + ' "' + line + '"')
-                            return error, send, receive, keylist
-                        out1 = int(out[0])
-                        out2 = int(out[1])
-
-                    listids[2*i] = out1
-                    listids[2*i+1] = out2
-                    
-                for id in listids:    
-                    listsend.append(id) 
-                
-                if id_in not in send:
-                    send[id_in] = list()
-                send[id_in].append(listsend)
-
-            # Receieve
-                 
-            if (re.search("<-", line)):
-                
-                result = re.search("^(\\d{1,3})<-(.*):(\\d{1,3})@(.*?)(\\[(\\d+,)?(\\d+)\\])?(\\s*#.*)*$", line)
-                # print(result)
-                if not result or result == '':
-                    error = True
-                    self.printerror('Error: Receive ID must be a number. In line ' + str(n+1) + ' "' + line + '"')
-                    return error, send, receive, keylist
-                if int(result.group(1)) < 2 or int(result.group(1)) > 254:
-                    error = True
-                    self.printerror('Error: Receive ID must be between 2-254. In line ' + str(n+1) + ' "' + line + '"')
-                    return error, send, receive, keylist
-                
-                id_in = int(result.group(1))
-                
-                if result.group(2) == '':
-                    error = True
-                    self.printerror('Error: sensor must be valid. In line  ' + str(n+1) + ' "' + line + '"')
-                    return error, send, receive, keylist
-                else:
-                    sensor = result.group(2)
-                    if sensor not in sens:
-                        error = True
-                        self.printerror('Error: sensor must be valid. In line ' + str(n+1) + ' "' + line + '"')
-                        return error, send, receive, keylist
-
-                if result.group(3) == '':
-                    error = True
-                    self.printerror('Error: Send ID must be a number. In line ' + str(n+1) + ' "' + line + '"')
-                    return error, send, receive, keylist
-                id_out = result.group(3)
-
-                if result.group(4) == '':
-                    error = True
-                    self.printerror('Error: action cannot be empty in line ' + str(n+1) + ' "' + line + '"')
-                    return error, send, receive, keylist
-                else:
-                    actuador = result.group(4)
-                    if actuador not in acts:
-                        error = True
-                        self.printerror('Error: action must be valid. In line ' + str(n+1) + ' "' + line + '"')
-                        return error, send, receive, keylist
-
-                if result.group(5):
-                    if result.group(6):
-                        map1 = result.group(6)[:-1]
-                        if int(map1)<0 or int(map1)>127:
-                            error = True
-                            self.printerror('Error: map value must be between 0-127. In line ' + str(n+1) + ' "' + line + '"')
-                            return error, send, receive, keylist
-                    else:
-                        map1 = 255
-                    map2 = result.group(7)
-                    if int(map2)<0 or int(map2)>127:
-                        error = True
-                        self.printerror('Error: map value must be between 0-127. In line ' + str(n+1) + ' "' + line + '"')
-                        return error, send, receive, keylist
-                else:
-                    map1 = 255
-                    map2 = 255
-                    
-                # print(map1,map2)
-                
-                listreceive = []
-                
-                listreceive.append(sens.index(sensor))    
-                listreceive.append(int(id_out))
-                listreceive.append(acts.index(actuador))
-                listreceive.append(int(map1))
-                listreceive.append(int(map2))
-                
-                if id_in not in receive:
-                    receive[id_in] = list()
-                receive[id_in].append(listreceive)   
-           
-        send = dict(sorted(send.items()))
-        receive = dict(sorted(receive.items()))
-        keylist = sorted(set(list(send.keys()) + list(receive.keys())))
+        text = self.editor.toPlainText()
+        program = sbcompiler.load_cache(self.path, text) if self.path else None
+        if program is None:
+            if len(self.compiler.texts) != self.blockcount:
+                self.compiler.reset(text.split('\n'))
+            program = self.compiler.compile(sbcompiler.MAX_ERRORS)
+            if self.path and not program.error:
+                try:
+                    sbcompiler.save_cache(self.path, text, program)
+                except OSError:
+                    pass
+        
+        for diagnostic in program.diagnostics:
+            self.printerror(str(diagnostic))
+        if program.truncated:
+            self.printerror('Too many errors, stopped after ' +
+                            str(len(program.diagnostics)) + '.')
+        if program.error:
+            return program.error, program.send, program.receive, program.keylist
          
-        # self.console.insertPlainText('send: ' + str(send) + '\n' +
-        #                           'receive: ' + str(receive) + '\n' +
-        #                           'keylist: ' + str(receive) + '\n')
-        self.console.insertPlainText('Verified... OK.' + '\n')
-        scrollbar = self.console.verticalScrollBar()
-        scrollbar.setSliderPosition(scrollbar.maximum())
-        app.processEvents()
-        
-        return error, send, receive, keylist
+        self.log.write('Verified... OK.')
+        
+        return program.error, program.send, program.receive, program.keylist
+    
+    def upload_engine(self):
+        # Imports the upload engine and starts its thread, the first time
+        import sbupload
+        if self.upload_thread is None:
+            self.upload_thread = QThread(self)
+            self.upload_worker = sbworkers.UploadWorker()
+            self.upload_worker.moveToThread(self.upload_thread)
+            self.upload_requested.connect(self.upload_worker.run)
+            self.upload_worker.progress.connect(self.upload_progress)
+            self.upload_worker.finished.connect(self.upload_finished)
+            self.upload_worker.failed.connect(self.upload_failed)
+            self.discover_requested.connect(self.upload_worker.discover)
+            self.upload_worker.discovered.connect(self.discovered)
+            self.upload_worker.discover_failed.connect(self.discover_failed)
+            self.upload_thread.start()
+            mark('upload engine')
+        return sbupload
+    
+    def no_network(self):
+        if self.iplocal:
+            return False
+        self.tabs.setCurrentWidget(self.console)
+        self.printerror('\n' + 'Error: no network interface with an IPv4 address.')
+        return True
     
     def upload(self):
+        if self.uploader or self.no_network():
+            return
+        
         error, send, receive, keylist = self.verify()
         if error: return
-        
-        self.console.insertPlainText('\n' + 'Uploading...' + '\n')
-        scrollbar = self.console.verticalScrollBar()
-        scrollbar.setSliderPosition(scrollbar.maximum())
-        app.processEvents()
-        
-        port = 12000
-        
+        sbupload = self.upload_engine()
+        
+        # Only modules whose program changed since the last upload
+        
+        # The state goes to the file and network the upload started with,
+        # even if either changes before it finishes
+        self.upload_hashes = dict()
+        self.upload_path = self.path
+        if self.path and not self.force_action.isChecked():
+            hashes = sbupload.load_state(self.path).get(self.network, dict())
+            changed = sbupload.changed_modules(keylist, send, receive, hashes)
+            if len(changed) < len(keylist):
+                self.log.write('\n' + 'Unchanged, not uploaded: ' +
+                               ', '.join(str(k) for k in keylist if k not in changed))
+            keylist = changed
+        if not keylist:
+            self.printerror('\n' + 'All modules are up to date.')
+            return
         for k in keylist:
+            self.upload_hashes[k] = sbupload.program_hash(k, send, receive)
+        
+        self.log.write('\n' + 'Uploading...')
+        
+        self.uploader = sbupload.Uploader(self.network, jobs=self.jobs or sbupload.JOBS,
+                                          ack=self.ack_action.isChecked(),
+                                          bundle=self.bundle_action.isChecked(),
+                                          discover=self.discover_action.isChecked(),
+                                          local=self.iplocal,
+                                          pacing=self.current_pacing(),
+                                          progress=self.upload_worker.progress.emit)
+        self.update_upload_actions()
+        self.progressbar.setRange(0, sum(len(sbupload.program_messages(k, send, receive))
+                                         for k in keylist))
+        self.progressbar.setValue(0)
+        self.progressbar.show()
+        self.cancel_button.setEnabled(True)
+        self.cancel_button.show()
+        self.upload_requested.emit(self.uploader, send, receive, keylist)
             
-            self.console.insertPlainText('\n' + str(k) + ': ' + self.network + 
-                                      str(k) + '\n')
-            client = SimpleUDPClient(self.network + str(k), port)
-            client.send_message("/initprog", 0)
-            scrollbar = self.console.verticalScrollBar()
-            scrollbar.setSliderPosition(scrollbar.maximum())
-            sleep(0.5)
-            app.processEvents()
-
-            if (k in send):
-                self.console.insertPlainText('send: ' + str(send) + '\n')
-                for m in send[k]:
-                    self.console.insertPlainText('send: ' + str(m) + '\n')
-                    client.send_message("/send", m)
-                    scrollbar = self.console.verticalScrollBar()
-                    scrollbar.setSliderPosition(scrollbar.maximum())
-                    sleep(0.5)
-                    app.processEvents()  
-
-            if (k in receive):
-                self.console.insertPlainText('receive: ' + str(receive) + '\n')
-                for m in receive[k]:
-                    self.console.insertPlainText('receive: ' + str(m) + '\n')
-                    client.send_message("/receive", m)
-                    scrollbar = self.console.verticalScrollBar()
-                    scrollbar.setSliderPosition(scrollbar.maximum())
-                    sleep(0.5)
-                    app.processEvents()
-                
-            client.send_message("/commit", 0)
-            sleep(0.5)
-            
-            # client.send_message("/verify", 0)
-            # sleep(0.25)
-            
-            client.send_message("/endprog", 0)
-            sleep(0.5)
-            
-        self.console.insertPlainText('\n' + 'Uploaded... OK.' + '\n')
-        scrollbar = self.console.verticalScrollBar()
-        scrollbar.setSliderPosition(scrollbar.maximum())
-            
+    def update_upload_actions(self):
+        # Upload needs an address and no other upload running
+        enabled = bool(self.iplocal) and self.uploader is None
+        self.upload_action.setEnabled(enabled)
+        self.upload_toolbar_action.setEnabled(enabled)
+    
+    def upload_progress(self, k, address, args):
+        if address == '/initprog':
+            self.log.write('\n' + str(k) + ': ' + self.uploader.network + str(k))
+        elif address in ('/send', '/receive'):
+            self.log.write(str(k) + ' ' + address[1:] + ': ' + str(list(args)))
+        self.progressbar.setValue(self.progressbar.value() + 1)
+    
+    def upload_cancel(self):
+        if self.uploader:
+            self.uploader.cancel()
+            self.cancel_button.setEnabled(False)
+            self.printerror('\nCancelling after the modules in progress...')
+    
+    def discover(self):
+        if self.uploader or self.no_network():
+            return
+        self.tabs.setCurrentWidget(self.console)
+        self.printerror('\n' + 'Discovering modules on ' + self.network + '0...')
+        # A sweep asked for explicitly is always a fresh one
+        self.upload_engine()
+        self.discover_requested.emit(self.network, self.iplocal, 0.0)
+    
+    def discovered(self, network, alive):
+        if network != self.network:
+            return
+        self.printerror('Online: ' + (', '.join(str(k) for k in alive) or 'none'))
+        program = self.compiler.compile()
+        if program.error:
+            self.online = '   ONLINE ' + str(len(alive))
+        else:
+            offline = [k for k in program.keylist if k not in alive]
+            if offline:
+                self.printerror('Configured but offline: ' + ', '.join(str(k) for k in offline))
+            self.online = ('   ONLINE ' + str(len(program.keylist) - len(offline)) +
+                           '/' + str(len(program.keylist)))
+        self.update_status()
+    
+    def discover_failed(self, network, message):
+        # An upload may be queued behind the sweep, so its state is left alone
+        self.printerror('Error: discovery on ' + network + '0 failed, ' + message)
+    
+    def upload_finished(self, uploader):
+        import sbupload
+        if uploader.offline:
+            self.log.write('\n' + 'Offline, not programmed: ' +
+                           ', '.join(str(k) for k in uploader.offline))
+        if self.upload_path and uploader.programmed:
+            state = sbupload.load_state(self.upload_path)
+            hashes = state.setdefault(uploader.network, dict())
+            for k in uploader.programmed:
+                hashes[str(k)] = self.upload_hashes[k]
+            try:
+                sbupload.save_state(self.upload_path, state)
+            except OSError as e:
+                self.printerror('Error: ' + str(e))
+        if uploader.unconfirmed:
+            self.log.write('\n' + 'Sent without acks, uploaded again next time: ' +
+                           ', '.join(str(k) for k in sorted(uploader.unconfirmed)))
+        if uploader.missed:
+            self.log.write('\n' + '\n'.join(str(k) + ': no ack for ' + address
+                                            for k, address in uploader.missed))
+        if uploader.uncommitted:
+            self.log.write('\n' + 'Not committed, old program kept: ' +
+                           ', '.join(str(k) for k in sorted(uploader.uncommitted)))
+        if uploader.failed:
+            self.log.write('\n' + '\n'.join(str(k) + ': not sent, ' + error
+                                            for k, error in uploader.failed))
+        if uploader.skipped:
+            self.log.write('\n' + 'Upload cancelled, not programmed: ' +
+                           ', '.join(str(k) for k in sorted(uploader.skipped)))
+        elif uploader.failed or uploader.missed:
+            self.log.write('\n' + 'Upload finished with errors.')
+        else:
+            self.log.write('\n' + 'Uploaded... OK.')
+        self.upload_done()
+    
+    def upload_failed(self, message):
+        self.printerror('Error: ' + message)
+        self.upload_done()
+    
+    def upload_done(self):
+        self.uploader = None
+        self.update_upload_actions()
+        self.progressbar.hide()
+        self.cancel_button.hide()
     
     def printerror(self, msg):
-        self.console.insertPlainText(msg + '\n')
-        scrollbar = self.console.verticalScrollBar()
-        scrollbar.setSliderPosition(scrollbar.maximum())
+        self.log.write(msg)
+    
+    def update_log_file(self):
+        # The console log follows the open file while the option is on
+        path = sblog.log_path(self.path) if self.path and self.log_action.isChecked() else None
+        try:
+            self.log.set_file(path)
+        except OSError as e:
+            self.log_action.setChecked(False)
+            self.printerror('Error: ' + str(e))
     
     def about(self):
         msgBox = QMessageBox()
@@ -683,12 +994,14 @@ if __name__ == '__main__':
 
     # Create PyQt5 application
     app = QApplication(sys.argv)
+    mark('QApplication')
     
     # Set application name
     app.setApplicationName("SoundBlocks Configurator")
     
     # Create main window object
     window = MainWindow()
+    mark('main window')
     
     # Loop
     app.exec_()
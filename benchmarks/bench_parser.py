@@ -0,0 +1,237 @@
+# Parser benchmark
+#
+# Generates valid and invalid .sbc files (sends with ranges, receives with
+# maps, comments) and times every stage of the compiler on them separately:
+# parse, validate, encode and link, plus the whole compile_text and its
+# peak memory under tracemalloc. Runs headless, without Qt.
+#
+#   python benchmarks/bench_parser.py --sizes 100,10000,1000000 --json parser.json
+#   python benchmarks/bench_parser.py --baseline parser.json --threshold 0.2
+#
+# With --baseline, the run fails (exit status 1) when the throughput of
+# compile (or of the stages given with --check) drops more than --threshold
+# below the one saved in that file. The single stages are short and
+# noisier, so they are only reported by default.
+# --legacy also compares against the old regex-per-check compiler.
+
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sbcompiler
+import sbc_legacy
+
+STAGES = ('parse', 'validate', 'encode', 'link', 'compile')
+
+
+def generate(lines, seed=0, errors=0.0):
+    # Configuration with a fraction `errors` of wrong lines: sends with
+    # ranges, receives with maps, comments
+    rnd = random.Random(seed)
+    out = list()
+    for n in range(lines):
+        k = rnd.randint(2, 254)
+        r = rnd.random()
+        if r < 0.4:
+            sensors = rnd.sample(sbcompiler.SENSORS, rnd.randint(1, 3))
+            ranges = list()
+            for _ in range(rnd.randint(1, 3)):
+                a = rnd.randint(2, 250)
+                ranges.append(str(a) if rnd.random() < 0.5 else
+                              str(a) + '-' + str(a + rnd.randint(1, 4)))
+            line = str(k) + '->' + ','.join(sensors) + ':' + ','.join(ranges)
+        elif r < 0.85:
+            line = (str(k) + '<-' + rnd.choice(sbcompiler.SENSORS) + ':' +
+                    str(rnd.randint(2, 254)) + '@' + rnd.choice(sbcompiler.ACTUATORS))
+            m = rnd.random()
+            if m < 0.3:
+                line += '[' + str(rnd.randint(0, 127)) + ']'
+            elif m < 0.6:
+                line += '[' + str(rnd.randint(0, 63)) + ',' + str(rnd.randint(64, 127)) + ']'
+        elif r < 0.95:
+            line = '# module ' + str(k)
+        else:
+            line = ''
+        if errors and rnd.random() < errors:
+            line = rnd.choice((
+                str(k) + '->tx:' + str(k),                          # unknown sensor
+                str(k) + '->t1:255',                                # ID out of range
+                str(k) + '->t1:2,3,4,5',                            # too many ranges
+                str(k) + '<-t1:1@dfPlay',                           # receive ID out of range
+                str(k) + '<-t1:' + str(k) + '@dfFly',               # unknown action
+                str(k) + '<-t1:' + str(k) + '@dfVolume[0,200]',     # map out of range
+                str(k) + '<-t1:' + str(k) + ' dfPlay',              # syntax
+                str(k) + '>t1:' + str(k),                           # syntax
+            ))
+        out.append(line)
+    return '\n'.join(out)
+
+
+def stages(text):
+    # Seconds spent in every stage compiling text, and the program. The
+    # garbage collector is off while timing, as in timeit.
+    gc.collect()
+    gc.disable()
+    try:
+        return _stages(text)
+    finally:
+        gc.enable()
+
+
+def _stages(text):
+    start = time.perf_counter()
+    texts = text.splitlines()
+    statements = [sbcompiler.parse_line(t) for t in texts]
+    parsed = time.perf_counter()
+    errors = [sbcompiler.validate(s) for s in statements]
+    validated = time.perf_counter()
+    lines = list()
+    for statement, error in zip(statements, errors):
+        if statement.kind == sbcompiler.BLANK:
+            lines.append(sbcompiler.Line(sbcompiler.BLANK))
+        elif error:
+            lines.append(sbcompiler.Line(sbcompiler.INVALID, errors=error))
+        else:
+            k, row = sbcompiler.encode(statement)
+            lines.append(sbcompiler.Line(statement.kind, k, row))
+    encoded = time.perf_counter()
+    program = sbcompiler.link(lines, texts, sbcompiler.MAX_ERRORS)
+    linked = time.perf_counter()
+    times = dict(parse=parsed - start, validate=validated - parsed,
+                 encode=encoded - validated, link=linked - encoded)
+    start = time.perf_counter()
+    sbcompiler.compile_text(text, sbcompiler.MAX_ERRORS)
+    times['compile'] = time.perf_counter() - start
+    return times, program
+
+
+def best(function, text, repeat):
+    times = list()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            program = function(text)
+            times.append(time.perf_counter() - start)
+    finally:
+        gc.enable()
+    return min(times), program
+
+
+def peak_memory(text):
+    # Peak bytes allocated by compile_text, on top of the text itself
+    gc.collect()
+    tracemalloc.start()
+    try:
+        sbcompiler.compile_text(text, sbcompiler.MAX_ERRORS)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_case(lines, errors, args):
+    text = generate(lines, args.seed, errors)
+    times = dict()
+    # Small files are repeated more, so each size takes about as long
+    for _ in range(max(args.repeat, 100000 // lines)):
+        result, program = stages(text)
+        for stage, seconds in result.items():
+            times[stage] = min(times.get(stage, seconds), seconds)
+    case = dict(lines=lines, corpus='invalid' if errors else 'valid',
+                errors=len(program.diagnostics), seconds=times,
+                lines_per_s=dict((stage, lines / max(seconds, 1e-9))
+                                 for stage, seconds in times.items()),
+                peak_memory=peak_memory(text))
+    if args.legacy and not errors:
+        # The old compiler stops at the first error, so only valid files
+        legacy, old = best(sbc_legacy.compile_text, text, args.repeat)
+        if (old.send, old.receive, old.keylist) != (program.send, program.receive, program.keylist):
+            sys.exit('Error: compilers disagree on the generated file.')
+        case['legacy_lines_per_s'] = lines / legacy
+    return case
+
+
+def regressions(cases, baseline, threshold, stages=('compile',)):
+    # Stages slower than the baseline by more than threshold
+    saved = dict(((c['lines'], c['corpus']), c) for c in baseline['cases'])
+    found = list()
+    for case in cases:
+        old = saved.get((case['lines'], case['corpus']))
+        if old is None:
+            continue
+        for stage in stages:
+            now = case['lines_per_s'][stage]
+            then = old['lines_per_s'].get(stage)
+            if then and now < (1 - threshold) * then:
+                found.append('%d lines (%s), %s: %.0f lines/s, was %.0f' %
+                             (case['lines'], case['corpus'], stage, now, then))
+    return found
+
+
+def numbers(text):
+    return [int(n) for n in text.split(',')]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='.sbc parser benchmark')
+    parser.add_argument('--sizes', type=numbers, default=[100, 1000, 10000, 100000, 1000000],
+                        help='file sizes in lines, e.g. 100,10000')
+    parser.add_argument('--errors', type=float, default=0.01,
+                        help='fraction of wrong lines in the invalid files')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--legacy', action='store_true',
+                        help='also time the old compiler')
+    parser.add_argument('--json', help='write the results to this file')
+    parser.add_argument('--baseline', help='results of an earlier run to compare with')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='largest drop in lines/s accepted (default 0.2, 20%%)')
+    parser.add_argument('--check', default='compile',
+                        help='stages compared with the baseline, of ' + ', '.join(STAGES))
+    args = parser.parse_args()
+
+    check = args.check.split(',')
+    for stage in check:
+        if stage not in STAGES:
+            parser.error('unknown stage ' + stage)
+
+    cases = list()
+    print('%8s %-8s %7s' % ('lines', 'corpus', 'errors') +
+          ''.join('%11s' % stage for stage in STAGES) + '  peak (MB)' +
+          ('     legacy' if args.legacy else ''))
+    for lines in args.sizes:
+        for errors in (0.0, args.errors):
+            case = run_case(lines, errors, args)
+            cases.append(case)
+            print('%8d %-8s %7d' % (lines, case['corpus'], case['errors']) +
+                  ''.join('%11.0f' % case['lines_per_s'][stage] for stage in STAGES) +
+                  '%11.1f' % (case['peak_memory'] / 2**20) +
+                  ('%11.0f' % case['legacy_lines_per_s'] if 'legacy_lines_per_s' in case else ''))
+    print('(lines/s, best of %d or more)' % args.repeat)
+
+    if args.json:
+        results = dict(benchmark='parser', time=time.strftime('%Y-%m-%dT%H:%M:%S'),
+                       python=platform.python_version(), platform=platform.platform(),
+                       seed=args.seed, repeat=args.repeat, cases=cases)
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=1)
+
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            found = regressions(cases, json.load(f), args.threshold, check)
+        for line in found:
+            print('Regression: ' + line)
+        if found:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,186 @@
+# Upload benchmark
+#
+# Generates N modules x M send and M receive rows, uploads them to the
+# module emulator over loopback and reports the total time, messages per
+# second, one-way per-message latency (p50/p99, from the uploader's send to
+# the emulator processing the message) and where the time went: the
+# uploader's phases (open, discovery, upload, close) and the latency of
+# every kind of message. The emulator runs on the uploader's event loop, so
+# the numbers include its own processing.
+#
+#   python benchmarks/bench_upload.py --modules 16,64 --rows 4,32 --json upload.json
+#
+# Every case is one mode: "ack" (wait for acks), "bundle" (acks and OSC
+# bundles) or "fixed" (no acks, fixed rate given by --rate).
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sbcompiler
+import sbemulator
+import sbupload
+
+MODES = ('ack', 'bundle', 'fixed')
+
+
+def generate(modules, rows):
+    # Modules 2..modules+1, each sending and receiving rows rows
+    ids = list(range(2, 2 + modules))
+    out = list()
+    for n, k in enumerate(ids):
+        other = ids[(n + 1) % len(ids)]
+        for r in range(rows):
+            out.append('%d->%s:%d' % (k, sbcompiler.SENSORS[r % len(sbcompiler.SENSORS)], other))
+        for r in range(rows):
+            out.append('%d<-%s:%d@%s[%d,%d]' % (k, sbcompiler.SENSORS[r % len(sbcompiler.SENSORS)],
+                                               other, sbcompiler.ACTUATORS[r % len(sbcompiler.ACTUATORS)],
+                                               r % 64, 127 - r % 64))
+    return '\n'.join(out)
+
+
+def percentile(values, p):
+    # Nearest rank
+    if not values:
+        return None
+    values = sorted(values)
+    return values[min(len(values) - 1, max(0, int(round(p / 100 * len(values))) - 1))]
+
+
+def summary(values):
+    return dict(count=len(values), p50=percentile(values, 50),
+                p99=percentile(values, 99),
+                mean=sum(values) / len(values) if values else None)
+
+
+async def run_case(program, mode, args):
+    emulator = sbemulator.Emulator(args.network, program.keylist, args.port,
+                                   ack=mode != 'fixed', ack_port=args.ack_port,
+                                   latency=args.latency, jitter=args.jitter,
+                                   loss=args.loss, seed=0)
+    emulator.trace = list()
+    await emulator.start()
+
+    sent = list()
+    def progress(k, address, args):
+        sent.append((time.perf_counter(), k, address))
+
+    pacing = sbupload.Pacing(rate=args.rate, global_rate=args.global_rate)
+    uploader = sbupload.Uploader(args.network, port=args.port, jobs=args.jobs,
+                                 delay=args.delay, ack=mode != 'fixed',
+                                 local=args.local, ack_port=args.ack_port,
+                                 bundle=mode == 'bundle', pacing=pacing,
+                                 progress=progress)
+    start = time.perf_counter()
+    try:
+        await uploader.run(program.send, program.receive, program.keylist)
+        total = time.perf_counter() - start
+        # Let the last messages (and /endprog) land
+        await asyncio.sleep(args.latency + args.jitter + 0.05)
+    finally:
+        emulator.close()
+
+    # Pair the n-th (module, address) sent with the n-th one processed
+    arrived = dict()
+    seen = dict()
+    for stamp, k, address in emulator.trace:
+        key = (k, address, seen.setdefault((k, address), 0))
+        seen[(k, address)] += 1
+        arrived[key] = stamp
+    latencies = list()
+    addresses = dict()
+    seen = dict()
+    for stamp, k, address in sent:
+        key = (k, address, seen.setdefault((k, address), 0))
+        seen[(k, address)] += 1
+        if key in arrived:
+            latency = arrived[key] - stamp
+            latencies.append(latency)
+            addresses.setdefault(address, list()).append(latency)
+
+    verified = all(emulator.modules[k].send == program.send.get(k, []) and
+                   emulator.modules[k].receive == program.receive.get(k, [])
+                   for k in program.keylist)
+    return dict(mode=mode, messages=len(sent), lost=len(sent) - len(latencies),
+                datagrams=sum(m.received + m.dropped for m in emulator.modules.values()),
+                total=total, messages_per_s=len(sent) / total,
+                latency=summary(latencies),
+                phases=uploader.phases,
+                addresses=dict((address, summary(values))
+                               for address, values in sorted(addresses.items())),
+                missed=len(uploader.missed), verified=verified)
+
+
+def numbers(text):
+    return [int(n) for n in text.split(',')]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Upload benchmark')
+    parser.add_argument('--modules', type=numbers, default=[16, 64, 253],
+                        help='module counts, e.g. 16,64 (at most 253)')
+    parser.add_argument('--rows', type=numbers, default=[4, 32],
+                        help='send and receive rows per module, e.g. 4,32')
+    parser.add_argument('--modes', default='ack,bundle',
+                        help='comma separated, of ' + ', '.join(MODES))
+    parser.add_argument('--jobs', type=int, default=sbupload.JOBS)
+    parser.add_argument('--delay', type=float, default=sbupload.DELAY, help='ack timeout')
+    parser.add_argument('--rate', type=float, default=1 / sbupload.DELAY,
+                        help='messages/s per module in fixed mode')
+    parser.add_argument('--global-rate', type=float, default=0.0,
+                        help='messages/s in total (0 = unlimited)')
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--jitter', type=float, default=0.0)
+    parser.add_argument('--loss', type=float, default=0.0)
+    parser.add_argument('--network', default='127.0.0.')
+    parser.add_argument('--local', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=sbupload.PORT)
+    parser.add_argument('--ack-port', type=int, default=sbupload.ACK_PORT)
+    parser.add_argument('--json', help='write the results to this file')
+    args = parser.parse_args()
+
+    modes = args.modes.split(',')
+    for mode in modes:
+        if mode not in MODES:
+            parser.error('unknown mode ' + mode)
+    if max(args.modules) > 253:
+        parser.error('at most 253 modules')
+
+    cases = list()
+    print('%-7s %4s %4s %8s %9s %10s %10s %10s  %s' %
+          ('mode', 'mods', 'rows', 'messages', 'time (s)', 'msgs/s',
+           'p50 (ms)', 'p99 (ms)', 'ok'))
+    for modules in args.modules:
+        for rows in args.rows:
+            program = sbcompiler.compile_text(generate(modules, rows))
+            if program.error:
+                sys.exit('Error: generated configuration does not compile.')
+            for mode in modes:
+                case = asyncio.run(run_case(program, mode, args))
+                case.update(modules=modules, rows=rows)
+                cases.append(case)
+                latency = case['latency']
+                print('%-7s %4d %4d %8d %9.3f %10.0f %10.3f %10.3f  %s' %
+                      (mode, modules, rows, case['messages'], case['total'],
+                       case['messages_per_s'], (latency['p50'] or 0) * 1000,
+                       (latency['p99'] or 0) * 1000,
+                       'yes' if case['verified'] and not case['missed'] else 'NO'))
+
+    if args.json:
+        options = dict(vars(args))
+        del options['json']
+        results = dict(benchmark='upload', time=time.strftime('%Y-%m-%dT%H:%M:%S'),
+                       python=platform.python_version(), platform=platform.platform(),
+                       options=options, cases=cases)
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=1)
+
+
+if __name__ == '__main__':
+    main()
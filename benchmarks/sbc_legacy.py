@@ -0,0 +1,196 @@
+# Reference compiler for the benchmarks
+#
+# The regex-per-check compiler that MainWindow.verify used before the
+# single-pass grammar of sbcompiler. Kept unchanged so the benchmarks can
+# compare against it.
+
+import re
+
+SENSORS = ['t1','t2','t3','t4','t5','t6','t7','ax','ay','az','gx','gy','gz','yaw','pitch','roll']
+ACTUATORS = ['dfPlay', 'dfPause', 'dfStop', 'dfResume', 'dfSetEq', 'dfVolume', 'dfPlayStop', 'dfPlayPause', 'dfPlayTouch']
+
+
+class Diagnostic:
+    # A compile error. line is 1-based, or 0 when it is not about a line.
+
+    def __init__(self, line, message):
+        self.line = line
+        self.message = message
+
+    def __str__(self):
+        return self.message
+
+    def __repr__(self):
+        return 'Diagnostic(%d, %r)' % (self.line, self.message)
+
+
+class Program:
+    # Compiled configuration.
+    #
+    # send[k] holds the 8-byte /send rows of module k: sensor bits (2 bytes)
+    # followed by three ID ranges. receive[k] holds the 5-byte /receive rows:
+    # sensor, sending module, actuator and the two map values (255 = unset).
+    # keylist is the sorted list of modules to program.
+
+    def __init__(self):
+        self.send = dict()
+        self.receive = dict()
+        self.keylist = list()
+        self.diagnostics = list()
+
+    @property
+    def error(self):
+        return len(self.diagnostics) > 0
+
+    def fail(self, line, message):
+        self.diagnostics.append(Diagnostic(line, message))
+        return self
+
+
+def compile_text(text):
+    program = Program()
+
+    lines = text.splitlines(keepends=False)
+    if len(lines) == 0:
+        return program.fail(0, 'Error: empty file.')
+
+    send = program.send
+    receive = program.receive
+
+    for n,line in enumerate(lines):
+
+        where = ' In line ' + str(n+1) + ' "' + line + '"'
+
+        if (re.search('^\\w+$', line)):
+            return program.fail(n+1, 'Error: syntax error in line ' + str(n+1) + ' "' + line + '"')
+
+        # Comments
+
+        if (re.search('^\\s*#', line)):
+            continue
+
+        # Send
+
+        if (re.search("->", line)):
+
+            result = re.search("^(\\d{1,3})->(.*):(.*)$", line)
+            if not result:
+                return program.fail(n+1, 'Error: Send ID must be a number.' + where)
+
+            id_in = int(result.group(1))
+
+            if result.group(2) == '':
+                return program.fail(n+1, 'Error: sensor list cannot be empty in line ' + str(n+1) + ' "' + line + '"')
+            sensores = result.group(2).split(",")
+            for sensor in sensores:
+                if sensor not in SENSORS:
+                    return program.fail(n+1, 'Error: sensor must be valid.' + where)
+
+            if result.group(3) == '':
+                return program.fail(n+1, 'Error: Receive ID must be a number.' + where)
+
+            id_out = result.group(3).split("#")[0].strip()
+
+            listsend = []
+
+            bits = 0
+            for s in sensores:
+                bits += 2**SENSORS.index(s)
+
+            bits = list(bits.to_bytes(2,'big'))
+            listsend.append(bits[0])
+            listsend.append(bits[1])
+
+            id_out = id_out.split(",")
+
+            if len(id_out) > 3:
+                return program.fail(n+1, 'Error: maximum 3 ID ranges for ' +
+                                    str(id_in) + '-> ' + '.')
+
+            listids = [0,0,0,0,0,0]
+            for i in range(0,len(id_out)):
+                out = id_out[i].split("-")
+                if len(out) == 1:
+                    if not str.isdigit(out[0]):
+                        return program.fail(n+1, 'Error: Receive ID must be a number.' + where)
+                    if int(out[0]) < 2 or int(out[0]) > 254:
+                        return program.fail(n+1, 'Error: IP must be between 2-254.' + where)
+                    out1 = int(out[0])
+                    out2 = out1
+                else:
+                    if (not str.isdigit(out[0]) or not str.isdigit(out[1])):
+                        return program.fail(n+1, 'Error: syntax error in line ' + str(n+1) + ' "' + line + '"')
+                    if int(out[0]) < 2 or int(out[0]) > 254:
+                        return program.fail(n+1, 'Error: IP must be between 2-254.' + where)
+                    if int(out[1]) < 2 or int(out[1]) > 254:
+                        return program.fail(n+1, 'Error: IP must be between 2-254.' + where)
+                    out1 = int(out[0])
+                    out2 = int(out[1])
+
+                listids[2*i] = out1
+                listids[2*i+1] = out2
+
+            for id in listids:
+                listsend.append(id)
+
+            if id_in not in send:
+                send[id_in] = list()
+            send[id_in].append(listsend)
+
+        # Receive
+
+        if (re.search("<-", line)):
+
+            result = re.search("^(\\d{1,3})<-(.*):(\\d{1,3})@(.*?)(\\[(\\d+,)?(\\d+)\\])?(\\s*#.*)*$", line)
+            if not result:
+                return program.fail(n+1, 'Error: Receive ID must be a number.' + where)
+            if int(result.group(1)) < 2 or int(result.group(1)) > 254:
+                return program.fail(n+1, 'Error: Receive ID must be between 2-254.' + where)
+
+            id_in = int(result.group(1))
+
+            if result.group(2) == '':
+                return program.fail(n+1, 'Error: sensor must be valid. In line  ' + str(n+1) + ' "' + line + '"')
+            sensor = result.group(2)
+            if sensor not in SENSORS:
+                return program.fail(n+1, 'Error: sensor must be valid.' + where)
+
+            id_out = result.group(3)
+
+            if result.group(4) == '':
+                return program.fail(n+1, 'Error: action cannot be empty in line ' + str(n+1) + ' "' + line + '"')
+            actuador = result.group(4)
+            if actuador not in ACTUATORS:
+                return program.fail(n+1, 'Error: action must be valid.' + where)
+
+            if result.group(5):
+                if result.group(6):
+                    map1 = result.group(6)[:-1]
+                    if int(map1)<0 or int(map1)>127:
+                        return program.fail(n+1, 'Error: map value must be between 0-127.' + where)
+                else:
+                    map1 = 255
+                map2 = result.group(7)
+                if int(map2)<0 or int(map2)>127:
+                    return program.fail(n+1, 'Error: map value must be between 0-127.' + where)
+            else:
+                map1 = 255
+                map2 = 255
+
+            listreceive = []
+
+            listreceive.append(SENSORS.index(sensor))
+            listreceive.append(int(id_out))
+            listreceive.append(ACTUATORS.index(actuador))
+            listreceive.append(int(map1))
+            listreceive.append(int(map2))
+
+            if id_in not in receive:
+                receive[id_in] = list()
+            receive[id_in].append(listreceive)
+
+    program.send = dict(sorted(send.items()))
+    program.receive = dict(sorted(receive.items()))
+    program.keylist = sorted(set(list(program.send.keys()) + list(program.receive.keys())))
+
+    return program
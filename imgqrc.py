@@ -1,6189 +0,0 @@
-# -*- coding: utf-8 -*-
-
-# Resource object code
-#
-# Created by: The Resource Compiler for PyQt5 (Qt v5.15.2)
-#
-# WARNING! All changes made in this file will be lost!
-
-from PyQt5 import QtCore
-
-qt_resource_data = b"\
-\x00\x00\x52\x51\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
-\x00\x00\x20\x00\x49\x44\x41\x54\x78\x9c\xec\xdd\x77\x9c\x5f\x55\
-\x9d\xff\xf1\xd7\xcc\x24\x99\x24\x93\x4c\x1a\x69\x94\x90\x42\xef\
-\xbd\x29\x88\x88\x14\x97\xb5\x00\x62\x5d\x71\xed\x2b\xa0\x22\x16\
-\x2c\xeb\xae\xeb\xaa\x6b\xc1\x5d\x69\xeb\xaa\x88\x0d\x59\x05\x05\
-\xfb\xaa\x28\x28\xa8\x20\xbd\xb7\x54\x20\x21\xbd\xf7\x99\xcc\xfc\
-\xfe\x78\x7f\xbf\xbf\x19\x42\x48\x66\xe6\x7b\xee\x3d\xf7\xdc\xfb\
-\x7e\x3e\x1e\x9f\xc7\x8c\x21\x26\x27\x77\xee\xf7\x9e\xcf\x3d\xe5\
-\x73\xc0\xcc\xcc\xcc\xcc\xcc\xcc\xcc\xcc\xcc\xcc\xcc\xcc\xcc\xcc\
-\xcc\xcc\xcc\xcc\xcc\xcc\xcc\xcc\xcc\xcc\xcc\xcc\xcc\xcc\xcc\xcc\
-\xcc\xcc\xcc\xcc\xcc\xcc\xcc\xcc\xcc\xcc\xcc\xcc\xcc\xcc\xcc\xcc\
-\xcc\xcc\xcc\xcc\xcc\xcc\xcc\xcc\xcc\xcc\xcc\xcc\xcc\xcc\xcc\xcc\
-\xcc\xcc\xcc\xcc\xcc\xcc\xcc\xcc\xac\x8a\x9a\x62\x37\xc0\xcc\x76\
-\xa8\xa9\x16\xcd\xbd\xbe\x6e\xeb\xfb\x41\xc0\x30\x60\x08\xd0\x0a\
-\x0c\xae\xfd\xb7\x61\x40\x4b\xed\xfb\xe1\xbd\x7e\xbd\xb5\xf6\x7b\
-\x3b\x80\x8d\xc0\x96\x5a\xac\xaf\x7d\xed\x02\x36\xd4\xbe\xef\xac\
-\xfd\x9e\x8e\xda\xaf\x75\xd6\xfe\x7b\x3d\xba\xb7\xfa\x5a\xff\xbe\
-\x3b\x83\xeb\x61\x66\x01\x0c\x8a\xdd\x00\x33\xdb\xa1\x7a\x47\x5f\
-\xef\xc4\x7b\x7f\xdf\xfb\x6b\x5f\x12\x80\x61\xb5\x5f\x6f\x02\x86\
-\xd6\x7e\x6f\xfd\x39\xd0\x85\x3a\xfb\x6e\x7a\x12\x00\xe8\x49\x00\
-\x9a\x7a\xfd\xde\x8e\x5e\xbf\xa7\xfe\xb5\xfe\x7d\x3d\x61\xa9\xff\
-\x59\x66\x56\x40\x1e\x01\x30\x8b\xaf\xf7\x9b\x7c\x3d\x86\x01\x13\
-\x6b\x31\x06\x18\x55\x8b\xf6\x5e\xdf\x8f\x02\x46\xf7\xfa\x3a\x12\
-\x75\xf4\x4d\xbd\x82\xad\xbe\x6f\xde\xea\xd7\x9a\xe8\x79\x53\xaf\
-\x77\xd6\xf5\x8e\xbf\xf7\xf7\xbd\x7f\x4f\x17\xb0\x16\x58\x01\xac\
-\x02\x56\xd6\xbe\xae\xde\xea\xeb\xca\xda\xef\x59\x0c\x2c\x42\x23\
-\x0b\xbd\x47\x08\x7a\x8f\x14\x98\x59\xce\x9c\x00\x98\xc5\x31\x1c\
-\x75\xee\xbb\x00\x93\x81\x9d\x7b\x7d\xdd\x19\x98\xc4\x73\xdf\xd0\
-\x07\xd1\xf3\x96\xdf\xfb\xfb\x96\xbc\x1b\xbe\x0d\xf5\xa9\x83\xce\
-\x5e\x5f\x7b\x47\x07\xb0\x19\x58\x07\x2c\x04\x16\xd4\xe2\xd9\x5a\
-\x2c\x00\xe6\xa3\x44\x61\x4b\xce\x6d\x37\xab\x2c\x27\x00\x66\xd9\
-\x19\x0c\xec\x0e\x4c\x03\xa6\xf6\xfa\x3a\x1e\x75\xee\xc3\x50\x22\
-\x50\xff\x5a\xff\xbe\x08\x9d\x7a\x96\x36\xa3\xd1\x80\x0d\xb5\x58\
-\x5f\x8b\x75\x68\xa4\xe0\x29\x60\x0e\x30\xb7\xf6\x75\x1e\x5a\x7f\
-\x60\x66\x01\x39\x01\x30\x0b\x63\x17\x60\xd7\x5a\x4c\x05\xa6\xa3\
-\x37\xfa\x31\xc0\xd8\xda\xd7\x31\xc0\x88\x48\xed\x4b\xc9\x7a\x34\
-\x75\xb0\x02\x58\xde\xeb\xeb\x7c\x94\x14\x3c\x5d\xfb\x7e\x16\x4e\
-\x0c\xcc\x06\xcc\x09\x80\x59\xff\x8d\x07\xf6\x40\x9d\xfc\x74\x60\
-\xb7\xda\xaf\xed\x54\x8b\xfa\xbc\xbd\x85\xd5\x81\xa6\x10\x96\xd6\
-\xe2\xd9\xda\xff\x7e\x0a\x98\x09\xcc\xae\x85\xa7\x11\xcc\xfa\xc0\
-\x09\x80\xd9\xf6\x8d\x40\x73\xf2\xbb\xa2\x21\xfc\x5d\x81\x29\xa8\
-\xe3\x9f\x86\x86\xf8\x2d\xae\x55\x68\x34\x60\x4e\xaf\x98\x8f\x46\
-\x0a\xe6\x01\xcb\xe2\x35\xcd\xac\xb8\x9c\x00\x98\x3d\x57\x7d\x61\
-\xde\xa4\xda\xd7\x69\xa8\xb3\xdf\x13\xd8\x1f\x6d\xaf\xb3\xe2\x9b\
-\x03\x3c\x01\x3c\x06\x3c\x8e\x92\x81\x45\xc0\x33\x68\xe4\xc0\xac\
-\xf2\x9c\x00\x58\xd5\xd5\x57\xe3\x4f\x44\xc3\xfa\x87\x03\x87\xa2\
-\xce\x7e\xa7\x88\xed\xb2\xb0\x56\x00\x8f\x00\xf7\x01\x77\xa3\x29\
-\x83\xa5\x28\x29\x58\x1e\xb1\x5d\x66\xd1\x38\x01\xb0\xaa\x19\x8c\
-\xf6\xcc\xb7\xa3\xb9\xfb\x43\x81\xe3\x80\x63\xd1\x1b\xbf\x55\xc3\
-\x6a\x94\x0c\xdc\x06\xfc\x05\xad\x1d\x58\x8d\x6a\x17\xac\x8b\xd8\
-\x2e\xb3\xdc\x38\x01\xb0\x2a\x18\x0e\xb4\xa1\x85\x7a\x87\x03\x2f\
-\x02\x8e\x04\xf6\x41\xfb\xec\xeb\xc5\x73\xac\x7a\xea\x35\x0c\x16\
-\x00\xf7\xa2\x84\xe0\x36\xb4\xdb\x60\x1d\x4e\x06\xac\xc4\xfc\xd0\
-\xb3\xb2\x1a\x84\x3a\xfe\x03\x81\x93\x81\x97\x02\x7b\xd3\xb3\xd7\
-\x7e\x70\xbc\xa6\x59\x41\xd5\xcf\x3e\x58\x8f\xa6\x08\x6e\x01\x6e\
-\x02\xee\xa9\xfd\x5a\x07\xae\x5a\x68\x25\xe2\x04\xc0\xca\x66\x28\
-\x70\x18\x70\x22\xf0\x32\x34\xaf\x3f\x06\x95\xc9\x35\xeb\x8f\x7a\
-\xb9\xe3\x05\xc0\x1d\xc0\x1f\x80\x3f\xa2\x69\x02\xb3\xe4\x39\x01\
-\xb0\x32\x18\x0e\x1c\x8d\x3a\xfd\x63\xd0\xdc\xfe\x24\xbc\x17\xdf\
-\xc2\xd9\x80\x6a\x0e\x3c\x0d\x3c\x80\xa6\x09\x6e\x46\xe5\x8b\xcd\
-\x92\xe4\x04\xc0\x52\xd5\x8e\x3a\xfb\x17\xa3\x61\xfe\x69\xb5\x68\
-\x8f\xd9\x28\xab\x84\x0e\x54\x5f\x60\x26\x5a\x48\xf8\x67\xb4\x90\
-\xd0\xbb\x09\x2c\x29\x4e\x00\x2c\x35\x07\x00\x27\xa0\x37\xfe\x03\
-\xf0\xde\x7c\x8b\xab\x13\x6d\x2f\x7c\x04\x2d\x22\xfc\x2b\x4a\x06\
-\x5c\x8d\xd0\x0a\xcf\x09\x80\xa5\x60\x02\x5a\xbd\x7f\x64\x2d\x5e\
-\x8c\xb6\xf2\x99\x15\x49\x07\x5a\x2b\xf0\x17\x54\x6b\xe0\x5e\xe0\
-\xc9\xa8\x2d\x32\xdb\x0e\x27\x00\x56\x54\xad\xc0\x7e\xe8\x2d\xff\
-\x18\xb4\x8a\x7f\xdf\xa8\x2d\x32\xeb\xbb\x45\x68\xc1\xe0\x2d\xc0\
-\x43\xb5\x58\x11\xb3\x41\x66\x5b\x73\x02\x60\x45\x33\x15\x95\xde\
-\x3d\x14\x78\x05\x70\x3c\xde\xb2\x67\x69\x7b\x00\xf8\x05\x5a\x38\
-\xf8\x04\x2a\x53\xdc\x15\xb5\x45\x66\x38\x01\xb0\x62\x68\x45\x47\
-\xe7\x1e\x0d\xbc\x1a\x38\x05\x1d\xa1\x6b\x56\x26\x6b\x80\xdf\x03\
-\x37\xa0\xb5\x02\x0b\x6b\xbf\x66\x16\x85\x13\x00\x8b\x69\x38\x9a\
-\xdf\x7f\x39\xf0\x0f\xc0\x11\x68\x1f\xbf\xef\x4b\x2b\xb3\xcd\xc0\
-\xa3\xc0\x8f\x81\xeb\xd1\x01\x45\x4e\x04\x2c\x77\x7e\xd0\x5a\x0c\
-\xad\xa8\x40\xcf\xd9\xc0\x59\x68\xfb\xde\x88\xa8\x2d\x32\xcb\xdf\
-\x06\x54\x64\xe8\x97\xc0\x35\xc0\x83\xc0\x46\x5c\x6d\xd0\x72\xe2\
-\x04\xc0\xf2\xd4\x8a\x16\xf4\xbd\x11\x2d\xea\x9b\x84\x2b\xf4\x99\
-\x6d\x40\x05\x85\xee\x46\x89\xc0\xef\xf0\x88\x80\xe5\xc0\x09\x80\
-\xe5\x61\x1c\x70\x3a\xf0\x2a\x7a\x8a\xf6\x0c\x89\xda\x22\xb3\x62\
-\x9a\x8b\x76\x0c\xfc\x14\x2d\x1c\x5c\x18\xb5\x35\x56\x6a\x4e\x00\
-\x2c\x4b\xed\xc0\x19\xc0\x99\xa8\x3e\xff\xb4\xb8\xcd\x31\x4b\xc6\
-\xd3\x68\x4a\xe0\x37\xc0\x75\xc0\xb3\x71\x9b\x63\x65\xe4\x04\xc0\
-\xb2\x30\x16\x38\xad\x16\xc7\x01\x33\xe2\x36\xc7\x2c\x59\x4b\x80\
-\x5b\xd1\xb9\x03\x3f\x03\x9e\x8a\xdb\x1c\x2b\x13\x27\x00\x16\xd2\
-\x4e\xc0\x4b\xd0\x36\xbe\x53\xd0\x9e\x7e\x33\x6b\xdc\x4a\xe0\xff\
-\x80\x5f\xa3\x53\x09\x9f\x89\xdb\x1c\x2b\x03\x27\x00\x16\xc2\x38\
-\xb4\xb8\xef\x54\xe0\x95\xc0\xee\x71\x9b\x63\x56\x5a\xcb\x80\x1b\
-\xd1\x42\xc1\xdb\xd1\xa1\x44\x66\x03\xe2\x04\xc0\x1a\x31\x1e\x38\
-\x08\xbd\xed\xbf\x1e\x98\x12\xb7\x39\x66\x95\xb1\x1a\xd5\x11\xf8\
-\x31\x70\x0f\x5e\x23\x60\x03\xe0\x04\xc0\x06\x62\x38\xaa\xd3\xff\
-\x06\xe0\xcd\xa8\x98\x8f\x99\xe5\x6f\x39\xf0\x23\xe0\x07\xc0\xc3\
-\xf8\x48\x62\xeb\x07\x27\x00\xd6\x1f\x83\x80\x5d\x50\xf1\x9e\xf7\
-\xa0\xc5\x7d\xcd\x51\x5b\x64\x66\xdd\xe8\xf0\xa1\x6b\x80\x6f\xa2\
-\xad\x84\x1b\x63\x36\xc8\xd2\xd0\x12\xbb\x01\x96\x8c\x51\xc0\x6b\
-\x81\x2f\xa2\xe1\xfe\x49\x38\x81\x34\x2b\x82\x26\x54\x49\xf3\x70\
-\xe0\x44\xf4\x5c\x9f\x07\xac\x8b\xd8\x26\x4b\x80\x1f\xe0\xb6\x23\
-\x2d\xc0\x49\xc0\xbb\xd0\x0a\xff\xf1\x71\x9b\x63\x66\x3b\xb0\x02\
-\xb8\x0b\x8d\x06\xfc\x1c\x55\x1a\x34\x7b\x1e\x27\x00\xb6\x3d\x87\
-\x01\xef\x04\x4e\x46\xc3\xfd\xbe\x5f\xcc\xd2\xf1\x14\xda\x29\x70\
-\x35\xda\x42\x68\xf6\x1c\x7e\xa0\xdb\xb6\xec\x85\xea\xf5\x9f\x0e\
-\x1c\x0a\x0c\x8e\xdb\x1c\x33\x6b\xc0\xc3\xc0\xaf\x80\xef\xa1\xea\
-\x82\x66\x80\xd7\x00\xd8\x73\x0d\x05\xce\x01\x3e\x88\x56\xf7\x4f\
-\xc5\xf7\x88\x59\xea\x26\x00\x47\x02\xfb\x00\xc3\x80\xd9\x78\x91\
-\xa0\xe1\x87\xbb\xf5\x38\x10\x38\x0f\xf8\x00\x70\x34\x7e\xeb\x37\
-\x2b\x93\x16\x60\x3a\x2a\xd8\x35\x11\x58\x8b\x8b\x08\x55\x9e\x13\
-\x00\x9b\x80\xaa\xf7\x7d\x00\x78\x3b\x30\x3a\x6e\x73\xcc\x2c\x43\
-\x6d\xc0\x51\xa8\x8e\xc7\x20\x74\x0c\xf1\xaa\xa8\x2d\xb2\x68\x9c\
-\x00\x54\xd7\x20\xb4\xc8\xef\x9f\x80\x4f\x00\x07\xc7\x6d\x8e\x99\
-\xe5\x68\x57\xb4\xb8\x77\x2c\x4a\x00\x16\x03\x9d\x51\x5b\x64\xb9\
-\x73\x02\x50\x4d\x93\xd0\x11\xbd\x9f\x02\xce\x46\xf3\x82\x66\x56\
-\x2d\xf5\x97\x80\x63\x6b\xff\x7b\x3e\x2a\x31\x6c\x15\xe1\x04\xa0\
-\x5a\x5a\x51\xb1\x90\x8f\x01\x1f\x06\xa6\xc5\x6d\x8e\x99\x15\xc0\
-\x4e\x68\x34\x60\x6f\x34\x12\xb0\x10\x8f\x06\x54\x82\x13\x80\xea\
-\x18\x05\xbc\x03\xf8\x1c\x2a\xe8\xd3\x1a\xb7\x39\x66\x56\x20\xcd\
-\xc0\x9e\xf4\x3c\x1b\x1e\x05\xd6\x47\x6d\x91\x65\xce\x09\x40\x35\
-\xec\x07\x7c\x06\x78\x37\x9a\xfb\x73\xfd\x7e\x33\xdb\x5a\x13\x5a\
-\x04\x7c\x04\x3a\xe5\x73\x2e\xf0\x4c\xcc\x06\x59\xb6\x9c\x00\x94\
-\xdb\x20\x54\xbf\xff\x33\xa8\xa8\x4f\x5b\xdc\xe6\x98\x59\x02\x5a\
-\x51\xcd\x80\x23\x81\x21\xc0\x23\xc0\xe6\xa8\x2d\xb2\x4c\x38\x01\
-\x28\xaf\xa9\xc0\x47\xd1\xde\xfe\x43\xf0\xcf\xda\xcc\xfa\x67\x12\
-\xaa\x04\xba\x3b\xaa\x19\xb0\x38\x6e\x73\x2c\x34\x77\x0a\xe5\xf4\
-\x72\xe0\x93\xa8\x9a\xdf\x84\xc8\x6d\x31\xb3\x74\x8d\x40\x3b\x05\
-\xf6\x06\x3a\x80\x59\x78\x81\x60\x69\x38\x01\x28\x97\xc9\xc0\xdb\
-\x50\x29\xdf\x97\xa1\x29\x00\x33\xb3\x46\x34\xa1\x2a\x82\x87\x00\
-\xed\x68\xbb\xe0\xf2\xa8\x2d\xb2\x20\x7c\x18\x50\x79\x1c\x8e\x4e\
-\xee\x7b\x03\xfa\x90\x5a\xf5\x6c\x06\x36\xa1\x3a\xef\x1b\xd0\x9b\
-\x5a\x37\x7a\x73\xeb\xda\xc6\xf7\x9d\xc0\x16\xb4\x28\x74\x50\xed\
-\x6b\x13\x9a\xf7\x6d\xda\xea\xd7\x07\xa1\xb3\x22\xea\x31\x24\xa7\
-\x7f\x93\x15\xcb\x66\xe0\x06\xe0\x72\xe0\xb6\xc8\x6d\xb1\x06\x39\
-\x01\x48\xdf\x30\xe0\x24\xe0\x43\xc0\x89\x71\x9b\x62\x19\xe8\x40\
-\xdb\xb1\x7a\xc7\x06\x9e\xdb\xd9\xaf\xd9\x2a\x56\xa3\xea\x6e\x9b\
-\x51\x07\xbf\xb1\xf6\xb5\xbb\xf6\xff\xdd\x52\x8b\x4d\x28\x09\x18\
-\x84\x16\x7e\xb5\xa0\xce\x7e\x58\xed\x6b\x4b\xed\xd7\x07\xa1\x0e\
-\xbf\x1d\x18\xd9\x2b\xea\xff\x7b\x58\xed\xbf\xb7\xa2\xe4\x60\xf8\
-\x56\xe1\x64\xa1\x7c\xfe\x06\x7c\x09\x1d\x33\xbc\x36\x72\x5b\x6c\
-\x80\x9c\x00\xa4\x6d\x27\xe0\x75\x68\xc8\x7f\x7a\xe4\xb6\xd8\xc0\
-\x6d\x04\xd6\xa1\xce\x79\x03\xea\x98\xd7\xa2\x45\x57\xcf\xa2\xc2\
-\x2c\x0b\x81\x45\xb5\xff\xbd\x14\x75\xf2\x2b\x29\xc6\xea\xec\x41\
-\x68\xfb\xd8\x28\x60\x1c\x3a\x6c\x66\x32\x5a\x44\xd6\x3b\x46\xa0\
-\x24\x61\x58\x2d\xda\x70\x15\xca\x94\x2d\x00\xbe\x02\x5c\x83\xee\
-\x4f\x4b\x8c\x13\x80\x74\xed\x0e\x5c\x08\xbc\x15\x3d\x78\xad\xf8\
-\x3a\x50\xe7\x5e\x7f\x7b\x5f\x8d\x56\x57\xcf\x44\x8b\xab\xe6\x00\
-\x4f\xa1\x4e\x7e\x19\x1a\xaa\xaf\x0f\xd7\xd7\x23\x15\x4d\x5b\x45\
-\x33\xaa\x3b\x3f\x19\xd5\xa2\x98\x0e\xcc\x00\xf6\x40\x3b\x56\x46\
-\xd3\x33\x8a\x30\x04\x8f\x1a\xa4\x62\x3d\x70\x2d\x1a\x0d\x78\x3c\
-\x72\x5b\xac\x9f\x9c\x00\xa4\xa7\x09\x15\xea\xf8\x57\x54\xbe\xd3\
-\x0f\xca\x62\xaa\xcf\xb1\x77\xa2\x61\xf9\x99\xe8\x01\x39\xb3\x57\
-\x2c\x40\x6f\xff\x1d\xb5\xe8\x44\x1d\x7e\xd9\x35\xa1\xe3\xa6\x07\
-\xd5\xbe\xb6\x02\x3b\xd3\x93\x10\xec\x59\x8b\x3d\x50\x72\x5b\xff\
-\x7d\x2e\x60\x55\x4c\x9d\x68\x3d\xc0\xa7\x81\x5b\xd1\xf4\x92\x25\
-\xc0\x09\x40\x5a\x06\x01\xaf\x42\xa7\xf7\x1d\x82\x7f\x7e\x45\xb4\
-\x05\x55\x4f\x7b\x08\x78\x10\xb8\x07\x78\x0c\x0d\xd7\x6f\xa0\x67\
-\x81\x9e\x1f\x92\xcf\xd7\x42\xcf\x22\xc3\xfa\x14\xc1\x14\xe0\x40\
-\x54\x99\xee\x60\x54\xa0\x66\x68\xac\x06\xda\x76\x3d\x09\x7c\x11\
-\xf8\x01\x2e\x23\x9c\x04\x77\x20\xe9\x18\x8f\x56\xf9\xbf\x1b\x3d\
-\x14\xad\x18\x56\x01\xf7\xa3\xce\xfe\x51\xd4\xd9\x2f\xab\xfd\xfa\
-\x4a\x60\x45\xbc\xa6\x95\xc6\x70\x34\x45\x30\x1a\x7d\x0e\xf6\x46\
-\xe5\xad\x0f\x40\x85\x6a\xc6\xc6\x6b\x9a\x6d\x65\x21\xf0\x6d\xe0\
-\x0a\x5c\x46\xb8\xf0\x9c\x00\xa4\xe1\x40\xe0\xfd\xc0\xab\xd1\x22\
-\x2b\x8b\xa7\x13\x78\x18\xbd\xd9\xdf\x8f\x86\xf5\x17\xa2\x05\x7b\
-\x4b\xd0\x50\xbe\x65\xab\x05\x25\x02\xe3\xd1\x9a\x82\x3d\xd1\xe8\
-\xc0\xa1\xe8\xb3\xe2\x83\xae\xe2\x5a\x0d\xfc\x02\xb8\x0c\xb8\x3d\
-\x72\x5b\x6c\x3b\x9c\x00\x14\xdf\x8b\x80\x8f\x00\x7f\x87\x0b\x37\
-\xc5\x32\x1f\xbd\xe1\x3f\x80\x3a\xfc\x39\xc0\x6c\xb4\x80\xcf\x8a\
-\xa1\xbe\xb0\x70\x2a\x3a\xe6\x7a\x6f\x94\x14\xec\x17\xb1\x4d\x55\
-\xf7\x07\xe0\xcb\xc0\xaf\x63\x37\xc4\xb6\xcd\x09\x40\xb1\x9d\x82\
-\xe6\xfb\x4f\x88\xdd\x90\x0a\x7a\x14\xcd\xe3\x3f\x0a\x3c\x81\x0e\
-\x44\x79\x04\xad\xde\xb7\xe2\x9b\x86\xa6\x08\xf6\x07\xf6\x42\x6b\
-\x07\x0e\xc1\xdb\x0e\xf3\x76\x1f\xf0\x1f\xc0\x75\x54\x63\x81\x6b\
-\x52\x9c\x00\x14\xd3\x60\xe0\x35\xc0\xc7\xd0\x43\xcb\xb2\xd7\x8d\
-\x56\xe6\xd7\x3b\xfe\xbb\x50\xb1\x93\xf9\x31\x1b\x65\x41\xd4\xeb\
-\xd9\xbf\xa8\xf6\xb5\xbe\xd3\xc0\xa7\x63\xe6\x63\x36\x3d\x8b\x03\
-\xd7\x44\x6e\x8b\xf5\xe2\x04\xa0\x78\x46\xa1\xe2\x3e\x17\xa3\xb7\
-\x18\xcb\xce\x3a\xe0\x69\xb4\x58\xe9\x31\xe0\xcf\xc0\xef\xd1\x5c\
-\xbe\x95\x53\x3b\x70\x0c\xf0\x62\x54\x3e\x7b\x2a\xb0\x1b\xaa\x68\
-\x68\xd9\x59\x8a\xa6\x03\xae\xaa\x7d\x6f\x05\xe0\x04\xa0\x58\xc6\
-\x03\xef\x02\x2e\x02\xc6\x44\x6e\x4b\x99\x2d\x44\x05\x77\xfe\x84\
-\x3a\xfc\xbf\xa0\x85\x4b\x56\x2d\xc3\x80\xe3\x50\x29\xed\x97\xa0\
-\x44\x60\x32\x1a\x81\xb3\xf0\xd6\x03\x97\x02\xff\x03\xcc\x8d\xdb\
-\x14\xb3\x62\x99\x82\xaa\x69\xad\xe3\xb9\x95\xdf\x1c\x61\x62\x1d\
-\xea\xf4\x6f\x04\xce\x45\xa5\x69\xbd\xa8\xd2\x40\x05\x86\x46\x03\
-\xaf\x00\xae\x46\xfb\xd9\x57\x12\xff\x9e\x2d\x63\x74\x02\xdf\x47\
-\xbb\x35\xcc\x0c\x15\x39\xf9\x5f\xb4\xc0\x2c\xf6\x07\xb4\x4c\xd1\
-\x89\x6a\xea\xdf\x0d\xfc\x1b\x70\x14\x1a\xea\x75\xc7\x6f\xdb\xd2\
-\x84\xd6\x05\xec\x89\xea\x6d\xfc\x0e\xd5\x73\xe8\x20\xfe\xbd\x5c\
-\xa6\xe8\x04\x7e\x03\x1c\x8f\x47\xa1\xad\xe2\x8e\x07\x6e\x42\xf5\
-\xe1\x63\x7f\x30\xcb\x14\xf3\x80\xaf\x03\xa7\xa3\xd1\x15\xcf\xf1\
-\x5a\x7f\xd4\xcb\x13\x9f\x0c\x7c\x15\x8d\x0a\xc4\xbe\xa7\xcb\x14\
-\x5b\x80\xbf\xa2\xcf\xa7\x59\x25\x9d\x84\xe6\xa1\x63\x7f\x18\xcb\
-\x14\x0f\xa1\x73\x12\x8e\x41\xc3\xfc\x66\x8d\x1a\x8f\x76\xe3\x9c\
-\x07\xdc\x4c\xcf\xd1\xca\x8e\xc6\xe3\x5e\xe0\xec\xbe\xff\x28\xcc\
-\xca\xe1\x74\xb4\xf8\x2c\xf6\x07\xb0\x0c\xd1\x89\x46\x51\x3e\x08\
-\x1c\x8b\xe6\x73\xcd\x42\x1b\x8c\x8a\x0b\xbd\x13\x4d\xd9\x79\x9d\
-\x40\x98\x78\x18\x78\x63\x3f\x7e\x0e\x66\x49\x7b\x05\x70\x27\xf1\
-\x3f\x78\xa9\xc7\x72\xb4\xb7\xf8\xdd\x68\x4b\x97\x4f\x8b\xb3\xbc\
-\xec\x89\x3a\xad\x2b\xd1\x3e\xf7\xd8\x9f\x85\xd4\xe3\x09\xe0\x1f\
-\xfa\xf5\x13\x30\x4b\xd0\xab\xd1\xb0\x57\xec\x0f\x5c\xca\x31\x13\
-\xf8\x26\xf0\x76\x54\xfe\xd5\x2c\x96\x9d\xd0\x10\xf6\xe5\xa8\x88\
-\x54\xec\xcf\x46\xca\x31\x13\x78\x0b\x5e\x18\x68\x25\xd4\x84\x1e\
-\x14\x8f\x10\xff\x83\x96\x6a\xcc\x43\x5b\x88\xde\x88\x17\xf5\x59\
-\xb1\x0c\x05\xce\x42\x89\xe9\x43\xc4\xff\xac\xa4\x1a\x73\x51\x62\
-\xef\x23\x9f\xad\x34\x5a\x80\x73\xd0\x30\x57\xec\x0f\x58\x8a\x31\
-\x0f\xf8\x29\xf0\x0e\x54\xc9\xcd\xac\xa8\x06\x01\xaf\x04\xae\xc1\
-\x9f\xf7\x81\xc6\x42\xe0\x9f\xd0\x31\xd0\x66\x49\x6b\x45\x6f\xac\
-\x73\x88\xff\xc1\x4a\x2d\xe6\x03\xbf\x42\x73\x83\x23\xfa\x7b\xe1\
-\xcd\x22\x6a\x05\xce\x40\x87\xe0\xcc\x23\xfe\x67\x29\xb5\x58\x0a\
-\x9c\x8f\x93\x00\x4b\xd8\x20\xd4\x79\x3d\x4b\xfc\x0f\x54\x4a\xb1\
-\x12\x15\x61\x79\x03\x7e\xe3\xb7\xb4\x0d\x07\x5e\x85\x46\xb0\x96\
-\x10\xff\xb3\x95\x52\xac\x40\x49\x40\x6b\xbf\xaf\xba\x59\x64\xcd\
-\x68\xd8\xdf\xd9\x7f\xdf\x63\x13\x70\x3f\xf0\x5e\x60\x02\xae\xd8\
-\x67\xe5\xd0\x8c\x0e\xf9\x3a\x0b\xf8\x03\xb0\x81\xf8\x9f\xb5\x54\
-\x62\x29\x7a\x1e\x0c\xea\xf7\x55\x37\x8b\xe8\x35\xc0\xe3\xc4\xff\
-\x00\xa5\x12\x73\x80\x4f\x02\xfb\xe2\x05\x40\x56\x4e\x2d\xc0\xee\
-\xa8\xa0\xd0\x83\xc4\xff\xcc\xa5\x12\x0b\x50\xed\x05\xb3\x24\x9c\
-\x89\x57\xfb\xf7\x35\x96\xa3\xbd\xd4\x2f\xc2\xc3\xfd\x56\x0d\x43\
-\x51\x65\xc1\xcf\xe2\xe9\xc1\xbe\xc6\x53\xc0\xdb\x06\x72\xb1\xcd\
-\xf2\xf4\xf7\x68\x18\x3b\xf6\x07\xa6\xe8\xd1\x09\xdc\x80\x92\xa5\
-\x9d\x07\x74\xa5\xcd\xd2\x36\x16\x38\x0d\x9d\x59\xe1\xaa\x82\x3b\
-\x8e\x59\xb8\x58\x90\x15\xd8\xa9\xc0\x5d\xc4\xff\xa0\x14\x3d\xfe\
-\x02\xbc\x0f\xd8\x7f\x60\x97\xd9\xac\x54\x76\x43\x6f\xb7\xbf\x27\
-\xfe\x67\xb3\xe8\xf1\x18\xf0\xda\x81\x5d\x66\xb3\xec\xbc\x14\xb8\
-\x9d\xf8\x1f\x90\x22\xc7\x62\xf4\xb6\xf3\x92\x01\x5e\x63\xb3\x32\
-\x3b\x1a\xf8\x32\x3e\x79\x70\x47\xf1\x20\x1a\x69\x35\x2b\x84\x17\
-\x01\x7f\x26\xfe\x07\xa3\xa8\xb1\x19\xb8\x05\xad\xe6\x1d\x3f\xb0\
-\x4b\x6c\x56\x09\xad\xc0\xeb\x80\x5f\x03\xeb\x89\xff\xd9\x2d\x6a\
-\xdc\x07\x9c\x32\xc0\x6b\x6c\x16\xcc\x81\x78\xe8\x6e\x7b\x31\x1b\
-\xd5\x49\x3f\x68\xa0\x17\xd8\xac\x82\xf6\x04\xbe\x80\x17\x13\x6f\
-\x2f\xee\x00\x8e\x1b\xe8\x05\x36\x6b\xd4\x54\x74\x2c\xe8\x66\xe2\
-\x7f\x18\x8a\x16\x6b\x80\x3f\xa2\x62\x3e\xde\xd6\x67\xd6\x7f\x4d\
-\x68\x5d\xd1\x2f\xf0\x22\xc1\x17\x8a\xdf\x00\x07\x0c\xf4\x02\x9b\
-\x0d\xd4\x44\xe0\x52\x54\xbc\x26\xf6\x87\xa0\x68\xb1\x00\xbd\xbd\
-\x4c\x19\xf0\xd5\x35\xb3\xba\x89\xc0\xa7\xf0\xb1\xc3\x2f\x14\xdf\
-\x02\xa6\x0d\xf8\xea\x9a\xf5\xd3\x28\xe0\x63\x78\x8e\x6e\xeb\xe8\
-\x00\xee\x44\xab\x74\x5d\xc3\xdb\x2c\x9c\x56\xe0\xe5\xc0\x4d\x78\
-\xc4\x71\x5b\xcf\x9d\x2f\x03\x93\x06\x7c\x75\xcd\xfa\x68\x08\xf0\
-\x6e\x54\xc0\x26\xf6\x8d\x5f\xa4\x58\x8d\x56\xf8\xef\x87\xcb\x76\
-\x9a\x65\x65\x3a\x70\x09\xb0\x8c\xf8\x9f\xf9\x22\xc5\x5a\xe0\x62\
-\xfc\xe2\x61\x19\x7b\x2d\xaa\x4a\x15\xfb\x86\x2f\x52\x3c\x86\x0e\
-\xed\x70\x06\x6e\x96\xbd\x9d\xd0\x4e\x81\x5b\x89\xff\xd9\x2f\x52\
-\x2c\x01\xde\x83\xd6\x4e\x98\x05\x77\x0a\xae\xe1\xdd\x3b\xb6\x00\
-\x3f\x00\x4e\x02\x86\x35\x70\x5d\xcd\xac\xff\x8e\x04\xbe\x81\x0f\
-\x17\xea\x1d\x73\xd1\xc2\x63\xb3\xa0\x5e\x0c\xdc\x46\xfc\x1b\xbc\
-\x28\x31\x0f\xf8\x17\x60\x8f\x46\x2e\xaa\x99\x35\x64\x37\xe0\x43\
-\xc0\x13\xc4\x7f\x26\x14\x25\x1e\x40\x25\x96\xcd\x82\x38\x10\x6d\
-\xc5\x89\x7d\x63\x17\x25\xfe\x0a\x9c\x8b\xe7\xdb\xcc\x8a\x60\x10\
-\x3a\x7a\xfc\x66\xe2\x3f\x1b\x8a\x12\x7f\x04\x8e\x68\xe4\xa2\x9a\
-\x81\xb6\xe0\x5c\x85\xb7\xfb\x75\xa3\xd5\xb6\x37\xa2\xb2\xc7\x66\
-\x56\x2c\xc7\x02\xd7\xe2\xdd\x49\xdd\xe8\xb0\xb1\xeb\xf0\x41\x63\
-\xdb\xd5\x12\xbb\x01\x05\x37\x04\x1d\x5a\x73\x2e\x30\x32\x72\x5b\
-\x62\x5b\x0e\x5c\x83\x86\xfd\xef\x89\xdc\x16\x33\x7b\xbe\x67\x50\
-\x75\xbc\x66\x54\xa4\xac\xca\xcf\xac\x66\x34\x3d\xd2\x84\xce\x68\
-\xe9\x88\xdb\x1c\x4b\xd1\xd9\x68\x51\x49\xec\x6c\x36\x76\xcc\x01\
-\x3e\x4e\xb5\x1f\x28\x66\xa9\x18\x8c\x56\xc3\x3f\x08\x74\x11\xff\
-\xf9\x11\x33\x96\x00\x6f\x47\x09\x81\x59\x9f\x1d\x89\x0e\x9c\x88\
-\x7d\x03\xc7\x8c\x0e\x74\xbc\xf1\x9b\xf0\xd6\x1a\xb3\xd4\xbc\x0c\
-\xf8\x2d\x9e\xbe\x9c\x85\x76\x2a\x99\xf5\xc9\x54\xe0\x97\xc4\xbf\
-\x71\x63\x77\xfe\xd7\xa3\x85\x34\x9e\x2a\x32\x4b\x4f\x13\xaa\x93\
-\x7f\x35\x4e\x02\xfe\x84\xcf\x0c\xb0\x3e\x18\x0f\x7c\x95\x6a\x7f\
-\x60\x3a\x81\xff\x46\x27\x92\x99\x59\xda\x76\x06\xfe\x1d\x58\x47\
-\xfc\x67\x4b\xac\xe8\x02\xbe\x89\xd6\x05\x98\x6d\xd3\x30\x54\xe6\
-\x77\x15\xf1\x6f\xd8\x58\xb1\x06\xf8\x0c\xae\xea\x67\x56\x26\xa3\
-\x81\xf7\x03\x8b\x88\xff\x8c\x89\x15\xeb\xd0\x19\x2e\xa3\x1b\xbc\
-\x96\x56\x52\xa7\xa2\xf9\xa2\xd8\x37\x6a\xac\x78\x16\xb8\x10\x18\
-\xdb\xe8\x85\x34\xb3\xc2\x19\x8e\x76\x34\x55\xb9\x68\xd0\x7c\xe0\
-\x8d\x8d\x5e\x48\x2b\x9f\x43\x50\xf1\x88\xd8\x37\x68\xac\x78\x04\
-\x78\x1b\x2e\xe9\x6b\x56\x66\xcd\xc0\x59\xc0\xdd\xc4\x7f\xe6\xc4\
-\x8a\x7b\x81\x13\x1a\xbd\x90\x56\x1e\xbb\xa2\xf9\xa1\xd8\x37\x66\
-\xac\xf8\x33\x70\x66\xc3\x57\xd1\xcc\x52\x71\x2a\x3a\x5a\x38\xf6\
-\xb3\x27\x56\x5c\x07\xcc\x68\xf8\x2a\x5a\xf2\x86\x01\x17\x51\xdd\
-\xe3\x7d\x6f\x06\x4e\x6c\xf4\x22\x9a\x59\x72\x8e\x01\x7e\x42\x35\
-\x17\x3c\xaf\x46\x6b\x9d\xda\x1a\xbe\x8a\x96\xb4\xd3\xd1\x90\x50\
-\xec\x1b\x32\xef\xe8\x44\x7b\x84\x5d\xd6\xd7\xac\xba\x0e\x44\x15\
-\x3e\xab\x58\x3e\xf8\x71\x74\xbc\xbb\x55\xd4\x14\xe0\xa7\xc4\xbf\
-\x11\xf3\x8e\x4d\xc0\x0d\xa8\xd8\x91\x99\x55\xdb\xde\xc0\xb7\xa8\
-\xe6\x36\xc1\x5b\x80\x7d\x1a\xbe\x82\x96\x9c\x56\xe0\xcb\xc0\x46\
-\xe2\xdf\x84\x79\x77\xfe\xd7\xe2\xa2\x18\x66\xd6\x63\x06\xf0\x35\
-\xaa\x37\x12\xd0\x81\x0e\x7b\xf3\x54\x40\xc5\xbc\x05\x98\x4d\xfc\
-\x1b\x30\xef\x9b\xfd\x3b\xc0\xbe\x01\xae\x9f\x99\x95\xcb\x6e\xc0\
-\x57\xa8\xde\x9a\x80\x85\xc0\x7b\x71\xc5\xd3\xca\x38\x00\x9d\x69\
-\x1f\xfb\xc6\xcb\x3b\xbe\x86\x57\xbe\x9a\xd9\x0b\x9b\x0c\x7c\x96\
-\xea\x8d\x8c\x3e\x0c\x1c\x1d\xe0\xfa\x59\xc1\xb5\x03\xdf\x45\x8b\
-\xe0\x62\xdf\x74\x79\x45\x17\x70\x19\xb0\x7b\x80\xeb\x67\x66\xe5\
-\x36\x01\xad\x90\xaf\x5a\x12\x70\x23\xae\x80\x5a\x6a\x43\x50\x39\
-\xcc\x95\xc4\xbf\xd9\xf2\xec\xfc\xff\x07\x77\xfe\x66\xd6\x77\x13\
-\x80\x2f\x51\xad\x24\x60\x23\xf0\x49\x7c\xec\x79\x69\x1d\x89\xb6\
-\x7e\xc4\xbe\xd1\xf2\xec\xfc\xbf\x0d\x4c\x0b\x70\xed\xcc\xac\x5a\
-\x26\xa3\x91\xc3\x0d\xc4\x7f\x96\xe5\x15\x4f\x03\xa7\xe0\xe3\xcf\
-\x4b\x67\x1c\x1a\xfa\x8f\x7d\x83\xe5\x15\x5b\x80\x1f\x01\x7b\x85\
-\xb8\x78\x66\x56\x49\xbb\x51\xbd\xdd\x01\x3f\x43\x47\xc2\x5b\x49\
-\x0c\x05\xfe\x91\xea\xdc\xc4\x5b\x50\x7d\x83\x03\x43\x5c\x3c\x33\
-\xab\xb4\xe9\xc0\xd5\x54\xe7\xf9\xd9\x01\x7c\x10\x6f\x0d\x2c\x8d\
-\x23\x80\x3b\x89\x7f\x63\xe5\x11\x9d\xc0\xaf\x80\xa3\x82\x5c\x39\
-\x33\x33\x6d\x1d\xbe\x96\xea\x6c\x11\x7c\x00\x78\x59\x90\x2b\x67\
-\x51\x8d\x06\x2e\x21\xfe\x0d\x95\x47\x6c\x41\xe5\x7d\x8f\x0d\x72\
-\xe5\xcc\xcc\x7a\x1c\x8a\x2a\x88\x76\x10\xff\x59\x97\x47\x7c\x07\
-\xd8\x39\xc8\x95\xb3\x28\x5a\x80\x37\x53\x9d\x83\x7e\x6e\x03\x4e\
-\x0a\x72\xe5\xcc\xcc\x9e\xef\x18\xe0\x37\xc4\x7f\xd6\xe5\x11\x6b\
-\x81\x0b\x80\x41\x41\xae\x9c\xe5\xee\x70\xe0\x77\xc4\xbf\x91\xf2\
-\x88\x47\xd0\x39\xdf\x5e\xbd\x6a\x66\x59\x7a\x39\xd5\x99\x52\xbd\
-\x0d\x38\x21\xcc\x65\xb3\x3c\x0d\x03\x3e\x0f\x6c\x26\xfe\x4d\x94\
-\x75\x2c\x04\xde\x01\x0c\x0e\x72\xe5\xcc\xcc\x5e\x58\x0b\xf0\x1a\
-\x60\x26\xf1\x9f\x7d\x59\x47\x07\xaa\xa3\xd2\x1e\xe4\xca\x59\x6e\
-\x5e\x07\xcc\x23\xfe\x0d\x94\x75\xac\x06\x2e\x04\x86\x87\xb9\x6c\
-\x66\x66\x3b\x34\x18\x9d\xa7\xb2\x98\xf8\xcf\xc0\xac\x63\x09\x3a\
-\x2b\xc0\x12\xb1\x0f\xf0\x73\xe2\xdf\x38\x59\x47\x07\xf0\x6f\x38\
-\x3b\x35\xb3\xfc\x0d\x05\x3e\x84\xe6\xca\x63\x3f\x0b\xb3\x8e\x3f\
-\x01\x07\x85\xb9\x6c\xc5\x51\xd6\xd3\x8f\xde\x0b\xbc\x01\x1d\xf9\
-\x5b\x66\x57\x01\x5f\x40\x8b\x1c\xcd\xcc\xf2\xd4\x89\xd6\x1e\x0d\
-\x41\x55\x56\xcb\xbc\x58\x6e\x3c\xaa\xac\x5a\x5f\x53\x66\x05\x75\
-\x04\x70\x17\xf1\x33\xc6\xac\xe3\x06\x60\xcf\x40\xd7\xcc\xcc\x6c\
-\xa0\x26\xa1\x2d\x73\x65\x5f\x6f\x35\x13\x2f\x08\x2c\xb4\xc1\x68\
-\xc1\x46\xd9\x2b\x56\xdd\x8e\x76\x38\x98\x99\x15\xc1\xbe\xc0\x4d\
-\xe8\x2d\x39\xf6\xf3\x31\xab\xd8\x84\x8a\x21\xf9\xb0\xa0\x82\x3a\
-\x05\x98\x43\xfc\x1b\x25\xcb\x98\x83\xb6\xfb\x99\x99\x15\xc9\xe9\
-\xc0\x43\xc4\x7f\x46\x66\x19\x4b\x80\x73\xf0\x76\xeb\xc2\x19\x03\
-\xfc\x04\x55\xc3\x8b\x7d\x93\x64\x15\xab\xd1\x71\x95\xcd\x81\xae\
-\x99\x99\x59\x48\xef\x45\xdb\x92\x63\x3f\x2b\xb3\x8c\x9b\x81\x5d\
-\x43\x5d\x30\x6b\x5c\x33\xf0\x56\x94\x9d\xc5\xbe\x39\xb2\x8a\xcd\
-\xc0\x37\xf0\x8a\x7f\x33\x2b\xae\x21\xc0\x67\x29\xf7\x11\xc2\xeb\
-\x80\xf3\x6b\xff\x56\x2b\x80\xdd\xd1\xbc\x78\xec\x1b\x23\xab\xe8\
-\x42\xa7\xfb\x79\xd1\x9f\x99\x15\xdd\x64\xe0\x5b\x94\x7b\x34\xf6\
-\x11\xe0\x90\x50\x17\x2c\x96\x32\x6c\x03\x1c\x09\xbc\x1d\xcd\xcb\
-\x94\xb5\x12\xde\x5f\x51\x55\xc3\xbb\x63\x37\xc4\xcc\x6c\x07\xd6\
-\x02\xcf\x02\xd3\x80\x19\x91\xdb\x92\x95\x9d\x80\x15\xc0\x7d\x68\
-\xb4\xc3\x22\x39\x12\x98\x45\xfc\x8c\x30\xab\x98\x03\x9c\x4b\xb9\
-\xf7\xd8\x9a\x59\xb9\xd4\xcb\x05\x3f\x46\xfc\x67\x68\x56\xb1\x80\
-\xc4\x0f\x5f\x4b\x7d\x04\x60\x3c\x5a\x74\x72\x7a\xec\x86\x64\x64\
-\x33\x70\x19\x70\x35\xce\x32\xcd\x2c\x1d\xdd\xa8\x14\x7b\x13\x70\
-\x3c\xe5\x1c\x9d\x1d\x89\x9e\xd1\xf7\xa1\x05\xda\x96\xb3\x93\x81\
-\x45\xc4\xcf\x04\xb3\x8a\x1f\x01\x53\x82\x5d\x2d\x33\xb3\x7c\x8d\
-\x07\xbe\x46\xfc\x67\x69\x56\xb1\x14\x4d\x3f\x5b\xce\x26\x00\x97\
-\x12\xff\x06\xc8\x2a\x1e\x04\x4e\x0c\x75\xb1\xcc\xcc\x22\x39\x04\
-\xf8\x1b\xf1\x9f\xa9\x59\xc5\x77\x81\x5d\x82\x5d\x2d\xeb\x93\x33\
-\x80\xa7\x89\xff\xc3\xcf\x22\xd6\x02\xef\x42\x47\x1a\x9b\x99\xa5\
-\x6c\x08\xf0\x7a\xca\x7b\x72\xe0\xb3\x68\x1b\x7a\x72\x52\x2d\x28\
-\x33\x16\xcd\xfb\x97\xb5\x18\xc3\x0f\xd1\xb6\x3f\xcf\xfb\x9b\x59\
-\xea\x36\x03\xbf\x00\xbe\x8d\xb6\x06\x96\xcd\x24\xe0\x34\x60\xe7\
-\xd8\x0d\xa9\x8a\x73\xd0\x02\x93\xd8\x99\x5f\x16\xf1\x37\x60\xff\
-\x70\x97\xca\xcc\xac\x10\x76\x05\x7e\x4b\x39\xcf\x0b\x58\x00\xbc\
-\x3b\xdc\xa5\xb2\x17\x32\x16\xf8\x26\xf1\x7f\xe0\x59\xdd\x44\x67\
-\x91\xfe\xee\x0c\x33\xb3\x6d\x39\x89\xf2\x6e\x0d\xbc\x91\xc4\x46\
-\x01\x52\xec\x68\xce\x46\xf3\xe3\xa3\x62\x37\x24\xb0\x75\xc0\x55\
-\x28\xb9\xd9\x1c\xb9\x2d\x66\x66\x59\x78\x0a\x95\x33\x3f\x94\xf2\
-\xad\x71\x1a\x8b\xd6\x39\xdc\x19\xbb\x21\x65\x35\x0e\xb8\x86\xf8\
-\x99\x5e\x16\xf1\x27\xbc\xe5\xcf\xcc\xca\x6f\x2c\x3a\xb8\x2d\xf6\
-\x33\x37\x8b\xf8\x15\x89\x8d\x02\xa4\xe4\x1f\x81\xf9\xc4\xff\x21\
-\x87\x8e\xd9\x78\x2f\xa9\x99\x55\xc7\x69\xc0\x03\xc4\x7f\xf6\x86\
-\x8e\x25\xc0\xfb\x02\x5e\xa7\x4c\xa5\xb4\x0b\x60\x3c\xf0\xf7\x94\
-\x2f\xbb\xda\x00\xfc\x12\xf8\x79\xec\x86\x98\x99\xe5\xe4\x66\xb4\
-\xd3\x69\x5d\xec\x86\x04\xb6\x13\x2a\x81\x5c\xb6\x7e\x2a\xba\x37\
-\x51\xce\x7d\xff\xb7\x02\x07\x04\xbc\x4e\x66\x66\x29\x98\x86\x5e\
-\x7c\x62\x3f\x83\x43\xc7\x52\xb4\x4e\xad\x29\xdc\xa5\xaa\xb6\xa1\
-\xc0\xf5\x40\x27\xf1\x7f\xb8\x21\xe3\x19\xe0\x9d\x01\xaf\x93\x99\
-\x59\x4a\xce\x46\x53\xa0\xb1\x9f\xc5\x21\x63\x0b\xf0\x3b\x60\x4c\
-\xc0\xeb\x94\x89\x54\xa6\x00\x8e\x03\x0e\x23\xcd\x5d\x0b\x2f\xa4\
-\x1b\x15\xc7\xb8\x31\x76\x43\xcc\xcc\x22\xf9\x03\x2a\x7c\xd6\x19\
-\xbb\x21\x01\x35\xa3\xf2\xc7\xc7\x53\xae\x3e\x2b\x8a\x21\x68\x6b\
-\xdc\x7a\xe2\x67\x76\x21\xe3\x4e\x74\x83\x98\x99\x55\xd9\xc1\x68\
-\x4d\x40\xec\x67\x72\xc8\xd8\x8c\x0e\x73\x2b\xdb\x76\xf5\x5c\x35\
-\x01\x07\x02\x4f\x12\xff\x07\x1a\x32\xd6\x02\xe7\x05\xbc\x4e\x66\
-\x66\x29\x7b\x23\x3a\x52\x37\xf6\xb3\x39\x64\x2c\x02\x8e\xa5\xc0\
-\x23\xed\x85\x6d\x58\x4d\x2b\x3a\x44\x62\x72\xec\x86\x04\xf6\x4b\
-\x34\x47\x64\x66\x66\x5a\x0c\x7d\x5d\xec\x46\x04\x36\x06\xf5\x5f\
-\x1e\x05\x18\xa0\x69\xc0\x43\xc4\xcf\xe4\x42\xc6\x72\xb4\x4d\xc4\
-\x2b\x44\xcd\xcc\x7a\x9c\x80\xca\xa1\xc7\x7e\x46\x87\x8c\xa7\xd1\
-\xfa\xb5\x42\x2a\xf2\x08\xc0\x30\xe0\x15\x28\x09\x28\x93\xef\x01\
-\x7f\x46\x37\x87\x99\x99\xc9\x7d\xc0\x77\x28\xd7\x82\xc0\x9d\x51\
-\xd1\xa3\xf6\xd8\x0d\x49\xcd\xee\xc0\x6d\xc4\xcf\xe0\x42\xc6\x1c\
-\x34\x27\x64\x66\x66\xcf\xb7\x3f\x70\x3f\xf1\x9f\xd5\x21\xe3\x01\
-\x74\xf6\x41\xe1\x14\x75\x04\x60\x10\x70\x0c\x05\x1e\x3a\x19\x80\
-\x4e\x74\xd8\xcf\xbd\xb1\x1b\x62\x66\x56\x50\x8f\x02\xff\x83\x16\
-\x4a\x97\xc5\xfe\xa8\x3f\x6b\x8d\xdd\x90\xad\x15\x35\x01\x98\x8c\
-\xe6\xc9\xcb\x74\x5a\xd4\xbd\x68\x5b\xc8\xc6\xd8\x0d\x31\x33\x2b\
-\xa8\x2e\xe0\x06\xe0\x6f\xb5\xef\xcb\xa0\x19\x38\x03\x98\x1e\xbb\
-\x21\x5b\x2b\x6a\x02\xb0\x37\x70\x72\xec\x46\x04\xb4\x06\xf8\x1a\
-\xaa\x78\x65\x66\x66\x2f\x6c\x21\x1a\x05\x58\x12\xbb\x21\x01\xbd\
-\x18\xd5\x3b\x28\x94\x22\x26\x00\x23\xd0\x70\xc9\xb8\xd8\x0d\x09\
-\xa4\x13\xb8\x1d\xf8\x19\xe5\x5a\xdc\x62\x66\x96\x85\x6e\x54\x25\
-\xf5\x36\xa0\x23\x72\x5b\x42\x69\x07\x8e\x02\x46\xc7\x6e\x48\x6f\
-\x45\x4c\x00\xf6\x46\xab\xff\xcb\x62\x39\xf0\x2d\x60\x45\xec\x86\
-\x98\x99\x25\x62\x3d\xf0\x5d\x74\xfc\x7b\x59\xbc\x8c\x82\x2d\x06\
-\x2c\x5a\x02\xd0\x0c\x1c\x04\x1c\x11\xbb\x21\x81\x6c\x01\xee\x06\
-\x7e\x5d\xfb\xde\xcc\xcc\xfa\xe6\x37\xc0\x5f\x29\xcf\xc8\xe9\x41\
-\xc0\xe1\x14\xe8\x7c\x80\xa2\x25\x00\x93\x51\x7d\xfc\xc1\xb1\x1b\
-\x12\xc8\x02\xe0\xfb\xc0\xaa\xd8\x0d\x31\x33\x4b\xcc\x26\x54\x1d\
-\x70\x56\xec\x86\x04\x74\x0c\x30\x35\x76\x23\xea\x8a\x96\x00\x1c\
-\x86\xaa\x41\x95\x41\x37\x7a\xfb\xff\x59\xec\x86\x98\x99\x25\xea\
-\x97\xf4\xd4\x83\x29\x83\xa3\xd0\xe9\xb6\x85\x50\xb4\x04\xe0\x08\
-\x0a\xb8\x55\x62\x80\x66\x03\x3f\xa6\x5c\xfb\x59\xcd\xcc\xf2\xb4\
-\x19\x2d\x08\x7c\x24\x76\x43\x02\xd9\x15\x8d\x02\x14\x62\x1a\xa0\
-\x48\x09\xc0\xc1\xe8\xc2\x94\xa5\x46\xfe\xdf\x80\x1b\x63\x37\xc2\
-\xcc\x2c\x71\xbf\x05\x6e\x8a\xdd\x88\x40\x9a\xd0\x48\xf7\xd1\xb1\
-\x1b\x02\xc5\x4a\x00\x8e\xa7\x3c\x65\x72\x9f\x04\x7e\x8e\xdf\xfe\
-\xcd\xcc\x1a\xb5\x1e\x25\x01\x0f\xc7\x6e\x48\x20\x07\x01\x2f\x8f\
-\xdd\x08\x28\x4e\x02\x30\x16\x38\x12\x18\x19\xbb\x21\x81\xfc\x09\
-\xad\x60\x35\x33\xb3\xc6\xfd\x19\xed\xa6\x2a\x83\xe1\x68\x2d\xc0\
-\xc4\xd8\x0d\x29\x4a\x02\x70\x18\x05\xac\x92\x34\x40\x0b\x80\x9b\
-\xd1\xfe\x7f\x33\x33\x6b\xdc\x2a\xe0\x8f\xe8\x78\xdd\x32\xd8\x8b\
-\x02\x8c\x78\x17\x25\x01\x38\x1e\x98\x11\xbb\x11\x81\xdc\x8c\x46\
-\x00\xcc\xcc\x2c\x9c\xbb\x28\xcf\xae\xaa\x5d\x80\x93\x62\x37\xa2\
-\x08\x09\xc0\x48\x34\x27\x32\x22\x76\x43\x02\x58\x4b\xb9\xb2\x54\
-\x33\xb3\xa2\x58\x08\xfc\x1e\x58\x1d\xbb\x21\x01\x0c\x43\x55\x01\
-\xa3\x96\xbc\x2f\x42\x02\x70\x0c\xb0\x47\xec\x46\x04\x72\x2b\xf0\
-\x97\xd8\x8d\x30\x33\x2b\xa9\xfb\x81\xff\x8b\xdd\x88\x40\x76\x25\
-\x72\x4d\x80\x22\x24\x00\x2f\x01\xa6\xc4\x6e\x44\x00\x5b\xd0\x8d\
-\xf9\x68\xec\x86\x98\x99\x95\xd4\x6c\x74\x5c\x70\x19\x0e\x09\x9a\
-\x80\x4e\xbd\x1d\x14\xab\x01\xb1\x13\x80\xfa\x6a\xc8\xf6\xc8\xed\
-\x08\xe1\x1e\xf4\xf6\x5f\x96\x33\xac\xcd\xcc\x8a\xe8\x6e\x74\x46\
-\x40\xea\x86\x03\x2f\x22\xe2\x09\x81\xb1\x13\x80\x23\x29\x50\x5d\
-\xe4\x06\xdd\x80\xdf\xfe\xcd\xcc\xb2\xf6\x14\xf0\x23\x60\x63\xec\
-\x86\x04\xb0\x33\x2a\x0a\x14\xa5\x2f\x8e\x99\x00\x0c\x42\xc7\x23\
-\x4e\x8a\xd8\x86\x50\x9e\x06\xfe\x00\xac\x8b\xdd\x10\x33\xb3\x92\
-\xdb\x84\x2a\x03\x96\xe1\x90\xa0\x31\x68\x1a\x60\x78\x8c\xbf\x3c\
-\x66\x02\x30\x0c\x6d\xff\x4b\x7d\xf5\x7f\x27\x9a\xfb\x2f\xc3\xcd\
-\x68\x66\x96\x82\x67\xd0\x73\x37\xf5\x51\x80\xa1\x68\x3b\xe0\xa8\
-\x18\x7f\x79\xac\x04\xa0\x19\x6d\xfd\x9b\x41\xfa\xb5\xff\x37\xa1\
-\xe1\xff\x15\xb1\x1b\x62\x66\x56\x11\x1b\xd0\x61\x6b\x65\x38\x6a\
-\x7d\x77\xd4\x1f\xe6\x7e\x40\x50\xac\xd5\x87\xad\xa8\x16\xf2\x98\
-\x48\x7f\x7f\x28\xdd\xc0\x83\xb5\xd8\x12\xb9\x2d\x66\x56\x4c\xbb\
-\x01\xd3\xd0\x7c\xef\x4e\x68\xd1\xf3\x10\x60\x30\x7a\x83\xdd\x84\
-\x5e\x20\x16\xa3\x37\xdb\x99\x94\xa3\x63\xcb\x52\x17\x3a\x21\xf0\
-\x7e\x34\x95\x5c\x88\xd3\xf5\x06\x68\x18\xfa\x37\xfc\x15\x58\x99\
-\xe7\x5f\x1c\x2b\x01\x18\x8e\xb6\xff\x45\x99\xf7\x08\x68\x13\x3a\
-\xf1\x6f\x59\xec\x86\x98\x59\xa1\xec\x01\x1c\x00\xec\x0f\xec\x59\
-\x8b\x5d\xd1\xd6\xaf\xa1\xdb\xf8\xfd\x2b\x51\xa1\x9b\xa7\x80\xc7\
-\x80\x27\x50\x07\xf7\x20\xb0\x34\x87\xf6\xa6\x68\x1d\xaa\x0c\x78\
-\x24\x69\xbf\x4c\x0e\x01\x5e\x0a\x5c\x41\xce\x09\x40\x2c\x07\x02\
-\xcf\xa2\x37\xe8\x94\x63\x1e\x70\x48\xe0\x6b\x63\x66\xe9\x3a\x00\
-\x78\x2b\x70\x0d\x3a\x17\xa4\x91\xe7\xcb\xbd\xc0\x57\x80\xbf\x43\
-\xc9\x83\x3d\xdf\x9e\x68\x14\x20\x76\x5f\xd0\x68\xac\x01\x4e\x08\
-\x7c\x6d\x0a\x69\x30\xf0\x36\x54\xce\x31\xf6\x45\x6f\x24\x3a\x81\
-\xeb\x80\xb6\xb0\x97\xc7\xcc\x12\xb4\x2b\xf0\x46\xe0\x77\x68\x78\
-\x3a\xe4\xb3\x66\x29\xf0\x75\xe0\x44\xca\x73\x62\x6a\x28\xcd\xc0\
-\x55\xc0\x66\xe2\xf7\x09\x8d\xf6\x27\x17\xb2\xed\xd1\xa1\x52\x19\
-\x0f\x7c\x93\xf4\x7f\x60\x0b\x81\x37\x90\xf6\xdc\x93\x99\x35\x66\
-\x08\xda\xc7\xfd\x5d\x74\x6e\x7d\x96\xcf\x9c\x79\xc0\xc5\x68\x4d\
-\x81\xf5\x78\x15\x5a\x37\x11\xbb\x4f\x68\x24\xba\x80\x1f\x52\x8e\
-\xaa\xb8\xdb\xb5\x17\xf0\x10\xf1\x2f\x78\xa3\x71\x3b\x9a\xcf\x33\
-\xb3\x6a\x6a\x05\xde\x02\x3c\x80\x16\x01\xe7\xf1\xdc\xd9\x84\x46\
-\x1e\x8f\x22\x7e\x21\xb7\xa2\x68\x07\x7e\x4d\xfc\x3e\xa1\xd1\x98\
-\x85\xd6\x33\x94\xda\x29\x68\x0b\x47\xec\x8b\xdd\x48\xac\x01\xbe\
-\x44\xfa\x5b\x18\xcd\x6c\x60\x86\x02\x1f\x21\xce\x5a\xa6\x4e\xe0\
-\xcf\xc0\x19\xf8\x19\x54\xf7\xcf\x68\x27\x45\xec\xbe\xa1\x91\xd8\
-\x02\xbc\x36\xf4\x85\xd9\x9e\xbc\x33\xc8\x91\xc0\xe1\x68\xd8\x2c\
-\x65\xf3\xd1\xb1\x94\xdd\xb1\x1b\x62\x66\xb9\x1b\x01\x7c\x02\x0d\
-\xc7\xc7\xa8\x64\xda\x82\x4e\x91\xfb\x0c\x39\x77\x18\x05\xf6\x47\
-\x74\x50\x50\xca\x9a\x29\xc0\x11\xc1\x59\x9a\x0e\xfc\x94\xf0\x8b\
-\x64\xf2\x8e\xdf\x50\x8e\x03\x8c\xcc\xac\x7f\x46\x00\x9f\x45\xdb\
-\xb5\x62\x3f\x87\xba\x81\xbf\x01\xa7\x65\xfa\x2f\x4e\xc3\x70\xe0\
-\x07\xc4\xff\x79\x34\x1a\xbf\x05\x0e\x0e\x7c\x6d\x5e\x50\xde\x23\
-\x00\x13\xd0\x82\x99\x94\x87\xad\xd6\xa2\xed\x39\xab\x63\x37\xc4\
-\xcc\x72\xd5\x86\x86\xfd\xdf\x4b\xa4\xd2\xad\xdb\x70\x24\xf0\x21\
-\x60\xbf\xd8\x0d\x89\x6c\x3d\xda\x0e\x98\xfa\x73\xf9\x48\x72\x5c\
-\xe4\x99\x67\x02\xd0\x8c\x8a\x63\x4c\xcc\xf1\xef\xcc\xc2\x53\xc0\
-\xad\xb1\x1b\x61\x66\xb9\x6a\x47\x1d\xed\x05\x44\x3c\xbe\xf5\x05\
-\xbc\x04\x6d\x21\xab\xfa\xa8\xe4\x1d\xa8\x80\x52\xca\x46\xa3\x7e\
-\x32\x97\x22\x7d\x79\x26\x00\xe3\xd0\xfc\x7f\xea\x9e\x40\xc3\x6e\
-\x66\x56\x0d\xa3\x51\x07\x7b\x11\xc5\xeb\xfc\x41\x9d\xc5\x39\xc0\
-\x6b\xa8\xf6\xb6\xe4\xfb\x51\xe5\xc4\xd4\x1d\x48\x4e\x6b\x4b\xf2\
-\x4c\x00\x76\x43\x0b\x1c\x52\xb6\x09\x6d\x61\x5c\x12\xbb\x21\x66\
-\x96\x8b\x31\xe8\xad\xff\xc3\x14\xbb\x08\x4f\x3b\x9a\x9a\x98\x16\
-\xbb\x21\x11\xad\x40\x09\xc0\xfa\xd8\x0d\x69\xd0\x81\xe8\xa0\xbc\
-\xcc\xe5\x99\x00\x4c\x04\xf6\xcd\xf1\xef\xcb\xc2\x4c\xfc\xf6\x6f\
-\x56\x15\xa3\x80\xf3\x80\x8f\x92\x46\xc5\xcf\x43\x51\xd9\xe0\xd6\
-\xd8\x0d\x89\xe8\x5e\xe0\xe1\xd8\x8d\x68\xd0\x1e\xe4\x54\x10\x28\
-\xaf\x04\xa0\x89\x9e\x83\x30\x52\xf6\x10\x70\x77\xec\x46\x98\x59\
-\xe6\x46\x02\xe7\x93\x4e\xe7\x0f\x2a\xb3\xfe\x26\xaa\x3d\x0a\xf0\
-\x30\x70\x57\xec\x46\x34\x68\x0c\x4a\x00\x32\x5f\x2c\x9f\x57\x02\
-\xd0\x8e\x0e\x6d\x48\x59\xfd\xf8\xc9\x05\xb1\x1b\x62\x66\x99\x1a\
-\x81\xe6\xfb\x3f\x56\xfb\x3e\x25\x87\xd7\xa2\xaa\x55\x02\x97\xa0\
-\xb5\x00\x5d\xb1\x1b\xd2\xa0\x69\xe4\x50\x0f\x20\xaf\x9b\x64\x37\
-\x54\x02\x38\x65\xf5\x63\x3a\xcd\xac\xbc\xda\xd0\x6a\xff\x0f\x92\
-\xce\x9b\x7f\x6f\xcd\xc0\x49\xc0\x2e\xb1\x1b\x12\xd1\x6c\xd2\xdf\
-\x0d\x30\xbd\x16\x99\x72\x02\xd0\x77\x0f\xe3\x04\xc0\xac\xcc\x46\
-\xa0\xb7\xfe\x0f\x50\xec\x05\x7f\x3b\x72\x02\xd5\x3e\x30\x68\x0e\
-\x5a\x0b\x90\xb2\xa9\x94\x2c\x01\xc8\xfc\x1f\x93\xb1\x87\x49\x3f\
-\xab\x34\xb3\x6d\x1b\x8e\x8a\xfc\x9c\x47\x71\x8a\xfc\x0c\xd4\x34\
-\xaa\x9d\x00\x3c\x05\xdc\x13\xbb\x11\x0d\xda\x15\x2d\x06\xcc\x54\
-\x1e\x09\x40\x0b\x5a\xd0\x90\xf2\xca\xd4\x0d\xc0\xe3\xc0\xc6\xd8\
-\x0d\x31\xb3\xe0\x46\xa2\xba\xfe\xe7\x53\xcc\x7d\xfe\xfd\xd5\x82\
-\x3a\x8f\xe1\xb1\x1b\x12\xc9\x66\xf4\xbc\x5e\x13\xbb\x21\x0d\x18\
-\x0c\xec\x4e\xc6\xe7\xe6\xe4\x91\x00\x4c\x22\xfd\x55\xa9\x4f\x92\
-\xfe\x41\x13\x66\xf6\x7c\x23\xd1\x82\xbf\xf7\xa3\xd5\xd7\x65\x31\
-\x05\x18\x1b\xbb\x11\x11\x3d\x83\x16\x6d\xa7\x6c\x17\x34\x12\x90\
-\x99\x3c\x12\x80\x3d\xd0\x7c\x46\xca\xee\xc1\x09\x80\x59\xd9\xd4\
-\x2b\xfc\x95\xb1\x8c\xee\x44\xd2\x9f\xca\x68\xc4\x7c\x54\x1a\x38\
-\x65\xbb\x00\xfb\x64\xf9\x17\xe4\x91\x00\x4c\x23\xa7\xaa\x46\x19\
-\xba\x1f\x9d\xfb\x6d\x66\xe5\x50\x2f\xf2\xf3\x11\xca\xd7\xf9\x83\
-\x92\x9b\x14\x77\x31\x84\xb2\x9c\xf4\xeb\x01\xec\x0a\xec\x9d\xe5\
-\x5f\x90\x57\x02\x90\xf2\x01\x40\x6b\xd0\x7c\x52\x47\xec\x86\x98\
-\x59\x10\xa3\xd1\x7c\xff\xc5\x94\xb7\x93\x6c\x45\xf3\xc8\x55\xd5\
-\x89\x9e\xdb\x29\x97\x6d\x1f\x4b\xc6\x0b\x01\xb3\x4e\x00\x5a\x48\
-\x7f\x3f\xea\xbd\xf8\xed\xdf\xac\x2c\x46\x02\xef\x23\xcd\x22\x3f\
-\xfd\xd1\x42\xda\xc7\xae\x87\xb0\x94\x72\xec\x06\x18\x9a\xd5\x1f\
-\x9e\x75\x02\xb0\x2b\x69\xbf\xfd\x83\xca\xff\x2e\x8a\xdd\x08\x33\
-\x6b\x58\x1b\x2a\xf0\xf3\x61\xca\xfb\xe6\x5f\xb7\x11\x8f\x5a\xae\
-\x04\x1e\x40\xa3\x01\xa9\x1a\x43\x86\x6b\xe8\xb2\x4e\x00\x76\x07\
-\xc6\x67\xfc\x77\x64\xed\x11\x94\x49\x9a\x59\xba\xda\xd0\x7c\xff\
-\x87\x28\xf7\x9b\x7f\xdd\x3a\x74\x7a\x69\x95\xad\x42\xa7\x03\xa6\
-\x9e\x00\x64\xb6\x8b\x2e\xeb\x04\x60\x0a\x69\x27\x00\x9b\x51\xf5\
-\xbf\xaa\x67\xd2\x66\x29\x1b\x8e\x0e\xf5\xf9\x00\xd5\xe8\xfc\x41\
-\xa3\x96\xab\x62\x37\x22\xb2\x2d\x68\x04\x77\x43\xec\x86\x34\x60\
-\x2c\x09\x27\x00\xbb\x91\xf6\x09\x80\x73\xf0\xf0\xbf\x59\xca\x46\
-\x00\x1f\x07\x2e\xa0\x9c\xab\xfd\x5f\xc8\x7c\xb4\x12\xbe\xea\x96\
-\x92\xf6\x16\xee\xb1\x24\x3c\x05\xb0\x1b\xe9\xce\xb5\x75\xa1\xf9\
-\xa3\xaa\x67\xd1\x66\xa9\xaa\x0f\xfb\x97\xa5\xc2\x5f\x7f\xcc\x22\
-\xed\x4a\x78\xa1\x6c\x40\xcf\xf1\x54\x47\x71\x87\x92\xe8\x08\xc0\
-\x50\x54\x05\x30\xd5\x95\xa8\x9d\x68\xfe\xc8\x09\x80\x59\x7a\xda\
-\xd1\x7c\xff\x05\x54\xaf\x20\xce\x52\x60\x2e\xe9\x1f\x89\x1b\xc2\
-\x3a\x94\x00\xa4\x3c\x0d\x30\x89\x8c\x0e\xa7\xca\x32\x01\xd8\x95\
-\xb4\x4b\x51\x76\xa1\x04\x60\x5d\xec\x86\x98\x59\xbf\x8c\x42\xd5\
-\xfd\x2e\xa2\x7a\x6f\xfe\x00\x7f\x45\xa5\x70\x4d\xbb\x21\xee\x43\
-\xeb\xb9\x52\xd5\x4e\x46\xd3\x00\xb6\x73\x5e\x9e\x00\x00\x20\x00\
-\x49\x44\x41\x54\x59\x26\x00\xd3\x48\xbb\xb6\xf6\x2a\x60\x26\x5a\
-\x48\x62\x66\x69\x18\x83\xde\xfa\x2f\x22\xed\x23\x7d\x1b\xf1\x07\
-\xb4\x06\xc0\xa0\x1b\x3d\xc7\x53\x5e\x0f\x31\x12\x9d\xa6\x1b\x7c\
-\x34\x3d\xcb\x04\x60\x2a\xe9\x26\x00\xf5\x9b\x66\x65\xec\x86\x98\
-\x59\x9f\x8d\xa2\xa7\xc2\x5f\x55\x3b\xff\x05\x68\x04\xc0\x23\x97\
-\x3d\x56\xa3\xe7\x79\x77\xec\x86\x0c\xd0\x08\x94\x00\xb4\x84\xfe\
-\x83\xb3\x4c\x00\xa6\x93\x6e\x02\xd0\x09\x3c\x81\x8f\xff\x35\x4b\
-\xc5\x48\xd4\xf9\x7f\x84\x74\x17\x1e\x37\xaa\x1b\xf8\x11\x5a\x00\
-\x68\x3d\x3a\xd1\x89\xae\xa9\x3e\xcf\x47\xa2\xf3\x74\x82\xf7\xd7\
-\x59\x26\x00\x53\x48\x77\xcf\xed\x66\x94\x31\xa6\xbc\x70\xc4\xac\
-\x2a\x46\xa0\x21\xff\xb2\x97\xf7\xdd\x91\x67\x80\x1f\xe2\xc2\x65\
-\x5b\xeb\x44\x49\x51\xaa\xa3\x22\x43\xd1\x0b\x75\x32\x09\x40\x33\
-\x69\x97\x00\xde\x84\x12\x80\xaa\x57\xd2\x32\x2b\xba\x36\xb4\xda\
-\xff\x83\x54\xf7\xcd\x1f\x60\x3d\xf0\x5d\x54\xf8\xc6\x9e\xab\x03\
-\x3d\xcf\xd7\xc7\x6e\x48\x03\x26\x03\x83\x42\xff\xa1\x59\x25\x00\
-\xe3\x48\x3b\x13\xaf\x27\x00\x29\x97\x90\x34\x2b\xbb\x36\x34\xdf\
-\x7f\x21\xd5\x9d\xf3\xaf\xbb\x0b\xb8\x0a\x58\x1b\xbb\x21\x05\x54\
-\x5f\xd3\x95\xea\x08\x00\xe8\x5e\x1f\x17\xfa\x0f\xcd\x2a\x01\x98\
-\x0c\x0c\xcb\xe8\xcf\xce\xc3\x6a\xb4\x98\xc6\xcc\x8a\x69\x04\xea\
-\xfc\xcf\xa7\x5a\x15\xfe\xb6\x65\x0e\xf0\xf9\xda\x57\xdb\xb6\x05\
-\xa4\xbd\xa8\xbb\x15\xd8\x39\xf4\x1f\x9a\x45\x02\xd0\x84\x12\x80\
-\xe1\x19\xfc\xd9\x79\xe8\x46\x45\x34\x52\xce\x16\xcd\xca\x6c\x04\
-\xd5\xad\xf0\xb7\xb5\x67\x81\x2f\x01\xbf\x8d\xdd\x90\x82\xdb\x08\
-\x3c\x4d\xba\xc5\x91\x86\xa0\x7e\x35\x68\x9f\x9d\x65\x02\x90\xd9\
-\x19\xc6\x19\xab\x2f\x00\x4c\xf5\x46\x31\x2b\xb3\x51\xe8\x38\xdf\
-\x0b\x70\xe7\xbf\x04\xb8\x14\xf8\x1e\x7e\x5e\xf5\xc5\x6c\xd2\x5d\
-\xd8\x3d\x04\x8d\x00\x04\x5d\x07\x90\x45\x02\xd0\x8c\x4a\x17\xa6\
-\x3a\x05\xb0\x0e\xad\x18\x4d\xb5\x76\xb4\x59\x59\xb5\xa3\x13\xfd\
-\x2e\xc4\x9d\xff\x12\xe0\x4a\xe0\xeb\x78\xde\xbf\x2f\xba\x50\x02\
-\x90\x6a\x69\xf7\xfa\x08\x40\x32\x09\x40\xaa\x53\x00\xeb\xd0\x8d\
-\xe2\x05\x80\x66\xc5\x31\x1a\x57\xf8\xab\x5b\x8c\x3a\xff\x2b\x48\
-\xbb\xc2\x5d\x9e\xea\x53\xbb\xab\x23\xb7\x63\xa0\x5a\xc9\x20\x01\
-\x08\xbe\xad\x00\x4d\x01\x4c\x42\x0d\x4e\xd1\x46\xb4\x9f\xd6\x43\
-\x6a\x66\xc5\x30\x9a\x9e\x0a\x7f\x55\xde\xea\x07\xb0\x0c\xb8\x1c\
-\x77\xfe\x03\xf1\x0c\xe9\xae\xed\x1a\x4c\x42\x53\x00\xc1\x17\x2b\
-\xe4\x68\x13\x5a\x58\x63\x66\xf1\xd5\x2b\xfc\x7d\x14\x77\xfe\xab\
-\x80\xaf\xa2\xb7\x7f\x77\xfe\xfd\xb7\x10\xd7\x02\x78\x8e\x2c\x46\
-\x00\x86\x92\xc1\x7e\xc5\x1c\xad\x45\x59\xb6\x99\xc5\x35\x1c\xcd\
-\xf7\x7f\x98\xb4\xeb\x8a\x84\xb0\x16\xb8\x04\x75\xfe\x7e\x3e\x0d\
-\xcc\x0a\xd2\x9d\x02\x00\x18\x4f\xe0\xb5\x75\x59\xbc\xa5\xa7\xbc\
-\x00\x10\x60\x11\x9e\xff\x37\x8b\x6d\x38\xaa\xf0\xf7\x21\xdc\xf9\
-\xaf\x05\xbe\x88\x3b\xff\x10\x52\x2e\x93\x3c\x04\x98\x10\xf2\x0f\
-\xcc\x62\x04\x60\x22\x9a\xaf\x48\xd1\x66\x34\x4c\x64\xd9\x1a\x84\
-\x12\xc5\x49\x68\x65\x77\xfd\x94\xab\xf5\xe8\x01\xb7\x80\xb4\x33\
-\x75\x6b\x4c\xbd\xc8\xcf\x05\x78\xc1\xdf\x6a\xe0\x0b\xc0\x7f\xa3\
-\x37\x58\x6b\xcc\x42\xb4\x15\x30\xc5\x97\xd4\xfa\x73\xb3\x89\x40\
-\x27\x1b\x86\x4c\x00\x9a\x6a\x31\x26\xf0\x9f\x9b\xa7\x0d\xe8\x06\
-\x49\xf5\xd8\xc8\xa2\x1a\x04\x1c\x0a\x1c\x0d\x1c\x84\x8e\x8a\x6e\
-\x47\x1f\xc2\x21\xf4\x9c\x73\xdd\x89\x16\x61\xae\x47\x2b\x9d\x1f\
-\x03\xee\x06\x6e\xc7\xeb\x32\xaa\xc2\x15\xfe\x7a\xac\x04\xbe\x8c\
-\x3b\xff\x90\x16\xa3\x11\x95\x14\x13\x80\x66\x7a\xfa\xd7\x4e\x02\
-\xf4\x53\xa1\x13\x80\x66\xf4\xa1\x4d\x35\x01\x58\x8f\x13\x80\x90\
-\x76\x03\x4e\x07\x8e\x07\xf6\x00\x76\x47\x0b\x59\xfa\x6a\x2d\x5a\
-\xb9\x3b\x17\xb8\x17\x55\x3b\xbb\x25\x68\x0b\xad\x48\x46\xa0\xc5\
-\x7e\xe7\xa1\x82\x3f\x55\xb6\x0c\x15\xf9\xb9\x12\x77\xfe\x21\x2d\
-\x46\xa3\x2a\xe3\x63\x37\x64\x00\x9a\xe8\xe9\x5f\xb7\x50\xb0\x04\
-\xa0\x19\x0d\xe5\x8e\xa2\x67\x48\x37\x35\x4e\x00\xc2\x98\x0c\xbc\
-\x1a\x78\x19\x70\x2c\x03\xaf\x61\x3d\x02\xd8\xa7\x16\xa7\x00\x27\
-\x01\x7f\x02\x7e\x09\xfc\xb1\xf1\x66\x5a\x81\xb4\xa3\x3d\xfe\x17\
-\xe0\xce\x7f\x29\xda\xea\x77\x39\xee\xfc\x43\x5b\x04\xac\x89\xdd\
-\x88\x01\xaa\xf7\xaf\x83\x50\xa1\xba\x86\xb7\xaa\x67\x31\x02\x30\
-\x3a\xf0\x9f\x9b\xa7\x7a\x02\x60\x03\x33\x08\x38\x19\x78\x1d\x4a\
-\x00\x42\x56\x6b\x6b\x46\x53\x08\x47\x03\x2f\x06\xae\x07\x6e\xc0\
-\x07\xa0\x94\xc1\x68\xe0\xfd\xf8\x54\x3f\xd0\x1b\xea\x15\x78\x9f\
-\x7f\x56\x16\x91\xee\xfa\xa2\xde\xfd\x6b\xd3\x0e\x7e\x6f\x9f\x64\
-\x31\x02\x90\xf2\x14\xc0\x06\xd2\x5e\x25\x1a\xd3\x04\xe0\x1c\xe0\
-\x3d\xc0\xfe\x19\xff\x5d\xc7\x02\x87\x01\x07\x03\x97\xa1\xa3\x50\
-\x2d\x4d\x63\xd0\x5b\xff\x87\xf1\x3e\xff\x25\xf4\x74\xfe\x5e\xed\
-\x9f\x8d\x65\xa4\x5b\x0c\xa8\xf7\x14\x7b\x90\x1d\x7c\x59\x8c\x00\
-\xd4\x87\x28\x52\xb4\x99\x74\x6b\x45\xc7\xb4\x33\x7a\x7b\x7b\x0f\
-\xf9\x6d\xd9\x6a\x05\xde\x02\x4c\x03\x3e\x07\xdc\x84\xb7\x6f\xa6\
-\xa6\x5e\xe1\xef\x23\xb8\xf3\xaf\x57\xf8\xbb\x1c\xbf\xf9\x67\x69\
-\x35\x5a\x68\x9c\xa2\xde\x53\x00\x41\x46\x00\x42\xd6\x01\x68\x26\
-\xfd\x29\x80\x4d\x38\x01\xe8\xaf\xdd\x80\x4f\x03\x1f\x24\xce\x7e\
-\xed\xe3\xd1\x36\xa9\x57\xa3\x1d\x05\x96\x06\x57\xf8\xeb\xb1\x0a\
-\xf8\x2f\x3c\xec\x9f\x87\xb5\xa4\x9b\x00\x34\xd1\x93\x00\x04\xe9\
-\xbb\x43\x27\x00\x2d\x28\x01\x48\xb5\x0c\xf0\x06\x34\x0a\x60\x7d\
-\x33\x1e\xf8\x67\xe0\x6d\xc4\xfd\x99\x1f\x04\x7c\x1e\x38\x9b\x74\
-\x93\xcf\x2a\x69\x43\x23\x46\xee\xfc\xb5\x20\xed\xcb\xb8\xc8\x4f\
-\x5e\xba\x49\xf7\x48\xe0\x26\x7a\x5e\xb0\x0b\x37\x05\x50\x1f\x01\
-\x48\x79\xef\xae\x8f\xd5\xec\xbb\x61\xc0\xc7\x81\x73\x29\x46\xc2\
-\xb7\x07\xf0\x6f\x68\x75\xec\x8d\xf8\x38\xe7\xa2\x6a\x43\x1d\xff\
-\x85\xb8\xc2\xdf\x5a\xe0\x3f\xf0\x3e\xff\xbc\xa5\xba\x06\x00\x0a\
-\x3e\x02\x50\x9f\x02\x48\x55\xaa\xab\x43\x63\xf8\x47\xe0\x0d\x14\
-\x6b\xd8\x7d\x06\x5a\x0f\x70\x36\xe9\x56\xa3\x2c\xb3\xe1\xa8\xf3\
-\xff\x00\xee\xfc\xd7\xa0\xf2\xbe\xee\xfc\xf3\xb7\x96\x74\xb7\x7a\
-\xd7\xb7\xd9\x17\x6e\x0d\x40\x0b\x7a\xe8\xa6\xfa\xc1\xee\x20\xdd\
-\xfd\xa1\x79\x3b\x12\x78\x07\x2a\xfb\x5c\x34\xf5\x91\x80\x33\x71\
-\x12\x50\x24\x23\x80\x8f\xe1\xf2\xbe\xa0\x0a\x7f\x5f\x44\x73\xfe\
-\xee\xfc\xf3\xb7\x86\x74\xa7\x01\x46\xa2\x97\xae\x20\xb5\x76\x42\
-\x26\x00\xc3\x6b\x91\xea\x43\x77\x03\x4e\x00\xfa\x62\x04\x7a\x88\
-\x1f\x14\xbb\x21\xdb\x51\x4f\x02\xce\xc2\x6b\x02\x8a\x60\x24\x3d\
-\xe5\x7d\x53\x1e\x21\x0c\x61\x19\x3a\xd5\xcf\x0b\xfe\xe2\x59\x4b\
-\xba\xc7\x02\x0f\x46\xd3\xaf\x41\x4a\x19\x87\x7c\x38\x0e\xad\x45\
-\x90\xa1\x89\x08\x36\xe2\x29\x80\x1d\x19\x04\x9c\x00\x9c\x4a\xf1\
-\xab\x3d\xee\x85\x16\x28\x36\xa3\xa2\x41\x5e\xdc\x19\xc7\x48\x74\
-\xa2\xdf\xf9\xb8\xc2\xdf\x32\x54\xb7\xc2\xe5\x7d\xe3\x4a\x39\x01\
-\x00\x6d\x81\x6e\x0d\xf1\x07\x85\x4c\x00\x06\x11\x70\x7f\x62\x04\
-\x1b\xf1\x08\xc0\x8e\xb4\xa3\xb9\xff\x71\xb1\x1b\xd2\x47\xfb\xa1\
-\x85\x8a\x00\xd7\xe1\x85\x81\x79\x1b\x0d\xbc\x0f\xcd\xf9\xa7\xbc\
-\x38\x38\x84\xc5\x68\xbe\xdf\x6f\xfe\xf1\xad\x23\xdd\x29\x00\xd0\
-\x28\x40\x90\x91\xf6\x90\x09\x40\xb0\x46\x45\xd2\x89\xea\x00\xd8\
-\xb6\x35\x01\x7b\x03\x27\x52\xfc\xb7\xff\xde\xf6\x47\xc3\xcf\x00\
-\x3f\xc6\x3f\xe3\xbc\xb8\xc8\x4f\x8f\xa5\xa8\xf3\xbf\x14\x77\xfe\
-\x45\xb0\x91\x74\x47\x04\x9b\x08\xd8\xd7\x86\x5c\x03\x50\x1f\x01\
-\x48\xd5\x16\xfc\x86\xb8\x3d\x23\xd1\x81\x3c\x29\x0e\xe3\x1e\x08\
-\x7c\x12\xed\x0e\x28\xd2\xae\x85\xb2\x1a\x8d\x4e\xf4\x73\xe7\xff\
-\xdc\x83\x7d\xdc\xf9\x17\x43\x27\x7a\xde\xa7\x2a\x58\x5f\x9b\xc5\
-\x08\x40\xaa\x53\x00\x5d\xb8\x94\xec\xf6\x4c\x40\x07\xfd\xa4\x3a\
-\xca\xb3\x2f\x4a\x02\xb6\x00\x3f\x21\xdd\x37\x80\xa2\x1b\x89\x16\
-\x89\xba\xc8\x4f\x4f\x85\xbf\xff\xc6\x9d\x7f\x91\x6c\x21\xed\x04\
-\x60\x30\x81\x5e\x64\x42\x8e\x00\xa4\x9e\x00\x78\x04\x60\xfb\x26\
-\x50\xec\x95\xff\x7d\xb1\x0f\xde\x1d\x90\xa5\x7a\x85\x3f\xbf\xf9\
-\x6b\xa1\xd9\x25\xb8\xf3\x2f\xa2\x94\x47\x00\x9a\xd0\xb3\xab\x70\
-\x6b\x00\x86\x90\x7e\x02\xe0\x11\x80\x6d\x6b\x41\x9d\x67\x19\xf6\
-\x6f\xef\x89\x92\x80\x4e\x5c\x31\x30\xa4\x36\x74\xa2\xdf\x45\xa4\
-\x5b\x0b\x24\x94\xde\x15\xfe\xdc\xf9\x17\xcf\x66\xd2\x7e\xd6\x0f\
-\x21\xd0\x08\x80\xa7\x00\x7a\x78\x0a\xe0\x85\x8d\x42\x7b\xeb\x53\
-\xfd\xd9\x6e\x6d\x0f\x74\x76\xc0\x60\xbc\x45\x30\x84\x7a\x79\x5f\
-\x57\xf8\xd3\x56\xe2\x2f\xe1\xad\x7e\x45\x96\xf2\x08\x00\x14\x78\
-\x0d\x40\xca\x0b\xac\x9c\x00\xbc\xb0\x76\x74\xea\x5f\x99\xcc\x40\
-\x23\x01\x5b\xd0\xee\x00\xff\xec\x07\x66\x24\xea\xfc\xcf\xa3\x1c\
-\x23\x44\x8d\x58\x89\x0e\xf6\x71\x79\xdf\x62\x4b\x39\x01\x68\xc2\
-\x23\x00\x99\xf0\x1a\x80\x17\x36\x9c\x74\xf6\xfe\xf7\xc7\x0c\x74\
-\x94\x71\xbd\x58\x90\x7f\xfe\xfd\xd3\x86\xe6\xfb\xcf\xc3\x15\xfe\
-\x96\xe3\x22\x3f\xa9\xe8\x24\xed\x84\xbf\xb0\x23\x00\x4e\x00\xca\
-\x69\x30\xe5\x5d\xd4\xb5\x37\x3d\x15\x03\xaf\xc3\xd3\x01\x7d\x35\
-\x02\xf8\x20\x2e\xef\x0b\xaa\xf0\x77\x05\xda\xea\xe7\xce\xbf\xf8\
-\x52\x1e\x01\x80\x82\x8e\x00\xb4\x90\x56\x81\x98\xad\x75\xa3\x69\
-\x00\x7b\xbe\xfa\xca\xd3\xb2\xda\x17\x55\x0c\x6c\x02\x7e\x84\x93\
-\x80\x1d\x19\x85\x2a\xfc\x5d\x84\x2b\xfc\x2d\x41\x6f\xfd\x97\xa3\
-\x3d\xff\x56\x7c\x5b\x48\xf7\x34\x40\x08\xd8\xd7\x86\x7c\xa8\x77\
-\x91\x76\x07\xda\x44\x31\xce\xb5\x2f\xa2\x2a\xac\x8f\xd8\x0f\x9d\
-\x56\xd7\x8d\xa6\x03\x5c\x31\x70\xdb\xea\x15\xfe\x3e\x8c\xe7\xfc\
-\xdd\xf9\xa7\xa9\x99\x74\x47\xaa\x21\x60\x1d\x83\x90\x1d\x5e\x47\
-\x2d\x52\xcd\xac\x5a\x28\xf7\x5b\x6e\x23\x3a\x48\xfb\xf0\x8c\xbe\
-\xaa\x9f\x1d\x70\x16\x69\x2f\x68\xcd\x4a\xef\x0a\x7f\x55\xef\xfc\
-\x7b\x0f\xfb\xbb\xf3\x4f\xcb\x60\xd2\x1e\xad\xae\xf7\xb5\x0d\x0b\
-\xd9\xe1\x6d\x46\x17\x35\xd5\x04\xa0\x19\x3f\xf4\x5f\xc8\x06\xaa\
-\xf3\x90\xdb\x0f\x55\x0c\xec\xc2\x15\x03\x7b\x1b\x89\xde\xfc\x2f\
-\xa6\xbc\xeb\x41\xfa\x6a\x15\xf0\x55\x7c\xb0\x4f\xaa\x52\x2f\x5b\
-\x1f\x2c\x01\x08\x39\x02\xd0\x49\xda\x8b\xe8\x52\x5f\xc3\x90\xa5\
-\x35\xc0\xd3\xa4\x9b\xdc\xf5\xd7\xbe\xc0\x67\xd0\xd9\x01\x29\x3f\
-\x28\x42\x19\x81\x2a\xfc\xb9\xbc\xaf\x3e\x0b\x5f\x46\x43\xff\xee\
-\xfc\xd3\x34\x88\x74\x9f\xf5\xdd\x14\x78\x04\xa0\x99\x74\x3b\x89\
-\x66\xd2\xad\x73\x9f\xb5\x95\xc0\xcc\xd8\x8d\xc8\xd9\x1e\xa8\x4e\
-\x40\x07\xd5\xae\x18\x38\x02\x0d\xf9\x5f\x88\x8b\xfc\xd4\x2b\xfc\
-\x7d\x0d\x77\xfe\x29\x4b\x39\x01\x80\x82\x8e\x00\x74\xa0\x51\x80\
-\x54\x13\x00\x8f\x00\xbc\xb0\x2d\xc0\xe3\xe8\x01\x58\x25\x33\x80\
-\xcf\x51\xdd\x35\x01\xf5\x7d\xfe\xae\xf0\xa7\x37\xff\x2f\xe2\xf2\
-\xbe\x65\xe0\x35\x00\x35\x21\x13\x80\xcd\xb5\x48\x35\x01\xf0\x1a\
-\x80\xed\x5b\x04\x3c\x10\xbb\x11\x11\xec\x81\xa6\x03\x5e\x43\xb5\
-\x46\x88\x46\xa0\x5d\x11\x17\xe0\x05\x7f\x2b\x51\xe7\x7f\x05\xde\
-\xe7\x5f\x06\x29\xaf\x01\xa8\x4f\x01\x04\x59\x9b\x14\x7a\x0d\x40\
-\xea\x23\x00\xa9\xde\x14\x79\x58\x0c\xdc\x44\xf9\xb7\x03\x6e\x4b\
-\x7d\x3a\xe0\x1c\xaa\x91\x24\xba\xc2\x5f\x8f\xe5\xc0\x7f\xe2\x05\
-\x7f\x65\x92\xfa\x14\x40\xb0\xf5\x76\x59\x6c\x03\x4c\x55\x33\x4e\
-\x00\xb6\x67\x0d\xf0\x3b\xf4\x36\x54\x45\x7b\xa1\xdd\x01\x67\x53\
-\xee\x91\x80\x76\xd4\xf9\x5f\x80\x3b\xff\xa5\xf4\xac\xf6\xf7\x9b\
-\x7f\x79\xa4\x3e\xdd\x5b\xc8\x29\x80\xd4\xeb\x2b\x0f\x06\x86\xc6\
-\x6e\x44\x81\x75\x03\x8f\x02\xb7\x92\x76\xc1\xa7\x46\xec\x83\x86\
-\xc5\x5f\x4b\x39\x47\x02\xda\xd1\x7c\xff\x85\xb8\xf3\x5f\x42\xcf\
-\x3e\xff\x65\x91\xdb\x62\x61\x0d\x25\xed\xcf\x6f\x21\x13\x80\xd4\
-\x0b\x01\xb5\xe2\x85\x4e\x3b\xb2\x1a\xb8\x9a\xea\xd4\x04\xd8\x96\
-\x03\x50\xb1\xa0\xb3\x49\xfb\x21\xb2\xb5\xd1\xe8\xad\xff\x43\x78\
-\xce\xbf\x77\x85\x3f\x0f\xfb\x97\x4f\x1b\x30\x2c\x76\x23\x06\xa8\
-\x9b\x80\x2f\xdb\x21\x13\x80\x4d\xb5\x48\x35\x01\x18\x8a\xeb\x9a\
-\xef\x48\x27\x70\x33\xf0\x1b\xaa\x3b\x0a\x00\xb0\x3f\xf0\x09\xca\
-\x93\x04\x8c\x41\x45\x7e\x3e\x86\x3b\xff\xa5\xe8\x54\xbf\xcb\xa8\
-\x76\xa2\x5b\x66\x6d\xe8\x84\xd3\x54\xd5\xfb\xda\x86\x85\x4c\x00\
-\xd6\xd7\x22\xd5\x69\x80\x61\xf8\xe1\xd7\x17\x6b\xd1\x9b\xd1\x83\
-\xb1\x1b\x12\xd9\x7e\xc0\xa7\x80\x33\x49\x3b\x09\x68\xc7\x15\xfe\
-\xea\x7a\x57\xf8\xf3\xb0\x7f\x79\x8d\x24\xdd\x04\xa0\x13\x55\x66\
-\xdd\x10\xe2\x0f\xcb\xa2\x12\x60\xaa\x7b\xc5\x87\xe0\x11\x80\xbe\
-\xba\x13\xb8\x0a\x58\x18\xbb\x21\x91\xed\x8d\x76\x07\x9c\x45\x9a\
-\x0b\x03\x47\xa0\x39\xff\x8f\xe0\xce\x7f\x2d\x70\x09\xde\xe7\x5f\
-\x05\x23\x49\x77\x0a\x60\x0d\xda\x02\x58\xb8\x29\x80\x2e\x54\x30\
-\x66\x55\xc0\x3f\x33\x6f\x1e\x01\xe8\x9b\x6e\x94\x00\x5c\x87\x6b\
-\xe5\xef\x89\x92\x80\xd4\xea\x04\xb4\xa1\x13\xfd\x3e\x8c\xd7\xbe\
-\xd4\x2b\xfc\xf9\xcd\xbf\x1a\x46\x90\xee\x69\x80\xab\x09\xb8\xdd\
-\x3e\x74\x02\xd0\x45\xda\xdb\xc4\x9c\x00\xf4\xdd\x7a\xe0\xb3\xc0\
-\x35\xa4\xbb\xee\x23\x94\x3d\x50\xc5\xc0\x54\xd6\x04\xb4\xa1\xba\
-\xfe\x2e\xef\xab\x07\xea\x17\xf0\x9b\x7f\x95\xa4\x3c\xda\xb5\x02\
-\x25\x00\x41\xd6\x60\x65\x91\x00\xac\x26\xdd\x05\x62\xc3\x48\xeb\
-\x2d\x2e\xb6\x45\xe8\xed\xf7\xda\xd8\x0d\x29\x80\x19\xa8\x62\xe0\
-\x99\x14\xfb\x1e\x1a\x81\x76\x31\xb8\xc2\xdf\x73\x2b\xfc\xb9\xf3\
-\xaf\x86\x26\xd2\x1d\xfe\xef\xa6\x67\x04\xa0\x70\x09\x40\x37\x9a\
-\x02\x58\x49\xba\x0b\x01\xbd\x0e\xa0\xff\xe6\xa2\xc5\x70\xdf\x8f\
-\xdc\x8e\x22\x98\x01\x7c\x9a\xe2\x8e\x04\xd4\x2b\xfc\xbd\x17\xef\
-\xf3\x5f\x8e\x16\xfc\x5d\x89\x8b\xfc\x54\x49\xca\x5b\x00\xeb\x23\
-\xec\x85\x9e\x02\x58\x45\xda\x09\xc0\xa8\xd8\x8d\x48\xd0\x2c\xd4\
-\xf1\x5d\x13\xbb\x21\x05\xb0\x17\xf0\xcf\x14\xaf\x62\x60\x3b\x9a\
-\xef\x77\x85\x3f\x6d\xef\xbb\x14\xed\x66\x71\xe7\x5f\x2d\xed\xa4\
-\x5b\xf0\xad\x3e\xc2\x5e\xd8\x11\x80\xd4\x13\x80\xa1\xc0\x4e\xb1\
-\x1b\x91\xa8\x99\x38\x09\xa8\xdb\x17\x0d\xb3\xbf\x8e\x62\x8c\x04\
-\x8c\x42\xf3\xfd\x1f\xc4\x9d\xff\x12\xd4\xf1\x7b\x9f\x7f\x35\x8d\
-\x23\xdd\x2d\x80\xbd\xfb\xd7\x20\x09\x40\xc8\xda\xf7\xbd\x77\x01\
-\x6c\x09\xf8\xe7\xe6\x69\x38\x30\x31\x76\x23\x12\xf6\x24\x9a\x0e\
-\x68\x46\x9d\x5f\xc8\x04\x33\x35\xfb\xa3\xc2\x3a\xdd\xc0\xf5\x04\
-\x2a\xdc\x31\x00\xa3\xd1\xa1\x3e\x17\xe1\x39\x7f\x57\xf8\xb3\x09\
-\xa4\x3b\xcd\xeb\x29\x80\x8c\xb5\x01\x93\x48\x77\x8b\x48\x11\xcc\
-\x46\x55\xf2\xae\x23\xdd\xfb\x20\x94\xfd\xe8\x29\x1b\xdc\x1a\xe1\
-\xef\x1f\x85\xe6\xfb\x3f\x8a\x3b\xff\x65\xa8\xf3\xbf\x0c\x6f\xf5\
-\xab\xb2\x09\xa4\xfb\x59\xa8\xbf\x60\x17\x76\x0a\x60\x0b\x9a\xa3\
-\x48\x79\x04\xc0\x09\x40\xe3\xe6\xa0\xca\x72\x3f\xc1\x49\xc0\x7e\
-\x68\x4d\x40\xde\xc5\x82\xda\xd1\x9b\xff\xc5\xa4\xfb\xc0\x0b\x65\
-\x25\x3d\x73\xfe\xee\xfc\xab\x6d\x22\xe9\x7e\x1e\x7a\xef\x02\x08\
-\x32\x02\x10\x72\x0a\xa0\xbb\x16\xf5\x7d\x8a\x29\x72\x02\x10\xce\
-\x5c\xb4\xe2\xbc\x09\x15\xc9\xa9\xf2\x51\xcb\x7b\x03\xff\x8a\x3e\
-\x1f\x79\x8c\x8c\x8c\x44\xf3\xfd\x1f\x22\xed\x3d\xcf\x21\xac\x01\
-\xbe\x84\xf6\xf9\x7b\xc1\x9f\x4d\x24\xed\x29\x80\x7a\xff\x5a\xb8\
-\x29\x80\xba\xc5\x04\x3a\xaa\x30\x82\x21\x38\x01\x08\x69\x1e\x4a\
-\x02\xae\x27\xdd\xda\x10\xa1\xec\x89\xea\x04\xbc\x96\x6c\x47\x02\
-\xda\x50\xe7\x7f\x11\xee\xfc\xd7\xa2\x7d\xfe\x5f\xc3\x9d\xbf\xc9\
-\x44\xd2\xdd\x06\xb8\x05\xf5\xaf\x85\x2e\xbc\x36\x0e\x78\x84\x9e\
-\x11\x81\xd4\xe2\xcf\x14\x63\xe5\x76\x99\x4c\xa3\xa7\x62\x60\xd5\
-\x63\x16\xf0\x06\xb2\xb9\xc7\x86\xa3\xc2\x4c\xab\x0a\xf0\xef\x8c\
-\x1d\xab\xd0\xd4\xcb\xd8\x86\xae\xa8\x95\xcd\xcf\x88\x7f\x6f\x0e\
-\x34\x9e\x45\xcf\xd2\x42\x1b\x06\xdc\x4a\xfc\x8b\x35\xd0\x78\x00\
-\xef\x04\xc8\xc2\x74\x54\x2c\x28\xf6\xcf\xb7\x08\xf1\x24\xf0\x46\
-\xc2\x26\x01\xc3\xd1\x36\xcc\x15\x05\xf8\xf7\xc5\x8e\x15\x68\x37\
-\x8a\x3b\x7f\xeb\x6d\x14\x70\x0b\xf1\xef\xcf\x81\xc6\x43\x04\xee\
-\x9b\xb2\x98\x02\xe8\x42\xa7\xc4\x75\x67\xf0\x67\xe7\x61\x28\x30\
-\x39\x76\x23\x4a\x68\x36\x7a\x28\xbb\x4e\x80\xce\x0e\xf8\x34\xe1\
-\x16\x06\x8e\x44\x5b\x0e\x5d\xe4\x47\x8b\xfc\x2e\xc1\x5b\xfd\xec\
-\xf9\x26\x91\x6e\x0d\x00\x80\x05\x04\x9e\x5e\xcf\x22\x01\xe8\x46\
-\x09\x40\xac\x7d\xcf\x8d\x6a\x05\x76\xc3\xeb\x00\xb2\x30\x1b\x75\
-\x7c\x2e\x1b\xac\x24\xe0\x93\x34\xbe\x26\x60\x24\x5a\xec\x77\x01\
-\x30\x26\x40\xbb\x52\xb6\x0c\x6d\xf3\xbb\x12\x77\xfe\xf6\x7c\xbb\
-\x90\xee\xe1\x57\x9d\x28\x01\x08\xba\xc3\x2e\xab\x11\x80\x67\xd1\
-\x69\x71\x29\x1a\x8e\xe6\x59\x8a\x54\xc6\xb5\x4c\x9e\xc4\x49\x40\
-\x5d\xbd\x4e\xc0\x39\x0c\x6c\x3a\xa0\x1d\xf8\x40\x2d\xaa\x5e\xc2\
-\x7a\x09\x3a\xd4\xc7\x07\xfb\xd8\xb6\x34\x01\x53\x49\x77\x0b\xe0\
-\x26\xd4\xaf\x06\xdd\x41\x94\x65\x02\xb0\x21\x83\x3f\x3b\x0f\x23\
-\xd0\xa1\x2e\x4e\x00\xb2\x33\x13\x6d\x8b\xbb\x16\xef\x0e\xa8\x57\
-\x0c\x7c\x2d\xfd\x2b\x16\x34\x1a\x38\x1f\xd5\xf7\x4f\x75\x5b\x53\
-\x28\x4b\xd0\x36\x3f\x97\xf7\xb5\x17\xd2\x8c\x5e\xec\x52\x9d\x22\
-\xdb\x4c\x06\x09\x40\x16\x7b\xb3\xeb\x53\x00\x1b\x33\xf8\xb3\xf3\
-\xd0\x8a\xb6\x6c\xb5\xc4\x6e\x48\xc9\xcd\x42\x6f\xbf\x4d\xa8\x52\
-\x5e\x95\xeb\x04\xec\x8f\xaa\x27\x36\xa1\x3a\x01\x3b\x9a\x3e\xab\
-\x97\xf7\xbd\x98\x74\x87\x34\x43\x59\x4a\xcf\x9b\xbf\x3b\x7f\xdb\
-\x9e\x19\xa4\xbb\x35\x36\x93\x11\x80\xac\x1c\x8a\x56\xd3\xc7\x5e\
-\x35\x39\xd0\x78\x14\xef\x04\xc8\xcb\x54\xe0\x7f\x51\x86\x1b\xfb\
-\xe7\x1e\x3b\x1e\x67\xc7\xbb\x03\xda\x51\xb2\xb0\xa6\x00\xed\x8d\
-\x1d\x2b\xd0\x56\x3f\x1f\xe0\x65\x3b\x32\x0c\xb8\x8d\xf8\xf7\xec\
-\x40\x63\x1e\x70\x5c\xf0\xab\x92\x91\x49\xc0\x1d\xc4\xbf\x68\x03\
-\x8d\x05\xc0\x21\xc1\xaf\x8a\xbd\x90\x29\x28\x09\xe8\x20\xfe\xcf\
-\x3e\x76\x3c\x81\xea\x04\x6c\x6b\x0a\xaa\x0d\xed\xa4\x70\xe7\xaf\
-\x22\x3f\xff\x8c\xea\x8e\x98\xed\xc8\x0c\xd2\xae\x4f\xf3\x24\x09\
-\xd4\x00\xa8\x6b\x01\x7e\x4f\xfc\x8b\x36\xd0\x58\x8a\xb6\x68\x79\
-\x1a\x20\x3f\x53\xe9\x59\x13\x10\xfb\xe7\x1f\x3b\x66\xf2\xfc\x24\
-\xc0\x9d\x7f\x4f\xac\xa9\x5d\x0b\x77\xfe\xd6\x17\x4d\xc0\xa9\xa8\
-\x3c\x79\xec\x7b\x77\xa0\x71\x1f\x19\x2c\x60\xcc\x6a\xde\x75\x0b\
-\x5a\x98\x93\xaa\xfa\x3a\x80\xa1\xc0\xba\xc8\x6d\xa9\x8a\xb9\x68\
-\x4d\x00\xc0\xeb\x23\xb6\xa3\x08\x66\x00\xff\x8e\x92\xa1\x1f\xa3\
-\x44\xf4\x63\xc0\xfb\xf0\x9c\xff\x6a\xe0\x0b\xb8\xb6\xbf\xf5\xdd\
-\x20\xf4\x99\x4a\xb9\x06\xc0\x42\x32\x28\xb1\x9f\xe5\xc2\xab\x79\
-\x68\x2b\x60\x8a\x17\xbd\x15\xdd\x30\x4e\x00\xf2\x35\x07\xed\x8d\
-\xef\x46\x6f\xc0\x55\x36\x1d\x95\xf5\x6d\x47\x87\x09\xbd\x8d\x74\
-\xb7\x30\x85\xb2\x12\x1d\xec\x73\x65\xed\x7b\xb3\xbe\x18\x4c\xda\
-\x09\xc0\x26\x7a\x46\x2f\x82\xca\x32\x01\x98\x8b\x3e\xa4\x29\x5e\
-\xf4\x41\xc0\x5e\x28\x01\xb0\x7c\xcd\x42\xc3\xbb\x5d\xc0\x9b\x22\
-\xb7\x25\xb6\xbd\x50\x42\x34\x8e\x74\x57\x2f\x87\xb2\x1c\xf8\x2f\
-\xdc\xf9\x5b\xff\xb5\xa0\xc2\x5b\xa9\x1e\x02\xb4\x16\x3d\x17\x83\
-\x16\x01\x82\x6c\xea\x00\xd4\xcd\x21\xdd\x82\x1c\x4d\xe8\x86\xa9\
-\x7a\x71\x95\x58\x66\xe2\x62\x41\x75\x53\x70\xe7\x5f\xaf\xf0\x77\
-\x05\xee\xfc\xad\xff\x46\xa0\x29\xdd\x2c\xfb\xbb\x2c\xad\x41\x55\
-\x54\x93\x4a\x00\x66\x93\x6e\x02\x00\x3a\x48\x64\x1a\xe9\xde\x34\
-\xa9\x7b\x12\x15\x0b\x72\x12\x50\x6d\x4b\x50\x5d\x7f\xd7\xf6\xb7\
-\x81\x68\x42\xc3\xff\x29\x6f\x15\x5d\x83\x5e\x8a\x82\x4f\x01\x64\
-\xd9\xb9\x3d\x43\xda\x8b\x74\x9a\x81\x83\x48\x73\x0a\xa3\x2c\x66\
-\xa1\x24\xe0\x07\xb8\x62\x60\x15\x2d\x41\x43\xfe\xae\xf0\x67\x03\
-\xd5\x8a\xb6\x74\xf7\xa7\xca\x66\xd1\xac\x46\x23\xea\xc1\x65\x99\
-\x00\xac\x07\x16\x65\xf8\xe7\x67\x6d\x10\x70\x20\xe9\x96\x8e\x2c\
-\x8b\x59\x68\x1e\xfc\x47\x24\x52\x05\xcb\x82\x58\x86\x3a\xff\xcb\
-\x6b\xdf\x9b\x0d\x44\x1b\x7a\x91\x4b\x75\xfe\x1f\x60\x31\x4a\x02\
-\x82\xcb\x7a\x78\xfb\x69\xd2\x3d\x14\xa8\x3e\x02\xe0\x75\x00\xf1\
-\xcd\x41\xdb\xe0\x7e\x8c\x93\x80\x2a\x58\x09\x5c\x8a\x3a\x7f\xbf\
-\xf9\x5b\x23\x86\x03\x07\x93\xee\xd9\x2e\x1b\xc9\xe8\xed\x1f\xb2\
-\x4f\x00\x9e\x42\xd9\x4b\xaa\xf6\x04\x26\xc4\x6e\x84\x01\xda\x55\
-\xf2\x61\x9c\x04\x94\xdd\x5a\xe0\x12\x5c\xdb\xdf\xc2\x18\x8b\x16\
-\x74\xa7\x6a\x05\x09\x27\x00\x4f\x93\x76\x41\xa0\x21\x28\x09\xa8\
-\xf2\x41\x35\x45\xf2\x34\xf0\x51\xe0\x7a\xbc\x26\xa0\x8c\xd6\x02\
-\x5f\x44\x43\xff\x1e\xf6\xb7\x46\x35\xa3\x23\xb7\x53\x5e\xc7\xb5\
-\x02\xbd\xfc\x64\xc2\x23\x00\x3b\x76\x00\x2e\x39\x5a\x24\xf3\x50\
-\xc5\xc0\xff\x8d\xdd\x10\x0b\x6a\x0d\x2a\xf2\x73\x05\x5e\xed\x6f\
-\x61\x8c\x42\xd3\xb8\x29\xbf\xc0\x2d\x47\x3b\xea\x32\x91\x47\x02\
-\x90\xf2\x08\x00\xe8\xa8\x56\x4f\x03\x14\xcb\x1c\x74\x10\xcc\xb5\
-\xb1\x1b\x62\x41\xac\x44\xe5\x7d\xbd\xd5\xcf\x42\x1a\x8d\x16\x72\
-\xa7\x7c\xa6\xcb\x4a\x12\x1e\x01\xe8\x40\x27\xeb\xa5\xec\x50\x74\
-\xba\xa1\x15\xcb\x6c\xb4\x3b\xc0\x75\x02\xd2\xb6\x02\xf8\x4f\xfc\
-\xe6\x6f\xe1\x8d\x01\x0e\x43\xb5\x00\x52\x35\x9f\x0c\x17\xd2\xe7\
-\x51\xe4\x66\x2e\x69\xcf\xe7\x8d\x41\xeb\x00\x52\xce\x22\xcb\x6a\
-\x36\xaa\x18\xf8\xbd\xd8\x0d\xb1\x01\x59\x86\x56\xfb\xbb\xc2\x9f\
-\x85\xd6\x8c\x4a\x69\x4f\x8e\xdd\x90\x06\xac\x42\x05\x80\x32\x93\
-\x47\x02\x30\xab\x16\x29\x3b\x18\x98\x18\xbb\x11\xb6\x4d\x33\xd1\
-\xa1\x39\x1e\x09\x48\xcb\x12\xd4\xf1\x7b\x9f\xbf\x65\x61\x2c\x70\
-\x44\xec\x46\x34\xe8\x69\xe0\xf1\x2c\xff\x82\xbc\x12\x80\xcc\xb6\
-\x31\xe4\xe4\x70\x54\x4e\xd2\x8a\x69\x26\xae\x18\x98\x92\x25\xe8\
-\x38\x5f\x57\xf8\xb3\xac\xec\x02\x1c\x15\xbb\x11\x0d\x9a\x4f\x09\
-\x12\x80\x05\xa4\x9f\x00\xec\x83\xce\x05\xb0\xe2\x72\xc5\xc0\x34\
-\x2c\x45\x6f\xfe\xee\xfc\x2d\x4b\xbb\xa0\x05\x80\x29\x7b\x06\xed\
-\x7a\xca\x4c\x1e\x09\x40\x07\x5a\x07\x90\xf2\x43\xb9\x0d\xcd\x27\
-\xa5\x5a\x4d\xaa\x2a\x7a\x57\x0c\xec\x88\xdc\x16\x7b\x3e\x57\xf8\
-\xb3\x3c\xd4\x8f\x73\x4f\xb9\x8c\xfb\x16\xd4\xf9\x6f\xca\xf2\x2f\
-\xc9\xeb\xa4\xbb\x67\x48\x7f\x14\x60\x7f\xd2\xae\x28\x55\x15\x73\
-\x81\x8f\x00\x3f\x21\xed\xa4\xb3\x6c\xd6\x02\x5f\xc1\x45\x7e\x2c\
-\x7b\xbb\xa1\xd5\xff\x29\x9b\x4f\x0e\x7d\x66\x5e\x09\x40\xe6\x8b\
-\x19\x72\xb0\x3f\x9a\x0a\xb0\xe2\x7b\x0a\x55\x0c\xfc\x31\x5e\x13\
-\x50\x04\xae\xf0\x67\x79\x9a\x86\x4e\x00\x4c\xd9\x6c\x72\x58\x3c\
-\x9f\x67\x02\xf0\x44\x4e\x7f\x57\x56\xa6\x03\xfb\xc6\x6e\x84\xf5\
-\xd9\x3c\x34\x1d\x70\x5d\xec\x86\x54\xdc\x6a\xe0\x73\x68\xde\xdf\
-\x9d\xbf\xe5\xa1\x0c\xcf\xea\xb9\x64\x58\x01\xb0\x2e\xaf\x04\x60\
-\x25\xf0\x64\x4e\x7f\x57\x56\x5a\x50\x5d\x69\x57\x05\x4c\xc7\x1c\
-\x54\x36\xf8\x9a\xd8\x0d\xa9\xa8\x55\xc0\x97\x81\xaf\xe1\x22\x3f\
-\x96\x8f\xb1\xa4\x5f\xfe\x17\x94\x00\x64\x5e\x45\x37\xaf\x04\xa0\
-\x1b\xad\x03\x48\xfd\x21\x70\x00\xaa\x0c\x68\xe9\x98\x0d\x7c\x0a\
-\x17\x0b\xca\x5b\xef\x0a\x7f\x2b\x22\xb7\xc5\xaa\x63\x3f\xd2\xdf\
-\xff\xbf\x1a\x8d\x60\x66\x3e\x7d\x99\x57\x02\x00\xb0\x10\x78\x2c\
-\xc7\xbf\x2f\x0b\x7b\x02\xc7\xc4\x6e\x84\xf5\xdb\x6c\x54\x2c\xc8\
-\x23\x01\xf9\x58\x0a\x7c\x15\xd7\xf6\xb7\xfc\x1d\x8a\x5e\xd4\x52\
-\x36\x1b\xad\x63\xca\x5c\x9e\x09\xc0\x33\xc0\xbd\x39\xfe\x7d\x59\
-\x18\x8e\xf6\x96\xa6\xbc\xbd\xa4\xaa\x66\xa2\xb2\xc1\x4e\x02\xb2\
-\xb5\x04\xed\xf1\xbf\x0c\xcf\xf9\x5b\xbe\x46\xa2\xce\x7f\x64\xec\
-\x86\x34\xe8\x01\x72\xaa\x9e\x9b\x67\x02\xb0\x04\xb8\x3b\xc7\xbf\
-\x2f\x2b\x7b\x92\x7e\x85\xa9\xaa\x7a\x12\xf8\x17\x5c\x31\x30\x2b\
-\xf5\xf2\xbe\x57\xe2\x37\x7f\xcb\xdf\x41\xb5\x48\xdd\x83\xe4\x74\
-\x88\x5e\x9e\x09\xc0\x16\xb4\x15\x30\xf5\x02\x20\x53\x81\xe3\x63\
-\x37\xc2\x06\x6c\x16\x3a\x4a\xd8\x15\x03\xc3\x5a\x86\x3a\xfe\x2b\
-\x48\xff\x33\x6e\x69\x3a\x1a\xd8\x3b\x76\x23\x1a\xb4\x16\x8d\x56\
-\xe6\x52\xc8\x2c\xcf\x04\x00\xf4\x86\x70\x57\xce\x7f\x67\x68\xed\
-\xe8\x6c\x80\xe1\xb1\x1b\x62\x03\x36\x9b\x9e\x8a\x81\x4e\x02\x1a\
-\xb7\x12\x0d\xf9\xbb\xc2\x9f\xc5\xd2\x8a\x0e\x6d\x1b\x13\xbb\x21\
-\x0d\xba\x8b\x8c\xcb\xff\xf6\x96\x77\x02\xb0\x18\xb8\x9d\xf4\x87\
-\x5f\xa7\xe2\xc5\x80\xa9\x9b\x8b\x2b\x06\x86\xb0\x06\xb8\x04\x77\
-\xfe\x16\xd7\xe1\x94\xa3\x50\xdb\x5d\xa8\x6e\x4e\x2e\xf2\x4e\x00\
-\x56\x03\x77\x92\xfe\x03\x77\x17\xe0\x65\xe4\x7f\xfd\x2c\xac\xa7\
-\x80\x8b\x51\x12\x90\x7a\x52\x1a\xc3\x5a\xe0\xf3\xb8\xc2\x9f\xc5\
-\x77\x3c\xe5\x28\xd5\x7e\x2f\x25\xff\x2c\xed\x83\xb6\x03\x76\x27\
-\x1c\x5d\xc0\x9f\x81\x9d\x02\x5f\x1b\x8b\x63\x1a\xda\x1d\x10\xfb\
-\xbe\x4a\x29\x56\xa3\xfa\x0a\xa9\x0f\xb9\x5a\xfa\xda\x80\x9f\xa3\
-\xe7\x72\xec\xcf\x45\x23\x31\x0f\xad\x63\xc8\x4d\x8c\x37\xd8\xe5\
-\xc0\xdf\x48\x7b\x14\xa0\x09\x75\x1a\x2f\x41\x15\x02\x2d\x6d\x73\
-\xd0\xc2\x40\x6f\x11\xec\x9b\x7a\x85\xbf\xcb\x71\x91\x1f\x8b\xab\
-\x09\xbd\xfd\xef\x5d\xfb\x3e\x55\xdd\x68\xf8\x7f\x51\x9e\x7f\x69\
-\x8c\x04\x60\x15\xf0\x17\x32\x3e\xe6\x30\x07\x3b\x01\x67\x01\x43\
-\x62\x37\xc4\x82\xa8\x57\x0c\xfc\x7e\xec\x86\x14\xdc\x0a\x74\xaa\
-\xdf\x65\x78\xab\x9f\xc5\xd7\x0d\xfc\x3d\x30\x25\x76\x43\x1a\xd4\
-\x85\xd6\xc7\x2d\x8e\xdd\x90\x3c\x1c\x86\x32\x9d\xd8\x43\x2e\x8d\
-\xc6\x6c\x54\x7a\xd2\xca\x63\x0f\xe0\xbb\xc4\xbf\xb7\x8a\x18\x4b\
-\x81\x7f\x05\xc6\x0d\xf4\xe2\x9a\x05\x36\x05\xd5\x97\x89\xfd\xd9\
-\x68\x34\xd6\x03\x27\x05\xbe\x36\x3b\x14\x6b\x11\xdb\xd3\x68\xaf\
-\x63\x77\xa4\xbf\x3f\x94\x89\xc0\xcb\xd1\x16\x14\x2b\x87\x99\xb8\
-\x6c\xf0\xb6\xd4\x2b\xfc\x5d\x4e\xc9\x17\x29\x59\x32\x5a\x80\x53\
-\x80\xdd\x63\x37\x24\x80\x59\xe4\x54\xfe\xb7\xb7\x58\x09\xc0\x3a\
-\xe0\x8f\xc0\x86\x48\x7f\x7f\x28\x43\x81\xd7\xe0\x37\xa2\xb2\x99\
-\x89\xde\x74\xff\x17\xef\x0e\x00\x75\xfe\x57\xa2\x04\xc0\x5b\xfd\
-\xac\x28\x86\x03\xaf\x04\x46\xc5\x6e\x48\x83\x3a\x80\x5b\xa8\xd0\
-\x94\x5a\x33\xf0\x52\x74\x3e\x40\xec\xa1\x97\x46\x63\x35\x70\x32\
-\x5e\x0c\x58\x46\xd3\x80\x6b\xd1\x07\x34\xf6\x7d\x16\x2b\x96\xa0\
-\xf2\xc9\xde\xf1\x62\x45\xd2\x84\xf6\xfe\x97\xa1\x0f\x59\x85\x12\
-\x99\xdc\xfb\x90\x58\x23\x00\x5d\xc0\x3d\xe4\x58\xf1\x28\x43\xc3\
-\xd0\x22\x94\xd4\xb3\x50\x7b\xbe\x39\xa8\x62\x60\x55\x8b\x05\xad\
-\x00\x2e\xc5\x45\x7e\xac\x78\x86\xa1\xd1\xd7\x32\x6c\x43\x9d\x0f\
-\xdc\x87\xca\xe5\x57\xc6\x20\xe0\x3f\x50\x25\xb1\xd8\x19\x58\xa3\
-\x31\x13\x2d\x6c\xb4\x72\x9a\x0a\x5c\x47\xb5\x46\x02\xd6\x00\x9f\
-\xa0\x1c\x0f\x58\x2b\x9f\xe9\xa8\x68\x4e\xec\xcf\x49\xa3\xb1\x01\
-\x4d\xaf\xa5\x7e\x82\xe1\x80\x9c\x42\xcf\x62\xc0\xd4\xe3\x22\x94\
-\x95\x5a\x39\xed\x8e\xa6\x03\xb6\x10\xff\x5e\xcb\x3a\xd6\xa0\xba\
-\x08\x63\x83\x5c\x39\xb3\xb0\x86\x00\x6f\x47\x2b\xe7\x63\x7f\x56\
-\x1a\x8d\x67\x81\x57\x53\xd1\xaa\xb2\x23\x80\x9b\x88\xff\x43\x08\
-\x11\x7f\x01\x0e\x09\x7b\x79\xac\x60\xa6\xa2\xa3\x84\x63\xdf\x6b\
-\x59\xc6\x6a\xe0\x93\xb8\xf3\xb7\xe2\x9a\x4e\x79\xfa\x8d\x7b\xd1\
-\x6e\xb2\x28\x62\x67\x1d\x6b\x51\xf5\xa3\x35\x91\xdb\x11\xc2\x11\
-\xf8\x80\xa0\xb2\x9b\x8b\x86\xc5\xcb\xba\x45\x70\x15\xf0\x25\x34\
-\x24\x59\x99\x15\xc9\x96\x9c\x43\x80\x17\xc5\x6e\x44\x00\x1b\x50\
-\xf1\x9f\x68\xdb\x6a\x8b\xb0\x72\x7d\x08\xea\x38\xc7\xc7\x6e\x48\
-\x83\x5a\xd0\xf0\xf0\xdd\xf8\xe1\x59\x66\x2b\xd1\x82\x9d\x71\xc0\
-\x41\x91\xdb\x12\xd2\x0a\xe0\xbf\xd0\x56\x3f\x97\xf7\xb5\xa2\xda\
-\x0d\x78\x2f\xda\x01\x90\xba\x67\x81\xff\x06\x1e\x89\xdd\x90\x98\
-\xc6\xa0\x83\x1c\x62\x0f\xc5\x84\x88\x15\xc0\x5b\xc2\x5e\x1e\x2b\
-\xa8\x32\x55\x0c\x5c\x0a\x7c\x1a\xd7\xb3\xb0\xe2\x3b\x03\xdd\xaf\
-\xb1\x3f\x33\x21\xe2\xaf\xc0\x84\xb0\x97\xa7\x7f\x62\x4f\x01\x80\
-\x3a\xcd\x07\xd1\x82\x8e\xd4\x8d\x06\x4e\x04\x26\x45\x6e\x87\x65\
-\x6f\x26\xea\x34\x53\x3f\x3b\x60\x09\xda\xe6\x77\x19\xae\xf0\x67\
-\xc5\x36\x0e\xd5\x8f\x29\x43\xa2\xba\x11\x8d\x24\x56\xa2\xf6\xff\
-\x8e\xfc\x1d\x4a\x02\x62\x67\x64\x21\x62\x2e\x70\x4e\xd0\xab\x63\
-\x45\x36\x03\x2d\x0c\x4c\xf1\x28\xd2\x45\xa8\xc8\x4f\x19\x1e\xa8\
-\x56\x7e\xa7\x00\x4f\x12\xff\x73\x13\x22\x66\xe3\x7e\xe2\xff\x9b\
-\x48\xb9\x56\x57\x57\x76\x5f\x67\x45\xcd\x00\x7e\x48\x5a\x75\x02\
-\xea\x15\xfe\xbc\xda\xdf\x52\xd0\x06\x7c\x86\xf8\x9f\x9b\x50\xf1\
-\x1b\x60\xd7\xa0\x57\x28\x71\x17\xa2\x55\x91\xb1\x7f\x30\x21\xe2\
-\x61\x54\xa5\xca\xaa\x63\x2a\x3a\x3b\x20\x85\x24\x60\x05\x2e\xef\
-\x6b\x69\x39\x99\x72\x9c\xfa\xd7\x8d\x86\xff\x3f\x1b\xf6\xf2\xa4\
-\xef\x48\xe0\x66\xe2\xff\x70\x42\xc5\xd5\xe8\xb0\x20\xab\x8e\x29\
-\x14\x7f\x24\xa0\xbe\xcf\xdf\xc3\xfe\x96\x8a\x21\xc0\x17\x89\xff\
-\xd9\x09\x15\x77\x02\x2f\x09\x7a\x85\x4a\xa0\x05\xf8\x1c\xf1\x7f\
-\x38\xa1\xe2\x31\xe0\xac\xa0\x57\xc8\x52\xb0\x3b\x1a\x09\x28\x62\
-\xc5\xc0\x35\xb8\xc8\x8f\xa5\xe7\x34\x74\x76\x4c\xec\xcf\x4f\xa8\
-\xf8\x06\x4a\x6a\x6c\x2b\x67\xa2\x03\x82\x62\xff\x80\x42\x44\x27\
-\xf0\x23\x74\x64\xa5\x55\xcb\x54\x8a\xb7\xa6\x65\x35\x2e\xef\x6b\
-\xe9\x69\x06\xae\xa0\xd8\xa3\x6a\xfd\x89\x05\xa8\x8c\xb1\x6d\xc3\
-\x54\xb4\xad\x2a\xf6\x0f\x29\x54\xcc\xc1\x6b\x01\xaa\x6a\x1a\xc5\
-\xb9\x97\x57\x02\x9f\xc2\xc3\xfe\x96\x9e\x53\x29\xcf\x0e\xb1\x6e\
-\xe0\xa7\xc0\x3e\x41\xaf\x50\x89\xb4\x00\xef\x42\x6f\xcf\xb1\x7f\
-\x50\x21\xa2\x03\xb8\x01\x8f\x02\x54\xd5\x34\xe0\xdb\xc4\x9d\x0e\
-\x58\x04\x7c\x14\x9f\xea\x67\xe9\x19\x8c\x3e\x3f\x9b\x88\xff\x2c\
-\x0f\x15\x1f\x43\x27\xe1\xda\x0b\x38\x86\x72\x1c\xf3\x58\x8f\x05\
-\xc0\xab\x80\xa6\x90\x17\xc9\x92\x31\x1d\xb8\x14\x9d\x7b\x91\xf7\
-\xbd\x37\x0b\x38\x1f\x68\xcf\xfc\x5f\x69\x16\xde\xc9\x94\x67\xdf\
-\x7f\x37\xf0\x38\x1a\xd1\xb0\xed\x18\x4d\xb9\xf6\x7b\x6e\x06\x7e\
-\x56\xfb\x77\x59\x35\x4d\x42\x99\xff\xa3\xe4\x77\xdf\xfd\x09\x78\
-\x3d\x5e\x6c\x64\x69\x6a\x45\x53\x68\x1b\x89\xff\x0c\x0f\x15\x97\
-\x93\xfe\x99\x37\xb9\x38\x0d\x9d\x4c\x16\xfb\x07\x16\x2a\x56\x00\
-\xaf\xa3\x18\x87\x2f\x59\x1c\x2d\x68\x57\xc8\x8d\xe8\xb0\xa8\xac\
-\xee\xb5\x59\xc0\xd7\x80\xe3\xf2\xf9\x67\x99\x65\xe2\x0c\xe0\x19\
-\xe2\x3f\xbb\x43\xc5\x5a\xe0\xcd\x41\xaf\x50\x89\x4d\x45\x73\xe7\
-\xb1\x7f\x68\xa1\xa2\x0b\xf8\x23\x9a\x13\xb6\x6a\xdb\x05\xb8\x18\
-\xbd\xa1\x2f\x22\xdc\x3d\x36\x07\x8d\x34\xbd\x19\xaf\x39\xb1\xb4\
-\x4d\x00\x7e\x49\x79\xd6\x82\x75\x03\x37\x01\x07\x86\xbc\x48\x65\
-\x36\x18\x9d\xaa\x57\xa6\xe1\x9f\x8d\xc0\x07\x6a\xff\x36\xb3\x69\
-\xc0\x07\x81\xdf\xa2\x79\xce\xe5\xf4\x6f\xb1\xe0\x66\x94\x40\x3c\
-\x8c\xea\x0e\xbc\x11\xcf\xf5\x5b\xfa\x9a\x81\x77\x50\xae\x11\xe0\
-\x2e\xf4\xec\x1f\x16\xf0\x3a\x05\x51\xe4\x85\x69\xf5\xfa\xea\x65\
-\x38\xf7\xb9\xee\x31\xe0\x4d\xa8\xa8\x85\x59\x13\x7a\x5b\x3f\x18\
-\x55\x06\x3b\x0c\x6d\x11\x1a\x8d\x12\xc5\x16\xf4\x40\xac\x3f\x44\
-\xb6\xa0\x9d\x25\x8b\xd0\xd6\xa8\x3b\x80\x5b\x51\x02\xd1\x91\x73\
-\xdb\xcd\xb2\xb0\x17\x70\x2d\xfa\x2c\x94\xc5\x63\x68\x64\xee\xee\
-\xd8\x0d\xd9\x5a\x91\xb7\x23\x2c\x40\x6f\x36\xfb\x51\xc0\xcc\x69\
-\x80\xf6\x41\x6b\x01\x9e\x42\x67\x5a\x5b\xb5\x75\x03\xeb\x80\xbf\
-\xa0\x87\xc3\x10\xb4\xf8\x69\x1c\x9a\x2a\x18\x09\x8c\x40\x43\xa1\
-\x1b\xd0\x28\xc1\x33\xe8\xed\x68\x73\x2d\xdc\xf1\x5b\x59\x8c\x44\
-\x0b\x57\x0f\x88\xdd\x90\x80\xba\x80\xeb\xd0\xda\x1c\xeb\xa7\x3d\
-\xd1\xd6\x89\xd8\x43\x38\x21\x63\x11\x3a\xfe\xd8\x6c\x47\x9a\x51\
-\x92\xde\x42\xb1\x47\xeb\xcc\x42\x38\x16\xbd\x1c\xc5\x7e\x46\x87\
-\x8c\x85\xc0\xd1\x14\xf4\xf3\xdb\x1c\xbb\x01\x3b\xf0\x0c\x5a\x0c\
-\xb2\x2e\x76\x43\x02\x9a\x80\x46\x01\xa6\xc7\x6e\x88\x15\x5e\x17\
-\x7a\xfb\xaf\xaf\x0d\x30\x2b\xab\x9d\xd1\xf4\xe8\x6e\xb1\x1b\x12\
-\x50\x07\x5a\x98\x5b\xaf\x65\x60\xfd\xd4\x04\x1c\x81\x56\x38\xc7\
-\xce\xe4\x42\xc6\x0a\x5c\x0f\xda\xcc\xac\xee\x2c\x60\x19\xf1\x9f\
-\xcd\x21\x63\x29\x5a\xdb\x53\xf4\x17\xed\x42\x1b\x4a\xf9\x0a\x42\
-\x74\xa3\x6d\x60\x65\x5a\xe8\x62\x66\x36\x10\x7b\xa1\x91\xde\xd8\
-\xcf\xe4\x90\x51\x2f\x00\x57\xe8\x12\xdc\x29\x64\x26\x9b\x50\x02\
-\xb0\x30\x76\x43\x02\x3b\x0e\x6d\x75\x2c\xf4\x0d\x62\x66\x96\xa1\
-\x76\xb4\xf0\xef\xe4\xd8\x0d\x09\x6c\x0d\xf0\x3d\x74\x0a\xa7\x35\
-\x68\x38\x3a\x45\xa9\x88\x67\xac\x37\x12\xb3\xd1\xbc\x97\x99\x59\
-\x15\x9d\x41\xbe\x25\xb2\xf3\x88\x2e\x34\xc2\x5b\xf8\xb2\xbf\x29\
-\x8c\x00\x00\xac\x47\xc3\x29\x8b\x63\x37\x24\xb0\x69\xc0\xb9\xc0\
-\x1e\xb1\x1b\x62\x66\x96\xb3\xc9\x68\x7f\x7c\xd9\x8e\xc7\x5d\x09\
-\x5c\x8f\xd6\x34\x58\x20\x93\x29\xdf\x3c\x51\x37\x1a\x2a\xfa\x22\
-\x3e\xb4\xc5\xcc\xaa\x63\x30\xf0\x71\xd4\x59\xc6\x7e\x06\x87\x8e\
-\xdb\x80\xdd\xc3\x5d\xaa\xec\xa4\x32\x02\x00\xf0\x2c\xf0\x73\xca\
-\x37\x0a\x30\x02\x1d\x17\x7c\x4a\xec\x86\x98\x99\xe5\xe4\xc5\x68\
-\xe5\xff\xa8\xd8\x0d\x09\x6c\x05\x1a\xad\x9e\x17\xbb\x21\x65\x34\
-\x09\x0d\xad\xc4\xce\xf0\x42\x47\x17\xf0\x7f\xc0\xc4\x70\x97\xca\
-\xcc\xac\x90\xda\x81\x1f\x50\xbe\x35\x5d\xdd\xc0\xef\x49\xe4\xed\
-\x1f\xd2\x3b\x9e\x76\x2d\x2a\x17\x79\x44\xed\x6b\x59\x34\xa1\xe4\
-\x66\x13\x70\x3b\xfa\x60\x98\x99\x95\x4d\x13\xf0\x4f\x68\xed\xd3\
-\x88\xc8\x6d\x09\x6d\x29\x70\x35\xf0\xeb\xd8\x0d\x29\xb3\x89\x68\
-\x7b\x45\xec\x4c\x2f\x8b\x98\x03\x9c\x46\x5a\x53\x33\x66\x66\x7d\
-\x75\x0c\x70\x3f\xf1\x9f\xb5\x59\xc4\x2f\x80\x29\xe1\x2e\x95\xbd\
-\x90\x37\xa3\xc3\x82\x62\xff\xc0\xb3\x88\x9b\xd1\x49\x88\x66\x66\
-\x65\x32\x1e\xf8\x09\xe5\x1c\xfa\x5f\x0c\x5c\x10\xee\x52\xd9\xf6\
-\x4c\x04\xae\x22\xfe\x0f\x3d\xab\xf8\x2f\x5c\x20\xc8\xcc\xca\xa3\
-\x15\xf8\x24\x9a\xe6\x8c\xfd\x7c\xcd\x22\x6e\x00\xa6\x86\xba\x58\
-\xb6\x63\x67\xa2\x93\xf5\x62\xff\xe0\xb3\x88\x15\x68\x94\xc3\x5b\
-\x03\xcd\x2c\x75\x83\x50\xc1\x9f\x67\x88\xff\x6c\xcd\x22\x96\x02\
-\xef\x0a\x76\xb5\xac\x4f\x76\x01\xbe\x4e\xfc\x1f\x7e\x56\x71\x07\
-\x9a\x2f\x33\x33\x4b\xd9\xbe\xc0\x2d\xc4\x7f\xa6\x66\x15\x3f\x44\
-\x45\xdd\x2c\x67\xa7\x01\xcb\x89\x7f\x03\x64\x15\xdf\x46\xbb\x03\
-\xcc\xcc\x52\x34\x0a\xb8\x84\xf8\xcf\xd2\xac\x62\x15\x1a\xad\x4d\
-\x52\x6a\xdb\x00\xb7\xb6\x0e\x2d\x2c\x39\x22\x76\x43\x32\xb2\x0f\
-\x4a\x70\xee\x45\xe7\xc2\x9b\x99\xa5\x62\x08\xea\x1c\x3f\x86\xd6\
-\x00\x94\xd1\x75\x68\x57\xda\x8a\xd8\x0d\xa9\xaa\x17\x01\x4f\x13\
-\x3f\x13\xcc\x2a\x1e\x07\xce\xc1\x5b\x03\xcd\x2c\x1d\x4d\x68\x84\
-\xf6\x01\xe2\x3f\x43\xb3\x8a\x25\xc0\xe9\xa1\x2e\x58\x0c\xa9\x8f\
-\x00\x80\x86\x60\xda\x80\xa3\xd1\x62\x93\xb2\x19\x07\xec\x04\x3c\
-\x81\x12\x1d\x33\xb3\xa2\x3b\x04\xf8\x08\x70\x7c\xec\x86\x64\xa4\
-\x1b\xf8\x1f\x34\xff\xbf\x3e\x72\x5b\x2a\x6f\x4f\xe0\x1e\xe2\x67\
-\x84\x59\x45\x07\x70\x2d\x2e\x32\x61\x66\xc5\x37\x0e\xb8\x1c\xd8\
-\x4c\xfc\x67\x67\x56\xf1\x04\x70\x78\xa8\x0b\x16\x4b\x19\x46\x00\
-\x40\x27\x4a\x35\x01\xc7\x01\xc3\x22\xb7\x25\x0b\xcd\xa8\x38\xd0\
-\x60\x74\xce\xb4\xd7\x03\x98\x59\x11\x35\x03\xef\x07\xce\x03\x86\
-\x47\x6e\x4b\x56\x36\xa0\x85\x8d\x3f\xc7\x65\xdb\x0b\x63\x3c\xaa\
-\xc1\xdc\x45\xfc\xec\x30\xab\x58\x06\xbc\x2f\xd4\x05\x33\x33\x0b\
-\xec\xcd\xe8\x24\xbc\xd8\xcf\xca\xac\xa2\x0b\xb8\x15\x17\xfd\x29\
-\xa4\x57\x03\xf3\x89\x7f\x93\x64\x19\x8f\x01\xa7\x86\xba\x60\x66\
-\x66\x81\x1c\x0f\xdc\x45\xfc\x67\x64\x96\xb1\x1c\x25\x39\x4d\x81\
-\xae\x99\x05\xd4\x0a\x7c\x07\xd8\x48\xfc\x1b\x25\xab\xe8\x42\xe7\
-\x05\xec\x1f\xe8\x9a\x99\x99\x35\x6a\x1a\x3a\x0c\xa7\x8c\x75\xfe\
-\xeb\xb1\x19\x9d\x65\x30\x3a\xd0\x35\xb3\x0c\x9c\x40\xb9\xb7\x9e\
-\x74\xa3\x0f\xd9\x77\x81\xdd\x02\x5d\x33\x33\xb3\x81\x1a\x0b\x5c\
-\x86\xe6\xc6\x63\x3f\x1b\xb3\x8c\x39\x78\xf4\x35\x09\x9f\x47\x45\
-\x82\x62\xdf\x30\x59\x27\x01\x5f\xc6\x87\x06\x99\x59\x3c\x6d\xa8\
-\xd0\xcf\x1a\xe2\x3f\x13\xb3\x8c\x8d\xc0\xd7\x28\xcf\xc2\xf9\x52\
-\x3b\x18\xf8\x0d\xf1\x6f\x9a\xac\x63\x3d\xf0\x21\xca\xb9\xf3\xc1\
-\xcc\x8a\x6d\x30\xf0\x6e\xca\x5d\x8e\xbd\x1e\x7f\x05\x8e\x0a\x73\
-\xd9\x2c\x0f\xe7\x02\x0b\x88\x7f\xe3\x64\x1d\xcb\xd0\x49\x54\x3e\
-\x39\xd0\xcc\xf2\xd2\x0c\x9c\x4d\x75\x9e\xb1\x1f\x08\x73\xd9\x2c\
-\x2f\x6d\xc0\x57\x28\xf7\xa2\x94\x7a\xcc\x05\xde\x80\xcb\x05\x9b\
-\x59\xf6\x9a\x80\x93\x81\x07\x89\xff\xec\xcb\x3a\xba\xd0\x7a\xab\
-\x71\x41\xae\x9c\xe5\xea\x58\x54\x38\x27\xf6\x4d\x94\x47\xdc\x87\
-\xce\xdc\x36\x33\xcb\xd2\x71\xc0\x1f\x89\xff\xcc\xcb\x23\xee\x04\
-\x4e\x09\x73\xd9\x2c\x6f\x43\xd0\xf0\xf8\x6a\xe2\xdf\x48\x79\xc4\
-\x4d\x28\xe9\x31\x33\xcb\xc2\xa1\xc0\x0d\x54\x63\x64\x75\x03\x3a\
-\xcf\xa0\xac\x27\x19\x56\xc2\x78\xb4\x7a\x33\xf6\xcd\x94\x47\x74\
-\x00\x37\xa2\x0f\xa9\x99\x59\x48\xfb\x01\x3f\x00\x36\x11\xff\x59\
-\x97\x47\xfc\x08\xd8\x3d\xc8\x95\xb3\xa8\x8e\x03\x1e\x26\xfe\x0d\
-\x95\x47\x6c\x42\x37\xee\x01\x41\xae\x9c\x99\x99\x4a\xdf\x7e\x1d\
-\xed\x3c\x8a\xfd\x8c\xcb\x23\x9e\x00\xfe\x2e\xc4\x85\xb3\xf8\xda\
-\x80\x0b\x28\xf7\xe9\x54\xbd\x63\x33\xf0\x7d\x74\x80\x90\x99\x59\
-\x23\x76\x45\x85\x7e\xaa\x32\x95\xda\x05\x7c\x12\x18\x15\xe2\xe2\
-\x59\x31\x4c\x46\xcf\xa0\x0d\x28\x00\x00\x12\x00\x49\x44\x41\x54\
-\x73\x57\xb1\x6f\xae\xbc\x62\x13\xf0\x4d\x7c\x68\x85\x99\x0d\xdc\
-\x78\x74\xf2\x5d\xd9\x0b\xfd\xf4\x8e\x3f\x00\x7b\x85\xb8\x78\x56\
-\x2c\x27\xa0\x72\x8e\xb1\x6f\xb0\xbc\xa2\x03\xb8\x12\xd8\x25\xc4\
-\xc5\x33\xb3\x4a\x19\x07\x7c\x96\xea\xbc\xf9\x77\x03\x8b\x80\x57\
-\x51\x91\x8a\x7f\x95\xf8\x47\xf6\xb2\x18\x18\x0a\x1c\x4d\x35\x0a\
-\xe7\x34\xa3\xaa\x88\xa0\xf3\x11\xd6\x45\x6c\x8b\x99\xa5\x63\x34\
-\x70\x1e\x70\x11\x30\x32\x72\x5b\xf2\x52\x7f\x61\xba\x06\xed\x00\
-\xb0\x12\xda\x09\xf8\x31\xd5\xd8\xc6\x52\x8f\x4d\xc0\xbf\x03\x13\
-\x03\x5c\x3f\x33\x2b\xb7\xd1\x68\xfb\xdb\x2a\xe2\x3f\xbb\xf2\x8c\
-\x9b\x80\x29\x01\xae\x9f\x15\xdc\x61\x94\xff\xdc\xea\xad\x63\x23\
-\xf0\x25\x60\xe7\x00\xd7\xcf\xcc\xca\x69\x0c\xf0\x51\xaa\xd7\xf9\
-\xcf\x02\x4e\x0a\x70\xfd\x92\x52\xb5\x29\x80\xba\x67\xd1\xf0\xf8\
-\x21\x40\x7b\xe4\xb6\xe4\x65\x10\x3d\xff\xde\x47\x81\x95\x71\x9b\
-\x63\x66\x05\x33\x01\x78\x3f\x7a\xfb\xaf\xca\x73\x11\x60\x29\xf0\
-\x55\xb4\x7d\xba\x2b\x72\x5b\x2c\x27\x23\xd1\xd6\x96\xaa\x14\xb5\
-\xa8\xc7\x3a\xe0\x6a\x60\x9f\xc6\x2f\xa1\x99\x95\xc4\xae\xe8\x78\
-\xf1\x15\xc4\x7f\x46\xe5\x19\x5b\x80\x6b\xf1\xb1\xea\x95\xb4\x37\
-\xf0\x3b\xe2\xdf\x84\x79\xc7\x06\x54\x27\xc0\xc5\x82\xcc\x6c\x06\
-\x70\x05\x1a\x15\x8c\xfd\x6c\xca\x3b\xee\x00\x0e\x6f\xfc\x12\x5a\
-\xaa\xce\x02\x1e\x23\xfe\x8d\x98\x77\x6c\x04\xae\x03\x8e\x68\xfc\
-\x12\x9a\x59\xa2\xa6\xa3\x52\xe9\x6b\x89\xff\x4c\xca\x3b\xe6\x01\
-\x6f\x6d\xf8\x0a\x5a\xd2\x46\xa0\xaa\x4f\x55\xda\xeb\xda\x3b\x7e\
-\x0e\x1c\xd5\xf0\x55\x34\xb3\xd4\x1c\x0c\x7c\x1b\x4d\x0b\xc6\x7e\
-\x0e\xe5\x1d\xeb\xd0\x94\x87\xab\xfd\x19\x33\xd0\x3c\x50\xec\x9b\
-\x32\x56\xfc\x16\x9d\xef\x6d\x66\xd5\x70\x1c\x3a\x38\xac\x4a\xdb\
-\xa1\x7b\xc7\x2f\x80\xfd\x1b\xbe\x8a\x56\x1a\xc7\x51\xbd\xad\x81\
-\xbd\xe3\x6e\xe0\x4c\x60\x70\xa3\x17\xd2\xcc\x0a\xab\x09\x9d\x6f\
-\x7f\x1b\xf1\x9f\x39\xb1\xe2\x71\xe0\xf4\x46\x2f\xa4\x95\xcf\x99\
-\xc0\x7c\xe2\xdf\xa0\xb1\x62\x36\x9a\x13\x1b\xd1\xe0\x75\x34\xb3\
-\xe2\x19\x0a\xbc\x96\xea\x9c\x8c\xba\xad\x58\x06\xbc\x0b\x6d\x03\
-\x37\x7b\x8e\x36\xe0\x42\xaa\x39\x27\x56\x8f\xa5\xc0\x87\x51\x35\
-\x30\x33\x2b\x87\x36\xe0\xdd\xc0\x02\xe2\x3f\x63\x62\xc5\x46\xe0\
-\x33\xe8\x8c\x03\xb3\x6d\x9a\x0c\x7c\x03\xd5\x85\x8e\x7d\xc3\xc6\
-\x8a\x75\xc0\x17\xf0\x21\x42\x66\x65\xb0\x13\xf0\x71\xaa\xb7\xc7\
-\x7f\xeb\xb8\x06\xed\x7a\x30\xdb\xae\xbd\x81\x5b\x88\x7f\xc3\xc6\
-\x4e\x02\xbe\x0d\xec\xd7\xd0\x95\x34\xb3\x98\xa6\xa3\x82\x67\x55\
-\xdd\xe5\x54\x8f\x3b\xf1\x96\x67\xeb\x87\xe3\x51\xc9\xdc\xd8\x37\
-\x6e\xcc\xd8\x08\xfc\x1e\x78\x65\x83\xd7\xd2\xcc\xf2\x77\x14\xaa\
-\xf5\x51\xe5\x29\xcd\x6e\xe0\x19\xf4\x0c\x6b\x6a\xec\x72\x5a\xd5\
-\xbc\x19\xdd\x3c\xb1\x6f\xe0\xd8\xf1\x30\x70\x3e\xd0\xda\xd8\xe5\
-\x34\xb3\x1c\x34\xa3\xc5\xbc\xb7\x03\x9d\xc4\x7f\x7e\xc4\x8c\x95\
-\xc0\xfb\xd0\x59\x28\x66\xfd\xd2\x0a\x7c\x96\x6a\x96\xc8\xdc\x3a\
-\x16\xa0\xd3\x04\x77\x6f\xe8\x8a\x9a\x59\x96\x76\x02\x3e\x01\xcc\
-\x21\xfe\x33\x23\x76\xac\x47\xd3\x1f\x2e\xf6\x63\x03\x36\x05\x15\
-\x09\xaa\x7a\x26\xdd\x0d\x6c\x06\xbe\x07\x1c\xdd\xd0\x15\x35\xb3\
-\x2c\x1c\x04\x5c\x49\xf5\x8e\xf2\xdd\x56\x74\x01\xbf\xc4\x8b\xfe\
-\x2c\x80\xa3\xd1\x5c\x78\xec\x9b\xba\x28\xf1\x3b\xe0\x35\xc0\x90\
-\x46\x2e\xaa\x99\x05\xd1\x0c\x9c\x0a\xfc\x8c\xf8\xcf\x86\xa2\xc4\
-\x1d\xc0\x89\x0d\x5c\x53\xb3\xe7\x38\x05\x55\xcb\x8b\x7d\x63\x17\
-\x25\x9e\x40\x35\x13\xa6\x34\x72\x51\xcd\xac\x21\xe3\x81\x77\x02\
-\x0f\x10\xff\x99\x50\x94\x78\x0c\x1d\xf2\x66\x16\xd4\x59\xc0\x2c\
-\xe2\xdf\xe0\x45\x89\xcd\xc0\x55\xc0\x91\xb8\x84\xb0\x59\xde\xf6\
-\x41\x07\xda\x78\xc8\xbf\x27\x9e\x05\xde\xde\xc8\x45\x35\xdb\x9e\
-\x7f\x04\x16\x13\xff\x46\x2f\x52\xdc\x8d\x76\x4c\xb8\x7a\xa0\x59\
-\xf6\x46\xa0\x21\xff\x5f\x11\xff\xb3\x5f\xa4\x58\x03\x7c\x08\xbf\
-\x8c\x58\x86\x86\x02\x1f\xc0\x7b\x6b\xb7\x8e\x65\xc0\xa5\xc0\x34\
-\xbc\xdf\xd6\x2c\x2b\x13\x81\x7f\x41\xdb\x93\xbb\x88\xff\xb9\x2f\
-\x4a\x6c\x46\x3b\xb6\xbc\xe2\xdf\x32\x37\x0e\xf8\x1c\xd5\x2e\x17\
-\xbc\xad\xd8\x08\xfc\x01\x38\x0d\x68\x19\xf0\xd5\x35\xb3\xad\x35\
-\x01\xc7\x02\x37\x00\x6b\x89\xff\x59\x2f\x5a\x5c\x8e\x4b\x97\x5b\
-\x8e\xa6\x00\x57\xe3\xed\x81\xdb\x8a\x27\xd0\x5e\xe4\xf1\x03\xbe\
-\xba\x66\x56\xd7\x8e\x46\x1d\xef\x07\xb6\x10\xff\xf3\x5d\xb4\xf8\
-\x21\x5a\x0f\x61\x96\xab\x7d\x80\x5f\xe0\x0f\xe5\xb6\x62\x19\x70\
-\x23\xf0\x6a\x3c\x1a\x60\x36\x50\xc7\xa1\xda\x1b\x0b\x89\xff\x99\
-\x2e\x62\xdc\x86\x16\x21\x9b\x45\x71\x0c\xf0\x57\xe2\x7f\x10\x8a\
-\x1a\x0f\xa3\x23\x38\xf7\x1c\xe8\x05\x36\xab\xa0\xdd\x80\x8b\xf1\
-\xb3\x65\x7b\xf1\x20\xda\x9e\x6d\x16\xd5\x29\xe8\xb4\xa9\xd8\x1f\
-\x88\xa2\xc6\x06\xe0\xa7\xc0\x1b\xd0\x70\xa6\x99\x6d\xdb\x60\xe0\
-\x0c\x34\xac\xbd\x86\xf8\x9f\xdd\xa2\xc6\x63\xc0\xd9\x03\xbc\xc6\
-\x66\xc1\x9d\x01\xdc\x47\xfc\x0f\x46\x91\xe3\x29\xe0\x3f\x80\xc3\
-\x07\x78\x8d\xcd\xca\xec\x40\xe0\x93\x68\xd4\x2c\xf6\x67\xb5\xc8\
-\x31\x13\x6d\x3b\x36\x2b\x94\x73\x80\x47\x88\xff\x01\x29\x7a\xdc\
-\x04\xbc\x09\x1f\x2c\x64\x06\xda\xda\x77\x26\x2e\xe5\xdb\x97\x78\
-\x0a\x17\xfa\xb1\x02\x7b\x13\x5a\x05\x1f\xfb\x83\x52\xf4\x58\x07\
-\x7c\x1b\x78\x29\x3a\xc1\xcc\xac\x6a\xda\xd0\xd6\xbe\xff\xc4\xc5\
-\xc5\xfa\x12\xcf\x02\x17\x0c\xe8\x4a\x9b\xe5\xe8\x4d\xc0\x6c\xe2\
-\x7f\x60\x52\x88\xc5\xe8\x01\x78\x30\x30\x7c\x20\x17\xdb\x2c\x31\
-\x43\x80\x3d\x80\x0f\xe3\x63\x7b\xfb\x1a\x8b\x80\xf7\xe3\x22\x63\
-\x96\x80\x16\xe0\x5c\x54\xad\x2b\xf6\x07\x27\x85\xe8\x00\x1e\x07\
-\x3e\x82\x56\x3f\x7b\xdb\xa0\x95\xd5\x78\x34\x84\x7d\x17\x2a\x9c\
-\x15\xfb\xb3\x97\x42\xac\x40\x25\x7e\x07\x0d\xe0\x7a\x9b\x45\x31\
-\x04\x78\x07\x1e\xda\xeb\x4f\xac\x06\xfe\x84\x46\x50\xda\xfa\x7f\
-\xc9\xcd\x0a\x6b\x08\xf0\x72\xe0\x27\xc0\x72\xe2\x7f\xd6\x52\x89\
-\xb5\xc0\xc7\x80\x61\xfd\xbf\xe4\x66\x71\x0d\x05\xce\xc7\x1f\xf8\
-\xfe\xc6\x7c\xe0\x7a\xe0\x55\xe8\xc1\x69\x96\xaa\x16\xd4\xf1\x7f\
-\x0f\x0d\xf7\xbb\x68\x58\xdf\x63\x3d\xaa\x28\xea\xad\xc3\x96\xac\
-\x36\xe0\x3d\x68\x01\x4b\xec\x0f\x54\x6a\xf1\x24\x70\x2d\xda\x5d\
-\xe1\x37\x00\x4b\x49\x13\xea\xf8\xbf\x85\x77\x06\x0d\x24\x56\xa3\
-\xce\xdf\x87\xfb\x58\xf2\x5a\x81\x77\x01\x4f\x13\xff\x83\x95\x62\
-\x3c\x8e\xce\x5d\x38\xab\x76\x2d\xcd\x8a\xaa\x19\x75\xfc\x97\x01\
-\xf7\x12\xff\xb3\x93\x62\x2c\x45\xeb\x81\xdc\xf9\x5b\x69\x0c\x42\
-\x6b\x02\xe6\x12\xff\x03\x96\x6a\x3c\x0a\x7c\x15\x15\x5d\xf2\x88\
-\x80\x15\xc9\x60\x54\x11\xf4\x8b\xb8\x2a\x68\x23\xb1\x10\xf8\x20\
-\xde\x11\x94\x0b\xaf\xb6\xce\x4f\x17\x70\x0f\xb0\x0a\xd8\x1f\x18\
-\x1b\xb7\x39\x49\xda\x09\x38\x1a\x38\x04\xd8\x19\x3d\x24\x56\xa3\
-\x85\x42\x66\x31\x8c\x04\x8e\x07\xde\x02\xfc\x13\x2a\x4f\xbb\x73\
-\xd4\x16\xa5\x6b\x01\xf0\x05\xe0\x0a\x60\x53\xe4\xb6\x98\x65\xe6\
-\xf5\xe8\x20\x8b\xd8\xd9\x76\xea\x31\x1f\xb8\x12\xad\x11\xd8\xb7\
-\x5f\x3f\x01\xb3\xc6\x4c\x01\x5e\x01\xfc\x3b\xf0\x10\xf1\x3f\x0b\
-\xa9\xc7\x5c\xe0\x3c\x34\x85\x62\x56\x7a\x67\xe2\x39\xc2\x50\xb1\
-\x09\x1d\xcb\x7c\x2e\x3a\xa2\xd9\xc3\x87\x96\x85\x66\x60\x1a\xf0\
-\x1a\xe0\x2a\x34\x57\x1d\xfb\xde\x2f\x43\xcc\x44\xd3\xa3\x66\x95\
-\xf2\xf7\xc0\xdd\xc4\xff\x00\x96\x25\x3a\x81\xdb\x51\xc5\xb0\xbd\
-\xf1\x22\x22\x0b\xa3\x1d\x98\x8a\x46\xee\x7e\x8a\xca\x58\xc7\xbe\
-\xd7\xcb\x12\x8f\x03\x6f\xed\xeb\x0f\xc2\xac\x4c\x9a\x81\x53\xd1\
-\x99\xdf\xde\x1f\x1c\x2e\x36\xa2\x13\xd5\x2e\x01\x8e\x03\x46\xe3\
-\x7a\x02\xd6\x3f\x2d\x68\x7e\xff\x70\x34\xcc\x7f\x2f\xea\xf8\xbb\
-\x88\x7f\x7f\x97\x25\xee\x47\x6b\x26\xbc\x16\xcd\x2a\xab\x19\x2d\
-\x6c\xfb\x39\x7e\xb8\x84\x8e\x0d\x68\x55\xf1\xcd\x68\x65\xf1\xbe\
-\xb8\x9c\xa8\x6d\x5f\x0b\x30\x09\xbd\xed\x5f\x8f\xca\x79\xfb\x8d\
-\x3f\x7c\xdc\x0a\x9c\x86\x3f\x8f\x66\x00\xec\x07\x7c\x1d\xd5\xc5\
-\x8f\xfd\xe1\x2c\x63\x2c\x45\x0b\x2f\xbf\x85\xd6\x5f\xb8\xba\x98\
-\xf5\x36\x04\x78\x31\xf0\x15\xe0\x6f\x68\x81\xa9\x13\xf2\x6c\xe2\
-\x67\x68\x64\xce\x0b\xfe\x22\xf3\xc9\x4a\xc5\x32\x05\x95\x0e\x7e\
-\x2f\xae\x85\x9f\x95\x2d\xa8\x24\xeb\x4c\xe0\x2f\xc0\x1f\x81\x3b\
-\xf0\xb6\xa3\x2a\x6a\x41\xa3\x6f\x27\xa0\x63\x79\xa7\xa1\x53\xfa\
-\x5c\x63\x22\x1b\x1d\xc0\x37\xd0\xce\x9d\x87\x23\xb7\xc5\x70\x02\
-\x50\x44\x13\xd0\xa2\x98\x0b\xd1\x50\xa4\x65\x67\x15\x2a\x37\x3c\
-\x13\x15\x19\xba\x07\xad\xc7\x58\x16\xb3\x51\x96\xa9\x21\xc0\x61\
-\xa8\xe3\x3f\x14\xed\x1a\xd9\x13\xd7\xe5\xc8\xda\x1a\xb4\xbf\xff\
-\x32\xb4\xdf\xdf\x0a\xc0\x09\x40\x31\x0d\x05\xfe\x01\x1d\x81\xb9\
-\x57\xe4\xb6\x54\x45\x07\x4a\x02\x1e\x40\x53\x05\xf7\xa1\x84\x60\
-\x69\xcc\x46\x59\x10\xc3\x50\xa7\x7f\x18\x2a\xc2\xb5\x2f\x70\x20\
-\x30\x26\x66\xa3\x2a\x64\x01\x70\x29\x7a\xfb\x5f\x1e\xb9\x2d\xd6\
-\x8b\x13\x80\x62\x7b\x2d\x70\x31\x7a\x70\x59\xbe\xee\x45\x53\x03\
-\x0f\x02\x4f\x01\xb3\xd1\x68\x41\x47\xcc\x46\x59\x9f\xed\x06\xcc\
-\x00\xa6\xa3\xf5\x35\x47\x02\x47\xa1\xe4\xda\xf2\xf3\x04\x5a\x57\
-\xf1\x2d\xfc\xd9\x29\x1c\x27\x00\xc5\x77\x1a\x3a\x18\xe3\x44\xfc\
-\xf3\x8a\x65\x1e\xaa\xd7\xf0\x37\x74\xb2\xdb\x02\xb4\x48\x6c\x61\
-\xcc\x46\xd9\x73\x8c\x07\x76\x01\x26\xa3\x4e\xff\x60\xd4\xe9\x1f\
-\x8c\x3f\x37\xb1\xdc\x89\xb6\xe2\xfe\x30\x76\x43\x6c\xdb\xfc\xc1\
-\x48\xc3\x51\x68\x3a\xe0\x34\xb4\x37\xd9\xe2\x59\x87\x46\x05\xee\
-\x00\xee\x42\x85\x4c\x96\x03\x2b\x6b\xb1\x25\x5e\xd3\x2a\xa3\x09\
-\xd5\x76\x18\x8d\xe6\xee\xf7\x00\x8e\x40\xf3\xfa\x07\xe3\x1d\x1e\
-\xb1\xad\x07\x6e\x41\x9d\xff\x1f\xe2\x36\xc5\xb6\xc7\x09\x40\x3a\
-\x76\x41\xb5\xb2\xdf\x89\x0e\xc5\xb1\x62\x58\x82\xd6\x0a\x3c\x50\
-\x8b\x47\xd1\x22\xc2\xf5\x28\x59\x58\x17\xaf\x69\xa5\x31\x04\xed\
-\x8a\x69\x03\xc6\xa1\x85\x7b\x07\x03\x07\xa1\x42\x3d\x5e\x2c\x5b\
-\x1c\x2b\x80\xef\xa3\x39\xff\x99\x91\xdb\x62\x3b\xe0\x04\x20\x2d\
-\x6d\xe8\xe0\x9b\x8f\xa3\xb7\x1e\x2b\x8e\x4e\x34\xc7\xd9\x81\xa6\
-\x0c\x1e\x44\x09\xc1\xdd\xc0\x63\x68\x15\x74\xfd\xbf\x77\xa2\xfd\
-\xd0\xf6\x5c\x4d\xa8\x30\xcc\xe0\x5a\x0c\x45\x73\xf9\x07\xa1\x0e\
-\xff\x10\x34\x9f\xdf\x56\xfb\x7d\x83\xf0\x33\xac\x48\x9e\x41\xa7\
-\xf9\x7d\x0f\xed\xb0\xb1\x82\xf3\x87\x27\x3d\x83\x51\xc1\x92\x7f\
-\xad\x7d\x75\x31\x8d\x62\xea\x44\x25\x89\xd7\xa3\xa9\x81\x59\x68\
-\x11\xe1\x93\xb5\xef\x67\xa1\x07\xe6\x66\x94\x0c\xd4\x8b\xce\x54\
-\x45\x53\x2d\x9a\xd1\x3d\xbd\x33\x5a\xb4\x37\x03\x6d\xcb\xdb\xa3\
-\x16\xa3\xd1\x2a\xfe\xa1\x78\x01\x5f\x91\xdd\x05\xfc\x1b\xf0\x5b\
-\x5c\x53\x23\x19\x4e\x00\xd2\xb5\x3f\xaa\x15\xf0\x46\x5c\xb8\x24\
-\x15\x1b\xe8\x99\x16\xa8\x27\x06\x4f\xa3\x1d\x06\xb3\x51\x81\xa2\
-\x67\x80\x45\x68\x28\xb5\x6c\xda\xd1\x70\xfd\x2e\xe8\x70\x9d\xfa\
-\x2a\xfd\xdd\x51\x47\xdf\x86\x4e\x72\xac\x7f\xb5\xe2\xeb\x40\x25\
-\x93\x2f\x41\x53\x61\x55\x4a\x62\x93\xe7\x04\x20\x6d\xbb\x00\x6f\
-\x46\xd5\x03\x77\x8d\xdc\x16\x1b\xb8\xb5\xc0\xea\x5a\xac\x45\xc9\
-\xc1\x1a\xb4\xbe\x60\x11\xb0\xb8\x57\x2c\x44\x6b\x0c\xd6\xd4\x7e\
-\x7f\x51\x8c\xac\xc5\x58\x60\x22\x2a\x68\x35\xb1\xd7\xf7\x13\x6a\
-\xff\xbd\xde\xc1\xb7\xf7\x0a\x4b\xd3\x32\xe0\x72\xe0\x3b\x28\x79\
-\xb5\xc4\x38\x01\x48\xdf\x48\x74\xac\xf0\xfb\xd1\x6e\x01\x2b\x97\
-\x8d\xf4\x74\xf6\x6b\x6a\xb1\x16\x0d\xb3\xd6\xa7\x18\xd6\xd5\x7e\
-\x6d\x6d\xaf\xff\xbe\xa6\xf6\x7b\xba\xe8\x59\x77\xd0\x55\xfb\xff\
-\xd4\xd7\x20\x6c\xaa\x7d\xdf\x02\xb4\xd6\xbe\x36\xa3\x11\xa5\xe6\
-\xda\xff\x1e\x52\xfb\x7e\x08\x3d\x9d\x7c\x1b\x30\xa2\xf6\xfd\x08\
-\x34\x34\x3f\xac\xf6\x67\xd4\x3b\xf7\xfa\xef\x6d\xc7\x23\x54\x65\
-\xf4\x10\xf0\x55\xf4\xf6\xbf\x32\x72\x5b\x6c\x80\x9c\x00\x94\xc7\
-\x89\x68\x87\xc0\x2b\xd1\x43\xd9\xaa\xa7\x3e\xc5\xb0\xbe\x16\x1d\
-\xa8\xd3\xef\xa4\xa7\xd3\xdf\x4c\xcf\xd1\xd3\xf5\xef\x5b\xd0\x3c\
-\x7c\x73\x2d\x5a\xd1\xb3\xa1\xfe\xeb\x4d\xb5\xaf\xf5\xa1\xf9\x61\
-\xb5\xaf\x7e\x7e\x54\x4f\x37\xf0\x7f\xe8\xcd\xff\x57\x91\xdb\x62\
-\x0d\xf2\x07\xb8\x5c\xa6\x00\xe7\xa2\x75\x01\xfb\x44\x6e\x8b\x99\
-\x95\xcb\xd3\xc0\xff\x6b\xef\xde\x5e\xec\x3a\xcb\x38\x8e\x7f\x67\
-\x72\x98\x9a\xa4\x93\x54\x43\xd2\x4c\xe2\xc4\x36\x4d\x82\xb6\x15\
-\xad\xad\x18\x45\xa1\x56\x8b\x78\x40\xc1\xe3\x95\x17\x5e\x78\xe1\
-\x3f\xe0\x8d\x20\x78\x21\x88\x77\x2a\x88\x20\x22\x52\x28\x56\x5a\
-\x85\x7a\xc2\x48\x9b\xd2\x4a\x4d\x1b\x12\x6d\xab\xb4\xda\x9c\x9c\
-\x36\x6d\xd3\x69\xd2\x34\xe7\x64\x0e\x5e\xfc\xd6\x62\xb6\xbb\x49\
-\x9c\xc9\xcc\xec\xb5\xf6\x5a\xdf\x0f\xbc\xac\x95\x4c\x18\x1e\xc8\
-\xcc\x7e\x9f\xf7\xf4\xbc\x0f\x00\x3f\x27\xa5\xb2\xd5\xe7\x96\x54\
-\x1d\x80\x16\xd4\x09\x72\xc3\xdd\x11\x52\x2b\x60\x13\xfe\x1f\x4b\
-\x9a\xbf\xb2\xaa\xdf\x0f\x48\x22\xa0\x06\xb0\x73\x68\x9e\x29\x52\
-\x8c\xe6\x09\x32\x55\x3b\x82\xd5\x03\x25\x5d\x9d\x63\xc0\x83\xc0\
-\xb7\x8b\xa7\xf5\xfc\x1b\xc4\x04\xa0\xb9\xc6\x49\x19\xce\x63\xe4\
-\xc8\xd5\x5a\xac\x19\x20\x69\xf6\x0e\x90\xb5\xfe\xef\x90\xfa\x15\
-\x6a\x18\x13\x80\x66\xbb\x48\xd6\xea\x9e\x24\x97\xa5\xdc\x40\xaa\
-\xa7\x49\xd2\xe5\x9c\x07\x1e\x03\xbe\x09\xdc\x4b\x4e\x95\xa8\x81\
-\x4c\x00\x9a\x6f\x9a\xec\x09\x78\x84\xfc\x22\x6f\x05\x56\x57\x1a\
-\x91\xa4\xba\x3a\x0a\xfc\x18\xf8\x16\x29\xec\xe3\xe5\x56\x0d\x66\
-\x02\xd0\x1e\xa7\xc9\x6c\xc0\x5e\x72\x4c\x70\x1b\x2e\x09\x48\x9a\
-\xb1\x8b\xac\xf5\xdf\x83\x57\x5d\xb7\x82\x09\x40\xbb\x5c\x20\xeb\
-\x7a\x7b\x48\x2d\xfa\x11\xbc\x49\x4d\x6a\xbb\x31\x52\xd4\xe7\xfb\
-\x64\xa6\xf0\x5c\xb5\xe1\xa8\x57\x4c\x00\xda\xe9\x38\x99\x09\x78\
-\x96\x9c\x1a\xd8\x4e\x0a\xbd\x48\x6a\x8f\x8b\xc0\x7d\xa4\xe3\xbf\
-\x17\x8f\xf7\xb5\x8e\x09\x40\x7b\x4d\x01\x87\x48\x22\x30\x46\x96\
-\x05\x36\x57\x19\x90\xa4\x9e\x79\x86\x9c\xe9\xff\x11\xf0\x38\xde\
-\xe0\xd7\x4a\x26\x00\x7a\x83\xd4\x0c\xf8\x17\xf9\x10\xb8\x1e\x37\
-\x09\x4a\x4d\xf5\x1a\xf0\x6b\xe0\x87\xc0\xcf\xc8\x31\x61\xb5\x94\
-\x09\x80\x4a\x63\xc0\xc3\x64\x79\x60\x18\xd8\x80\x47\x06\xa5\xa6\
-\x98\x20\x89\xfe\x4f\x80\xef\x01\xfb\xaa\x0d\x47\x75\x60\x02\xa0\
-\x4e\x13\x64\x49\x60\x2f\x59\x22\x58\x53\x34\x4f\x0b\x48\xfd\xeb\
-\x10\xb9\xb5\xef\xbb\xc5\xf3\x4c\xa5\xd1\xa8\x36\xbc\x0c\x48\x97\
-\x33\x00\xec\x00\xbe\x0e\xdc\x4d\x66\x04\x24\xf5\x8f\x71\x60\x37\
-\xf0\x53\xe0\x77\x58\xc6\x57\x5d\x4c\x00\xf4\xff\xac\x04\x3e\x0e\
-\x7c\x83\x24\x04\x5e\x35\x2c\xd5\xdb\x59\xe0\x69\x32\xdd\xff\x1b\
-\xb2\xac\x37\x5d\x69\x44\xaa\x25\x13\x00\xcd\xc6\x20\xd9\x1c\xf8\
-\x69\x92\x08\xdc\x82\xcb\x47\x52\xdd\x4c\x01\x07\xc9\x88\xff\x3e\
-\xb2\xaf\xc7\x51\xbf\x2e\xcb\x04\x40\x73\x31\x44\x2a\x08\x7e\x11\
-\xf8\x1a\xb0\xb1\xda\x70\x24\x15\x8e\x91\xb3\xfc\xbf\x00\xfe\x89\
-\xf5\xfb\x35\x0b\x26\x00\xba\x1a\x6b\x80\xdb\x49\x22\xf0\xa5\xe2\
-\xcf\x92\x7a\xef\x34\x70\x3f\xf0\x4b\xb2\x79\xd7\x12\xbe\x9a\x35\
-\x13\x00\xcd\xc7\x26\xb2\x2f\xe0\x6e\xe0\x73\xe4\xca\x61\x49\x8b\
-\xef\x0c\xd9\xd8\xf7\x5b\xe0\x51\x32\xf5\x2f\xcd\x89\x09\x80\x16\
-\xc2\x46\xe0\x4e\xe0\x2e\x92\x0c\x8c\x54\x1b\x8e\xd4\x58\xa7\x80\
-\x3f\x01\x3b\x49\xdd\x8e\xe7\xaa\x0d\x47\xfd\xcc\x04\x40\x0b\x69\
-\x1d\xf0\xa9\xa2\x7d\x00\xf7\x08\x48\x0b\xe5\x24\xf0\x17\xd2\xf1\
-\x3f\x08\xfc\xbb\xda\x70\xd4\x04\x26\x00\x5a\x0c\xeb\x81\xcf\x92\
-\x53\x03\xef\xc3\x19\x01\xe9\x6a\x9d\x20\x6b\xfb\x7f\x06\x7e\x85\
-\x1d\xbf\x16\x90\x09\x80\x16\xd3\x3a\xe0\x0b\xc0\xe7\x81\x77\xe1\
-\xd5\xc3\xd2\x6c\xbd\x4a\xae\xec\xfe\x23\x70\x4f\xf1\x2e\x2d\x28\
-\x13\x00\xf5\xc2\x08\xf0\x19\x92\x0c\xdc\x4c\x12\x03\xeb\x08\x48\
-\x6f\x76\x94\x5c\xcc\x75\x3f\xb9\xb4\xe7\x70\xb5\xe1\xa8\xc9\x4c\
-\x00\xd4\x2b\x4b\xc8\x25\x43\x1f\x02\xbe\x0a\x7c\x84\x1c\x1f\x1c\
-\xaa\x32\x28\xa9\x06\x26\xc8\x54\xff\x1e\x32\xda\xdf\x49\x6e\xed\
-\x9b\xa8\x32\x28\x35\x9f\x09\x80\x7a\x6d\x80\x74\xfc\x5b\xc8\x8c\
-\xc0\x97\xc9\x71\x42\x6f\x1e\x54\xdb\x4c\x91\xa9\xfe\x3f\x90\x8e\
-\xff\x6f\x24\x11\xb0\xe3\x57\x4f\x98\x00\xa8\x4a\x6b\x80\x77\x90\
-\xbb\x06\xbe\x02\xbc\x17\x7f\x26\xd5\x0e\x07\xc8\x14\xff\x03\x64\
-\x7d\xff\x95\x6a\xc3\x51\x1b\xf9\x61\xab\x3a\x58\x05\xdc\x44\x8a\
-\x0a\x7d\x12\xf8\x28\xb0\xa2\xd2\x88\xa4\x85\x77\x11\xd8\x05\xfc\
-\x1e\x78\x9c\x24\x01\xaf\x56\x19\x90\xda\xcd\x04\x40\x75\x32\x48\
-\x4e\x0b\xdc\x0c\xbc\x87\x14\x16\xba\xa3\xd2\x88\xa4\xf9\xdb\x4f\
-\x8a\xf7\xfc\x15\x78\x0a\xf8\x07\x5e\xd2\xa3\x1a\x30\x01\x50\x5d\
-\xad\x24\xf7\x0d\xdc\x46\x92\x80\x0f\x02\x9b\x2b\x8d\x48\x9a\xbd\
-\xd7\x81\xdd\xc0\x63\xc0\xdf\x81\x27\x70\x9a\x5f\x35\x63\x02\xa0\
-\x7e\xb0\x99\x9c\x1e\xd8\x41\x66\x06\x6e\xc3\x25\x02\xd5\xcf\x34\
-\x19\xe1\xef\x03\x9e\x24\xd3\xfc\xfb\x2a\x8d\x48\xba\x02\x13\x00\
-\xf5\x9b\x1d\x64\xd3\xe0\x1d\xc0\x56\xe0\x46\x60\x59\xa5\x11\xa9\
-\xcd\xa6\xc8\x5a\xfe\x01\xd2\xf9\xef\x02\x1e\x02\xce\x56\x18\x93\
-\x34\x2b\x26\x00\xea\x57\x6b\x81\x0f\x93\x7d\x02\xb7\x92\x7b\x07\
-\x46\x80\xb7\x54\x19\x94\x5a\x61\x02\x38\x52\xb4\xa7\xc8\xa5\x3c\
-\x8f\x00\x2f\x55\x19\x94\x34\x57\x26\x00\x6a\x82\x6b\xc9\x12\xc1\
-\x27\x8a\xe7\x06\x72\xc4\x70\x65\x95\x41\xa9\x51\x2e\x02\xc7\xc9\
-\x3a\xfe\x1e\xb2\xa9\xef\x61\x5c\xd7\x57\x1f\x33\x01\x50\x93\x2c\
-\x27\xd5\x06\x6f\x27\x47\x09\xef\x02\x6e\x20\xfb\x05\xac\x38\xa8\
-\xb9\xba\x00\x9c\x21\xe5\x79\x77\x93\x0a\x7d\x0f\x01\xe3\xc5\xd7\
-\xa6\xab\x0b\x4d\x9a\x3f\x13\x00\x35\xd1\x00\x19\xfd\x0f\x03\xef\
-\x06\x3e\x06\xdc\x09\x6c\x23\x89\xc0\x52\xfc\xd9\xd7\xa5\x4d\x92\
-\xce\x7d\x3f\x59\xcf\xdf\x49\x2a\xf4\xbd\x01\x9c\xc2\x2a\x7d\x6a\
-\x10\x3f\x04\xd5\x06\x6f\x05\xae\x23\x97\x10\xdd\xca\xcc\x89\x82\
-\xad\x55\x06\xa5\x5a\x19\x27\x53\xfb\x8f\x92\x23\x7b\x87\xc9\x94\
-\xff\x6b\x38\xd2\x57\x43\x99\x00\xa8\x6d\x96\x91\x6b\x89\xd7\x91\
-\xe3\x85\xef\x04\xde\x4f\xea\x0c\xac\xad\x30\x2e\xf5\xd6\x39\x60\
-\x2f\x29\xce\xb3\x0f\x38\x48\xa6\xfa\x5f\x06\x4e\x56\x18\x97\xd4\
-\x33\x26\x00\x6a\xbb\x55\xc0\x28\xb9\x93\x60\x1b\x59\x32\xb8\x05\
-\xd8\x4e\x96\x10\xd4\x0c\xa7\xc9\x35\xbb\x4f\x03\xcf\x00\xcf\x03\
-\x2f\x90\x91\xfe\xd1\x0a\xe3\x92\x2a\x63\x02\x20\xfd\xaf\x51\x52\
-\x5b\x60\x94\x1c\x2b\x1c\x25\x1b\x09\x6f\x24\xf7\x15\x0c\x56\x17\
-\x9a\xe6\xe0\x65\x32\xaa\xdf\x5f\xb4\x43\xc0\x58\xc7\xbb\xd4\x7a\
-\x26\x00\xd2\x95\x0d\x93\xce\x7f\x0b\x99\x21\x28\x13\x83\x4d\x45\
-\x5b\x57\x5d\x68\x2a\x9c\x25\x9d\xfb\x8b\x64\x54\x7f\xa8\x68\x07\
-\x98\x19\xe9\x4b\xea\x62\x02\x20\xcd\xdd\x28\x59\x22\xd8\x4e\x92\
-\x82\xb7\x93\x4d\x86\xd7\x91\xfa\x03\x6f\xc3\x1a\x04\x8b\x61\x8a\
-\x6c\xca\x3b\x4e\x6a\xed\x8f\x93\xe9\xfb\x83\xc0\xb3\x64\x8a\xff\
-\x39\xac\xc2\x27\xcd\x8a\x09\x80\x34\x7f\xcb\xc9\x1e\x82\x51\xb2\
-\xb1\x70\x0b\x39\x61\x70\x3d\x29\x52\x34\x4c\xf6\x1a\x5c\x0b\x5c\
-\x53\x4d\x88\x7d\xe5\x3c\xd9\x88\x77\xaa\x78\x9e\x24\x1d\xfe\x18\
-\x19\xd1\x1f\x06\xfe\x43\x3a\xfc\xe3\x15\xc5\x28\xf5\x3d\x13\x00\
-\x69\xf1\xac\x22\x89\xc1\x4d\x64\x19\xa1\x5c\x4a\x58\x4f\x8a\x13\
-\x2d\x2f\xda\x50\xd1\xca\xf7\xa6\x2b\xcf\xda\x9f\xef\x78\x9e\x27\
-\x45\x77\x5e\x22\xd3\xf7\xfb\xc9\xc8\xfe\xf9\xe2\x79\xa2\x8a\x40\
-\xa5\x26\x33\x01\x90\x16\xdf\x00\xd9\x3c\xb8\xa4\x68\x83\x64\x89\
-\x60\x03\x33\x77\x18\x74\x3e\x37\x92\xbd\x05\x43\x1d\xff\xbe\x7c\
-\x76\xb7\xba\xfc\x0e\x4f\x92\x29\xfa\xee\x36\xd9\xd1\x4e\x93\xcd\
-\x79\x2f\x16\xed\x48\x47\x7b\x81\x94\xd5\xbd\xd0\xf1\xbd\x26\xf1\
-\x0c\xbe\xb4\x68\xea\xf2\xe1\x21\xb5\xd5\x00\xa9\x4c\xb8\x94\xd4\
-\x28\x28\xdf\x57\x90\x24\x60\x3d\xd9\x57\xb0\xba\xe3\xb9\x9a\x2c\
-\x2b\x94\x7f\x37\xdc\xf1\xb5\x25\x5d\xdf\x7b\x36\xef\xdd\x9d\xec\
-\x74\xd7\xb3\xfb\x7d\x92\x54\xc6\x3b\x41\xa6\xe6\xcb\xf7\x4b\xb5\
-\xd7\x49\xc7\xfe\x0a\x39\x7b\x3f\x41\xea\xea\x4f\x74\x35\x49\x3d\
-\x66\x02\x20\xd5\x5f\x67\x62\x70\xa5\xb6\x8c\xdc\x86\xb8\x8c\x2c\
-\x27\x5c\x43\x7e\xc7\x87\x8a\xbf\x1b\x2c\xbe\xbe\xb4\x78\x2f\x97\
-\x1e\x2e\x92\x8d\x73\xe5\xa8\xfb\x4c\xf1\x3e\x41\x3a\x6d\xc8\x14\
-\x7d\xd9\x81\x9f\x25\x23\xf5\xee\x4e\xfc\x72\xcd\x51\xbc\x54\x43\
-\x26\x00\x52\x7f\xe8\x9c\xf2\xef\x7e\xef\x5c\x62\x28\x13\x80\xb2\
-\x73\x1f\x20\x89\x40\x99\x00\xac\xe0\xd2\x09\xc0\x39\xd2\xf9\x4f\
-\xf0\xe6\x04\x60\x9a\x99\x75\xfa\x32\x59\x28\x3b\xf6\x72\xaa\xff\
-\x52\xef\xd3\xd8\xf9\x4b\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\
-\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\
-\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\
-\x92\x24\x49\x92\x24\x49\x92\x24\xa9\xce\xfe\x0b\xe9\x54\x70\x99\
-\x53\x18\x4d\xdb\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\
-\x00\x00\xf1\x36\
-\xff\
-\xd8\xff\xe1\x10\x85\x45\x78\x69\x66\x00\x00\x4d\x4d\x00\x2a\x00\
-\x00\x00\x08\x00\x0c\x01\x00\x00\x03\x00\x00\x00\x01\x05\xea\x00\
-\x00\x01\x01\x00\x03\x00\x00\x00\x01\x09\x81\x00\x00\x01\x02\x00\
-\x03\x00\x00\x00\x04\x00\x00\x00\x9e\x01\x06\x00\x03\x00\x00\x00\
-\x01\x00\x01\x00\x00\x01\x12\x00\x03\x00\x00\x00\x01\x00\x01\x00\
-\x00\x01\x15\x00\x03\x00\x00\x00\x01\x00\x04\x00\x00\x01\x1a\x00\
-\x05\x00\x00\x00\x01\x00\x00\x00\xa6\x01\x1b\x00\x05\x00\x00\x00\
-\x01\x00\x00\x00\xae\x01\x28\x00\x03\x00\x00\x00\x01\x00\x02\x00\
-\x00\x01\x31\x00\x02\x00\x00\x00\x1f\x00\x00\x00\xb6\x01\x32\x00\
-\x02\x00\x00\x00\x14\x00\x00\x00\xd5\x87\x69\x00\x04\x00\x00\x00\
-\x01\x00\x00\x00\xec\x00\x00\x01\x24\x00\x08\x00\x08\x00\x08\x00\
-\x08\x00\x2d\xc6\xc0\x00\x00\x27\x10\x00\x2d\xc6\xc0\x00\x00\x27\
-\x10\x41\x64\x6f\x62\x65\x20\x50\x68\x6f\x74\x6f\x73\x68\x6f\x70\
-\x20\x32\x33\x2e\x35\x20\x28\x57\x69\x6e\x64\x6f\x77\x73\x29\x00\
-\x32\x30\x32\x34\x3a\x30\x34\x3a\x30\x39\x20\x31\x35\x3a\x31\x34\
-\x3a\x31\x34\x00\x00\x00\x00\x00\x04\x90\x00\x00\x07\x00\x00\x00\
-\x04\x30\x32\x33\x31\xa0\x01\x00\x03\x00\x00\x00\x01\xff\xff\x00\
-\x00\xa0\x02\x00\x04\x00\x00\x00\x01\x00\x00\x01\xbe\xa0\x03\x00\
-\x04\x00\x00\x00\x01\x00\x00\x01\xbe\x00\x00\x00\x00\x00\x00\x00\
-\x06\x01\x03\x00\x03\x00\x00\x00\x01\x00\x06\x00\x00\x01\x1a\x00\
-\x05\x00\x00\x00\x01\x00\x00\x01\x72\x01\x1b\x00\x05\x00\x00\x00\
-\x01\x00\x00\x01\x7a\x01\x28\x00\x03\x00\x00\x00\x01\x00\x02\x00\
-\x00\x02\x01\x00\x04\x00\x00\x00\x01\x00\x00\x01\x82\x02\x02\x00\
-\x04\x00\x00\x00\x01\x00\x00\x0e\xfb\x00\x00\x00\x00\x00\x00\x00\
-\x48\x00\x00\x00\x01\x00\x00\x00\x48\x00\x00\x00\x01\xff\xd8\xff\
-\xed\x00\x0c\x41\x64\x6f\x62\x65\x5f\x43\x4d\x00\x01\xff\xee\x00\
-\x0e\x41\x64\x6f\x62\x65\x00\x64\x80\x00\x00\x00\x01\xff\xdb\x00\
-\x84\x00\x0c\x08\x08\x08\x09\x08\x0c\x09\x09\x0c\x11\x0b\x0a\x0b\
-\x11\x15\x0f\x0c\x0c\x0f\x15\x18\x13\x13\x15\x13\x13\x18\x11\x0c\
-\x0c\x0c\x0c\x0c\x0c\x11\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\
-\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\
-\x0c\x0c\x01\x0d\x0b\x0b\x0d\x0e\x0d\x10\x0e\x0e\x10\x14\x0e\x0e\
-\x0e\x14\x14\x0e\x0e\x0e\x0e\x14\x11\x0c\x0c\x0c\x0c\x0c\x11\x11\
-\x0c\x0c\x0c\x0c\x0c\x0c\x11\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\
-\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\
-\x0c\x0c\x0c\xff\xc0\x00\x11\x08\x00\x6b\x00\x6b\x03\x01\x22\x00\
-\x02\x11\x01\x03\x11\x01\xff\xdd\x00\x04\x00\x07\xff\xc4\x01\x3f\
-\x00\x00\x01\x05\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\
-\x00\x03\x00\x01\x02\x04\x05\x06\x07\x08\x09\x0a\x0b\x01\x00\x01\
-\x05\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x01\x00\
-\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x10\x00\x01\x04\x01\x03\
-\x02\x04\x02\x05\x07\x06\x08\x05\x03\x0c\x33\x01\x00\x02\x11\x03\
-\x04\x21\x12\x31\x05\x41\x51\x61\x13\x22\x71\x81\x32\x06\x14\x91\
-\xa1\xb1\x42\x23\x24\x15\x52\xc1\x62\x33\x34\x72\x82\xd1\x43\x07\
-\x25\x92\x53\xf0\xe1\xf1\x63\x73\x35\x16\xa2\xb2\x83\x26\x44\x93\
-\x54\x64\x45\xc2\xa3\x74\x36\x17\xd2\x55\xe2\x65\xf2\xb3\x84\xc3\
-\xd3\x75\xe3\xf3\x46\x27\x94\xa4\x85\xb4\x95\xc4\xd4\xe4\xf4\xa5\
-\xb5\xc5\xd5\xe5\xf5\x56\x66\x76\x86\x96\xa6\xb6\xc6\xd6\xe6\xf6\
-\x37\x47\x57\x67\x77\x87\x97\xa7\xb7\xc7\xd7\xe7\xf7\x11\x00\x02\
-\x02\x01\x02\x04\x04\x03\x04\x05\x06\x07\x07\x06\x05\x35\x01\x00\
-\x02\x11\x03\x21\x31\x12\x04\x41\x51\x61\x71\x22\x13\x05\x32\x81\
-\x91\x14\xa1\xb1\x42\x23\xc1\x52\xd1\xf0\x33\x24\x62\xe1\x72\x82\
-\x92\x43\x53\x15\x63\x73\x34\xf1\x25\x06\x16\xa2\xb2\x83\x07\x26\
-\x35\xc2\xd2\x44\x93\x54\xa3\x17\x64\x45\x55\x36\x74\x65\xe2\xf2\
-\xb3\x84\xc3\xd3\x75\xe3\xf3\x46\x94\xa4\x85\xb4\x95\xc4\xd4\xe4\
-\xf4\xa5\xb5\xc5\xd5\xe5\xf5\x56\x66\x76\x86\x96\xa6\xb6\xc6\xd6\
-\xe6\xf6\x27\x37\x47\x57\x67\x77\x87\x97\xa7\xb7\xc7\xff\xda\x00\
-\x0c\x03\x01\x00\x02\x11\x03\x11\x00\x3f\x00\xf5\x2a\x6b\xaa\xba\
-\x99\x5d\x2d\x6b\x29\x63\x43\x6b\x63\x00\x0d\x0d\x02\x18\xd6\x35\
-\xbe\xd6\xb1\xad\x4f\x65\x95\xd5\x5b\xad\xb5\xc1\x95\xb0\x17\x3d\
-\xee\x30\xd6\xb4\x09\x73\x9c\xe7\x7d\x16\xb5\x54\xb7\x33\x1b\xa7\
-\x53\x4e\x3b\xdc\xeb\x6e\x2d\x0d\xa6\x86\x0d\xd6\xd9\xb4\x6d\xf6\
-\x56\x3f\xe9\xda\xff\x00\xd0\xd5\xfe\x16\xca\xd0\x99\x83\x91\x9b\
-\x63\x32\x7a\xa4\x06\x30\x87\xd1\x80\xd3\x35\xb1\xc0\xee\x65\xb9\
-\x2f\xff\x00\xb5\x59\x0d\x8d\xed\xff\x00\xb4\xd8\xef\xfe\x6b\xd6\
-\xb6\xaf\xb5\xa4\xa4\x4e\x65\x9d\x75\x8e\x65\x8c\x75\x3d\x21\xda\
-\x16\x38\x16\xbf\x29\xbd\xc3\xda\x7d\xf4\xe0\x3b\xfd\x1b\xbf\x4d\
-\x9b\xf9\xfe\x96\x1f\xf4\xd3\x75\x0e\x96\xc7\x8a\xf2\xb0\xab\xaa\
-\xbe\xa1\x86\x07\xd9\x6c\x2d\x03\xd8\x3e\x9e\x19\xb3\x6e\xfa\xf1\
-\xb2\x19\xfa\x2f\x67\xf3\x5f\xcf\x7a\x7f\xa2\x5a\x29\x24\xa6\xb7\
-\x4f\xea\x14\x75\x0c\x7f\x5e\x9d\xcd\x21\xc5\x96\xd4\xf1\x16\x57\
-\x63\x74\xb6\x8b\xd8\x0b\xb6\xdb\x5b\xbf\xf4\xa5\x7b\xea\xf7\xab\
-\x2b\x33\xa8\x60\x5d\x55\xee\xea\xbd\x34\xb5\x99\xa1\xb1\x7d\x4f\
-\x3b\x6a\xc8\x63\x78\xaf\x21\xdf\xe0\xee\x63\x7f\xa3\xe5\xff\x00\
-\x80\xff\x00\x09\xea\xd1\xfa\x25\x67\xa6\x75\x1c\x6e\xa7\x83\x56\
-\x76\x29\x3e\x95\xc2\x5b\xb8\x41\x11\xa1\xfd\xe6\x3b\xfe\x32\xa7\
-\xd9\x4d\xbf\xce\xd1\x65\xb4\xfe\x91\x25\x36\x95\x1e\xb0\xc7\x0c\
-\x41\x95\x5c\x9b\x70\x5e\x32\x5a\x06\xa4\x86\x4f\xaf\x53\x7f\x95\
-\x7e\x2b\xaf\xa5\xbf\xf1\x8a\xf2\x64\x94\xb3\x5c\xd7\xb4\x3d\x84\
-\x39\xae\x00\xb4\x8e\x08\x3d\xd4\x95\x2e\x90\x76\xe0\xb2\x82\x7d\
-\xd8\xa5\xd8\xe4\x77\xfd\x11\x35\x57\x3f\xd7\xa9\xb5\xd8\xae\xa4\
-\xa6\x2f\x6b\x5e\xc7\x31\xe2\x5a\xe0\x43\x81\xee\x0a\x06\x03\x9c\
-\x71\xc5\x56\x12\x6c\xa0\x9a\x9e\x4e\xa4\xec\xd1\x8f\x77\xfc\x6d\
-\x7b\x2d\xff\x00\xae\x2b\x0b\x27\xa8\x75\x7c\x2e\x91\x9c\x1b\x71\
-\x7d\x96\x66\xb3\x75\x58\xb4\x56\xfb\xae\x73\xaa\x1f\xa4\xb1\x98\
-\xf4\x35\xf6\x6d\xf4\x76\xfe\x93\xe8\x7e\x85\x25\x3a\xcb\x37\xec\
-\xc2\x7e\xcd\xb3\xf4\x7f\x6a\xfa\x51\xaf\xa7\x1f\xb4\x36\x7f\xc5\
-\xfa\xff\x00\xa2\x57\xe8\xbe\x9c\x8a\x6b\xc8\xa1\xed\xb6\x9b\x9a\
-\x1f\x5d\x8d\x32\xd7\x35\xc3\x73\x1e\xd7\x7e\xeb\x9a\xa6\x92\x9f\
-\xff\xd0\xf4\x16\x62\x67\x61\x5d\x7d\xb8\x98\xf8\xb7\x0c\x87\xba\
-\xc7\x99\x7d\x36\x12\x4f\xb4\x3e\xc2\xdc\xbf\x59\xdf\x9b\xfe\x06\
-\xbf\xf8\xb4\x5f\xda\xbe\x90\x1f\x6b\xc4\xc8\xc7\xd3\xe9\x6c\xf5\
-\x9b\xfe\x76\x19\xc8\xdb\xff\x00\x5d\x6d\x6a\xce\x2b\x72\x1b\x8b\
-\x4b\x72\x9e\xdb\x32\x43\x1a\x2f\x7b\x06\xd6\xba\xc0\x07\xaa\xf6\
-\x33\xf3\x58\xe7\xfd\x14\x54\x94\x83\x1b\xa8\x60\x65\x92\x31\xb2\
-\x2b\xb9\xc3\x96\xb1\xe0\xb8\x7f\x59\xa0\xee\x6a\xb0\xab\xe5\x60\
-\x60\xe6\x00\xdc\xcc\x7a\xb2\x03\x75\x68\xb5\x8d\x7c\x47\x86\xf0\
-\x50\x47\x46\xc2\x68\x8a\x8d\xd5\x0e\xcd\xae\xfb\x9a\xd1\x1f\xbb\
-\x5b\x6d\xf4\xff\x00\xe8\x24\xa5\xbe\xcd\x7e\x6b\x9c\xec\xdf\x6e\
-\x29\xd2\xbc\x31\xc3\x87\xef\x66\x3b\xfc\x26\xff\x00\xfb\x8b\xfc\
-\xc7\xfa\x6f\x5f\xfc\x15\xe1\x03\x85\x48\x74\xeb\xd9\xfc\xd6\x7e\
-\x4b\x47\x66\xbb\xd2\x78\xfb\xed\xa5\xf6\x7f\xe0\x89\xb6\x75\xaa\
-\xa3\x6d\xb8\xf9\x20\x72\xd7\xb1\xf4\xb8\xff\x00\xd7\x98\xec\x96\
-\x7f\xec\xb2\x4a\x6f\xa6\x54\x4f\x51\xc8\xa8\x7e\xb5\x85\x73\x00\
-\xd0\xd9\x4c\x5e\xcf\xec\xb6\x93\xf6\xa7\x7f\xec\x2a\x2e\x3f\x53\
-\xe9\xf9\x4e\xf4\xe8\xc8\x63\xed\xef\x54\xc5\x83\xfa\xf4\xbf\x6d\
-\xac\xfe\xdb\x12\x53\x06\xfe\x83\xaa\x39\xa3\xe8\x66\x57\xbe\x3f\
-\xe1\x29\xdb\x5b\xdd\xfd\x6b\x69\xb2\xaf\xfd\x86\x57\x16\x7f\x5d\
-\xc5\xcf\xc8\xc0\x2f\xe9\x6e\x65\x7d\x4b\x1d\xc2\xec\x47\x58\x25\
-\x85\xed\xfa\x74\xda\x01\x6f\xe8\xf2\x68\x75\xb8\xcf\xff\x00\x47\
-\xea\xfa\xbf\x4d\x89\xf2\xfa\x3d\x59\xd7\xb9\xd9\xb7\x5b\x91\x88\
-\x40\x03\x01\xc5\xa3\x1e\x44\x7b\xad\x65\x6c\x65\xb9\x3b\xa3\xf9\
-\xac\xab\xae\xc6\xff\x00\x80\x49\x4d\x6f\xda\x19\x5d\x60\xec\xe8\
-\xf6\x7a\x38\x20\xc5\x9d\x52\x03\xb7\xc7\xe6\x74\xca\xec\x0f\xaa\
-\xff\x00\xfc\x3b\x6b\x1f\x87\xfe\x86\xbc\xdf\xd2\xfd\x9e\xcd\x1d\
-\x1f\x1b\x0e\xb1\xf6\x21\xb2\xe3\x63\x2c\xb6\xfb\x0b\xac\xb2\xc8\
-\xf6\x3f\xed\x17\xd8\xe7\x5d\x73\xbd\x07\xd9\x5d\x7b\xdf\xfa\x3f\
-\xea\x2b\xc0\x00\x00\x02\x00\xd0\x00\x9d\x25\x38\xb6\x03\xd0\x32\
-\x6f\xcb\x1b\x9d\xd1\xb2\x5c\x6d\xc8\xad\xad\x2f\x38\xb7\x38\xee\
-\xb7\x29\x8c\x66\xe7\x7d\x87\x27\xf9\xcc\xaf\x4d\xbf\xaa\xe4\xfe\
-\xb7\xfc\xc6\x46\x5d\xb8\xda\x1f\xb5\x3a\x67\xfd\xcc\xa3\xf9\x8f\
-\xb5\xff\x00\x38\xcf\xe8\xff\x00\xf7\x33\xe9\x7f\x45\xff\x00\xbb\
-\x1f\xcd\x23\xdd\x75\x54\x56\xeb\x6e\x78\xae\xb6\xfd\x27\x38\xc0\
-\x1d\x96\x27\xec\x7a\x7d\x4d\xdf\xb3\xe9\xf4\xbe\xd3\xf6\xcf\x47\
-\x6b\xa3\x6e\xcf\x4f\x6e\xdf\x53\xd0\xfb\x4f\xda\xbf\x5e\xf4\xbd\
-\x1f\xb3\x7a\x9f\xa5\xf4\xbf\x68\x7e\xbc\x92\x9f\xff\xd1\xf5\x44\
-\x94\x29\x6d\x2c\xa9\xb5\xd0\x1a\x2b\xac\x6c\x6b\x5b\x10\xd0\xdf\
-\x66\xcd\x3f\x73\x6e\xd5\x34\x94\xa4\x92\x49\x25\x29\x24\x92\x49\
-\x4a\x42\xc9\xc4\xc4\xcb\x67\xa7\x95\x4d\x79\x0c\x06\x43\x6d\x6b\
-\x5e\x27\xe0\xf0\xe4\x54\x92\x53\x47\xf6\x46\x3b\x00\x18\xf6\xdf\
-\x8d\x1f\x44\x57\x6b\x8b\x47\xf5\x69\xb8\xdb\x47\xfe\x04\xb2\x7a\
-\xc7\x4a\xea\xf8\x99\x23\xad\x74\xce\xa5\x6b\xf3\x76\x57\x8a\x70\
-\xf2\x43\x0e\x35\xc1\xd6\x6d\xa9\xb7\x32\xa1\x8d\xe9\x58\xcb\x72\
-\x37\x7d\xa6\xaf\xd2\xb2\xbf\xf0\x76\x7f\x37\x6f\x48\xaa\x64\xfe\
-\x97\x37\x16\x8d\x36\xd7\xbb\x22\xc0\x44\xfd\x01\xe9\xd4\xdf\xe4\
-\xfe\x96\xdf\x55\xbf\xf1\x09\x29\x8b\xb3\x33\x69\x23\xed\x18\x6e\
-\x7b\x3b\xd9\x8c\xe1\x60\x03\xc5\xd5\x3f\xd1\xc8\xfe\xc5\x15\xe4\
-\x25\xfb\x63\xa7\x9c\x7a\xf2\x2b\xb7\xd5\x17\x17\x36\x9a\xeb\x05\
-\xd6\x3d\xec\xd2\xca\x9b\x44\x7a\xbe\xa5\x4e\x6f\xe9\xd8\xf6\xfe\
-\x83\xfc\x3f\xa6\xae\xac\xae\x85\x8d\x43\xfe\xd3\xd6\x03\x5a\x6d\
-\xea\xb6\x9b\xc5\x80\x73\x48\x6b\x31\xf0\xb6\xff\x00\x25\xf8\x94\
-\x51\x77\xfc\x65\x89\x29\xce\xe9\xbd\x43\x3b\x3b\x32\xdc\x9e\xbb\
-\xd2\xb2\xf0\x5d\x84\xe1\xf6\x6a\x36\x8c\x8a\x1a\x63\xfa\x45\x76\
-\x62\xef\xb3\x2f\x29\xdb\xbf\x9c\xf4\x7d\x1c\x6a\xff\x00\x47\x47\
-\xe9\x3e\xd3\x6d\xba\xff\x00\xb7\xba\x4c\x7f\x48\x1c\x71\xb5\xd3\
-\x3f\xe8\xa3\x6f\xf4\x8f\xfb\xad\xfd\x23\xfe\x09\x5f\x49\x25\x3f\
-\xff\xd2\xf4\x9b\xba\x47\x4d\xb6\xc3\x73\xa8\x6b\x2e\x71\x93\x75\
-\x53\x55\x84\xff\x00\xc7\x50\x6b\xb7\xfe\x9a\x81\xc0\xcb\xac\x7e\
-\xab\x9d\x63\x75\xd1\x97\x86\xdc\xc0\x3e\x2e\xf4\xf2\x5d\xff\x00\
-\xb1\x4a\xfa\x64\x94\xd1\xf5\x3a\xcd\x5f\x4e\x9a\x32\x9b\x3a\xba\
-\xb7\xba\x97\x47\xf2\x69\xb5\xb7\x33\xff\x00\x66\x92\x1d\x54\x34\
-\xc6\x46\x26\x4e\x39\xf3\xaf\xd5\x1f\xe7\x61\x3b\x29\xbf\xe7\x2b\
-\xc9\x24\xa6\xad\x5d\x57\xa6\x5c\xe0\xca\xf2\xaa\x36\x1f\xf0\x7b\
-\xc0\x7f\xc0\xd4\xe3\xea\x37\xfc\xd5\x69\x42\xda\x29\xbd\xbb\x2e\
-\xad\xb6\xb7\xf7\x5e\xd0\xe1\xff\x00\x49\x55\x3d\x17\xa6\x0f\xe6\
-\xe8\x14\x7f\xe1\x77\x3a\x8f\xfd\xb6\x75\x49\x29\xba\x92\xa6\x3a\
-\x73\x98\xe9\xa7\x2f\x22\xb1\xfb\xa5\xe2\xd1\xff\x00\xb3\x4c\xbd\
-\xff\x00\xf4\x91\x6a\xab\x31\x84\xef\xbd\xb6\x37\xb6\xea\xe1\xdf\
-\xe7\x31\xed\x6f\xfe\x06\x92\x93\xaa\xb8\x6e\x17\x3e\xec\xa1\xf4\
-\x6c\x77\xa7\x59\x99\x96\x55\x2c\x0e\xfe\xd5\xa6\xe7\x7f\x51\x4f\
-\x2a\xbc\xab\x69\x35\x50\xf6\xd4\x5f\xed\x7d\xba\xee\x6b\x4f\xd3\
-\x35\x06\xed\xfd\x2f\xfa\x37\x6e\xf6\x23\x31\x8c\xad\x8d\xad\x83\
-\x6b\x18\x03\x5a\xd1\xc0\x03\x40\x12\x53\x9d\xf5\x89\xef\xfd\x93\
-\x76\x3d\x4e\xd9\x76\x69\x6e\x1d\x4e\x1a\x16\xbb\x21\xc3\x1b\xd5\
-\x6c\x7f\xa0\x65\x8f\xbf\xfe\xb4\xb4\x2b\xae\xba\xab\x6d\x55\xb4\
-\x32\xba\xc0\x6b\x1a\x34\x00\x01\xb5\xad\x0b\x3f\x28\xfd\xa3\xae\
-\x61\x63\x72\xdc\x46\x59\x99\x67\x93\xc8\xfb\x16\x2b\x5d\xff\x00\
-\x18\xcb\xf3\x5f\xff\x00\xa0\xeb\x49\x25\x2e\x92\x49\x24\xa7\xff\
-\xd3\xf5\x54\x96\x2e\x2f\xd5\xfc\x77\x59\x93\x95\x7e\x66\x6e\x5b\
-\x33\x6d\x37\xd7\x55\xd9\x17\x31\xb5\x35\xe2\x7e\xcf\x55\x15\xbe\
-\x86\xb2\xa6\xee\xf6\xb2\xca\xf7\xb3\xe8\x7e\x62\x3f\xfc\xdb\xe8\
-\x45\xdb\xac\xc2\xaa\xf7\x7e\xf5\xe3\xd6\x3f\xe7\x64\xfa\xa9\x29\
-\x9d\xfd\x7b\xa3\x51\x67\xa2\xfc\xca\x9d\x7f\x02\x8a\xdd\xea\x5a\
-\x7f\xab\x8f\x4f\xa9\x7b\xbf\xed\xb5\x01\xd5\x33\x72\x74\xc0\xc0\
-\xb4\xb7\xb5\xd9\x73\x8b\x5f\xfd\xb6\xf6\xd9\x9d\xfe\x76\x1b\x19\
-\xff\x00\x08\xaf\x51\x8d\x8f\x8d\x58\xab\x1a\xa6\x53\x58\xe1\x95\
-\xb4\x35\xbf\xe6\xb2\x11\x12\x53\x99\xfb\x2f\x3b\x24\xee\xea\x39\
-\xf6\x39\xbf\xf7\x1f\x10\x1c\x5a\xfe\x76\x31\xf6\x67\x3b\xff\x00\
-\x63\x19\x53\xff\x00\xd0\xa0\x74\x3c\x1c\x5c\x2e\xa9\xd5\xaa\xc4\
-\xad\xb5\x52\x1f\x40\xda\xd0\x07\xbb\xd1\x6b\x9e\xe7\xbb\xe9\x58\
-\xf7\x6e\x63\x9d\x65\x9e\xf5\xb4\xb3\x3a\x29\x16\xdb\xd4\xf2\xda\
-\x3d\x97\xe6\xbd\xac\xff\x00\xd0\x76\x53\xd3\xac\xff\x00\xc1\xf1\
-\x2e\x49\x4e\x91\x20\x02\x49\x80\x35\x24\xf1\x0b\x36\x8e\xb4\xec\
-\x8d\xf7\xe3\xe1\x5f\x76\x0b\x4c\x33\x25\xa0\x03\x67\x73\x75\x14\
-\x58\x59\x65\xd8\x9a\xfe\x8f\x21\x9f\xcf\xff\x00\x80\xaa\xda\x76\
-\x5c\xa5\xd4\x18\xcc\xfc\x96\xf4\xa7\xb7\xd4\xc5\x2c\x36\x67\x37\
-\xb3\x9b\x3b\x68\xc6\x7f\xf2\x6f\x7e\xf7\xd9\x5f\xe7\xd5\x4f\xfa\
-\x3b\x16\x8a\x4a\x73\xac\xc5\xe9\x5d\x6a\xba\xf2\xd8\xf7\x39\xd5\
-\xef\x65\x79\x14\x5b\x65\x36\x30\xce\xdb\xaa\x73\xe8\x7d\x56\xb5\
-\xcd\xb1\x9f\xa5\xc7\xbb\xfc\x23\x3f\x4b\x5a\xcb\xcf\x7f\x5e\xfa\
-\xb7\x53\xb3\xdb\x91\x67\x5b\xe9\x54\x80\x72\xb1\xae\x6b\x06\x5d\
-\x55\x83\xfa\x5c\x9c\x6c\x8a\x19\x4b\x32\xbd\x36\x7b\xdf\x46\x4d\
-\x5e\xa7\xe8\xff\x00\xa5\x2d\x0c\xae\x87\x6d\x9d\x55\x9d\x4b\x0f\
-\x3a\xec\x12\x5d\x59\xcc\xc7\xac\x30\xd5\x90\x2b\x3a\x7a\xcd\x7b\
-\x0b\x9b\x6b\xaa\xfd\x5d\xf7\xb1\xde\xa7\xa0\xca\x6b\xff\x00\x03\
-\x5a\x0e\x6f\x45\xcd\xab\x2a\xcc\xde\x9d\x9b\x99\x53\x6e\xd6\xdc\
-\x6a\xec\x63\xda\xd7\x49\x77\xab\x8b\x4e\x7d\x79\x18\xed\xdf\x3f\
-\xa6\xa3\xf4\x3f\xe9\x29\xb2\xab\x3f\x9e\x4a\x43\x8a\xee\xa5\x97\
-\xd7\x73\x3a\xb6\x0d\xed\x7e\x0d\x4c\xaf\x09\xd8\x4e\x64\x1b\x8d\
-\x6d\xfb\x57\xda\x2b\xca\x71\xdd\x45\xb4\x5b\x9b\x6e\x2f\xa0\xfa\
-\xf6\x7a\xb5\x5d\x5d\xde\x95\x9e\xfa\xb6\x71\xb3\xf1\xf2\x1e\x6a\
-\x04\xd7\x90\xc1\x2f\xc7\xb0\x6d\xb1\xa3\xf7\xb6\x7e\x7d\x7f\xf0\
-\xd5\x7a\x94\xfe\xe5\x8b\x9b\xa9\x9f\x58\x71\x32\xeb\xea\x78\x5e\
-\x87\x53\xc2\x63\x2d\xab\x33\x13\x1b\x7e\x2d\x8e\x73\xec\x6e\x43\
-\xef\x6f\x4f\xbe\xcb\x70\xff\x00\x68\xd5\x6f\xda\x5f\x7b\xdf\x6e\
-\x2d\x99\x3e\xbe\xcf\xf4\x4b\x6f\x1a\xdc\x3e\xb7\x8a\xdb\x6e\xc5\
-\xb2\xb0\xd3\x2c\x17\x00\x1e\xd2\x44\xfa\x94\x5f\x43\xec\x66\xed\
-\x7e\x9e\x3d\xfb\xeb\x7f\xe8\xff\x00\x9c\x49\x4e\x92\x4a\x87\xd9\
-\xba\x96\x37\xf4\x4c\x81\x91\x58\xe2\x8c\xa9\x91\x1f\x9a\xcc\xca\
-\xc1\xb7\xff\x00\x62\x29\xcb\xb1\x2f\xb6\x75\x4e\x3f\x67\xeb\xf4\
-\x67\xd6\x64\x6e\xfd\xfe\x3f\xa3\x7f\xc2\x7f\x49\xdf\xff\x00\x68\
-\xf6\x7e\x91\x25\x3f\xff\xd4\xf5\x54\x94\x58\xf6\x58\xc6\xd9\x5b\
-\x83\xd8\xf0\x1c\xd7\x34\xc8\x20\xea\xd7\x35\xc1\x49\x25\x29\x24\
-\xc4\x86\x82\xe7\x18\x03\x52\x4f\x00\x2e\x74\x7d\x72\xc5\xc9\xc9\
-\xb7\x1b\x0b\xd2\xaf\xd2\x8d\xb6\xe7\xbd\xf8\x8c\xb4\x49\x6f\xa9\
-\x86\xe7\xd1\x6f\xda\x6b\xdd\xfc\xb6\x24\xa7\xa1\x71\x21\xa4\x81\
-\xb8\x80\x48\x68\xee\x7c\x35\x59\x7d\x2c\x3b\xa5\x74\x0c\x36\x65\
-\x33\x66\x57\xa4\xcf\x56\x99\x05\xcf\xca\xb7\xf4\x97\xb0\x39\xa7\
-\x63\xed\xbb\x2e\xcb\x3d\xff\x00\x43\xfc\x27\xf3\x6a\x55\xbb\xeb\
-\x05\xac\xdc\xd7\xe0\xc3\x81\xda\xe6\x8b\x1e\x27\x5f\xe5\x57\xb9\
-\x4b\xed\x0d\x77\x57\xc5\xc2\xbd\xc0\xe5\x57\x8a\xfc\x82\xd6\x82\
-\xd6\x13\xba\xac\x77\x5b\x5e\xe2\x7e\x8e\xfb\x19\xf4\x9f\xe9\xb2\
-\xdf\xd2\x7f\x39\x5a\x4a\x6c\xe0\xe3\x3e\x9a\xdc\xfb\x8b\x5d\x93\
-\x7b\xbd\x4c\x87\x36\x76\x97\x40\x60\x6b\x37\x7e\x65\x55\xb1\x95\
-\x33\xfa\x9b\xfe\x9a\xb2\x92\x49\x29\x49\x24\x92\x4a\x73\x7a\x85\
-\x37\x62\xdb\xfb\x53\x0d\xa5\xef\x6c\x0c\xcc\x76\x89\xf5\xaa\x1c\
-\xbd\x8d\x1f\xf6\xb3\x19\xbe\xfa\x3f\xd3\xb3\xf5\x4f\xf0\x94\xdb\
-\x8f\x13\x4d\x95\xb8\x75\x3e\x8e\xe6\xdf\x4e\x48\x16\xdd\x8c\x1c\
-\x3d\x3b\x83\x86\xe6\xe4\x62\xd9\xfc\xdd\x59\x2f\x6f\xbb\xfe\xe3\
-\xe5\xff\x00\x86\xf4\xbf\xa5\x55\xa8\xb2\xaf\xdd\xd1\xee\x19\x15\
-\x88\xe9\x76\xb8\xfd\xad\x9d\xa8\x73\x8e\xef\xb6\xd7\xfb\x98\xce\
-\x7f\xf4\xe6\x7f\x37\x5f\xf4\xdf\xd1\x7e\xb9\xeb\x25\x37\x70\x73\
-\xb1\xb3\xa9\xf5\xb1\xdc\x61\xae\x2c\xb1\x8e\x05\xaf\x63\xc7\xd2\
-\xaa\xea\x9f\x0f\xae\xc6\xfe\xeb\xbf\xea\x15\x85\x47\x37\xa6\x9b\
-\xad\x19\x78\x96\x7d\x97\x3d\xad\xda\xdb\xa3\x73\x5e\xd0\x77\x0a\
-\x72\xe9\xdc\xcf\xb4\x53\xfd\xaf\x5a\x9f\xd2\x7d\x9e\xea\x7d\x4b\
-\x10\x3f\x68\x75\xae\x3f\x67\x37\x7f\xf3\x51\xea\x98\xf5\xbe\x97\
-\xa9\xbf\xd1\xdb\xfb\x3b\xd2\xf7\xfd\xab\xfa\x4f\xa9\xfa\xbf\xd8\
-\x7d\x54\x94\xff\x00\xff\xd5\xf4\xa3\x9f\x89\x41\x35\xdd\x38\xad\
-\x61\xda\xd3\x63\x76\x57\x03\x46\xec\xb7\xf9\x8f\xea\xb7\x7a\xb4\
-\xd7\x35\xed\x0e\x61\x0e\x69\xd4\x38\x19\x05\x23\xc2\xc1\xa7\xd2\
-\xf5\xee\x9f\x4b\xd5\x9f\xd1\xfe\xcc\xf5\x37\xce\xbf\xd2\xb6\xfe\
-\xad\xbb\xff\x00\x0c\xfb\x12\x53\x7f\xab\x9f\x5b\xec\xfd\x38\x6b\
-\xf6\xdb\x36\xda\x3f\xe0\x2b\x1e\xae\x4e\xef\xf8\x3b\x76\xb3\x11\
-\xdf\xf8\x65\x5e\xb2\xb6\x58\xc7\x57\x63\x43\xd8\xe1\x0e\x6b\x84\
-\x82\x0f\x67\x34\xac\xba\x7d\x4f\xdb\x74\x7a\xbe\xa6\xef\xb1\x59\
-\x1e\xbe\xcd\xdf\xce\xd3\xbf\xd1\xfb\x37\xe8\xbf\xd1\xfd\xb3\x77\
-\xfd\xd1\xfb\x3f\xfd\xaa\x5a\xc9\x29\xc9\x3f\x56\xba\x75\x4f\x36\
-\xf4\xcd\xdd\x2a\xe3\xa9\x76\x19\x15\xb1\xc7\xc6\xdc\x32\xd7\xe1\
-\x5d\xfd\x7b\x71\xfd\x45\x43\xac\xd5\xd6\xfd\x06\xbb\x27\x18\x64\
-\xbf\x15\xde\xb6\x2f\x51\xc0\xd7\x22\x97\xb4\x7f\x38\xee\x99\x7b\
-\x99\xeb\x52\xf6\x6e\xab\x27\x1f\x17\x3a\xeb\x72\xa8\x7d\x94\x7a\
-\x0b\xa5\x49\x25\x38\xff\x00\x56\xbe\xb3\x74\xcf\xac\x58\x6e\xbf\
-\x0a\xe6\x59\x6d\x07\xd3\xca\xad\x84\xfb\x1f\xfb\xcc\xf5\x5b\x55\
-\x8f\xc7\xbb\x6e\xfc\x6b\x9d\x5b\x3d\x46\x7f\xa3\xba\xbb\xa9\xab\
-\x61\x72\xfd\x5f\x7f\xfc\xf8\xe8\xfb\x3d\x59\xfb\x3d\xdf\xd1\x36\
-\x6f\x8d\xcc\xdd\xfb\x57\xd5\xff\x00\xbc\xdd\x9b\xfe\xcf\xff\x00\
-\x76\xbd\x5f\x4b\xf5\x8f\x45\x75\x09\x29\x49\x24\x92\x4a\x52\x62\
-\x01\x10\x75\x07\x90\x9d\x24\x94\xe5\xd3\xbf\xa4\xe4\x37\x19\xc6\
-\x7a\x65\xee\x0d\xc5\x71\xff\x00\x01\x63\x8e\xd6\xe1\xb9\xdf\xf7\
-\x1a\xe7\x7f\x42\xff\x00\x45\x6f\xea\x5f\x9f\x85\x4a\xd4\x55\x3a\
-\xb7\xfc\x97\x99\x3e\x87\xf3\x16\x7f\x4a\xfe\x8f\xf4\x5d\xfd\x2b\
-\xfe\xeb\xff\x00\xa6\xff\x00\x83\x59\xbf\xa0\xf4\xff\x00\xef\x4b\
-\x77\xa1\xff\x00\x0d\xbb\xec\xde\xa7\xfd\xb7\xeb\xfa\x7f\xfd\x51\
-\xfa\x1f\xf7\x65\x25\x3f\xff\xd9\xff\xed\x17\xb4\x50\x68\x6f\x74\
-\x6f\x73\x68\x6f\x70\x20\x33\x2e\x30\x00\x38\x42\x49\x4d\x04\x04\
-\x00\x00\x00\x00\x00\x0f\x1c\x01\x5a\x00\x03\x1b\x25\x47\x1c\x02\
-\x00\x00\x02\x00\x00\x00\x38\x42\x49\x4d\x04\x25\x00\x00\x00\x00\
-\x00\x10\xcd\xcf\xfa\x7d\xa8\xc7\xbe\x09\x05\x70\x76\xae\xaf\x05\
-\xc3\x4e\x38\x42\x49\x4d\x04\x3a\x00\x00\x00\x00\x00\xe5\x00\x00\
-\x00\x10\x00\x00\x00\x01\x00\x00\x00\x00\x00\x0b\x70\x72\x69\x6e\
-\x74\x4f\x75\x74\x70\x75\x74\x00\x00\x00\x05\x00\x00\x00\x00\x50\
-\x73\x74\x53\x62\x6f\x6f\x6c\x01\x00\x00\x00\x00\x49\x6e\x74\x65\
-\x65\x6e\x75\x6d\x00\x00\x00\x00\x49\x6e\x74\x65\x00\x00\x00\x00\
-\x43\x6c\x72\x6d\x00\x00\x00\x0f\x70\x72\x69\x6e\x74\x53\x69\x78\
-\x74\x65\x65\x6e\x42\x69\x74\x62\x6f\x6f\x6c\x00\x00\x00\x00\x0b\
-\x70\x72\x69\x6e\x74\x65\x72\x4e\x61\x6d\x65\x54\x45\x58\x54\x00\
-\x00\x00\x01\x00\x00\x00\x00\x00\x0f\x70\x72\x69\x6e\x74\x50\x72\
-\x6f\x6f\x66\x53\x65\x74\x75\x70\x4f\x62\x6a\x63\x00\x00\x00\x0c\
-\x00\x50\x00\x72\x00\x6f\x00\x6f\x00\x66\x00\x20\x00\x53\x00\x65\
-\x00\x74\x00\x75\x00\x70\x00\x00\x00\x00\x00\x0a\x70\x72\x6f\x6f\
-\x66\x53\x65\x74\x75\x70\x00\x00\x00\x01\x00\x00\x00\x00\x42\x6c\
-\x74\x6e\x65\x6e\x75\x6d\x00\x00\x00\x0c\x62\x75\x69\x6c\x74\x69\
-\x6e\x50\x72\x6f\x6f\x66\x00\x00\x00\x09\x70\x72\x6f\x6f\x66\x43\
-\x4d\x59\x4b\x00\x38\x42\x49\x4d\x04\x3b\x00\x00\x00\x00\x02\x2d\
-\x00\x00\x00\x10\x00\x00\x00\x01\x00\x00\x00\x00\x00\x12\x70\x72\
-\x69\x6e\x74\x4f\x75\x74\x70\x75\x74\x4f\x70\x74\x69\x6f\x6e\x73\
-\x00\x00\x00\x17\x00\x00\x00\x00\x43\x70\x74\x6e\x62\x6f\x6f\x6c\
-\x00\x00\x00\x00\x00\x43\x6c\x62\x72\x62\x6f\x6f\x6c\x00\x00\x00\
-\x00\x00\x52\x67\x73\x4d\x62\x6f\x6f\x6c\x00\x00\x00\x00\x00\x43\
-\x72\x6e\x43\x62\x6f\x6f\x6c\x00\x00\x00\x00\x00\x43\x6e\x74\x43\
-\x62\x6f\x6f\x6c\x00\x00\x00\x00\x00\x4c\x62\x6c\x73\x62\x6f\x6f\
-\x6c\x00\x00\x00\x00\x00\x4e\x67\x74\x76\x62\x6f\x6f\x6c\x00\x00\
-\x00\x00\x00\x45\x6d\x6c\x44\x62\x6f\x6f\x6c\x00\x00\x00\x00\x00\
-\x49\x6e\x74\x72\x62\x6f\x6f\x6c\x00\x00\x00\x00\x00\x42\x63\x6b\
-\x67\x4f\x62\x6a\x63\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x52\
-\x47\x42\x43\x00\x00\x00\x03\x00\x00\x00\x00\x52\x64\x20\x20\x64\
-\x6f\x75\x62\x40\x6f\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x47\
-\x72\x6e\x20\x64\x6f\x75\x62\x40\x6f\xe0\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x42\x6c\x20\x20\x64\x6f\x75\x62\x40\x6f\xe0\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x42\x72\x64\x54\x55\x6e\x74\x46\x23\
-\x52\x6c\x74\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x42\
-\x6c\x64\x20\x55\x6e\x74\x46\x23\x52\x6c\x74\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x52\x73\x6c\x74\x55\x6e\x74\x46\x23\
-\x50\x78\x6c\x40\x72\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x0a\x76\
-\x65\x63\x74\x6f\x72\x44\x61\x74\x61\x62\x6f\x6f\x6c\x01\x00\x00\
-\x00\x00\x50\x67\x50\x73\x65\x6e\x75\x6d\x00\x00\x00\x00\x50\x67\
-\x50\x73\x00\x00\x00\x00\x50\x67\x50\x43\x00\x00\x00\x00\x4c\x65\
-\x66\x74\x55\x6e\x74\x46\x23\x52\x6c\x74\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x54\x6f\x70\x20\x55\x6e\x74\x46\x23\x52\
-\x6c\x74\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x53\x63\
-\x6c\x20\x55\x6e\x74\x46\x23\x50\x72\x63\x40\x59\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x10\x63\x72\x6f\x70\x57\x68\x65\x6e\x50\x72\
-\x69\x6e\x74\x69\x6e\x67\x62\x6f\x6f\x6c\x00\x00\x00\x00\x0e\x63\
-\x72\x6f\x70\x52\x65\x63\x74\x42\x6f\x74\x74\x6f\x6d\x6c\x6f\x6e\
-\x67\x00\x00\x00\x00\x00\x00\x00\x0c\x63\x72\x6f\x70\x52\x65\x63\
-\x74\x4c\x65\x66\x74\x6c\x6f\x6e\x67\x00\x00\x00\x00\x00\x00\x00\
-\x0d\x63\x72\x6f\x70\x52\x65\x63\x74\x52\x69\x67\x68\x74\x6c\x6f\
-\x6e\x67\x00\x00\x00\x00\x00\x00\x00\x0b\x63\x72\x6f\x70\x52\x65\
-\x63\x74\x54\x6f\x70\x6c\x6f\x6e\x67\x00\x00\x00\x00\x00\x38\x42\
-\x49\x4d\x03\xed\x00\x00\x00\x00\x00\x10\x01\x2c\x00\x00\x00\x01\
-\x00\x01\x01\x2c\x00\x00\x00\x01\x00\x01\x38\x42\x49\x4d\x04\x26\
-\x00\x00\x00\x00\x00\x0e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x3f\x80\x00\x00\x38\x42\x49\x4d\x03\xf2\x00\x00\x00\x00\x00\x0a\
-\x00\x00\xff\xff\xff\xff\xff\xff\x00\x00\x38\x42\x49\x4d\x04\x0d\
-\x00\x00\x00\x00\x00\x04\xff\xff\xff\xc4\x38\x42\x49\x4d\x04\x19\
-\x00\x00\x00\x00\x00\x04\x00\x00\x00\x1e\x38\x42\x49\x4d\x03\xf3\
-\x00\x00\x00\x00\x00\x09\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\
-\x38\x42\x49\x4d\x27\x10\x00\x00\x00\x00\x00\x0a\x00\x01\x00\x00\
-\x00\x00\x00\x00\x00\x01\x38\x42\x49\x4d\x03\xf4\x00\x00\x00\x00\
-\x00\x12\x00\x35\x00\x00\x00\x01\x00\x2d\x00\x00\x00\x06\x00\x00\
-\x00\x00\x00\x01\x38\x42\x49\x4d\x03\xf7\x00\x00\x00\x00\x00\x1c\
-\x00\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\x03\xe8\x00\x00\x38\x42\x49\x4d\
-\x04\x08\x00\x00\x00\x00\x00\x10\x00\x00\x00\x01\x00\x00\x02\x40\
-\x00\x00\x02\x40\x00\x00\x00\x00\x38\x42\x49\x4d\x04\x44\x00\x00\
-\x00\x00\x00\x10\x00\x00\x00\x02\x00\x00\x02\x40\x00\x00\x02\x40\
-\x00\x00\x00\x00\x38\x42\x49\x4d\x04\x1e\x00\x00\x00\x00\x00\x04\
-\x00\x00\x00\x00\x38\x42\x49\x4d\x04\x1a\x00\x00\x00\x00\x03\x49\
-\x00\x00\x00\x06\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\xbe\
-\x00\x00\x01\xbe\x00\x00\x00\x0a\x00\x69\x00\x6e\x00\x64\x00\x65\
-\x00\x78\x00\x5f\x00\x69\x00\x63\x00\x6f\x00\x6e\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\xbe\
-\x00\x00\x01\xbe\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x10\x00\x00\x00\x01\x00\x00\x00\
-\x00\x00\x00\x6e\x75\x6c\x6c\x00\x00\x00\x02\x00\x00\x00\x06\x62\
-\x6f\x75\x6e\x64\x73\x4f\x62\x6a\x63\x00\x00\x00\x01\x00\x00\x00\
-\x00\x00\x00\x52\x63\x74\x31\x00\x00\x00\x04\x00\x00\x00\x00\x54\
-\x6f\x70\x20\x6c\x6f\x6e\x67\x00\x00\x00\x00\x00\x00\x00\x00\x4c\
-\x65\x66\x74\x6c\x6f\x6e\x67\x00\x00\x00\x00\x00\x00\x00\x00\x42\
-\x74\x6f\x6d\x6c\x6f\x6e\x67\x00\x00\x01\xbe\x00\x00\x00\x00\x52\
-\x67\x68\x74\x6c\x6f\x6e\x67\x00\x00\x01\xbe\x00\x00\x00\x06\x73\
-\x6c\x69\x63\x65\x73\x56\x6c\x4c\x73\x00\x00\x00\x01\x4f\x62\x6a\
-\x63\x00\x00\x00\x01\x00\x00\x00\x00\x00\x05\x73\x6c\x69\x63\x65\
-\x00\x00\x00\x12\x00\x00\x00\x07\x73\x6c\x69\x63\x65\x49\x44\x6c\
-\x6f\x6e\x67\x00\x00\x00\x00\x00\x00\x00\x07\x67\x72\x6f\x75\x70\
-\x49\x44\x6c\x6f\x6e\x67\x00\x00\x00\x00\x00\x00\x00\x06\x6f\x72\
-\x69\x67\x69\x6e\x65\x6e\x75\x6d\x00\x00\x00\x0c\x45\x53\x6c\x69\
-\x63\x65\x4f\x72\x69\x67\x69\x6e\x00\x00\x00\x0d\x61\x75\x74\x6f\
-\x47\x65\x6e\x65\x72\x61\x74\x65\x64\x00\x00\x00\x00\x54\x79\x70\
-\x65\x65\x6e\x75\x6d\x00\x00\x00\x0a\x45\x53\x6c\x69\x63\x65\x54\
-\x79\x70\x65\x00\x00\x00\x00\x49\x6d\x67\x20\x00\x00\x00\x06\x62\
-\x6f\x75\x6e\x64\x73\x4f\x62\x6a\x63\x00\x00\x00\x01\x00\x00\x00\
-\x00\x00\x00\x52\x63\x74\x31\x00\x00\x00\x04\x00\x00\x00\x00\x54\
-\x6f\x70\x20\x6c\x6f\x6e\x67\x00\x00\x00\x00\x00\x00\x00\x00\x4c\
-\x65\x66\x74\x6c\x6f\x6e\x67\x00\x00\x00\x00\x00\x00\x00\x00\x42\
-\x74\x6f\x6d\x6c\x6f\x6e\x67\x00\x00\x01\xbe\x00\x00\x00\x00\x52\
-\x67\x68\x74\x6c\x6f\x6e\x67\x00\x00\x01\xbe\x00\x00\x00\x03\x75\
-\x72\x6c\x54\x45\x58\x54\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\
-\x6e\x75\x6c\x6c\x54\x45\x58\x54\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x4d\x73\x67\x65\x54\x45\x58\x54\x00\x00\x00\x01\x00\x00\
-\x00\x00\x00\x06\x61\x6c\x74\x54\x61\x67\x54\x45\x58\x54\x00\x00\
-\x00\x01\x00\x00\x00\x00\x00\x0e\x63\x65\x6c\x6c\x54\x65\x78\x74\
-\x49\x73\x48\x54\x4d\x4c\x62\x6f\x6f\x6c\x01\x00\x00\x00\x08\x63\
-\x65\x6c\x6c\x54\x65\x78\x74\x54\x45\x58\x54\x00\x00\x00\x01\x00\
-\x00\x00\x00\x00\x09\x68\x6f\x72\x7a\x41\x6c\x69\x67\x6e\x65\x6e\
-\x75\x6d\x00\x00\x00\x0f\x45\x53\x6c\x69\x63\x65\x48\x6f\x72\x7a\
-\x41\x6c\x69\x67\x6e\x00\x00\x00\x07\x64\x65\x66\x61\x75\x6c\x74\
-\x00\x00\x00\x09\x76\x65\x72\x74\x41\x6c\x69\x67\x6e\x65\x6e\x75\
-\x6d\x00\x00\x00\x0f\x45\x53\x6c\x69\x63\x65\x56\x65\x72\x74\x41\
-\x6c\x69\x67\x6e\x00\x00\x00\x07\x64\x65\x66\x61\x75\x6c\x74\x00\
-\x00\x00\x0b\x62\x67\x43\x6f\x6c\x6f\x72\x54\x79\x70\x65\x65\x6e\
-\x75\x6d\x00\x00\x00\x11\x45\x53\x6c\x69\x63\x65\x42\x47\x43\x6f\
-\x6c\x6f\x72\x54\x79\x70\x65\x00\x00\x00\x00\x4e\x6f\x6e\x65\x00\
-\x00\x00\x09\x74\x6f\x70\x4f\x75\x74\x73\x65\x74\x6c\x6f\x6e\x67\
-\x00\x00\x00\x00\x00\x00\x00\x0a\x6c\x65\x66\x74\x4f\x75\x74\x73\
-\x65\x74\x6c\x6f\x6e\x67\x00\x00\x00\x00\x00\x00\x00\x0c\x62\x6f\
-\x74\x74\x6f\x6d\x4f\x75\x74\x73\x65\x74\x6c\x6f\x6e\x67\x00\x00\
-\x00\x00\x00\x00\x00\x0b\x72\x69\x67\x68\x74\x4f\x75\x74\x73\x65\
-\x74\x6c\x6f\x6e\x67\x00\x00\x00\x00\x00\x38\x42\x49\x4d\x04\x28\
-\x00\x00\x00\x00\x00\x0c\x00\x00\x00\x02\x3f\xf0\x00\x00\x00\x00\
-\x00\x00\x38\x42\x49\x4d\x04\x14\x00\x00\x00\x00\x00\x04\x00\x00\
-\x00\x01\x38\x42\x49\x4d\x04\x0c\x00\x00\x00\x00\x0f\x17\x00\x00\
-\x00\x01\x00\x00\x00\x6b\x00\x00\x00\x6b\x00\x00\x01\x44\x00\x00\
-\x87\x6c\x00\x00\x0e\xfb\x00\x18\x00\x01\xff\xd8\xff\xed\x00\x0c\
-\x41\x64\x6f\x62\x65\x5f\x43\x4d\x00\x01\xff\xee\x00\x0e\x41\x64\
-\x6f\x62\x65\x00\x64\x80\x00\x00\x00\x01\xff\xdb\x00\x84\x00\x0c\
-\x08\x08\x08\x09\x08\x0c\x09\x09\x0c\x11\x0b\x0a\x0b\x11\x15\x0f\
-\x0c\x0c\x0f\x15\x18\x13\x13\x15\x13\x13\x18\x11\x0c\x0c\x0c\x0c\
-\x0c\x0c\x11\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\
-\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x01\
-\x0d\x0b\x0b\x0d\x0e\x0d\x10\x0e\x0e\x10\x14\x0e\x0e\x0e\x14\x14\
-\x0e\x0e\x0e\x0e\x14\x11\x0c\x0c\x0c\x0c\x0c\x11\x11\x0c\x0c\x0c\
-\x0c\x0c\x0c\x11\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\
-\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\
-\xff\xc0\x00\x11\x08\x00\x6b\x00\x6b\x03\x01\x22\x00\x02\x11\x01\
-\x03\x11\x01\xff\xdd\x00\x04\x00\x07\xff\xc4\x01\x3f\x00\x00\x01\
-\x05\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x03\x00\
-\x01\x02\x04\x05\x06\x07\x08\x09\x0a\x0b\x01\x00\x01\x05\x01\x01\
-\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x01\x00\x02\x03\x04\
-\x05\x06\x07\x08\x09\x0a\x0b\x10\x00\x01\x04\x01\x03\x02\x04\x02\
-\x05\x07\x06\x08\x05\x03\x0c\x33\x01\x00\x02\x11\x03\x04\x21\x12\
-\x31\x05\x41\x51\x61\x13\x22\x71\x81\x32\x06\x14\x91\xa1\xb1\x42\
-\x23\x24\x15\x52\xc1\x62\x33\x34\x72\x82\xd1\x43\x07\x25\x92\x53\
-\xf0\xe1\xf1\x63\x73\x35\x16\xa2\xb2\x83\x26\x44\x93\x54\x64\x45\
-\xc2\xa3\x74\x36\x17\xd2\x55\xe2\x65\xf2\xb3\x84\xc3\xd3\x75\xe3\
-\xf3\x46\x27\x94\xa4\x85\xb4\x95\xc4\xd4\xe4\xf4\xa5\xb5\xc5\xd5\
-\xe5\xf5\x56\x66\x76\x86\x96\xa6\xb6\xc6\xd6\xe6\xf6\x37\x47\x57\
-\x67\x77\x87\x97\xa7\xb7\xc7\xd7\xe7\xf7\x11\x00\x02\x02\x01\x02\
-\x04\x04\x03\x04\x05\x06\x07\x07\x06\x05\x35\x01\x00\x02\x11\x03\
-\x21\x31\x12\x04\x41\x51\x61\x71\x22\x13\x05\x32\x81\x91\x14\xa1\
-\xb1\x42\x23\xc1\x52\xd1\xf0\x33\x24\x62\xe1\x72\x82\x92\x43\x53\
-\x15\x63\x73\x34\xf1\x25\x06\x16\xa2\xb2\x83\x07\x26\x35\xc2\xd2\
-\x44\x93\x54\xa3\x17\x64\x45\x55\x36\x74\x65\xe2\xf2\xb3\x84\xc3\
-\xd3\x75\xe3\xf3\x46\x94\xa4\x85\xb4\x95\xc4\xd4\xe4\xf4\xa5\xb5\
-\xc5\xd5\xe5\xf5\x56\x66\x76\x86\x96\xa6\xb6\xc6\xd6\xe6\xf6\x27\
-\x37\x47\x57\x67\x77\x87\x97\xa7\xb7\xc7\xff\xda\x00\x0c\x03\x01\
-\x00\x02\x11\x03\x11\x00\x3f\x00\xf5\x2a\x6b\xaa\xba\x99\x5d\x2d\
-\x6b\x29\x63\x43\x6b\x63\x00\x0d\x0d\x02\x18\xd6\x35\xbe\xd6\xb1\
-\xad\x4f\x65\x95\xd5\x5b\xad\xb5\xc1\x95\xb0\x17\x3d\xee\x30\xd6\
-\xb4\x09\x73\x9c\xe7\x7d\x16\xb5\x54\xb7\x33\x1b\xa7\x53\x4e\x3b\
-\xdc\xeb\x6e\x2d\x0d\xa6\x86\x0d\xd6\xd9\xb4\x6d\xf6\x56\x3f\xe9\
-\xda\xff\x00\xd0\xd5\xfe\x16\xca\xd0\x99\x83\x91\x9b\x63\x32\x7a\
-\xa4\x06\x30\x87\xd1\x80\xd3\x35\xb1\xc0\xee\x65\xb9\x2f\xff\x00\
-\xb5\x59\x0d\x8d\xed\xff\x00\xb4\xd8\xef\xfe\x6b\xd6\xb6\xaf\xb5\
-\xa4\xa4\x4e\x65\x9d\x75\x8e\x65\x8c\x75\x3d\x21\xda\x16\x38\x16\
-\xbf\x29\xbd\xc3\xda\x7d\xf4\xe0\x3b\xfd\x1b\xbf\x4d\x9b\xf9\xfe\
-\x96\x1f\xf4\xd3\x75\x0e\x96\xc7\x8a\xf2\xb0\xab\xaa\xbe\xa1\x86\
-\x07\xd9\x6c\x2d\x03\xd8\x3e\x9e\x19\xb3\x6e\xfa\xf1\xb2\x19\xfa\
-\x2f\x67\xf3\x5f\xcf\x7a\x7f\xa2\x5a\x29\x24\xa6\xb7\x4f\xea\x14\
-\x75\x0c\x7f\x5e\x9d\xcd\x21\xc5\x96\xd4\xf1\x16\x57\x63\x74\xb6\
-\x8b\xd8\x0b\xb6\xdb\x5b\xbf\xf4\xa5\x7b\xea\xf7\xab\x2b\x33\xa8\
-\x60\x5d\x55\xee\xea\xbd\x34\xb5\x99\xa1\xb1\x7d\x4f\x3b\x6a\xc8\
-\x63\x78\xaf\x21\xdf\xe0\xee\x63\x7f\xa3\xe5\xff\x00\x80\xff\x00\
-\x09\xea\xd1\xfa\x25\x67\xa6\x75\x1c\x6e\xa7\x83\x56\x76\x29\x3e\
-\x95\xc2\x5b\xb8\x41\x11\xa1\xfd\xe6\x3b\xfe\x32\xa7\xd9\x4d\xbf\
-\xce\xd1\x65\xb4\xfe\x91\x25\x36\x95\x1e\xb0\xc7\x0c\x41\x95\x5c\
-\x9b\x70\x5e\x32\x5a\x06\xa4\x86\x4f\xaf\x53\x7f\x95\x7e\x2b\xaf\
-\xa5\xbf\xf1\x8a\xf2\x64\x94\xb3\x5c\xd7\xb4\x3d\x84\x39\xae\x00\
-\xb4\x8e\x08\x3d\xd4\x95\x2e\x90\x76\xe0\xb2\x82\x7d\xd8\xa5\xd8\
-\xe4\x77\xfd\x11\x35\x57\x3f\xd7\xa9\xb5\xd8\xae\xa4\xa6\x2f\x6b\
-\x5e\xc7\x31\xe2\x5a\xe0\x43\x81\xee\x0a\x06\x03\x9c\x71\xc5\x56\
-\x12\x6c\xa0\x9a\x9e\x4e\xa4\xec\xd1\x8f\x77\xfc\x6d\x7b\x2d\xff\
-\x00\xae\x2b\x0b\x27\xa8\x75\x7c\x2e\x91\x9c\x1b\x71\x7d\x96\x66\
-\xb3\x75\x58\xb4\x56\xfb\xae\x73\xaa\x1f\xa4\xb1\x98\xf4\x35\xf6\
-\x6d\xf4\x76\xfe\x93\xe8\x7e\x85\x25\x3a\xcb\x37\xec\xc2\x7e\xcd\
-\xb3\xf4\x7f\x6a\xfa\x51\xaf\xa7\x1f\xb4\x36\x7f\xc5\xfa\xff\x00\
-\xa2\x57\xe8\xbe\x9c\x8a\x6b\xc8\xa1\xed\xb6\x9b\x9a\x1f\x5d\x8d\
-\x32\xd7\x35\xc3\x73\x1e\xd7\x7e\xeb\x9a\xa6\x92\x9f\xff\xd0\xf4\
-\x16\x62\x67\x61\x5d\x7d\xb8\x98\xf8\xb7\x0c\x87\xba\xc7\x99\x7d\
-\x36\x12\x4f\xb4\x3e\xc2\xdc\xbf\x59\xdf\x9b\xfe\x06\xbf\xf8\xb4\
-\x5f\xda\xbe\x90\x1f\x6b\xc4\xc8\xc7\xd3\xe9\x6c\xf5\x9b\xfe\x76\
-\x19\xc8\xdb\xff\x00\x5d\x6d\x6a\xce\x2b\x72\x1b\x8b\x4b\x72\x9e\
-\xdb\x32\x43\x1a\x2f\x7b\x06\xd6\xba\xc0\x07\xaa\xf6\x33\xf3\x58\
-\xe7\xfd\x14\x54\x94\x83\x1b\xa8\x60\x65\x92\x31\xb2\x2b\xb9\xc3\
-\x96\xb1\xe0\xb8\x7f\x59\xa0\xee\x6a\xb0\xab\xe5\x60\x60\xe6\x00\
-\xdc\xcc\x7a\xb2\x03\x75\x68\xb5\x8d\x7c\x47\x86\xf0\x50\x47\x46\
-\xc2\x68\x8a\x8d\xd5\x0e\xcd\xae\xfb\x9a\xd1\x1f\xbb\x5b\x6d\xf4\
-\xff\x00\xe8\x24\xa5\xbe\xcd\x7e\x6b\x9c\xec\xdf\x6e\x29\xd2\xbc\
-\x31\xc3\x87\xef\x66\x3b\xfc\x26\xff\x00\xfb\x8b\xfc\xc7\xfa\x6f\
-\x5f\xfc\x15\xe1\x03\x85\x48\x74\xeb\xd9\xfc\xd6\x7e\x4b\x47\x66\
-\xbb\xd2\x78\xfb\xed\xa5\xf6\x7f\xe0\x89\xb6\x75\xaa\xa3\x6d\xb8\
-\xf9\x20\x72\xd7\xb1\xf4\xb8\xff\x00\xd7\x98\xec\x96\x7f\xec\xb2\
-\x4a\x6f\xa6\x54\x4f\x51\xc8\xa8\x7e\xb5\x85\x73\x00\xd0\xd9\x4c\
-\x5e\xcf\xec\xb6\x93\xf6\xa7\x7f\xec\x2a\x2e\x3f\x53\xe9\xf9\x4e\
-\xf4\xe8\xc8\x63\xed\xef\x54\xc5\x83\xfa\xf4\xbf\x6d\xac\xfe\xdb\
-\x12\x53\x06\xfe\x83\xaa\x39\xa3\xe8\x66\x57\xbe\x3f\xe1\x29\xdb\
-\x5b\xdd\xfd\x6b\x69\xb2\xaf\xfd\x86\x57\x16\x7f\x5d\xc5\xcf\xc8\
-\xc0\x2f\xe9\x6e\x65\x7d\x4b\x1d\xc2\xec\x47\x58\x25\x85\xed\xfa\
-\x74\xda\x01\x6f\xe8\xf2\x68\x75\xb8\xcf\xff\x00\x47\xea\xfa\xbf\
-\x4d\x89\xf2\xfa\x3d\x59\xd7\xb9\xd9\xb7\x5b\x91\x88\x40\x03\x01\
-\xc5\xa3\x1e\x44\x7b\xad\x65\x6c\x65\xb9\x3b\xa3\xf9\xac\xab\xae\
-\xc6\xff\x00\x80\x49\x4d\x6f\xda\x19\x5d\x60\xec\xe8\xf6\x7a\x38\
-\x20\xc5\x9d\x52\x03\xb7\xc7\xe6\x74\xca\xec\x0f\xaa\xff\x00\xfc\
-\x3b\x6b\x1f\x87\xfe\x86\xbc\xdf\xd2\xfd\x9e\xcd\x1d\x1f\x1b\x0e\
-\xb1\xf6\x21\xb2\xe3\x63\x2c\xb6\xfb\x0b\xac\xb2\xc8\xf6\x3f\xed\
-\x17\xd8\xe7\x5d\x73\xbd\x07\xd9\x5d\x7b\xdf\xfa\x3f\xea\x2b\xc0\
-\x00\x00\x02\x00\xd0\x00\x9d\x25\x38\xb6\x03\xd0\x32\x6f\xcb\x1b\
-\x9d\xd1\xb2\x5c\x6d\xc8\xad\xad\x2f\x38\xb7\x38\xee\xb7\x29\x8c\
-\x66\xe7\x7d\x87\x27\xf9\xcc\xaf\x4d\xbf\xaa\xe4\xfe\xb7\xfc\xc6\
-\x46\x5d\xb8\xda\x1f\xb5\x3a\x67\xfd\xcc\xa3\xf9\x8f\xb5\xff\x00\
-\x38\xcf\xe8\xff\x00\xf7\x33\xe9\x7f\x45\xff\x00\xbb\x1f\xcd\x23\
-\xdd\x75\x54\x56\xeb\x6e\x78\xae\xb6\xfd\x27\x38\xc0\x1d\x96\x27\
-\xec\x7a\x7d\x4d\xdf\xb3\xe9\xf4\xbe\xd3\xf6\xcf\x47\x6b\xa3\x6e\
-\xcf\x4f\x6e\xdf\x53\xd0\xfb\x4f\xda\xbf\x5e\xf4\xbd\x1f\xb3\x7a\
-\x9f\xa5\xf4\xbf\x68\x7e\xbc\x92\x9f\xff\xd1\xf5\x44\x94\x29\x6d\
-\x2c\xa9\xb5\xd0\x1a\x2b\xac\x6c\x6b\x5b\x10\xd0\xdf\x66\xcd\x3f\
-\x73\x6e\xd5\x34\x94\xa4\x92\x49\x25\x29\x24\x92\x49\x4a\x42\xc9\
-\xc4\xc4\xcb\x67\xa7\x95\x4d\x79\x0c\x06\x43\x6d\x6b\x5e\x27\xe0\
-\xf0\xe4\x54\x92\x53\x47\xf6\x46\x3b\x00\x18\xf6\xdf\x8d\x1f\x44\
-\x57\x6b\x8b\x47\xf5\x69\xb8\xdb\x47\xfe\x04\xb2\x7a\xc7\x4a\xea\
-\xf8\x99\x23\xad\x74\xce\xa5\x6b\xf3\x76\x57\x8a\x70\xf2\x43\x0e\
-\x35\xc1\xd6\x6d\xa9\xb7\x32\xa1\x8d\xe9\x58\xcb\x72\x37\x7d\xa6\
-\xaf\xd2\xb2\xbf\xf0\x76\x7f\x37\x6f\x48\xaa\x64\xfe\x97\x37\x16\
-\x8d\x36\xd7\xbb\x22\xc0\x44\xfd\x01\xe9\xd4\xdf\xe4\xfe\x96\xdf\
-\x55\xbf\xf1\x09\x29\x8b\xb3\x33\x69\x23\xed\x18\x6e\x7b\x3b\xd9\
-\x8c\xe1\x60\x03\xc5\xd5\x3f\xd1\xc8\xfe\xc5\x15\xe4\x25\xfb\x63\
-\xa7\x9c\x7a\xf2\x2b\xb7\xd5\x17\x17\x36\x9a\xeb\x05\xd6\x3d\xec\
-\xd2\xca\x9b\x44\x7a\xbe\xa5\x4e\x6f\xe9\xd8\xf6\xfe\x83\xfc\x3f\
-\xa6\xae\xac\xae\x85\x8d\x43\xfe\xd3\xd6\x03\x5a\x6d\xea\xb6\x9b\
-\xc5\x80\x73\x48\x6b\x31\xf0\xb6\xff\x00\x25\xf8\x94\x51\x77\xfc\
-\x65\x89\x29\xce\xe9\xbd\x43\x3b\x3b\x32\xdc\x9e\xbb\xd2\xb2\xf0\
-\x5d\x84\xe1\xf6\x6a\x36\x8c\x8a\x1a\x63\xfa\x45\x76\x62\xef\xb3\
-\x2f\x29\xdb\xbf\x9c\xf4\x7d\x1c\x6a\xff\x00\x47\x47\xe9\x3e\xd3\
-\x6d\xba\xff\x00\xb7\xba\x4c\x7f\x48\x1c\x71\xb5\xd3\x3f\xe8\xa3\
-\x6f\xf4\x8f\xfb\xad\xfd\x23\xfe\x09\x5f\x49\x25\x3f\xff\xd2\xf4\
-\x9b\xba\x47\x4d\xb6\xc3\x73\xa8\x6b\x2e\x71\x93\x75\x53\x55\x84\
-\xff\x00\xc7\x50\x6b\xb7\xfe\x9a\x81\xc0\xcb\xac\x7e\xab\x9d\x63\
-\x75\xd1\x97\x86\xdc\xc0\x3e\x2e\xf4\xf2\x5d\xff\x00\xb1\x4a\xfa\
-\x64\x94\xd1\xf5\x3a\xcd\x5f\x4e\x9a\x32\x9b\x3a\xba\xb7\xba\x97\
-\x47\xf2\x69\xb5\xb7\x33\xff\x00\x66\x92\x1d\x54\x34\xc6\x46\x26\
-\x4e\x39\xf3\xaf\xd5\x1f\xe7\x61\x3b\x29\xbf\xe7\x2b\xc9\x24\xa6\
-\xad\x5d\x57\xa6\x5c\xe0\xca\xf2\xaa\x36\x1f\xf0\x7b\xc0\x7f\xc0\
-\xd4\xe3\xea\x37\xfc\xd5\x69\x42\xda\x29\xbd\xbb\x2e\xad\xb6\xb7\
-\xf7\x5e\xd0\xe1\xff\x00\x49\x55\x3d\x17\xa6\x0f\xe6\xe8\x14\x7f\
-\xe1\x77\x3a\x8f\xfd\xb6\x75\x49\x29\xba\x92\xa6\x3a\x73\x98\xe9\
-\xa7\x2f\x22\xb1\xfb\xa5\xe2\xd1\xff\x00\xb3\x4c\xbd\xff\x00\xf4\
-\x91\x6a\xab\x31\x84\xef\xbd\xb6\x37\xb6\xea\xe1\xdf\xe7\x31\xed\
-\x6f\xfe\x06\x92\x93\xaa\xb8\x6e\x17\x3e\xec\xa1\xf4\x6c\x77\xa7\
-\x59\x99\x96\x55\x2c\x0e\xfe\xd5\xa6\xe7\x7f\x51\x4f\x2a\xbc\xab\
-\x69\x35\x50\xf6\xd4\x5f\xed\x7d\xba\xee\x6b\x4f\xd3\x35\x06\xed\
-\xfd\x2f\xfa\x37\x6e\xf6\x23\x31\x8c\xad\x8d\xad\x83\x6b\x18\x03\
-\x5a\xd1\xc0\x03\x40\x12\x53\x9d\xf5\x89\xef\xfd\x93\x76\x3d\x4e\
-\xd9\x76\x69\x6e\x1d\x4e\x1a\x16\xbb\x21\xc3\x1b\xd5\x6c\x7f\xa0\
-\x65\x8f\xbf\xfe\xb4\xb4\x2b\xae\xba\xab\x6d\x55\xb4\x32\xba\xc0\
-\x6b\x1a\x34\x00\x01\xb5\xad\x0b\x3f\x28\xfd\xa3\xae\x61\x63\x72\
-\xdc\x46\x59\x99\x67\x93\xc8\xfb\x16\x2b\x5d\xff\x00\x18\xcb\xf3\
-\x5f\xff\x00\xa0\xeb\x49\x25\x2e\x92\x49\x24\xa7\xff\xd3\xf5\x54\
-\x96\x2e\x2f\xd5\xfc\x77\x59\x93\x95\x7e\x66\x6e\x5b\x33\x6d\x37\
-\xd7\x55\xd9\x17\x31\xb5\x35\xe2\x7e\xcf\x55\x15\xbe\x86\xb2\xa6\
-\xee\xf6\xb2\xca\xf7\xb3\xe8\x7e\x62\x3f\xfc\xdb\xe8\x45\xdb\xac\
-\xc2\xaa\xf7\x7e\xf5\xe3\xd6\x3f\xe7\x64\xfa\xa9\x29\x9d\xfd\x7b\
-\xa3\x51\x67\xa2\xfc\xca\x9d\x7f\x02\x8a\xdd\xea\x5a\x7f\xab\x8f\
-\x4f\xa9\x7b\xbf\xed\xb5\x01\xd5\x33\x72\x74\xc0\xc0\xb4\xb7\xb5\
-\xd9\x73\x8b\x5f\xfd\xb6\xf6\xd9\x9d\xfe\x76\x1b\x19\xff\x00\x08\
-\xaf\x51\x8d\x8f\x8d\x58\xab\x1a\xa6\x53\x58\xe1\x95\xb4\x35\xbf\
-\xe6\xb2\x11\x12\x53\x99\xfb\x2f\x3b\x24\xee\xea\x39\xf6\x39\xbf\
-\xf7\x1f\x10\x1c\x5a\xfe\x76\x31\xf6\x67\x3b\xff\x00\x63\x19\x53\
-\xff\x00\xd0\xa0\x74\x3c\x1c\x5c\x2e\xa9\xd5\xaa\xc4\xad\xb5\x52\
-\x1f\x40\xda\xd0\x07\xbb\xd1\x6b\x9e\xe7\xbb\xe9\x58\xf7\x6e\x63\
-\x9d\x65\x9e\xf5\xb4\xb3\x3a\x29\x16\xdb\xd4\xf2\xda\x3d\x97\xe6\
-\xbd\xac\xff\x00\xd0\x76\x53\xd3\xac\xff\x00\xc1\xf1\x2e\x49\x4e\
-\x91\x20\x02\x49\x80\x35\x24\xf1\x0b\x36\x8e\xb4\xec\x8d\xf7\xe3\
-\xe1\x5f\x76\x0b\x4c\x33\x25\xa0\x03\x67\x73\x75\x14\x58\x59\x65\
-\xd8\x9a\xfe\x8f\x21\x9f\xcf\xff\x00\x80\xaa\xda\x76\x5c\xa5\xd4\
-\x18\xcc\xfc\x96\xf4\xa7\xb7\xd4\xc5\x2c\x36\x67\x37\xb3\x9b\x3b\
-\x68\xc6\x7f\xf2\x6f\x7e\xf7\xd9\x5f\xe7\xd5\x4f\xfa\x3b\x16\x8a\
-\x4a\x73\xac\xc5\xe9\x5d\x6a\xba\xf2\xd8\xf7\x39\xd5\xef\x65\x79\
-\x14\x5b\x65\x36\x30\xce\xdb\xaa\x73\xe8\x7d\x56\xb5\xcd\xb1\x9f\
-\xa5\xc7\xbb\xfc\x23\x3f\x4b\x5a\xcb\xcf\x7f\x5e\xfa\xb7\x53\xb3\
-\xdb\x91\x67\x5b\xe9\x54\x80\x72\xb1\xae\x6b\x06\x5d\x55\x83\xfa\
-\x5c\x9c\x6c\x8a\x19\x4b\x32\xbd\x36\x7b\xdf\x46\x4d\x5e\xa7\xe8\
-\xff\x00\xa5\x2d\x0c\xae\x87\x6d\x9d\x55\x9d\x4b\x0f\x3a\xec\x12\
-\x5d\x59\xcc\xc7\xac\x30\xd5\x90\x2b\x3a\x7a\xcd\x7b\x0b\x9b\x6b\
-\xaa\xfd\x5d\xf7\xb1\xde\xa7\xa0\xca\x6b\xff\x00\x03\x5a\x0e\x6f\
-\x45\xcd\xab\x2a\xcc\xde\x9d\x9b\x99\x53\x6e\xd6\xdc\x6a\xec\x63\
-\xda\xd7\x49\x77\xab\x8b\x4e\x7d\x79\x18\xed\xdf\x3f\xa6\xa3\xf4\
-\x3f\xe9\x29\xb2\xab\x3f\x9e\x4a\x43\x8a\xee\xa5\x97\xd7\x73\x3a\
-\xb6\x0d\xed\x7e\x0d\x4c\xaf\x09\xd8\x4e\x64\x1b\x8d\x6d\xfb\x57\
-\xda\x2b\xca\x71\xdd\x45\xb4\x5b\x9b\x6e\x2f\xa0\xfa\xf6\x7a\xb5\
-\x5d\x5d\xde\x95\x9e\xfa\xb6\x71\xb3\xf1\xf2\x1e\x6a\x04\xd7\x90\
-\xc1\x2f\xc7\xb0\x6d\xb1\xa3\xf7\xb6\x7e\x7d\x7f\xf0\xd5\x7a\x94\
-\xfe\xe5\x8b\x9b\xa9\x9f\x58\x71\x32\xeb\xea\x78\x5e\x87\x53\xc2\
-\x63\x2d\xab\x33\x13\x1b\x7e\x2d\x8e\x73\xec\x6e\x43\xef\x6f\x4f\
-\xbe\xcb\x70\xff\x00\x68\xd5\x6f\xda\x5f\x7b\xdf\x6e\x2d\x99\x3e\
-\xbe\xcf\xf4\x4b\x6f\x1a\xdc\x3e\xb7\x8a\xdb\x6e\xc5\xb2\xb0\xd3\
-\x2c\x17\x00\x1e\xd2\x44\xfa\x94\x5f\x43\xec\x66\xed\x7e\x9e\x3d\
-\xfb\xeb\x7f\xe8\xff\x00\x9c\x49\x4e\x92\x4a\x87\xd9\xba\x96\x37\
-\xf4\x4c\x81\x91\x58\xe2\x8c\xa9\x91\x1f\x9a\xcc\xca\xc1\xb7\xff\
-\x00\x62\x29\xcb\xb1\x2f\xb6\x75\x4e\x3f\x67\xeb\xf4\x67\xd6\x64\
-\x6e\xfd\xfe\x3f\xa3\x7f\xc2\x7f\x49\xdf\xff\x00\x68\xf6\x7e\x91\
-\x25\x3f\xff\xd4\xf5\x54\x94\x58\xf6\x58\xc6\xd9\x5b\x83\xd8\xf0\
-\x1c\xd7\x34\xc8\x20\xea\xd7\x35\xc1\x49\x25\x29\x24\xc4\x86\x82\
-\xe7\x18\x03\x52\x4f\x00\x2e\x74\x7d\x72\xc5\xc9\xc9\xb7\x1b\x0b\
-\xd2\xaf\xd2\x8d\xb6\xe7\xbd\xf8\x8c\xb4\x49\x6f\xa9\x86\xe7\xd1\
-\x6f\xda\x6b\xdd\xfc\xb6\x24\xa7\xa1\x71\x21\xa4\x81\xb8\x80\x48\
-\x68\xee\x7c\x35\x59\x7d\x2c\x3b\xa5\x74\x0c\x36\x65\x33\x66\x57\
-\xa4\xcf\x56\x99\x05\xcf\xca\xb7\xf4\x97\xb0\x39\xa7\x63\xed\xbb\
-\x2e\xcb\x3d\xff\x00\x43\xfc\x27\xf3\x6a\x55\xbb\xeb\x05\xac\xdc\
-\xd7\xe0\xc3\x81\xda\xe6\x8b\x1e\x27\x5f\xe5\x57\xb9\x4b\xed\x0d\
-\x77\x57\xc5\xc2\xbd\xc0\xe5\x57\x8a\xfc\x82\xd6\x82\xd6\x13\xba\
-\xac\x77\x5b\x5e\xe2\x7e\x8e\xfb\x19\xf4\x9f\xe9\xb2\xdf\xd2\x7f\
-\x39\x5a\x4a\x6c\xe0\xe3\x3e\x9a\xdc\xfb\x8b\x5d\x93\x7b\xbd\x4c\
-\x87\x36\x76\x97\x40\x60\x6b\x37\x7e\x65\x55\xb1\x95\x33\xfa\x9b\
-\xfe\x9a\xb2\x92\x49\x29\x49\x24\x92\x4a\x73\x7a\x85\x37\x62\xdb\
-\xfb\x53\x0d\xa5\xef\x6c\x0c\xcc\x76\x89\xf5\xaa\x1c\xbd\x8d\x1f\
-\xf6\xb3\x19\xbe\xfa\x3f\xd3\xb3\xf5\x4f\xf0\x94\xdb\x8f\x13\x4d\
-\x95\xb8\x75\x3e\x8e\xe6\xdf\x4e\x48\x16\xdd\x8c\x1c\x3d\x3b\x83\
-\x86\xe6\xe4\x62\xd9\xfc\xdd\x59\x2f\x6f\xbb\xfe\xe3\xe5\xff\x00\
-\x86\xf4\xbf\xa5\x55\xa8\xb2\xaf\xdd\xd1\xee\x19\x15\x88\xe9\x76\
-\xb8\xfd\xad\x9d\xa8\x73\x8e\xef\xb6\xd7\xfb\x98\xce\x7f\xf4\xe6\
-\x7f\x37\x5f\xf4\xdf\xd1\x7e\xb9\xeb\x25\x37\x70\x73\xb1\xb3\xa9\
-\xf5\xb1\xdc\x61\xae\x2c\xb1\x8e\x05\xaf\x63\xc7\xd2\xaa\xea\x9f\
-\x0f\xae\xc6\xfe\xeb\xbf\xea\x15\x85\x47\x37\xa6\x9b\xad\x19\x78\
-\x96\x7d\x97\x3d\xad\xda\xdb\xa3\x73\x5e\xd0\x77\x0a\x72\xe9\xdc\
-\xcf\xb4\x53\xfd\xaf\x5a\x9f\xd2\x7d\x9e\xea\x7d\x4b\x10\x3f\x68\
-\x75\xae\x3f\x67\x37\x7f\xf3\x51\xea\x98\xf5\xbe\x97\xa9\xbf\xd1\
-\xdb\xfb\x3b\xd2\xf7\xfd\xab\xfa\x4f\xa9\xfa\xbf\xd8\x7d\x54\x94\
-\xff\x00\xff\xd5\xf4\xa3\x9f\x89\x41\x35\xdd\x38\xad\x61\xda\xd3\
-\x63\x76\x57\x03\x46\xec\xb7\xf9\x8f\xea\xb7\x7a\xb4\xd7\x35\xed\
-\x0e\x61\x0e\x69\xd4\x38\x19\x05\x23\xc2\xc1\xa7\xd2\xf5\xee\x9f\
-\x4b\xd5\x9f\xd1\xfe\xcc\xf5\x37\xce\xbf\xd2\xb6\xfe\xad\xbb\xff\
-\x00\x0c\xfb\x12\x53\x7f\xab\x9f\x5b\xec\xfd\x38\x6b\xf6\xdb\x36\
-\xda\x3f\xe0\x2b\x1e\xae\x4e\xef\xf8\x3b\x76\xb3\x11\xdf\xf8\x65\
-\x5e\xb2\xb6\x58\xc7\x57\x63\x43\xd8\xe1\x0e\x6b\x84\x82\x0f\x67\
-\x34\xac\xba\x7d\x4f\xdb\x74\x7a\xbe\xa6\xef\xb1\x59\x1e\xbe\xcd\
-\xdf\xce\xd3\xbf\xd1\xfb\x37\xe8\xbf\xd1\xfd\xb3\x77\xfd\xd1\xfb\
-\x3f\xfd\xaa\x5a\xc9\x29\xc9\x3f\x56\xba\x75\x4f\x36\xf4\xcd\xdd\
-\x2a\xe3\xa9\x76\x19\x15\xb1\xc7\xc6\xdc\x32\xd7\xe1\x5d\xfd\x7b\
-\x71\xfd\x45\x43\xac\xd5\xd6\xfd\x06\xbb\x27\x18\x64\xbf\x15\xde\
-\xb6\x2f\x51\xc0\xd7\x22\x97\xb4\x7f\x38\xee\x99\x7b\x99\xeb\x52\
-\xf6\x6e\xab\x27\x1f\x17\x3a\xeb\x72\xa8\x7d\x94\x7a\x0b\xa5\x49\
-\x25\x38\xff\x00\x56\xbe\xb3\x74\xcf\xac\x58\x6e\xbf\x0a\xe6\x59\
-\x6d\x07\xd3\xca\xad\x84\xfb\x1f\xfb\xcc\xf5\x5b\x55\x8f\xc7\xbb\
-\x6e\xfc\x6b\x9d\x5b\x3d\x46\x7f\xa3\xba\xbb\xa9\xab\x61\x72\xfd\
-\x5f\x7f\xfc\xf8\xe8\xfb\x3d\x59\xfb\x3d\xdf\xd1\x36\x6f\x8d\xcc\
-\xdd\xfb\x57\xd5\xff\x00\xbc\xdd\x9b\xfe\xcf\xff\x00\x76\xbd\x5f\
-\x4b\xf5\x8f\x45\x75\x09\x29\x49\x24\x92\x4a\x52\x62\x01\x10\x75\
-\x07\x90\x9d\x24\x94\xe5\xd3\xbf\xa4\xe4\x37\x19\xc6\x7a\x65\xee\
-\x0d\xc5\x71\xff\x00\x01\x63\x8e\xd6\xe1\xb9\xdf\xf7\x1a\xe7\x7f\
-\x42\xff\x00\x45\x6f\xea\x5f\x9f\x85\x4a\xd4\x55\x3a\xb7\xfc\x97\
-\x99\x3e\x87\xf3\x16\x7f\x4a\xfe\x8f\xf4\x5d\xfd\x2b\xfe\xeb\xff\
-\x00\xa6\xff\x00\x83\x59\xbf\xa0\xf4\xff\x00\xef\x4b\x77\xa1\xff\
-\x00\x0d\xbb\xec\xde\xa7\xfd\xb7\xeb\xfa\x7f\xfd\x51\xfa\x1f\xf7\
-\x65\x25\x3f\xff\xd9\x00\x38\x42\x49\x4d\x04\x21\x00\x00\x00\x00\
-\x00\x57\x00\x00\x00\x01\x01\x00\x00\x00\x0f\x00\x41\x00\x64\x00\
-\x6f\x00\x62\x00\x65\x00\x20\x00\x50\x00\x68\x00\x6f\x00\x74\x00\
-\x6f\x00\x73\x00\x68\x00\x6f\x00\x70\x00\x00\x00\x14\x00\x41\x00\
-\x64\x00\x6f\x00\x62\x00\x65\x00\x20\x00\x50\x00\x68\x00\x6f\x00\
-\x74\x00\x6f\x00\x73\x00\x68\x00\x6f\x00\x70\x00\x20\x00\x32\x00\
-\x30\x00\x32\x00\x32\x00\x00\x00\x01\x00\x38\x42\x49\x4d\x04\x06\
-\x00\x00\x00\x00\x00\x07\x00\x08\x01\x01\x00\x01\x01\x00\xff\xe1\
-\x0e\x2a\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\
-\x65\x2e\x63\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\x00\x3c\
-\x3f\x78\x70\x61\x63\x6b\x65\x74\x20\x62\x65\x67\x69\x6e\x3d\x22\
-\xef\xbb\xbf\x22\x20\x69\x64\x3d\x22\x57\x35\x4d\x30\x4d\x70\x43\
-\x65\x68\x69\x48\x7a\x72\x65\x53\x7a\x4e\x54\x63\x7a\x6b\x63\x39\
-\x64\x22\x3f\x3e\x20\x3c\x78\x3a\x78\x6d\x70\x6d\x65\x74\x61\x20\
-\x78\x6d\x6c\x6e\x73\x3a\x78\x3d\x22\x61\x64\x6f\x62\x65\x3a\x6e\
-\x73\x3a\x6d\x65\x74\x61\x2f\x22\x20\x78\x3a\x78\x6d\x70\x74\x6b\
-\x3d\x22\x41\x64\x6f\x62\x65\x20\x58\x4d\x50\x20\x43\x6f\x72\x65\
-\x20\x37\x2e\x32\x2d\x63\x30\x30\x30\x20\x37\x39\x2e\x31\x62\x36\
-\x35\x61\x37\x39\x2c\x20\x32\x30\x32\x32\x2f\x30\x36\x2f\x31\x33\
-\x2d\x31\x37\x3a\x34\x36\x3a\x31\x34\x20\x20\x20\x20\x20\x20\x20\
-\x20\x22\x3e\x20\x3c\x72\x64\x66\x3a\x52\x44\x46\x20\x78\x6d\x6c\
-\x6e\x73\x3a\x72\x64\x66\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\
-\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x30\
-\x32\x2f\x32\x32\x2d\x72\x64\x66\x2d\x73\x79\x6e\x74\x61\x78\x2d\
-\x6e\x73\x23\x22\x3e\x20\x3c\x72\x64\x66\x3a\x44\x65\x73\x63\x72\
-\x69\x70\x74\x69\x6f\x6e\x20\x72\x64\x66\x3a\x61\x62\x6f\x75\x74\
-\x3d\x22\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6d\x70\x4d\x4d\x3d\
-\x22\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\
-\x2e\x63\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\x6d\x6d\x2f\
-\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x73\x74\x45\x76\x74\x3d\x22\x68\
-\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\x63\
-\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\x73\x54\x79\x70\x65\
-\x2f\x52\x65\x73\x6f\x75\x72\x63\x65\x45\x76\x65\x6e\x74\x23\x22\
-\x20\x78\x6d\x6c\x6e\x73\x3a\x64\x63\x3d\x22\x68\x74\x74\x70\x3a\
-\x2f\x2f\x70\x75\x72\x6c\x2e\x6f\x72\x67\x2f\x64\x63\x2f\x65\x6c\
-\x65\x6d\x65\x6e\x74\x73\x2f\x31\x2e\x31\x2f\x22\x20\x78\x6d\x6c\
-\x6e\x73\x3a\x70\x68\x6f\x74\x6f\x73\x68\x6f\x70\x3d\x22\x68\x74\
-\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\x63\x6f\
-\x6d\x2f\x70\x68\x6f\x74\x6f\x73\x68\x6f\x70\x2f\x31\x2e\x30\x2f\
-\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6d\x70\x3d\x22\x68\x74\x74\
-\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\x63\x6f\x6d\
-\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\x22\x20\x78\x6d\x70\x4d\x4d\
-\x3a\x44\x6f\x63\x75\x6d\x65\x6e\x74\x49\x44\x3d\x22\x33\x32\x30\
-\x31\x34\x31\x42\x44\x45\x39\x32\x45\x44\x44\x39\x46\x46\x33\x31\
-\x39\x35\x43\x34\x36\x41\x44\x42\x44\x41\x36\x38\x30\x22\x20\x78\
-\x6d\x70\x4d\x4d\x3a\x49\x6e\x73\x74\x61\x6e\x63\x65\x49\x44\x3d\
-\x22\x78\x6d\x70\x2e\x69\x69\x64\x3a\x36\x64\x64\x63\x65\x34\x63\
-\x63\x2d\x66\x66\x38\x32\x2d\x37\x35\x34\x63\x2d\x38\x34\x61\x38\
-\x2d\x35\x61\x35\x33\x39\x31\x65\x36\x35\x61\x39\x66\x22\x20\x78\
-\x6d\x70\x4d\x4d\x3a\x4f\x72\x69\x67\x69\x6e\x61\x6c\x44\x6f\x63\
-\x75\x6d\x65\x6e\x74\x49\x44\x3d\x22\x33\x32\x30\x31\x34\x31\x42\
-\x44\x45\x39\x32\x45\x44\x44\x39\x46\x46\x33\x31\x39\x35\x43\x34\
-\x36\x41\x44\x42\x44\x41\x36\x38\x30\x22\x20\x64\x63\x3a\x66\x6f\
-\x72\x6d\x61\x74\x3d\x22\x69\x6d\x61\x67\x65\x2f\x6a\x70\x65\x67\
-\x22\x20\x70\x68\x6f\x74\x6f\x73\x68\x6f\x70\x3a\x4c\x65\x67\x61\
-\x63\x79\x49\x50\x54\x43\x44\x69\x67\x65\x73\x74\x3d\x22\x43\x44\
-\x43\x46\x46\x41\x37\x44\x41\x38\x43\x37\x42\x45\x30\x39\x30\x35\
-\x37\x30\x37\x36\x41\x45\x41\x46\x30\x35\x43\x33\x34\x45\x22\x20\
-\x70\x68\x6f\x74\x6f\x73\x68\x6f\x70\x3a\x43\x6f\x6c\x6f\x72\x4d\
-\x6f\x64\x65\x3d\x22\x31\x22\x20\x70\x68\x6f\x74\x6f\x73\x68\x6f\
-\x70\x3a\x49\x43\x43\x50\x72\x6f\x66\x69\x6c\x65\x3d\x22\x45\x50\
-\x53\x4f\x4e\x20\x20\x47\x72\x61\x79\x20\x2d\x20\x47\x61\x6d\x6d\
-\x61\x20\x32\x2e\x32\x22\x20\x78\x6d\x70\x3a\x43\x72\x65\x61\x74\
-\x65\x44\x61\x74\x65\x3d\x22\x32\x30\x32\x34\x2d\x30\x34\x2d\x30\
-\x35\x54\x32\x30\x3a\x34\x38\x3a\x33\x33\x2d\x30\x33\x3a\x30\x30\
-\x22\x20\x78\x6d\x70\x3a\x4d\x65\x74\x61\x64\x61\x74\x61\x44\x61\
-\x74\x65\x3d\x22\x32\x30\x32\x34\x2d\x30\x34\x2d\x30\x39\x54\x31\
-\x35\x3a\x31\x34\x3a\x31\x34\x2d\x30\x33\x3a\x30\x30\x22\x20\x78\
-\x6d\x70\x3a\x4d\x6f\x64\x69\x66\x79\x44\x61\x74\x65\x3d\x22\x32\
-\x30\x32\x34\x2d\x30\x34\x2d\x30\x39\x54\x31\x35\x3a\x31\x34\x3a\
-\x31\x34\x2d\x30\x33\x3a\x30\x30\x22\x20\x78\x6d\x70\x3a\x43\x72\
-\x65\x61\x74\x6f\x72\x54\x6f\x6f\x6c\x3d\x22\x41\x64\x6f\x62\x65\
-\x20\x50\x68\x6f\x74\x6f\x73\x68\x6f\x70\x20\x32\x33\x2e\x35\x20\
-\x28\x57\x69\x6e\x64\x6f\x77\x73\x29\x22\x3e\x20\x3c\x78\x6d\x70\
-\x4d\x4d\x3a\x48\x69\x73\x74\x6f\x72\x79\x3e\x20\x3c\x72\x64\x66\
-\x3a\x53\x65\x71\x3e\x20\x3c\x72\x64\x66\x3a\x6c\x69\x20\x73\x74\
-\x45\x76\x74\x3a\x61\x63\x74\x69\x6f\x6e\x3d\x22\x73\x61\x76\x65\
-\x64\x22\x20\x73\x74\x45\x76\x74\x3a\x69\x6e\x73\x74\x61\x6e\x63\
-\x65\x49\x44\x3d\x22\x78\x6d\x70\x2e\x69\x69\x64\x3a\x65\x65\x66\
-\x34\x30\x63\x65\x66\x2d\x62\x64\x30\x31\x2d\x31\x65\x34\x39\x2d\
-\x61\x62\x35\x34\x2d\x30\x38\x62\x65\x65\x35\x36\x39\x33\x38\x64\
-\x66\x22\x20\x73\x74\x45\x76\x74\x3a\x77\x68\x65\x6e\x3d\x22\x32\
-\x30\x32\x34\x2d\x30\x34\x2d\x30\x35\x54\x32\x30\x3a\x35\x33\x3a\
-\x35\x34\x2d\x30\x33\x3a\x30\x30\x22\x20\x73\x74\x45\x76\x74\x3a\
-\x73\x6f\x66\x74\x77\x61\x72\x65\x41\x67\x65\x6e\x74\x3d\x22\x41\
-\x64\x6f\x62\x65\x20\x50\x68\x6f\x74\x6f\x73\x68\x6f\x70\x20\x32\
-\x33\x2e\x35\x20\x28\x57\x69\x6e\x64\x6f\x77\x73\x29\x22\x20\x73\
-\x74\x45\x76\x74\x3a\x63\x68\x61\x6e\x67\x65\x64\x3d\x22\x2f\x22\
-\x2f\x3e\x20\x3c\x72\x64\x66\x3a\x6c\x69\x20\x73\x74\x45\x76\x74\
-\x3a\x61\x63\x74\x69\x6f\x6e\x3d\x22\x73\x61\x76\x65\x64\x22\x20\
-\x73\x74\x45\x76\x74\x3a\x69\x6e\x73\x74\x61\x6e\x63\x65\x49\x44\
-\x3d\x22\x78\x6d\x70\x2e\x69\x69\x64\x3a\x36\x64\x64\x63\x65\x34\
-\x63\x63\x2d\x66\x66\x38\x32\x2d\x37\x35\x34\x63\x2d\x38\x34\x61\
-\x38\x2d\x35\x61\x35\x33\x39\x31\x65\x36\x35\x61\x39\x66\x22\x20\
-\x73\x74\x45\x76\x74\x3a\x77\x68\x65\x6e\x3d\x22\x32\x30\x32\x34\
-\x2d\x30\x34\x2d\x30\x39\x54\x31\x35\x3a\x31\x34\x3a\x31\x34\x2d\
-\x30\x33\x3a\x30\x30\x22\x20\x73\x74\x45\x76\x74\x3a\x73\x6f\x66\
-\x74\x77\x61\x72\x65\x41\x67\x65\x6e\x74\x3d\x22\x41\x64\x6f\x62\
-\x65\x20\x50\x68\x6f\x74\x6f\x73\x68\x6f\x70\x20\x32\x33\x2e\x35\
-\x20\x28\x57\x69\x6e\x64\x6f\x77\x73\x29\x22\x20\x73\x74\x45\x76\
-\x74\x3a\x63\x68\x61\x6e\x67\x65\x64\x3d\x22\x2f\x22\x2f\x3e\x20\
-\x3c\x2f\x72\x64\x66\x3a\x53\x65\x71\x3e\x20\x3c\x2f\x78\x6d\x70\
-\x4d\x4d\x3a\x48\x69\x73\x74\x6f\x72\x79\x3e\x20\x3c\x2f\x72\x64\
-\x66\x3a\x44\x65\x73\x63\x72\x69\x70\x74\x69\x6f\x6e\x3e\x20\x3c\
-\x2f\x72\x64\x66\x3a\x52\x44\x46\x3e\x20\x3c\x2f\x78\x3a\x78\x6d\
-\x70\x6d\x65\x74\x61\x3e\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x3c\x3f\x78\x70\x61\x63\x6b\x65\x74\
-\x20\x65\x6e\x64\x3d\x22\x77\x22\x3f\x3e\xff\xe2\x01\xcc\x49\x43\
-\x43\x5f\x50\x52\x4f\x46\x49\x4c\x45\x00\x01\x01\x00\x00\x01\xbc\
-\x41\x50\x50\x4c\x02\x20\x00\x00\x6d\x6e\x74\x72\x47\x52\x41\x59\
-\x58\x59\x5a\x20\x07\xd7\x00\x01\x00\x18\x00\x01\x00\x00\x00\x00\
-\x61\x63\x73\x70\x41\x50\x50\x4c\x00\x00\x00\x00\x45\x50\x53\x4f\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\xf6\xd6\x00\x01\x00\x00\x00\x00\xd3\x2d\x45\x50\x53\x4f\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x05\
-\x63\x70\x72\x74\x00\x00\x00\xc0\x00\x00\x00\x49\x64\x65\x73\x63\
-\x00\x00\x01\x44\x00\x00\x00\x77\x77\x74\x70\x74\x00\x00\x01\x0c\
-\x00\x00\x00\x14\x62\x6b\x70\x74\x00\x00\x01\x20\x00\x00\x00\x14\
-\x6b\x54\x52\x43\x00\x00\x01\x34\x00\x00\x00\x10\x74\x65\x78\x74\
-\x00\x00\x00\x00\x43\x6f\x70\x79\x72\x69\x67\x68\x74\x20\x28\x43\
-\x29\x20\x53\x45\x49\x4b\x4f\x20\x45\x50\x53\x4f\x4e\x20\x43\x4f\
-\x52\x50\x4f\x52\x41\x54\x49\x4f\x4e\x20\x32\x30\x30\x37\x2e\x20\
-\x41\x6c\x6c\x20\x72\x69\x67\x68\x74\x73\x20\x72\x65\x73\x65\x72\
-\x76\x65\x64\x2e\x00\x00\x00\x00\x58\x59\x5a\x20\x00\x00\x00\x00\
-\x00\x00\xf3\x51\x00\x01\x00\x00\x00\x01\x16\xcc\x58\x59\x5a\x20\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x63\x75\x72\x76\x00\x00\x00\x00\x00\x00\x00\x01\x02\x33\x00\x00\
-\x64\x65\x73\x63\x00\x00\x00\x00\x00\x00\x00\x18\x45\x50\x53\x4f\
-\x4e\x20\x20\x47\x72\x61\x79\x20\x2d\x20\x47\x61\x6d\x6d\x61\x20\
-\x32\x2e\x32\x00\x00\x00\x00\x00\x00\x00\x00\x18\x00\x45\x00\x50\
-\x00\x53\x00\x4f\x00\x4e\x00\x20\x00\x20\x00\x47\x00\x72\x00\x61\
-\x00\x79\x00\x20\x00\x2d\x00\x20\x00\x47\x00\x61\x00\x6d\x00\x6d\
-\x00\x61\x00\x20\x00\x32\x00\x2e\x00\x32\x00\x00\x00\x00\x18\x45\
-\x50\x53\x4f\x4e\x20\x20\x47\x72\x61\x79\x20\x2d\x20\x47\x61\x6d\
-\x6d\x61\x20\x32\x2e\x32\x00\x00\xff\xee\x00\x21\x41\x64\x6f\x62\
-\x65\x00\x64\x00\x00\x00\x00\x00\x03\x00\x10\x03\x00\x01\x02\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xdb\x00\x43\x00\
-\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\
-\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\
-\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x02\x02\x02\x02\x02\
-\x02\x02\x02\x02\x02\x02\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\
-\xff\xc2\x00\x0b\x08\x01\xbe\x01\xbe\x01\x01\x11\x00\xff\xc4\x00\
-\x8f\x00\x00\x02\x02\x02\x03\x01\x01\x01\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x01\x02\x09\x08\x0a\x03\x05\x07\x06\x04\x0b\x10\x00\
-\x01\x01\x07\x04\x02\x02\x02\x02\x02\x02\x03\x01\x00\x00\x00\x01\
-\x11\x00\x02\x05\x06\x07\x08\x09\x10\x21\x03\x04\x31\x12\x20\x0a\
-\x41\x22\x30\x32\x40\x42\x13\x14\x15\x17\x18\x19\x11\x00\x01\x03\
-\x02\x04\x03\x04\x09\x02\x05\x03\x04\x02\x02\x02\x03\x01\x02\x03\
-\x04\x11\x05\x00\x21\x06\x07\x31\x41\x12\x51\x61\x71\x08\x10\xf0\
-\x81\x91\xa1\xb1\x22\x13\x14\xc1\x09\x20\xd1\xe1\xf1\x15\x32\x23\
-\x16\x30\x42\x24\x17\x40\x52\x72\x33\x62\x25\xa2\x34\x0a\xff\xda\
-\x00\x08\x01\x01\x01\x00\x00\x00\xdf\xd1\x92\x43\x64\x7a\x9d\x2d\
-\x76\x8a\xf9\xed\x71\xb6\xa5\xc8\xc6\x00\x00\x08\x5a\xeb\x6c\x45\
-\xfa\x18\x00\x01\xf8\xea\x8a\xd9\xa5\x16\x94\xff\x00\x2d\x32\x5d\
-\x04\xe3\x30\x24\x1e\x7d\xae\x65\xfc\xfb\xc4\x7c\xcf\x5d\x0d\x9f\
-\x39\x00\x00\x00\x23\x54\xde\xa9\x60\xcc\x04\xa4\x11\x2a\xca\xd0\
-\x3f\x6a\x84\xc2\x35\x39\x6a\x9d\x89\x20\x05\x8d\xba\xfd\x6c\xeb\
-\xf4\x91\x6a\xaa\x7c\xea\xe7\x06\x98\x00\x01\xd7\xeb\xfd\xb0\x79\
-\x22\x32\x01\x27\x8a\x7f\x25\x9a\xf0\x92\x91\x1c\x18\xfd\x99\xb8\
-\xe5\x16\x9d\x78\xd6\xfe\xc4\x1f\xbc\x1c\x56\xb8\x96\x47\x63\x13\
-\x4c\x00\x89\x25\x1d\x7b\xef\xf3\xb6\x04\x4a\x12\x42\xe0\xaa\x3b\
-\x60\x94\x54\xd2\xf9\xaa\x00\xd8\x8f\x94\x17\x1d\x18\xfd\x75\xd2\
-\x4c\x43\x4f\x83\x58\x5b\x5d\xb2\x29\x11\x92\x64\x24\xc8\xe0\x6b\
-\xcf\x38\xb1\xc5\x91\x94\x61\x57\x36\x61\xdc\x45\x0c\x8d\x50\x5b\
-\x04\x9c\x7e\x6b\x5e\xab\x36\xb0\x6e\x44\xd3\x23\x28\xf1\xeb\x5d\
-\x64\xb6\x5f\x30\x43\x8c\x90\xba\xca\x3c\xbd\x66\x42\x4c\x4d\x28\
-\x78\x5e\x3d\xe7\xb8\x0e\x2f\x1a\x72\x5d\x3c\x26\xa6\x5d\x86\x7d\
-\x75\x4d\xa4\xda\x05\xc7\xaf\x06\x53\x5b\xe4\xd0\x0c\x41\xc7\x46\
-\x97\x99\x21\x47\x90\x8b\x4a\x3c\x55\x85\x67\x3c\xb2\x18\xb8\x79\
-\xbe\x52\x88\xfd\xb6\xe5\xff\x00\x43\x09\x21\x49\x34\x47\x8b\x50\
-\xab\x39\xbb\xf9\xb1\x48\x50\x97\x15\x24\x5d\x0f\x74\xa4\x34\x45\
-\x22\x3a\xfb\xd3\xef\xbf\xee\x05\xfa\x40\x35\xb9\xf4\x6b\xae\xf5\
-\x29\xb2\x51\x6c\x52\x13\x8c\x30\x9a\x9d\x76\x39\xfa\xae\x58\x49\
-\xa6\x71\xce\x38\xe1\x86\x96\xb1\x32\x13\x22\x44\xf3\xdd\x72\xfa\
-\xdb\x2e\xfa\x6a\x8b\xda\x92\x6d\x18\xc5\x93\xa3\xe4\x62\x63\x8c\
-\x9a\x4b\xe6\x69\x57\x3b\x73\x89\x72\x10\x9b\x40\x28\x71\xd1\x75\
-\xe9\xce\x71\x52\x5c\x6a\x9a\x2a\xfb\x66\x5f\x72\xaa\xdb\x4d\xd7\
-\x6b\x22\xee\x80\x0a\x10\xe8\xfa\xef\x67\xb5\xff\x00\x58\x1b\x27\
-\x07\x25\x1f\x32\xa4\xcb\xd0\xfa\xf7\x28\xc9\x88\x25\x08\xb8\x55\
-\xee\x65\xfb\xc4\x9a\x8b\xe9\xb5\x51\xb3\x8b\x8b\x6a\xb5\xec\x53\
-\xb0\xd5\x1b\x60\xbc\xb3\x01\x43\x1b\x2b\xbf\xc6\x38\xb2\x0a\xce\
-\x3d\x6a\x41\x35\x1c\x20\xcd\x6f\xd2\xa6\x99\x28\x8a\x51\x8c\x92\
-\xe8\xa9\xfa\xe7\x5c\xe3\x0f\x01\xd5\xa7\x66\xbc\xa9\x00\x4b\xf0\
-\x69\xdb\x76\x76\xdb\x37\x24\x85\xc5\x8f\x75\x7b\xf0\xdf\x1d\xdb\
-\x59\x56\x68\xf7\xfc\xca\x49\xca\x3c\x90\x9c\x48\xca\x20\x82\x89\
-\x6f\x5e\x42\xa5\xda\xca\xda\xb7\xea\x98\x00\x9f\xe5\xd6\xe7\xe3\
-\x76\x4a\xfb\xa9\x26\xa2\xc4\xbf\x0f\x9a\x61\xbe\x14\x2e\x5f\xd3\
-\xd1\xfe\xdc\x80\xce\x2c\x89\xec\x65\x19\x44\x92\x70\x68\xa8\x4f\
-\x0a\xbe\x7d\x7c\xf0\x76\xe5\x6d\x81\x80\x02\x60\x57\x6e\xa3\x3b\
-\xff\x00\x42\x42\x83\x1c\x66\x45\x49\x46\x3f\x97\xc9\x30\x37\x1d\
-\xbe\x27\xf6\x65\x05\x97\xfd\xe8\xda\x02\x7d\x27\xf2\xbd\xfe\xa6\
-\x1e\x45\xef\x9f\xa8\x00\x4d\x0c\x15\x44\x55\xce\xd8\x4e\x24\xa0\
-\x49\x27\x28\xc7\x92\x2a\x51\x69\x2e\x3f\x03\xac\xcf\x8a\xf9\x5c\
-\xa4\xb4\x4f\xaa\x06\x2a\xa6\xb5\x3e\x60\x00\x04\xe2\x0f\x1e\xfc\
-\xcf\x34\x39\x82\x1c\x90\x8f\x23\x88\x46\x4c\x51\x90\xd2\x8b\x4b\
-\x8f\x12\xeb\x53\xe3\x3f\x1e\x68\x59\xbf\x76\x27\xe6\x9f\x73\xd9\
-\x00\x27\x05\x35\x0a\xbd\xfa\x4b\x22\x94\xa4\x11\x68\x5c\x90\x64\
-\x64\xe3\x28\xb9\x45\x44\x04\xd4\x7a\xec\x2b\xaf\xce\xf7\xe3\x3e\
-\x8f\x3b\xb4\xc7\xe4\xdf\xbf\xec\xd8\x02\x71\xe1\xa4\xcf\x59\xb6\
-\x26\xb9\xa0\xe5\x16\x11\x60\xe1\x25\x38\xa9\x28\x72\x71\x92\x21\
-\x24\x9a\x0e\x2e\x8b\x0d\xeb\xba\xa0\x30\x13\x68\x9b\x92\xf5\x86\
-\x34\xbc\x4f\x5c\x6b\x68\xb3\xe6\x39\x82\x93\x89\x16\x4d\x28\xce\
-\x13\x12\x8c\xe0\x09\xa6\x21\xa0\x08\x69\xb1\xb5\xfe\x0e\x62\x37\
-\x79\x6d\x5e\xfb\x2f\x33\xd0\xfb\x4a\x4d\xf5\xf6\x43\xce\x3f\x69\
-\xe4\xe5\x81\x38\x93\x8c\x65\x0e\x44\x21\x0e\x5c\x64\x93\xe1\xe4\
-\x4d\x31\x34\x01\xf9\x28\xfe\xf2\x5a\xeb\xa8\x5a\x19\x4b\x8c\x37\
-\x9b\xe3\x1e\xaf\xf3\x95\x4f\xe1\x1d\x66\xc8\xb0\x9a\x42\x91\x28\
-\x12\x88\x46\x40\x04\x5a\x4c\x13\x10\x01\x8f\x3e\x01\x60\x8c\x5c\
-\x5a\x1e\xed\x51\x63\x92\x94\xc8\x10\xfd\x2a\x2c\x4d\xa1\xc6\x71\
-\x8b\x25\x02\x42\x40\x93\x44\xd4\x46\x9a\xa4\x1b\x9b\xfa\x30\x8f\
-\xe6\xd4\xe7\x6c\xae\x67\x39\x26\xa3\x24\x0e\x5c\x7c\x90\x72\xe3\
-\x99\x15\x34\xa4\xa2\x0a\x50\x6e\x2c\x4d\x34\x46\x9c\x2e\x3e\x41\
-\x1c\x0f\xf2\x3b\x4c\x9b\x94\x83\x8c\xc7\x1c\x8b\x9c\x67\x28\xcc\
-\x82\x6a\x51\x92\x4e\x33\x83\x10\x86\x09\xa6\x23\xca\xb0\x36\xd1\
-\xc0\x86\xb2\x3b\x30\xf6\x12\x63\x71\x81\x4f\x18\xed\xd7\xfa\x05\
-\x8c\xe5\xcf\x60\xc2\x24\xa5\x01\x26\x0d\x20\x01\xa1\xa0\x0a\xbe\
-\xb1\x1f\xb0\x05\xf3\xfa\xa3\x6d\xb4\x49\xca\x3c\x90\x8c\x89\x71\
-\x7c\xdd\x7d\x62\x2f\xcc\x4f\x37\xf3\xcb\xed\x8e\x48\xa0\x38\x4e\
-\x56\x9a\x10\xc4\xd3\x40\xab\x62\xca\x00\x29\xcb\xe8\xed\xad\xc9\
-\xce\x2d\xf1\x72\x28\xc6\x7c\x6d\x75\x38\x57\x86\x1e\x1b\xf6\x7f\
-\x79\x60\xf9\x45\xd8\x8e\x33\x43\x04\x34\x31\x00\x78\xa6\x31\x58\
-\x40\x06\xa8\xdb\x4b\x7d\x24\x99\x38\xc9\x25\x3e\x36\xd2\x22\x0f\
-\x8f\xc5\xeb\xdf\xc1\xff\x00\x47\xe7\xfb\x7c\xe0\xca\xef\xa4\x92\
-\x4c\x1a\x62\x06\x8a\x5b\xb8\xde\xdc\x08\xea\x79\xb6\x2c\xda\x7c\
-\x88\x6b\x8e\x42\x1b\x82\x44\x84\x25\xc7\xe5\xb8\x1d\x8c\x5f\x33\
-\xf5\x7f\x97\x9f\x27\x33\xa7\xd4\xbf\x53\x00\x68\xf2\x0c\x48\xb1\
-\x60\x0c\x76\xa6\x3d\x89\x66\xd4\xa4\xe2\xd2\x53\x81\x21\x71\x9c\
-\xbc\x6c\x42\x11\x28\xa8\xfc\xfe\x32\x61\xff\x00\x9a\xfe\xff\x00\
-\x4a\x3d\x1f\x34\xbe\xdf\xbc\x9c\x2a\x0e\xd8\xfb\xe8\x81\xaf\x9d\
-\xc0\xe4\x64\xdc\x79\x13\x69\x30\x51\x9a\x4a\x2e\x2d\xa0\x08\xc9\
-\x20\x01\x1c\x3e\x7f\xf3\x1d\xcf\xd2\xf4\x78\x61\xda\xd8\x38\x86\
-\xb5\x5e\xda\x7b\x91\xb9\x32\x48\x13\x8c\xd4\x59\xc7\x28\xa1\x36\
-\x27\x16\x81\x89\xa1\x88\x00\x18\x9f\x51\xab\xce\xd3\xa3\x9c\x66\
-\xd2\x93\x88\xc4\xe2\x80\x80\x29\x38\x8b\xe2\x28\xf6\xab\xf6\x7a\
-\xcd\x00\x21\x22\x49\xc7\x11\xaa\x9a\xeb\xfd\x86\x40\x56\xaf\x94\
-\xdc\x0b\x26\xc0\x1b\x8b\x51\x98\x90\xb8\xe4\xe0\x35\xd1\xd2\xf5\
-\x7b\xfd\xf5\xd5\xd2\x65\xf6\x65\x22\x69\x49\x0e\x50\xfc\xb5\xef\
-\x4a\xb4\x81\xec\x1b\x7f\x58\xe3\xd5\xaa\xae\xb7\xa4\xfb\x73\x9a\
-\x2c\x24\x9a\x22\x49\xf1\xca\x28\x14\x78\xb0\x36\xa0\xfa\xdb\x86\
-\xcf\xae\x53\x5c\x4b\xa3\xc9\x96\x24\xff\x00\x2d\x41\x58\x7f\xbb\
-\xb0\x5f\x96\x9a\xf4\x01\xdb\x8b\x6b\x8d\x3a\x7e\x7a\xd9\xed\xe7\
-\xd5\xf9\xc6\xd4\x93\x22\x84\xb9\x23\xc6\xa1\x8d\x75\x4f\x85\x7d\
-\xa5\x9b\xda\xff\x00\x74\x34\xb5\x9e\xd8\x3b\xd5\x01\x1f\x09\xa6\
-\x46\xc6\xbe\x2b\xe1\xd6\x8f\x9a\x2d\x33\xc9\x7f\x92\x7e\xf9\xb8\
-\x63\xb8\x4f\xce\x54\x0f\x71\x6f\x7d\x9c\xa5\x19\x09\xfe\x43\xe5\
-\x7c\xaf\xce\x30\xd7\x07\xfe\x43\xe2\xbb\x6f\x69\xba\xdc\xa4\xe7\
-\x4d\xb1\x2d\x56\x76\x81\xfa\x46\x3f\x91\xd5\x93\x63\x5c\x94\x7f\
-\x9f\x5d\x8f\x7f\xba\x4f\xd3\xe5\x5f\x7f\xdb\x61\xfd\x0b\xfa\x96\
-\xc6\x7f\x47\x2f\x09\xa7\x3f\x75\xb7\x6e\xe5\xcc\x17\xf1\x71\xdc\
-\x06\xcc\x7d\x57\xeb\xf2\xb7\x30\x3d\x3b\xb7\x60\x38\xb9\xc4\x51\
-\xd4\xe7\x6c\x1e\x65\x28\xd1\x4e\x79\xe7\x24\xa4\xf8\xf4\x5c\xac\
-\x4d\xb8\x2c\x43\x49\xdb\x1b\xca\x0b\x88\xec\x34\xd5\xfe\x84\x1c\
-\xf2\x5e\x1f\x4f\xbd\x85\xb6\x7b\xbb\x99\x4a\xf6\x7b\xec\xc4\x86\
-\x09\x09\x35\x22\x24\x75\x4d\xda\xc6\x49\xe2\x2e\x1b\x5c\x14\xa4\
-\xe4\xbc\x26\x8c\xb3\xde\xd0\x3c\x46\x8f\xed\x3a\x90\xf1\x67\x52\
-\x9f\xe8\x1d\x7f\x5d\xc0\xdf\xca\xd4\x67\x88\x7d\xbd\xc7\x7a\x2f\
-\xe0\xec\xc5\x31\x32\x28\x4e\x32\x52\x23\xf8\xf5\x3a\xdb\x38\x71\
-\xd6\xfe\xf0\xbd\xff\x00\x95\x39\x1c\x67\x1c\xf9\x3e\x76\xa2\x3d\
-\x6e\xcd\x31\x97\x55\xec\x13\xb7\x9d\xa4\xfe\x8e\x49\xf1\xf8\x85\
-\x50\x78\xae\xc7\x52\x44\x84\x3e\x29\xa4\xd0\xd4\xa3\x84\x75\x45\
-\xb1\xab\x78\xc3\x84\xd6\xed\x29\x27\x26\x00\x46\x38\x7f\x5f\x37\
-\x7d\xc9\x52\x3e\x99\x62\xdd\x90\x11\x27\xc7\xca\x21\x82\x51\x9b\
-\x49\xa8\xc8\x5a\xb7\xec\x2f\xee\xae\x34\x7b\x6d\x7e\xb9\x20\x06\
-\x00\x04\x71\x62\xab\xaf\xc5\xd2\xf7\xac\x5a\x6c\xd8\x85\x24\x0e\
-\x2d\x91\x60\xe0\xc4\x4b\x8b\x51\x3d\xb9\xf9\x15\x79\x46\xc4\x65\
-\x32\x33\x4c\x00\x4c\x2b\xa7\x0e\x6f\x55\xd4\x77\x88\xde\xef\x2c\
-\xa2\xe4\x86\x09\x80\x09\xc4\x60\xa1\xa7\x9e\xe1\x32\xf3\x8a\xb2\
-\xb9\x2e\x66\x30\x00\x00\x02\x1a\xf0\xdc\xae\x44\xac\x04\xaa\xed\
-\x83\x7d\x09\x0d\xa6\x08\x60\x42\x68\x23\x34\x97\x17\x2f\xe4\xd7\
-\xde\xfe\x3b\x99\x8c\x60\x00\x00\x07\x5f\xaa\xee\xd2\x3d\xfc\x7c\
-\x3f\x5c\x5d\x89\xb2\x08\xe5\x4c\x60\x00\x86\x42\x50\x93\x51\x53\
-\xaf\xbf\x64\xc9\xf6\xd8\x00\x00\x00\x01\xe1\x54\xa9\xb0\x3f\x6f\
-\x1e\xbb\x5b\x9b\x23\xb3\x0e\x66\xc0\x00\x00\x8c\x3f\x26\x35\x60\
-\xf7\x97\xfe\xce\x97\xf4\xde\xb5\x42\xdb\x37\x6f\x24\xd0\xc0\x00\
-\x00\x01\x7c\x16\xb3\x9b\x47\x76\x64\x6a\x8f\x06\xb6\x33\xfd\xd2\
-\x00\x01\x32\x38\x81\xac\xd6\x63\xfb\x26\x6c\x7b\x17\xef\xf5\xfe\
-\xab\xd8\x68\x56\xfb\x39\x40\x00\x00\x00\x00\x03\x13\xa9\xd7\x63\
-\x89\xa3\x0b\xa9\x8f\x60\x8f\x66\x4d\x0c\x08\xbc\x6f\xd1\x4b\x01\
-\xef\xb2\xd6\xf3\xd7\x36\xbb\xb9\x9e\x77\xa2\x76\xfa\x3f\x45\xc9\
-\xc6\xe4\x30\x00\x00\x00\x02\xa3\x7b\xdb\x53\x6d\x79\xfd\x02\xec\
-\x76\x00\x00\x47\x5e\x1d\x80\x3b\xcf\xc1\x84\x74\x6d\x88\x39\x3d\
-\xb1\xde\x4c\x4e\xbf\x68\x5f\x6e\x3e\x76\xc0\x00\x00\x00\x00\x15\
-\x30\xe4\x35\x8b\x4c\x22\xd8\x00\x07\x8d\xd5\x0d\xdf\x4a\x49\xf1\
-\xe2\xfd\x23\x79\x6d\xeb\xe6\x6d\x48\x63\xcd\xfc\xf3\x30\x00\x00\
-\x00\x00\x02\x34\x01\x62\xb9\xd8\x07\x8c\xfb\x14\xc1\x80\x6b\xf7\
-\x75\xde\xaa\xe3\x20\x47\xc2\x6b\xed\x5b\x79\x1b\xe9\x76\xb9\x66\
-\x33\x62\x60\x00\x00\x00\x01\xc7\xad\x56\xc1\x1e\xa2\x15\x7d\xe6\
-\xbd\x8e\x64\xe5\x57\x2c\x91\x1d\x65\x36\x69\xe5\x00\x01\x1f\x9e\
-\xba\xff\x00\x9e\xfd\x76\x7f\x53\xfb\x0f\x90\x00\x00\x00\x00\x00\
-\x7c\xa6\xb4\x9b\x2b\xfd\x78\x2e\x97\x05\x31\x6f\x8f\x35\xb3\x3b\
-\x9f\x1a\x6a\xf6\xf6\xd3\x04\xc0\x05\x89\xb8\x83\xae\xd5\xd9\xdf\
-\x0c\x80\x00\x00\x00\x00\x03\xcc\x75\xc3\xd9\xbb\xbc\x05\x19\xf5\
-\x94\xe1\x89\x16\x61\x57\x9b\x01\x7b\x43\x60\x00\x09\x9c\x5a\xca\
-\xe9\xfd\xfd\x45\x7d\x69\x80\x00\x00\x00\x00\x06\x30\xd3\x66\xc4\
-\x9f\xff\xda\x00\x08\x01\x01\x00\x01\x05\x00\x74\x02\x0a\x23\xa1\
-\x02\x32\x23\x7e\xaa\x01\xd4\xa0\x31\xd8\xe4\x1e\x5b\x84\xde\x74\
-\x36\xe9\xfe\xc2\x17\x73\x67\x98\xff\x00\xb5\xab\x19\xa6\x57\xbd\
-\x66\xb4\xca\xfc\x6d\x36\x7d\xfa\xe6\x59\xbe\x3c\xe4\x6b\x50\xad\
-\xd0\x3b\x87\xa0\x40\x83\xfc\x88\x18\x3a\x03\x3c\x01\x6b\x8f\x88\
-\xf7\xac\x33\x2c\xfd\x5e\xc7\x0f\x67\x81\xe0\xa3\xe6\x8b\xaf\x7f\
-\xa7\xc1\xdf\xe9\xd9\x5c\xdc\xf5\x24\xb9\x55\x1e\xa0\xfb\x33\xa0\
-\x82\x48\x40\x15\xd0\x85\x8e\xed\xd8\xe0\xe2\xec\x70\x63\xf9\xc7\
-\xed\xee\xe6\x14\x22\xbd\xed\xfe\xc5\xe0\x8a\x55\xe2\x83\x73\xaf\
-\x86\xa9\xf5\x46\x41\xa3\x92\x55\x47\x98\x6e\x2b\x37\xb3\x8d\xb9\
-\xdb\xdd\x38\xb6\x6a\x52\x03\x3d\xc6\xeb\xce\xd5\xba\x55\x2c\x56\
-\x2a\x5b\x8d\xfa\xdd\x50\xec\x2e\xf0\x1d\xe4\x0f\x0f\xe5\x78\xa0\
-\xcc\xad\xbc\xc5\x6b\xe5\x8d\xe3\x02\xe3\xf8\x2e\x82\xcb\x3c\x7c\
-\x41\x50\x57\xe0\xf2\xb1\x0d\x7a\x10\x3e\x6a\x61\x70\x9d\x6e\x77\
-\x7b\x3d\x63\xb3\x02\x7d\x41\x46\x04\x81\xb8\x74\xb3\xc1\x05\xe2\
-\xc0\xf8\xe8\xd5\xd5\x8e\xef\x07\xfd\x00\x43\x07\xbd\x99\x77\x27\
-\x72\x8c\x4e\xcb\xbb\xcf\x23\x5d\x35\xd8\xd1\x2b\x3a\xa4\x94\x5e\
-\x96\xdc\xa6\x6f\x2a\x0c\xa9\x2a\xcb\x92\x4c\xbc\xde\xc8\x5e\x0a\
-\x02\x97\x72\x67\x61\x42\xea\xa5\x6c\x53\x64\xba\x17\x76\x72\xd7\
-\xb0\x42\x53\x40\x54\x7c\xf6\xd6\x27\xd0\xea\x45\x7a\x18\xdd\xec\
-\xf5\x6c\xda\xf6\x5d\x24\xb7\xb0\xd5\x54\xe8\x3c\x32\x95\x08\xaa\
-\xd7\xa1\x47\x78\xeb\x9d\xb9\xd8\x1d\x52\x8c\xd5\x0b\x68\xf6\x56\
-\x05\xe5\x28\x40\x79\xe0\xdf\x8f\x64\x75\xe0\xd9\x15\x91\x7b\xb3\
-\xb5\xab\x39\x70\xdd\x17\xec\x68\xa3\xac\x01\x75\xb7\x62\xa0\x00\
-\x43\x22\xbc\xf1\x46\xbf\x6c\x89\x52\x4b\x1e\x92\xed\xb7\x1c\xf5\
-\xb2\xf3\x6a\xbc\x3a\x19\xd1\x84\xf4\x3c\x04\x2d\xbe\x84\x28\x2e\
-\xfe\xb9\x7e\xb1\xda\xa5\x21\xcc\x38\xe9\xc8\x3d\x33\xbe\xda\x44\
-\xea\x68\x9b\xef\xf2\x77\xc0\x2a\x5b\xc3\x7a\xfb\x1c\xb5\xcb\x51\
-\x4a\x15\x76\x70\x18\x97\x5e\x33\x08\xfc\xa3\x7e\x08\x42\x41\x42\
-\xc0\x10\xea\x6c\xea\x00\x9e\xae\xa6\xef\xf1\xbb\xcb\xc7\x40\x3a\
-\x1d\x7b\x71\xbd\x60\xdb\x87\x48\x60\xa8\x08\x07\xd4\x02\x55\x67\
-\x09\x7b\xa9\x35\xca\x94\xa8\x4f\x71\x9b\x28\x20\x93\xb8\x62\xf2\
-\x33\xc7\x64\x2b\xc9\xca\xe7\x17\x1d\xf8\xe5\xdb\xab\x4d\xe2\x98\
-\xfa\xc6\xc4\x2e\x4d\x88\xb8\x13\x52\xad\xbe\x8b\xbb\x73\x70\x71\
-\x76\x38\xaf\xef\x1b\xb5\x5e\xd1\x2a\xc6\x3d\xf2\x3d\x48\xaf\xa6\
-\x9f\x02\x35\x77\xfa\xb2\xef\xa7\xf5\x60\xba\x8d\xce\x4b\xa8\xc7\
-\x15\x72\xb2\xac\x69\xd4\xcf\xfd\xa7\x65\xcc\x55\x82\xa2\xee\xce\
-\xab\x1d\x82\xab\x3a\xee\xc7\x44\x2d\x90\x19\x72\x2d\x26\xce\xd0\
-\x38\xbf\x52\x3b\x09\x7c\xa1\x6f\x00\x05\x2a\x43\x1d\xcf\x91\x2e\
-\x4b\x2f\x48\xf9\x02\x4d\x89\xd9\xe5\x4f\x62\xd3\x7c\xe5\x2c\x48\
-\x52\xe5\x6b\xbd\x2a\xe7\x93\x0a\x81\x65\xf8\xe4\xa0\x96\x5f\x28\
-\xf1\xb8\xeb\x8e\xb1\x4d\x06\xc3\x42\x02\xb7\x91\xcb\xc6\xe7\x23\
-\x99\x0a\xc6\x8d\x58\xa4\x95\xe7\x1f\xf9\x35\xa1\x97\xc7\x2e\x3a\
-\x54\xa8\x1f\x0f\x3a\x22\xb7\xe4\x94\xd0\x3a\x01\x8d\x74\x38\x22\
-\x90\xac\x31\xc4\x39\x65\x1e\x77\x54\x1f\x20\x82\xcf\x23\xc0\x04\
-\x75\x40\x65\x46\x28\x0a\xed\xb9\x60\x40\x0f\x7f\x6b\x92\xa6\x6e\
-\xd5\xea\x25\x8e\xfa\xb6\x6a\x4d\x0b\x25\x58\xe8\x0a\x15\x42\xc7\
-\x63\x52\x69\xbf\x14\x4a\xe0\x10\x22\x33\xa5\x0d\xe1\x5f\xd5\xbb\
-\x59\x4c\xab\x26\xd0\xeb\xbb\xcc\x6c\xf1\x45\x68\x55\x29\xb7\xa9\
-\x17\x6f\x57\x54\x04\x4d\x03\x6e\x58\x04\xd0\x85\x60\x81\xb7\x57\
-\x8a\x07\xdc\x71\xe7\x72\x57\x8b\xa9\xb2\x1f\x3d\x62\xcb\x29\xb2\
-\x1d\xfa\x53\xe5\x0f\x06\x0a\x41\x28\x37\x43\xa1\x0b\xa0\x2d\xb0\
-\x67\xc2\xb5\x11\x3d\xda\x61\x98\x07\x4a\xb1\x28\xc5\xe2\xa9\xea\
-\x43\xca\xf2\x6e\xf7\x84\x56\x04\x16\x24\xba\x36\x04\x83\xec\xf8\
-\x0f\x3b\x4f\x7b\xbc\x16\xfd\x7a\x5c\x5d\x8e\x2e\x57\x5d\x7d\xc7\
-\xdd\xd3\x7d\x79\x38\x38\xf9\x79\x1a\x74\x9e\x65\x0a\x77\x2e\xd6\
-\x8c\xa4\x55\xab\xa0\x9c\x6c\xe7\x11\xb2\xcd\x28\x9a\xf8\x38\x78\
-\xf8\x38\xce\xec\x3c\x15\x47\x49\xd0\x04\xd3\x75\x60\x54\x31\x0a\
-\x48\x56\x79\x54\x86\xcf\x1d\x35\xb4\x8b\x63\x99\x70\xeb\x90\x7a\
-\x8f\x73\x74\xeb\xdd\x58\x07\x83\x20\x63\xe4\xa9\xf8\x29\x24\x15\
-\x0a\xa7\x23\xf2\xbf\x52\x80\xdc\xc4\x0e\x31\xd1\x8f\x42\x76\x2e\
-\x85\xf6\x6f\x50\x1b\x76\xdd\x7d\x95\x8a\xb3\xc0\x97\x80\x52\xa5\
-\x7c\x9c\xed\xde\x65\x09\xb1\x8a\x7f\x26\xdd\x66\x6b\x33\xb7\x26\
-\x63\x4a\xe8\x2e\x5f\x18\x57\x05\xd3\xed\xf5\xfb\xfd\x5f\x8d\x59\
-\xcf\xe4\xb7\x12\x9b\xfa\xd8\xe2\xbb\x9b\xcd\xed\x52\x0a\x2f\x4c\
-\x68\x44\x90\xce\x9f\x53\xfe\xc1\xe2\x80\xb7\xb2\x15\x0f\x00\x41\
-\x62\xf0\x0c\xe9\x5d\x09\x46\x0f\x6c\xbb\x97\xc3\x1e\x40\x05\xd0\
-\xde\x35\x3a\xa2\xf0\x2b\x12\xc2\x4f\x6a\x37\x57\x20\xf2\x44\xa1\
-\x01\xef\x80\x4b\x29\x6f\x76\x0f\x12\x48\x60\xf0\x23\xcb\x12\x03\
-\x12\x5e\x3e\x58\xbc\x43\x5d\xa5\x08\x80\xdc\xb5\xbd\x62\x8e\xb5\
-\x76\x6a\x25\x07\xdc\x0f\x60\xde\xca\xcf\x29\x62\xf7\xa8\xf6\xfd\
-\x5e\x0a\xc5\xe5\x00\xa3\x15\x5a\x97\x56\x29\xb5\x1b\x95\xab\xa6\
-\x76\x27\x8b\x83\x9f\x28\xe7\xd7\x86\x55\xab\x1c\xb8\xab\xe2\x76\
-\x9f\xd2\x5c\xa0\xe3\xba\x4a\xc8\x35\x01\xc3\xce\x56\x67\xc9\x7a\
-\xac\x38\xf0\x79\xdd\xfe\x14\x9a\x86\x5a\x9c\xbe\x02\x26\x84\xa9\
-\x3f\xb3\xbf\xaa\x14\xf6\x21\x5b\x61\xa3\xcc\x80\x68\x48\x61\xb3\
-\x02\x40\x9b\xe7\x19\x5e\x43\x96\xfb\x17\x99\x5d\x72\x1d\x35\xda\
-\xcd\x80\x50\x4b\x56\xec\xba\xe8\x67\x57\xdb\xc3\x6c\xeb\x3c\x37\
-\xd9\x36\x2d\xe0\x0d\x80\x0d\xe3\x47\x82\x17\x80\x78\x4e\x3c\x7d\
-\x6b\x37\xca\xbf\x13\xe1\xf7\x1e\x54\x1e\x10\x17\x9e\x79\x40\x40\
-\x1d\xd9\xd2\x8c\xa0\x36\x47\xb3\x15\x49\xec\xa1\xfa\x3b\x8c\x6b\
-\xd9\xca\x6c\xf7\x42\x2d\xb2\x87\x5b\x44\xa4\x40\x49\x5e\x60\x97\
-\x28\x0d\xf4\xf1\xbc\xe3\xee\xe7\x2b\x18\xb3\x15\xc0\xcb\xd8\x82\
-\xca\x04\xb7\x7e\x34\xb4\x6e\x35\x8d\x60\x9e\x9b\xc9\xb1\x18\xa5\
-\x07\xce\x75\x05\xee\xc3\xf2\x7d\x91\xfa\x02\xed\x32\xcf\xee\x3d\
-\xa7\x38\x9d\x3b\xae\xb4\x6e\xab\xf4\xdd\xe4\x04\x02\x10\x12\x40\
-\xd9\xc5\x51\xb0\x62\x41\x0f\x1d\x94\x22\x33\xc4\x06\xab\x95\x7a\
-\x41\xa1\xd2\x04\xb5\x46\xae\x17\x2b\x73\xdc\x8f\x21\xc9\xd4\xd6\
-\x58\x78\x23\x3a\xdb\x12\x4a\x3c\xbb\x92\x5b\xc3\x0d\x98\xee\x02\
-\x8d\x1e\x2c\x8f\x16\x28\x1d\x05\x1b\x2d\x14\x8e\x27\x3e\x5a\xed\
-\xb3\x54\xde\x3a\xc5\x42\x09\xd8\x1d\x88\xfd\x9e\x24\xbb\xe4\x7b\
-\x06\x8e\xc7\xa0\xb2\xc4\x22\xf5\xf2\xe5\x72\x77\x9d\x56\x31\xc9\
-\x88\x3a\x39\x65\xbd\x57\x40\x74\x31\x20\x1b\xf3\xb6\x28\xa5\x6c\
-\x8b\xc1\x21\xbd\x78\x3c\x23\x91\xc7\x79\x06\x4e\x2c\x26\xab\x59\
-\xa5\xca\x59\xd5\xd8\x53\xcb\xb7\xa3\x1f\x0f\x57\x43\x3d\xc4\xe3\
-\xed\x58\x6c\xea\xd7\xab\xef\x14\xfb\x83\xab\x2d\x88\xf6\x39\xac\
-\x57\x2d\xd4\x07\xa5\xda\xc9\x86\x45\x2d\x4f\x9a\x8f\xe7\x7b\x1e\
-\x55\x4d\xf9\x06\xbc\x51\x8a\xa7\xd3\x0f\x02\xef\xb3\x17\x94\x07\
-\x88\x6d\x8b\x3c\x76\x7c\xab\x4d\xf6\xd1\x30\xd7\xba\xc5\xd5\xea\
-\xf5\xba\x5d\x65\x3e\xa5\xe5\x65\xf5\x67\x49\x04\x7f\x62\x09\x79\
-\x51\x9e\x25\x14\x86\x04\x87\xbd\x87\xb2\xfb\xb7\xe4\xbc\x10\x92\
-\x01\x20\x19\x96\x11\xd4\x98\x25\xec\x3e\xcd\xd1\x28\x74\xa6\xca\
-\xc1\xe5\x60\xf3\x2e\xf7\x23\x73\xf4\x46\xd3\x29\x94\x4a\x7d\xbd\
-\x5f\xb0\x14\xfb\x69\xf6\x6b\x40\xac\xc6\x9c\xfc\x4f\x83\xe6\x2b\
-\x0a\x87\x46\xa1\xb7\x77\x6a\xb7\x77\x85\xfa\xc5\x60\x59\x86\xb6\
-\x9b\xe6\xe8\x07\xc1\x2d\xe0\x8d\xcb\xc1\xbf\x24\x32\x06\xe5\xeb\
-\xf1\x72\x3b\x54\x6d\x36\xdb\x6b\x47\x4a\xa4\xe0\x2a\xcc\x23\xd1\
-\x7e\x7b\x1a\xcb\xd5\x08\x86\xcc\xd7\xd9\x98\xbb\x52\x80\xd3\xaf\
-\xb2\x15\xa0\x45\xe1\xd4\x57\x27\x76\x29\x5f\x61\xb0\x79\xd6\x51\
-\x8e\xf5\x87\x63\x8b\x90\x2a\x86\x78\xab\x12\xac\xa4\x97\x82\x02\
-\x5e\x2c\x08\x47\x49\x52\x4b\xa0\xaa\x12\xa5\x4b\xc5\x4a\xee\xc7\
-\x62\xe9\x00\x92\x4b\x12\xad\xe5\xba\x51\x3f\xfe\x3d\xcb\x5b\xaf\
-\xba\xfb\xba\x3c\xf8\x0d\x90\x9c\xd2\xd0\x3b\x2f\x88\x5b\xee\x2c\
-\xee\xfb\x24\xf5\x8a\x49\x91\xe5\x2a\x71\x2c\x0f\x91\x6f\x3a\x77\
-\x7a\x5d\x48\x8f\x57\x22\x58\x10\x93\x6a\x74\x7e\xcb\x73\x57\x30\
-\x53\x4a\x88\xed\x4a\x90\x5f\x93\x0f\x90\x40\x79\xe2\xa0\xfe\xac\
-\xf1\x05\x81\x42\x01\x78\xbc\x8a\x9b\x22\xb4\x46\x1b\xd1\x8b\x74\
-\x62\xb4\x2a\x90\xc7\x61\x55\x03\x11\xd8\xf1\xa9\x1d\x59\xa3\xeb\
-\xbf\x67\xdc\x8e\x73\x61\xae\xbd\x4b\x43\xab\x67\x39\x9d\x90\x62\
-\x1c\xb1\xfc\xfd\xd3\x8e\x0e\xfe\x45\xb2\xd5\x4f\x1c\xe9\xe7\x48\
-\x4b\xe2\x9f\x67\x2b\x1d\x73\xc3\xd4\xfa\xf3\x6d\x46\xaa\xf2\xf4\
-\x62\xf0\xb8\x8f\x18\x28\x09\x74\x0f\x23\xd9\xd0\xc0\xa3\x3b\xb1\
-\x05\xd0\x1d\x28\xcf\x10\x41\x20\x97\x51\x58\xec\x73\x3d\x40\xa6\
-\xea\x99\x6a\x38\x6e\xcd\x45\x31\xc8\xf7\x17\x6b\xb5\xc1\xd2\xea\
-\xdd\x8f\xd8\xb6\xd1\xa8\x64\x9b\x49\xae\xb7\x33\xb9\x88\x93\xec\
-\x4f\x10\x56\xbd\x64\xfc\x6e\xba\x1d\x1f\x05\xd5\x77\xd4\xb5\xfc\
-\xe3\x52\xdc\x72\x07\x4f\x20\xf4\xf2\xe5\xe9\x35\xc5\x2b\x0d\xc2\
-\x80\x3d\x4a\x80\x85\x83\x78\x67\xc8\x60\x14\x87\x41\x01\x03\x12\
-\xac\x37\x2f\x80\xae\x80\x74\x7b\x89\xd2\xdc\xf0\xfe\x97\x64\x4e\
-\x56\xeb\x42\xea\x17\x5a\xa4\x61\x4b\x1b\xd5\x23\xbc\xe6\x0d\x24\
-\xfa\x7d\x1b\xec\x5b\xee\x73\x68\x10\x96\xb2\x89\x90\x9a\x33\xc1\
-\x48\xf3\x69\x60\x55\x3f\xb9\x25\x55\x5a\x69\x52\x21\xa0\xa8\xd0\
-\x10\x09\xf2\xca\xc0\x29\x79\x16\x3f\x05\xe8\x4c\x70\x3a\x93\x2a\
-\xd7\xbc\x15\xe6\x76\x50\x8e\xf0\xce\x52\x7c\xb3\x69\xb6\xd7\x27\
-\x4c\xdd\x3e\x8f\x4a\x1d\xd7\xf9\x1d\x13\x7f\x3f\x07\x9e\x75\xc7\
-\x72\x75\x58\xee\xb6\x35\x4a\x64\xcc\x27\xd7\x38\x15\x15\x07\x72\
-\x8e\x95\x50\xf1\x67\x09\x20\x8f\xd4\x28\x61\xb0\x74\x2b\x12\xca\
-\x5d\x05\x49\x00\xb2\xb0\x1e\xc1\xd4\x40\x14\x3c\x41\x2f\x00\xa3\
-\x72\x1d\xdd\x19\xe7\x5c\x57\xf8\x78\xb9\x05\x56\xb5\x6b\x72\xae\
-\x10\xe9\x93\x04\x76\x8b\xd3\x88\xf4\xec\xdf\x2e\x36\xfc\xef\x5b\
-\x22\x79\x41\xb6\x98\x8d\x12\xcd\xbe\x3f\x6b\x14\x5a\x58\x9e\x64\
-\xc9\xd7\xa3\xe5\x97\x40\x51\x89\x27\x4b\xc3\xc7\xc7\x2d\xc0\x5d\
-\x67\x5f\x85\xce\xbf\x07\xf0\xae\xcd\xe4\x3b\xe0\x1d\xd5\xab\xa5\
-\x60\x96\x24\xa8\x55\xaa\xda\x85\x3a\xa0\xd2\x0f\xa8\x64\xdc\x3a\
-\x54\x7e\xad\xbb\xcc\xe8\x20\x7a\xbc\x59\x08\x67\x77\x00\x37\xa9\
-\x57\xcb\x2b\x3c\x08\x67\x77\x0e\xa8\x60\x0b\x21\x74\x15\x50\xbe\
-\xae\x82\x4a\x94\x0e\x94\x42\xe8\x45\x64\x20\x26\x8f\xf1\x71\xf2\
-\x3b\x5f\x2c\x4e\xd3\x2e\x6b\x86\x68\xc1\x1d\x26\x94\x7b\x30\xd9\
-\x23\x3e\x96\xe5\xcf\xdc\xcd\x75\x72\xb7\x7e\x5a\x11\x9a\x1c\x76\
-\xd7\xee\xec\x12\x65\x97\x66\x5e\xa7\xe1\x8e\xe1\xaa\x45\x64\xa5\
-\x34\x7b\xa3\x09\x8b\xc2\xa3\xb0\xff\x00\x88\xdf\x47\xde\xf5\x0e\
-\x17\xc8\x1b\x0f\xd9\x94\x83\x7b\x59\x1c\x97\x2d\xfe\x68\xb3\xfb\
-\x4d\xa8\x92\xcf\x38\x74\x3a\x37\x67\x42\xb3\xde\x0a\x93\xfd\x49\
-\xf2\xf1\x46\xfe\xcc\x0a\x36\xe0\x95\x47\xc0\x57\x54\x97\x81\x47\
-\x7f\xb3\xcc\x36\x04\xbc\x59\x5d\x04\x0d\x9c\x05\x37\x75\x8e\xcf\
-\x3d\xb6\x9f\x9d\x86\xbb\x9d\x0b\xa0\xb4\x42\x0f\x0c\x8b\x75\x6b\
-\x4e\x36\x6c\x8a\xbf\x71\x45\x70\x65\x2e\xd3\x7e\xc7\x5e\x94\x66\
-\xf2\x8c\xf4\x0e\x47\x32\x89\x48\x22\xb0\x4c\xfd\x5a\xe4\x1b\x8e\
-\x97\xe4\xd6\xc2\xeb\x0f\x0f\xdc\xba\x09\x52\x26\xb8\xe7\xd6\xdf\
-\x37\x42\xdd\xa8\x84\x87\x3f\x4a\x75\x2e\x53\x0b\xf2\x0b\xa1\x50\
-\x1e\x78\x38\xed\xed\x64\xe7\xbd\x09\xaa\xb8\xe6\xc6\x94\x02\xd3\
-\xa1\xba\xa8\x2c\x50\xb1\x47\x46\xc8\x02\x9d\x94\x00\xdb\x17\x9e\
-\x42\x5d\x78\x31\x67\x48\x2f\x15\x5f\x0c\xeb\xc0\x0d\xde\x75\xd0\
-\x81\xe0\x14\x80\x18\x90\xe8\xf6\x04\x26\xca\x0b\xa0\xa0\x20\xa8\
-\x40\x1e\x43\xa1\x21\xe2\x4a\x96\x42\x9a\x20\x67\xb8\x9c\x79\xa3\
-\x72\x94\xb3\x32\x75\xaa\xa6\x34\xac\x5a\xb3\x71\x56\xdf\xad\xc6\
-\x35\xab\x24\xb7\x70\x7f\x51\xae\x7e\x19\x46\x27\x3b\x65\xdb\xeb\
-\xcf\x5c\xad\xbb\x3e\x16\xdb\x50\xa4\x1a\x65\x5d\x29\x05\x62\x83\
-\x87\xdd\x20\x10\x48\x4d\x0b\x17\x80\x35\xfe\xe3\x28\xa5\xae\xd3\
-\x4b\x91\xcd\xc4\x16\xf7\xea\xce\x3b\xb1\x99\x47\xac\x3a\x5c\x08\
-\x9a\x95\x75\x94\x86\x24\x80\x01\x45\x20\x6e\xca\x4b\x3b\xbb\x0d\
-\xcf\xf5\x00\xee\xea\xb3\xa4\x96\x7f\x45\x20\x17\x9e\x6d\xc9\x79\
-\xe4\x67\xb7\x61\xe0\x12\x19\xe2\x4b\x79\xd0\x1d\x01\x4d\x15\x8a\
-\xea\x3e\x4f\x05\x76\xf8\x2d\x6e\x31\x7f\x99\xe9\xea\x5b\xdd\x17\
-\xe0\x91\xa7\xdc\x45\x5a\x94\x6f\xbf\x1c\xb7\xcc\xcf\xdb\x27\x6a\
-\x48\xcc\x35\x45\xa4\xa2\x86\xdd\x25\x03\xb8\xf9\x6d\xde\x47\x5e\
-\x62\x7d\x45\x4b\xab\xb4\xe2\x90\xcb\xf9\xdc\x89\xdd\xee\x6e\x79\
-\xe0\x7d\xab\x88\xb2\xfa\xdb\x8e\x4f\xb2\xfd\xd6\xd4\xc9\x6e\x9a\
-\x65\xfe\xd0\x26\xd7\x24\xcb\x8f\xa1\xd5\x0b\x84\x73\x71\x3d\xa3\
-\xc1\x02\x29\x28\x19\xd6\x3b\x1f\x0f\x2a\x30\xd8\x12\xa4\x85\x1f\
-\x95\x46\x47\x5b\xc1\x78\x16\x1b\x87\xbc\x82\x8c\x42\xb3\xfe\x3f\
-\x04\x05\x1f\xd4\x15\x24\x33\x8e\x90\x48\x4f\x88\x0b\xfc\x1d\xbe\
-\xcf\x17\x53\xaf\x8d\x49\xf7\x9a\xe7\xee\x87\x67\x1d\x1b\x8f\x50\
-\xd1\x28\x3c\x32\x33\xd3\xbd\x5c\x2b\x41\x27\x38\x8e\x3b\x72\x43\
-\x5a\xff\x00\xf6\xbd\xf2\xe4\xd6\x4b\xb6\xb9\x4a\x89\xe3\x2a\xa5\
-\xdc\xbc\xd5\x2b\xc9\xd2\xbc\x97\x07\xac\x96\x85\x6c\x17\x0f\xd8\
-\x93\x29\x7d\x3a\xa7\x70\x9a\x9d\x40\xa8\xbd\x67\x85\x55\x1c\x0f\
-\xda\x14\xd4\xfc\x0e\xcf\x73\x05\x6a\x0e\xf2\x64\x5b\x29\x70\xf8\
-\x8f\xf7\x04\x23\x21\x0c\xe9\xdd\xef\x27\x76\x74\x29\x5f\x62\x5d\
-\x0c\xac\xf0\xdf\x70\x5d\x0e\xa2\x95\x78\xef\xbf\xa9\x24\x97\x42\
-\x82\x77\xf6\xdc\x14\x75\x1e\x75\x9e\x40\xc4\x00\x57\x54\x60\x35\
-\x00\x9f\xe0\xba\xaa\x93\xd5\xa4\xf4\x07\x1a\x14\x52\x05\x44\xed\
-\x5c\x82\x75\x4d\x9f\x21\x7e\xc2\x94\xea\xb9\x55\x8c\xca\x58\xb6\
-\x3f\x69\xa5\xab\x48\x6e\xb8\x1d\x00\x21\x6f\xf5\x7b\x42\x19\xee\
-\x2e\x37\x9f\x03\xf5\xd8\xb7\xe0\x82\x02\x28\x44\x74\x0f\x56\x0e\
-\x82\xc3\x60\x00\x5d\xc3\x14\x2f\x00\x8c\x01\x62\xc8\x7d\x5d\x75\
-\x58\x6c\xc1\x5e\x24\x21\xf5\x74\x03\xfd\x9f\xf2\xee\xe5\x01\x25\
-\x01\x4d\x3f\x3a\x0f\xea\x48\x4d\x06\xe4\xec\xc0\x29\x3e\x32\xe5\
-\x35\x54\x19\xe6\x6b\x94\xe0\x3d\x69\x62\x5a\xd4\x92\x1b\xb7\xc8\
-\xe7\x07\x16\x35\x24\xe8\xe6\x45\x32\x91\xc6\xe8\x44\xdd\x83\xa0\
-\x81\xfd\x43\xa4\x90\x84\x90\x08\x4f\xd9\x42\xba\x49\x2e\x94\x2f\
-\xf9\x1e\x0a\x33\xc7\x74\x46\xd9\x5c\x04\x32\x87\x59\x08\x67\x7c\
-\xa8\x0c\x0a\x91\xb3\x3c\x55\x93\x74\x0a\x08\x2c\x54\x00\xf2\x0d\
-\xc8\x77\xca\x16\x78\xa8\x6d\xd8\x10\x34\xdd\x36\x40\xc5\x34\xfc\
-\x68\xf3\xc1\xd7\x68\x3f\x1c\x36\xe1\x32\x36\xe8\x41\xab\xc4\x06\
-\xc9\x65\xc7\x75\xad\x6e\xcc\x30\xf3\x6c\xf1\x2b\x5a\xb1\x87\x5d\
-\x46\x46\x05\x00\xd9\x81\x52\x48\x04\x92\x80\xed\xba\xd2\x1b\xb8\
-\xb6\xfa\xf5\xd5\x77\x91\xc7\xdd\x05\x03\x02\x1d\x1b\x3c\xc4\x23\
-\xc4\x94\x04\x16\x1b\x38\x42\x31\xfd\x83\xac\x81\xe2\x15\x5d\x20\
-\x15\xf5\x21\xe2\x1b\xc0\x52\x19\xed\xdd\xd9\x17\xf5\x1b\x3a\x3c\
-\x9f\x3a\x00\xac\x76\x3e\x34\xdc\x68\x11\x89\x5d\x6b\x7d\x44\x85\
-\x52\x7a\x4b\x8a\x9a\x3d\x30\xd3\xea\x1b\xf0\x7c\x12\x32\x5d\x3f\
-\xc6\x2e\xbf\x2a\xf0\xce\x87\x5e\x1b\x0f\x60\x81\x95\x48\x08\xc3\
-\x76\x07\xd8\xbc\x77\xd2\xa7\x61\x0a\xcb\x27\x3e\x6e\xb6\x31\x32\
-\x2b\x44\x62\xbd\x8a\xf5\x9d\x4b\x6e\xe2\x94\xb3\xa3\x4d\x65\xe8\
-\x9d\x25\xc8\x15\x9d\x56\xd7\x7a\x51\x58\x6c\x4b\x8b\xd8\xaa\x90\
-\x5d\x05\x8e\xcd\xba\x29\x64\xf5\x1e\x18\xee\xc4\x05\x04\xab\x1d\
-\xd8\x95\x21\x9e\x65\x5d\x3c\x7c\x4a\xea\xbf\x2c\x85\xcc\x9d\xb9\
-\xb6\x31\x21\x4a\x30\x89\x12\x50\xd7\x76\x9a\xe6\x48\x6c\x9f\x2c\
-\xfd\x7f\x65\x8e\xed\xd7\xdd\x60\xd8\x36\xe5\xb7\x74\x00\x4b\xae\
-\xab\x6e\x18\xba\x49\x01\x5b\xd5\x18\x0f\x67\x9e\x75\xd4\x28\x44\
-\x7a\x4c\x94\xa6\x8e\xad\x67\xc4\x9d\x88\xd6\x98\x64\x03\x0d\xf3\
-\xd5\x07\x99\xa3\xd3\xae\x71\x6d\xb3\xa3\x0f\xcd\xd4\xeb\x4e\x38\
-\x29\x2e\x5a\xec\x5a\xad\xf0\xca\x75\x2a\x40\x9f\x3a\x0e\x97\x48\
-\x5d\xc1\x0e\xb1\x28\xca\x8c\xbb\x12\xa4\x84\x2f\x3e\xf7\xb0\xf7\
-\x0f\x90\x8c\xa8\x3f\x00\xb1\xf8\x80\xba\x02\x9a\x79\xf8\x12\x00\
-\x81\xc8\x12\x95\x66\xbd\xff\x00\x8e\x7a\xae\x23\xbb\x6e\x18\xbd\
-\xc2\x1d\xbb\x74\xad\xaf\x1b\xed\xe4\x94\x60\xf6\xec\xf1\xdd\x74\
-\x52\x4a\x04\x0a\xcf\x3c\x43\x6e\x19\xe5\x23\xf0\x80\xb1\x08\x62\
-\x70\x38\x34\x67\xaf\x59\x71\xb3\x65\xb5\xda\x27\x18\xc2\x1d\x13\
-\x97\xbb\xdc\xb6\x9d\x9b\x5b\x77\xed\xf4\xef\xfb\x27\x94\x16\x1d\
-\x20\xe7\xbe\xca\xe3\x71\x9a\x4d\x7d\xb6\x81\x5c\x3a\xf0\xf8\xcc\
-\x26\x2f\xc2\x08\x25\x48\x27\x76\xf6\x77\xdd\x42\x79\xd3\xc3\x02\
-\x8d\xf8\xd0\x68\x0a\x1f\xc0\xf9\x5c\x4d\x46\x76\x96\x51\xbc\x6d\
-\x52\x59\xea\x99\x5b\xdf\xc7\x3e\x1d\xe8\xc5\xd5\xdd\xfc\xa1\x00\
-\xea\xca\xb2\xb8\x2c\x09\x74\x12\x08\x77\x73\xf8\x1b\x37\xe3\x62\
-\xe8\xd9\x94\xb2\x84\x21\x18\x07\x54\x1d\xf6\x0e\x84\x21\xdf\xd8\
-\x92\xa4\xa2\x38\x03\xae\x94\x47\xb8\xdc\xe4\x15\x3a\xdc\x28\x3d\
-\x66\x84\xd4\x5c\x1e\x63\x9e\x7f\x7d\xcc\x21\xf6\xa9\xa3\x41\xa8\
-\x1e\x69\x68\x5b\xf0\xdc\x87\xe4\x66\x91\x74\xe5\x0c\xf5\x58\xdf\
-\x6f\x8e\x47\xc8\x3d\x98\xcf\x82\x0d\x39\x4a\x53\x10\x0f\x3a\x40\
-\x28\xc4\xec\xeb\xc1\xe0\x0a\xea\xba\x82\x9f\x00\x9a\x12\x82\xfb\
-\x66\xf8\xe5\xc0\xdd\x04\x02\x13\xd6\x80\xc1\x3e\x0f\xbc\x1d\x76\
-\xc1\xde\xe4\xbc\x9c\xf2\x0d\x98\x15\x79\xe4\x44\xdd\xd7\x97\x44\
-\x62\x87\x4d\xd9\x77\x78\x6c\x5d\x25\x88\x42\xbe\xc1\xdf\x24\x12\
-\x3f\xab\x7a\xfe\xcc\x8f\x16\x21\x43\xbe\x4b\xa5\x80\x56\x45\x62\
-\x19\xfe\x1e\x3e\x41\x38\x50\xba\x35\x50\x38\xea\x1e\x19\xf1\xd5\
-\x52\x7b\x9d\x5c\x0b\x51\x69\x16\x66\x8d\xe3\xf7\x2b\xd4\xab\xb3\
-\xc1\x54\x33\x63\x49\x3b\xbc\x99\x52\xbd\x1a\x7d\xdd\xe6\xcf\xbd\
-\xac\x4a\xb1\x3a\x51\x98\xcc\x7b\x55\xb8\x8c\xbb\x5f\x68\x9c\xdd\
-\xcf\xc1\xdf\xe9\x76\xdc\x04\x1f\x91\x4d\x6b\xcd\x5f\x96\xe8\x3d\
-\x24\xb1\x3a\x49\x1d\xe8\x74\x51\x3e\x37\x6d\x57\xba\x94\x0e\xd9\
-\xbe\xb6\x74\x5f\xb3\x2a\x59\x0b\x0f\xd5\x88\x20\x83\xbb\xa3\x72\
-\x14\xb2\x7e\xde\x06\xe0\x7a\xb3\xca\xa1\x7d\x7c\x90\x54\x04\x6f\
-\x2c\x49\x75\xbf\x3b\x2f\xe5\x54\xa9\x01\x43\xcc\x0a\x00\xa0\x16\
-\x4d\x7c\xe9\xf9\x7b\x8b\x8d\xf6\x8b\xca\x12\xac\x7f\xaf\x35\xd8\
-\x3d\x9c\x4e\xb1\x29\xc7\x09\x56\x5d\x30\xc4\xf9\x71\x09\x52\x24\
-\x7e\x8c\x36\x82\xe6\x26\x92\xf3\xf5\xab\xee\x50\xe4\x66\xff\x00\
-\xf4\xfe\x69\x97\x7a\xf4\xfb\x2a\x96\xab\x3b\x77\xa0\xb5\xbe\x96\
-\x4c\x9d\x7e\x84\xcf\x02\x89\x07\x39\x1c\xe4\x0a\xcf\xf2\x39\xc6\
-\x2f\x92\x15\xff\x00\xd6\x55\x92\x5b\x80\x42\xe5\x78\x22\xa0\xd1\
-\x74\xfb\x14\xd6\x6e\x58\x45\xa2\x5a\x4d\x1a\xe8\x5b\xf5\xb7\x04\
-\x52\xf1\x04\xff\x00\x75\xf6\x65\x0a\x1e\x52\xbb\xb6\xc4\x02\x08\
-\xd9\x80\x46\x25\x82\x16\x57\x80\x0a\xc1\x50\x92\xce\xa9\x01\x01\
-\x79\x54\x84\x6d\xd8\x14\x63\xe4\xbc\xa5\x15\x89\x25\x88\x4d\x1d\
-\x28\x4e\xe7\xe4\x81\x10\x23\xfd\x6e\xbf\x20\x99\x68\xfd\x2e\x9c\
-\x5b\xab\x6e\x14\x4b\xa0\xff\x00\x46\x90\x4a\xd0\xa1\x0d\x97\x22\
-\x30\xbe\x0e\xdc\x2a\xa7\x3d\xcb\x5e\x6d\x02\xbf\x5c\x97\x4a\xd1\
-\x31\xab\x6e\x76\x69\xc6\x06\xc5\x55\x34\x7b\xcb\x56\xd9\xb7\x9e\
-\xf8\xb3\xfb\xc6\xe0\xe3\x70\x28\x67\x77\x20\x3c\x18\x3c\x7d\x5d\
-\xdc\x2e\xec\x55\x01\xdd\x11\x94\xb7\x96\xd9\xd0\x77\x62\xc8\x40\
-\xfc\x79\x65\x46\x1b\x12\x08\x6d\x97\x4f\x2c\xf2\x16\x2e\xa0\x0c\
-\xf7\xc9\x36\xf8\x84\x63\xa2\x27\xc9\x75\x2d\x1e\x8b\xf4\xa0\x10\
-\x4c\x00\x4a\x5d\xba\xef\x5e\x03\x15\x61\xbb\x3e\x43\x01\xb3\xa0\
-\x06\x24\x02\x0b\x1d\xde\xfc\x30\xf2\x0f\xb0\x0a\x8a\x18\xf9\x45\
-\x64\x46\x52\xe9\x78\x02\x4b\xac\x55\x90\x31\xd4\xa0\x2f\x05\x62\
-\xc3\x49\xda\xa5\x53\xda\x6d\x09\xb9\xdf\xb1\xce\x3e\x28\x04\xc9\
-\x51\xfe\xc3\x79\x19\x9a\x26\xfb\x38\xaf\x35\x7e\xb7\x41\xd9\x36\
-\x01\x74\x75\xe5\x3a\x7f\xaa\x6c\x50\x96\xbe\x1b\x93\x98\xed\x2e\
-\xdd\x2d\xe7\xec\x77\x63\x55\x51\xca\x4b\x70\x74\x4e\xbb\x4b\xe1\
-\xf7\x5e\x1f\x0c\xc0\x55\xbe\x6a\x29\x8d\xdc\x17\x50\xae\xa5\x05\
-\xc6\xeb\x04\x6f\x27\xd5\x1e\x1e\x40\xfd\x9e\x00\xb3\xaa\xce\xba\
-\x8c\x9a\x21\x57\x51\x9e\x28\xc3\xf6\x20\x82\x7c\x31\x47\x98\x80\
-\x49\x3f\xae\xc7\x42\x00\x67\xbc\x69\xb2\x2a\x34\xc3\x33\x4b\xb2\
-\x9c\x2e\xe7\x73\xff\x00\x8f\xdb\x7a\xe6\x17\xcb\x9b\xac\x8b\x73\
-\xd3\x6f\xaf\x24\xc9\x54\x62\xd4\x3f\x1c\xd6\x59\x6e\xdc\xdf\x6b\
-\x09\xbf\xa9\x4e\x6c\x12\xcd\x7a\x30\xe3\x6d\xfe\x34\x0b\xa0\x00\
-\x30\x4d\x55\x95\x18\xb7\x7f\xa1\xd3\x89\xf4\xeb\xce\x2b\x2c\x6e\
-\xe1\xba\x15\xbb\xeb\x6d\xda\x92\x63\xb5\x32\xa1\xfd\x85\x71\xa1\
-\x56\x2d\x23\xee\x23\x54\xe9\xd4\x73\x1f\xb9\x51\xb3\xbc\x92\x49\
-\x00\xa8\x6f\xb6\xf5\x70\x7e\x92\x63\x33\x12\x5f\x6c\x49\x14\xf3\
-\x48\x95\x1a\x49\xa9\x90\x00\xa1\x81\x42\x51\x5d\x56\xdd\x49\x40\
-\x84\x9f\x2c\xa7\xd9\x97\x75\x00\xae\xee\xf9\x21\x86\xec\x3f\x67\
-\xb6\xf6\x3f\xd8\x94\x78\x3a\x18\x6e\x49\x24\xb7\x37\x3f\x0f\x5d\
-\xcb\x9d\xc9\xb5\x95\x5a\x3f\x56\x21\x99\xdb\xd8\xbb\x7e\x77\xf0\
-\x87\x76\x97\x8d\x1a\xb6\xdc\x60\xd9\x35\xab\xf5\xf8\x7a\xfc\x1d\
-\x77\x34\xfb\x45\x4b\x70\xb9\x93\x19\xf6\x69\xd6\xec\x75\x2d\x4d\
-\x09\x01\x4b\x6e\x58\x84\xd3\x76\xee\xf7\x7a\x90\xfe\xad\x5e\xce\
-\x25\x8c\x52\x0a\xbd\x43\xae\x36\x97\x57\xf9\x0d\x76\xf2\xc0\xa3\
-\x26\x8f\x74\x7a\x4f\x76\x32\x51\x82\xab\x1b\xc9\x87\x4a\xfe\x31\
-\x5f\x90\x4f\xaf\xfd\x70\xc0\x1f\xd8\x47\x8b\x22\x81\xd7\xbd\x87\
-\xd8\x96\x46\x84\x5f\x75\xf4\x4d\x1f\x4f\x7b\x75\x95\xea\xb5\x39\
-\xb8\x39\xaa\xc2\x79\x24\x0a\xbf\x28\x54\x7e\xb3\xbc\x8e\x17\xc1\
-\x52\xe8\x46\x21\x41\x01\x86\xc5\x8a\xea\x4b\x0d\x99\xe2\x03\x7b\
-\xa9\x5f\x56\x2f\x00\xc1\xe0\x18\x1f\xd8\x96\xe4\xe6\xe3\xe1\x15\
-\x66\xf2\xed\x4a\x85\x70\xd6\x7f\xb1\x55\x85\xd3\xee\x48\xc6\x63\
-\xf2\xd3\x71\x91\x08\x7e\x31\xb3\x11\x7a\x1d\xab\x64\xc2\x2d\x84\
-\xdb\x43\xf0\x59\x7a\x07\x2e\xf4\x91\x88\x21\x9d\x0a\x4e\x9f\x68\
-\x5e\xd7\x47\xbb\x67\x34\x42\x12\xe4\x0a\x8f\xa9\x07\x76\x45\x3a\
-\x54\xaa\x99\x22\x52\x09\x2f\x24\x59\x36\xba\xab\xf2\xad\x56\x8d\
-\x8a\xcb\x55\xb6\xfa\x4b\x59\xb0\xd9\x4e\xbb\xbd\x5e\xc4\xf3\x95\
-\xfb\x0b\x86\xda\xa5\xfb\xdb\x95\xdd\xc1\x55\x89\xd0\x6f\xa5\x70\
-\xa2\x54\xce\xe2\x69\x6e\x5f\xf1\x87\x5d\xb0\xd9\x77\x5f\x5c\x3c\
-\x9c\xd6\x9c\x88\xda\x56\x3e\xfb\xfc\x59\x00\xcf\xa0\x08\x26\xb9\
-\x42\x58\x9e\x20\xb3\xc6\x3a\xea\x85\xbb\xce\x34\x1f\x2d\x54\xe7\
-\x96\x6c\x85\xc5\xa1\xb1\xbe\x80\x79\x97\x76\x2f\x01\xa9\xdb\x4f\
-\xf9\xf8\x9c\xe4\x7b\xb1\xc5\xc6\xe4\x4a\x7f\x91\xa0\xef\x77\x2e\
-\xc2\xd8\xe1\xdc\x93\x86\x43\x2c\x72\x40\xe9\xd4\xec\xf8\xe3\x0e\
-\x9a\x76\x22\xdf\x68\x3b\x5d\xee\x44\x22\x3f\x60\xfb\x8b\xa8\x3d\
-\x6e\x9d\xc3\x7d\x91\x2e\x56\x10\xfe\x21\xf2\xeb\x72\x3d\xaa\x51\
-\xf5\x79\xb1\x09\x52\x2f\x46\x2c\x82\xd3\xad\xff\x00\xa9\xc3\xd6\
-\xe0\xeb\xba\x46\x84\x32\x06\x78\x16\x75\x41\x4f\x67\x8b\x7d\x99\
-\x9f\xeb\x4c\x2f\xc9\xdd\x37\xa1\xf2\x93\x7e\x37\x60\xa5\xa7\xd9\
-\xee\x53\xa6\x72\x85\x53\xaa\xf3\xbe\x6a\x2e\x62\xdf\x2d\x62\x8b\
-\xdb\xa4\xaa\xe8\x53\xea\xad\xda\xea\x75\xfb\xbd\x7b\xfc\xc4\x9c\
-\xd1\x03\x9d\xf1\x83\x94\xc8\x5d\xdc\xcb\xdd\x4e\xe7\x57\xbf\xd7\
-\x69\xe2\xb9\xd1\xfa\x69\x13\x82\x47\x61\x33\x14\x35\xaf\x6e\xc6\
-\xed\xef\x20\x34\x36\xf6\xe4\xee\xce\x02\xb0\xfb\xf5\x9d\xa3\x90\
-\xeb\x78\xc6\x84\x02\x6f\x95\xa6\xae\x36\xf5\x2d\x5b\xed\xaa\x88\
-\xdc\x54\xbd\x39\xd9\x65\xfb\x59\x14\x76\x83\x65\xf6\x9c\x4c\x51\
-\xb8\x2c\x7e\x0b\x31\xc3\xbd\x8a\x6f\xf0\xfc\xdc\x0e\x57\x72\xe1\
-\x34\xd5\x4c\x56\x62\xf7\x23\xd7\x9b\x67\xd2\xb7\xd6\x9a\xdd\xdd\
-\xe4\xe8\xfd\x73\x2c\x53\xaf\xd8\x97\xfe\xbb\x38\xd1\x86\x74\xe4\
-\x7c\x43\xe3\xa2\x9f\xf5\xa5\xab\x75\xa1\x32\x87\x0c\x3e\x5d\x81\
-\x42\x5d\x75\xc0\x1b\xd7\x74\x6f\x5f\xd4\x29\x64\x0c\x9b\x6f\xea\
-\xe8\x40\xe8\x52\xa4\x0f\xeb\xa6\x6a\x60\xa6\xb8\xe5\xbb\xad\xc7\
-\xff\x00\x0f\x5c\x82\x34\x50\x42\xa3\x5f\x5d\x4d\x9c\xef\x06\xb7\
-\xda\xf5\x84\xdb\xb5\xb2\x4d\xc0\x2b\x29\x75\x9d\x0c\x76\x67\xdd\
-\x05\xbe\xcb\xf4\xa6\x79\xc7\x85\x48\xe9\x7d\xc3\x2f\x1a\x4e\x77\
-\x00\x59\x74\x9e\x32\xb9\x6f\xf7\xa1\x60\x94\x92\xf3\xa5\xdb\xb4\
-\x97\xb3\x7f\x8c\xea\x87\x4c\x32\xcf\x9c\x6a\x0b\x22\xd2\x6f\xb5\
-\x15\xa0\x45\xa2\x50\x7a\xe5\x8f\x8c\x9b\x52\x0b\xbe\xb1\x6a\x79\
-\x71\xb6\x45\xf5\xc6\xac\x55\x72\x9b\xe4\x07\x83\x9b\x8b\x9d\xc5\
-\x2c\x02\x8f\x5d\xab\x55\xb9\xd1\x7b\x85\x96\x26\xac\x52\x5c\x2d\
-\x01\x8e\xc3\x72\xc9\x55\xad\xbf\xb3\x44\xee\x62\x85\x5c\x44\x00\
-\x3e\xa4\x3c\xaf\x69\x74\x38\x70\xb4\x9b\xf1\xa6\x36\xfd\x45\x25\
-\x6b\x72\xa3\x28\x03\x38\x03\x01\xbb\xc0\x96\x74\x7a\x82\x01\x60\
-\x01\x65\x04\x7a\xa3\x3a\x85\x80\x05\xd4\x56\xd8\x37\x90\x41\x0e\
-\x80\x03\x26\xc8\x10\xa3\x55\xfe\x8b\xb7\x07\xf6\x55\x1e\x3c\xe8\
-\x9b\x5e\xcd\xc5\xf5\x2d\xaa\x81\x62\x06\x58\x92\xfa\x34\x05\xd7\
-\x42\x3b\xb3\xcf\x80\xce\xee\xe8\xd8\x3c\x15\xae\x2e\xdc\x28\xd5\
-\xd7\xd2\x6a\x89\xf5\x5d\xc4\x4c\xe1\x03\xc6\x65\xa1\xf4\x6c\x4a\
-\xd7\x3a\xbc\x9c\x9d\x8e\xbd\xc4\xdb\xad\x33\xb9\xca\x63\x2b\x45\
-\xae\x2b\x14\xd5\x0a\x33\x42\xac\x3e\xf8\xa4\xeb\x84\xfa\xb7\x5b\
-\xd4\x4a\x33\x31\xd3\xef\xb2\xd6\x3a\x3b\x17\x71\x7b\xd5\xdd\xec\
-\xa7\x62\x37\x37\x56\xd1\x79\x74\xa2\x0f\x1c\x84\xc7\xfa\x25\xe2\
-\x43\xa7\x7f\x52\x5e\x2e\xab\x4e\x12\x34\x9f\x3e\xc1\xaa\xbe\x17\
-\xe8\x87\x72\x2d\x14\x9b\xf3\x49\x67\xbd\x2a\x31\x9d\xcb\x7f\x8f\
-\xc7\x69\xfd\x5a\xa6\x95\x5a\x09\xee\x12\x1b\xd5\x3d\x5e\xa1\x75\
-\x88\x52\x1d\x5d\x48\xdb\xc6\x9e\xaa\xc7\x72\xf0\x08\x41\x0d\xfd\
-\x43\xde\xca\x02\x3c\x01\x05\x15\x90\x96\x20\xaf\x73\x9d\xce\xa7\
-\x57\x02\x1c\xdd\xfb\x89\xbe\x94\x64\x56\x21\x58\x94\x19\x14\xae\
-\xdd\x59\xfa\xe7\xad\x92\x85\xc8\x76\xed\x47\x46\xe4\xba\xad\xeb\
-\xfa\xba\x08\xd4\x80\x5e\x0e\x33\xdd\x77\x0b\x3a\xeb\xc8\x42\xb4\
-\xc9\x2b\x40\x26\xf8\x3d\x59\xc7\x54\xef\x49\xe6\x8b\x6d\xbf\xde\
-\x79\xb6\x6e\x75\xe7\x1f\x17\x0f\x66\x56\xb9\x75\xd2\xf5\xf1\xfd\
-\x51\x2d\xca\x0f\xd7\xb2\x4a\x3f\x9e\x6e\xbc\xcd\x4e\x72\xb5\x94\
-\xcb\x48\xef\xca\x73\x2c\x22\x74\x96\x90\x96\x3b\x31\x05\x93\x62\
-\xe3\x55\x9b\x6d\xa1\x55\xcb\xa1\x55\x30\x87\x4e\x44\x53\x8a\xdb\
-\x73\x8f\x0a\x85\x38\x02\x32\xfe\xc3\xce\x9e\x59\x77\x62\xfa\x3f\
-\xb3\xa5\xed\xd9\xc4\x4f\x2c\x08\x2c\xea\x17\x4b\xc0\x00\xf0\x03\
-\xd9\x18\x9f\xdb\x23\xd5\xe6\x1f\x6c\xf6\x37\xf5\x87\xa3\x1d\xca\
-\x77\x8e\x06\x1b\x95\x6b\xc5\xaf\x5d\x3b\x6b\xb7\x2c\x65\xdb\x6b\
-\xdd\x1a\x61\xe5\x9d\xf2\x4a\x3c\x5e\x3e\xbe\xc0\x15\xdf\xe4\xf0\
-\x56\x20\x16\xbb\xcb\x38\xa6\x77\x6f\x4f\xed\x86\xf4\xaa\x8d\xb8\
-\x55\x4e\x2e\x6e\x2e\xc7\x17\x23\x8e\xbc\x2f\xaa\xcc\xe7\xee\xe4\
-\x72\xcc\xef\x1e\x9b\xde\xed\x39\x85\x43\x3a\x10\x68\x78\x79\x89\
-\x62\xf0\x04\x9d\x82\x92\x37\x27\xc2\x69\xe5\x8a\xfc\x40\x46\x21\
-\x58\x38\x85\x0e\x88\x81\xdd\xd9\x37\x40\xcf\x3a\xac\xf7\x8d\x8b\
-\x3e\x8d\xf6\x68\x9f\x1f\x9f\xe9\xbd\xb3\x51\xc8\x3d\xbf\xd0\x3d\
-\xc8\x52\x43\xc8\xeb\x5e\x7c\xaf\x3b\xdf\xad\x6c\xa1\x32\x94\xe5\
-\x20\xd1\xd7\x42\x04\x0c\xa1\x7f\x29\xb9\x42\xc7\xf8\x0b\xa0\xb5\
-\xd9\xda\xa5\x3c\xba\xea\x5d\x60\xb7\xa9\x53\xa8\x75\x6a\x0f\x07\
-\x81\x00\x8c\x84\xe3\xe6\x71\x99\x23\x38\xf6\xc8\xb4\x2e\xe9\xfa\
-\x41\xe1\xea\x34\xf0\xc8\x8c\x02\x04\x0f\x06\x04\x1d\x1e\x54\x60\
-\x4a\x85\xd4\x94\xd3\x74\x04\xe8\xbb\x00\x83\xf2\x47\xea\x7d\x89\
-\x45\x24\xb6\x40\x3b\xb0\xaa\xb3\xf6\x1d\xe2\x2e\x9e\x34\xdd\xb2\
-\x13\x76\xfd\x5b\x77\xa5\xf6\x05\x6d\x73\xc5\x05\x90\xcb\xa4\x30\
-\x05\xbf\x3b\xa3\xbb\x16\x4f\x98\x09\xa9\x0a\xd9\x19\xb1\x58\x05\
-\xe9\x51\x9c\x3d\x5f\xc5\x46\xac\x5d\x41\xe5\xe7\x7d\x9d\xc8\x6e\
-\x35\xfa\x77\x21\xc9\x62\x59\x55\x8c\xf7\x67\x6e\x3e\x57\x39\x78\
-\xff\x00\x00\xb3\x8c\x01\x1a\xae\xfa\x8f\x1f\x8f\x88\x43\xa3\xc1\
-\x9d\x54\xfc\x95\x51\xbb\x3a\xaa\xf9\x53\x4f\xed\x52\xb9\x55\x8f\
-\xb0\x63\x9c\x63\x8f\x8f\xc3\xb5\x62\xa7\x4b\x34\x82\x40\xb2\xea\
-\x09\x12\xaf\x75\x37\x89\xd7\x78\xc1\x1b\x23\x2e\xfa\x0d\x13\x7f\
-\x97\xe7\x47\x9d\x56\xcb\x0d\xad\x4f\xf4\x7e\xad\xda\xe5\xc7\xc8\
-\x57\x59\x44\x82\x10\x41\x78\x5f\x76\x3f\x69\x2d\xf1\xd3\x9a\x31\
-\x7a\x17\x0b\x8c\x59\x92\x9b\xd4\xb9\x36\xab\xca\xc0\x92\x15\x82\
-\x96\xfc\x31\x24\x7c\x36\x0c\x36\x1f\x05\x3e\xec\x0f\xea\xaa\x55\
-\x18\x14\x79\xbf\x01\x0b\x3d\xfd\x7f\xe3\x70\x3c\x41\x6e\xd7\x6b\
-\x87\xa5\xd5\x8d\xce\x13\xde\x43\xee\xea\x05\x04\xe8\x4b\xd0\x81\
-\xb0\x5f\xd4\x28\x79\x42\x82\xbf\xcf\x10\x87\xf5\x22\xbd\x1e\xac\
-\x6a\x7f\xc2\x4d\xee\xcb\xf3\x1c\x1e\x66\x85\xba\xf0\x2c\x1d\x05\
-\xae\x06\xde\xe9\x65\xcc\x53\x67\x29\x65\xdd\x60\xee\x64\xb7\x0b\
-\x9c\xa4\x37\x4b\x4e\x5e\x79\x59\xdd\xce\xcf\x05\xd0\x2f\xf0\x1d\
-\xc6\xae\x95\x63\xe1\x97\x7f\x60\xc4\xb2\x94\x55\x65\xf5\x6c\x8c\
-\x56\x9e\x7a\x5d\x42\xad\x1e\x95\x75\x29\x35\x0b\x74\x10\xef\x86\
-\xf2\x06\xfa\x78\xff\x00\x02\xe2\x2d\xde\x95\xdc\xf5\x2e\xa4\x75\
-\x62\xb8\x62\xe2\xad\xc1\x23\x70\x99\x82\x1a\x3c\xbc\x14\xc5\xe0\
-\xd0\xc8\xec\x32\xf0\xf1\xe3\x70\xf6\x69\x53\x6c\x2f\x26\xd4\x5a\
-\xf3\xe5\xc0\x41\x67\x4a\x8f\x6d\x93\xf9\x37\x65\xf5\x3d\xd8\x97\
-\x4a\x1d\xc1\x3e\xde\xa5\xa4\x52\xee\x49\xff\x00\x3c\x58\xb6\xa7\
-\xbd\x97\xfe\xc5\xf8\xba\xe3\xe2\xea\xfd\x88\xb1\x75\xdc\x83\xc6\
-\x7e\xc4\x98\xfc\xe9\xc3\xad\x33\x3c\x34\x16\xee\x6b\xf9\x78\xa5\
-\xd6\xc3\xba\xb5\x36\xf5\xa0\x9d\x43\xd2\x85\x3a\xa8\x7c\x0d\x83\
-\x1d\xdb\x7f\xf0\x0f\x8a\x97\x4d\x64\xfa\xb3\x26\x53\x8a\xaf\x52\
-\xf0\xa7\x74\xf0\x98\x9f\x4a\x2f\x0d\xd1\xe7\x41\x19\x03\xc6\x8c\
-\xa9\x74\x70\xab\x30\xcb\x3c\xff\x00\x48\xa7\x5e\x97\x7b\xaf\xdd\
-\xeb\xae\xdf\x34\x6f\x03\x47\x8a\x35\xd9\x5e\x8d\x1d\xb3\xe8\x1f\
-\x26\x49\x72\x0b\x90\x88\xa9\xc3\x95\xd2\x5c\x94\x16\x49\xfa\xe2\
-\x63\xa2\x5f\x76\x51\xc4\x76\x38\xe4\xbe\xbf\x3d\x82\xd9\x7f\x6a\
-\x1f\x09\xb1\x9b\x3d\x81\x74\x21\xb4\x5a\x92\x41\xa1\xf4\xfe\x83\
-\x53\x0a\x63\xdc\x3b\x34\x62\xe2\xe9\x93\xb9\x95\xe3\x20\xfc\x17\
-\x7f\xf0\xef\x46\xd3\x29\xf5\xe7\xd0\x1c\x4f\xdd\x65\x5c\xa1\x35\
-\x79\xd2\xac\x88\xc8\xc7\x71\x78\x56\x2f\x42\x6f\x46\x42\x90\x2b\
-\xa5\xd0\xe2\x16\xa1\x71\xd7\xba\x3f\xcb\x49\x58\x85\xd0\x04\x62\
-\xc8\x9f\x07\x41\x63\xb0\xba\x6b\x8f\x90\xed\x72\x90\x64\xb7\x1c\
-\xf9\xa2\xc9\xfb\xd3\xb7\xd6\x9b\x2f\xb4\xee\x9e\x58\x06\x46\x6f\
-\xfb\x1d\x16\xfd\x2c\xfd\x86\xec\x63\x9b\xbb\x05\xc9\xed\x82\x47\
-\x9c\x97\x66\x59\x7e\x6c\x83\xec\xc8\x81\x3f\x5a\xab\x05\x9c\xa6\
-\x1a\x73\x0e\xab\x9c\x38\xfa\xcc\x24\xb1\x1f\x87\x4c\x70\x70\x48\
-\xd3\xf6\x0e\x9f\x2c\x36\x60\x13\xf8\xb7\x5f\x81\xd7\x28\xf8\xfd\
-\x17\x43\x29\x63\x6b\x20\xdd\x2b\xa9\x95\x81\x24\x00\x80\x33\xc1\
-\x45\x4a\xa5\xf2\x2d\x5b\x94\xb8\xb1\x63\x5b\xa9\xc5\x58\xfe\x27\
-\x8a\x3b\x73\x11\x9e\xb5\xf3\x65\x7a\x15\x08\xeb\x74\x1d\xf4\x75\
-\x7b\x90\x88\x6f\x7f\x8e\xbd\xe3\x6e\xcd\xae\x32\x05\x58\x3e\xb1\
-\x54\x0a\x71\x80\xcb\x78\xf7\xcd\x36\x32\xb8\x28\x17\xd8\x3e\xac\
-\xd1\x98\xbd\x01\xbc\x1b\x74\xb9\x99\x75\x43\xe4\x80\xb9\x08\xc7\
-\x1d\xb9\x64\x62\x90\xe3\x42\xf0\xee\x13\x1d\x77\x4d\xc3\xca\xe7\
-\x33\x84\xa0\x00\x22\x7f\x8a\x47\xb0\xbf\x6c\x7e\xcc\x31\x09\xee\
-\xc0\xf2\x01\x27\x5e\x2c\xb0\x36\xd3\xf2\xc8\x15\x77\xd7\xf3\xf1\
-\xb8\x0a\xc9\x2a\xdb\xf5\x18\xc3\x4d\x2a\x8e\x46\xe4\xce\x37\x4b\
-\xa3\xc1\x6f\x50\xa8\xc7\x8d\xd7\x85\xc4\x59\xcd\xbf\x5c\xe4\x9f\
-\x56\x30\x29\xdb\xa6\xed\x48\x32\x67\x7d\xd8\xfe\x9b\x68\xc6\x43\
-\x2c\xda\xbe\x39\xc7\xcb\xc7\xcc\xe6\x60\xf1\xc7\xd2\xbf\xfb\x75\
-\xc3\x1e\x4e\xa2\x57\x29\x2f\x87\x89\x74\x78\xff\x00\x19\xe7\x7d\
-\x9b\x27\xb6\x25\x51\xe5\x49\xd2\xc2\x6f\x8a\x9d\x5f\x05\x1b\x1e\
-\x35\xa4\x95\xfa\x8f\xd7\x09\x7d\xde\x47\x5e\x01\x58\x9d\x87\x8d\
-\x09\x4d\x3c\x36\x7b\xaa\xd0\x8c\xd2\x8a\x3d\x21\x74\x29\x7d\x34\
-\x05\x43\x29\x5d\x5e\x0a\xc4\x34\xfd\x4d\xa4\x9a\x9b\x04\xb8\xcf\
-\xae\x65\xbf\xd5\xee\xa7\x6a\x97\xe7\x9f\x11\x7d\xcb\x7d\xfb\x55\
-\xd0\xfe\x9c\x76\xfe\x2d\xe6\x9f\x5d\x44\xb9\x8c\xec\x8f\xd2\xec\
-\x85\x51\xd0\xf2\x90\x77\xd0\x00\x3f\xc4\xe5\xe2\xe3\xe7\xe3\xbd\
-\x8a\x1b\x32\x63\x5a\xe7\xa8\xd5\x61\xa7\xf5\xe2\x9c\x6b\x50\x71\
-\x4d\x6f\x51\x88\x87\x4e\x94\x64\xb6\xdb\xfa\x3d\x0c\xa9\x0a\x7d\
-\xc9\x49\x2f\x6e\xd7\xeb\x6b\x9c\x5c\xdc\x7c\xae\x13\xa6\xea\x4b\
-\x72\x3c\x1d\x76\x92\x43\xdc\xbd\xfc\xef\x3a\xeb\x78\x1f\x3f\x2c\
-\x80\x9e\x5e\xbf\x17\x2b\x97\xcf\x8b\x5b\x3f\xbf\xf9\x16\xe9\xe0\
-\x17\xf7\xf5\x76\xba\x09\x0f\x37\x57\x19\x4c\xaf\xbf\x1b\xb9\x16\
-\xa1\xf9\x26\xb7\x80\x54\xa7\xf8\xf3\xb4\x95\x2c\xd4\x49\x4e\x0f\
-\xd6\x9f\x30\x53\x57\xa4\x49\xe6\x57\xa9\x12\x9e\xa4\x02\xd1\x89\
-\x7a\x07\x1e\xea\xd5\xec\x64\x59\xed\x63\xed\x73\xd8\x15\xdb\xd0\
-\x51\x04\xbe\xfb\xdc\xa4\x51\xaa\x4b\x90\x0b\x62\xaa\xfd\x9e\x0e\
-\xe7\x5b\xb4\xe7\xb3\x5e\x1d\x78\x82\x5b\x3d\xb1\x7d\x7e\x68\x1c\
-\x46\x96\xd9\x0e\xec\x88\x75\x05\x7e\x65\x1a\xec\xec\x72\xd6\x6f\
-\x8e\x4a\x9b\x70\xbb\x8d\x5e\x95\xb5\x55\x5c\x7a\x5c\x17\xd7\x7a\
-\x9c\x61\x97\x39\x14\xdf\x2e\xdc\x21\xe5\x1f\xe3\xd6\x1a\x45\x22\
-\xd7\x2a\x79\x2f\xd4\xda\xf7\x85\x7a\xfd\x2d\xcc\x90\x39\xb6\x05\
-\xa9\x54\x3e\x5a\x25\xff\x00\x8a\xff\x00\xad\x77\x30\x9c\x4a\x45\
-\x7b\xd2\x85\x12\xab\xdd\x19\xb6\x95\x56\x1c\x87\xc1\xb8\x73\xeb\
-\x3d\x5c\x9c\xdf\x6c\xb6\xf5\xc1\x20\xf5\x68\x79\x25\x0f\xf1\x15\
-\xd7\x97\xd3\xd7\xed\x6f\x17\xaf\x1d\x4c\x53\xe0\x5e\x48\xae\x32\
-\xb4\xcd\x45\x66\xba\x8f\x39\xd3\xa1\xe3\xfc\x7b\xbe\xe2\xb6\xde\
-\x7a\x0f\x62\x1c\x97\x23\x45\xa3\xbf\xf6\x7b\x3f\xf4\x3f\xff\xda\
-\x00\x08\x01\x01\x01\x06\x3f\x00\xce\xb9\x78\xd0\xf7\xf8\xe7\x84\
-\x8a\x9c\xe9\xee\xe5\xdd\x8a\x1e\x39\xe4\x69\x9e\x3e\x1e\x03\x04\
-\xfb\xeb\xd8\x30\x0f\x33\xc3\xf9\xfb\x31\x9f\x1e\x07\xd9\x5f\xe7\
-\xe9\x15\xe3\xc0\x7e\xb5\xee\xc5\xc2\xfb\x7f\xb9\xc2\xb3\xd9\xad\
-\x31\x1f\x9d\x73\xb9\xdc\x64\xb3\x0e\x04\x18\x71\xdb\x53\xaf\xc8\
-\x95\x25\xf5\x21\xa6\x5a\x69\xb4\x92\x4a\x88\x00\x62\xfb\xe5\x1b\
-\x66\xf5\x6d\xaf\x4a\x7e\xd9\x5b\x1f\xab\x6c\x53\xb7\x07\x75\x34\
-\xf2\x65\x8f\xfd\x91\x7d\x8a\xd3\x6f\x4b\x8a\x66\x2d\xc4\x22\xf4\
-\xec\x29\x48\x75\x10\x63\xc7\x28\x6c\x36\xa0\xf2\xd4\x02\x90\xac\
-\x5a\x76\xcb\xcb\xf6\xd6\xe9\xdd\x2d\x6e\x83\x0e\x0b\x77\x3b\xe1\
-\xb7\xc5\x93\xa9\x35\x1d\xc2\x14\x61\x1f\xfc\xbd\xee\xee\xe3\x46\
-\x54\xa9\xab\x05\x54\xcd\x28\x6c\x2b\xa5\x09\x4a\x68\x31\xb9\x5e\
-\x5b\x37\x76\x6e\xa9\x8b\xa2\x75\x94\x96\x24\xcc\x9d\x66\x97\xf8\
-\x37\xc8\x4f\xd8\x6f\x2c\xdc\xe2\x39\x01\xc7\x18\x75\x1f\x63\xee\
-\xc5\xe8\xe8\x52\x14\x16\xd2\x88\xe7\x5c\x5b\xbc\xee\xec\x5e\xe1\
-\x6e\xe5\x9b\x72\x76\x1e\x44\x2d\x6a\xe3\x97\xcd\x50\xc0\xd3\xd7\
-\x7b\x74\x67\xa3\x21\xfb\x7c\xa8\xc8\x81\xf9\x50\x7e\xe8\xff\x00\
-\x52\x92\xe9\x2b\xea\x29\x22\x87\x1b\x6b\xbb\x36\x29\x08\x93\x1f\
-\x54\x69\xd8\x6f\xcb\x2d\xa8\xad\x2c\xdd\x18\x6f\xec\x5c\xd8\x4a\
-\xf8\x38\x1a\x96\xda\x80\x50\xa8\x50\x15\x19\x67\x8c\x8f\xfd\x4f\
-\x65\x3d\x98\xe1\xd9\xcb\xb3\x9e\x09\x3d\x87\x1b\x63\xbf\xcf\xae\
-\x44\x7d\x91\xf3\xa7\x6d\x83\xb7\x9a\xe6\x4b\x4c\xa5\x16\xfb\x36\
-\xe4\xd8\x23\xc7\xb6\x5a\xde\xb8\x48\x1d\x0d\x34\xd5\xc6\x02\xd8\
-\x5b\x7d\x47\xac\xa9\xb7\x8e\x62\xb4\x65\xf6\x56\x97\x1a\x7d\xb4\
-\x3a\xd3\x89\x35\x4a\xd0\xe2\x42\x92\xa4\x9e\x14\x29\x39\x62\x9e\
-\x1f\x31\xff\x00\x43\xdb\x5f\x4c\x98\x52\x90\x97\xa3\x4b\x61\xe8\
-\xcf\x34\xb1\xd4\x97\x1a\x7d\x05\xb7\x50\x47\xff\x00\x52\x85\x1c\
-\x79\x8e\xf2\x99\xa8\xe6\x39\x10\x44\xd4\xab\xdc\x0d\xad\xb7\xcb\
-\x4b\xc0\xcb\xd2\x37\x58\xf1\xdf\x97\xfe\x39\x6b\x05\xb5\x45\x89\
-\x21\xee\x9e\x90\xa2\x42\x81\xe5\xc0\x1e\x75\x15\xa9\x3c\x78\x57\
-\xbf\x1d\xd5\x3e\xdc\x11\x43\x43\xcf\x07\xfe\xea\x71\xc0\x06\xbd\
-\xdf\xa5\x3d\x98\x29\xcc\x81\x9d\x7b\xfb\xb1\x4e\xe3\x5e\xef\xe5\
-\x91\xc3\xd1\xdd\x01\xc6\xa4\x34\xe3\x2e\x24\x8a\x85\x21\xc4\x94\
-\x2d\x24\x70\xa1\x4a\xb1\xe6\x63\xca\x7d\xd1\xf5\x35\x15\x5a\xd6\
-\xf5\xb9\x3a\x1a\x3b\x9f\x42\x15\xa6\xb5\x0c\xa4\xdc\xe2\xa6\x3d\
-\x42\x50\xe3\x6c\xb7\x37\xed\x7d\x35\x57\x53\x4a\x07\x86\x3b\x82\
-\x72\xcc\xf8\xd7\xb3\x1d\xdc\x72\xec\xe5\x8a\x90\x40\xaf\x3a\xe2\
-\xa3\x3a\x7a\xf3\xef\xc0\xec\x29\xae\x32\xe3\xcb\xd9\xc7\xe1\x8a\
-\x50\x8e\x92\x28\x7b\x7e\x5c\x47\xf0\x5f\x77\x13\x73\x35\x4d\x9b\
-\x46\xe8\xdd\x35\x09\xd9\xf7\x7b\xf5\xf2\x6b\x10\x60\xc5\x61\xb4\
-\xd4\x0f\xba\xfa\xd0\x95\xbc\xea\xa8\x94\x21\x35\x52\xd4\x40\x48\
-\x24\xd3\x11\x74\x0e\xd4\xc5\xdc\x4f\x2f\xdf\xb7\xee\x98\xb9\xbb\
-\x23\x52\x6e\xa4\xc0\xab\x35\xe7\x7e\xa4\x43\x90\x1b\x6e\x05\xa2\
-\xd2\xfa\x1a\x91\x27\x4d\xd5\xb5\x14\xa5\x44\xb2\xaa\xf5\x3b\xf5\
-\x00\xda\x74\xc6\xd4\x6d\x96\x99\xb1\xe9\xdb\x16\x9c\x80\xcc\x67\
-\x3f\xc2\x5a\xe3\x5b\x3f\xca\xcd\x4a\x40\x93\x76\x9e\x98\xe9\x05\
-\xfb\x84\xe7\x3e\xb7\x56\xa2\xa5\x29\x4a\x39\xe2\x84\x71\xcf\xbb\
-\x3e\x5e\x23\x0b\x42\x92\x0a\x4d\x6a\x08\xa8\x50\x35\x24\x50\xe3\
-\x5c\xed\x2e\xab\x88\x97\xf4\xb6\xbb\xd2\xf7\x7d\x2d\x76\x63\xa1\
-\x0a\xa4\x2b\xbc\x37\x62\x38\xb6\xd2\xe2\x56\x8f\xba\xd7\xdd\xea\
-\x4e\x44\x05\x0c\x6e\x0f\xed\xa1\xe6\x12\xfc\xc4\x8d\x0a\x95\xc5\
-\xbb\x6c\x4e\xb2\x9d\x01\xcb\x4c\x39\x71\xae\x81\x6e\xda\xe1\x44\
-\x96\xfa\xc3\x33\x1a\xb9\xc4\x48\x69\xc0\x9a\x86\xa7\xb4\xa4\x75\
-\x28\xa8\x80\x08\xcc\x10\x08\x23\x3a\xd7\x85\x0f\x3a\xe5\x8e\xcf\
-\xe3\xf5\xf0\xf4\x76\xff\x00\x4f\xeb\xfc\x1c\x3e\x15\x03\xc7\x1b\
-\x8c\xee\x94\x60\xbd\xb8\x3b\x3c\xe4\x3d\xea\xd0\xbd\x08\xab\xaa\
-\xbc\x68\x34\xbd\x71\x99\x11\xa0\x01\x25\xc9\x96\x63\x25\xb4\x8a\
-\x50\xad\x49\xf1\xc6\xc8\x6e\x5b\x92\x5f\x91\x7c\x73\x49\x42\xb2\
-\x6a\x7f\xc9\x08\x4c\x94\x5f\xac\x49\xff\x00\x1b\x39\x4f\x25\x00\
-\x00\xa7\x9d\x8f\xd6\x32\x49\xa2\xb3\x00\xd4\x63\xda\x3e\x74\xfe\
-\x1a\xe2\x80\x1f\x12\x47\xea\x73\xfe\x00\x07\x3e\x62\xb9\x63\x2a\
-\xd4\x7c\x72\xe1\x5e\xfc\x79\x73\xf3\x37\x67\x55\xb2\x03\x96\xeb\
-\xe1\xdb\x9d\x5d\x2a\x54\x70\x1c\x93\x61\xd4\x4b\x0d\xa1\x0a\x94\
-\x8a\x29\x2d\xb4\x4a\x88\x04\x9a\xaa\x99\x62\x3c\x84\x28\x2d\x0f\
-\xb2\xdb\xc8\x52\x73\x4a\x92\xe2\x12\xb0\xa4\xd3\x2a\x28\x1a\x8c\
-\x64\x0f\x01\x41\xca\xbe\x3d\xd8\x35\x34\x23\xba\x9c\x3f\xae\x0f\
-\x69\x14\xee\xf7\x63\x30\x69\x41\xd9\xc7\x90\xcb\x15\x03\x3a\xe7\
-\x96\x67\x89\xc6\x40\xd5\x43\x3f\x77\xcc\x57\x02\x9e\xdf\x1c\xbf\
-\x96\x3c\xbf\x79\xa3\xb6\x43\x8a\xda\x6f\x32\x23\xed\x26\xb4\x9f\
-\x21\xd2\x86\x19\xb6\xcd\x98\xa7\xed\xf2\x9d\x6c\x10\x14\xb6\xd0\
-\xfb\xc8\x0b\xe2\x2a\x39\x57\x06\x77\x5a\x7f\x1f\xf1\x7f\x2b\xee\
-\xe5\xd1\xf6\x7e\xdf\xdd\xeb\x07\x87\x47\x47\xc3\x07\x3a\xf3\xa5\
-\x38\x0a\x70\xc7\x0f\xd7\xc3\x95\x31\x4c\xf2\xf7\x1f\x6e\x39\x8a\
-\x65\xe3\x5a\x7b\x72\xc5\x4f\x67\x8f\xad\x71\x5e\x7d\x95\xa1\xe3\
-\x82\x3b\x29\x8a\x67\xf2\xf0\xa6\x35\x0e\xf1\xef\xae\xb2\xb6\xe9\
-\x3d\x2f\x63\x88\xfb\x91\xd8\x79\xe6\xd5\x78\xd4\x37\x04\x32\xb7\
-\x23\x58\xf4\xf5\xb0\x28\x49\xba\x5d\xa7\x29\x1d\x2d\xb4\xd8\x39\
-\x9a\x9a\x24\x12\x2c\xfb\xff\x00\xe6\xb2\xd3\x7a\xd9\xcf\x21\x5a\
-\x5e\xf1\xfe\x53\x68\x7c\xbe\xb5\x26\xe5\x6d\xb8\xee\xcc\x44\x2d\
-\x2e\xdb\xf5\x0e\xb6\xe9\x54\x7f\xf2\x11\x9d\x2d\xa5\x45\x6a\x48\
-\x6f\xa4\x96\xe3\x80\x92\xb7\x57\x66\xd2\x7a\x4a\xcb\x6d\xd3\xba\
-\x6b\x4f\x5b\xe2\xda\xac\xb6\x4b\x44\x46\x60\xdb\x6d\x96\xf8\x4c\
-\xa5\x88\xb1\x61\xc4\x8c\x86\xd9\x61\x86\x5a\x6c\x24\x25\x20\x01\
-\x4f\x45\x28\x79\x7c\x70\x46\x0d\x7b\xc7\x7f\x67\xbf\x1a\x6b\x73\
-\xf6\xe7\xf1\xac\xfe\x60\xf6\x68\xca\xbb\x68\x5b\xc0\x5b\x91\x5f\
-\xbe\x5b\xd1\xff\x00\x97\x2f\x49\xae\x6b\x4a\x49\x8c\xe4\xd7\x99\
-\x06\x33\xc6\xa1\x97\x8f\xff\x00\x55\x2b\x17\x1d\x95\xdd\x48\x52\
-\x74\x27\x99\xdd\xa4\x76\xe1\xa7\x35\xae\x89\xbe\xa1\xe8\x77\x5b\
-\x8a\x74\xe4\xa3\x6b\x7e\xe6\x96\x25\x36\xd3\x9f\x98\x85\xb6\x04\
-\x96\xc0\x25\x2b\x3d\x43\xe9\x50\x38\xae\x07\x7f\x0f\x47\x0a\x77\
-\x7f\x18\xcf\x9f\xbf\xbb\x1f\x0f\xe9\xe9\x9b\x6c\x9e\xc3\x72\x61\
-\x5c\x22\x48\x87\x32\x3b\xa9\x0b\x69\xf8\xb2\xda\x54\x77\xda\x71\
-\x2a\xa8\x52\x1c\x69\x64\x11\xd8\x71\xe6\x83\xf6\xfc\x9b\x2b\xec\
-\x69\x89\x37\x65\xef\x16\xcb\xc6\x74\xad\xb6\xdb\xd2\x1a\xa4\xa6\
-\x62\x6d\x50\x50\xf2\x94\xa7\x93\x6d\x5a\xd6\xca\x8a\x49\x00\xb2\
-\x4e\x55\xa9\xcf\xd9\xe1\x9f\xf2\xc7\x8f\x0e\xfc\xe9\x5f\x4d\x07\
-\x2e\x3e\x91\xe8\xe1\x97\x6e\x0e\x64\x9e\x07\x86\x5f\x2c\x1e\xee\
-\x7c\x7e\x5d\x98\xdc\x9d\x10\xd4\x66\x9f\xbd\x2a\xc8\xf5\xeb\x4c\
-\x2d\xc2\xb4\xfe\x2e\xa4\xb1\xd2\xe7\x68\x90\x95\xb6\x43\x89\x2d\
-\xcc\x8c\x9e\x04\x1c\x68\x19\xda\xb2\x47\xdf\xd6\x3a\x7e\x2b\xba\
-\x5b\x53\xa1\x6e\x07\x24\x37\x71\xb1\xbc\xb8\x40\xc8\xcc\xa8\x2d\
-\xd6\x5a\x4a\xb3\xe3\x5e\x27\x8e\x05\x06\x64\xfb\xc6\x62\xa6\x9e\
-\x18\x35\x15\xcf\x80\xf5\xe3\xfa\x62\x80\x67\xd2\x39\xf0\xa7\x2f\
-\x1c\x54\xe6\x3d\x7e\x38\x07\x3e\x3d\x5d\xa6\x9f\xca\x87\x15\xc8\
-\xfb\x7e\x7d\x87\x1d\x5c\x01\xe4\x3b\x69\x97\xbf\x1a\xfa\x45\xa5\
-\x2d\x0b\xee\x86\x5d\xa3\x70\xec\xce\x3a\x7a\x42\x65\x68\xfb\x94\
-\x7b\xcb\xad\xf5\x50\xf4\xa6\x4c\x48\xcb\x6d\x55\xca\x8b\xc3\xde\
-\x60\x13\x1a\xad\x33\xb4\x22\xfc\xb8\x7f\x70\x90\x27\x1b\x7b\x50\
-\xc4\x7f\xb8\x07\x50\xff\x00\xcd\x74\x0e\x15\xee\xc7\x7f\x4e\x42\
-\x94\x39\xf6\x9e\x15\x18\x1c\xf3\xcf\xda\x07\xca\x98\xee\xaf\x66\
-\x7f\x3e\xdc\x0c\xeb\x43\xc4\xd7\xfa\xe3\x96\x64\x92\x3f\x96\x78\
-\xae\x79\x50\xe6\x30\x3c\x73\xcb\x8e\x23\x39\x78\x0e\xeb\xbd\xe1\
-\xd5\xae\x22\xd5\xb6\x5b\x37\xa6\x5c\x44\xdd\x61\xab\xaf\x73\x1c\
-\x4c\x58\x5d\x30\x18\xfb\x92\x63\xdb\x5b\x94\xea\x03\xae\xf4\x13\
-\x98\x4a\x12\xa5\xa9\x29\x31\x3c\xe0\xfe\xe8\xbf\x72\xfe\xb4\x08\
-\x97\x7d\x99\xf2\xca\xa9\x4f\x0d\x13\xb7\x30\xd7\x27\xf2\xe2\x2f\
-\x52\x58\xd2\xe9\x89\x32\xe8\x19\x4b\x5d\x4c\x3a\x95\xa8\x94\xff\
-\x00\xbe\x54\xa0\x12\x88\xb6\xdb\x64\x38\xd6\xeb\x7c\x16\x1b\x8b\
-\x0a\x0c\x26\x1b\x8d\x16\x24\x66\x50\x1b\x69\x86\x23\xb4\x94\x34\
-\xd3\x4d\xb6\x00\x4a\x52\x00\x00\x63\x2c\xe9\xec\xc0\xed\xe6\x72\
-\xfe\xdc\x4e\x0d\x47\x87\x78\xf4\x1a\x73\xa7\xf2\xf9\x62\x94\xcf\
-\x2f\x86\x5e\xdc\xb1\x03\xf7\x1c\xf2\x35\x1e\xe1\x61\xf3\x01\xb6\
-\xf7\x08\x37\x5d\xd6\xd3\x9a\x4a\xde\xd3\xd3\xf7\x17\x48\xc4\x08\
-\x66\x75\xd5\x98\x4d\x32\xe2\xe7\xde\x2d\xd0\x90\x13\x29\xaa\x13\
-\x2a\x10\x58\xa1\x52\x13\x5b\x76\xa0\xb1\xce\x6a\xd7\xb9\xba\x7a\
-\x0c\x38\x5b\x8f\xa1\xa6\xa9\x2c\x5d\xad\x17\x94\x34\x19\x95\x29\
-\xb8\xca\x21\x4f\xdb\xa5\x49\x6d\x65\x0b\x45\x42\x4d\x50\xaa\x29\
-\x24\x63\x23\xdf\x4a\x70\xe5\xc7\x3e\x5e\x8a\xf6\xe0\xf6\x72\xfe\
-\xbf\xc5\x4e\xc2\x41\xf8\xe0\xf6\x7c\xcf\xa2\xbf\x0e\x03\x33\xf3\
-\xc1\xaf\x23\x97\x87\xf2\xc7\x91\x6f\x3d\xba\x5a\x39\x6d\xbd\x2d\
-\xae\x1d\xd9\x9d\xcf\x5c\x56\x55\xf7\x26\x69\x6d\x57\xf7\x1e\xb3\
-\xbb\x31\x4d\x74\xa9\xf6\xa1\xc9\x54\x94\x25\x2a\x27\xeb\x75\x34\
-\xe0\x71\x6c\xba\xc5\x58\x76\x35\xca\x0c\x59\xcc\x38\x9c\xd2\xa6\
-\xa5\x32\x87\x90\x41\xa9\xe2\x95\x63\x87\x0e\x07\xc7\x07\x3e\x3f\
-\x0c\xb1\x91\xa7\x7f\x1c\x54\x03\x5e\xc1\x90\x3c\x73\x38\xe3\xcc\
-\x11\xfc\xbd\x07\xb4\xf2\xec\xf5\xae\x06\x7c\x39\x9a\x7b\x71\xc7\
-\x22\x72\xe3\xee\xc1\xa7\x8e\x7e\xbd\x98\xa8\x34\xae\x60\x76\x92\
-\x39\xe7\xdb\x85\xb6\xb4\x85\x21\x68\x52\x16\x93\x42\x0a\x56\x92\
-\x95\x02\x0f\x10\x46\x37\x7f\x68\xde\xbe\x7e\x16\x8b\xdd\x86\x62\
-\x6b\x2d\x0b\x62\x94\xe1\x4c\x68\xf7\x77\x8c\xc9\x57\x28\xf6\xe0\
-\xe3\x69\x4a\x54\xfb\x85\xd3\xd0\x85\x52\x89\xe1\x91\xc6\x66\x94\
-\x06\x84\x7c\xbe\x18\xe7\xda\x09\xa0\xa1\xf8\x93\xc7\x9e\x0d\x78\
-\x8c\xe9\xe3\xf0\xe7\x8a\x77\x8f\x7f\x2c\x0c\xf8\x65\xce\x83\x3e\
-\x39\xf7\x60\x57\xb7\x20\x39\xf7\x57\x2c\x1e\xec\xcf\x2c\x6a\x2d\
-\x33\x39\xa4\x3d\x0e\xff\x00\x65\xb9\x5a\x24\xb6\xe2\x02\xd0\xb6\
-\x67\xc4\x76\x32\xc2\x90\xa0\x42\xc7\x4b\x99\x8e\x78\xf3\x3f\xe5\
-\xb6\x7a\xae\x46\xf5\xa3\xb7\xe7\x6f\xb6\xc2\xc6\xc2\xa0\x8f\xcd\
-\x4e\x9c\xbc\xef\x96\xde\x59\x65\xc9\x6a\x07\xdf\x23\xfc\x59\x81\
-\x29\xf7\x0a\xba\xc0\xfc\x7a\xab\xa6\x94\x04\x1a\xe6\x6a\x29\xed\
-\x1c\x71\xd8\x90\x3d\xa7\x1c\x32\xa8\xf6\xe5\xfa\x60\x50\x56\xbe\
-\xbc\x30\x49\x3c\xa8\x08\xe4\x4e\x5e\x3c\xf0\xa5\xb8\xb4\xa1\x0d\
-\xa4\xad\xc7\x16\x52\x94\x25\x09\x1d\x45\x4a\x52\xb2\x48\x48\x19\
-\x93\x88\x3b\x1d\xe4\xca\xc7\x62\xf3\x01\xbe\xfa\x92\xf1\x23\x4b\
-\x5c\xee\x36\xeb\xcb\x72\x74\x8e\xd5\xc8\xea\x11\x5d\xb9\xea\x37\
-\xad\xc8\x96\xe4\xb9\x50\x1e\x73\xa8\xc7\x05\x08\x1d\x0a\xeb\x5a\
-\x48\xa1\x63\xcd\x9f\x9a\xc9\xf3\x37\xb3\xce\x16\xb1\x76\x5d\xd6\
-\xe7\xab\x75\x63\x8e\x5c\x2d\x1a\x15\x12\x9e\x2b\x66\xd1\xa1\xed\
-\x32\x92\x22\xdb\xe3\x44\x68\x24\x34\xf8\x69\x2e\x25\x07\xa5\x1d\
-\x09\x34\x39\x0a\x0a\x0f\x66\x5c\x29\xca\x9e\x8e\x7c\x71\x90\xfe\
-\x43\x03\xe2\x7f\xa7\x7f\xa2\x9e\xd3\xdd\xe8\x71\x97\x50\x87\x1a\
-\x79\x0a\x43\x88\x5a\x42\x90\xe2\x1c\x04\x2d\x0b\x49\xa8\x52\x54\
-\x93\x4a\x11\x89\x3f\xb8\x97\xed\xc6\xcd\xd5\x9d\x51\x6b\xbe\x3f\
-\xa9\xb7\x9f\x62\x6d\xcf\x3f\xfe\x1b\x51\x59\x1e\x70\xcc\xd4\x17\
-\x8d\x35\x6b\x88\xa4\xb9\x29\x2b\xe8\x52\xa5\x5a\x92\x14\x97\x02\
-\xbe\xe3\x00\x2d\x01\x06\xdd\x32\xd5\x36\x1e\x94\xdd\xfb\x6d\xbd\
-\x0b\xd7\x3b\x51\x72\x93\xf6\xb5\x0d\x92\x4b\x4b\x54\x77\xe6\x47\
-\x8b\x21\x2c\x48\x97\x6a\x79\xd4\x12\x87\x52\x8f\xa6\xbd\x2b\x09\
-\x50\x23\x00\x56\xb5\xad\x3e\x3e\x91\x5f\x5c\xfd\x14\xee\xaf\xa4\
-\xe7\xc7\x30\x2b\xea\x71\x98\xa7\xb6\xb8\xed\xe3\xe8\x57\x1c\xb2\
-\xcf\x31\x99\x3c\xb1\xbe\x9a\x35\xb8\x2a\x9d\x7c\x85\xa3\xe6\x6a\
-\xcd\x29\xf6\x56\xa6\xa5\x46\xd4\xfa\x4e\x97\xeb\x34\x88\xaf\x26\
-\x8a\x69\xd1\x2a\x10\x4d\x47\x14\xa8\x83\x91\xc6\xc4\xea\x57\xef\
-\x2d\xde\xae\x6d\xe8\xbb\x75\xa6\xf3\x25\x0f\xaa\x42\x9b\xba\x5a\
-\x5b\xfc\x09\x91\xde\x71\x7f\x5a\x9d\x61\xe6\x0a\x54\x55\x99\x22\
-\xbe\x8a\xf8\xd4\x76\xf6\x63\x3f\x5f\x51\x8e\xc1\xdb\x5f\xd3\xbb\
-\x1f\x2c\x12\x7b\x78\x76\x53\x04\xf7\x60\x77\xfc\xa9\x81\x5a\xe5\
-\x9d\x39\x63\xe7\xdd\xf0\x38\xea\x26\xa2\x99\x53\xdc\x7d\xb5\xc5\
-\x48\xc8\xf0\xa9\xcf\x3e\x78\xf2\xf9\xe6\x4e\xc3\x6c\x5d\xc5\x3b\
-\x6b\xae\x22\xdb\x75\x5a\x1a\x52\x3a\xd8\xd3\xf7\x75\x06\x95\x3c\
-\x47\x59\x4a\x64\xb8\xc9\x2a\x6c\x54\xd5\x21\xda\x8e\xd1\x6d\xbc\
-\xc0\x75\x2f\x43\xb9\xc1\x89\x3e\x33\xa9\x50\x50\x5b\x32\x99\x43\
-\xed\x2a\xa0\x91\x9a\x57\x80\x3c\x0f\xaf\x76\x38\xf1\x15\x39\x0e\
-\x3d\x9e\x19\x62\xbd\xa0\x8f\x96\x7e\x8a\x11\x90\xe5\x95\x73\xe6\
-\x3b\xf1\x91\xe3\xcc\xfa\xe5\x4c\x53\x97\x67\xb3\xf9\x63\x71\x74\
-\x1c\xb9\x92\x95\x61\xde\xab\x3e\x9c\xdc\x7b\x54\x77\x1a\x69\x30\
-\x9b\xbc\x68\xfb\x94\x1b\xf4\xa8\xac\x2f\xfd\x6e\x3a\x7f\xe3\x6b\
-\x71\x59\x64\x0f\x1c\x86\x2b\xdf\x4f\x6e\x00\xad\x4f\x3f\xef\xce\
-\x98\x1d\xd4\xea\xf1\xc0\x39\x64\x3b\x3d\x73\xc5\xdb\x56\x6b\x2b\
-\xf5\xb3\x4d\xe9\xbb\x24\x39\x17\x1b\xb5\xe6\xef\x31\x98\x30\x21\
-\x44\x8c\xd2\x9e\x7d\xe7\xe4\x3e\xb6\xdb\x42\x10\xda\x49\xe3\x89\
-\x3e\x57\x3f\x6f\x66\xaf\x76\x6d\x99\x8e\xeb\x4c\xef\x6f\x9a\x07\
-\x50\xf5\xa2\xcc\xdd\x8d\xfe\xa6\xe7\x69\xed\x1f\x3d\x6d\x89\x6a\
-\xb8\xcb\x8c\xe8\x5b\x6e\x33\x47\x57\x4a\x7d\x28\x25\x78\x62\xd3\
-\xa2\xac\xed\xea\x0d\x5d\x3d\x22\x56\xaf\xd7\xba\x82\x2c\x49\x9a\
-\x8f\x53\x5d\x97\xd4\xb7\xe5\x49\x96\xb6\x4a\xda\x8e\x16\xb3\xd0\
-\xd2\x68\x90\x09\x26\xaa\xa9\x29\x08\x48\x4a\x42\x68\x12\x9a\x00\
-\x00\xa5\x28\x00\x00\x50\x63\xd7\xfb\xe0\x13\xca\xbf\x1f\x46\x67\
-\xdb\xe9\xaf\x85\x47\x6f\x67\x0e\xff\x00\x41\x1d\xf4\xa7\x81\xe1\
-\xd9\x5a\x60\xb6\xb4\x05\xa5\x61\x49\x52\x08\x05\x2a\x49\x1f\x52\
-\x54\x0e\x44\x11\xcb\x9e\x23\x7e\xe0\x9e\x40\x1c\xb8\xda\x37\x3e\
-\x3d\xca\x0c\xcd\xcd\xdb\x5b\x34\x86\xa0\xdb\xef\x76\xe6\x3a\x4d\
-\xd6\xef\x6a\x86\x12\x96\x1d\x6e\x74\x76\x3f\xf3\xe1\x10\x43\xe4\
-\x97\x11\x47\x2a\x4b\x96\x8b\x2d\xd9\xad\x2b\xbd\x9a\x59\xa5\xc4\
-\xd7\xbb\x55\x7e\x58\x89\xa8\x2d\x93\xe0\xac\xc4\x9b\x36\xde\xd3\
-\xbf\x6f\xfc\x95\xb1\xd9\x0d\x92\x1c\x6a\xa5\xba\x84\xac\x25\x59\
-\x60\xe7\x91\xe1\xc7\xe1\x5f\x47\x87\xa3\x2a\x7f\x4c\x78\x1f\xd3\
-\xfa\xfa\x0d\x46\x59\x53\xb7\xb4\xe3\xf5\xf5\xe7\x81\x9d\x2a\x79\
-\x82\x71\x43\xdf\xee\xc1\xe1\x99\xcb\x2e\x18\xb8\xdb\x65\xb6\x87\
-\xa3\x5c\x20\x4b\x85\x21\xa7\x12\x14\x87\x59\x90\xc2\xda\x71\x0b\
-\x49\xc8\xa5\x69\x59\x04\x63\xcd\x8e\xc2\x39\x25\xa6\xa3\xed\x66\
-\xfd\xeb\x26\x2d\x16\x36\xda\x92\x84\xda\x2d\x53\x6e\xf3\x0c\x56\
-\x5b\x12\x49\x53\x6d\x2d\xb6\x82\x82\x72\x1f\x55\x46\x58\x3f\xfd\
-\x78\x8e\x3d\xbc\xb1\xcc\x57\x19\x1c\xfb\x69\x5e\x1d\xb8\xc8\x9a\
-\x0a\xd7\xbf\x2a\xe5\x98\x38\x00\x1c\xa8\x05\x73\xae\x7e\xd3\x9e\
-\x00\xa7\xf4\xa6\x05\x79\xf6\x7a\xf0\xc0\x51\xe5\x96\x09\xe3\x4a\
-\xf7\x70\xc0\x35\xcc\xd3\xc2\x9e\xa7\x03\x31\x52\x7c\x38\x9e\x63\
-\x07\xd7\x95\x31\xb8\x7a\x00\x05\x7e\x4d\xf3\x4e\x4e\x6e\xde\xb4\
-\xac\xb6\xb4\x5c\x5a\x69\x4f\x43\x53\x6e\x8a\xa9\xb5\xfd\xf6\xc0\
-\xa8\xcc\x57\x2c\x37\xa6\xee\x2c\x39\x13\x53\x6d\x1d\xea\x5e\xda\
-\xea\x28\x8f\xb9\xf7\x24\x37\x27\x4f\xa5\x0c\xc5\x75\xee\xa2\x57\
-\xd4\xec\x52\x9a\x93\xc4\x82\x73\x19\x91\xe1\x4c\x70\xa7\xf5\xcf\
-\x33\xe8\x1c\x7b\xf1\x50\x05\x06\x54\xe3\xc6\xbe\xff\x00\x46\x5e\
-\xb9\x67\x8f\x2e\xbb\x97\x15\x86\x13\x33\x4d\xde\x75\xdd\x9e\xe7\
-\x27\xed\x92\xfb\x96\xcb\xc6\xd8\x6b\x56\xd8\x60\x38\x9e\x09\x45\
-\xc5\x2d\xab\xea\xa8\xe3\xce\x98\xaf\x0c\xe9\x4a\xf1\xcb\x3a\x65\
-\xdf\x83\x5e\x5f\x3e\xcf\x6e\x33\xe0\x78\xe0\xdf\x37\x6f\x57\xc5\
-\x45\xf6\x6b\x6b\x4e\x9c\xd1\x16\x95\x26\xe1\xaa\xf5\x0c\xb1\x44\
-\xa1\x88\x56\xb6\x14\xb7\xd2\x85\x2d\x69\x05\xc5\x84\xa0\x13\xc6\
-\xa4\x61\x9d\xc0\xf3\x56\x9d\x43\xb1\x9e\x46\xad\x17\x37\xa6\x68\
-\x8d\x9a\xb3\x4e\xba\x69\xeb\xfe\xec\xdb\x03\xf5\x85\x27\x55\xc7\
-\x52\x63\xcb\x55\xba\x5b\x28\x4a\xfe\xfa\xc3\x66\x84\x86\x50\x01\
-\xfb\x98\xb4\xed\xbe\xcd\xe8\x8b\x1e\x84\xd1\xb6\x56\x52\xcc\x3b\
-\x45\x92\x22\x23\xa0\xf4\x80\x14\xf4\xa7\x8f\x53\xf3\x65\x39\x4a\
-\xad\xd7\x54\xb5\xad\x55\x24\x92\x70\x48\x14\xa8\x23\xf4\xf9\xe0\
-\xe7\x97\x0f\x03\x51\x9e\x7d\x95\xc7\xcf\xf9\xfa\x38\x53\xbb\x1d\
-\xbf\x51\xe1\xd9\x9f\x87\x03\x8e\x67\xc7\xd1\xdd\xd9\xeb\xcf\x14\
-\x1c\xab\xf0\xa5\x7e\x78\xee\xcf\x2e\xfe\xdc\x65\x4c\xb8\xf7\x61\
-\x49\x50\x0a\x0a\x49\x05\x27\x30\x41\xc8\x82\x0f\x11\x4c\xbc\x30\
-\xbf\x3d\x9e\x41\x20\xa7\x44\xf9\x93\xd2\xaa\x4d\xe7\x59\x68\xbd\
-\x30\x51\x68\x8b\xba\x91\xe1\xba\x99\x4f\xc9\x8e\xd3\x4a\x6a\x2a\
-\x35\x1a\xda\x42\x83\xc8\x28\xe9\xb8\xa0\xf4\x2f\xeb\xa1\x32\x74\
-\xee\xab\x8e\x8d\xb7\xf3\x1f\xb7\xd2\x1d\xd3\xdb\x91\xb6\x57\xc3\
-\xfe\x36\xe6\xbb\xa5\xb1\xc5\x44\x99\x73\xb3\xc1\x96\x5b\x94\xec\
-\x63\x21\xa2\x97\xda\x29\xeb\x8c\xef\xd2\xaa\xa4\xa5\x6a\xa1\xe7\
-\x91\xee\x3c\xbd\x02\xbc\x71\xf0\x1e\x38\xe3\x9d\x3d\x84\xe3\xc7\
-\x2f\x45\x0e\x2b\xcb\x3a\xfb\x0f\xf4\xc5\x33\xe1\x5a\xfa\xf3\xc0\
-\x1d\xd9\x1f\x0c\x67\x98\xad\x29\xd9\xcf\xe5\x8f\x32\x5a\x1e\x66\
-\xa2\x43\x16\x5d\xd5\xd1\x3a\x73\x70\x34\xfe\x9e\x88\xc0\x8e\xd0\
-\x94\xcd\xba\x24\x49\xff\x00\x94\xe2\x7a\x5b\x92\xfb\x8f\x32\xe3\
-\xb5\x35\x5d\x08\x1c\x06\x47\x90\xa7\x6f\x0a\x50\x57\x00\x02\x33\
-\xc8\x73\xec\x18\xcb\x30\x2b\x5f\x11\x82\x79\x53\xe7\xcb\x03\x2f\
-\x5e\xdc\x03\xcc\x63\xb2\x95\x35\xf6\x78\x60\x28\xf1\xa5\x69\xdb\
-\x4e\xff\x00\x6e\x07\x0e\x24\xd3\x8f\x6e\x33\xcc\x66\x32\xca\x99\
-\x65\x4f\x0a\x62\x94\xe6\x28\x78\x1e\x19\xd7\xb7\x04\x73\x27\xe7\
-\x9e\x16\x8e\x35\x1d\x24\x77\x1c\x88\x23\xbc\x1c\x6b\x7d\xb4\x6e\
-\x3a\x23\x69\xdd\xed\x43\x7a\xba\xd4\xa3\xf6\x9b\x49\xbc\x96\x9e\
-\x71\xe0\xdf\x4a\x5b\xfb\x9d\x2e\x47\x75\x2b\x27\xa9\x40\xa9\x14\
-\xcb\x0a\x52\x1c\x4a\x82\x09\x4b\x87\xa8\x51\x0a\x4f\xfa\x82\xb3\
-\xfa\x48\xef\xc7\x53\x6a\x4a\xd3\xc8\xa5\x41\x49\x3e\x0a\x15\x1e\
-\x9a\x77\xf0\xef\xf4\xc7\x71\x68\x4a\x95\x19\xc5\x3c\xc9\x23\x36\
-\xdd\x53\x2e\xc7\x2b\x49\xe4\x4b\x2f\xa9\x3e\x04\xfa\x2e\x7a\xb3\
-\x5b\xea\x2b\x4e\x97\xd3\x96\x78\xce\x4c\xb9\xdd\xef\x33\x58\x83\
-\x06\x1c\x66\x92\x56\xe3\xaf\x3e\xfa\xd0\x84\xa5\x29\x18\x9b\xe5\
-\xe3\xf6\xc6\xd2\x2a\xd7\x9a\x91\xf9\x26\xd1\xa9\xb7\xda\xed\x06\
-\x6b\x3a\x27\x42\xb6\xba\xa5\xe9\xf1\xe4\x48\x88\x20\xc9\x53\x4d\
-\x92\xb4\xad\x4b\x25\x5d\x3f\x42\x16\x4e\x1f\xdf\x7f\x35\xba\xfa\
-\xe1\xe6\xb3\xcc\x85\xda\x43\x57\x05\x6a\x8d\x7a\xca\x6e\x7a\x6f\
-\x46\x3d\xf7\x04\x8f\xc4\xd2\x16\x7b\x80\x7d\x0d\xae\x33\xb4\x4a\
-\x24\xb8\x3a\x92\x94\x8f\xb6\x96\xc1\x50\x2d\xb2\xc3\x4d\xb2\xd3\
-\x49\x4a\x5a\x69\xa4\x25\xb6\x90\x94\xd0\x25\x08\x42\x68\x94\xa5\
-\x20\x72\xc1\x1c\x39\x9c\xc7\x1a\x0f\x78\xcf\x14\x34\x34\xcb\xba\
-\xbc\x86\x0f\x0e\xef\x5e\xdc\x50\x8a\x52\x9e\x8a\x72\xc0\xa6\x59\
-\xe7\xeb\xe3\x83\xf0\xa5\x3b\x38\xfb\x4e\x3b\x71\xc2\x9e\xda\xfa\
-\x07\x60\xa9\xfe\x58\xf8\xf8\xd3\x80\x38\x07\x88\x19\xd3\x85\x31\
-\x43\x4c\xf8\x8e\x59\xfc\x31\x33\xcd\xce\xce\xef\xb4\x7d\x88\xf3\
-\xca\xa5\x43\x9b\x6b\xdb\xdd\x16\xeb\x97\x09\x7b\xa9\x72\x52\xda\
-\x65\x87\xef\x5a\x7a\xce\x1c\x93\xa7\xa6\x3d\x15\x2b\x06\x7a\xc3\
-\x4c\xc9\x20\xa5\x41\x6e\x29\x27\x16\x3d\xa9\xf3\x31\x6e\x7a\xc3\
-\xe6\x2a\xd7\xa0\xad\xda\xf6\x30\x7a\xd9\x32\x09\xd6\x3b\x7f\x2e\
-\x42\x2d\xf1\xf5\x21\x2b\x65\x31\x84\xa6\x66\x2d\x2d\x3d\xd2\xa0\
-\x1d\x2a\x0b\x4a\x40\x24\x27\xb3\x2a\x7c\xea\x71\xca\x99\xe4\x3f\
-\x4c\xb9\x60\x65\xc3\x87\x76\x06\x7c\xfd\xf8\x23\xfd\x34\xe7\xda\
-\x3c\x71\x5f\x97\xa0\x9f\x87\x85\x7e\x27\x15\xcc\x0a\x65\x97\x1a\
-\x54\xe7\xcb\x15\xe5\x4e\x1e\x15\xae\x2a\x7b\x73\xc7\x95\xdf\x3d\
-\xf6\xe6\xae\x4d\x46\xb4\x6a\x9b\x5e\xcb\xee\x92\xad\xe8\x59\x8d\
-\xff\x00\x1a\xd5\x52\x64\xb7\x63\xbc\x5d\x3e\xb4\x32\xd3\x10\x27\
-\x3c\xb6\x14\xe2\xc1\x1f\xef\x24\x1c\xc2\x69\x6f\xbb\xdb\x64\xb3\
-\x2a\x0d\xca\x1c\x79\x91\x5f\x65\x61\x6d\xb8\xc4\x86\xd2\xeb\x6b\
-\x4a\x92\x48\x21\x40\xf8\x60\x14\x8e\x1c\x3b\xa8\x79\xe3\x3c\x8f\
-\x1e\x3c\xb8\x53\xb3\x07\xa8\xe4\x78\x78\x1c\xbb\x30\x69\xc6\x9e\
-\xec\x0e\x5d\xa3\x8f\x86\x38\x8a\x03\xc0\x7c\x2b\x8e\x14\x3d\x87\
-\x2a\xe0\x64\x01\x1c\x4e\x5d\xd9\x9a\x66\x30\x7b\xa9\xc4\xf6\xf2\
-\xf7\xe3\x31\x5c\x8e\x55\x22\x94\xe5\x82\x79\x9f\xe6\x0f\xe9\x82\
-\x71\xb5\x7b\xf5\xac\x6f\xd6\xd7\xb7\x4b\x4c\x6b\x28\x5f\xf0\xed\
-\x11\x6b\xb8\xb0\x8d\x6b\xa8\xa1\xa5\xe4\x4a\x94\x21\xc4\x42\x95\
-\x29\xab\x5b\x4e\x32\x84\x48\x79\x61\x2c\xa5\x2e\xd1\x47\x3c\x6a\
-\xb1\xe5\x3a\x2d\xab\xc8\x5f\x95\xfb\xa4\x15\xdb\xa1\xee\x1c\x87\
-\xe6\x8d\x55\xaa\x65\x74\xa1\x32\xda\x6f\x54\xc2\x40\xbb\x04\x3c\
-\x91\x9a\xad\xc8\x60\x24\x2e\x8b\x5a\x86\x19\xfd\xbd\xbf\x70\x8d\
-\xc8\xd4\x9b\x8f\x33\x52\xbc\xc4\xfd\x2b\xb9\xba\xa6\xef\x74\xb8\
-\xd8\xff\x00\x0d\xf6\x83\x50\xaf\x3a\x5a\xf7\x7d\x2a\x7e\x4d\x92\
-\xe3\x24\x16\xe4\xb0\xa7\x01\x8e\xf2\x49\x09\x49\xeb\xab\x13\x22\
-\x3c\xd4\x88\xd2\x5a\x6d\xe6\x1f\x65\x69\x71\xa7\x5a\x75\x01\x6d\
-\xb8\xdb\x88\x25\x2b\x42\xd2\xa0\x41\x1f\xc5\xa7\x76\xb7\xcb\x8e\
-\xd4\x5d\xb5\x7e\xb7\xd5\xf3\x1b\xb6\xd9\xd1\x7d\x9a\xc4\x39\x4b\
-\x93\x31\xf4\x46\x80\xb8\xd6\xf8\xc9\x92\xca\xc4\xb5\xb8\x3a\x7e\
-\xeb\xed\xd2\xa0\x91\x84\x6a\x4f\x3e\x1b\xef\x37\x4d\x68\x69\xce\
-\x31\x31\x9d\x8e\xda\xe9\xee\x26\x3b\xf6\xf3\x21\xb9\xcc\xdb\xf5\
-\x2d\xe4\xb4\xcc\x54\x3a\xd2\x0f\xda\x71\x31\xd0\xe2\xb2\xa8\x74\
-\x62\xc9\xb7\xbb\x53\xa3\x6c\x7a\x2f\x4a\xd8\x61\x35\x0a\x0d\xb6\
-\xcd\x01\x88\xa0\xa5\xb1\xf5\x3d\x29\xe6\xd0\x1d\x97\x29\xf5\x92\
-\xb7\x1d\x70\xa9\x6b\x51\x24\x92\x7d\x1d\xb5\xec\xf6\x65\x82\x48\
-\xa0\x1c\xf3\xf0\xcb\x04\x53\x3e\x35\xe1\xc7\x99\xcb\x14\x3f\xea\
-\xf5\xfd\x31\xc0\xf6\x54\xf3\xc1\x1e\xb5\xe5\xf2\xc0\x07\x88\xcc\
-\xf7\x11\x8f\x67\xc6\xb4\xa6\x0f\x6d\x6a\x6b\xd9\xdd\xe1\x8c\xfb\
-\x7f\xa8\xf9\x60\x76\x7c\xb8\xe2\xbc\xb3\xec\xed\xcb\x1c\x32\xa5\
-\x6b\xc4\x60\x53\x3a\xf7\xe0\x95\x50\x24\x0a\x92\x48\xa0\x03\x32\
-\x4d\x72\xc5\xd7\x4b\x58\xb5\x04\x4d\x4d\xbd\x57\xbb\x5c\xe8\x7a\
-\x07\x6d\x34\xd2\x91\x7b\xd6\x97\xfd\x41\x22\x33\xcd\x5a\xda\x83\
-\x62\x86\xa7\x24\x86\x3f\x32\x9d\x6f\xba\x1b\x8e\xd2\x41\x52\xd6\
-\x02\x4e\x2e\xfe\x75\x3f\x71\x17\x11\xb9\xfb\xe9\xab\xee\x83\x51\
-\x5b\x76\xea\xf1\x30\xde\xac\x3a\x4e\x69\x73\xee\x46\x9b\x7c\x05\
-\x6e\x41\xb9\x5c\x99\x69\x2d\xa5\x11\x50\x15\x1a\x27\x40\x4a\x4a\
-\xc2\x53\xd2\x6e\x56\x4d\x35\x64\xb5\xdc\x15\x09\x9b\x68\x99\x06\
-\xdd\x16\x34\x94\xdb\xa3\x0f\xf6\x20\x36\xf3\x4d\x25\x6d\xc3\x68\
-\x8a\xa5\xb0\x42\x01\xe5\x82\x47\x2e\x19\xf3\xfe\xd8\xe5\x5e\xea\
-\x91\x5e\xfe\xcc\x1a\x8f\x5e\x78\x35\x19\x57\x88\xcc\x78\x63\x97\
-\x4f\x30\x78\x77\x7c\x71\x5e\x14\xc0\x3d\xdf\x3a\x62\xb8\xe0\x69\
-\x5e\x5d\xfc\x2b\xc4\x63\xa4\x8a\x65\x5c\xbc\x7c\x07\x3c\x52\x9f\
-\x0e\xc3\x40\x79\x81\xc3\x1b\xa1\xb3\x1a\x81\x0e\x98\xda\xc7\x4d\
-\xca\x62\x04\x88\xeb\x0d\xcb\x81\x7c\x84\x53\x71\xb1\x5c\x62\x3a\
-\x72\x6e\x4c\x1b\xac\x56\x9c\x49\x39\x12\x9a\x1a\x83\x85\xed\xa6\
-\xa0\x79\xf8\x1b\x89\xb0\xf7\x79\xbb\x6b\xae\x74\xfd\xd9\xe0\xfd\
-\xf6\x24\xfb\x14\x97\x61\x22\x54\xa7\x01\xa2\xd8\x94\x19\xea\x42\
-\x92\x0a\x29\x95\x49\x07\x1d\xde\xce\x3f\xdb\x15\xa5\x4f\x3e\xec\
-\x0c\xab\x4e\x34\xae\x5f\x0c\x56\xb4\xea\x3c\x41\xcb\x2a\x72\xa6\
-\x00\xa6\x74\xfd\x31\x5a\x71\x3c\xbb\x7f\xae\x0a\xb9\x52\xbf\xd3\
-\xc7\x14\x3c\x72\xcf\x1d\xf9\x73\xec\xee\xe7\x83\xdb\xcf\xdb\xfd\
-\xf1\x3f\x5b\x6e\xa6\xb9\xd2\xda\x03\x49\xda\xda\x2e\xce\xbf\xea\
-\xcb\xd4\x0b\x1d\xb2\x3a\x40\xc8\x2a\x4c\xe7\x99\x6d\x6e\x2f\x82\
-\x52\x2a\xa5\x1c\x80\x27\x17\x7f\x2c\xbf\xb5\x56\xc5\x6b\x7d\xf8\
-\xdc\x99\xc0\xdb\x5e\xdf\x49\x96\x65\x46\xdb\x5d\x0e\xa7\x9c\x5b\
-\x0b\xbd\x08\xf3\xdb\x68\x4a\x66\x3f\x4a\x8a\x1e\x9c\xb8\xb1\xc2\
-\x80\x21\x2e\xd4\x24\xeb\x0d\xf4\xfd\xce\x35\xe5\xd3\xcd\x37\x98\
-\xad\x77\x1a\x5c\xf1\x6b\x97\x76\xb8\x27\x41\x68\x69\xd2\x62\x13\
-\x1a\x35\xb6\x2f\x5b\x26\x73\x90\x24\x10\x13\xf6\xd3\x1e\x22\x10\
-\x02\x50\xcf\x48\xa9\xd5\xfe\x5e\x1c\xd3\xd6\x9d\x28\x36\x3b\x59\
-\xdc\xb4\xb5\xb2\xcf\x68\x68\x31\x11\x36\x8f\xba\xb5\xb2\xf2\x1b\
-\xea\x52\xa8\xeb\xe1\x67\x3c\xf3\xe2\x78\x9b\xae\x8f\x0a\xb7\xe9\
-\x4d\xe6\xd2\xec\x3f\x7a\xd9\xcd\xd0\x10\x9b\x5d\xd7\x4b\xea\x56\
-\x00\x79\xa8\x0f\x4b\x42\x7f\x2d\x5a\x7e\xf6\xe3\x29\x62\x63\x21\
-\x44\x14\x90\xe0\x1d\x68\x49\x17\x6f\xdb\x1b\xcf\x4c\x25\xe8\xbf\
-\x30\xfb\x55\x29\xcd\x2b\xa3\xee\x97\x56\x97\x13\xfe\x45\x6f\xb5\
-\x01\x1a\x04\x67\x96\xe7\x52\x25\x37\x70\x61\xb4\xbb\x06\x52\x16\
-\xb6\xdf\x69\x69\x4f\x51\x3d\x0a\x70\x2a\xa2\x87\x30\x47\x02\x28\
-\x0d\x47\x75\x0e\x05\x3b\x73\xaf\x66\x0f\x7f\xf3\x07\xf4\xf4\xc1\
-\xbe\xed\x46\x81\xda\x05\xca\x89\x02\x2c\x08\x3a\x8b\x4d\x59\x74\
-\xbc\xa9\xe9\xb6\xc7\x59\x91\x01\x86\xee\xb0\x58\x71\xff\x00\xb2\
-\xc1\x5d\x5b\xfa\xf2\xe5\x81\x4e\x1c\xa9\xc2\x9c\xa9\xe8\xf6\xfa\
-\xe5\x8a\x01\x90\xa1\xcb\x85\x6b\xdb\xc3\x86\x32\x1c\x40\xf5\xaf\
-\x75\x31\x4a\xe5\x5a\x7b\xbf\xb6\x07\x11\xcb\xc6\xbf\xca\xb8\x35\
-\x15\x03\x87\x6f\x7f\xb7\x00\x01\x4a\x9e\x7e\x1d\xfc\xf1\x97\xaf\
-\x6e\x00\xcb\x3e\x1e\xbc\x29\x8c\x87\xc3\xd1\xca\xbc\x87\x6f\x67\
-\xc7\x01\x26\xa6\xb5\x3f\x3c\x1c\xc1\x03\x81\xfd\x0e\x2e\xda\xb7\
-\x59\x5f\x6d\x7a\x67\x4d\x58\x60\xc8\xb9\x5e\x2f\x57\x89\x8c\x40\
-\xb7\x5b\xe0\xc5\x69\x4e\xc8\x91\x22\x4c\x85\xb6\xd3\x6d\xb6\xda\
-\x49\x35\x3c\xb1\x7d\xdb\x0f\x22\x91\x2e\xba\x17\x65\x2d\xf2\xe5\
-\x58\xb5\x97\x9a\xcd\x4b\x62\x75\xbb\x53\x89\x69\xd0\x89\xad\x6d\
-\xac\x09\xbf\x6d\x57\xe9\xce\xa0\x14\x36\xea\x80\x6d\xb3\x55\x2a\
-\x9f\x4e\x2e\x1a\xab\x4d\x5a\xee\x3a\xd3\x76\xb5\x0a\x14\xad\x5b\
-\xbc\x7b\x83\x39\x7a\x9f\x70\x2f\xef\x3c\xa4\x39\x24\x2a\xef\x38\
-\x2d\x76\xe8\x6e\x3a\x90\x44\x78\xc1\x96\xb2\x15\x06\x95\xc5\x4f\
-\x67\x0f\xd6\x98\xe1\xc6\xbc\xb8\x60\x00\x38\xfc\x07\x33\x82\x78\
-\x54\xe7\x8a\xf1\x15\xe1\xcf\x97\x3e\x78\xec\x03\xd9\xf3\xa6\x3b\
-\x47\xbf\x19\x0f\x77\x33\xf1\xc6\x7f\x0f\xd3\x1e\xda\xf8\x57\x14\
-\x02\x95\xae\x7d\x9f\xcf\x1e\x03\x8f\x01\x5e\xcf\x6e\x3d\x9c\xff\
-\x00\x4a\x76\x60\x8e\xdc\x58\xb5\x63\x53\x7f\xc4\x6d\xbf\x9d\x4d\
-\x38\xdc\x09\xf0\x90\x85\xa2\x17\xfe\xcb\xd2\xa1\xa8\x2e\x24\xa5\
-\x29\x11\xdb\x91\x73\x8f\x29\x87\x51\x5a\x15\xb8\x5c\xe6\x45\x50\
-\x72\xfa\x80\x52\x49\x1d\xb9\x8e\xde\x35\xc0\x27\x8d\x73\xfd\x2b\
-\xcf\x00\xe4\x32\xaf\x66\x3b\x86\x7d\xc4\xe3\x31\x4a\xf3\x3c\x8d\
-\x7c\x31\x97\x0e\x35\xaf\x3e\x1e\x35\xc6\x74\xef\xe7\xc7\xb7\x07\
-\xe1\xfd\x73\xc7\x1e\x19\xf1\xa7\xaf\x0c\x0d\xad\xdb\x4d\x3b\x2f\
-\xcc\x3f\x9a\x0b\xd8\x6e\x2d\x8b\x68\xf4\x5b\xab\x9a\x9b\x2c\x99\
-\x67\xed\x44\x99\xad\x27\xdb\xd1\x29\x76\xc6\x94\xea\x87\x4c\x54\
-\x25\x52\x9e\xa8\xfa\x52\x93\xd6\x2d\x3e\x64\xbf\x76\x2d\x53\x2b\
-\x41\xed\x8b\x72\x63\xdc\x34\x27\x95\x6d\x21\x32\x7d\xbe\x0b\x16\
-\xc6\xc3\x8a\x89\xfe\x6e\xde\xb9\x0b\x45\x95\x52\x12\xf1\xfb\xa5\
-\xd2\xf4\xf7\x93\x44\xb8\xa4\x00\x90\x18\xd1\x5b\x21\xb6\xba\x53\
-\x6f\x2c\x2d\xb6\xc8\x7d\x8d\x3d\x68\x89\x06\x45\xc1\xd6\x59\x43\
-\x02\x55\xd2\x63\x4d\xa6\x55\xc6\x5a\x9b\x6c\x05\x38\xf2\xd6\xb3\
-\x4e\x38\xa5\x05\x32\xfe\x58\xdc\x3d\x31\x77\xb8\x7f\x8c\x85\xbd\
-\xa9\xb4\xdf\xed\x89\x7d\x20\x41\x4d\xc9\xf8\xc6\x3a\x82\x5f\x3f\
-\x4b\x0e\x4c\x95\x0d\x60\x24\xd1\x2a\x59\xca\xa4\xe0\x2d\x25\x2b\
-\x6d\x40\x14\xac\x10\xa0\x41\xe1\x42\x2a\x08\x23\x3c\x69\xef\x3a\
-\x1e\x53\x74\xd4\x78\x7e\x75\x7c\xbf\x48\xb7\xde\xed\x73\xac\xef\
-\xff\x00\x8a\xbb\xee\x36\x87\xb3\xb8\xa9\x57\x1d\x2a\xec\x96\x94\
-\xd0\x99\x78\x86\xca\x0a\xe0\x95\x92\xb5\x74\x96\x41\xaa\x91\xd2\
-\xf6\x98\xd5\x0c\x3b\xa6\x37\xd3\x6b\x18\x67\x4f\x6e\x0e\x98\xb9\
-\xa8\x33\x70\x72\xe5\x6d\x42\x61\x4e\x94\x63\xac\xa5\xd4\xc8\x6e\
-\x53\x2a\x4b\xa9\x29\xa8\x56\x7c\x08\xc5\x7f\x82\x25\xef\xca\xaf\
-\x99\x7f\x32\x3e\x59\xae\x91\x02\x5d\x4c\x4d\x2d\xaf\x6e\x37\xbb\
-\x1c\x87\xd9\x00\x33\xf9\x76\xeb\xc3\xce\x29\xe6\x92\x00\x05\x2a\
-\x71\x49\xe9\xca\x98\x66\x66\xd2\x79\xa3\xda\x1f\x34\xba\x6d\x11\
-\xdd\x4b\xda\x77\x77\xf4\xdc\x7d\x23\x7c\x4a\x9b\x52\x04\x56\xda\
-\xba\x5a\xa2\x2d\x0f\x39\xf6\x52\x42\xd6\xa9\x08\xea\x51\xad\x31\
-\x3a\x27\x9c\x1f\xdb\x6b\x5c\xdf\xd8\x86\xb6\xbe\xde\xae\xf2\xe5\
-\x30\x6b\x4b\x5b\xed\x28\x7d\x6a\x36\xd6\x9c\xb8\xb8\x90\x80\x85\
-\x28\xad\x4f\xa2\xb9\x0e\x9a\x9c\x5a\xb4\xc6\xe0\x6b\x4d\x5b\xb0\
-\x3a\xd6\xe0\xa4\x31\x2f\x4c\xef\x2e\x8b\xbe\xe9\x65\xda\x65\xa9\
-\xc2\xd7\xe3\x5c\x6e\xa6\x2b\xf6\x98\x8b\x0e\x82\x9a\xb8\xea\x13\
-\x51\xc7\x11\xee\x1b\x6d\xba\x1a\x17\x5b\xc4\x94\x8f\xb8\xc3\xba\
-\x67\x53\xda\x2e\xc1\xe6\xf8\x95\x21\x11\x25\xba\xb2\x00\x39\xe5\
-\x97\x03\x8c\xa8\xa4\x9a\xd2\x99\xe5\xf2\x38\xa1\xe0\x0d\x47\xc7\
-\x22\x7d\xb8\x3c\x80\x14\x19\x7e\xbd\xb4\xc5\x41\x3e\xa6\x99\x60\
-\x01\x52\x46\x75\x3e\xbd\xb8\x26\xb5\xa9\xad\x7d\xc3\x00\x9a\xd7\
-\x3a\x7b\xb0\x2a\x09\x39\x1f\x75\x2b\x5c\x57\x96\x0d\x79\xd7\x3e\
-\x7c\x72\xf8\x0c\x53\x3e\xa1\x4a\x1f\x71\xc5\xfb\x71\xf7\x27\x50\
-\xdb\xf4\xce\x96\xd3\xd1\x17\x26\x64\xfb\x8c\x96\xa3\xa5\xd7\x28\
-\x44\x78\x51\x83\x8a\x49\x7e\x64\xc7\x48\x6d\xa6\xd3\x55\x2d\x6a\
-\x00\x0c\x3f\xb9\x1e\x65\xa2\xea\x1d\x9b\xf2\x43\x65\x96\xd3\x9b\
-\x5b\xb1\x30\xae\x4e\xdb\x75\x1e\xf0\x32\xd4\x80\xea\x35\x4e\xe1\
-\xbd\x05\xd4\xb8\xcd\x9a\x5b\x6d\xa4\xb3\x18\x90\x48\x51\x09\xc8\
-\x07\x1c\xb4\xe8\xcd\x09\xa7\x2d\x1a\x53\x4c\x58\xe1\x47\x81\x6a\
-\xb2\xd9\x20\xb1\x6f\xb7\xc2\x8b\x19\xb4\xb4\xd3\x6d\x47\x8c\x84\
-\x36\x9e\x96\xd2\x33\xa5\x4f\x3c\x57\x91\xf9\xf7\xd7\x3c\x75\x1a\
-\xd4\x1a\x7c\x3b\x29\xdf\x83\x92\xb3\xc8\xe4\x69\xfa\x67\x84\x81\
-\x90\x1f\xa9\xcf\x06\xb9\x0e\x15\x3c\xce\x05\x05\x6b\xcf\x90\xc5\
-\x3c\x7e\x1e\xfc\x1c\x8d\x01\x34\x1c\xfd\x9d\xa3\x3c\x64\x4f\x1e\
-\x3f\xa7\x23\xcf\x00\x53\xb7\x3f\x40\x1c\xcf\xcb\xdf\x82\x9e\xce\
-\x7d\xd9\x65\x80\x54\x33\x19\x52\xbf\xcb\x1f\x2f\x5e\x79\x62\x5e\
-\xe3\x69\x08\x32\x64\x6e\x2f\x97\xed\x4f\x61\xdd\xfd\x20\xfd\xb9\
-\xaf\xbb\x73\x68\x69\x99\x88\x7a\xf8\xcc\x34\x04\xa9\x4f\x29\xdb\
-\x32\x9d\x57\xdb\xe0\xb5\x21\x3d\x98\xdb\x1d\xc7\x43\x9f\x71\xcd\
-\x53\xa4\x6c\xd7\x39\x44\xd7\xad\x33\x1f\x84\xd1\x92\x87\x12\xaf\
-\xad\xb7\x12\xed\x7a\x92\x73\x4a\xaa\x0e\x63\x1c\xc1\x3c\x7b\x0f\
-\x61\xc7\x4e\x60\xf6\xfb\x7e\x78\xad\x4e\x74\xf6\x91\xcb\xdb\x8a\
-\xd0\x8c\xf3\xf5\xec\xc0\xe3\x5e\x03\x85\x3f\x9d\x71\x52\x0d\x73\
-\xec\xa1\xf1\xc5\xc7\x50\x6a\x2b\xa4\x0b\x25\x92\xd1\x0d\xf9\xf7\
-\x3b\xad\xce\x53\x30\x6d\xf0\x21\x46\x6d\x4e\xbf\x26\x54\xb9\x0b\
-\x6d\x86\x19\x69\xb4\x12\xa5\x29\x40\x00\x33\xc2\xbc\x91\xfe\xd0\
-\x1a\x7e\x7e\xa9\xb8\xce\x94\xab\x3e\xe8\xf9\x9b\x62\x1b\xec\xd8\
-\x74\x95\xb9\xc5\x18\xf3\xd5\xa5\x6e\xb2\x10\x88\x71\x23\xc7\x4a\
-\x89\x5d\xc9\x64\xad\x60\x7f\xe3\x0f\xa9\xb7\x14\x37\x2b\x5d\xc8\
-\x7f\x7a\xfc\xce\xea\x68\xcc\x4d\xd6\xdb\xb9\xac\x9e\x91\x79\x96\
-\xdd\xe1\xf4\x17\xae\x2d\x69\xd4\xdc\x96\xf2\xa2\x47\x54\xc7\x5c\
-\x25\xf5\x03\x21\xd2\x6a\xa5\x0e\x02\x80\x50\x00\x3b\x85\x39\x70\
-\xcb\xd1\xcc\xd7\x98\x1e\xa7\x1b\x43\x7f\xd3\x1a\x45\xeb\xfc\xdb\
-\x76\xae\xb6\xda\xb5\x5b\xf0\xae\x8a\xb3\xce\x83\xa5\x5c\x98\xd4\
-\xb7\x67\x26\x4b\x2f\x46\x90\xb1\x09\xc6\x4d\x02\x1c\x4a\xe8\xb3\
-\x4a\xd4\x8c\x5b\x6d\x51\x5a\xfb\x31\x6d\xd0\xa2\x43\x8e\xd1\x52\
-\x96\x5b\x6e\x33\x28\x69\x08\x2b\x70\xa9\x6a\x29\x09\xa5\x49\x24\
-\xe0\xa1\x5f\x50\x23\xfd\x24\x02\x9e\xf0\x78\xd6\xa3\x09\xfd\xd0\
-\xfc\x8f\x31\x26\xcd\x60\x0f\xa6\xf7\xe6\x87\x6c\x74\xba\x57\x0c\
-\x49\x62\x3c\xb1\x2a\xed\xb8\x56\xdb\x7c\x65\x06\x65\xb3\x39\x8e\
-\xa3\x74\x61\x2d\x92\x15\x59\x04\x28\x17\x29\xa3\xf7\x2f\x45\x5e\
-\x21\x48\x97\x75\xb2\x5b\xa5\xdf\x2c\xcd\xcb\x8c\xf4\xfb\x44\xd9\
-\x0c\x21\x4e\xb5\x25\x96\x5c\x71\x48\x69\x6e\x54\xa1\x47\x22\x3d\
-\xdf\xc2\x68\x29\x53\x53\x8f\xa9\x20\x83\xc4\x10\x08\x3e\xc2\x08\
-\xc3\xa8\xde\x2d\x87\xda\xed\xc3\x5b\xa9\x5a\x4c\xbd\x49\xa3\xec\
-\xd3\xee\x29\x0e\x01\xd6\xa6\xee\x0e\x44\xfc\xd6\x96\x69\xfe\xa4\
-\xb8\x0e\x23\xdc\xf6\x86\x36\xe6\x79\x73\xd5\xf6\xc7\x9d\x95\x68\
-\xd4\xdb\x3b\xae\xb5\x05\x89\x56\xe5\xca\xea\xfb\xad\x31\x0d\xe9\
-\x72\xa1\xa1\x82\x14\x47\xdb\x4a\x52\x90\x93\x4a\x52\xa0\xb4\xf7\
-\x96\x9f\xdc\x2d\x8d\xd6\xb6\x5a\xae\x8b\x91\x6e\xd0\x5e\x61\xf4\
-\x93\x37\x01\x3e\xd6\xa4\xaf\xa6\xdd\x3b\x55\xb6\x2e\x97\x35\xa9\
-\x15\x03\xa9\x3f\x6a\x9c\x41\x14\xa1\x62\xdd\xe7\x57\xc8\x26\xa4\
-\xd7\x76\x24\x7d\x0e\x6e\x97\x95\xe7\xde\xd6\x16\x95\x25\x25\x3d\
-\x52\x25\xd8\x5d\x0f\xbd\x09\x09\x6c\x95\xab\xad\xe6\x8d\x01\xa0\
-\xc8\xd0\x40\xbb\xee\x65\xeb\x67\xef\xc1\xd5\x46\x7e\xc7\xbb\xda\
-\x5a\xed\xa3\xe4\x31\x21\x09\xaa\xdb\x72\x5c\x86\x5d\xb7\x02\x14\
-\x08\x00\xbc\x09\xa7\x0a\x62\x2c\xdd\xb9\xdd\x2d\x07\xad\xa3\xca\
-\x8e\xd4\xa6\x15\xa6\xb5\x4d\x9a\xec\xa5\x30\xf8\xab\x6b\x2d\xc4\
-\x98\xe3\x88\x0a\xec\x50\x04\x60\x74\xf3\xcf\xa8\x1e\x23\xd9\xcb\
-\x1c\x28\x2b\x52\x3d\xde\x18\x06\x9d\xa2\x9c\x79\x60\x1e\x46\xb9\
-\x78\x7b\xf0\x47\x1c\xf3\x1c\xfb\x72\xe7\xc7\x02\x99\x13\xec\xfe\
-\xd8\x1d\xdc\x7d\xb8\xff\x00\x95\x6f\xfc\xab\x2d\xe3\x67\xb4\x0d\
-\xd6\x34\xcd\xab\xda\x28\x8d\x7e\x65\xb2\xe1\x78\x8c\xca\x09\xd6\
-\xba\xe9\xd9\x2d\x84\xcf\xb8\xb5\x21\x4b\x4c\x38\x68\x06\x3b\x08\
-\x01\x6a\x2b\x59\x1d\x2c\xc4\x88\xc3\x31\x62\xc6\x69\xb6\x63\xc7\
-\x61\x09\x69\x96\x59\x6d\x21\x08\x69\xa6\x90\x02\x50\x84\x24\x00\
-\x00\x14\x00\x63\x8f\x13\xf0\x03\xf9\x8c\x66\x39\x76\x9f\x96\x33\
-\x19\x90\x39\xd6\xb4\xef\xc5\x08\xff\x00\x56\x7f\x3e\x58\x39\x67\
-\x53\x9e\x7c\x3f\xb6\x06\x59\x03\xeb\xec\xc0\x14\xe3\xd9\xc0\x53\
-\x02\x95\xe3\xc7\xbf\xd9\x91\xc0\xae\x64\xf2\xcb\x2e\xdc\xfc\x70\
-\x41\xe6\x73\xf6\xf0\xf9\xe2\x9e\xc3\xdc\x79\x62\x99\x8e\x34\x3d\
-\xbd\xbf\x0c\x66\x7f\xd2\x0d\x3c\x46\x2a\x32\x35\xa9\x1d\xe4\x52\
-\xb8\x00\x65\x95\x4f\x89\xf9\x67\x83\x4c\xf3\xc8\xd7\x86\x2f\x96\
-\x39\xec\x89\x10\xaf\x16\x99\xf6\xd9\x6c\x2a\x94\x7a\x3c\xc8\xae\
-\xc7\x75\xb3\x5c\xbe\xa4\x38\x46\x37\xc7\x60\xa7\xcf\xb9\x5d\x1a\
-\xd8\xbd\xdf\xd5\x7a\x3a\xd8\xe5\xc0\x2f\xee\xdb\x6c\xcc\xdc\x24\
-\x39\x69\xb7\xad\x2e\xab\xee\xa5\x28\x86\x53\xd0\xaa\x04\xa8\x66\
-\x9a\x8e\x03\xbb\x00\xf1\x3c\x4f\xbf\x2f\x86\x33\xa7\x70\x27\x9f\
-\x6f\x0c\x1a\x95\x72\xe1\x8e\x39\xf1\xfe\xb8\xbe\x6e\xd6\xfb\xeb\
-\xcb\x2e\x85\xd1\xf6\x38\xae\xbc\xa7\xee\x32\x53\xf9\xf7\x49\x29\
-\x49\x2c\xda\xec\x76\xb6\xca\xa7\xde\x2e\x92\x97\x44\xb6\xc3\x0d\
-\xad\x6a\x27\x85\x2a\x40\xd2\x5a\x32\xd7\xa9\x7c\xb6\x7e\xde\x3a\
-\x77\x50\xbe\x35\x05\xed\xf1\x71\xb4\xea\x5d\xcb\x80\xc3\xdd\x2c\
-\x22\x4c\x9a\xb5\x1e\xf1\x2d\xf6\x91\x54\x41\x68\x2e\x14\x52\xa2\
-\xa7\x94\xe2\xd2\xdd\x60\x6d\xbe\xc6\x68\x6b\x5e\x97\xb6\xb3\x1e\
-\x2a\x6e\xb7\x54\x30\x87\xaf\xda\x8e\x6c\x66\x50\xc9\xb8\xdf\x2e\
-\xae\x24\xca\x9b\x25\xc0\x9a\xd1\x4a\xe8\x40\x34\x48\x00\x53\xf8\
-\xb2\xcb\x87\x0f\x1c\x03\xcc\x9e\x3e\xc3\xdf\xc7\x17\x0b\x45\xda\
-\x1c\x6b\x8d\xb2\xe9\x12\x44\x1b\x8c\x19\x8c\xb7\x22\x2c\xc8\x52\
-\x9a\x53\x32\x62\xc8\x61\xc0\x5b\x75\x97\x99\x59\x4a\x92\xa0\x41\
-\x07\x3c\x5f\xbc\xe2\x79\x1b\x83\x75\xdc\xdf\x2b\x3a\x8b\x50\x9b\
-\xce\xe3\xed\x15\xba\x3b\x92\xae\x5b\x73\x6b\x97\x70\x33\xee\x76\
-\xe5\x5b\xda\x4b\xdf\x99\xa1\x10\x97\x9e\x53\x32\x5a\x4a\x17\x02\
-\xa0\x2f\x21\xf7\x0d\x9e\xc9\x12\xe6\xce\xdb\x6e\xc5\xc2\x3b\x6a\
-\x46\xdd\xea\x4b\x84\x6f\xcb\xb9\xb9\xf6\x03\xce\xff\x00\x83\x96\
-\x0a\x11\x39\xc6\xc0\x25\x4c\x29\x2d\xc8\x40\x15\x28\xa6\x67\x87\
-\x81\xe3\x8e\x07\x8f\xa9\xc0\xa8\xe5\xef\xec\x3e\xfc\x1a\x81\xc4\
-\x57\xdf\xcb\x04\x81\x95\x7f\xa7\xcf\x03\xd9\xc7\xc7\x9e\x38\x64\
-\x78\x76\x65\xe3\x81\x97\x86\x5f\x2c\x14\x3c\xda\x1c\x41\x04\x14\
-\x38\x94\xad\x24\x1c\xb3\x0a\x04\x70\xc3\xf6\xed\xd1\xd9\x1d\xb4\
-\xd6\xac\x49\x4a\x92\xeb\x97\xbd\x23\x66\x93\x27\x33\x52\xa4\x4c\
-\xfc\x41\x2d\xa5\x9e\xd4\xac\x1c\x4c\xd4\x5b\x39\x73\xdd\xbf\x2d\
-\x7a\xa9\xf0\x95\xc5\xba\xed\x0e\xbd\xbb\xdb\x20\x42\x74\x28\x2c\
-\x2d\x9b\x3c\xe7\x66\x45\x65\x01\x69\x07\xa1\xa2\xd0\xc4\x7b\x7f\
-\x97\x2f\xdc\x3e\xcb\xb9\x76\x1b\x5d\xcf\xf2\xa1\x69\xaf\x30\x1a\
-\x19\x17\x6b\xa4\x8b\x63\x6c\x36\xd3\x36\xa7\xb5\x62\x55\x75\x98\
-\xb4\x7f\xb6\x6b\xf4\xa3\x32\x08\x22\x84\x2a\xe7\xa8\x3c\xc8\x79\
-\x26\xd0\x7b\xc9\xa3\xf4\xd4\x39\x53\xef\x7a\xe7\x66\x35\x4b\xb1\
-\xdb\x4d\xb6\x22\x7e\xe3\xf3\xdd\xb5\x95\x5d\x27\xb4\x96\x5b\xaa\
-\x8a\x8c\x54\x27\xa4\x70\x18\x8f\x2b\x78\xb6\xcf\x7e\xb6\x41\xd7\
-\x23\x37\x21\xc9\x1a\x83\x40\xce\xbc\x59\xba\x14\x80\xb2\xf3\x33\
-\xad\x3f\x72\x4a\xe3\x2d\x35\x53\x6a\x53\x09\x52\x90\x3a\x88\x18\
-\xb6\xdc\x36\xf3\xcc\x8e\xdc\x48\x7a\xe6\xdb\x8e\x31\x66\xbe\x5f\
-\x23\xe9\x9b\xfb\x29\x69\x6a\x42\xc4\xab\x35\xf9\x50\x27\xc6\x29\
-\x52\x4e\x6a\x40\x07\x88\xa8\xcf\x09\x99\x63\xd5\x1a\x7e\xed\x15\
-\xda\x7d\xb9\x36\xeb\xc5\xbe\x63\x2a\xa8\xea\x05\x2e\x47\x90\xe2\
-\x0d\x52\x6b\xc7\x01\x48\x75\xb7\x41\xa0\x05\xb5\xa1\x63\x3e\x19\
-\xa4\xd3\x1d\xb5\xe7\xc4\xfb\xf1\xc2\x9e\xfc\x57\xe5\x8f\x01\x4c\
-\x72\xa9\x34\xe5\x4e\x38\x06\xb9\x8f\x5e\x1c\x06\x2b\x9f\x8f\x61\
-\xa0\x07\xc2\xb8\xaf\x3a\x52\xa7\xf5\x38\x15\x39\x1c\xbd\x7d\xb8\
-\xcf\x89\x26\x83\xd7\x96\x08\xad\x48\x35\xa8\x1e\xb9\xe0\x74\xf1\
-\xcc\xfc\x38\x60\x76\xf6\xf0\xe1\x9d\x71\xf4\x81\x9e\x7e\xbe\x07\
-\x1e\x19\x53\xc6\xbf\x1c\x70\xa5\x3b\x73\xaf\x8f\x2c\x67\x9f\x66\
-\x07\x6f\x0c\x0e\xe1\x4c\x72\xe4\x29\xdb\xcb\x87\x3c\x6a\xab\x55\
-\xc1\x4b\xb7\x6d\xb7\x9d\x1d\x25\x6b\xd4\xf6\x57\x9c\xe9\x66\xde\
-\xad\xc1\xd3\x69\x4d\x9a\xf7\x05\xb2\x8e\x94\x25\xff\x00\xb5\xf6\
-\x24\x12\xa0\x0a\x8c\x9e\x27\x92\x54\x93\x54\xa8\x54\x11\x4c\xc7\
-\x6f\xa4\x95\x28\x00\x01\x52\x89\x20\x00\x07\x12\x4f\x01\x84\x6d\
-\x66\x83\xb7\x4c\xf3\x0d\xe6\x4a\xf4\x44\x3b\x1e\xd4\xed\xfc\x84\
-\xdc\x13\x68\x9d\x24\x2d\x98\x4e\x6b\x1b\xac\x24\x4b\x4d\xa1\xb7\
-\x24\x94\x81\x1d\x09\x72\x52\xc9\x1f\x42\x41\xeb\x16\x3f\x37\xdf\
-\xba\xbe\xae\xbb\x5a\xf4\x64\x57\x97\x74\xdb\xbf\x2c\x30\xd4\x98\
-\xd6\x9b\x35\xaa\x4b\xa1\xe8\x90\x1e\x81\x1d\xcf\xb5\x63\x86\xa6\
-\x50\x9f\xbc\xa5\xfd\xcb\x8c\x80\xaa\x38\xb4\x94\xa5\x58\xb3\xe8\
-\xcd\x0f\xa7\xed\x5a\x63\x4b\xd8\x20\xc6\xb6\xda\x2c\xb6\x68\x4c\
-\x40\x81\x06\x1c\x56\x92\xcb\x2c\xb3\x1e\x3a\x1b\x6d\x21\x28\x48\
-\xce\x95\x3c\xf1\x98\xf8\xd6\xbf\xc6\x0f\xb7\xe1\xfd\x71\x43\xfa\
-\x61\xf8\x53\xa3\x31\x32\x24\xa6\x96\xc4\x98\xd2\x99\x6d\xf8\xf2\
-\x19\x75\x2a\x43\x8c\xbc\xcb\xa9\x52\x1c\x69\xc4\x28\x85\x24\x82\
-\x08\x38\x4f\x98\xff\x00\x21\xb7\x28\xfe\x5b\x7c\xca\xd8\xee\x89\
-\xbe\xbb\x6a\xd3\xf2\xa4\xd8\xf4\x0e\xba\x75\xaa\x3a\x59\xfc\x08\
-\x35\x8b\xa5\x6f\x26\x42\x03\x88\x93\x15\x94\xb4\xb5\x93\xf7\x11\
-\xd4\xa0\xe2\x5a\xf2\x7b\xfb\x83\xe9\x2b\xe6\xd8\xee\xae\x85\x54\
-\x7d\x33\x7a\xdc\x2b\xfa\xcf\xe2\x4a\x9e\xc7\x4c\x78\xb7\x3b\xb9\
-\x2d\x86\x5f\xb6\xdd\x90\x12\xe3\x73\x63\xad\xd6\x94\x95\x75\x90\
-\x11\x55\x07\x37\x15\x3a\xbf\x4e\xab\x42\x35\x6b\x17\xa7\x35\x6a\
-\x6e\xf0\x4d\x81\x16\xb5\x25\x2b\x13\x57\x73\x0f\xfe\x22\x58\x21\
-\x63\xea\x2b\xa5\x48\x1c\x71\x9f\x2c\xb8\x71\x03\x9f\x7e\x08\x3c\
-\x38\xfb\x78\xe0\x52\xb4\x3d\x83\x9d\x78\x57\x03\x24\x9e\x3c\x47\
-\xf5\xc5\x39\x76\xd3\x9e\x79\x7b\x70\x0f\xaf\xa9\xc1\x3c\x89\xcf\
-\xe7\x8c\xb2\x1f\x3c\x57\xb7\x87\xb3\x19\xe2\x55\xb6\xe3\x19\x99\
-\x70\x66\xb0\xe4\x69\x51\x5f\x6d\x2e\x32\xfb\x0e\xa4\xa1\xc6\x9d\
-\x6d\x60\xa1\x68\x5a\x4d\x08\x22\x84\x61\xdb\x25\xe3\x6e\x34\x6d\
-\xd6\xd8\xf2\x03\x6b\x85\x70\xd3\x96\xa9\xb1\xd4\xda\x52\x50\x94\
-\x7d\xa9\x11\x5c\x48\x4a\x51\x90\xc4\x88\xf7\xdf\x2c\x1b\x73\x6f\
-\x5c\xa6\x9d\x6d\xe9\x9a\x52\xdc\xee\x8f\x9c\xaf\xbb\xc5\x7f\x95\
-\xa6\xdf\xb6\xbb\xd6\x9c\xe8\x6b\x54\xd4\xd2\x95\x38\x79\xcd\xac\
-\xdc\xdf\x33\x7b\x2f\x29\x25\xc3\x6b\x1a\x1f\x79\x6f\xe6\xdf\x6a\
-\x2e\xf4\x97\x7e\xc4\x1b\xa1\x9a\x5c\x4b\xb4\xfa\xba\x96\x55\x9e\
-\x44\x50\x62\xde\x76\xb7\xf7\x3d\xf3\x5b\xa6\x5d\xb7\xc6\x69\x96\
-\x58\xbe\xce\x62\xff\x00\x05\x6a\x60\x8f\xb0\xa7\x18\x6e\x65\xb8\
-\x3b\x46\xd3\xd2\x7e\xe7\x5d\x70\xd3\xfa\x47\xf7\x14\xd0\xda\xf2\
-\xd7\x6f\x61\xc1\x12\xd3\xb8\x5b\x61\x19\x91\x3d\xca\xa8\x34\xd5\
-\xca\x54\x26\x25\xc8\x29\x57\xd3\xd4\xe2\x55\xd4\x29\x90\xe3\x59\
-\x8f\xb9\xa4\x7c\xa0\x6f\xa3\x0d\x0e\x98\xf1\xad\xd7\x4b\xe6\x94\
-\xbb\xbd\x52\x47\xdf\x4a\xa6\x2a\xdd\x04\xf4\x7f\xf4\x2a\x04\x8f\
-\x76\x23\x37\xb8\xdf\xb5\x0d\xdf\x51\x08\xfd\x08\xba\xdd\x76\xcb\
-\x74\xec\xb7\xf8\xce\x25\x28\xab\x92\xa0\xc0\x8e\xdc\xc9\xa7\xac\
-\x83\x46\x88\x51\x07\x2a\xf3\x2a\x63\x77\xfc\x86\xf9\xc4\xdb\x69\
-\xb1\xc2\x3f\x24\xc8\xdb\x79\x57\x0b\x7a\x49\x20\x3a\xe3\x73\x07\
-\xe3\x25\x4c\x35\x43\x55\x14\x8e\x1d\xe3\x06\x35\xdb\x78\x65\xed\
-\xb5\xcd\xa6\x90\xb9\x56\xfd\xc9\xd2\x7a\x93\x4b\x2a\x2b\x8a\x59\
-\x69\x6c\xae\x5c\xcb\x6f\xe0\x29\x4d\xad\x04\x12\x97\x4a\x68\x2b\
-\x5a\x67\x86\xe3\x6d\xef\x98\x5d\xa4\xd5\x72\x9c\x6d\x2e\x22\x1d\
-\xab\x5c\x58\x1f\x96\xa4\x38\x02\x92\x44\x5f\xcd\x4b\xe4\x10\x78\
-\x84\xe3\xee\x5b\xae\x50\x27\xb4\xae\x0b\x87\x2d\x89\x48\xcf\x87\
-\xd4\xcb\x8b\x4d\x72\xc1\x1d\xbf\x0f\xef\x8c\xb8\xfb\x72\xef\xcf\
-\x14\xec\xe1\xfa\xe7\xdd\x82\x29\xdd\xcb\x3f\x6e\x38\x0e\x3c\x48\
-\xc7\x22\x06\x75\xe4\x3b\x3b\xf8\xe3\x3c\xcd\x4f\x01\xc0\x7b\x79\
-\x60\x90\x33\xe7\xd8\x07\x3a\x67\x9e\x06\x64\x77\x71\x26\x99\x7c\
-\x31\x90\xa0\xc5\x49\xe7\xc3\x00\x7c\x7d\xbc\xf1\x91\xaf\x7f\x0c\
-\x4d\xde\x4d\xa1\x4a\x98\xdf\x9f\x2b\xf7\x68\xdb\xcb\xb6\xd2\x98\
-\x48\x0f\xce\x66\xc0\xb4\xbb\xaa\x74\xf3\xab\x4a\x4b\xab\x89\x74\
-\xb1\x25\xd5\x7d\xb0\x40\x5b\xcc\xb6\x0e\x55\xc5\xeb\x67\x2e\x16\
-\x6b\xa6\x92\xdf\xed\xb0\xd2\x16\xab\xb6\xb1\xb5\xcd\x54\x45\xda\
-\xef\xcd\xa1\x4d\x5b\xee\xd7\x3d\x3e\x58\x70\xbe\xcc\x78\x97\x15\
-\xa1\x2b\x69\xe4\x25\x63\xee\x8e\x92\xa0\x14\x44\x89\x92\x56\x1b\
-\x8d\x15\x87\x64\xbe\xe1\x04\x84\x32\xcb\x6a\x75\xc5\xd0\x66\x7a\
-\x50\x92\x71\xa8\x5f\xd9\xdd\x2b\xb9\x1e\x61\xb7\x2a\x14\xa9\xf6\
-\x9b\x1e\x8e\xd3\x5a\x62\xed\x66\xb5\x4d\xba\xc3\x71\xd8\xff\x00\
-\x72\x6e\xa1\xb9\x42\xe9\x6a\xda\x99\x2d\x50\xae\x3b\x32\x1c\x23\
-\x3e\x8e\x9a\x90\x2c\x1a\x33\x67\x2d\x9e\x44\x36\x07\x51\x4c\x72\
-\x0e\xa3\xdd\x51\x70\xbc\x23\x5c\xcc\xb3\xa3\xa5\x12\xe2\xe9\xd9\
-\xf2\x5d\x62\x62\xdc\x94\xdb\x9d\x3d\x71\x18\x6c\x05\x55\x25\xe4\
-\xf4\x90\xa5\xea\x88\x76\x87\xf7\x53\x79\x6e\x2e\xae\x55\xeb\x75\
-\xb7\x15\x2c\xdf\x75\x12\xe5\xbe\x7a\xe4\x1b\x5a\xa4\xb6\xb4\x5b\
-\x50\xeb\xa4\x95\x2d\x15\x79\xc3\x9a\xd6\xa3\x80\x94\x80\x94\xa4\
-\x50\x01\x90\x00\x70\x00\x72\x03\xf8\x47\xad\x7d\x47\xa4\xf6\x01\
-\xd9\xcf\x8f\xcb\xf8\x33\xf5\xf0\xef\xc4\xfd\x2b\xba\x76\x67\x34\
-\xe6\xb3\x44\x62\xde\x96\xdd\xdd\x22\xcc\x3b\x7e\xbe\xd2\xd2\x50\
-\x43\xb1\xff\x00\x1a\xe6\xa6\x14\x6e\x16\xdf\xba\x07\xdc\x89\x20\
-\x2d\xa5\x8a\x90\x12\xaa\x28\x6a\xff\x00\xff\x00\xe7\xce\xf7\xbc\
-\x91\x2f\x16\xef\x35\x0a\xb2\xdc\xf4\x66\xeb\xb7\x7a\x7a\xe2\xce\
-\x91\xd0\x1b\x75\x3d\x8d\xe7\xbb\xdc\x5f\xb4\xb6\xea\xde\xd3\xda\
-\xbe\xed\xa5\x76\xe2\x44\x6f\xf1\xeb\x52\x11\x22\x43\xe9\x1d\x65\
-\x0b\x4b\xb8\xe3\x5e\x7c\x38\x0a\x54\x70\xe6\x30\x6a\x72\x1c\xf9\
-\x9f\x6f\x71\xc0\xa5\x29\x5c\xf2\x3c\x69\xcb\x1c\x88\xa5\x00\xec\
-\x1f\xd3\x02\x9d\xe1\x5c\x78\x81\x5c\x77\x76\x0e\x55\xe5\xdd\x85\
-\x53\xc7\x3e\x34\x1f\xd3\x09\xcb\xdf\xc0\xd7\xf4\xa1\xc0\x03\x97\
-\x67\x0a\xe3\x3e\x1e\xb4\xc1\xed\x04\xd0\xf6\xf8\xe3\x3c\x88\xe3\
-\xcf\x8f\x0e\xd1\x98\xc0\x24\x64\x32\xee\xfe\x98\x03\xb4\xe3\x2c\
-\xbd\x94\x1e\xcc\x1e\xef\x1a\x7c\xfd\x19\xa4\x1a\xf1\xcb\x87\x3f\
-\x0e\x18\x29\x91\x16\x3b\xe9\x50\xa1\x4b\xcc\x34\xe0\x29\xec\x21\
-\x68\x35\x14\xc4\xa8\x7a\xdf\x68\xf6\xeb\x55\x45\x98\x3f\xf2\x18\
-\xbe\xe8\xeb\x0d\xc5\xb7\x33\xa8\x2b\x12\x60\x2e\xa7\xa8\xd6\xbc\
-\x6b\x85\x5d\xa4\xf9\x73\xd3\xfa\x46\xee\xb0\xdf\x55\xcb\x6e\xee\
-\x77\xcd\x0d\x23\xad\xb5\x15\xa1\x61\xbd\x3b\x71\x83\x14\x2d\x2a\
-\x57\x1f\xb7\x5c\x5c\x35\x17\x97\x1f\x38\x5e\x6c\x76\x32\x7c\x99\
-\x22\x73\x16\x9b\x7e\xe2\x48\xd4\x1a\x61\xb9\x2d\xb7\xd0\xda\x5f\
-\xb5\xdc\xdb\x0e\xcb\x62\xa0\x55\x2e\x3a\xa2\x46\x55\xc4\xc9\x9b\
-\x4d\xe6\xaf\x68\xfc\xcd\x5b\x4c\xa3\x28\x58\x37\x8b\x4e\x7f\x80\
-\xbb\x18\xed\x85\x84\xc1\x8b\x3e\x13\x2a\x41\xeb\x6f\xa7\xfd\x52\
-\x1b\x25\x79\xd4\x0e\x26\x2f\x9c\x8f\xdb\x4b\x72\x8b\x76\xd6\x83\
-\x77\x0d\x6f\xe5\xf6\x64\x7d\x73\x66\x90\xe8\x5a\x92\xe4\xc6\xec\
-\xcd\xc9\x96\xfb\x10\x3e\xda\x3a\xca\x8c\x95\x11\xc2\x9c\xf0\xcd\
-\x8e\xf7\xba\x52\xb6\x6f\x56\x39\xfe\xdb\x9a\x5f\x79\x2c\x37\x4d\
-\x09\x39\xa9\x29\x21\x0f\x46\x12\xee\x71\xd3\x6a\x75\xc6\xd6\x7a\
-\x7e\x97\xc8\x51\xaf\x4d\x68\x68\xc5\xe3\x40\xeb\xdd\x21\xac\xad\
-\x92\x9b\x43\x91\xe7\x69\xcd\x41\x6b\xbb\xc7\x71\xb5\xa6\xa8\x52\
-\x1c\x85\x25\xe4\x9e\xa4\xe6\x31\x50\x6a\x0f\x30\x6b\x96\x58\xee\
-\xec\xc1\xc0\x22\xa7\x2c\xfc\x79\xf1\x18\x3e\x38\x1d\xde\xb9\xe3\
-\xb7\x3a\xe7\xec\xe3\xee\xc5\x3d\x79\x57\x04\x1e\xcf\xa7\xba\x83\
-\xf5\xc5\xde\xc1\x75\x61\x12\xad\xb7\xab\x6c\xcb\x5c\xf8\xce\x24\
-\x2d\x0f\xc4\x9f\x1d\xc8\xd2\x1a\x52\x4e\x45\x2b\x69\xd2\x0e\x2f\
-\x3b\x93\xb6\x76\xcd\x49\x7a\xd0\x96\xbd\xd9\x6e\x13\xf6\x78\x42\
-\x5b\x50\xb5\x7e\xd1\xeb\xd9\x2d\x4d\x6a\xd3\x35\xc2\x54\x87\xa3\
-\xa6\x14\xd2\xdf\xdd\x71\x25\xb6\xe5\xb4\x54\x08\x29\x03\x1a\x73\
-\x51\x98\x4f\x45\x63\x52\xe9\xfb\x5d\xe0\xdb\xe7\x34\x51\x22\x33\
-\x57\x68\x0c\xcb\xfc\x49\x4d\x2c\x55\x2e\xb4\x97\xfa\x16\x92\x38\
-\x82\x31\x77\xd6\x3a\x67\x64\xb6\xd6\xd1\xa9\x6f\xaf\xfe\x4d\xd2\
-\xed\x13\x49\x59\x91\x2a\x44\x92\xa7\x16\xa7\xc2\xcc\x42\x1a\x71\
-\x6b\x75\x4a\x51\x48\x05\x4a\x51\x26\xa4\x9c\x22\x2c\x08\x91\xe1\
-\x46\x68\x74\xb7\x1e\x2b\x2d\xb0\xca\x07\x62\x1a\x69\x29\x42\x7d\
-\x83\xf8\xfe\x5c\xfe\x59\xfa\x09\xa9\xa7\x67\xf2\xc0\x20\xe5\x9f\
-\x2e\x3f\xc0\x54\xa2\x12\x94\x82\xa5\x29\x44\x00\x00\x15\x24\x93\
-\x90\x00\x61\xed\xae\xfd\xbb\x75\x46\x8f\x89\xbf\x52\x6f\x31\x1d\
-\xbf\xeb\x1b\xa4\xdb\x54\xa8\x1a\x3f\x4d\x43\x6d\xd9\x32\xe0\xc4\
-\x6e\x63\x73\x61\x49\xd4\xf7\x87\x03\x6d\x32\xc2\xdb\x51\x0d\x15\
-\x91\xd0\xbe\x85\x0d\xe2\xf3\x69\x7e\xd7\x88\xbe\xfe\xe7\xba\xe2\
-\xd7\xa4\xb5\xa6\x86\xdc\x67\xa6\xbb\xd5\xa2\x35\x75\x8f\x55\xd8\
-\x35\x05\xe1\x98\x77\x15\x29\x4d\x97\x6f\x5a\x76\x14\xbb\x62\xdb\
-\x4a\x13\x1c\x31\x20\xb3\xd3\xd2\x54\x4d\x3f\xfb\x71\x3e\x1c\x86\
-\x5c\x29\x8e\xd1\xff\x00\xd7\xb2\x99\xd7\x0a\xec\xad\x4f\x68\xa9\
-\xfe\x98\x20\x9e\x07\x2f\x03\xfc\xb1\x9f\x2e\x07\xb7\x8e\x33\xc8\
-\x83\x4f\x1e\x78\x07\x88\x55\x45\x39\xd3\x9e\x0e\x75\x20\x57\x3e\
-\x43\x06\xbf\xe9\x15\xe3\x81\x9f\xb0\x72\x18\x1d\xa4\xd6\x9d\xdf\
-\xa5\x70\x39\x54\x10\x79\xf7\x8c\x28\x78\x8e\xca\xd0\x8a\xfb\x69\
-\x8a\x67\x4a\xd4\x76\xf8\xe3\x33\x5f\x98\x3f\x2e\x18\x35\xaf\x67\
-\x8e\x47\x2f\x1c\x54\x1c\xc1\xf8\x63\xa7\xbf\x8f\x7e\x3b\xab\x99\
-\xcc\xe7\xcf\xdb\x82\x33\x35\x03\x3a\x78\x72\xc1\x07\x90\xa9\xc5\
-\x78\x8e\x63\xdb\x4c\x1a\x01\x43\x9f\xb7\xe7\xcb\x05\x2e\x21\x2b\
-\x49\x1d\x25\x2b\x1d\x49\x29\xec\x20\xd4\x11\x85\xda\xf7\x63\x65\
-\x76\xdf\x5d\xc5\x58\x70\x03\xa8\x74\x9d\x9e\x6c\xa6\x0b\xc9\x09\
-\x71\xc8\xb3\x57\x17\xf2\xe3\x3a\xae\x91\xf5\x21\x69\x35\x03\x3c\
-\xb1\x71\xbf\xec\x46\xa3\xde\x7f\x2d\x7a\x8a\x6f\xdc\x5a\x26\x6d\
-\x2e\xe5\x6a\x0b\x6d\xbd\x87\x94\xaf\xb8\x85\xa2\xd1\x3a\x4c\xc8\
-\xc9\x42\x1c\x00\xf4\xa3\xa0\x64\x31\x11\x1b\x13\xe7\xab\x4c\x6f\
-\x66\x9e\x80\x97\x9b\x6b\x48\xf9\x87\xd2\x4e\x2e\x4b\xcc\x84\xa8\
-\xb3\xf7\x75\x45\xbb\xfc\x85\xd1\x6e\x85\x00\x9a\x95\xa5\x20\x67\
-\x4e\x58\x7a\x0f\x9c\x9f\x20\x4f\xee\x0e\x92\x62\x4a\xfa\xb7\x3f\
-\xca\xed\xca\x46\xa9\x88\x8b\x7b\x08\x05\xc9\x6f\x69\x97\xcc\xc9\
-\xe1\x6a\xe9\xa8\x0e\x2a\x30\x35\xa5\x2b\x40\x4e\x94\xb9\xee\xc2\
-\xf6\x63\x5e\xb2\x52\xdc\xcd\x0f\xbd\xb6\x89\xbb\x7b\x79\x88\xf9\
-\x08\xea\x65\x72\x2e\xed\xa2\xd2\xb5\x25\x4e\x01\xf4\xc8\x35\xad\
-\x46\x58\x62\xe7\xa4\x35\x56\x9e\xd4\xd6\xf9\x2d\xa5\xd6\x26\x58\
-\xae\xf0\x2e\x91\xdd\x6d\x69\x0b\x42\xd0\xec\x27\xde\x41\x4a\x92\
-\x41\x19\xf0\x3e\x8a\x7b\x7e\x5e\x83\xc4\x1c\xa9\xfa\x8c\x54\xfb\
-\xfd\x1e\x5b\x7c\xc5\x58\x1a\xd1\x6e\xc7\xdb\xd7\xa6\xda\x37\x46\
-\xc7\xab\x6d\x82\x6b\x3a\x97\x4f\x37\x22\x3d\xce\xc5\x31\x86\x3e\
-\xc3\xad\x4b\xb9\xd9\xa7\x30\xb4\x34\x97\x7a\x02\x52\xf9\x57\x57\
-\xd3\xd2\x5a\x61\xb4\x25\xb6\xda\x6d\x0d\xa1\xb4\x00\x94\x21\x28\
-\x48\x48\x4a\x00\xc8\x24\x01\x90\xe4\x3f\xe9\x56\x87\xc3\xdb\x8f\
-\x51\xf3\xc6\x46\x95\xf9\x77\x63\xc0\x9a\xf8\xd7\xdb\x83\x9d\x72\
-\x1e\x03\x8e\x29\xdd\x5c\x3b\xa4\x57\x3c\x3d\xab\x75\x64\x19\x76\
-\xdb\x3d\xa6\x22\x15\x2e\x65\x65\x34\x63\xae\x42\xe3\xb0\xaf\xba\
-\x90\xda\x5d\xaa\x6b\x4a\xaa\x99\x8e\x38\xd3\x7a\x7f\x4c\x69\x86\
-\x6c\xb6\xbb\x6b\xb2\x6e\xd1\x60\xcd\x71\xeb\xa5\xda\x4d\xda\xe6\
-\xf3\xb3\xa7\xde\x2f\x77\x3b\x83\xb2\xa6\x4c\xb9\xc9\x95\x21\x6a\
-\xaa\xdc\x50\x6c\x1e\x94\xd0\x00\x31\x4a\x0e\x1d\x34\xa7\x2e\x14\
-\xa7\x66\x0d\x0e\x63\x86\x59\x0e\x39\x7b\xf0\x2a\x6b\x41\xf3\xe5\
-\x85\x73\xa5\x39\x53\x96\x2b\xdf\x98\x1c\x69\xdc\x31\x9f\xb3\x06\
-\xbd\xe4\x70\xcf\xe3\x8e\x63\x3a\x57\x96\x7c\xb0\x4f\xb0\x9e\xd0\
-\x07\x3a\xd4\x70\xc0\xa1\xcb\xb0\x70\xf1\x27\x9e\x09\x19\x53\x21\
-\x51\xc6\x94\xa9\xee\xc7\x7d\x72\xee\xa5\x2b\xf1\xc6\x6a\xae\x75\
-\xa0\xe1\x97\xc6\x98\x15\xe6\x49\xf9\x60\x70\xa8\xad\x01\xf6\x1a\
-\xe3\xa7\x9f\x1f\x65\x47\xc7\x04\x56\x82\xb9\x53\xb0\xd4\x90\x30\
-\x69\x90\x07\x2e\xfa\xe5\x8c\xeb\xd5\xf2\x1c\xb8\x73\xae\x15\xe3\
-\x5f\x68\xcc\xd7\x1d\x55\xee\x3e\xca\x77\x63\xab\x86\x5c\x3d\xbc\
-\x4e\x3b\x7a\x87\x85\x39\x8f\x7e\x3b\xd5\xca\x95\xe1\xef\xed\xc0\
-\xef\xcb\xdb\x83\xd8\x0e\x7f\x1c\x78\x71\xf4\x14\xad\x09\x5a\x54\
-\x08\x29\x52\x41\x49\x07\x88\x29\x35\x07\x01\x1b\xd5\xb1\x3b\x77\
-\xad\x66\xa0\x74\xb3\x7b\x9b\xa7\xe1\x46\xd4\x31\x87\x50\x55\x23\
-\xdf\x60\xb5\x1e\xea\xd7\xd4\x2b\x93\xbf\x3c\x48\xd4\x3e\x50\xb7\
-\xf7\x7e\xbc\xaa\xea\xa4\x07\x5e\x80\x9d\x23\xae\x2e\xf7\xad\x2a\
-\x99\x6a\x52\xdc\x47\xe5\xd8\xae\x73\x03\xce\xc7\x2b\x5d\x14\x80\
-\xf8\x05\x20\x76\x62\x40\xb6\xee\x7f\x97\x6f\x39\x1a\x46\x00\x28\
-\x83\x0b\x54\xda\x9e\xd0\x5a\xe2\x54\x66\x41\x0d\x07\x65\x45\x6a\
-\x14\x01\x25\xc6\x87\xd4\xa7\x1f\x78\xf5\x0e\x75\xa8\x62\xdb\xe7\
-\x83\xf6\xf5\xdf\x9d\xb3\x69\xa8\xca\x72\xe3\xae\xb6\xd6\x23\x5a\
-\xff\x00\x45\xa5\xc0\xa2\x3a\xd1\x29\x9f\xb0\xc3\x4c\x24\x0f\xab\
-\xff\x00\x25\x6a\x15\xe1\x88\x96\x4d\x3b\xbf\xf6\x0d\x29\xaa\x65\
-\x35\x1d\x5f\xf1\x7d\xc6\x62\x56\x88\xba\xb6\xfc\x84\x85\x7e\x18\
-\x5d\xed\xa8\xf6\xf9\x12\x1a\x2a\xe9\x50\x69\xf5\x80\x79\xe1\x13\
-\xb4\xed\xf6\xd1\x7c\x86\xea\x12\xe3\x52\xad\x37\x18\x97\x08\xee\
-\x21\x60\x14\x2d\x0e\xc5\x79\xc4\x29\x2a\x07\x23\x5c\x0c\xeb\xeb\
-\xfa\xfa\x3b\x3e\x3c\xfd\x16\xcb\x9e\xeb\x6e\x36\x8a\xdb\xab\x7d\
-\xe6\xe2\xd5\xa2\xd5\x37\x59\xea\x4b\x4e\x9d\x8b\x71\xba\x48\x24\
-\x31\x6f\x86\xf5\xd6\x5c\x54\x48\x94\xe5\x32\x42\x09\x56\x58\x89\
-\x75\xb2\xdc\xa0\xdd\xad\x93\x99\x44\x88\x57\x1b\x74\x96\x66\x41\
-\x96\xc3\x89\x0a\x43\xd1\xa5\x47\x5a\xd9\x79\xa5\xa4\xd4\x29\x24\
-\x82\x3f\x88\xf7\x1f\x47\x02\x7c\x39\x62\xaa\xca\xa3\x2e\xdf\x1c\
-\x53\x8d\x30\x05\x47\x32\x4f\x68\xcb\xf9\xe1\x44\x64\x38\xe7\xc0\
-\xfa\xd7\xe3\x8b\x46\xc1\x6d\x05\xa4\xee\xe7\x9a\x1d\x6e\x19\x89\
-\xa7\x76\xee\xc6\x1c\x9d\xfe\x00\x4f\x43\x9f\x8b\x78\xd4\xca\x88\
-\x97\x3f\x0e\x3b\x61\x25\xc4\xb6\xa2\x82\xa4\xa4\xa9\x45\x28\xaa\
-\x82\xb7\xb3\xcc\xd6\xb4\x93\xaf\xf7\xbf\x55\x97\x2e\x53\x20\xb8\
-\x86\x93\x61\xd0\xec\xce\x50\x7d\x36\x1b\x0b\x28\x06\x89\x88\x8e\
-\x96\xd6\xb2\x6a\xae\x91\xc0\x71\x00\x0a\x01\xc3\xe5\x8a\xf7\xfc\
-\x7e\x78\x35\xe0\x78\xfb\x29\xcf\x1c\x48\xa1\xcf\xc0\xf0\xa6\x01\
-\x07\x22\x79\x52\xb5\xa7\xea\x31\x53\xcc\x9f\x77\x66\x2a\x6b\x43\
-\xc0\x8a\xe5\x43\x96\x13\xdb\xcc\x8c\xab\x4e\x58\xa0\xa5\x6a\x49\
-\x3c\xb9\xfb\x71\xd3\x4c\x89\xa1\xcf\xb7\x2f\xd3\x1d\x3d\xfe\xf3\
-\x95\x3b\x30\x72\xc8\x56\xb5\x3c\x45\x39\x1c\x03\xdb\xc7\xe1\x8a\
-\xf0\x19\xe5\xfc\xb0\x49\xad\x7b\x2a\x29\xc4\x70\xf6\x60\x60\xa9\
-\x24\xf6\x1e\xe0\x3b\x30\x2a\x78\x9e\xde\xea\x8f\x96\x29\xf2\xe0\
-\x7b\xfb\xf1\x9d\x2a\x4d\x0d\x3b\xbc\x78\x61\x54\x3c\x3c\x0d\x69\
-\x5c\x1e\xfe\x1f\xcf\x06\xa6\xb4\x19\x7e\xb5\xc8\xe0\x1a\xe4\x4d\
-\x33\xa6\x42\xa2\xb4\xc0\x19\xf0\xa5\x7b\x47\x67\xb3\x1f\xcb\xbb\
-\x04\x54\x9a\x9f\x7e\x7f\x1c\x1a\x8c\xfe\x58\xf0\xcf\xd1\xde\x7e\
-\x35\xc7\x7f\x3c\x1a\xe7\x5c\xb0\xec\x3b\x9c\x18\x77\x08\xaf\x20\
-\xa1\xc8\xd3\xa3\x33\x2e\x3b\x89\x50\xcd\x2e\x34\xfa\x16\x85\xa7\
-\xc4\x62\x58\xdc\x9f\x2e\x1b\x67\x70\x9f\x35\x34\x7a\xfd\x68\xb0\
-\x45\xd3\x3a\x88\x28\x0a\x07\x11\x7c\xd3\xc9\xb6\x5c\x83\x80\x65\
-\x5f\xb9\xc3\x2c\xc6\x58\x9f\x78\xf2\x67\xe6\xef\xcc\x9f\x95\x7b\
-\x9c\x94\x8f\xb5\x68\xb3\x6a\xe7\x75\x86\x8e\x4f\xdb\x42\x83\x0c\
-\x2e\xcd\x7b\x5f\xe4\x2a\x33\x6a\x55\x40\x54\x85\x76\x52\x94\xa2\
-\x63\x69\x0f\x30\xde\x5c\xbc\xc9\xc1\x80\xdb\x2d\x34\xce\xe7\xe8\
-\xfb\x9e\x8d\xd4\x12\xdb\x65\x29\xaa\x9c\xb8\xd8\x0a\xd8\x53\xef\
-\x84\xe6\x56\x4f\xd4\x78\xf3\xc2\xa2\xf9\x80\xfd\xae\x35\x4e\xa9\
-\xd3\xb6\xd6\x5f\xff\x00\x25\xab\xf6\x03\x5c\x5b\xf5\x8f\xe5\x88\
-\xa8\x5a\x95\x26\xd7\x60\x5a\x1d\x9a\xb1\x22\x80\xa1\xb7\x16\x83\
-\x9d\x2a\x48\xa6\x2d\xd1\xbc\xc1\x6d\x17\x99\xdf\x2c\xd7\xa9\x6b\
-\x57\xe5\x42\xdd\x3d\x9c\xd4\xad\x43\xb7\xa0\x28\x84\x3c\xf5\xd2\
-\xd3\x1e\x7b\x0e\x30\xa4\x8e\xae\xa0\x9a\x84\xf1\x02\x86\x96\xf3\
-\xa1\x7c\xd3\xed\x04\xf9\x57\x35\x04\xc3\xb6\xdc\x75\x6d\xbe\xc1\
-\x76\x71\x45\x3d\x49\x6d\x56\xcb\xeb\x96\xe9\xc8\x59\xaf\x05\x20\
-\x1c\x79\x55\xde\xfd\x03\xa9\x5e\xd4\x3b\x15\x66\xd3\xda\x83\x48\
-\xdd\xe7\x69\x7d\x40\xdc\xeb\x1d\xa3\x5a\x5c\xae\xcd\x4f\x83\x2a\
-\x68\xb6\xcc\x5b\x2c\x3d\x74\x80\xd2\x50\xd3\x94\x05\x7f\x66\x95\
-\xfa\x32\x8d\xe5\x97\xce\x30\xd5\xcd\x6d\x6b\x3a\x99\x63\x68\x77\
-\x96\x7a\xe4\x5d\x62\x58\xa3\x5e\x00\x52\xf4\xdd\xe6\x33\xdd\x57\
-\x21\x60\x4c\xc6\xdc\x54\x69\x2d\x07\x42\x14\xa5\xd5\x25\x04\xa9\
-\x16\x1d\x71\xa1\xef\xb0\x35\x1e\x94\xd4\xb6\xf8\xf7\x6b\x25\xea\
-\xda\xf2\x64\x44\xb8\x5b\xe5\xa0\x39\x1e\x4b\x0e\x24\x9a\xb6\xe2\
-\x0d\x46\x33\x20\xf8\x70\x1e\x1f\xc5\x9e\x74\xe0\x7d\x73\xae\x0e\
-\x7e\x03\xb3\x02\xb9\xd0\xe7\xee\x34\xf8\xe2\xa5\x54\x14\xcc\xf6\
-\x0a\x57\x89\xcb\x10\xfc\x95\x79\x32\xb6\xb7\xbb\x5e\x69\x75\x6b\
-\x52\x6d\xf7\x69\x76\x97\x13\x37\x4d\x6d\x44\x47\x63\xa9\x2e\xdc\
-\x75\x0d\xc2\x31\x71\x96\x6e\xb1\x50\xe0\x70\x34\x4d\x18\xc9\x4e\
-\xd2\xa9\x4a\xa5\x6e\xb6\xea\xde\xa4\xee\xbf\x9a\x4d\x7c\x87\x6e\
-\x3a\xff\x00\x72\xb5\x14\x87\x2e\xf2\xe1\x4a\xb8\x2c\xc8\x93\x67\
-\xb1\x4a\x9c\x5c\x90\xcc\x46\x16\xbe\x95\x3b\x50\xa7\x8a\x6b\x44\
-\xa6\x89\x18\xe3\xc0\x7a\x8f\x45\x13\x4a\x0e\x3d\x9f\xcb\x04\xd4\
-\xd2\xb9\xe5\xee\xc8\x72\xc0\xa1\x3f\x57\x3e\xef\x81\xe7\x82\x09\
-\xc8\x53\x2e\x14\xa5\x3d\xa6\xb8\x35\xcc\x7b\x45\x3b\x32\xec\x23\
-\x06\xb9\x04\x91\x4a\x77\xfb\xf0\x0e\x5c\x29\x98\x15\xa8\x3c\x7c\
-\x70\x38\xe5\xdd\xd9\xdb\x8c\x88\xcf\x8f\xb3\xb3\x2e\xec\x50\xf0\
-\xe0\x2b\x4e\x1d\xfe\x38\x01\x47\xdb\xed\xe7\x8c\x8d\x06\x74\x1c\
-\xbc\x7b\x31\x42\x72\xa5\x72\x1c\x69\x9f\x7e\x38\x03\x4a\x1a\xd3\
-\xda\x3b\x38\xe3\x3a\xfe\x83\x15\xaf\x02\x72\xf7\x7c\xb1\x9d\x2b\
-\xc7\xc3\x20\x3e\x43\x15\xe3\x51\x4c\xb3\xcf\xb7\xb3\x14\xae\x7c\
-\x0f\x1a\x67\xfc\xb1\x4e\x74\xcb\xdb\x82\x2b\x9f\x6e\x74\x3d\xbc\
-\xb2\xc0\xcf\x8f\x2f\x99\xf8\x60\xe7\x53\x43\x9d\x29\xe3\xf0\xc5\
-\x07\x87\x3a\xd3\x1d\xb5\xcf\x2e\x75\xfe\xb8\xea\xae\x75\xf6\x78\
-\x7b\xb1\xd4\x0f\x3a\x7c\x3d\x03\x90\x00\x0f\xed\xc7\x15\xf4\x57\
-\x95\x69\xfa\xfa\x4f\xad\x71\xc3\x95\x28\x73\x1c\x7b\x0f\x8e\x15\
-\x0f\x50\x58\x2c\xb7\xb8\xab\x1d\x2b\x8d\x76\xb5\xc1\xb8\x30\xb1\
-\x4a\x51\x4d\x4b\x61\xd4\x11\xec\xc4\xa4\xeb\xef\x2c\x5b\x47\x70\
-\x95\x25\x68\x79\x77\x5b\x76\x93\xb7\xd8\x2f\x21\xe6\xc5\x10\xeb\
-\x77\x6b\x23\x50\x27\x36\xe2\x47\x30\xbc\x5d\x74\xbb\x7a\x4f\x73\
-\xb4\x05\xb6\xee\xe3\x2f\xc8\x89\xa4\x37\x3f\x54\x39\x6a\x12\xe3\
-\x7d\xc5\xc7\x90\x9b\x1e\xa3\x99\x7d\xb4\x24\xb4\xe2\xca\x87\x4b\
-\x40\x8a\x50\x50\x65\x85\x43\xf2\xd5\xe7\x17\x5f\x26\x54\x34\x33\
-\x6e\xb6\xe9\x5d\xd1\xb6\x43\x95\x63\x89\x6d\x12\x92\xe2\x57\x1e\
-\xe3\x65\x4b\x6f\x32\xfc\x26\xd4\xa2\x91\xf8\xe4\x2b\xb5\x38\xdb\
-\x5d\xaa\x9f\xbd\x1a\x57\xcd\x56\xcf\xea\xdb\x03\xba\xa9\x3a\x26\
-\x4d\xc2\xe2\x88\xad\xe9\xcb\x64\xa7\xa1\x4b\x82\x88\xf7\xaf\xb7\
-\x2e\xcf\x29\xbe\x83\xd2\xe4\x52\x41\x3d\x24\xf5\x00\xa4\xe3\x48\
-\xea\x2f\x31\x1a\x4f\x5c\xf9\x65\xbf\xea\x86\x58\x54\x56\x75\x4d\
-\x86\xf3\x7b\xd2\x13\x0a\xc2\x02\xe5\x5a\xf5\x65\xb2\xd8\x62\xbf\
-\x01\x2b\x70\x55\x6e\xa1\xae\x8a\xd0\xe5\x99\x6a\xfb\xb6\x1b\x8f\
-\xa4\x35\xc5\xa9\xcf\xa7\xf2\x74\xf5\xf2\xdf\x71\xfb\x4e\x74\x85\
-\x16\x9e\x6e\x33\xee\x3a\xcb\xc9\x0a\x1d\x48\x50\x0a\x4f\x31\x80\
-\x42\x81\x07\x81\x1c\xe9\x8e\x38\xcb\xb7\x3f\x1f\x47\x1a\x65\xcc\
-\x65\xfa\x53\x14\xf6\x9f\xe4\x31\x7a\xdd\xdd\xfd\xdc\x5d\x39\xb6\
-\x1b\x75\x60\x54\x66\xee\x9a\xa3\x53\xcc\x10\xed\xec\x3d\x31\xe4\
-\xb1\x12\x3b\x60\x05\xbf\x26\x4c\x87\x54\x12\x86\xdb\x42\xd6\xa3\
-\xc0\x63\x49\x79\x10\xfd\xa7\x37\x13\x4f\x6b\xcd\xc8\xdc\x58\xd2\
-\x24\x6b\xbd\xee\x4d\xc0\x59\xac\x7a\x27\x49\x32\x8a\xdd\x46\x94\
-\x76\xf3\x1d\x97\x2e\x77\x96\x62\x75\xa9\xd7\x1b\x6d\x4a\x64\x00\
-\x96\xd2\xa7\x15\xd4\xdd\xda\xeb\x68\x91\x37\x5e\x6f\x3e\xb9\x71\
-\xdb\x96\xe1\x6e\xbe\xa5\x50\x9b\xa8\x2e\xd2\xe7\x3e\x67\x4b\xb7\
-\xc2\x90\xef\x5b\xb1\x6d\x28\x9c\xea\xd6\x94\xf5\x17\x1c\x27\xa9\
-\x6a\x51\xc0\xa7\x0f\x49\xf5\xe6\x31\x97\x02\x46\x5c\xeb\xea\x31\
-\xd3\xf4\xf7\xd7\x86\x79\xd3\x07\x3a\x93\x97\x2a\x0e\xd0\x31\x5e\
-\xd1\xe3\x9d\x7b\x39\xe2\xa4\xd4\xf3\x1c\x86\x5c\xfb\x31\x5a\xf1\
-\xa1\x22\x99\xf0\xce\x9e\x38\x27\x2a\x0a\xd0\x11\x5c\x1c\xe8\xae\
-\x35\xa0\xe0\x73\xc7\x6d\x6b\x51\xcf\x81\xe1\x8a\x53\x23\x98\x3d\
-\x9d\x9c\xb8\x8c\x50\x90\x73\xa8\x35\xca\xa3\x3e\x38\x3c\xc7\x23\
-\x97\xad\x71\x53\xc0\x0e\x5f\x3c\xb0\x0d\x47\x86\x75\xa6\x47\x3c\
-\x11\xc2\xb4\x3d\x82\x99\xe3\x3f\xf5\x76\x73\x3c\xb1\xc7\xc7\xb4\
-\x7c\x31\x40\x78\x71\x27\x32\x72\xe2\x31\x4e\x9a\xf6\x13\x80\x0f\
-\x02\x38\xff\x00\xfc\xbb\x71\xd5\xc7\x3f\x5e\x23\x8d\x71\xf0\xf0\
-\xf0\xc6\x5c\x29\xdb\x41\x9f\x6f\x0c\xf0\x00\x1f\x0c\xce\x07\x8f\
-\x1f\x77\xcb\x14\x07\x2a\xe7\xce\x9c\x8f\xcf\xd0\x7b\xfd\x1d\xe2\
-\x94\xf0\xc6\x7c\x7d\x3d\xff\x00\x3e\xea\x50\xff\x00\x16\x74\xaf\
-\x1f\x1c\xb3\xe4\x38\xe3\x49\xe9\x39\x93\xac\x97\xcd\xa7\xd9\xdd\
-\xb5\xd2\x3a\x73\x70\x34\xaf\xe5\x4f\x6a\x4c\x8d\x3d\xfe\xf6\xa6\
-\xbd\x44\xb9\xc4\x71\x28\x1f\x6e\x64\x8b\xc0\x68\x39\x19\x41\x3d\
-\x2b\x4d\x55\xd4\x08\xc5\x8f\x6e\x17\xb6\x3a\x2a\x56\x8a\xd3\xb6\
-\x98\x76\x2b\x36\x9d\x9b\xa7\xad\x93\x2d\xb0\x2d\x50\x19\x43\x11\
-\x61\xc7\x8f\x22\x33\x89\x43\x4c\x36\xd8\x09\xe7\x90\xe7\x8b\xf6\
-\xa5\xda\xf8\x1a\xbf\xcb\xe6\xb4\xbe\xd5\xd9\x3a\xa3\x66\x75\x55\
-\xdf\x48\x48\x4c\xb4\x95\xad\xb9\x49\xb6\xc4\x93\xfe\x2d\x4e\x87\
-\x17\xd4\xaf\xf6\x7e\xba\x67\xdf\x21\x5b\x09\xe6\x33\x42\x79\xa8\
-\xdb\x8b\x53\x08\x5d\xab\x4a\x6f\x44\x06\xed\x9b\x82\xec\x76\x13\
-\x4f\xf1\xff\x00\xe7\xda\x6d\x2c\x4d\x96\x53\x4a\x3a\xfc\x90\x16\
-\x79\x0e\x18\x55\xa7\xcf\xef\x94\x7d\xde\xd8\x09\x90\xa5\xa6\x0d\
-\xcf\x5d\xe9\x8d\x2f\x7a\xd7\x5b\x71\x15\x25\x0d\x84\x4f\x9b\x7b\
-\xb4\xc2\x7d\xa8\xac\x48\x75\x46\x81\xb5\xbe\x10\x38\x9a\x62\x2e\
-\xaa\xd9\x7d\xd2\xd2\x3a\xf2\xd3\x2a\xa0\x7f\x88\xba\xc7\x54\xe8\
-\xcf\x04\xa5\x6e\x46\x9b\x6d\x75\x4d\xce\x87\x29\x94\xac\x75\x36\
-\xe3\x69\x52\x6b\x98\xe1\x8e\xea\x71\xef\xc1\x27\xb4\x65\x5e\xef\
-\xe9\x89\xda\xa7\x72\x35\x8d\x83\x48\xd9\x6d\xd1\x9d\x93\x22\x5d\
-\xea\xe7\x16\x00\x2d\xb4\x92\xa2\x19\x43\xee\xa1\x6f\x2c\x8a\x80\
-\x94\x82\x49\xc6\x98\xd3\x1e\x43\x36\x9b\x70\xb5\xff\x00\x97\xdf\
-\x2f\xce\x6a\x4b\xa6\xa2\x76\x19\x97\x6b\xb7\x6b\x6d\x4e\x96\x92\
-\xb4\x4c\x6e\x1c\xb3\x1a\xdb\x74\x99\x0a\x14\x6a\xc0\x60\x29\xd7\
-\xcf\xde\xa8\xe8\x2b\xa1\xd3\x9a\xa7\xfc\x26\xbb\xd9\x6d\xe1\xdb\
-\x5d\x4b\x16\xed\x6c\x63\x50\xd9\x6f\x1a\x66\xed\x12\xe9\x66\x96\
-\xdb\xc2\x3b\xf0\xe6\xb5\x05\xe9\x70\xdd\x75\xae\x87\x52\x92\x50\
-\xe2\x0e\x46\xb4\x38\xb4\xe9\xfd\xf1\xf2\x5b\xaf\x75\xdd\xf1\xc9\
-\x31\x2d\xd6\xdd\x5b\xb5\xf6\x2d\x46\x88\xd7\xb6\x18\x6d\x8f\xcb\
-\x92\xe5\xba\x45\xb2\x6b\x0a\x9c\xa6\x96\x5d\xe8\x6d\x6d\x22\x86\
-\x80\x14\x82\xac\x47\x81\xb8\x3a\x9e\xff\x00\xb1\x5a\xb9\x4b\x0c\
-\xcb\xd2\x5b\xc9\xa5\x6f\xba\x22\xe3\x0d\xe3\xd4\x9a\x2e\x5d\xce\
-\x0b\x76\xb5\xa1\x4b\x49\x09\x52\x5e\x21\x47\xbf\x2c\x5b\xe4\x68\
-\xbd\xd0\xd1\x9a\x92\x3d\xd1\x6b\x44\x07\xed\x37\xeb\x74\xb6\xe4\
-\x29\x0b\x2d\xa9\x09\x53\x52\x15\xf5\x85\x8a\x53\x8d\x79\x60\x51\
-\xc4\x12\xae\x00\x28\x1a\xf3\xca\x87\x31\xdf\xc3\xd0\x4d\x38\x90\
-\x7c\x3e\x3d\xa7\x1c\x0d\x69\x9d\x78\xf7\x9c\xfc\x70\x9c\xbb\xcf\
-\x3e\x7d\xbe\xcc\x1e\xd3\xc0\x13\xee\xef\xc1\xa0\x34\xa5\x0e\x7d\
-\xbe\xfc\x67\x52\x07\x0f\x0c\x1a\xd6\x9c\x41\xfd\x3b\xb0\x9e\x40\
-\x93\x53\xc3\xb6\x9e\xcc\x03\x9f\x2a\x8f\x0e\xcc\x13\x4a\x11\x5e\
-\x1c\x0e\x38\x93\xd8\x7f\xbe\x02\x48\x39\x8f\x9d\x70\x00\x27\x3e\
-\x3d\xf4\xaf\xb4\x60\x93\x51\xd9\xf3\xa7\x3e\xcc\x02\x38\x50\x01\
-\xdb\xed\xc7\x49\xad\x41\x14\xcb\x80\xe1\xf0\xc1\x1f\xd7\x97\x7f\
-\x6e\x09\xce\xb9\x67\xeb\xe1\x84\x9a\x1c\xce\x79\xf6\xd3\x87\xb0\
-\x63\xda\x3d\xb9\x60\xf1\xe2\x3c\x3c\x4e\x39\xf0\xae\x7d\xb4\xae\
-\x00\x3c\xb3\x3d\xe2\xbc\x3d\xf8\xcf\x2e\xca\x64\x01\xe0\x3d\x98\
-\xa0\xe5\x52\x6b\xce\xb4\xfd\x30\xbe\xf5\x54\x7a\x6a\x2b\x95\x2b\
-\xe3\xe8\xce\xb5\xe5\x8f\x51\x53\xd9\x5f\xfa\x0f\xca\x79\x5f\x6d\
-\xa8\xcc\xba\xfb\xae\x2b\x24\xa5\xa6\x50\xa7\x16\xa2\x7f\xfa\x84\
-\xa6\xb8\xf3\x69\xe6\x52\x46\x8c\xb0\xc5\xb0\xc6\xd5\x72\xb6\xf7\
-\x6f\xf5\xb4\x14\xfd\xcb\x9d\xde\xc5\x67\xb8\x3f\x05\x51\xa5\xc9\
-\x09\x09\x58\x31\xad\x6c\x3f\x44\x9c\x83\xa1\x27\xfd\x23\x19\x9c\
-\x86\x67\xfb\x60\x11\x95\x68\x7f\xa7\x76\x0e\x5c\x7d\x72\xc3\xf6\
-\xeb\xbd\xbe\x15\xd2\x04\xa6\xd6\xc4\xa8\x53\xe2\xb3\x2e\x2b\xec\
-\x38\x92\x95\xb6\xf3\x0f\xa1\x6d\xb8\x85\xa4\xd0\x82\x08\xcf\x09\
-\xde\x3f\x23\xfa\xfe\xf9\xe5\x83\x7c\x2d\x33\xdf\xbc\xb3\x03\x49\
-\x5d\xe7\xd9\x34\x2e\xa3\x92\xa4\xfd\xc4\xb0\xf5\xb2\xdc\xb6\xda\
-\xb3\x3c\xa7\x92\x08\x5b\x48\x2c\xa8\x29\x49\x71\xb5\x05\x02\x9b\
-\x9f\x92\x1f\x3f\x16\x0b\x7e\x92\xf3\x0b\xa4\x5d\x72\xd9\xa7\x75\
-\x9c\x19\x11\x9b\xb5\xeb\xa8\x96\xe8\x88\x7d\x0f\xdd\x19\x4b\xa1\
-\x11\xae\xb3\xe0\x74\xc8\x6d\xf6\x92\x98\xf2\x52\xac\x92\xda\xe8\
-\x95\x4e\xb7\xed\x4d\x99\x5b\xd1\xbb\x92\x5f\x55\xb2\xd9\xa5\xf4\
-\xcb\xc8\x9f\x1e\xd3\x31\x4b\x4b\x06\x7d\xec\xc4\x53\xb2\x0c\x58\
-\xcf\xb8\x94\x94\x34\x95\x2d\x4a\x50\x1f\x48\x35\x10\x3c\xc4\x7e\
-\xe1\xbb\x81\x76\xd7\x77\x8b\x84\xe8\x3a\x9b\x4c\x6c\xb5\xb6\x5b\
-\x90\xf4\x6e\x98\x84\xea\x1a\x98\xc5\xa2\xed\x1d\xa3\xd1\x32\x33\
-\x4a\xe9\x4a\xa3\x26\x8d\xa8\x27\xfd\xc2\xb5\x12\x71\x16\xc1\xa4\
-\x34\xf5\x9f\x4d\x59\x20\xb2\xd4\x78\xb6\xbb\x1d\xba\x2d\xb2\x0b\
-\x0d\x32\x84\xb6\xd3\x6d\xc5\x86\xd3\x4d\x25\x28\x6d\x20\x0a\x0c\
-\x86\x2d\xb3\x37\xc7\x60\xb6\xa3\x75\x26\x59\x5e\x0f\xda\xe6\xeb\
-\x7d\x11\x60\xbf\xcd\x86\xe2\x73\x01\x99\x73\xe0\xbb\x21\x28\x07\
-\x3e\x8e\xae\x9a\xe7\x4a\xe2\x25\x8f\x42\x68\x5d\x29\xa3\xec\xd0\
-\x5a\x6d\x98\x96\xbd\x39\x60\xb5\xd9\xe0\x45\x69\xa4\x84\x36\xdb\
-\x11\x60\x46\x65\x96\x90\x80\x05\x02\x40\xa6\x1c\xb2\xee\x96\xd9\
-\x68\xbd\x71\x6f\x74\x00\x5a\xd4\x36\x0b\x75\xc1\x69\xa1\xea\x05\
-\xb7\xdf\x61\x4f\x36\xa4\xab\x30\x52\xa0\x41\xcc\x62\x4d\xc7\x6b\
-\xaf\x5b\xab\xb0\xf7\xc5\x3e\xec\xe8\x32\x76\xf3\x5b\xdc\xda\xb6\
-\x41\xb8\x2b\xa9\x4c\xc8\x6a\xd7\x70\x72\x52\x1b\x4b\x0b\x50\x28\
-\x43\x4b\x6c\x26\x94\x14\xc3\xc8\xd9\x5f\x33\xfa\x53\xcc\x9e\x8f\
-\x85\x31\xc7\x61\xe9\xad\xd9\x6e\x5c\x5d\x44\x60\x37\x18\x37\x1a\
-\x23\x37\x49\xee\xdc\x15\xd6\x85\x81\xf4\xfe\x52\x52\x69\xda\xac\
-\xa3\xec\xc5\xff\x00\xc8\xad\xde\x3e\xf9\x5f\x9c\x55\xbf\x42\xea\
-\x78\x4d\x4d\x56\xd9\x4e\xb9\xc4\x65\xeb\x9d\xe1\xeb\xc4\xd0\xfa\
-\xed\xcd\xc2\x67\x4c\x40\x9a\xeb\x44\xce\x40\x32\xd0\xda\x73\x06\
-\x87\x2c\xa8\x72\xf7\x62\x83\x9d\x2a\x39\xd7\x01\x47\x32\x38\x8c\
-\x87\x1a\xf3\xe1\x85\x1c\xb2\xcf\xdf\x9f\x11\xd9\x8a\xf7\xf1\xef\
-\x14\xcb\xc7\x19\x53\x85\x4f\xc4\x1f\x75\x71\xca\xbc\xab\xc0\xfe\
-\xa7\x00\x50\x65\x5e\x26\xb5\xf8\x63\xe9\xe3\xcf\x3f\xe7\x85\x13\
-\xc2\xa4\x52\x9c\x78\x0f\x6e\x05\x33\xaf\x0c\xb2\x03\x97\x77\x0c\
-\x54\x9c\xc6\x79\xf3\xee\x18\xcb\xe6\x41\xee\x1d\xa3\x19\x81\x40\
-\x40\xa1\xef\xaf\x3e\x78\xcb\x88\xc8\x50\x62\xa3\xb6\xa4\xd7\x3e\
-\x27\x15\xee\xf9\x63\x2e\xdc\xf3\xe5\x9f\x0f\x10\x71\x4a\x90\x91\
-\xc2\x9d\xa3\xf5\xc1\x35\xf6\x56\xb9\x9e\xca\xd3\x81\xc2\xb3\xf6\
-\x73\xa9\xe3\x80\xaf\x9d\x32\xfe\xf8\x03\x22\x7b\x78\x53\x3e\xc1\
-\x96\x28\x0e\x5f\xd3\xbb\x07\x2a\x64\x07\xb8\x8f\xd0\x63\xbf\x2a\
-\x7a\xf6\xfa\x0e\x7d\xbe\x19\x63\x2a\x65\x9d\x0f\x67\xca\x98\xf5\
-\xf5\xaf\xa3\x2c\x1e\x19\x57\xb3\x89\xcb\x2f\xe3\xdc\xdd\x67\x24\
-\xa0\x2a\x0e\x98\xb8\x44\x84\xda\x94\x52\x5f\xb8\x5c\xd9\x30\x21\
-\xb2\xdf\x4f\xd4\xa5\xad\xe7\xc5\x00\xcc\x9e\x19\xe3\x44\xdb\x2c\
-\x76\xd3\x6d\x4e\xac\x54\xed\x71\x29\x0e\xb4\x51\x2d\xd7\xf5\x23\
-\xea\x9c\x97\x26\xd6\x8a\x5c\x8f\xb2\xb4\x82\x55\x42\x29\x43\x81\
-\xd9\xc7\xc7\xbb\xc3\xd0\x79\x62\x95\xaf\x7e\x0f\x0c\x86\x7e\x14\
-\xe7\x8f\x24\x9b\x51\xb0\xaf\xa7\x40\xea\x0d\x7d\xb6\x11\xd9\x9f\
-\xae\xed\x37\x15\xc0\x97\x3d\x2d\xea\x7b\xc3\x6d\x8b\xcb\xd1\x14\
-\x64\x30\xd5\xb9\x2d\x94\x36\xa2\x3a\x96\x1c\xc8\x90\x29\x8b\x45\
-\xc2\xeb\x68\x87\xaa\x77\x9e\xfb\x67\xb6\xc8\xdc\x4d\x73\x75\x90\
-\xfd\xf5\xd9\xf7\xf0\xc3\x66\x7a\xac\xae\xdd\x42\xdd\xb7\xdb\xdc\
-\x7c\x02\x12\x84\xa0\xac\xa4\x29\x55\x56\x13\xd0\x12\x90\x12\x00\
-\x14\xa0\x03\x2a\x00\x06\x42\x83\x19\x01\x4e\x7d\xbe\x8a\xe4\x0d\
-\x7d\xf4\xf7\xe7\x51\x8e\x5c\x2b\x96\x46\xbd\xfe\xd3\xe8\xa1\x1e\
-\xfc\x21\xc5\x21\x05\x6d\xd4\xa1\x64\x24\xa9\x25\x49\x29\x3d\x2a\
-\xcc\x82\x52\x48\xf6\xe2\x87\xe5\x4c\x1a\xd0\x28\x1c\x8e\x5e\xcc\
-\x67\x9f\x4d\x47\x6d\x49\xe1\xec\xc6\x7c\xcf\x1c\xeb\x9f\x1f\x96\
-\x00\x1c\x33\x24\xf7\xfe\x98\xad\x73\x34\xf0\xed\xec\xc5\x49\xcf\
-\xb3\xc7\x07\xb6\xa7\xb6\x80\xf8\xf3\xc0\x3d\x5d\xe4\x71\xae\x74\
-\xaf\x6e\x3a\xab\x96\x7d\x99\x77\x11\x81\x43\xc4\x64\x0e\x7d\xf9\
-\x60\x54\xd4\x73\x39\x0f\x51\x83\x5e\xda\xe5\xc4\xf3\xe5\x4c\x75\
-\x13\x4e\x79\x76\x50\x7c\xb1\x51\xed\xc8\x65\x9e\x55\xa6\x59\xe0\
-\xa7\x9d\x6b\x4e\x7c\xb1\x5a\xfb\x3e\x55\xf1\xc0\x4f\x3c\xc9\xa7\
-\x87\xc7\x14\xaf\xbc\xfb\xe9\x8a\x0e\x22\x9e\xfe\xec\x0a\xe4\x79\
-\xf7\xf7\x73\xe1\x8c\xf8\x1a\x7b\x69\xfd\x70\x7b\xe9\x5f\x8d\x30\
-\x3c\x6b\x8a\x24\xe5\xdf\xe3\xe1\x8a\x8e\x15\xa7\x68\xca\x99\xfb\
-\x71\xda\x2b\xc7\x3f\x46\x59\xe7\xef\xf4\x9c\xfb\x72\xe7\xc3\x09\
-\xee\xe2\x3d\x7b\x7d\x20\x76\x9c\x53\x1d\x98\xf5\xfe\x98\xf2\xb1\
-\xe5\x53\x6c\xc5\xd9\xf9\x3b\xad\xb9\xb1\x2f\x3a\xfd\x5a\x7c\xff\
-\x00\xe6\x5a\xf4\x8d\x99\xd6\x19\x66\x5d\xc1\x64\x14\x46\xb7\x19\
-\x52\xd6\xf1\x2b\xa0\x59\x8d\x41\xd8\x6c\x5a\x7a\x25\x7f\x1a\xc9\
-\x6a\x81\x6c\x60\x9c\x89\x6e\x14\x66\xd8\x4a\x95\x4c\xaa\xa0\x8a\
-\x9f\xe0\x00\x73\x3e\xde\x3f\xd7\x0f\x48\x5e\x49\x69\x97\x1c\x56\
-\x74\xaa\x5b\x42\x96\xaa\x57\x2e\x09\xc7\x9a\xdf\xdc\x3f\x76\xac\
-\x33\xe3\x69\x7d\x8e\xd5\x97\x1d\x86\xf2\xfb\x63\x75\xe6\xe4\x5a\
-\xad\xf6\xed\x29\x2e\x5d\xb9\xfb\xb3\x8a\x47\x5b\x6e\x5c\x16\x52\
-\xe3\xab\x0d\xa8\xa1\x2f\x48\x56\x6a\xa0\xa0\x48\xa0\xe9\x02\x82\
-\x99\x50\x0a\x53\xc3\x15\xee\xa7\xa9\xc7\x77\x3c\x56\xb4\xed\xfd\
-\x30\x08\xe4\x38\x1e\x15\xe6\x4e\x02\x89\xec\x3d\xf9\x53\x96\x09\
-\xcc\xd4\x1c\xf9\x78\x70\xe3\x4c\x15\x57\xd7\x85\x31\x4f\xef\x4e\
-\x3d\x9c\x69\x81\x5e\x20\x13\x9d\x78\xe4\x79\x62\x95\xa0\x35\xf8\
-\xd7\x87\xb7\x19\x57\xa7\x9d\x7e\x67\xb3\x1d\xd9\x53\xf9\x8c\x25\
-\x3c\x6b\x52\x69\xe3\x96\x7c\xb1\xd2\x79\xf0\xa5\x39\x72\xc7\x13\
-\x96\x55\xe1\xcc\xf6\x62\x82\xb9\x9e\x5c\xbf\x90\xc1\xec\xad\x09\
-\xe6\x3d\xb9\xd2\xa7\x07\xb3\xdf\x5e\x59\x7b\xb1\x4a\x9f\x6f\xaf\
-\x76\x2b\xde\x00\xcb\x8f\xb3\x0a\x49\x35\xe3\x9f\xc3\x9e\x3a\x47\
-\xc7\x2c\x1a\xf3\x1f\x2e\x18\x04\x82\x6a\x72\xf6\x1c\x28\x76\x53\
-\xb3\x86\x5c\x79\xe0\x28\x57\x97\x66\x7c\x8f\x3e\x34\xc1\x35\x34\
-\x19\xd0\x03\x51\xfc\xa9\x80\x79\xe4\x39\x71\xfe\xb8\xad\x4d\x41\
-\x23\x3e\xce\x3c\xf1\xdf\xcb\xbb\xb7\xdf\x82\x4e\x7f\xcf\x2a\x1e\
-\x5c\x8e\x3b\xa8\x6b\xe1\x8a\xf2\x07\x91\xf5\x38\xee\xcb\xc6\xbf\
-\xc8\x0f\x47\x3e\xcf\xe9\x83\xd8\x41\x1d\xf9\xfb\x0e\x7e\x83\xd8\
-\x69\x5f\xd3\x1c\x73\xec\xf4\x54\x73\x3c\x3b\xbd\xfe\x82\x7b\xc5\
-\x3e\x35\xf4\xa9\x4a\xc8\x00\x49\x3d\x83\x99\xc6\xf5\x6f\x35\xb7\
-\x59\x2e\xf7\x62\xda\x0b\x33\x1b\x67\x1f\x4d\xc7\x4c\x8f\xf1\xf6\
-\xbb\x85\xb5\xd7\x58\x0f\x3d\xf7\x40\x69\x73\x1c\x98\xa9\x6a\xfa\
-\x40\x1d\x22\xa7\x96\x33\xe3\xf2\xee\xfe\x00\x4f\xb3\xc7\x1b\xe1\
-\xba\x69\x94\xdb\x3a\x89\xbd\x1f\x3f\x4d\xe8\x68\xaa\x70\xb6\xf5\
-\xcb\x5b\x6a\xa6\x95\x64\xd3\x90\xe3\x74\x85\x2c\xbb\xf9\xf3\x12\
-\xe1\xa0\x24\x25\xb2\x79\x63\x6a\xb4\x46\xa4\x6d\x63\x5a\x6a\x48\
-\xd2\xb7\x0f\x58\xb8\xeb\x68\x0f\x7f\x9c\xd6\xaf\x1b\xe3\xf1\xdd\
-\x75\x20\x29\xe7\x22\x26\x52\x5b\x52\x95\x55\x15\x24\x9c\x57\x9f\
-\xc3\x1e\xdf\x67\xbf\x06\xb5\xcc\x7c\xb0\x00\x20\xd4\xd7\xbc\x70\
-\xec\xaf\x0c\x0a\x0c\xb3\xa9\xc5\x4f\x11\xfa\xd7\x2c\x65\x51\x95\
-\x7b\xa9\x43\x8a\x1c\xc0\xe5\xdf\xe3\x8e\x06\xbd\x9c\xe9\xc3\x8f\
-\x1e\x18\x66\x66\xd3\xef\x16\x87\xd6\x41\xe4\x36\xe8\x8d\x6c\xbe\
-\x43\x33\xd0\x87\x47\xfb\x7f\x76\x03\xce\x37\x2d\xa2\xae\x41\x48\
-\x18\x05\x0b\x4a\xf9\xd5\x25\x2a\x1e\x20\x82\x7b\x30\x7b\x4e\x5e\
-\xcf\x47\x32\x4f\xca\xbc\xb0\x0f\x61\x1c\x39\x1e\xcc\x0c\xce\x74\
-\x3d\xf5\xf8\x0c\x1a\x71\xec\xe3\x4c\xff\x00\x96\x32\xc8\xf1\x3f\
-\xde\x98\x3d\xe7\xbb\x2f\x5a\x60\x73\xe7\xfd\x31\xd5\x5f\x11\xc6\
-\x9f\xde\x98\x57\xff\x00\x89\xc0\xe3\x50\x3e\xac\xb9\xf2\xe3\xcf\
-\x1c\x72\xc8\x12\x0d\x3b\x87\xb3\x2c\x50\x1c\xb3\x3f\xdf\xd9\x8c\
-\xb3\x0a\x15\x35\xc7\x1a\xf7\x72\xc7\x3a\x9a\xd4\x1c\xbe\x24\x71\
-\xc5\x3d\x6b\xfa\x60\x11\xc3\x9e\x7e\x1f\x2c\x73\xad\x7d\x9f\xdf\
-\x14\xef\xf5\xf6\xe0\xa8\x71\xad\x3c\x38\x1c\x70\xaf\xae\x5f\x1c\
-\x1a\xf1\xaf\xa6\x83\x04\x76\x1c\x67\xeb\xd9\xe8\xf9\x7a\x33\xc7\
-\x0a\x76\xf6\x7b\xbd\x3b\x83\xb8\x77\xa9\x09\x8d\x6f\xd2\x9a\x56\
-\xf1\x75\x75\x6a\x52\x52\x54\xeb\x10\xdd\xfc\x66\x5b\x2b\x29\x49\
-\x75\xf9\x0a\x4a\x12\x2b\x52\x48\x18\xbe\xeb\x5d\x68\xfd\xb2\x7e\
-\xae\xdd\xdd\x63\x74\xd6\xd7\x09\xf6\xc6\x9a\x43\x2b\x81\x31\x65\
-\x56\xe8\xe5\xe4\xb6\x87\x64\xad\x84\xb8\xa0\x56\xb2\x49\x27\x8f\
-\xf0\xe5\xee\xef\xe5\xdf\x8f\x25\xbf\xb7\x96\x97\x9f\xf9\x9a\x1f\
-\x40\xdb\xa5\xf9\x80\xde\xfb\x42\x21\x37\x70\xb7\xcc\x90\xda\x9d\
-\x6f\x4d\x40\xbe\x15\x75\x25\x96\xe0\xdb\xa1\xba\xea\x52\xa1\x42\
-\xb9\xa8\x3c\x42\x71\x0a\x04\x66\xd2\xcc\x68\x51\x58\x89\x1d\xa4\
-\x00\x94\x34\xcc\x76\x92\xd3\x68\x4a\x46\x40\x21\x29\xa0\x1c\xbd\
-\x00\xe7\x9d\x3f\xad\x7b\x70\x7c\x08\x00\x78\x65\xc2\xb8\xae\x75\
-\x07\x3f\x6d\x78\x62\xbc\x82\xaa\x07\x0c\xf9\x63\x31\x4a\x10\x7d\
-\xb9\xf1\xc5\x3f\x9f\x02\x3b\x3d\xbe\x97\xae\x9a\x06\xd9\xad\x76\
-\x23\x51\x1b\x7b\x56\xf8\x77\xad\xa3\xd5\x77\x1d\x3c\xa8\x09\x62\
-\x41\x92\xcb\xf1\xe0\x2d\xc9\x30\x7f\x25\x0b\x34\xeb\x28\xea\x29\
-\xa0\x27\x21\x49\x97\x4f\x2e\xbf\xb8\xde\xaf\xbf\xc2\x40\x0d\x5a\
-\x34\xfe\xf3\xc1\x99\x7e\x8a\xcc\x34\x13\xf6\xe3\xcc\x57\xe4\x5c\
-\x20\xbf\x21\x29\x3f\xfe\xe4\xc6\x41\x51\x19\x8c\xf0\xd3\x7b\x97\
-\xe5\xc3\x68\xfc\xd3\xd8\xe2\x12\xb9\x1a\x83\x6a\x6f\x22\xcb\x77\
-\x76\x20\x5a\xd2\x92\xbb\x74\x87\x23\xbe\x66\x84\x24\x29\x61\x31\
-\x0a\x3e\xac\xbb\x04\x5d\x31\xe6\x7b\x60\xb7\xb7\x60\x35\x22\x9d\
-\xfb\x33\x1d\xbc\x68\xdb\xb5\xca\xc3\x14\x25\x49\x69\xc9\x4e\x4f\
-\x66\x23\x4e\x22\x11\x90\xae\x84\x2c\xb7\xf5\xd4\x53\x8e\x20\x27\
-\x6f\x77\xfb\x6f\x2e\xb3\x2e\x25\x2d\xc6\xb5\x4b\xbe\xc4\xb4\xdd\
-\x94\xf2\x91\xd6\x63\x2a\xdb\x74\x5c\x59\x68\x90\x8c\xfa\x90\x53\
-\xd4\x08\x3d\x87\x09\x7a\xdd\x71\x85\x39\x95\xe6\x87\x62\x4a\x62\
-\x42\x15\xde\x95\xb4\xb5\x83\xec\xc5\x78\xf3\xee\xcf\xb3\x04\x82\
-\x28\x4d\x7e\x74\xc5\x45\x0f\x22\x0f\xbe\xb8\xa8\x3f\x49\x3c\x2b\
-\xc7\xb7\xd9\x8e\xe1\xf0\xfe\xf8\xcb\x2c\xb9\x77\x0e\x78\xaf\x1c\
-\xc5\x08\x3e\xd3\xe3\x81\x4a\x55\x44\x93\xcf\x2f\x1e\xec\x71\xc8\
-\x93\x97\x00\x07\x69\xe1\x83\x4e\x43\xe5\x96\x06\x7c\x32\x1c\x32\
-\x1e\x8a\xf6\x9f\x5e\xec\x13\x80\x38\x57\x3a\xd6\x9e\xbc\x30\x08\
-\x39\x64\x07\x6e\x59\x67\xee\xc7\x86\x58\xee\xfe\x2a\x9e\x75\xfe\
-\xb8\xf5\xf1\xf4\x53\x95\x6b\x4f\xe2\xd9\xaf\x2d\x50\xad\x72\x6e\
-\xd0\xf7\x4b\x51\x2e\xf3\xab\xe3\xb2\xf2\x1a\x69\xdb\x0e\x9c\x91\
-\x0c\x43\xb6\x48\x70\x2b\xef\xa1\x17\x1b\xb4\xa6\xd7\x44\xa6\x8a\
-\x6d\x85\x02\x45\x71\xa7\xb4\x9d\x8a\x1b\x56\xfb\x55\x86\xd5\x12\
-\xdd\x12\x1b\x3f\xfe\xb6\x1b\x8e\xd2\x52\x52\x09\xcc\xfd\x40\xf1\
-\xc5\x39\xfa\xe7\xe9\x35\x3c\xf2\xc6\xa1\xd5\x57\x99\x0d\x43\xb4\
-\x69\xab\x25\xce\xfd\x73\x96\xf2\xc2\x1a\x8f\x02\xd5\x09\xe9\xd2\
-\xde\x5a\x8d\x02\x52\xdb\x2c\x28\x92\x7b\x31\xe7\xcf\xf7\x41\xd5\
-\x0e\xdc\xe6\xff\x00\xed\x8d\xd0\xbd\xe8\x8d\xb3\x4d\xdc\x17\x55\
-\x68\xd2\x56\xfb\x8a\x92\xdc\x28\x0f\x2d\x6a\x29\x66\x15\xb2\x14\
-\x48\xe0\x26\x89\xe9\x14\x1d\x98\x03\xb3\xd1\xe1\x90\xfe\xdc\x73\
-\xc5\x3b\x79\xf6\x76\xe3\x8f\x1a\xff\x00\x6c\x50\xd4\x02\x4f\x8d\
-\x45\x31\x96\x7f\xcf\xb4\xe2\xb5\x1d\xfd\xd8\x23\x81\xf6\x67\xc0\
-\xd3\x14\xce\x87\x8f\x0a\x82\x39\x76\x56\xb8\xad\x32\x1d\xdc\x4f\
-\x7f\x86\x38\x67\xcb\x96\x7c\xbd\xb8\xa1\xa7\x61\x14\xf9\xf2\x3c\
-\x31\x22\x06\xa3\xd3\x56\x1b\xf4\x29\x28\x09\x91\x1a\xed\x6a\x83\
-\x3d\x87\xd0\x93\x54\xa5\xc6\xe5\x30\xea\x16\x12\x4d\x45\x78\x1c\
-\x3b\x16\xed\xb1\xda\x7b\x48\xdc\x8c\xa3\x3a\x1e\xa2\xdb\xc0\xee\
-\x89\xbd\x5b\xa7\x29\xd2\xea\xe5\xc4\x95\x62\x5c\x54\x07\x54\xea\
-\x8a\x8f\x52\x54\x0f\x31\x86\x35\x47\x95\x7f\x39\x1b\xc5\xa3\x58\
-\x80\xd5\xc9\xd8\xba\x3f\x5d\x5c\xa5\xea\xfd\x3f\x22\x64\xd0\x4b\
-\x4d\xcc\x4a\xa6\x45\x6d\x70\x58\x5a\x8a\x93\x56\x56\xe8\x56\x7d\
-\x59\xe1\x87\x64\xed\xe6\xd3\x79\xb1\xb3\xdb\xa7\x3a\xec\xd9\x7a\
-\x4e\x70\xb2\xea\x09\xd6\x94\xc8\x49\x6d\x84\xda\xe6\x9b\x59\x6e\
-\x62\x62\xa8\xe6\xd8\x78\x92\x3f\xd2\x69\x43\xf9\x1e\x6a\xfc\x8c\
-\xef\xe6\xce\xdb\xbf\xc9\x9b\x6f\xf9\xcb\x6d\x9a\x55\xfe\xdc\xd9\
-\xfb\x3f\x70\x3f\x29\x0e\xc4\x80\xe3\x0d\xa9\x40\xa4\x74\x17\x52\
-\x69\x50\xa3\x5c\xba\x2d\xbb\xd5\x65\xd3\x17\x86\xa1\xc1\x95\x70\
-\xb0\xeb\x46\xa4\x69\xbb\x9d\xb4\xcf\x1f\xec\xb1\x29\x17\x16\x9a\
-\x60\x3c\x95\x8e\x95\x04\x2d\x54\x38\x8d\x74\xd1\x9a\xcf\x4c\xea\
-\x9b\x7c\xa6\xc3\x91\xe5\xd8\xef\x36\xfb\x9b\x0e\x21\x43\x22\x95\
-\x45\x7d\xc1\x82\x6a\x0d\x47\x00\x7e\x35\xc0\xcb\x85\x38\x77\x1e\
-\x67\xb7\x14\x26\xa0\xe6\x31\x4a\xf1\xcc\x91\xdf\xfd\x31\x4a\x0e\
-\x1c\x48\xcf\x31\x80\x38\x76\x9e\xdc\xeb\xcb\xb3\x03\xb0\x70\xee\
-\x18\x23\xe3\x80\x84\x8c\xc8\x2a\x24\xf0\x48\xe1\x5f\x12\x70\x12\
-\x68\xa0\x41\x35\x02\x86\xb9\x65\xf1\xc5\x39\x8e\x27\x04\x73\x39\
-\x57\xb8\x7c\x71\xdb\xdb\x97\x0f\xd3\x3c\x66\x01\x03\xd9\xef\xa6\
-\x2b\x5a\xd7\xe7\xd9\xfc\x1f\x2f\x87\xe9\x83\xe1\x5f\x5c\xf1\xeb\
-\xdf\x83\xde\x29\xe8\xe5\x90\xf5\xf6\xff\x00\x05\x4f\x0e\x64\xf0\
-\x02\x98\xba\xee\xdc\xe6\xe4\xdc\x2e\x1b\x41\x65\x4e\x9e\xd3\x13\
-\x22\xdd\x9d\x72\xd5\x1d\x95\x7d\xd6\xe5\x21\xcb\x7b\x0b\xfc\x65\
-\x49\x7e\xe2\xeb\xa1\x5f\x70\x29\x49\x2c\x02\x29\x4f\xe2\xf3\x2b\
-\xa9\x2c\x8f\x06\xb5\x4e\xb9\xd3\xb1\x76\x97\x4c\x04\xad\x48\x7d\
-\x57\x1d\xc6\x9c\xce\x9d\x94\xa6\x0a\x14\x87\x4b\xac\x59\xe5\x49\
-\x74\x74\x9a\x8e\x8a\xe3\xcb\xc6\x8e\x6a\x1a\x62\xdc\xf5\x06\x94\
-\x8f\xae\xaf\x8e\x2a\x37\xe2\xc9\x95\x73\xd5\x69\x45\xcd\x6e\xcc\
-\x49\x4a\x56\xa7\x92\xc3\xa8\x4d\x55\x9d\x00\xae\x2b\xd9\x81\x4e\
-\x74\xca\x99\x77\xf6\xe5\x80\xa1\xfe\x9e\xec\x8f\x31\xdd\x81\x51\
-\x99\xcc\x78\x1f\xe9\x8c\xbd\x7d\x4e\x00\xa0\x39\xf3\xe5\xfc\x8e\
-\x29\x95\x79\xe3\xd7\x2c\x02\x48\xee\x19\xfc\x80\x38\xa7\x2a\xfb\
-\xfd\xb8\xa9\xa7\x80\xf8\xfb\x6b\x82\x32\xee\xee\xef\xe1\xc7\x04\
-\x76\x80\x7b\xf1\x40\x45\x79\x80\x73\xe1\xd9\x8f\xe9\xcf\x03\x80\
-\x1c\x6a\x72\x3c\x78\x1c\xf3\xc5\x0f\xf3\xcb\xe1\x85\xc4\xbb\xda\
-\xad\xf7\x38\xae\x0a\x2d\x89\xd0\xe3\xcb\x69\x63\x87\xd4\xdb\xed\
-\xad\x2a\xcb\xb4\x61\x37\xcd\x7b\xb1\x5a\x41\xcb\xf0\x5b\x2e\x2e\
-\xf7\x61\x8c\xe6\x98\xb9\xbe\xb6\x3f\xfd\x46\x54\xbb\x0b\x90\x1c\
-\x95\xd0\x09\xa7\xdc\x2a\xa6\x2e\xd7\xdf\x2f\x3b\xbd\xbd\x1b\x11\
-\x77\xb9\x2e\x4c\x86\x58\xd3\xba\xca\xe3\x32\xc9\x0a\x53\xcc\xf4\
-\x36\xe4\x78\x2f\xbe\x87\xd0\x86\x9d\x1d\x65\x3f\x7a\xab\x27\x33\
-\x4c\x0b\xae\xcb\xf9\xbd\xdb\xcf\x30\x76\x46\xa5\xb6\x83\xa2\xf7\
-\x5e\xd1\x2a\xde\xe3\xb6\xd6\xd3\xf5\x3c\x99\xee\xa2\x73\xc2\x63\
-\x80\x50\xa0\x4a\x69\x1c\xc1\xe5\x8b\x2a\xfc\xd3\x79\x0e\x5e\xaf\
-\x86\xb9\x01\x9b\xde\xa9\xd8\xab\xca\xaf\xc9\x61\x82\xb7\x4a\x65\
-\xb3\x61\x8c\x6f\x12\x6a\x50\x13\xf4\x29\xc4\x66\x78\xf2\xc3\xda\
-\x6b\x74\x98\xdc\xcd\x84\xbe\x45\x42\x55\x29\x9d\xd1\xd1\x77\x1b\
-\x5c\x06\x54\xa5\x2d\x0a\x6c\xcf\x8a\x99\x6d\x07\x02\xdb\x3f\x4a\
-\x82\x54\x7b\x32\xc1\x7f\x6c\x3c\xc2\xed\x7e\xa7\x52\x0b\x69\x72\
-\x1b\x1a\xa6\xdb\x16\xe2\xd9\x74\xd1\xb0\xbb\x7c\xd7\xa3\x4c\x49\
-\x59\xff\x00\x4d\x51\x9e\x11\x22\xd7\x73\x81\x71\x8e\xe0\x0a\x43\
-\xd0\x65\xb1\x29\xa5\xa4\x80\x42\x92\xe3\x0e\x38\x85\x02\x0f\x23\
-\x8a\x03\x98\xc0\x14\x34\x3c\xfb\x29\x5c\x57\x1d\x3f\xf7\x01\x5a\
-\x11\xc8\xd3\x87\x75\x71\xc3\x3a\xf1\xfd\x3d\x22\x9c\xeb\xfd\x88\
-\xc1\x1d\xb8\xf6\x9f\xd3\xd3\x4f\x5c\xbd\x1d\xf8\x3d\xff\x00\xdf\
-\xf4\xc1\xfe\xb9\xfb\xbf\x8b\x5e\x6a\xf6\x65\xc3\x89\x77\x87\x60\
-\x9f\x1b\x4d\xfe\x73\x88\x6d\x99\x3a\x9e\xe0\xc2\xe1\x69\xf8\x95\
-\x5a\x92\x14\xb9\x17\x47\xda\x48\x15\xce\xb8\xb6\x3f\xba\x57\x26\
-\xaf\x7b\x85\xaa\x2e\x13\xef\x17\xcb\xca\x02\x14\xec\xb4\xc9\x94\
-\xf4\x86\x8b\xcf\xa1\x08\x0e\xa9\x4e\xbe\xb5\x9a\x00\x2a\xbc\x80\
-\xfe\x2f\xdb\xd7\xf6\xdf\xd1\x53\xd0\xf7\xfc\xaf\x70\x13\xbd\x1b\
-\xa7\x6c\x69\x4e\x87\x62\xe9\x9b\x24\x91\x0a\xc5\x32\x45\x28\xda\
-\x99\x42\x23\x5c\x5c\xe9\x35\x50\x29\x07\x2c\x8e\x34\xfe\x99\x82\
-\xd3\x6c\x42\xb0\x59\xad\xb6\x88\xad\x32\x80\x86\x9b\x8f\x6f\x88\
-\xd4\x56\x90\x84\x8a\x51\x29\x43\x62\x98\x3d\xfe\x3e\x3c\xbb\x70\
-\x08\x39\x13\x9f\x71\xec\xe3\xcf\x14\x1c\x33\x51\x1c\x01\xf6\xd0\
-\x1c\x03\x97\xd2\x39\x57\x98\xe1\x9f\x66\x3e\x19\x78\xd3\x9e\x38\
-\x92\x01\x3c\xab\xcb\x87\x8e\x78\xae\x40\xd3\x8e\x32\xa5\x29\xcf\
-\x86\x5f\xd7\x1c\x01\xa0\xa8\x3f\xd4\xf2\xc1\x5d\x39\x53\xe3\xc7\
-\xc3\x1d\x95\xf7\xe7\xfa\xe0\xd6\xbc\x4d\x39\xe4\x39\x9c\x50\x56\
-\xa3\x89\xa7\x1e\x5c\x39\x66\x70\xaa\xf6\xfb\x32\x07\xf9\x60\xe7\
-\x5a\xf0\xf6\x7c\x71\x4c\xc9\xe1\x5a\x56\x83\xf9\x60\x57\x90\xf7\
-\xe7\x8a\xf7\xf2\xcf\xfb\xe3\x2e\xf1\x9e\x64\x77\xe3\x88\xa8\x39\
-\x7c\x4f\x2e\xf3\x80\x33\xf7\x0e\x7d\xbc\x2b\x96\x3a\x56\x84\xad\
-\x34\xa1\x0a\x48\x50\x3e\xc3\x51\xcf\x0f\xd8\xb7\x4f\x69\x34\x0e\
-\xb9\xb6\xc9\x49\x4b\xd1\xb5\x0e\x99\xb4\xdc\x3a\x82\xb8\x90\xeb\
-\xb1\x8b\xa8\x56\x7c\x42\x81\xc0\x95\x13\x65\x7f\xf5\xe5\xc5\xa6\
-\x16\xcc\x7b\x86\xdb\x6a\x2b\xe6\x91\x71\x82\xa5\x75\x25\xc1\x1a\
-\xdf\x35\x30\x9c\x5b\x6a\xcd\x3d\x4d\x90\x9e\x58\x66\x47\x96\x4f\
-\x3b\xde\x66\x76\x6a\x43\x0e\x07\x93\x06\x46\xa5\x1a\xa2\xc4\xeb\
-\xe0\xd4\xb8\xf5\xa9\xe5\xc0\x64\x95\xf0\x50\xff\x00\x49\x03\x31\
-\xdb\x74\x6b\x4c\x79\xa3\xda\x7f\x31\x9a\x7d\x0e\x33\x2a\x02\x77\
-\x13\x49\xaa\xc9\xa9\x54\x88\xa8\x5a\x95\x6f\x4b\x90\x02\x23\xa5\
-\xa9\x84\x25\x2a\x52\x9e\x52\xc1\x35\x04\x0c\x6a\xf9\x9e\x65\x3c\
-\x82\xde\xef\x76\xed\x32\x88\xce\xb1\x72\xd9\x69\xce\x5f\x9c\xb9\
-\x46\x5a\x51\xf9\x2f\xc7\x81\xf7\x6e\x0e\x3c\x96\xd5\xd5\x92\x54\
-\x95\x0a\x53\xa4\x0a\x90\xcc\x4d\xd2\xb8\xee\x0e\xc8\xea\x04\x25\
-\x84\x5c\xec\xdb\x8b\xa1\xaf\x70\x55\x6d\x94\xfa\x0a\x8b\x2e\x4a\
-\x87\x1a\x5b\x4b\x43\x6b\x49\x49\x5e\x40\x12\x2b\x4a\xe1\x97\xac\
-\xbe\x63\xb6\xab\xef\x4b\xfc\x74\xc5\x8b\x71\xd5\xb6\xab\x54\xa5\
-\x7e\x52\x12\xeb\x2d\x88\xf7\x09\x31\xdd\x2b\x52\x56\x32\xa6\x46\
-\xa3\x00\xd8\x75\x35\x86\xf2\x0a\x52\xa0\x6d\x97\x68\x33\x85\x14\
-\x3a\x92\x7f\xf1\xdf\x70\xfd\x43\x87\x6e\x0d\x08\x34\xe6\x39\x62\
-\xb8\xcf\x80\x1f\x0e\x38\xa8\xe1\x8a\x8f\x48\xee\xfe\x75\xf4\x0f\
-\x5a\xe3\x9f\xbe\x9c\x3d\xff\x00\xc1\x9f\x6f\x2a\x57\xdf\x8f\x5f\
-\x5c\xf0\x49\x34\x1c\xf1\xb2\x3e\x50\xf6\xee\xe5\x72\x8e\xde\x8e\
-\xb8\x31\xba\x9b\xad\x72\xb7\x40\x5c\xeb\x7c\x45\x48\x6d\xeb\x6e\
-\x90\xb0\x5d\x1d\xa1\x8c\xc3\xcb\x43\xb2\x67\x94\x38\x4a\xa8\xd3\
-\x6a\xe9\xa1\x0a\x16\xab\x34\x36\xd2\xd4\x6b\x64\x08\xb0\x59\x42\
-\x00\x09\x08\x8c\xca\x1a\x04\x01\xff\x00\xdb\xa6\xbf\xc2\x49\xc8\
-\x73\x3c\x80\xa6\x64\xd7\xb0\x63\xcf\x1f\x99\xe9\xea\x6e\xeb\xa5\
-\x3c\xb8\x47\x56\xc9\xed\xd4\xaf\xcc\x72\x6c\x68\x2a\xb2\x74\xe9\
-\x69\xc9\x81\xf4\x86\x19\xfc\xb9\xd6\xf9\xaf\xac\x03\x92\xdc\x3d\
-\xa4\xe0\x65\xc3\x96\x3b\x2b\x4c\xa9\x5a\x8e\x78\x20\x57\x23\x53\
-\xdd\xcb\x02\xbc\x29\x5c\xb2\xa8\xcc\xe0\x0a\xf2\xfd\x72\xf8\x63\
-\xd7\xc3\xf5\xc7\x67\x1c\xbb\x7c\x71\x4e\xdf\x45\x29\x95\x3e\x3d\
-\x9d\xc3\x05\x3c\xaa\x07\x3c\x85\x69\x97\xb3\x02\x95\xa8\xa6\x5f\
-\xaf\x6e\x06\x7c\x07\x1e\xfc\xb1\x5a\xf0\x15\xef\x27\x87\xb8\xe0\
-\xf1\xaf\x1e\xef\x66\x7d\x98\x23\x88\x14\xa1\xef\xe7\x8e\xfe\xee\
-\x1e\xb4\xc7\x6d\x7e\x42\x99\x7b\x70\x40\xe5\x9f\xc3\xfa\xe2\xb5\
-\x3e\x38\x2a\x34\x02\xa2\x94\xe3\xdf\xf1\xc0\x57\x76\x67\xbc\x65\
-\xef\x38\x27\xb0\x67\xdf\x8e\xaf\xee\x2b\x8a\xf2\x07\x3f\x0f\x66\
-\x09\x03\x2f\x96\x29\xdd\xf3\xc5\x16\x84\xa8\x11\x42\x14\x01\x49\
-\x1d\xe0\xd4\x1c\x3a\xd6\xb7\xda\xcd\xbf\xd5\xa9\x79\x0b\x43\x89\
-\xd4\x3a\x4a\xc5\x75\xeb\x4b\x9f\xeb\x4a\x8c\xc8\x4e\x92\x15\xcf\
-\x3c\xf1\x2a\xe1\x77\xf2\xf1\xa7\xed\x12\xe6\x90\xa7\xd5\xa4\xae\
-\x17\x7d\x2e\xc8\x76\xab\x51\x79\xa8\x96\x79\xf1\x62\x36\xe1\x52\
-\xcd\x7a\x50\x2b\x97\x60\xc5\xd3\x55\xec\x5f\x98\xbf\x33\x3b\x3b\
-\x72\x9c\xcc\x56\x6d\xf1\xec\x5b\x80\xb9\xf6\xeb\x1a\x22\xf4\x80\
-\xd5\xbd\x99\xb1\x8b\xc5\x85\xa4\x50\xa5\xe7\x1d\xa6\x54\x20\x0c\
-\x4c\xb9\xf9\x7a\xfd\xc6\xe6\x6a\xd6\x99\x75\x0d\xda\xf4\xce\xf3\
-\xe9\xc6\xee\xcc\xbb\x07\xee\x05\xb8\x2e\x17\x57\x19\xbb\xfd\xd9\
-\x44\x56\xab\x43\x28\xae\x40\x74\xe2\x54\x6d\x53\xb2\xdb\x41\xbf\
-\xb6\xc5\x42\x53\x70\x67\x69\x0b\xbc\x7d\x3d\x30\x4d\x8c\xc3\x40\
-\xbf\x35\xb9\x92\xa3\x04\xb5\x39\xee\xae\x94\x25\x04\xa0\xd4\x93\
-\x4a\x62\x2c\x5d\xe4\xfd\xb2\x37\x9e\x24\x76\xdb\x65\x37\x7b\xae\
-\x81\xb9\x23\x55\xc4\x65\xe5\x29\x21\xc7\x21\xfe\x35\xbd\x6d\xc8\
-\x64\x36\xa0\x40\xfb\x80\xd7\x2a\xf3\x13\x6c\xdb\xb7\xb5\x7e\x66\
-\x36\x92\x7c\x67\xda\x61\xc4\x6a\x6d\xa4\xbc\xba\xc8\x72\x42\xc2\
-\x19\x01\xd8\x45\xe5\x27\xef\x66\x53\xd4\x91\x50\x0f\x66\x22\x58\
-\x6c\x5b\xfd\x64\xb1\x5f\x24\xa1\x4a\x45\xab\x5b\xc1\xba\x68\xf9\
-\x68\xe9\xa7\x53\x6e\x2a\xfb\x12\x1c\x74\xb9\x5f\xfb\x7a\xea\x69\
-\x96\x18\x8b\xa6\x77\x5b\x6f\xef\x72\x24\x46\x4c\xc6\x63\xdb\xb5\
-\x65\x96\x4c\x87\x63\x2d\x5d\x28\x7d\xb6\x1b\x98\xa7\x56\xca\x94\
-\x28\x14\x05\x09\xca\xb8\xeb\x89\x2e\x34\x94\x9e\x0a\x61\xf6\x9d\
-\x07\xc0\xb6\xa3\x5c\x65\xfc\x59\x76\x7b\x8f\xa7\x5c\xee\xbe\xac\
-\x90\x23\xd9\x74\x6d\x8a\x55\xd1\xd1\x54\x87\x25\xc9\x00\x33\x6f\
-\xb7\xc7\x4a\xd4\x80\xe4\xa9\xf3\x9d\x6d\xa6\xd3\x5a\x95\x2c\x0c\
-\x6b\x0d\xf3\xd7\xba\x86\x3e\xad\xd7\x5b\xd1\x79\x77\x58\xdc\x2e\
-\x4d\xc0\x66\x3c\x6b\x53\x33\xb2\x85\x62\xb4\xae\x8a\x90\xab\x65\
-\x9a\xda\x96\x62\xb3\xd6\xa2\xa5\x06\x8a\x8e\x6a\xc0\xec\xe5\xfc\
-\x3b\xeb\xbc\x93\x25\x47\x86\x9d\xba\xda\xdd\x6b\xaa\x23\x3d\x28\
-\x94\xb0\x6e\x36\xcb\x14\xd7\xed\x8c\xa8\xa4\x85\x56\x44\xf4\xb6\
-\x80\x06\x75\x50\xc4\xcd\xf4\xd4\xf1\x1c\x56\xbe\xf3\x15\xaf\x75\
-\x4e\xb9\xbe\xdd\x64\x31\xf6\x5f\x9d\x0b\xfc\xcc\xe6\xe0\x50\x29\
-\x29\x71\x4d\x17\x54\xea\xc2\x89\xfa\xfa\xba\xa8\x2b\xe8\xcc\x71\
-\x19\x77\x76\xfb\x70\x4f\x22\x46\x55\xff\x00\x57\x6e\x58\x2a\x56\
-\x44\x72\xf8\x7c\x30\x49\x14\xa7\x0c\xbb\x49\x39\x70\xc0\xcb\x85\
-\x7b\x29\xe8\xaf\x76\x58\xcf\xdb\xed\xfd\x06\x05\x33\xf1\x3c\xbc\
-\x71\xc4\xe7\xef\xe2\x0f\xbf\x2c\x65\x5e\x14\xe1\xed\xc7\x3a\xd3\
-\x9f\x6e\x2a\x4f\x0f\xf5\x0e\xca\x72\xef\xae\x08\x48\xf6\xf7\x1e\
-\xdf\x0c\x14\x8a\x8a\x73\xef\xe1\xef\xc5\x33\x02\xb4\xf1\xf0\x27\
-\x02\x82\xa0\x0f\xed\x8a\x8f\x78\xed\x38\xcf\x85\x7e\x18\xa6\x74\
-\xa5\x07\x67\x3a\xd7\xd8\x31\xd8\x0f\x2e\x18\xf6\xf3\xe6\x3d\xbc\
-\x71\x52\x48\xa7\x0c\xb2\xe5\xef\xcc\xe0\x8e\xdf\xe9\x83\x4f\x6f\
-\xbb\xbf\xbb\x00\x72\xe3\x5a\x66\x7c\x7c\x31\xeb\x9f\xa4\xd0\x0a\
-\x71\xf7\x77\xd2\xbf\x2f\x47\x0e\xcc\xfd\x7c\x31\xf5\xa1\x2a\xff\
-\x00\xf2\x48\x3e\xf0\x45\x0e\x1e\x89\x7d\xd3\x76\x2b\xc4\x59\x05\
-\x25\xe8\xf7\x2b\x4c\x19\xac\xb8\x52\x41\x49\x5a\x1f\x61\x61\x45\
-\x24\x71\x38\x37\x9d\x43\xe5\xc7\x69\xa4\xdd\xd5\x24\xcb\x55\xda\
-\x3e\x8f\xb4\x41\xb9\x2a\x52\xa8\x54\xf9\x99\x0e\x33\x2f\x97\x49\
-\x48\xcc\xaa\xb9\x62\xfb\xa8\xb4\xec\x0d\xc0\xdb\xfd\x53\x79\x86\
-\xfc\x28\xf7\xfd\x2b\xad\xae\xad\xbd\x64\x69\xe7\x7e\xf5\x2c\xf0\
-\xee\x0b\x9b\x06\x22\x5b\x5e\x69\x48\x6e\x82\xbc\x31\x16\x36\xc1\
-\x79\xea\xdf\x3d\x05\x22\x2c\xc7\xe7\x7e\x5e\xa4\x5a\x75\x4c\x80\
-\xeb\xed\x7d\xb3\x1d\xa5\x47\x9f\x66\x63\xf0\x7a\x89\x70\xb4\xe3\
-\x4e\xa3\xee\x7d\x42\x98\xb7\xa7\x4b\x79\xa7\xda\x4d\xef\xb1\x42\
-\x90\x50\xfc\x2d\xc5\xd2\x6e\x59\x2f\x53\x62\x74\xff\x00\xdf\x3e\
-\xd9\x15\xc4\xfd\xf4\xd2\x80\x15\x0c\xd5\x52\x72\xc3\x2e\x6b\xbf\
-\x29\xbb\x73\xb8\x90\x42\xd6\x65\x48\xdb\x5d\xc2\x44\x6b\x92\x22\
-\xa5\x2e\x14\xac\x42\xbd\x30\xdb\x2f\xcb\xfa\x45\x50\x95\x84\x92\
-\x72\x38\x8c\xfe\xe1\xf9\x30\xf3\x31\xa7\xc2\xa6\x2a\xdd\x34\xdb\
-\x74\x7b\x77\xc1\x0e\x5b\x65\x21\xc2\xa4\xc2\x94\xa5\xbb\x19\x45\
-\x54\x6d\xc4\x82\x95\xf2\xef\x16\x6b\xcd\xf3\x50\xed\x96\xa2\x0f\
-\x3e\xcb\x96\x0d\xc9\xd3\xf3\x34\xbd\xc5\xbf\xc7\x73\xed\xad\xc5\
-\x09\xc9\x0c\xa9\xae\xbe\x61\x67\x8e\x78\x6a\x5d\x87\x59\xd9\x2e\
-\xd1\xdd\xc9\x0e\xc0\x98\xcc\x94\xab\x20\xa2\x47\xda\x52\x89\xa0\
-\x50\xe5\xcf\x0a\x31\x2e\x2c\x38\x13\x99\xa9\x28\xcb\xb4\x75\x84\
-\xd4\x77\xe0\x29\xb5\xa5\x60\x80\x41\x4a\x82\x85\x29\x97\x02\x79\
-\x62\x9d\xfe\xbf\x3c\x15\x2d\x49\x42\x52\x0a\x96\xa5\x10\x94\xa5\
-\x20\x54\x95\x28\xd0\x01\x8d\x9a\xf2\xdb\xa7\x35\x5b\x69\xd1\x3a\
-\x33\x58\xd9\x37\x13\x75\x18\xb6\xad\xbb\xa5\xae\xff\x00\x3e\x03\
-\x8e\xaf\x4f\x68\x5d\x42\xc4\x69\x01\x2b\x86\xe3\x69\x76\x6b\xad\
-\xb9\x50\x95\xb6\xc9\x22\xb4\xc5\xb2\xc3\x66\x86\xc4\x0b\x6d\xaa\
-\x0c\x78\x30\xe2\x46\x6d\x2d\x30\xc3\x11\xdb\x4b\x68\x6d\xa6\xd3\
-\x44\xa5\x01\x29\xc8\x60\xa4\x8f\xe9\x96\x5c\xfb\x7f\x87\x48\xf9\
-\x59\xd2\xf2\x1f\x77\x70\xbc\xdf\x6e\x8e\x94\xdb\x4b\x6d\xba\xde\
-\x4a\xa7\xff\x00\xc5\xa1\x5d\x61\x5d\xf5\x2c\xcf\xb6\x92\x95\x08\
-\xcb\x71\x98\xb1\x14\xa2\x42\x7f\xf2\xa8\x7a\x85\x52\x76\x67\x67\
-\xad\xc8\x09\x63\x41\xed\xfe\x9c\xb1\x39\x44\x21\xb2\xe4\xb8\xd6\
-\xe6\x3f\x31\xe5\x25\xaf\xf6\xfa\xde\x94\x56\xa5\x11\xc4\x9a\xe0\
-\x56\xb4\xc5\x39\x0e\x7c\x6b\xfd\x71\xdb\x41\x5f\x0c\x0a\x8a\x9a\
-\xf2\xec\xc5\x39\xf7\x54\xfa\xf1\xc5\x28\x69\xf2\xf1\xc5\x39\xd2\
-\xbe\x83\xed\x06\x9e\xbc\x70\x2b\x42\x4f\x0c\xbb\x31\xf0\xe0\x71\
-\xeb\xd8\x07\xe9\x83\x4e\x5d\xc7\xc7\xdb\x96\x09\xa6\x59\x67\xda\
-\x3d\xbd\x98\x04\xf0\xc8\x01\x96\x7d\x9d\xb4\xc5\x79\x1c\xcd\x78\
-\x8c\xb2\xa6\x05\x78\x8a\xf1\xcb\xb7\xf4\xc7\x4f\x33\x5c\xf8\x0e\
-\x7d\x87\x05\x3d\xd5\x07\x96\x7c\xb0\x0d\x0d\x07\x13\x9f\x1f\xe8\
-\x71\x5c\xc8\xe2\x0f\x77\x1c\x0c\xeb\x51\x5f\x7d\x70\x01\x19\x72\
-\xef\xaf\xf2\xae\x29\xc0\xd7\x33\xd8\x31\x5a\x50\xf1\xa1\xf5\x18\
-\x1c\xbd\xbe\xf2\x30\x4f\x00\x3c\x3f\xa6\x32\xad\x07\x0e\xe1\xfd\
-\x86\x00\xf6\xfb\xff\x00\xb7\xa2\xa4\x65\xc2\xb8\xe3\x5e\xff\x00\
-\xe3\x23\xb7\xd6\xbe\x38\xa5\x30\x43\x8c\xb4\xe0\x3c\x7a\xdb\x42\
-\xeb\x9d\x7f\xee\x04\x61\x7f\xf2\x8d\xbf\xd2\x17\xd5\x38\x08\x52\
-\xee\x7a\x7e\xd9\x2d\xc3\xd5\x9a\x89\x5b\xd1\xd4\xaf\xab\x0b\x72\
-\xdf\xb7\x1a\x62\xd6\xea\xd4\x95\x97\x6d\x56\xf6\xad\xce\xa5\x49\
-\x35\x05\x0e\x44\x0c\xa9\xbe\x3f\xf6\xd3\x8e\x02\x6d\x2e\xdd\xe0\
-\x21\x3f\x74\xa1\x09\xba\xcb\x90\xd8\x53\xb9\x92\x5b\x96\xe3\xe9\
-\x29\x49\xe0\x0e\x43\x09\x8f\x1e\xf6\xfb\xe9\x0b\x5a\x94\xe4\xb8\
-\xec\x2d\x6a\x49\xa9\x42\x2a\xd0\x68\x00\x8a\x8e\x5c\x06\x14\x2d\
-\xda\x8f\x4d\x46\x6b\xa9\x44\x2a\x4d\x9a\x6c\x97\x0a\x54\x0d\x01\
-\x4a\x6e\x0c\xa6\xa9\x34\xe7\x9d\x39\x62\x6e\x93\xd6\x9e\x6d\xb5\
-\x7e\xdc\x68\x39\x68\x71\xb9\x36\x6d\x8e\xd3\xd1\x34\x4d\xf2\xe0\
-\xda\xd4\x68\xdd\xc3\x55\x5c\x66\xdf\x6e\x26\x31\x68\xf4\xa9\xa6\
-\x43\x21\x75\x35\x38\x6a\x4e\xda\x35\xad\x2f\x3a\x93\xf2\xe6\x5c\
-\x2e\x1a\xab\x5a\xea\xfb\xb6\xa0\xbb\x5d\x6e\x37\x06\x44\x79\x73\
-\x66\x21\xe7\x5b\x82\xb7\x96\xc0\x08\x49\x0d\x0e\x84\xe4\x33\xa9\
-\x24\x0e\x14\x1d\xbd\xa0\x0c\x1a\xf1\xf4\xf0\xa5\x73\xa7\x67\xa3\
-\x6e\x3c\xbd\x37\x6f\x6d\x5b\x6d\xe4\x87\x41\x23\x56\xea\x77\x9f\
-\x71\x45\x57\x6d\x69\x7e\x8d\x03\x50\x83\x1f\xec\x92\x94\xb3\x6e\
-\x32\x2d\xcd\x14\xa8\x8e\xa5\x87\x2b\x95\x01\x42\x12\x00\x4a\x12\
-\x12\x90\x05\x00\x4a\x45\x00\x03\xb0\x0c\x57\xe3\x4f\x96\x28\x6b\
-\xf5\x7c\xeb\x82\x7b\x07\xeb\x5c\x13\x95\x78\x81\xdd\x5a\x62\xa7\
-\x9e\x79\x7b\xbd\xb8\x35\xa8\x03\xe3\xda\x7b\xf8\x62\xbd\xb8\xcb\
-\x8e\x5f\x13\x8e\x04\x78\xf6\xd6\x9c\x7b\xf0\x69\xcc\x93\xed\xc1\
-\x14\xcc\x10\x3b\xb3\x3c\x7b\x70\x41\xe1\x5f\x0e\xca\x7c\x71\x9f\
-\x32\x4f\x6f\xc7\x14\x3c\xf0\x3c\x45\x38\xd3\xba\xa0\x11\x82\x49\
-\xcc\x65\xda\x3e\x23\x8e\x32\x3d\xf9\xf6\x71\x3d\xf4\xc0\x34\xe3\
-\x5c\xf9\x8e\x59\x71\xc1\x00\x9e\x39\x67\xd9\xfc\xf1\x43\x9f\x61\
-\x35\xe7\xca\x99\xd3\x04\xd4\x71\xa6\x5f\x11\x8a\x57\xb3\x3c\x1c\
-\xfd\xfd\x9e\x8a\x93\x9f\x7f\x0f\x87\x3c\x0a\x1f\x69\xaf\x7e\x5c\
-\xe9\x8e\x23\xb7\x8f\x1f\x86\x3d\x98\x4f\xff\x00\x88\xf4\x0c\xf8\
-\xfc\x39\x67\xfc\x15\xf6\x7c\xbf\x4c\x7b\xfe\x3e\x83\x5e\x3e\xbd\
-\xde\x9c\xf1\xeb\x97\x77\xa3\xe3\xef\xfe\x2a\xfc\xf3\xf4\xf1\xa9\
-\xe7\x8b\xbd\xf2\xe2\xfa\x23\x40\xb3\xdb\x27\x5c\xe6\xbe\xb2\x12\
-\x86\x62\xc1\x8a\xec\x97\xdd\x59\x3c\x12\x86\xda\x24\x9e\xec\x79\
-\xef\xfd\xc2\xb5\x03\xdf\x9e\xee\xf2\xef\x5e\xad\xb0\x68\x79\x6b\
-\x5a\xdc\x71\x1a\x52\x25\xea\x43\xd1\x9a\xff\x00\x73\xea\x6d\x11\
-\xa0\x35\x19\x84\x01\x44\x84\x37\x90\xc5\x06\x75\xc0\xce\xb9\x76\
-\xd6\x98\x02\xb4\xcf\x2f\xd7\x00\x1a\xf3\xe0\x7c\x69\x8a\xf6\xe5\
-\xcb\x2a\xd3\x3e\xfc\x52\xb9\xf3\xfe\xd8\xcc\xff\x00\x3e\xec\xb0\
-\x33\xa9\x3c\x7c\x3d\x9c\x31\x43\x50\x00\xa8\xa7\xb3\x3c\x77\xfe\
-\xb8\xf5\xf0\xc2\xbb\x6a\x3b\x69\x4f\xe7\x4c\x64\x39\x8f\xd3\xe5\
-\x8f\xaa\x87\x03\xbf\x86\x05\x4d\x3b\xbb\xc7\x3a\xf3\xc1\xaf\x03\
-\xcb\xb3\x00\x57\x22\x69\x5e\x62\xbd\x9e\xec\x67\x98\xf5\xa7\x66\
-\x78\x14\x3c\x68\x3f\xae\x2b\xd5\xcf\x33\xd9\xf1\xc7\x49\x23\xb4\
-\x1e\x15\xa9\xe7\x83\x9f\x65\x3b\xff\x00\xb6\x3d\x78\xf3\xf9\xfa\
-\x72\xcc\x77\xfb\xbb\xb0\x4f\x20\x47\x0e\x1c\x3f\x4c\x53\x23\x4a\
-\x66\x3d\x7b\xf1\x98\xa8\xec\xad\x3d\x12\xaf\xdb\x83\xad\xf4\xae\
-\x89\xb2\x42\x69\x6f\x4b\xbb\x6a\x9b\xf5\xae\xc5\x6f\x8e\xd3\x62\
-\xab\x71\xd9\x57\x29\x31\xda\x42\x52\x39\x93\x83\xa1\x74\x5d\xf3\
-\x58\xf9\x8c\xd7\x6e\x07\xdb\x8d\x67\xd9\x8b\x03\xb7\xeb\x52\xa5\
-\xb5\xd2\x96\xd9\x56\xa2\x7d\x51\xed\xcf\xa5\xe5\xaa\x81\x71\xbf\
-\x21\x39\x1e\xcc\x6d\x64\xbd\xb8\xf2\x16\x9d\x83\xd9\x0d\x71\xaf\
-\x60\xe9\x21\xb9\xdb\xdc\xd6\xa1\xb9\xaa\xe0\xa9\xab\x48\x8b\x1d\
-\x80\xcb\x7a\x6e\xdf\x05\xd9\x4d\xf5\x2e\x84\xba\x52\x00\xa1\xa7\
-\x1d\xc2\x46\xf1\xe8\x7d\x19\xa3\xaf\x7a\x23\x55\x44\xb0\xdb\x24\
-\xe8\x8d\x54\xbd\x4f\x69\xd4\xf6\x89\x96\x0b\x5d\xea\x35\xf5\xc0\
-\xec\x58\xcf\xd9\x25\xba\xa9\xeb\x6d\x70\xdc\xeb\x53\x7f\x6c\x2b\
-\xad\x49\x52\x4e\x3b\x40\x1e\xee\x15\xf8\xe2\xbd\xf4\xf4\x1c\xf8\
-\x73\xc2\x87\x61\xa7\xa4\x67\xda\x4e\x7e\x03\x86\x2b\xd9\x83\x9e\
-\x5c\xbf\xa7\xb7\xd1\xad\x77\xcb\x4c\x6d\x95\xe3\x76\x67\xe9\x03\
-\x6d\x75\xfd\x27\x64\x71\xd6\xe4\x9b\x74\xab\x84\x78\xd7\x0b\xa3\
-\xaa\x62\x2c\xd9\x02\x25\xaa\x2b\x8a\x7d\xde\x86\x96\xae\x94\x72\
-\x15\x21\x36\xcd\xd5\x99\xa8\x76\x37\x52\x22\x57\xe1\x3c\x9d\x43\
-\x6e\x99\x77\xb0\xfd\xe0\x1b\xeb\x5f\xf9\x4b\x64\x77\x1e\x8c\xda\
-\x54\xba\x55\xe6\x1b\x02\x87\x3c\x8e\x23\x6a\x7d\xa0\xdd\x0d\x13\
-\xb8\x76\x49\x35\x0d\xcd\xd2\xda\x82\xdd\x74\x09\x52\x4d\x14\xd3\
-\xec\xc7\x7d\x4f\xc6\x79\x24\x66\x85\xa5\x2a\x1d\x98\xaa\x54\x92\
-\x3b\x41\x07\xf8\x7c\xda\xeb\x58\x57\x88\xb6\x3b\xb3\xbb\x4d\x7c\
-\xd2\x76\x2b\x84\x99\x4b\x88\x5a\xbd\x6b\x80\xd6\x92\xb7\xfe\x33\
-\x8d\x05\x3c\xa9\x81\xfb\xc0\x2d\x25\x00\xa9\x4b\x02\x9d\xa3\x60\
-\xec\x2d\xa6\x47\xe6\xea\x6b\x12\xf5\x9d\xcd\xe9\xb0\x95\x02\x6c\
-\xa9\x9a\x81\xd3\x28\xc8\x92\xcb\xbf\xef\x15\xba\xd7\x49\x05\x7f\
-\x51\x4d\x0e\x5c\x31\x97\xc3\x02\x99\x9a\x1a\x8e\x5e\x1f\x1c\x53\
-\x99\x35\x27\xd6\x9c\x31\xc2\xa0\x8e\x79\xd2\x98\x23\xb2\x99\x65\
-\x82\x69\x4c\xa9\xe3\xdf\x83\xc2\xa6\x99\xfc\xbd\xf8\xe5\x4a\x0c\
-\x87\x77\xb7\x1c\x73\xf8\x7b\x31\xc7\xb7\xe7\xfa\x62\x9e\xbc\xbf\
-\x9e\x2b\xdb\xc4\xf7\x76\x53\x15\x1c\xf8\xfb\x30\x3b\x79\x65\x97\
-\xea\x71\x43\xc4\x50\x83\x41\x95\x38\xe0\x8a\x70\xe7\x97\x3c\x53\
-\x89\xcc\xe7\xeb\xdf\x8a\x13\xc3\x32\x3f\x5a\x91\x8a\x70\x3c\x6b\
-\xfc\xf0\x6b\xc7\x2a\x8c\xb2\xe1\xe3\x96\x39\xd0\x50\x7c\xfe\xaf\
-\x0a\x7a\x39\xd4\x52\xbe\x24\x57\x2a\x76\x61\x35\xe3\xc6\xbe\x3f\
-\xaf\xa4\x53\x8f\x3c\x77\x73\xf6\x62\x45\xeb\x53\xdf\x2d\x3a\x7e\
-\xd1\x11\xb5\x3b\x26\xe5\x78\x9f\x16\xdd\x05\x86\x90\x92\xa5\x2d\
-\xd9\x32\xdd\x69\x94\x24\x24\x73\x38\xb8\x58\x34\xd6\xb3\xbe\xf9\
-\x84\xd7\xf1\x1c\x54\x68\xfa\x33\x64\xec\xcf\xea\x85\x4a\x9b\x5e\
-\x80\xc1\xd4\x27\xec\x69\xe0\x02\xc8\x0a\x28\x90\xea\x85\x47\xd3\
-\x98\xc3\xb1\x7c\xa2\x79\x6a\xb6\xf9\x3c\xd9\x7b\x8a\xdd\x86\xd6\
-\xe9\xee\x8b\x42\x76\xb3\x7a\x2b\xc9\xeb\x6a\xe5\x0c\x5e\xe3\xc3\
-\x8c\xc3\x2b\x65\x49\xa7\xe2\xdb\xdf\x58\x39\x87\x06\x58\x8b\xad\
-\x3f\x70\xdf\x38\x1b\xb5\xe6\x3a\xfc\xb9\xed\xdd\xa4\xe9\x58\x7a\
-\x82\xeb\x1f\x4c\xb5\x21\x7d\x2e\x48\x80\xd4\x8b\x9c\x89\x6f\x26\
-\x08\x5e\x40\x47\x6a\x32\xa9\xcf\x21\x48\x13\xb6\xaf\xcb\xc6\xdb\
-\x59\x2f\x76\xe8\x4d\xc0\x8f\xa9\x64\xe9\xbb\x75\xd7\x51\x86\x5b\
-\x09\xa9\x55\xe6\xe4\xcc\x99\xc9\x5b\x8a\x48\x2a\x29\x58\xa9\x1e\
-\x18\xd9\xd7\xed\x51\x4c\x1b\xbc\xaf\x36\x5b\x4e\xcd\x91\xf8\x20\
-\x44\x62\x3b\xd1\xe3\xdf\x9f\x90\xd3\xdf\x60\x24\x06\x24\x45\x42\
-\x91\x43\xf4\x83\x99\xe1\x43\xb3\xba\x92\x3d\x9e\xdb\x6c\xbb\x6a\
-\xdd\xb8\xd1\x77\xdb\xfb\xd6\xf8\xec\x34\xa9\xf7\x29\x1a\x76\xde\
-\x95\xbf\x29\xf6\x52\x9f\xcb\x79\x28\x48\x40\x71\x55\x25\x29\x1c\
-\xa9\x80\x79\xd7\x85\x39\x7a\x09\x1e\xfe\xcc\xfd\x07\xbe\x9e\x18\
-\xce\xa7\xb0\x72\xaf\xbf\xd2\x47\x6f\x1c\x50\xe7\xc2\x94\x39\x50\
-\x54\x7e\xb8\xcb\x86\x24\xdb\xee\x11\x58\x9b\x06\x63\x2e\x47\x95\
-\x16\x53\x48\x79\x89\x0c\x3a\x92\x87\x1a\x75\xa7\x02\x90\xb4\x2d\
-\x26\x84\x10\x41\x18\x6e\x16\xb3\xd8\x9d\x1d\x6a\x7d\x9f\xff\x00\
-\x55\xd3\x46\xda\xe2\x69\x5b\x90\xaa\xd4\xb5\xa9\xd7\xec\xec\x46\
-\x12\x56\xa5\x2d\x59\xb8\x17\xc4\xf6\xe1\xcd\x6f\xe4\x0b\xcd\x1e\
-\xe9\xec\x35\xd6\x43\x72\xbf\x32\xc3\x33\x52\x5c\x15\x1d\xa7\x56\
-\xd2\x88\x5d\x9e\xeb\x6b\x31\x5f\x8d\xf7\x5e\x39\xa5\xd4\x39\x4e\
-\x4a\x14\xc3\x9b\x47\xb6\x1b\xa3\xbb\xbe\x63\xae\x36\x3b\x13\x9a\
-\xee\xed\xa7\x6e\x96\x6b\x86\xef\x5b\x9e\xd2\x61\xf7\x5b\x54\xf3\
-\x2a\xeb\x12\x7b\xf1\xa3\xb8\xa6\x0a\x54\x86\x5d\x4b\x88\x50\x19\
-\x82\x45\x6e\xfa\x37\xf7\x0b\xf2\xfb\x3e\x55\xc1\xab\x92\x50\x6e\
-\x7b\x7b\x68\x7b\x4b\x5f\xb4\xf4\x70\x95\xa1\xd6\xe7\x69\x7b\xdf\
-\x47\xe6\xd1\xe4\x8e\x91\xd4\xc2\xa8\x4f\xd4\xaa\x0a\x9d\x53\xe5\
-\xc7\x72\xe1\x5d\xaf\x96\xe8\xb1\xe4\x6a\xad\xbc\xbe\x24\x59\xf5\
-\xd6\x94\x72\x47\xfa\x59\xb9\xd9\x64\x2c\x2d\xe6\x82\xfe\x9f\xbf\
-\x1d\x4f\x30\x55\xf4\xf5\xf5\x02\x31\x51\xcf\xd1\x66\xb1\x41\x98\
-\xd3\x77\x8d\xc6\xdf\x8d\xbf\xb4\xc6\x80\xa7\x42\x17\x3a\x0e\x9f\
-\x4d\xc7\x53\x4e\x21\x35\xeb\x52\x23\x3b\x6e\x61\x44\x80\x42\x49\
-\x07\x1b\x73\xe5\x8f\xcd\xfe\xd4\xab\x42\xd8\x20\xdb\xf4\xee\x86\
-\xd0\x9b\xa3\xa0\x44\xab\xcc\x74\x39\x15\x88\xd6\xc8\xdf\xf3\x4b\
-\x33\xc7\xef\xb4\x87\x7a\x3a\xd7\x22\x20\x50\x49\x20\x06\x94\x4d\
-\x71\x6e\xd4\xfa\x13\x52\x5a\xf5\x3d\x86\xeb\x11\x99\xd0\x2e\x96\
-\xa9\x2d\xc9\x8b\x26\x34\x84\x05\xb6\xe3\x6e\x20\x90\x42\x92\x78\
-\x71\x18\xaf\x67\x8e\x2b\xc4\xfe\xa7\xe7\x81\xda\x72\xfd\x7e\x14\
-\xc7\x70\x24\x70\xcc\xe7\xdf\x82\x49\x14\xe1\x4a\xf0\xe1\xdc\x31\
-\x99\xe0\x47\x2a\x57\x3e\x5c\x31\x5a\xe4\x29\x90\xfd\x71\x51\x8a\
-\x53\x2e\xdf\x45\x3b\x33\x3e\xee\x18\x03\xb6\xb8\xe1\x90\xa9\xae\
-\x7c\x47\x67\x2c\x1e\x55\xcf\xd9\x8a\xf6\x67\x97\x77\xf4\xc5\x71\
-\x52\x0d\x06\x43\x2e\xce\xdc\x52\x9c\xb8\xd3\xbf\x1c\x01\x26\xbe\
-\x14\xca\x84\xfb\xb1\xf4\xf8\x11\xda\x70\x49\x35\x06\xb4\x39\xd7\
-\xbc\xd3\x00\xf0\xa5\x2a\x78\xe3\x3f\x77\xa0\xba\xfb\xad\xb2\xda\
-\x6b\xd4\xe3\x8b\x4a\x10\x90\x38\x95\x2d\x44\x25\x34\x1d\xb8\x96\
-\x37\x83\x7b\xf4\xac\x5b\xfc\x58\xae\x49\x6f\x45\x69\xa9\x5f\xf2\
-\xbd\x69\x2f\xa1\x0a\x52\x5a\x63\x4f\x58\x84\xd9\xa8\x53\xa5\x34\
-\x4a\x9d\x0d\xa0\x9c\xab\x84\x59\x7f\x6d\xcf\x22\x5a\xb6\xf9\x64\
-\x93\x30\xc2\x77\x76\x37\xbc\x2f\x4f\xd8\x62\xb2\xe2\xba\x59\x98\
-\xc5\xb5\xa9\x11\x21\x74\xa9\x95\x07\x6a\xa9\xce\xad\x20\xd1\x4c\
-\xd7\x2c\x5b\xf5\xcf\xee\x3f\xe7\x8b\x71\x35\x24\x27\xae\x8a\xbe\
-\x2b\x64\xb6\xba\x7c\x8b\x36\x8c\xb1\x25\xfa\x28\x59\x22\x3a\xca\
-\xe2\x5b\x12\xdc\x46\xc9\x6b\xef\x08\x4b\x71\x69\x26\xab\x27\x3c\
-\x43\x56\xd6\x6c\x76\x96\x45\xf2\x22\x1a\x3f\xf2\xad\x4b\x18\x6a\
-\x7d\x48\xb7\xda\x6c\x21\x4f\xa6\xe7\x78\x12\x9d\x8c\xb7\x29\x55\
-\x7d\x90\x80\x4e\x74\xc2\x5a\x61\x96\x99\x6d\x20\x04\xb6\xcb\x69\
-\x6d\xb4\x84\xf0\xe9\x42\x40\x4a\x40\x1d\x9e\x8f\x76\x04\x59\x76\
-\xb6\x2e\x17\x76\x37\xfb\x68\xa4\xe9\xb7\xdd\x71\x86\xd5\x6d\xba\
-\x37\x74\x99\xd5\x31\xb2\xf2\x92\x54\xa5\x41\xfb\xac\x94\xa3\x32\
-\x1c\x35\xc8\x1c\x79\x7a\x8f\x25\x08\x43\xed\x6d\x06\x81\x4b\xc9\
-\x40\x09\x48\x77\xfe\x37\x6f\xfb\x81\x29\x04\x84\xa7\xab\x90\x39\
-\x63\x87\x0c\xb2\xf7\xfe\xb8\xa7\x6f\x03\x4e\xcf\x9e\x58\x55\x32\
-\xee\xf0\xfe\x58\x1d\xf9\xe3\xb7\x1e\xdc\xbc\x72\xe1\x89\x13\xa7\
-\x49\x62\x1c\x38\xac\xad\xf9\x32\x64\xba\x86\x18\x61\x96\x92\x56\
-\xe3\xae\xba\xe1\x4a\x1b\x6d\x09\x04\x92\x4d\x00\xc2\x76\x86\x76\
-\xab\xd4\x5a\xba\x6b\x6e\x26\x3d\xc7\x55\xe8\x7b\x1a\xf5\x16\x8f\
-\xb6\xcd\x57\xdd\x0a\x86\xe5\xde\x2b\xbd\x32\xde\x69\x6d\x74\x2c\
-\xc7\x4b\xa8\x42\xcf\x49\x35\x0a\xa6\x9d\xd7\xfa\x17\x50\x41\x5d\
-\xbf\x51\xc3\x6e\x64\x7b\x64\xe9\xb0\x98\xbd\xc2\x43\xca\x50\x61\
-\x9b\x95\xb5\x32\x16\xf4\x39\x4e\x24\x05\x7d\xb5\x7d\x40\x11\x96\
-\x3e\x35\xf5\xe3\x8f\x70\xc1\xcb\xba\xbd\x95\x07\x1e\xef\x8f\xa0\
-\xcb\x54\x48\xca\x94\xa6\x8b\x0a\x92\x58\x68\xbe\x59\x26\xa5\xa2\
-\xe9\x49\x59\x6c\x9c\xfa\x6b\x4a\xe2\x2d\xcf\x73\xf4\x8c\x9d\xbd\
-\xdc\xfb\x62\x9f\x72\x06\xe9\xed\x8b\x56\xdb\x0e\xa5\x91\xf7\x5a\
-\x29\x11\xb5\x03\x6a\x84\xf4\x3b\xfc\x30\xea\x52\xba\x3a\x90\xf8\
-\xe9\xa2\x5c\x09\x2a\x06\xc3\xe6\x27\x62\xf7\x13\x55\xea\x0d\xa7\
-\xb7\x5d\xa0\xbb\xa5\x77\xf7\x45\xc3\x91\x6b\x8b\x0a\x5a\xdf\x2b\
-\x67\x4c\x6e\x3d\x89\x89\x52\xd8\x61\x72\x03\x65\x2a\x0e\xf5\x44\
-\x92\x95\xa9\x29\x27\xeb\xad\xf7\x63\xbc\xd4\x4f\xd0\xba\x1b\xcc\
-\x45\x9d\xcb\x78\xd1\x0a\xb5\xa2\x45\x9a\x0e\xe4\x5a\x53\x00\x22\
-\x72\xba\x65\xba\xec\x06\xf5\x1b\x72\xd9\x2e\x7d\x96\x94\xd8\x90\
-\x87\x08\x6d\xa1\xf6\x94\x4d\x79\x78\xd7\xd7\x8e\x3f\x6e\xbf\xdb\
-\xa5\x0a\x95\x25\xa7\xef\x97\xad\xd8\xdc\x08\x51\x1f\x53\x0e\xaa\
-\xc1\x75\x79\x9b\x1c\x34\x21\xc4\xa3\xfd\xb7\x13\x0a\xd7\x39\x45\
-\x5d\x5f\x4a\x55\x98\x23\x1a\x4f\x75\x3c\xbb\x6f\xc6\xb9\xd1\xec\
-\x58\x6f\x91\xae\xb2\xb4\x16\xba\xb7\xc2\xd5\x76\xb5\x32\x84\xa4\
-\xad\x8b\x6d\xf1\x0b\x85\x3e\x33\x8d\xaf\xa8\x23\xef\x36\xfa\x42\
-\x4d\x38\x8a\xe2\xd7\xb4\xfe\x67\xb6\x96\x76\x96\xd0\x30\xee\x51\
-\x2c\xda\x53\x7f\x74\x4b\x49\x9f\xa4\x66\xc5\x77\xad\xa8\xff\x00\
-\xf2\x88\x31\xc7\xe4\xdb\xa4\x92\x94\xd4\xf4\x29\x24\xa8\x9c\xb3\
-\xc4\x39\x9a\x32\xf1\x07\x55\xda\x67\x34\xd3\xd1\x6f\x56\x69\x71\
-\xe4\xc2\x79\xa7\x5b\x2e\xfd\xc5\x96\xdd\x51\x6d\x48\x49\x00\xa4\
-\x8e\xa0\x48\xcb\x0a\x4a\x54\x92\xb6\xfa\x7a\xd2\x0d\x4a\x6b\x9a\
-\x6a\x39\x54\x63\x80\xff\x00\x4d\x45\x7b\x7f\x96\x78\x0a\x3c\x4f\
-\x1f\x12\x72\xcb\x14\xe6\x73\x34\xec\x04\x7e\x98\x15\x19\x0f\xe9\
-\x4c\x1a\x9c\xce\x79\x76\x72\xf4\x65\x9e\x7e\x9e\x75\xa7\x2e\x20\
-\x73\xcf\x03\x3c\xa9\x98\xf1\x26\x99\x67\x9d\x70\x08\xe7\xf2\xec\
-\xc5\x07\x03\x96\x7d\xa7\xf4\xc5\x38\xd0\xd6\x83\x97\x11\xc7\xdb\
-\x8f\x65\x7d\x98\x3c\x78\xe5\xde\x31\x53\xdb\x5c\xb1\x9f\x8d\x7d\
-\x72\xc7\x5b\x8e\x21\xa4\x8f\xfb\x96\xb0\x80\x07\x7a\x94\x40\x18\
-\x7d\xdd\xdd\xf3\x0d\xb4\x5a\x01\x4c\x15\x25\xc8\x9a\x8b\x5d\x69\
-\xf8\x57\x0e\xb4\x02\x4b\x68\xb6\xaa\x71\x9c\xeb\x83\xa4\xfd\x29\
-\x6c\x9c\x7f\x8a\xda\xb7\x37\x1f\xcc\x7e\xa6\x72\x52\xa1\xb1\x69\
-\xda\x9d\x1d\x3d\xc8\xae\x3c\x92\x52\x0f\xf9\x5b\xe8\xb5\x46\x75\
-\xa5\xb9\x44\x82\xc8\x74\xe7\xc3\x85\x64\x59\x3c\x9d\x7e\xd9\x7a\
-\x8b\x49\xdb\x64\x29\x68\xb7\xeb\x2d\xdf\x6e\xf3\x21\x3f\x8e\xb5\
-\x16\x9b\x98\xf3\x2e\x35\xa6\x2d\x11\xbe\xbf\xa8\x27\xf2\x1f\xaa\
-\x08\x24\x00\x2a\x55\x3b\xcf\x37\x9e\x79\x9b\x4f\xb7\xd7\x81\x16\
-\x54\xcd\xa9\xd9\x47\x9c\xb5\xbe\xcc\x47\xd5\xf7\x25\x5a\x5e\x5d\
-\x8b\xfc\x55\xbd\x2f\x34\xca\xfe\xd7\x5b\xcf\x4e\x4f\x50\xe0\xa4\
-\xd7\xaa\x15\xe2\x2e\xda\x3b\xba\xfa\xd6\x33\x6d\x05\xeb\x5d\xde\
-\x98\x75\x8d\xdd\x4e\xb6\xe7\xde\x2f\x35\x1a\x53\x68\xb5\x47\x75\
-\x4f\x12\x7a\x92\xc0\x55\x0d\x2a\x46\x1a\xb6\xd8\x6d\x16\xdb\x3d\
-\xbd\x84\xa5\x2c\xc2\xb6\x42\x8f\x06\x2b\x49\x40\xe9\x42\x50\xcc\
-\x66\xdb\x6d\x21\x29\x00\x01\x4c\xa9\x8f\x97\x7e\x7e\xdc\x67\x8a\
-\x70\xc8\xe7\xf0\xc7\x7e\x60\xfc\x07\x3f\x46\xc0\xe9\x09\x12\xd7\
-\x16\x46\xab\xf3\x6b\xb6\x0c\x45\x52\x1f\x0d\x12\x9b\x7c\x2b\xfc\
-\x99\x24\x36\xa4\x2d\x12\x4a\x50\xa1\x44\x91\x40\x48\x57\x21\x8d\
-\xb1\xb3\xb4\x41\x6a\xd9\xa1\x34\xb4\x16\xa8\x80\xd8\x2d\xc6\xb2\
-\xc3\x69\x2a\x08\x19\x22\xa1\x35\xa0\xc5\x46\x5f\x2f\x76\x39\xe5\
-\xc3\xdb\xf2\xae\x0d\x33\xec\xed\x3e\xa3\xd3\x7e\xdc\x4d\xcb\xd5\
-\x36\x6d\x1b\xa3\x34\xd4\x27\x2e\x17\xbd\x43\x7e\x9a\xcc\x0b\x74\
-\x18\xad\xe4\x56\xec\x87\xd4\x94\xf5\xad\x64\x25\x09\x15\x52\xd4\
-\x40\x00\x93\x8d\x3f\xe4\xfb\xc8\xad\xae\x7e\xa2\xd9\x9d\xd0\x65\
-\x56\x3b\x84\x2d\x2f\x06\x4c\x7d\x69\xac\xed\xec\xbe\xb4\xdf\x2f\
-\x97\x6b\xd0\x90\xc8\xb1\x68\x74\xc5\x58\x0e\x21\x41\x9e\x96\xc2\
-\x94\xf2\xca\x4f\x42\x60\xe9\x49\x5b\x59\xa5\xb5\x86\xb1\xbe\xe9\
-\xc8\x70\xf5\xe6\xab\xd5\x16\xc8\xf7\xbb\x95\xce\x5b\xd1\x50\x67\
-\xc4\x86\xfc\xf4\x3e\xab\x75\xb5\xb9\x05\x41\xb4\x33\xd2\x4f\xfa\
-\x94\x4a\x89\x38\x99\x78\xf2\xbb\xb9\x5a\xc7\xcb\xa6\xb0\x32\xd3\
-\x73\x8e\x9b\x25\xc6\x64\xed\x36\xec\xe8\xe5\x2a\x86\x5c\x86\xa9\
-\x2d\xcd\x88\x23\xa9\x1f\x41\x65\xd0\x13\x53\x54\x90\x48\x2d\x6a\
-\xdd\xdc\x93\xa7\x7c\xd5\x6c\x95\x8d\x4c\xbd\xac\xa6\x5a\x21\x29\
-\x7a\xce\xc7\x68\x6d\x7f\x61\xc9\x16\xcf\xc2\x62\x35\xc1\xd6\xa3\
-\xb1\xd2\xeb\x8e\x3c\xcc\x9a\x00\x7a\x8a\x45\x54\x22\x4a\xdb\x0d\
-\x73\x6c\x5e\xa6\x55\xbd\xa9\xd7\x3d\x13\x71\x90\x88\x7a\x96\xd4\
-\x1c\xaa\x56\x87\x60\xbc\x50\xe3\xe1\xa7\x3e\x92\xa6\xfa\xd2\x0f\
-\x1c\x78\xfa\xd7\x03\xb8\x53\xb3\xd6\x87\xd1\x4f\x5e\xff\x00\x46\
-\xb3\xd9\xdd\xdd\xd2\xb6\xcd\x67\xa0\x35\xe5\x8e\x75\x83\x50\xd8\
-\xae\xd1\x9b\x90\xc4\x88\x73\x99\x5b\x2a\x75\x92\xe2\x54\xa8\xd3\
-\x63\x15\x7d\xc6\x1e\x41\x4b\x8c\xba\x94\xad\x04\x28\x03\x85\xea\
-\x0d\xb6\x5e\xb2\xb6\x6c\x2e\xa0\xd5\x4c\xea\x5d\x80\xdd\x48\x73\
-\xa4\xa5\xc6\x7f\xc6\xc9\x6a\xe9\x17\x4d\x5d\xaf\x16\xf5\x32\x63\
-\xea\x3d\x3d\x25\x14\x41\x57\xdb\x5a\xdb\xe9\x50\xc8\xf5\x2b\x57\
-\xdd\xbc\xc3\x46\x69\xfd\x73\xb3\xd7\xf8\x1a\x78\xeb\xc8\xb1\x15\
-\x1a\xdf\xab\x74\xf4\x8b\x51\x7e\x2c\x89\xf2\x00\x4b\x0b\xd4\x96\
-\xb7\x21\xba\x99\xbd\x21\x20\xa1\x6d\x2c\xfd\x4a\x51\x3e\x6e\xbc\
-\xe6\xda\xff\x00\xfe\xf7\x68\xbc\xbe\xe9\xf7\xb6\x7b\x6e\xee\xd2\
-\xe4\x2a\x64\x2f\xcf\xb2\x7d\xad\x35\xf9\xb6\x0c\xd4\xc2\x22\xdc\
-\x65\x45\x9d\x2b\xe8\xa5\x3a\xf3\xfa\x89\xc0\xc4\xdd\x3b\xab\x6c\
-\x76\xbd\x43\x64\xb8\xb2\xe4\x79\x96\xdb\xb4\x36\x27\x44\x7d\xa7\
-\x12\x52\xb4\xa9\xa9\x08\x5a\x6b\x43\x91\xe2\x39\x62\xeb\xbc\x9e\
-\x42\x77\x1a\xe1\xa4\x65\x49\x54\x9b\x95\xf3\x64\xf5\x4c\xc9\x37\
-\x8d\x0d\xa8\x64\xae\xae\x38\xd5\xb9\x13\x1f\x5a\xad\x65\xd0\x80\
-\x94\x21\x25\x21\x34\x01\x2a\x4a\x72\xc2\xf6\x4f\xcd\xee\x9b\xb8\
-\xf9\x5d\xdf\x2b\x58\x44\x59\xb1\xb5\xc3\x4e\x41\xd1\xba\x9a\x43\
-\x65\x6d\xae\xe1\xa7\x75\x13\xad\x88\xa6\x1b\xa1\xbe\xb4\x97\x96\
-\x10\x12\xac\x96\xae\x38\x89\x75\xb3\xcf\x89\x73\xb6\xce\x61\xa9\
-\x50\xa7\xc1\x90\xd4\x98\xb2\xa3\xbc\x80\xe3\x4f\xb1\x21\x95\x2d\
-\xb7\x1a\x71\x0b\x04\x10\x48\x20\xe0\x0f\x79\xfe\x55\xe3\xc7\x03\
-\x3a\x8e\x1e\xdc\xa9\x9f\x33\xe8\xcf\xba\x9d\xf5\xf4\x7c\xb1\x5c\
-\xcf\x70\xf4\x25\x0a\x75\x01\xc5\x27\xa9\x2d\xa9\x69\x4a\xd4\x9e\
-\x15\x09\x26\xa4\x0c\x75\xad\xe6\xd0\x81\xff\x00\x72\xdc\x4a\x52\
-\x3c\x4a\x88\x18\x52\x2e\xda\xcb\x4b\xdb\x56\x84\x15\xad\x13\xaf\
-\xd6\xb8\xaa\x42\x28\x6a\xa5\x25\xe9\x48\x20\x50\x7c\x30\xf3\x53\
-\xbc\xc0\x6c\xec\x47\x23\xaf\xa1\xe4\xbf\xb8\x7a\x59\xa2\xda\xc1\
-\x50\xe8\x5f\x5d\xcc\x74\xa8\x14\x9c\x8e\x3f\x3f\x56\x79\xad\xd8\
-\x9b\x4c\x7e\x94\xa8\x15\xee\x3e\x99\x92\xb7\x02\xfa\x8a\x7e\xd3\
-\x31\x27\xbe\xeb\xb5\xfb\x67\xfd\x29\x3c\x0f\x61\xc2\xe0\x3f\xe6\
-\x09\x8d\x61\x74\x4a\x52\xa6\xad\xfa\x1b\x4d\xea\x0d\x44\xa9\x3d\
-\x6c\xfd\xe4\x88\xb3\x23\xdb\xd1\x6e\x7c\xa9\x22\x83\xa5\xd3\x55\
-\x64\x33\x07\x0e\xdb\x36\xeb\xcb\xbf\x98\xdd\x6e\xf2\x1f\x75\xa6\
-\xa4\x1d\x37\x6d\xb4\xc3\x90\x86\xd2\x4f\xdc\x61\x66\x7c\xd7\x55\
-\x53\x4a\xa7\xa2\xa0\x1a\xf2\x38\xba\x33\xe5\xdb\xf6\xe1\xdd\x5d\
-\x57\x39\xa8\x61\x70\x64\x5f\x64\xde\x56\xc8\x97\xd2\x16\xea\x25\
-\x47\xb4\x69\xd5\xa4\x36\xdb\x66\xa0\x07\xc2\x94\x72\x1d\xb8\x97\
-\x76\xd0\xdb\x3d\xb5\x9e\x5f\xac\xb7\x96\x63\xff\x00\x8a\x6a\x7e\
-\x9f\x8d\x1e\xfd\x6b\x8e\xfb\x81\x2a\x79\xc5\x6a\xfb\x94\xf5\xb9\
-\x29\xa6\xd5\x55\x75\x30\x8e\x06\x89\xe1\x88\x6e\xf9\xa6\xfd\xc8\
-\xf5\x3e\x9a\xd3\xb2\x3e\xda\xae\xd6\x0d\xbd\xb8\x5c\xa0\xbe\xe2\
-\x1c\x88\x96\x9f\x65\x98\x5a\x7c\x69\xdb\x3b\x7f\x59\x57\xfa\xbe\
-\xea\x4d\x6b\x4c\x44\xd4\xdb\xb5\xaa\xb7\x7b\x7d\xb5\x13\x4f\x09\
-\x52\x9e\xd6\x3a\xa9\x71\xed\xd3\x1f\x53\x81\xd7\x0b\xb1\x61\x23\
-\xf2\x8a\x16\x52\x01\x05\xf3\x54\x81\x5c\xea\x4c\x48\xbb\x4b\xb0\
-\x9b\x6b\xa4\x1c\x88\x80\x96\xee\x30\xb4\xc5\xb5\xeb\xba\xca\x53\
-\xd1\xf7\x1d\xbb\xcb\x61\xfb\x8b\xce\x94\x8c\xd4\xa7\x09\x27\x01\
-\xb6\x18\x69\x84\x24\x50\x21\xa6\xd2\xda\x40\xe5\x44\xa4\x01\x81\
-\xc7\xdb\xd9\xea\x3d\x1d\xd9\x7c\x45\x71\x90\x27\xbc\x56\xa3\xd9\
-\xc3\x2c\x03\x5a\x8e\x1c\xbf\x4e\x35\xc1\xc8\xe5\x97\x78\xa9\xf0\
-\xc1\xa6\x5e\xb9\xe0\xd3\xb7\x23\x8f\xdb\x8f\x6d\x9d\x4b\x8b\x91\
-\xa9\x7c\xd4\xb5\x73\x62\x8e\xd1\xae\x9b\x45\xba\x1b\x0e\x75\x46\
-\xea\xff\x00\x79\x60\xdc\xc2\xaa\x52\x68\x12\x45\x47\x51\xae\x99\
-\x80\xa5\x75\xaa\x1d\x86\xd3\x18\xa8\x00\x9e\xa2\xcc\x16\x1b\xa8\
-\x48\xe0\x0f\x4f\xa0\xf7\xf8\x7f\x7c\x1e\x20\xf6\x76\xf7\x62\x83\
-\xc7\xe5\xc7\x1a\x87\x5e\x6b\x8b\xd4\x1d\x3b\xa4\xf4\xbd\xb6\x4d\
-\xde\xf9\x79\xb8\xbc\x96\x21\xc1\x81\x15\x05\xc7\x5e\x75\xc5\xf0\
-\xc8\x64\x38\xa8\x90\x06\x78\xd4\x9e\x5e\x34\x26\xb4\xb7\xe9\x2f\
-\x29\x9b\x55\xfe\x1e\xf7\xa8\x34\xdb\x77\x06\xd9\xd5\xbb\x90\xfb\
-\x52\x83\xad\x5c\x2e\x76\xa1\xff\x00\x96\x8b\x5b\xaf\xb6\x12\xc3\
-\x6b\x01\x0d\x00\x16\xbf\xac\x80\x9b\x15\x8b\x6e\xb6\xf3\x4a\xe9\
-\xd9\x56\x7b\x5a\x6d\xc8\xbb\x40\xb2\xc0\x6a\xf6\x63\xb8\x10\xb9\
-\x2c\x3d\x77\x4b\x1f\x9e\xf2\x1f\x79\x3d\x4b\x0a\x5d\x14\xac\xcf\
-\x01\x41\xd9\x5f\xeb\x4c\x65\xc8\x91\xe3\x87\xe1\xcb\x61\xa9\x11\
-\xa4\xb2\xb6\x5f\x8e\xfb\x69\x79\x97\x9a\x5a\x4a\x5c\x69\xc6\xd6\
-\x14\x85\xa1\x69\x34\x20\x8a\x53\x0b\xf3\x81\xe4\x02\x7b\x5b\x77\
-\xbc\x9a\x76\x62\x75\x25\xff\x00\x6d\xe1\xc8\x72\xd5\xa7\x75\x52\
-\xa0\x36\xa7\xa4\xbd\xa7\x1b\x86\x80\xd5\xae\xeb\x39\x08\xe9\x76\
-\x2f\x4f\xe3\x4a\xa9\xc9\x0a\x24\xab\x55\xe8\xad\xca\x36\xbd\x2d\
-\xbd\x5b\x4c\xf3\x16\x5d\xc3\xd1\x8e\xbe\xe3\x17\xe8\x73\x59\x71\
-\x70\xa5\xcd\x6e\xd9\x29\x2d\xcb\x7e\x3b\x52\xe3\xad\x2f\x25\x21\
-\x4e\x30\xac\x95\xc7\x0c\xcb\x86\xfb\x52\x63\x48\x40\x71\x97\x99\
-\x58\x5b\x6e\x21\x59\x85\x25\x49\x24\x10\x46\x3e\x58\x62\xcb\xaf\
-\xb7\x23\x47\xe9\x1b\xb4\xb8\xc9\x99\x1a\xdb\x7f\xbe\xdb\xed\x93\
-\x64\x45\x5b\xa5\x94\x3e\xd3\x12\xdf\x69\xc5\xb6\xb7\x87\x48\x20\
-\x50\xab\x2c\x44\xbb\x59\xa7\xc6\xb8\x5b\xa6\xb4\x1e\x8b\x2a\x2b\
-\xcd\xbe\xcb\xcd\xab\x82\xd0\xe3\x4a\x52\x54\x08\x1c\x8f\xa2\xfd\
-\xb0\x5e\x63\x34\x83\x3a\xa3\x47\xdd\x56\x89\xd6\xd9\x4d\x2c\x46\
-\xbd\xe9\x8b\xfc\x66\xdd\x45\xbf\x50\xe9\xfb\x88\x4a\x9c\x85\x73\
-\x82\xa7\x49\x49\xcd\x0b\x04\xa5\x69\x52\x09\x18\xbc\xe9\x8f\x2d\
-\x72\x6e\x3a\xac\xda\x6e\x12\xf4\x2c\x2d\x51\x2a\xc5\x06\x1d\xcc\
-\xff\x00\xcf\xdf\xbb\xb6\xdd\xe3\x54\x39\x67\x6d\xa6\xdf\x97\x6e\
-\x8c\xfa\x63\xb7\x2d\x7f\x59\x5a\x5b\xa9\xe0\x31\x6e\xdc\xad\xc4\
-\xff\x00\x1d\xa6\x2f\xbb\x9f\xa8\xef\x9b\x89\xab\x35\x15\xf5\xe8\
-\xb6\xc4\x7e\x0c\xc9\x0a\x54\x49\x37\x09\xd2\xd4\xd2\x63\x46\xa2\
-\x94\xa1\xf7\x14\x00\xea\xaf\x31\x85\x39\xa6\xf5\x0d\x9a\xfc\xda\
-\x1a\x65\xe5\x2e\xd3\x72\x89\x70\x40\x65\xf4\xf5\x32\xe9\x54\x57\
-\x5c\x4f\xdb\x75\x22\xa9\x3c\x0f\xa2\xa7\x80\xaf\xb2\x9f\xcf\x12\
-\x74\xde\xef\x6d\xe6\x9d\xd6\x11\x1f\x8b\x2a\x2b\x12\xe7\xdb\x98\
-\x37\x6b\x70\x96\xc2\xe3\x38\xf5\xae\xec\x84\x26\x7c\x09\x01\xa5\
-\x90\x95\xb4\xe2\x54\x93\x98\xcf\x0d\xeb\x6f\x21\x1b\xc3\x79\xde\
-\x2d\xab\x84\x1c\x54\xdf\x2d\x9b\xc1\x76\x45\xc1\x98\x56\xf6\xc1\
-\xfb\x70\x34\xa5\xe2\x4a\xa3\xa9\x0c\x45\x62\xa8\x61\xb0\xe3\x0e\
-\x24\x81\xd4\xa7\x05\x46\x2d\x3b\x6b\xe6\x73\x6e\xb5\xb7\x96\x2d\
-\xd7\x7d\x0e\xb1\x3e\x06\xb8\xb6\x48\x6b\x4a\x09\xd1\x5e\x4c\x77\
-\x12\xd6\xa0\x53\x4c\xb5\x1d\x0f\xac\x85\x37\xf7\x92\x84\x94\xa8\
-\x51\x47\x2a\xc7\xba\x58\x6e\xb6\xfb\xc5\xb6\x5a\x03\xb1\xe7\x5b\
-\xa5\xb1\x32\x33\xc8\x50\xfa\x54\xdb\xd1\xd6\xe2\x14\x08\xec\x38\
-\x1c\x6b\x5e\xc1\x4f\x0e\x58\xcf\x88\x35\xa0\x22\xb4\xa7\xf0\x73\
-\xcb\xdc\x7f\xb6\x24\xeb\x3d\xe0\xf3\x35\xe6\x0f\x45\xeb\xfd\x22\
-\x5c\xd0\x52\x18\xb7\x4c\xb9\xed\xdc\x2b\x24\xeb\x39\x5b\x73\x6d\
-\x46\xcb\x6a\x8d\x6c\xb4\xb3\x76\x2b\x6c\xae\x49\xfb\x7f\x79\xde\
-\x9e\xb5\x12\x00\x38\xd3\x5b\xe1\xe6\x8f\xf7\x04\xf3\x27\xa5\x23\
-\x6f\x3c\x53\xa8\xb4\xce\x92\x95\xad\xf5\x4c\x9b\x94\x7d\x2d\x2c\
-\x13\x6a\xbb\x3c\xe2\x2f\x51\xba\x5a\xbb\xb0\xa0\xf3\x6d\x82\x02\
-\x9a\x50\x50\xa0\x22\x91\x2e\x1b\xa1\xbf\xfb\xeb\xb9\xb7\x96\xc8\
-\x72\x64\xbb\x96\xa2\x54\x64\x4a\x79\x2e\xfd\xd4\x15\x28\xaa\x4c\
-\xb2\x84\x2b\x92\x9d\x55\x79\xf1\x38\x52\xe6\x37\xac\xee\x51\x15\
-\xd7\xf7\x23\x4a\xbb\x05\x2d\xf0\xb4\x94\x2d\xa7\xe4\xfd\xaf\xba\
-\x59\xae\x74\x4f\x49\xa9\x39\xd0\xe1\x31\x2f\x7b\x67\xa9\x35\x70\
-\x6d\xdf\xb8\x15\x7c\xd6\x17\x74\x84\xb6\x00\x4a\x23\x21\xa8\x0f\
-\x44\x40\x69\x00\x64\x48\x2b\xe0\x4a\x89\xcf\x16\xf8\xf6\x4f\x2b\
-\x1b\x69\x21\x76\xb9\x06\x4c\x49\x77\xcb\x51\xbe\xce\x43\xb4\xe9\
-\x05\xc9\x77\x57\x25\x3e\xf0\x48\x19\x05\x95\x52\x95\xe3\x88\xcc\
-\x69\x7d\xa0\xdb\x9b\x13\x71\x42\xbf\x1b\xfc\x6e\x90\xb1\xc5\x2c\
-\xd7\xe9\x57\x42\x9a\x84\x14\x0a\x80\xa1\xed\xc1\x45\xb2\xcf\x6b\
-\xb7\xa4\xd1\x25\x30\xe1\x45\x8c\x93\x4c\xbf\xd2\xcb\x68\x03\xdd\
-\x8a\x50\x24\x26\x99\x0c\xbf\xa6\x29\xcb\xb7\xbb\x97\xb7\x0a\xee\
-\x3c\xfd\xbf\x1c\x75\x7a\xf1\xa6\x0f\x3c\xc7\x3f\x1e\xdc\x12\x29\
-\x4a\x65\x9e\x75\xec\xf1\xcb\x15\xaf\xb3\x9f\x0a\x9f\x66\x33\x3e\
-\x1f\x23\xee\xc7\x51\xf6\x78\x7f\x52\x70\x7b\xb8\x0a\x9c\xb3\xe5\
-\xe1\x80\x78\x13\x5a\x92\x78\x8e\xde\xdc\x1a\x71\x20\x50\xf7\x1e\
-\x3e\x8f\xda\x53\x61\xe0\x5d\xe4\x33\x2b\x4e\xdf\x75\x16\xe5\x5c\
-\xa0\x20\x36\xb8\xcc\x42\x72\xf7\x6b\x09\x9e\xe2\x54\x95\x28\x3c\
-\xa6\xb4\xf3\x88\x46\x54\x34\x22\xb9\xd0\xb2\xcd\x6b\xf6\x99\x69\
-\xb0\x78\x7f\xfa\xd2\x94\x83\x96\x5c\x06\x29\xed\xf4\x1e\x35\xf1\
-\xf5\xae\x78\xaf\x0c\x58\xbc\x8c\xec\x3d\xc1\xd6\xb4\xde\x99\xba\
-\xd9\xb5\x6e\xff\x00\xeb\xa8\x71\xdb\xb8\xd9\xe2\xc6\xb3\xcf\x6e\
-\x52\x36\xf6\x4a\xbe\xa6\x13\x2a\x60\x42\x5c\x78\x28\x8a\x10\x94\
-\xd1\x55\x58\x1a\xcb\x75\x76\xf3\x6e\xec\x56\x4d\xcd\xdc\x78\x76\
-\xd8\x7a\xb3\x54\xc6\x8c\x53\x36\x4c\x0b\x6b\x69\x11\xad\xd1\x52\
-\xa5\xa9\x9b\x74\x42\xb0\x16\xe2\x18\x4b\x69\x71\x60\x15\x54\xa4\
-\x52\x9c\xf0\x46\x59\x67\x5f\xd4\x7b\x30\x0f\x51\xa7\x67\xcf\xe3\
-\x8a\x8a\x9e\x54\xae\x59\xf3\xee\xc1\xa8\xa8\x1c\x6b\xc0\xfb\xfb\
-\x71\xb2\x3f\xb8\x6f\x93\xad\x26\xc6\x81\x97\x7f\xd7\xb3\xe3\xee\
-\xfe\xa0\xd3\x3d\x50\xa3\xc9\xd6\x33\x7e\xdd\xc2\xdf\x3a\xf7\x0a\
-\x3b\x6a\x43\x8d\x6a\x60\xc3\x8d\xc9\x2a\x05\x0e\xa9\x0a\xeb\x04\
-\xa8\x9c\x4c\x46\x97\xda\x0d\xa4\xb9\x8b\xa6\x9e\xb7\xb5\x22\x3d\
-\xda\x3e\xa0\x62\xdd\x68\xd5\x8d\xb2\xa4\x5c\x2f\x36\xf6\x19\xb8\
-\x87\x3e\xdc\xd7\x28\xa7\x63\x54\xb1\xd6\x09\x41\xa1\x38\xd7\x9a\
-\x9f\x76\xb4\x5d\xaf\x47\xee\xbe\xd7\x6a\x68\xb6\xad\x40\x74\xc4\
-\x1b\x8c\x5d\x27\x7b\xb3\xde\x51\x31\xcb\x35\xca\xd7\xfe\x41\xc9\
-\x0a\x6e\x4a\x5c\xb7\xbe\xd3\xed\x07\x5c\xa1\x42\x55\xf4\xf5\xf4\
-\xa7\xf1\xb5\x7a\xa4\xd8\x75\x95\xba\x13\xf1\xf4\xde\xb3\xb7\x34\
-\xdb\xb3\x6d\x4b\x70\x75\x21\xa7\xd9\x59\x40\x9b\x6f\x53\xc1\x2a\
-\x5b\x25\x49\x04\x8a\xa4\xa5\x54\x50\x85\xb3\xbb\x6b\xe6\x32\x7b\
-\x7b\x5d\x7c\xd4\xa1\xfd\x03\xaa\x11\x21\xc3\xa5\x5d\x80\xdb\xe1\
-\x2d\x36\xe1\xbc\x31\x21\x36\xb0\xf8\x28\xfb\xf1\x8b\x8a\x43\x4a\
-\x51\x04\xa9\x00\xa8\xc7\xd5\x7e\x62\x3c\x8f\xc2\xdf\xbd\xbd\xb3\
-\xda\xad\xff\x00\x73\x5e\xed\xb4\x39\x72\x65\x5f\x98\x5b\x28\xff\
-\x00\xfb\x76\xa7\x69\x87\x2e\x76\xf7\xd4\xb4\xfd\x6e\x14\xc4\x4a\
-\x6a\x4f\xfa\x69\x4c\x5a\xb4\xf6\xfe\xed\x5e\xeb\xec\x5e\xa0\xb8\
-\xa9\x0d\x3d\xf9\xf6\xc4\xde\xed\x91\x1f\x15\xfb\xc9\x79\xc5\x37\
-\x6b\x9e\x3e\xc9\x04\x10\x96\x14\xae\x54\xad\x31\x7c\xdb\xa8\xda\
-\xeb\x69\x37\xff\x00\x6e\x75\x5c\x68\x09\xd4\x5a\x0a\xe3\x76\x82\
-\xec\xee\xb6\x9d\x62\xe5\x03\xf3\xec\x12\x5e\x8d\x79\xb6\xcf\x85\
-\x25\x94\x38\xdb\x81\x08\x5b\x6e\xa2\xa9\x50\x22\xb8\xdc\xcf\x27\
-\x5a\x4d\x6b\xda\x9d\x33\xa9\xf4\x53\x56\x5d\x27\x33\x47\x24\x5b\
-\x9b\xd3\xb7\x2b\x0a\xe3\xdc\x74\xca\xff\x00\x1e\x31\x6c\x49\xb6\
-\x33\x72\xb7\xb2\x24\x30\x48\xfb\xcc\x75\xa4\x90\x4d\x71\xbd\x3e\
-\x59\x77\xa7\x79\x6f\x31\x35\x56\xda\xcf\xb9\x6d\x9d\xe3\x49\xdc\
-\xe4\x96\xa2\x6a\xa6\x74\x4d\xc2\x7d\xb2\xd8\xfc\x68\xf3\xd6\x50\
-\x87\x12\xa0\x4a\x4a\x00\x59\x48\xfa\x49\x49\xa6\x12\xe3\x6b\x4b\
-\x88\x3c\xd2\xa0\xaa\xfb\x47\x3c\x65\x96\x64\xf1\xf8\x60\x92\x73\
-\xcc\x56\xb9\x77\x57\xba\xb8\xe1\x98\xa6\x43\x3a\xfc\xf1\x37\x48\
-\xee\xe6\xdf\xe9\xfd\x5f\x69\x98\x82\x92\x67\xc1\x68\x4e\x8c\xb2\
-\x08\x4b\xf0\xee\x2d\x06\xe6\xc4\x90\xd9\x35\x0a\x42\xd2\x41\xc3\
-\xfa\xdb\xc8\x37\x9b\x2d\x75\xa2\x22\x37\x3d\xfb\xb2\xb6\x83\x72\
-\x2e\x73\x75\x16\x8a\x7d\x2b\x49\x5b\xd6\xab\x7b\x8a\x2f\x26\x3c\
-\x59\x2b\x19\x07\x98\x75\x69\x51\xa8\x70\x62\xd5\xa3\x7c\xfd\x79\
-\x69\xd7\x1b\x6a\xf2\x66\xb1\x66\x73\x77\xf4\x94\x34\xde\x34\x05\
-\xe5\x64\xf4\x7f\x94\x6d\x84\x3e\xf3\xf1\x99\x70\x02\xb5\x21\x0e\
-\xbe\xb4\x8a\xfd\x38\x8f\xa9\xb6\x6f\x73\x74\xa6\xba\xb7\x3e\x84\
-\xac\x8b\x3d\xd6\x33\xd3\x63\x29\x48\x4a\xcb\x53\x2d\xe5\xc4\xcd\
-\x88\xf2\x12\xe0\xea\x4b\x88\x49\x15\x18\x19\x81\x4c\xcf\xbf\x86\
-\x29\xcb\xb7\xd9\x5f\x4e\xbd\xdb\xfd\xd3\xb2\xbf\x64\x81\xab\x3c\
-\xc3\x3f\xbc\xb7\x3d\x49\xa3\x2d\xd6\x5b\x4e\xaa\x7e\xf5\x06\x3f\
-\xf8\x99\x96\xf1\x7a\x93\x6c\x92\xf9\x83\x72\x69\x0a\x4b\xe4\x82\
-\xa3\x41\x43\x90\xc6\xdd\xec\x86\x89\x7e\xe3\x23\x49\xed\xa6\x99\
-\xb7\x69\x5b\x03\xd7\x79\x4a\x9b\x72\x5d\xb6\xd6\xc8\x62\x31\x99\
-\x29\x60\x17\x5e\xe8\x19\x90\x00\xec\x00\x50\x62\xb4\xa8\xe9\xaf\
-\x11\xc7\x9f\xc3\x15\x3d\xa0\x0f\x1c\x57\xb6\xb9\x7e\xbe\x07\x03\
-\xbb\x19\x9e\xdc\x65\x91\x34\x35\xf0\xa6\x63\xdf\x83\x5c\xcf\x02\
-\x73\xe2\x30\x42\x79\x70\xf1\x3c\x38\xf7\xe0\x0e\xda\x57\xd9\x9d\
-\x06\x58\x15\xe5\x5a\x0c\xb0\x13\x51\x5e\x23\xfa\xf7\xe0\x78\xd0\
-\x9e\x59\x73\xf6\x8c\x56\xa9\x3c\x32\xe3\x5e\x47\x8f\x0c\x11\xd9\
-\x98\xf7\xf6\xe2\x95\x14\xe3\x5f\x8d\x38\x62\xa6\x9c\x3b\xeb\xee\
-\xf0\xc0\xec\xcc\x8f\x1e\xcf\x86\x07\xff\x00\xe5\xdb\x4a\xd3\x07\
-\xb3\xf4\xc6\xd4\x47\xd3\x05\x6f\xa3\xcb\x2e\xc3\x5b\xd8\xd5\xeb\
-\x6f\xad\x6d\x45\x72\x77\xf9\x6d\x40\x0b\xae\x74\xa9\x96\x94\xb4\
-\xea\x08\xa8\x00\x1e\xa2\x6a\x39\xe4\x3c\x06\x00\xf6\x7c\xfd\x15\
-\xed\x3f\x2c\x6b\x2d\x6d\x1e\x4c\x01\xac\xe7\x42\x73\x4f\x6d\xe5\
-\xae\x71\x59\xff\x00\x33\xac\xee\xed\xae\x35\xa2\x23\x4c\x32\x7e\
-\xfb\xc9\x65\xd5\x7d\xd7\x3a\x7f\xd0\xd3\x6a\x51\x20\x02\x71\xa9\
-\xe6\xc0\x9a\xad\x5b\xb9\x77\x5d\xc9\xd4\x73\x77\x9b\x5d\xc9\x8c\
-\xb4\xbb\x7c\xd7\x93\x9e\x6e\xf3\x70\x88\xc4\xc7\x42\x95\x2a\x2d\
-\xad\x17\x34\x35\xfe\xda\x8b\x61\xc0\xa1\x91\x0a\x02\x80\x81\x4a\
-\x52\xbf\xcf\xb7\x02\xbe\xb5\x19\x60\x9c\xaa\x79\x7b\x46\x60\x60\
-\x03\xce\xb4\xcf\x3e\x38\xa5\x6b\x4c\x1e\x7c\xa9\x5c\xb8\xf1\xe5\
-\x9e\x35\x3e\xc7\xef\xd6\x89\xb6\xeb\xfd\xb4\xd5\xec\xb0\xcd\xf3\
-\x4e\xdd\x3e\xe2\x5a\x7f\xf1\x9f\x6e\x4c\x77\xd8\x93\x19\x6d\x4a\
-\x87\x29\x87\xda\x05\x0e\xb4\xb4\x2d\x3c\x8e\x67\x17\x28\x1a\x7b\
-\x65\xaf\xdb\x7f\x76\x92\x59\x72\x05\xf3\x4e\xeb\x4b\xf3\xcf\x5b\
-\x9c\x60\x64\x84\x42\xba\xc9\x9f\x0e\x44\x77\xb2\x0e\x25\xc4\xa8\
-\x91\xc0\x83\x9e\x13\xb2\xba\x0a\xc2\x99\xa8\xd3\x1a\xd7\x59\xad\
-\x28\x96\xd5\xba\xdb\x76\xd4\x56\xc1\x7d\x96\x8b\x44\xc7\x6e\x51\
-\xe3\x30\xd4\x97\xd5\x6a\x69\xa0\xd9\x78\x9a\x0a\x24\xa8\x71\xc3\
-\x0f\x3a\xc2\xe3\x38\xf3\x48\x5a\xe3\xba\x50\x56\xca\x94\x9a\xa9\
-\xa5\x94\x15\x21\x4a\x6c\xe4\x4a\x49\x19\x63\x51\x6d\x5e\xe8\xd9\
-\x18\xba\x59\x2f\x90\x9e\x61\x99\x69\x4a\x11\x72\xb3\xcc\x52\x6b\
-\x1a\xe7\x6a\x97\xd2\x5c\x8b\x32\x2b\xc1\x2b\x4a\x92\x73\x22\x86\
-\xa3\x2c\x59\x34\x5e\xe2\x4c\x77\x74\x7c\x9f\xea\xa9\xed\x5b\xe1\
-\x6a\x17\x22\x4a\x7d\xdd\x0a\xae\xb4\xb0\xdc\xa5\x7d\x86\x25\x18\
-\xcf\xbe\x82\x92\xe4\x55\x10\xcb\x94\x52\xdb\x29\x55\x52\xa8\xf7\
-\xcd\x41\xb5\x5b\x23\xbc\xf6\x79\xf1\x9c\x43\x77\x69\x3a\x67\x4e\
-\x5c\x2f\x16\xf5\x4a\x65\x4d\xbc\x94\x5c\x1a\x8c\x9b\xbd\xae\x6a\
-\x5b\x70\x82\x52\xb6\xdc\x49\xe0\x6b\x81\xae\x3c\x97\x6f\x9e\xe9\
-\xf9\x4d\xd6\x6c\xc9\x7a\x6b\x71\x6d\xb7\x7b\x86\xa4\xd3\x0b\x75\
-\x6a\x2e\xb6\xd4\x76\xd5\x3e\xdf\x78\x80\x10\xed\x28\xb3\x22\x47\
-\x48\xc8\x27\xb6\xd8\xbd\xbd\xd5\xd6\x3f\x3d\x7b\x45\x63\x6d\xe4\
-\x4a\x8c\xe2\xe3\xea\x0d\x42\xf5\xb9\x03\xfd\x94\x3f\x6e\xbc\x18\
-\x5a\xbc\x4c\x4b\x69\x00\x08\xce\xba\x84\xf0\xa9\x04\x50\xf9\xbf\
-\xdc\xed\xa8\xd6\x9e\x51\xb5\xd5\xda\x56\x99\x8d\xb8\x5a\x5e\x0e\
-\x9c\xb9\xd9\xe4\xb7\x72\xb3\xc0\xff\x00\x1f\x72\xb8\xc3\x83\x71\
-\x44\x43\x35\xc9\xee\x30\xd3\xaa\x25\x65\x75\xea\xfa\xf3\x27\x16\
-\xdd\x39\xab\xb7\x3b\x4a\x69\x1d\xdd\xd2\x71\x62\xd9\xaf\x36\x6d\
-\x45\x71\x8d\x64\x97\xa9\xa4\x35\xd6\xdb\x37\x5b\x53\x13\x1e\x02\
-\x4c\x99\x8c\x32\x16\xeb\x2d\xa9\x6b\x42\xaa\x69\x4c\x47\xb9\x59\
-\xa7\x46\xb8\xdb\xe5\xb7\xf7\x63\x4b\x8a\xea\x5e\x65\xe4\x1e\x0a\
-\x42\xd0\x48\x38\xa7\x2a\x01\xee\xc0\xf7\x7c\x28\x3b\xb0\x78\x76\
-\xf6\x56\xb5\xe1\xc7\x19\x53\x8f\x78\xa1\xe7\x4f\x76\x24\xe9\xfd\
-\x6d\xa6\x6c\x5a\xaa\xc9\x35\xa5\xb3\x2e\xd7\x7e\xb6\xc4\xba\x42\
-\x7d\xb7\x12\x52\xa4\xae\x3c\xc6\x9d\x6c\xd5\x27\x8d\x30\xfe\xba\
-\xf2\xc7\xad\x75\xaf\x95\x8d\xca\xfc\xe9\x37\x48\xb7\xad\xbf\xba\
-\xcf\x16\x33\x35\xe3\xd5\xf6\x9d\xb1\x7e\x63\x0d\xb5\x08\xaf\x22\
-\xd3\x4b\x42\x3a\x49\x1d\x38\x90\xdc\xad\x15\xa2\x7c\xef\x68\xc8\
-\x32\xd6\xeb\x37\x7b\x5c\xa6\xac\x3a\xcd\xbb\x33\x09\x48\x2d\xbd\
-\x6f\x69\xb8\xb2\x9f\x98\xa6\xc1\x23\xa5\xb9\x2a\x2b\xe6\x78\x61\
-\xcd\x0b\xe6\x3f\x6e\xb7\x27\xca\xe6\xbf\xb6\x49\x66\xd9\x7d\x83\
-\xaf\xec\x72\xdc\xb0\xc2\xba\xba\xe7\xda\x43\x69\xba\xb1\x1d\x32\
-\x51\x0d\xd3\xf5\x25\xe7\xa3\xb4\xdf\x47\xd4\x48\x14\x26\x2e\xa3\
-\xdb\xad\x75\xa5\xf5\x9d\x96\x62\x6b\x1e\xe1\xa7\xef\x50\x2e\x6c\
-\x39\x95\x4a\x42\xa3\x3e\xe5\x16\x9e\x69\x34\x23\x9e\x29\x51\x40\
-\x33\x35\xe7\x4f\x86\x78\x69\x95\x2b\xad\x67\xa9\x6b\x5f\x42\x5b\
-\x2a\x5b\x8a\x2a\x52\x94\x94\x00\x01\xcf\x3c\x0a\x64\x45\x3d\x69\
-\xe3\x81\x5c\xa9\xc2\x9e\xce\xec\x02\x7b\x4d\x45\x38\x9e\xdf\x6e\
-\x29\xcb\xd1\x4a\xf7\x1f\x5e\xd3\x8f\x97\xa0\xd4\x53\x3c\x88\xa6\
-\x7f\x3c\x0a\x1c\xc1\xcf\xb2\x9c\xf1\xff\x00\x68\x35\xf0\xc1\xa5\
-\x05\x68\x9a\x78\xd3\x00\x57\x32\x7c\x79\xe2\x87\x33\xc4\x00\x2b\
-\xdb\xfc\xb0\x6b\x41\xc2\x9d\x86\xbc\x3e\x58\x24\x9c\xb8\xd7\xb7\
-\x00\xf3\xe5\xd9\x4e\x55\xe7\x8c\xf2\xa1\xc8\x8a\x53\xbb\x2c\xf8\
-\x62\x83\x20\x7d\x48\xed\xe5\x89\x32\x5c\x20\x22\x33\x0f\x3e\xb5\
-\x28\x84\xa4\x25\x96\xd4\xe2\x89\x51\xa0\x00\x04\xf1\xc7\xee\x67\
-\xe7\x16\xf0\x99\x12\x11\x7b\xdd\xdb\xd6\x8b\xd3\x17\x19\x6a\x44\
-\x97\x1c\xb2\x31\x7f\x9e\xdc\x38\x8c\xcb\x47\x5a\x15\x1e\x0d\xbe\
-\xd2\xc3\x68\x4a\x5c\x29\x08\xa0\xa5\x00\xc7\xf3\xc7\x8e\x38\xd4\
-\xd4\x03\xeb\xec\xc6\x67\x21\xdb\x4c\xbd\xbc\xb1\x02\xc3\x63\xd3\
-\x3a\xb7\x71\x2d\x7e\x5e\xe2\xc0\xb5\xdb\xb4\xbe\x8a\x43\x17\x0b\
-\x86\xad\xdc\xbd\x77\x2d\x8b\x74\xbb\x5d\xba\xdf\x28\xfe\x0c\x99\
-\xb6\x7b\x6a\xdb\x4f\xdd\x55\x7e\xc1\x71\xd0\x69\x9e\x34\xbe\xdb\
-\x6d\xde\x9f\x91\xa6\xec\x71\x51\x2e\xf9\x26\xdf\x3a\x43\x93\x2e\
-\x26\xf9\xa9\x25\x3b\x7c\xbe\xc8\xb9\x4b\x75\xc7\x56\xfc\xd7\xee\
-\x93\x9d\x2b\x3d\x45\x29\x3f\x4a\x68\x90\x00\x03\x9d\x78\xf7\x73\
-\xc8\xe5\x82\x4e\x66\x86\x9d\xd8\xa7\x12\x06\x47\xf4\x18\x00\x91\
-\xdb\x4f\x1e\x1f\x1f\x4e\x79\x54\x65\xd9\x5c\xf3\xc1\xcc\x57\x31\
-\x95\x32\x38\xfa\x40\x4f\x31\x4c\xa8\xaa\xd7\x80\xa0\x39\xe1\x35\
-\x22\xa3\x8d\x32\xcf\x9e\x59\xf1\xf1\xc5\x31\x37\x4f\xea\x7b\x3d\
-\xba\xfb\x66\xb8\xb0\xe4\x79\xb6\xeb\x9c\x56\x65\xc4\x90\xcb\x88\
-\x28\x71\x0e\x32\xfa\x54\x85\x02\x95\x53\x31\x86\xb7\x73\xc8\xae\
-\xb8\x97\xb5\x7a\x9e\x0c\xc7\xae\x97\x4d\x00\xeb\xee\x3d\xa2\xf5\
-\x5b\x5d\x28\xfb\x96\x89\x50\x1c\x52\xa3\xb0\xc3\xc9\x6e\x89\xaa\
-\x4f\xdb\x24\xf4\x14\x56\xa0\xec\xa7\x99\x4d\x16\xee\xc5\x6f\x3c\
-\x45\x88\x96\xe8\xb7\xc9\x08\x6f\x4e\x6b\xa2\xc9\x2c\x3d\x37\x4f\
-\x5c\x9d\x08\x64\x3a\xf3\xc8\x25\x2c\x15\x28\xa8\x11\xd0\xa5\x67\
-\x4a\xa4\xa5\x5d\x41\x2a\xfa\x48\x35\x07\x81\xc8\x9c\xb1\x27\x4d\
-\x79\x84\xd9\x0d\xbc\xdd\x1b\x7c\x88\xef\x46\x4b\xda\x97\x4e\xc0\
-\x95\x75\x88\xd3\xc0\x87\x3f\xc7\xde\x92\xd2\x2e\xb6\xf5\x9a\xd7\
-\xa9\x97\x90\xa0\x73\xe3\x89\xfb\xc3\xe4\x5b\x53\x6e\x26\xcc\xeb\
-\xdb\x23\xef\xdf\x58\xd2\x91\xb5\x04\xdb\xdd\x92\x67\xd9\x09\x5b\
-\x56\x9b\x2a\x1f\x52\x2e\x50\x5c\x4a\x92\x54\xdf\x53\xce\x02\x78\
-\xd0\xd3\x1b\x9d\xa1\x7c\xbf\x79\xb2\x44\x09\x9b\x4a\x84\x85\xed\
-\xae\xe3\x5d\xdb\x7e\xe9\x75\x86\xea\x57\xf6\x84\x0b\x5e\xa1\x8d\
-\x3a\x03\x4f\x48\x76\x37\xdb\x2e\xaf\xa1\x08\x5a\x8e\x60\xe3\x4b\
-\x0f\xdc\x9f\xc9\xdc\xf4\x6d\x24\xcb\xb4\x6d\x39\x79\xdd\xbd\x0f\
-\x0d\x89\x33\x6d\x4e\xbc\xa6\xd9\x66\xef\x39\x36\x19\xb7\x4b\x34\
-\x94\xac\x85\x2d\x6d\x14\xc4\xea\x48\x3d\x0a\x52\xa8\x83\x60\xd5\
-\xda\x7e\x52\x66\x58\xf5\x25\x9e\xdd\x7d\xb4\xcb\x00\xa4\x49\xb7\
-\x5c\xe2\xb5\x32\x23\xc1\x0a\xa2\x93\xf7\x18\x74\x1a\x1a\x11\xcf\
-\x00\xd7\xb0\x8a\xfe\xb4\x03\x19\x65\x5e\x7d\x9d\xa4\xe0\xd0\x0a\
-\x9e\xdc\xf2\x1c\x3d\xb8\xa5\x07\x0c\xff\x00\xb6\x3d\xc3\x3e\xfc\
-\xb0\xfd\xb3\x76\x76\xab\x44\xeb\x86\x64\x30\xb8\xe5\xdb\xed\x86\
-\x04\xb9\x88\x6d\x60\x0f\xf6\x27\x29\x91\x2d\x95\x8a\x0e\x95\x25\
-\x60\x83\xc3\x0e\xeb\x0f\x2b\x3b\xd3\xba\x9e\x5a\x75\x9b\x6e\xbb\
-\x22\x0a\xb4\xd6\xa1\xb9\xcb\xd3\x8c\xa9\x4d\xb8\x12\xc1\xb6\x7e\
-\x64\x77\x84\x75\x29\x79\xff\x00\xba\x4d\x38\x62\x56\xc2\x9f\x32\
-\x7b\x75\x79\xd0\xfa\xa1\xb6\x6c\xc9\xdf\x95\xa5\xc1\xae\xf4\x84\
-\x38\x0f\xff\x00\x9b\x5d\xe1\xa4\x08\x31\xe5\xaa\x4d\xc5\xbb\x58\
-\xb6\x96\xc8\x7d\x5d\x33\x09\xeb\x07\xfd\xc4\x56\x99\xf0\xfe\xf8\
-\xf5\xa9\xa7\x8e\x78\xa5\x28\x48\xe3\xec\xf8\xe0\x82\x78\x53\xb3\
-\x9d\x49\x3e\x8f\x6e\x01\xcc\x77\x1f\xd4\x60\xd3\xdb\xdd\xc3\xb7\
-\x2a\x50\x7a\x28\x33\x00\x66\x2b\xcf\xf4\xc5\x39\xab\x9f\x7e\x08\
-\xe7\x51\xee\xed\xf7\xe3\xbf\xc3\x87\x67\xb7\x14\xa5\x15\xc7\x87\
-\x0e\x62\xb8\xae\x75\xce\x9e\xc0\x68\x3f\x9e\x28\x69\x41\xef\xe3\
-\x5f\xd7\x03\x2e\x3c\xbd\x7b\xf1\xc2\x94\x39\x0e\x75\xcf\xf9\xe3\
-\x81\xa5\x2a\x0f\x6f\xf2\xc2\x6a\x78\x0f\x8f\xf5\xc7\x9a\x1d\xea\
-\x9d\x70\x8b\x6d\x73\x46\x6d\x06\xb2\x91\x68\x7e\x64\x81\x15\xb7\
-\x35\x0d\xc2\xd3\x22\xd7\xa7\xa2\xa1\xc2\x0a\x8b\xd2\xaf\x33\x59\
-\x6d\x09\x48\x2b\x52\x94\x00\x04\x90\x31\x61\xdc\x4b\xc3\x2e\x31\
-\x7c\xdf\x3d\x63\x7f\xdc\x29\x8d\x2d\x82\xca\x5a\x62\x43\xc2\x23\
-\x09\x41\x51\x25\xd4\x2d\x6c\xb8\xb0\xae\x07\xaf\x2c\xbd\x14\xad\
-\x3b\xf0\x7b\xcd\x73\xe5\xee\xf1\xc6\xe8\x6e\xdb\xad\xb5\x2e\xe7\
-\xa7\x74\xdc\xc4\xe9\xab\x52\xdf\x0c\x2e\xf3\xaa\x6e\x08\xfc\x1d\
-\x3f\x6b\x69\x7d\x2b\x50\x72\x5d\xd2\x43\x49\xc9\x24\xf4\xd4\xd3\
-\x1a\x5b\x7b\xb7\x4e\xcc\xe4\x9d\xcf\xd5\xbf\x93\xab\xa5\xc9\xbc\
-\x25\xd7\x67\x22\xe9\xa8\x1d\x76\x7c\x89\xcf\xa6\x49\x58\xfb\xe1\
-\x72\x55\xf6\x8d\x2a\xd0\x25\x29\xa0\xcb\x03\xd7\x3e\x58\x24\x91\
-\xd8\x6b\x97\x13\x9f\x60\xe0\x31\xec\xe7\x90\xaf\x1f\x0a\xe0\x1a\
-\x0a\xd7\xb3\xe5\xe3\x80\x69\x99\x1f\x0f\xd4\xe2\x95\xf6\x7f\x5c\
-\x7b\xfd\x1e\x1f\xae\x7e\x8f\x5f\xd7\xd1\xc6\x94\xad\x7e\x15\xf8\
-\x60\x52\x94\xe6\x72\x02\xbd\xf8\x7b\x4b\x6a\xa8\xeb\xb3\xea\x4b\
-\x73\xed\x5d\x74\x9e\xb4\xb3\xd2\x25\xf2\xc3\x7b\x86\xaf\xbb\x0a\
-\x4b\x53\x19\x09\x7d\xc8\xe1\xe0\x3a\xdb\x26\x84\x1e\xda\x62\x17\
-\x93\xbf\x3d\xd0\xd9\xb1\x5e\x1b\x26\xd5\xb4\x5b\xf5\x26\x4a\x93\
-\xa6\xf7\x1a\xda\xcb\xa5\xab\x54\x0b\xd4\xf7\xc2\x58\x8d\x7d\x79\
-\x82\x94\xa1\xc5\x28\x07\x56\x0a\x14\x02\xca\x4a\xdb\x7d\x87\x10\
-\xeb\x2e\xa1\x2e\x36\xeb\x6a\x0b\x43\x88\x58\x0a\x4a\xd2\xa0\x48\
-\x52\x54\x93\x50\x46\x54\xc1\x42\x80\x50\x3c\x41\x15\xe5\xdf\x96\
-\x2d\x9e\x68\x7c\xa2\xdc\xdf\xd1\x7e\x62\xb4\x40\x43\xae\xdb\xe0\
-\x3a\xa8\xd6\x7d\xc5\xb2\xb5\x25\x32\xa6\x58\x6f\xf0\xd0\xb6\xe2\
-\xcd\x54\x84\x25\x41\x3f\x70\x51\x44\x8a\x9a\x84\x94\xdd\x74\x46\
-\xe5\x69\xcb\x46\x9d\xdd\xed\x38\xfd\xc3\x4c\xee\x8e\xcd\xea\xb6\
-\x23\xaa\x62\x67\xda\x1d\x10\x2e\x17\x38\x76\x6b\x9a\x4b\xd2\xec\
-\x12\xe4\x85\x7d\xb5\x94\x2b\xa0\xd5\x04\xd4\x54\xc2\xb4\x5a\x61\
-\xc7\x81\x6c\xb7\x45\x66\x14\x08\x31\x5b\x43\x31\x62\x44\x8e\xd8\
-\x69\x88\xec\x32\x80\x10\xdb\x2d\x36\x90\x94\xa4\x00\x00\xcb\x04\
-\x76\x71\x3d\xfc\x38\x77\xe2\x80\xe6\x33\xa5\x39\x76\x67\xe3\x81\
-\x5e\xcf\x76\x2a\x29\x5a\x57\xd9\x9f\xf2\xc0\x57\x7d\x28\x3b\x38\
-\xf3\xc5\x2b\x92\x4d\x6b\xcc\xe7\x96\x7c\x31\x4e\x67\x85\x7d\x79\
-\x60\x0a\x67\xc3\xc7\x2f\xf5\x76\xfa\x7b\xa8\x6a\x7b\x32\xe5\x9e\
-\x29\xdd\xed\xf6\xfa\x47\xaf\xaf\x0c\x73\xe3\x81\x42\x46\x5c\x8e\
-\x58\xce\x84\x1c\xbb\xf8\x57\xf4\xc0\x1c\x7b\xc8\x06\x9d\x87\xc7\
-\xd1\x95\x07\xcb\x15\x22\x86\xb4\x39\x71\xc0\xa7\x01\x51\xf1\x1f\
-\xcb\x04\xd3\x2c\xeb\x96\x7c\x78\xd7\xd9\x81\x4f\x0a\x7b\xce\x0e\
-\x55\xe1\x90\xe7\xee\xc5\x39\x10\x29\xcb\xf9\x76\x63\x86\x7c\x7d\
-\xdd\xbd\xd8\xf2\xaf\xe4\x36\xc3\x73\xb9\x35\xaa\xbc\xd3\xef\x5d\
-\x9d\xf9\xb6\xa8\x29\x4f\xe2\xdd\x74\xae\x91\x91\x1d\xb9\x10\xef\
-\x0e\x9a\xa9\x10\x9e\xba\xdd\x58\x70\x24\x0f\xa9\x51\xc9\x39\x27\
-\x1b\x51\xb3\x96\x26\x9a\x66\xdd\xa0\x34\x4d\x87\x4f\x36\x19\x4f\
-\x4a\x16\xec\x28\x0c\xa2\x4b\xa0\x1a\x93\xf7\x64\x75\x2b\x32\x4e\
-\x78\x15\xe1\xc3\x80\xae\x5f\xdf\x14\xe6\x48\xc1\xcf\x20\x33\x3c\
-\xb0\x3c\xbb\xed\xa5\xe1\x16\xdd\x11\xb4\x96\xd7\xb5\x35\xcf\x57\
-\x21\x4e\x4a\xb4\xc5\xdd\x78\x85\xf6\x6d\x76\xfb\x94\x76\x28\xd4\
-\xa4\xda\xd2\xe2\x55\xf6\x9c\x55\x3a\x94\x55\x42\x40\xa6\xda\x68\
-\xdd\xc3\xd4\x10\xb5\x66\xb9\xd3\x3a\x32\xc1\x65\xd5\x5a\x92\xdf\
-\x01\x16\xc8\x37\xab\xe5\xbe\xdc\xcc\x6b\x85\xc6\x2d\xbd\xb2\x51\
-\x15\x89\x12\x10\xa5\x25\x03\x80\x38\x14\xe2\x47\xaf\xba\xb8\xf1\
-\xa5\x7b\xe9\xdd\x8a\x1e\x3d\x87\x1c\x7c\x06\x2b\xeb\x4e\xfc\x53\
-\x2e\x19\xf6\xf7\x63\x2e\xdf\xef\xfc\x79\x63\x2c\x8d\x6b\x5c\x5d\
-\xf4\x06\xb4\xb6\xc2\x37\x15\xc7\x71\xed\x39\xa8\x57\x11\x87\x2e\
-\x36\x0b\xb3\x68\x52\xa1\xcc\x87\x25\x68\x2f\x34\x94\x3d\x42\xae\
-\x92\x2a\x2b\x89\x7f\xb7\x37\x9d\xe6\xd7\x64\xdc\xcd\x3a\xdb\x89\
-\xd8\xed\xcd\x9c\xe3\xdf\xe1\xb7\x5b\x47\x30\xb7\x53\x6d\x8e\x2e\
-\x72\x8f\xda\x76\xec\xc4\x36\x82\x5b\x52\x9c\x2e\x3d\xd2\x50\xa0\
-\x16\x9a\xac\x10\x42\x81\x19\x11\xc2\x94\xc8\x8a\x71\xcb\x02\xa2\
-\xa0\xf6\xd3\xc3\x03\xcd\x87\x93\x57\x99\xd1\x1e\x6a\xf4\x74\x96\
-\x6e\xaa\x76\x2c\xf7\xad\x51\x35\xbd\xae\x23\x6a\x13\x6d\x32\x5b\
-\x6b\xaa\x0b\xb3\xe4\x36\x01\x48\x7d\xb5\x34\xf9\x48\x43\x99\x1a\
-\x8b\xce\xd6\xee\xbd\x8f\xff\x00\x53\xf9\x98\xdb\x97\x11\x6b\xd6\
-\xfb\x73\x7a\x71\x50\xa5\x5d\x0c\x74\x86\x8e\xa0\xb1\x33\x31\x2c\
-\x3b\x26\x24\xa7\x10\xa5\x38\xda\x02\xcb\x0a\x34\xaa\x92\x52\xb5\
-\x71\xcf\xb6\x95\xf0\xf1\xcb\x00\xfb\x79\x71\xed\xe0\x33\xf4\xfa\
-\xd6\xbd\xb5\xed\xa6\x33\xce\xa4\xd7\xbe\xb8\x24\x1c\xf8\x57\xb3\
-\xbb\xd0\x69\x5f\x0e\xce\xec\x73\xc1\xa7\xa0\x83\xe2\x3c\x31\x98\
-\xa7\xc7\x2f\x45\x31\xd2\x91\x9d\x3d\x83\x14\xe2\x69\x81\x40\x07\
-\x77\x66\x5f\xcf\x14\x39\x90\x73\xf9\x8f\x40\x06\xa0\x9c\xb2\xf8\
-\x1c\xb0\x7d\xb9\xf3\x3c\xfd\xf8\x3d\xb4\xa6\x7c\x0f\x31\xe3\x80\
-\x93\x52\x7b\x47\x0f\x6f\x76\x78\xa0\x34\x14\xcc\x8f\x6e\x2b\x9f\
-\x31\xc6\x9c\xff\x00\x5c\x12\x78\xf8\x70\x03\x1e\x4b\x34\xcd\xe2\
-\xe0\xda\x74\xb6\xc6\x6d\x64\x2b\xcd\xcc\xca\x09\x93\x6d\x87\x7b\
-\xba\xdf\x2e\xd7\x64\xfd\xc4\xa4\x9f\xc4\x79\xe6\x44\x50\x7e\xe5\
-\x2a\x14\x93\xc3\x3c\x36\x5b\x35\x6d\x48\x41\x41\x1c\x0a\x4a\x41\
-\x49\x14\xca\x9d\x27\x14\xef\xa7\xa1\x7a\x5f\x49\xb9\x2e\xeb\xbc\
-\xfb\x9c\xf3\x5a\x47\x6f\xac\x16\x36\x8c\xdb\xcc\x59\x77\x87\x3f\
-\x09\xcd\x42\xb8\xad\xa1\xd5\xb7\x1a\xd4\x87\x0b\x89\x52\xd2\x10\
-\xb7\x12\x13\x5a\x9c\x47\x7b\x57\xea\x03\x72\xbc\x6a\x88\x42\xf9\
-\xaa\x9e\x75\x86\x97\x3f\x51\x6a\x5b\xa3\x82\x53\xd7\x7b\xa4\x87\
-\x42\xa6\x35\x32\x3b\x47\xed\xa9\x3d\x6a\x0e\x28\x92\x78\x01\x83\
-\xdd\xc3\xbf\xc3\x02\x94\x19\x01\x5f\x0e\x7e\xdc\x71\xe1\xf1\xcb\
-\xdd\x5a\xe3\xbf\xbb\xbc\xe5\xee\xc5\x08\xe1\x5a\x1e\xee\x78\x3c\
-\x72\xf5\xcb\x15\xe7\x4e\x3d\x98\xcf\x8f\xf0\x7b\xbd\x1d\xb9\x92\
-\x3b\xab\xfc\x13\xed\x56\x99\x7f\xf0\xed\xeb\xd2\x0d\xae\xff\x00\
-\xb4\x5b\x95\x6e\x42\x23\x5f\x34\xee\xa6\x81\xd3\x32\x14\x5f\xf2\
-\x4d\xa4\x4b\x6e\xd9\x3e\x54\x76\xd0\xf2\x52\xa1\x4a\x05\x8a\x29\
-\x20\xe3\x5f\x79\x45\xf3\x64\xe3\xf6\x6f\x36\x5e\x5e\xae\xb2\x74\
-\xf5\xe9\x8b\xbc\x76\xe0\xcf\xd6\x1a\x76\x02\xc4\x68\xd7\x9f\xa0\
-\x88\xf2\xee\x11\xa8\x9f\xba\xb6\xbe\x97\xd9\x71\xa7\xc0\x21\xca\
-\xe0\x73\xfe\x98\x39\x64\xaa\x83\xcf\x2c\xeb\xcb\x16\x9d\xf1\xd8\
-\xdd\x49\x3b\x68\xbc\xcf\x6d\xcb\x6f\x5c\x74\xae\xb1\xd3\x3f\x6a\
-\xdc\xe6\xa8\x76\x22\x4c\x88\x56\x7d\x40\xfb\x29\x43\xce\xff\x00\
-\xe4\xa0\x06\xde\x2a\x25\x29\x52\x92\xa0\x52\xac\xa1\x79\x3d\xf3\
-\xe7\x65\x7f\x67\x3c\xd3\x58\x58\x62\xdf\x1a\xf7\x7a\x88\xdd\xb3\
-\x48\xee\x30\x41\xfc\x78\xb2\xa3\x5c\x53\xd1\x6d\x85\x7b\x9e\x10\
-\x08\x6d\x0a\x11\xe5\x28\x92\xc1\xcf\xa1\x29\x5b\x6e\x25\xc6\xd6\
-\x94\xa9\xb5\xb6\xa0\xa4\xad\x2a\x15\x04\x29\x26\x8a\x49\x18\xc8\
-\xd5\x54\xe4\x6b\xcc\x13\x5c\xb0\x01\xe3\x4e\x1f\xaf\x0c\x13\xc6\
-\xa7\xd7\xe7\x83\xcf\x3f\x9f\x1f\x41\x34\x39\x90\x0f\xb3\x2a\xe2\
-\x9c\xe9\x5f\xe0\xcf\x33\xcc\x8e\xec\x71\xaf\x7f\xf6\xa7\xf0\x77\
-\xf2\xf4\x54\x73\xfe\xdf\xa7\xa3\xa8\x71\x00\xfb\x3b\xe9\xcf\x19\
-\x9a\xe3\x9e\x7e\xec\xb1\xff\x00\xf1\xa6\x7d\xa7\xc2\x98\xaf\x23\
-\x4f\x81\x38\x35\x35\xe0\x78\xd6\x95\xae\x29\xd9\x8f\x35\x9a\xd7\
-\x5f\xed\x7e\xbc\x87\xb4\xf6\xbf\xf8\x1d\xe2\xd5\xa9\xee\x91\x6f\
-\x10\xf4\x9d\xe7\x4b\x5a\x2d\xd6\x96\xad\x86\xcb\x7f\xfc\x74\x5b\
-\x6e\x02\x4c\xd8\x68\xac\x56\x9e\x52\x81\x6d\xc4\xaa\x9f\x6d\x69\
-\x09\x4a\x45\x12\x84\x84\x24\x76\x25\x23\xa4\x67\x97\x00\x31\x51\
-\xc4\x9a\x77\x91\xdd\xed\xc6\xa7\xdc\x2d\x5b\x3d\xa8\x36\x8d\x37\
-\x69\x9b\x72\x73\xad\x55\x7a\x53\x91\xa3\xb8\xeb\x50\xe2\x32\x2a\
-\xe4\x89\x52\x56\x80\x84\x21\x20\xa9\x44\xd3\x0f\xf9\xee\xde\xc8\
-\xb2\xae\x1a\xa3\x56\x35\x22\x3e\x80\xb0\x5c\xe1\xbb\x02\x1e\x91\
-\xd2\xec\xc9\x79\x56\xb6\x23\x5b\xa4\xa9\x65\xc5\x36\xcb\x99\x3a\
-\x40\x2a\x59\x52\xc0\x1d\x6a\xc2\x52\x94\x84\xa1\x23\xa4\x04\x8a\
-\x04\x8e\x40\x01\xcb\x1d\xb5\x27\xc4\x03\xd9\xe1\x8a\x0c\xbc\x3d\
-\x79\xe2\x9d\xd5\xf8\xe3\xf4\xed\xfe\x0a\xff\x00\x1d\x73\xf0\xe5\
-\xfd\xfd\x3c\xb8\x53\xc7\x1a\x23\xf7\x41\xf2\xd5\x02\x4c\xbd\xc1\
-\xd9\x67\x6d\xb2\x77\x6b\x42\xd9\xe0\x2d\x6e\x6b\xcd\x1d\x05\x66\
-\x1c\xeb\x93\xbf\x84\x81\x25\xf7\xa1\x58\xe4\x3a\xd4\x9a\x85\x95\
-\x46\x09\x50\xa7\xda\xfa\xb4\x3e\xf6\x6d\xe4\xd4\xbd\x66\xd5\xd6\
-\x98\xf2\xe4\xc0\x5b\x8d\x99\xf6\x2b\xb2\x50\x11\x72\xb2\xdc\xda\
-\x6d\x4a\xfb\x13\xad\xd2\xc2\x9b\x5a\x6b\x43\x40\x45\x41\x07\x00\
-\x56\xb5\x3d\xfd\xff\x00\x2a\x60\x8a\x70\x34\xa5\x78\xe5\x4a\x9c\
-\x86\x1f\xd3\x7a\x99\x27\x49\x6e\x05\xae\xb2\xf4\x46\xe7\xd9\x23\
-\xb6\x8d\x43\xa6\xae\xcd\x02\xa8\xce\x38\xeb\x65\x87\xae\x36\xc2\
-\xe8\x05\xc8\xcb\x70\x25\x5c\x52\x52\xb0\x95\x0b\x5f\x95\xef\x3f\
-\x16\xbb\xf6\xb9\xda\x68\x8f\xfe\x26\xda\x79\xa5\x86\xeb\xb7\x36\
-\x25\x58\x94\xf3\x6d\x45\x8b\xa9\x9b\x75\x2a\x92\x51\x6b\x43\x89\
-\x42\xd4\xb5\x99\x2d\x0c\xa8\xe2\x07\x5e\x2d\xba\xdb\x40\x5f\xed\
-\x9a\xa3\x4b\x5e\x18\x6e\x4d\xaa\xfb\x67\x94\xd4\xdb\x6d\xc2\x3b\
-\x80\x28\x39\x1e\x43\x4a\x52\x16\x12\x7e\x93\xcc\x10\x41\xa6\x2a\
-\x06\x7d\x9e\xbd\xb8\xa7\x3a\xf0\x3c\x89\x15\xe5\xcb\x03\x3e\x00\
-\x8e\x79\x9e\xfc\x67\x97\x6f\xa9\xc5\x71\x90\xaf\xaf\xbf\xf8\x3f\
-\xaf\x6f\xf5\xc0\x1c\x3f\x84\x01\xc3\x9f\xcf\xd1\x5e\x39\x7c\xb8\
-\xe0\x8e\xce\x38\xa5\x3b\x87\x67\xcf\x9e\x28\x4f\x78\xa7\x79\x3c\
-\x72\xf4\x1a\x65\x4e\x1d\xf4\xfe\x78\x06\x94\xfe\x99\x0c\x64\x38\
-\x93\x5a\x78\x9c\xfd\xe3\x05\x5d\x28\x0b\xe9\x09\x2a\x09\x1d\x45\
-\x20\xe4\x0a\xa9\x5a\x0a\xe0\x24\x76\x71\x3e\xef\xd7\x12\x25\xc9\
-\x70\x33\x1e\x2b\x0e\xc8\x90\xea\xd4\x02\x1b\x65\x94\x17\x1d\x5a\
-\x89\x00\x24\x25\x29\x24\xe2\xc7\x63\x72\x26\xa1\x85\xe5\x27\x6d\
-\xf5\x1d\xc6\x0d\x9d\xfb\x1b\x52\x4c\x7d\x63\xaa\xec\x61\x2b\x93\
-\x70\xd4\x6f\x24\xa1\xa6\xed\xa6\x43\x2e\x36\xcf\x57\xd2\x13\xda\
-\x5c\x14\xb7\xd9\x6d\x71\x9b\x8b\x6f\xb6\xc6\x6a\x2c\x58\xec\xa0\
-\x21\xa6\x5a\x69\x21\x08\x43\x68\x48\x01\x29\x01\x34\xcb\x09\xcb\
-\xfe\xec\xcf\xe9\xee\x38\xad\x29\x4e\x5e\xda\x60\xf3\xae\x75\xec\
-\xe3\x82\x39\x8c\x1c\xa9\x4f\x8e\x3f\xa7\xeb\xc3\xfe\xb4\xeb\x75\
-\xc2\x33\x52\xe0\xcf\x8c\xf4\x49\x71\x64\x21\x2e\x33\x22\x34\x86\
-\xd4\xd3\xec\xba\xda\xc1\x42\xdb\x71\xb5\x90\x41\x14\x38\x72\xcf\
-\x7c\x75\xdb\x97\x90\x0f\x34\xba\xba\xeb\x76\x8d\x72\x28\x7c\x45\
-\xda\x8d\x63\x72\x90\x95\x37\x0d\x24\x05\x45\x87\x1a\x31\x75\x20\
-\xa0\x94\x07\x62\x55\x43\xea\x68\x83\x6e\xbd\xd8\xa7\x47\xb9\x5a\
-\xae\xd0\x23\x5c\xad\xf3\xe2\x38\x97\xa3\x4b\x85\x31\xb4\xbc\xc4\
-\x86\x1e\x41\x28\x71\x0e\x36\xa0\x45\x31\xde\x4f\x0f\x5e\xec\x2b\
-\x9f\x10\x2b\xeb\xc3\x3c\x6a\x1d\xab\xdd\x9d\x35\x13\x51\x69\x7d\
-\x41\x11\xc8\xce\xa5\xd4\x04\x4e\x80\xf1\x4f\xfb\x33\xed\x73\x40\
-\xfb\xf0\x27\xc5\x70\x05\x36\xe2\x08\x20\x8c\x49\xd4\xdb\x75\x2b\
-\x54\xf9\x8f\xf2\x21\x36\xe2\xe4\xad\x47\xa7\xa6\xce\x54\x9d\x43\
-\xb6\x91\xe7\xce\xeb\x91\x39\x30\x50\xcb\x8a\x8e\xf4\x74\x39\x5f\
-\xca\x66\x91\x5f\xa1\xfb\xc8\x69\x44\x2c\xd9\x77\x27\x68\xb5\x6d\
-\xb7\x50\xda\x2e\xb1\x19\x76\x4c\x36\x65\x30\xab\xb5\x96\x5a\x9b\
-\x42\xde\xb6\xde\x60\x25\xc3\x22\x04\xe6\x14\xaa\x29\x0b\x02\xbc\
-\x45\x41\x07\x19\x54\x73\xf6\xf7\x7b\xb0\x3c\x6a\x7d\x98\xee\xf5\
-\xcc\x63\xa6\x99\xf6\x72\xa7\x0e\x3e\x18\xec\xa7\xbb\x87\x3e\xdc\
-\x66\x6b\xc3\x80\xe7\xfc\x7d\xdf\xdf\x1c\x69\xdf\x8e\xfe\x15\xf5\
-\xef\xf4\xd2\xb5\x35\xec\xa6\x39\xfb\x3d\xdf\x0c\x1f\xaa\xa4\x7f\
-\xa7\x97\x11\xf1\xc5\x6b\x90\x1c\x38\x67\xed\xa6\x38\xe3\xfd\x54\
-\xe5\xc3\x9d\x2b\x5c\x57\xa8\x7b\xbb\x49\xe3\x4a\xd3\x03\x3a\x1a\
-\x1a\x9f\x1c\xe9\x80\x09\xed\xcc\x8a\xd7\xe3\x85\xe9\x2d\x3b\x75\
-\x5d\xbb\x70\x77\x96\xf3\x17\x6d\xf4\x67\xe3\x74\xaa\x6a\x64\x5d\
-\x42\x97\x74\x96\xca\x3a\x82\x93\xf8\xb6\xa6\x9d\x21\x7c\x10\xb2\
-\x92\x7b\x0e\x83\xd3\x46\xd5\x0a\xdd\x76\x6a\xd6\x99\x77\x7f\xc6\
-\xfb\x6b\xfb\x97\x29\xc4\xc8\x94\xf2\xdf\x42\x10\x5c\x5b\x8b\x74\
-\x92\x68\x33\x3c\x31\x96\x64\xe6\x3d\xb4\xc1\x55\x4d\x0e\x74\xf1\
-\xc6\x46\x98\xe0\x47\x8e\x2b\xef\xc6\x7f\xfc\x0d\x47\xb4\x7b\xbb\
-\xa6\x20\x6a\x7d\x29\xa8\xa2\x38\xd2\xd9\x96\xca\x17\x22\xdd\x2d\
-\x23\xaa\x2d\xd2\xd9\x24\x8f\xbb\x0a\xe1\x09\xe0\x16\xd3\xad\x94\
-\xad\x2a\x19\x1c\x5b\x7c\xbb\x79\x81\x85\x7b\xd6\x7e\x4f\x2f\xb3\
-\x22\xda\xf6\x73\x7b\x58\x8b\x32\x72\x76\xf5\x32\x64\x25\x88\xb6\
-\x0d\x67\x34\xfd\xff\x00\xc6\xb7\xb6\xa7\x52\x9f\xb8\xea\x92\x96\
-\xc6\x69\x3d\x00\x84\xc4\xbb\xd9\x2e\x50\xae\xd6\xb9\xcc\xb7\x22\
-\x24\xfb\x7c\x96\x65\xc4\x90\xcb\x89\x0b\x4b\x8d\x3e\xca\xd6\xda\
-\xd2\x42\x87\x03\x8a\x83\x91\xcc\xf0\xe3\x90\xa6\x5c\xf1\x53\xc3\
-\x2f\x89\xa7\xbf\x13\xac\xf7\x98\x31\x2e\x76\xbb\x94\x77\x62\x4e\
-\xb7\xce\x61\xb9\x31\x25\xc5\x7d\x05\xb7\x58\x90\xc3\xc9\x53\x6e\
-\x36\xea\x14\x41\x04\x11\x89\xde\x74\x3f\x6b\xe7\x1f\x89\x3c\x2d\
-\x77\x1d\xd8\xf2\xf6\xda\x55\x27\x4f\xea\x7b\x1c\x53\xf9\x93\x1b\
-\xd3\x56\x24\x51\xb9\x0e\xc8\xe9\x57\xfe\x2a\x07\xdf\x49\x51\x2c\
-\x28\x2b\xe8\x53\x36\x27\x9f\x91\xb6\x3b\xf9\xa7\xe2\x31\x17\x71\
-\x76\x63\x5b\xb0\xf6\x9e\xd4\xf6\x4b\xe3\x49\x0c\xdc\x53\x6b\x8b\
-\x74\x44\x57\x6f\x36\xc4\x4b\x4a\x82\x5d\x69\x25\x48\x04\x07\x12\
-\x85\x65\x8a\x83\x51\xda\x0e\x29\xd9\x4f\x90\xc5\x79\x57\xf5\xa5\
-\x71\x4f\x9e\x7f\xc7\xe1\xeb\xf2\xf4\xfa\xf7\xe2\x94\xcb\xd7\x2c\
-\x74\xf1\x26\xb5\xe3\x4a\x67\xed\xc1\x02\x86\x9c\xe9\x9d\x7f\xbe\
-\x15\x26\xe1\x32\x24\x18\xe8\x1f\x5c\x89\x92\x1a\x8c\xca\x79\x54\
-\xb8\xf2\x90\x84\xe7\xdf\x87\x9a\xdc\x0f\x32\x1b\x33\xa5\x1f\x8e\
-\x85\xb8\xf4\x6b\xc6\xe1\x69\x98\xd2\x9b\x4b\x6b\xfb\x6a\xac\x55\
-\x5c\x0b\xe4\x87\x3e\x9a\x04\x93\x5c\x31\x0e\xe3\xe6\x8b\x4d\x5f\
-\xa4\x3f\x26\x44\x52\x9d\x1d\x69\xd4\x3a\xa5\xa6\x9c\x8c\xa2\x97\
-\x54\xec\x9b\x4d\xae\x44\x64\xb4\x55\x50\x15\xd7\x45\x72\xae\x14\
-\xfa\xf7\x73\x58\x7e\x3a\x10\x95\x26\x4a\x36\xc3\x5a\xad\x97\x52\
-\x54\x53\xfe\xda\x93\x6a\xa9\x20\x67\x9d\x32\x38\xb9\x5e\xda\xde\
-\x6d\x46\x63\x5b\xa6\x45\x86\x18\xff\x00\xd6\xfa\xd1\x53\xa6\x19\
-\x4d\x75\xa6\x44\x48\xa9\xb4\x17\x1c\x8c\xd9\x1d\x0b\x51\xe9\xa2\
-\x87\x0c\x22\x75\x85\xcd\xea\xd6\x25\xde\xb5\x47\x8d\xa7\xf6\x97\
-\x52\x29\x4f\xb2\xdd\x0a\xdf\x6e\x44\xf6\xe0\xc3\x0d\x24\x1a\xd4\
-\xb8\x0d\x07\x0e\x58\xb6\xec\x6e\x92\xd9\x0f\x30\x1a\x44\x6a\x19\
-\xe6\xd9\xa7\x35\x96\xb0\xd1\x88\x89\x65\x99\x25\x30\x9f\x9c\x5e\
-\xb8\x22\x24\xb9\x72\x6d\x50\x9e\x4b\x3d\x0d\xba\xe2\x4a\x7a\xd4\
-\x3a\x8a\x41\xae\x07\xb7\xc4\x11\xfa\xd3\x1b\x31\xa3\xae\xc8\x71\
-\xb8\xdb\x7f\xa7\x95\xaa\x2c\x92\x7a\x9a\x72\x3a\xaf\x37\x79\x32\
-\x18\x7f\xff\x00\x15\xc6\x9c\xeb\x97\x1a\x3c\x14\x96\xf2\x20\xf5\
-\x1e\xc3\x58\x11\x43\x85\xe5\x33\x15\xa4\x29\xe5\xa1\x2d\xad\xd5\
-\x04\x00\x5c\x5b\x68\x09\x42\x14\xbe\x60\x00\x06\x07\x2a\x56\xa2\
-\x9c\x7f\xb6\x0e\x3c\x00\xf4\x53\x97\x6f\xe9\xee\xc6\x43\xdf\xf3\
-\xca\xb8\xef\xf8\x7f\xd7\xf5\xfd\x72\xc5\xf7\x41\xeb\x9b\x24\x2b\
-\xfe\x9a\xd4\x50\x1f\xb7\xdc\xad\xf3\x59\x4b\xad\xb8\xcb\xe8\x52\
-\x0a\x91\x51\xd4\xdb\xa8\xad\x52\xa4\x90\xa4\x9a\x11\x9e\x1f\xf2\
-\xff\x00\xbc\xf3\x35\x36\xb4\xf2\x4d\xbe\xfa\x95\xf9\xfb\x3f\xb8\
-\x0f\xfe\x4c\xe8\xdb\x63\x74\xb8\x4d\x1f\x76\xc5\x31\x6e\x2d\xf3\
-\x1d\x98\x69\x90\x94\xbc\xd0\x29\x0e\x27\xa5\xe4\x02\x7e\xe0\x10\
-\xae\x96\xe9\x2d\x4b\x81\x71\x8b\x1e\x6c\x39\x4c\xa8\x2d\x99\x11\
-\xa4\xb6\x97\x5a\x75\xb5\x24\x90\xa4\xb8\xda\xc1\x14\xf4\x90\x45\
-\x78\xf2\x1c\xc7\x03\x89\x5b\x95\xb5\x52\x62\x6d\x4f\x99\xad\x37\
-\x6c\x7d\xcd\x13\xb9\x16\x76\x4d\xb6\x44\x8b\x83\x0b\x44\xa8\xb1\
-\xaf\x32\x6d\xa6\x3c\xa7\x0a\xdd\x67\xa1\x12\x3a\x94\xe3\x3d\x55\
-\xa2\x92\x3a\x4d\xb7\xc9\xd7\xee\x47\xa5\x6e\xbb\x6f\xbc\xb6\x57\
-\x61\x69\xed\x3d\xba\x72\xa2\x91\xa6\x35\xd3\x7f\x90\x6d\xd0\xae\
-\x17\x79\xa8\x4a\x61\xc4\x7e\x63\x89\x40\x44\xa6\xd4\xa6\x1f\xaf\
-\x51\xe8\x26\x98\x66\x54\x57\x9b\x7e\x3c\x86\x50\xf3\x0e\xb4\xa4\
-\xad\xb7\x1b\x71\x3d\x6d\xb8\x85\x24\x90\xa4\xa9\x26\xb5\xec\xc5\
-\x32\xaf\x67\x7d\x2b\xf3\xff\x00\xa0\x4f\x6f\x1c\x78\x0f\x97\xa4\
-\x76\x57\x3c\x5a\x6f\xbb\xbb\xa8\x20\xe9\xc8\x37\xc8\xd7\xb9\x30\
-\xee\x37\x79\x22\x05\xa1\x96\x6c\x30\xd3\x32\x62\xa5\x4d\x5a\x54\
-\x9f\xbb\xd2\xe2\x43\x6c\xa0\x29\xe7\x54\xaa\x21\x24\xe2\xf9\xaf\
-\x7c\x9e\x6f\xbe\xd3\xf9\x7f\xf2\xec\x2f\x92\x74\x0d\xbe\xff\x00\
-\xa9\x6e\x5a\x35\x9b\x9d\xc2\x4b\x4f\x25\xb9\x1a\x9a\x01\xbc\xb7\
-\x2a\xe6\x90\x0b\xa8\x4b\x40\x04\x85\x75\x02\x9e\xa2\x71\x0e\x37\
-\x9a\x1f\xdc\xeb\x77\xf7\x37\x4a\xbc\xc4\x39\x48\xb1\x68\xcb\x6c\
-\x0b\x24\x06\x5f\x40\x0b\x49\x66\x4b\x72\xd7\x0e\x4d\x7a\xc9\xfb\
-\xce\x47\x5a\xd4\x68\x72\xa0\x18\xb7\xbf\xac\x34\xf6\xe1\xee\x7d\
-\xd2\x12\x50\x5c\xb9\xea\xfd\x75\x75\xfb\x92\xd7\xd2\x12\xe1\x7a\
-\x35\xa8\xdb\xe2\x84\x39\xd2\x09\x48\x40\xe0\x33\xa8\xae\x22\xc7\
-\xb3\x79\x48\xda\x07\x17\x15\x09\x43\x72\xae\xda\x6a\x35\xee\x72\
-\xba\x50\x94\xf5\xbb\x32\xed\xf9\x6f\xb8\xb5\x25\x03\xa8\x95\x54\
-\xd3\x3c\x35\x6c\x7b\xca\xfe\xc9\xb9\x01\xae\xa0\xcc\x7f\xfd\x79\
-\xa6\x92\x86\xea\x9e\x83\xd3\xd1\x6f\x49\x49\x29\xe7\xdb\x9e\x0d\
-\xb6\xd7\xe5\xa7\x65\xa2\x5b\xd4\x7a\x8c\x54\xed\xee\x99\x53\x4b\
-\x3d\x5d\x55\x29\x72\xdc\xbe\xa3\xd4\x6b\x9e\x78\x62\xdb\x69\xdb\
-\x5d\x0f\x6c\xb7\x47\x6b\xf1\xe3\xc2\x83\xa5\xec\xd1\x63\xb2\xc0\
-\x1d\x21\xa6\xda\x66\x1a\x10\x86\xc0\x19\x00\x31\x71\xb9\x69\x1d\
-\x27\x6a\xb6\xdc\x2e\x93\xa5\x4f\x93\x3d\xb8\x6c\x7e\x5f\xdc\x94\
-\xea\x9d\x53\x48\x7b\xa3\xad\xb6\x1b\x2a\xa2\x12\x9a\x00\x9a\x01\
-\xc3\x06\xbf\xdb\x10\x36\x96\xf3\x74\x31\x35\x9c\xfd\x1f\x0e\xd9\
-\xa4\x14\xe3\xdf\x91\x6c\xba\x39\x0e\xcb\x2a\xe9\x72\xb7\x30\x2a\
-\xb8\xcc\x4f\x69\xbf\xb8\x4a\x54\x03\x84\xa0\xd3\x3a\x8c\x53\xba\
-\xbd\x9d\x99\x65\xfc\x14\xc7\x6e\x7e\xbe\xec\x77\xff\x00\xf0\xb5\
-\xc6\xc7\xeb\xf8\xc1\xb6\x35\x15\xae\x41\xd3\xda\x81\x84\x01\x75\
-\xd2\x7a\x99\x96\x96\xab\x3e\xa0\xb4\xc9\x14\x72\x3c\xa8\x32\xfa\
-\x55\xf4\x91\xd6\x8e\xa4\x9c\x94\x71\xa9\xbf\x6b\xbf\x38\xb7\x49\
-\x32\xf7\x43\x6b\xa2\x93\xb4\x1a\xf6\xe6\xe2\x91\x1f\x5c\xe8\xd8\
-\xed\xb6\xb8\x30\xda\xb8\x4c\x5b\x6e\x5c\xe4\x7e\x03\x89\x5c\x75\
-\x24\x28\x94\x21\x6d\x92\x54\xde\x79\xf7\x0e\xee\x66\xbe\x39\x63\
-\xdb\x5c\x71\xe7\xeb\xc6\xb8\xa5\x32\xad\x3d\x94\xad\x7d\xf8\x9f\
-\xa3\xb7\x5b\x4d\xb7\xfe\x48\xb3\x5b\x1e\xb2\xb4\xa5\x10\xb5\x4e\
-\x9e\x96\xda\x83\xb1\xdf\xb7\x5d\x1b\x47\xdf\x0d\xa5\xe4\x24\x96\
-\xd4\x4a\x15\x4e\x18\xd2\xfb\x3d\xe6\x8e\xe5\xa8\xf7\xbf\xca\x56\
-\xb1\xd4\x32\xad\x5a\x27\x7a\x1d\x32\x6e\x97\xfd\xbe\x8c\xb4\xa5\
-\x50\x60\xde\x96\x4b\xae\x2e\xdd\x0d\x94\x12\xb6\x9d\x59\x70\x36\
-\x14\x5a\x24\x20\x23\x0f\xef\x9b\x5b\x83\xa6\x1c\xda\x88\xd6\x44\
-\xea\x09\x3a\xd9\x17\x58\xaa\xb1\xb1\x6d\x59\x6d\x08\x71\xd9\xa1\
-\xc2\xd3\x6e\x29\xf7\x90\xd0\x6c\x9e\xb2\xea\x82\x29\xd4\x40\xf4\
-\x0e\x39\x7a\x0e\x75\xce\xbe\x18\x19\x57\x3e\xde\x1c\xeb\x8f\x13\
-\x5f\xe0\xa9\xe3\x5e\xee\x14\xee\xc5\x71\xa9\x37\x43\x5d\xde\xa0\
-\xdb\x11\x15\x85\x5b\xf4\xdc\x19\x0e\xa0\x4b\xd4\x5a\xa6\x63\x2e\
-\x26\xcd\x62\xb5\x45\xaf\xdd\x9b\x3a\x64\x90\x00\x6d\x01\x4a\xe9\
-\x05\x5c\x01\xc6\xdc\x4d\x5d\xc6\x56\xab\xd2\x17\x59\xf7\x2b\xeb\
-\x1a\x6a\xef\xa9\x62\x69\x9b\x16\x9e\x87\x71\x4a\xe4\xb6\x13\x68\
-\x02\x3b\x48\x88\xcc\x15\xa0\x21\xb5\x07\x1d\x5f\x4a\x42\x8a\x94\
-\x2b\x8d\x39\xa1\xb4\x55\xca\x3e\xa9\xb1\x46\x9f\x72\xd4\x0d\xe9\
-\xbd\x2d\x71\x62\xd5\x0e\x1d\xce\xe0\xc3\x0b\x94\xe4\xc9\x4e\xcd\
-\x61\xf7\x94\xb5\xb2\x02\x10\xa0\xe8\x4a\xaa\x40\x4d\x71\xa1\x76\
-\x33\xce\xe7\x95\x7d\xde\xdc\xe6\xb4\xad\xc1\xfd\x3a\x8d\xc2\x8b\
-\x06\xe9\x22\xf7\x6d\x88\x97\x56\xd4\x3b\x64\xa9\x06\xdf\x22\x35\
-\xca\x2c\x2f\xb7\xd2\xcb\x8b\x75\x25\x48\x20\xa5\x45\x3d\x29\x11\
-\xad\x7b\x81\xff\x00\xb0\xb6\xde\x64\x89\x31\x22\xa1\xfb\xd6\x9b\
-\x54\xab\x65\x66\x29\x2d\xa1\xd5\x4c\xb7\xbe\xfa\x9b\x6d\xb7\x09\
-\x4a\xc2\x90\x95\x26\x9c\x29\x9e\x22\x2a\x1f\x9a\xbd\x9d\x69\x73\
-\x1a\x61\xd6\xd9\xb8\x6a\xeb\x75\xb5\xe6\xbf\x21\x61\xa6\xda\x92\
-\xdc\xf7\x58\x54\x77\xbe\xe1\xe9\x29\x58\x04\x1e\x38\x87\x7f\xd3\
-\x17\xab\x5e\xa1\xb1\xdc\xe3\xa2\x4d\xbe\xed\x66\x9d\x1a\xe3\x6f\
-\x99\x1d\xc1\xd4\xdb\xd1\xa6\x44\x75\xd6\x1e\x6d\x40\xe4\x52\x48\
-\xc0\x24\xd7\x86\x5c\xa9\xf3\xc1\x03\x3e\x3c\x69\x96\x5f\xae\x28\
-\x7b\x00\xcc\xd3\x3c\x6b\x5b\x1e\xde\xdf\x98\xd2\xfa\xda\xeb\xa7\
-\x2e\xd0\x74\xb6\xa2\x92\xc7\xe5\x47\xb3\xde\xe4\xc3\x79\xab\x7c\
-\xf7\x58\x04\x7d\xd4\x46\x90\xa4\xa8\x8e\xec\x6d\xce\x88\xfd\xc2\
-\xf4\xac\xf7\x53\x2e\x21\xbc\xe8\x1d\xff\x00\x79\xc9\x6b\x8d\x3b\
-\x5a\xea\x50\x19\x56\xad\x87\x7a\x71\x48\x4c\xc8\x0d\x99\x0f\x47\
-\x90\xd1\x01\x48\xaa\x87\x4f\xd2\x41\xb6\xde\x2d\x93\xa2\xdc\x60\
-\x5c\x61\x47\x9b\x0a\x7c\x37\x9b\x7e\x24\xe8\x72\x5a\x43\xac\x4b\
-\x8e\xf3\x4a\x53\x6e\x34\xf3\x6b\x0a\x04\x1a\x67\x85\x1e\xd5\x52\
-\x9c\x7f\x5e\xcf\x97\xa0\xd7\xd8\x6b\x9e\x79\x76\x9c\x24\x52\xb4\
-\xcc\xfc\x33\xf7\xe0\xf7\xfc\xb1\xf2\xee\x1c\xb1\x41\xff\x00\x4b\
-\xbb\xe3\xff\x00\x42\xcb\xbc\xfb\x46\x83\xa7\xbc\xd4\x6c\x88\x3a\
-\x83\x6b\x75\x55\xba\x42\xed\x93\xae\x6a\x82\xfb\x53\xd5\xa6\xe7\
-\x4b\x61\x4d\x97\x5a\x92\xb6\x3f\xd8\x2e\x12\x1a\x70\xd4\x50\x29\
-\x40\xcf\xdb\x0d\xd3\x84\xd6\x81\xf3\x47\xb5\x5d\x76\x1d\xce\xdb\
-\xcb\x82\xcb\x13\x64\xc8\xb5\x2c\x42\x73\x51\x5a\x59\x7d\x2d\xae\
-\x4c\x29\xab\x40\x53\x81\x15\x2c\xad\x54\x26\x84\x13\x5e\x7f\x0f\
-\xd7\x1c\x6a\x7b\x4f\xa0\x8c\x5d\x74\x4e\xe1\x69\xab\x56\xa9\xd3\
-\x57\x88\xeb\x8f\x36\xd9\x76\x86\xcc\xb6\x14\x95\x0a\x07\x1b\x0f\
-\x25\x5f\x6d\xe6\x95\xf5\x21\x62\x8a\x49\x00\x8c\x4a\xf2\xe5\xa6\
-\xf5\xd5\xe3\x53\x7e\xdf\x9e\x61\x35\x93\x57\xbd\xc3\xd3\xaf\x4d\
-\x6d\x77\x5d\xb7\x73\x45\x4a\x4e\xec\x59\x62\x43\x43\xf4\x75\x88\
-\xb7\xfd\x57\xa1\x2d\xf6\x85\x3f\x1c\xf4\xa9\x99\xca\x0e\x37\xd5\
-\x45\xff\x00\xd3\xed\xf1\xa7\xbf\x3e\x38\xdb\x3f\x28\xed\xc9\x9a\
-\xf6\xd7\xf9\x4a\xd3\x70\xb7\x7f\x72\xa3\xb3\xf6\x9e\xb6\x5d\xb5\
-\xf5\xc9\xc8\x92\xac\x56\xd7\xd9\x52\x4a\x4a\xad\xf6\xf7\xd9\xea\
-\x5e\x7d\x1f\x7d\x68\xc8\x9a\xe1\x2d\xb0\xcb\x6d\x21\x86\x90\xc3\
-\x28\x42\x12\x94\xa1\xb6\xd0\x10\x00\x48\x00\x01\x44\x80\x3b\xb1\
-\x4a\x1e\x15\xaf\xb4\xf7\x73\xc2\x99\x9b\x6f\x87\x31\x97\x33\x71\
-\xb9\x31\x99\x79\x0a\x34\xa5\x54\x97\x10\xa0\x71\x73\xb2\x6e\x3e\
-\xc5\xe8\x79\x3f\xe4\xff\x00\x29\xe7\x2e\x56\xbb\x3c\x6b\x35\xd5\
-\xb9\xb2\x5a\x5b\x7f\x9c\xdd\xc2\xd6\x98\xb2\x53\x21\x2a\x57\x55\
-\x7a\xa8\xa2\x33\x07\x3c\x5e\x2d\x5a\x66\xe3\x75\xb6\xdd\x6f\x88\
-\x45\xa2\x25\xfa\x0e\xa9\xb8\xda\x06\x8d\xb2\x45\x5a\x9f\x6e\x7d\
-\xbe\xdb\xf8\xf2\xd3\x7a\xbd\x48\x71\x08\x41\x43\xaf\x32\xd2\x10\
-\x72\x35\x4d\x4e\xa2\xb0\xf9\x26\xdd\x0d\x51\xaf\xf6\x7e\xca\xd4\
-\x39\x16\x2d\x35\xa9\xae\xd6\x2d\x4a\xab\xcc\xa7\x6a\xd4\xc5\x23\
-\x4e\xde\xdd\x9d\x16\x2b\xe9\x50\x2b\x28\x67\xec\x95\xd6\xa5\x4a\
-\x23\x16\x3d\xbb\xfd\xc8\x76\x4e\x56\x8d\x9e\x64\xa6\xd7\x71\xdc\
-\x6d\x23\x68\x9d\x6f\x11\xa4\xb0\xe7\xe2\xc9\x7e\xeb\xa7\xa4\x7d\
-\xe8\x92\x3e\xcb\xc8\x25\xd3\x11\xe4\x9c\xcf\x4b\x34\x14\xc4\x1d\
-\x4b\xb3\x9b\xa3\xa6\xb5\x44\x79\xec\xb7\x21\x16\xef\xcd\x6e\x05\
-\xfd\x86\x9d\x1d\x4d\x99\xb6\x29\xc5\x8b\xa4\x5f\xb8\x33\x4f\x5b\
-\x63\xa8\x66\x2a\x30\x3b\x39\x7c\xf9\x1e\x78\x15\xe1\xc0\x78\x9e\
-\xce\xfa\x62\x6e\xda\xef\x86\x90\xb7\xcc\xbe\xdb\x23\x4d\x95\xb7\
-\x5b\x83\x1e\x3a\x51\xaa\xb6\xfb\x52\x38\xcf\xfe\x1d\xe2\xcb\x70\
-\x6c\xb6\xf1\x69\x12\x5b\x6d\x6f\x46\x5a\x8b\x0f\x74\x0e\xa4\xf5\
-\x04\xa9\x2d\xfe\xd4\xde\x7e\x64\xb2\xfd\x91\x6f\xb5\x13\xcb\x3e\
-\xf1\xbf\x24\xb7\x6a\xbd\x58\x24\x38\xe4\x7b\x04\x15\xdc\x66\x38\
-\x50\xf4\x0b\xaf\xda\x0d\x34\xc9\x59\x76\x24\xaf\xf6\x88\xa1\x21\
-\xb0\x41\x04\x28\x24\x82\x93\x50\x41\x02\x84\x11\x50\xa0\x46\x63\
-\x06\xa3\x9d\x29\xdd\xee\xcf\x14\xe2\x0f\xae\x58\xf8\x7f\xf1\x68\
-\x7d\x7d\xe3\x11\xbc\xed\xf9\x3f\x73\xfe\x17\xe6\xbf\x41\x47\x44\
-\xa9\x31\x21\x14\xc7\xb3\x6e\x95\x96\x10\x5a\xa4\xd8\xaf\x51\x2a\
-\x98\xee\x4f\x95\x18\xa9\xb4\x3a\xa1\xf5\x82\x12\xa3\x92\x54\x9b\
-\xc5\x86\xef\x01\x5b\x7d\xbf\x3b\x72\xf2\x2c\xbb\xa7\xb5\x77\x87\
-\x7e\xc5\xe6\xd1\x75\x60\x16\x9e\x9f\x06\x24\x94\xb3\x2a\x4d\xa9\
-\xf7\xdb\x55\x17\xd1\xf4\x2b\xe9\x56\x7c\x49\xa8\x35\x20\xd3\xba\
-\xb4\xee\xed\xf4\x7a\xfa\xd7\xd0\x0f\xb3\xc7\x96\x08\xec\xf0\xfe\
-\x7f\xc1\xdd\xfc\x5b\x93\xbc\xfa\xd2\x62\x21\x69\x9d\xb9\xd2\x57\
-\x8d\x51\x74\x75\x6a\x09\xeb\x6a\xdb\x11\xc7\x9a\x8c\xd7\x51\x01\
-\x4f\xca\x78\x25\xb6\xd2\x33\x52\xd4\x00\xc6\xef\x79\xda\xdc\x26\
-\xd9\x91\xb8\x3e\x6f\x37\x02\xed\xaf\x6d\x6e\x49\x8c\xea\x6e\x56\
-\x2d\xbe\xfc\x97\x51\xa6\x34\xff\x00\xe4\x49\x4a\x5f\x54\x46\x9b\
-\xea\x71\xb0\x02\x53\xf6\xd4\x9a\x0a\x00\x71\xe2\x31\x90\xff\x00\
-\x57\x1f\x1e\xdf\x8f\xa2\xb9\xd7\x2f\x5f\x6f\xa2\x84\x76\x71\xa1\
-\x15\x1e\xcc\x4f\xd1\xbb\xaf\xb7\x96\x0b\xcc\x29\xaa\x7d\xe4\xdc\
-\x5b\xb6\xc2\x66\xef\x0e\x5b\xe8\x28\x5c\xb8\x93\xfe\xc2\x9f\x65\
-\xf3\x5a\x95\x03\x99\x19\xe1\xed\x73\xe4\x6b\x7b\xb5\x3e\xd9\x6e\
-\x03\x3f\xe2\xda\x85\x63\xbe\x3b\x1d\x5a\x6d\xa6\x6d\xe9\x01\x72\
-\x61\x4c\x8f\x1b\xfc\x9c\x1b\x83\xe5\x35\x27\xad\x6c\x95\x13\xf4\
-\x0a\xd7\x0d\xed\x0f\xee\x59\xb3\x9a\xf3\x5b\x68\x89\xb7\x66\x6d\
-\xda\x5b\x7e\xec\xf0\x2d\xb2\x99\x7d\x0f\x28\xa5\x09\x5d\xca\xd6\
-\x96\x6d\x17\x58\xe8\x42\x4a\xcb\x6e\x96\x26\xb4\x91\x55\x05\xd7\
-\x28\xc8\xdb\x8d\xff\x00\xdb\xbb\x95\xd6\x43\xac\x46\x1a\x7e\x76\
-\xa1\x81\x69\xbf\xb5\x31\xf2\x52\x88\x4a\xb5\x5c\x9e\x8d\x29\x52\
-\x7a\xd2\x47\x4a\x12\xaa\x90\x69\x5c\x25\xc6\x96\x87\x5b\x58\x0a\
-\x4b\x88\x50\x5a\x54\x0e\x60\xa5\x49\x24\x10\x6b\x85\x47\xd1\x46\
-\xdd\xa7\x7c\xc7\x6d\x3c\xc3\xad\x76\x3f\x5d\x2d\x1f\x8f\x3a\x1d\
-\xf6\x0a\x7e\xfc\x8d\x34\xfd\xc5\x90\x99\x2d\x5a\x75\x0a\x5a\x4a\
-\x15\x99\x43\x6f\xa1\xa7\x4a\x4f\x45\x0d\xfb\xca\x7f\x98\x96\x5c\
-\xd2\x7e\x6d\xfc\xbc\xa5\x5a\x3f\x57\xdb\x2e\xff\x00\xf8\xb2\x75\
-\x73\x3a\x6d\x62\xd1\x2a\xec\xc2\x5f\xfb\x7f\x91\x73\x8f\x21\x9e\
-\x99\x49\x47\x55\x4d\x1c\xca\xa5\x29\xa1\xec\x1e\xcf\xd6\x98\x19\
-\x53\xff\x00\x8f\x42\x07\x0f\x5a\xe5\xc3\x16\xcf\xdc\x0f\xc9\x23\
-\x6f\x69\xef\x30\x3b\x71\x32\x2d\xef\x70\xf4\xbd\x99\xc3\x11\x9d\
-\xcd\xd2\x76\xa6\x56\x66\xb4\xe4\x46\xa8\xd4\xe9\xed\xc6\x49\x0e\
-\xb0\x7f\xff\x00\x6d\xac\x8d\x56\x94\x62\xd9\xae\xb4\xd3\x8a\xb4\
-\x6b\x3b\x4b\x6c\xda\xb7\x17\x42\x5c\x4a\x58\xbe\xe9\x5d\x4a\xc3\
-\x49\x44\xd6\x25\xc2\x24\x3c\x88\xaf\xbc\x14\xb6\x56\x52\x3a\x90\
-\x45\x68\x6a\x30\x3f\x82\x36\xa4\xda\xdd\xc1\xd3\x3a\xca\xdb\x25\
-\xb4\xac\xb9\x69\xb9\xc7\x76\x44\x75\xf4\xa5\x4e\x47\x99\x0c\xac\
-\x4a\x89\x21\x9e\xaa\x2d\xb7\x10\x95\xa1\x59\x10\x0e\x58\x06\xa3\
-\x3e\x63\x31\x8c\xe9\xdd\x4e\xcc\x1e\xef\xe5\x81\x5f\x4f\xb6\x9e\
-\xff\x00\x4e\xca\xf9\x14\xd2\x86\x5c\x9d\xce\xf3\x9b\xba\x9a\x6b\
-\x4e\xc1\x8f\x02\x4f\xda\x5d\xb7\x46\xe9\x3b\xfd\x9e\xf1\xa8\x6e\
-\x77\x06\xd0\x85\xad\xd8\x32\x1f\x2c\x30\x51\xf4\x85\x25\x4b\x3f\
-\x50\x41\x49\xd0\x3b\x7b\x6e\x6d\x2d\xc6\xd1\xfa\x46\xc5\x61\x69\
-\x29\x4a\x50\x9f\xb7\x6a\xb7\x47\x84\x0d\x10\x94\xb7\xd4\x4b\x55\
-\xe1\xdf\x8a\xfa\x3b\x6b\xf0\xfe\xff\x00\xc1\xed\xaf\x6e\x06\x59\
-\x7e\xbc\x6b\x87\x34\xee\xb9\xd3\x76\x7d\x4f\x6a\x73\xee\x29\x30\
-\xef\x10\x23\x4f\x69\xa7\x16\xda\x9a\x2f\x32\x89\x2d\xb8\x94\x3e\
-\x94\x2c\xd1\x40\x02\x39\x1c\x4f\x93\xa2\x37\x03\x54\xed\x9e\xa8\
-\x77\x55\x4f\xd4\xd6\xed\x41\x60\xe8\xb7\x3d\x05\xa9\x05\x6e\xc5\
-\xb2\x88\xf6\xef\xc6\x8e\xa8\xb0\x64\x14\x94\x3a\x00\x78\x84\x8e\
-\xa5\x28\xf1\x1f\xfa\xd7\x70\x15\xe7\x4b\x65\x9f\x90\x1d\x8b\xa6\
-\x6f\xa9\xbb\xea\xa4\x5b\x2d\xb0\x48\x79\xc8\x49\x5d\xc1\xcf\xf3\
-\xba\x7d\xcf\xc2\x6d\x49\xea\x61\xd0\xc2\x94\x78\x15\x53\x09\xdb\
-\x9f\x3f\xbb\x0f\xb9\x1e\x52\xf5\xfa\x2e\x2a\x82\xab\xb3\x96\xb9\
-\xba\x83\x43\x3c\xd2\xc5\x62\xcb\x53\xaa\x8f\x1a\xf3\x11\xa7\x52\
-\x08\xaa\x59\x90\x9a\x51\x5d\x40\x2a\x98\xd3\x1f\xba\xb7\xed\x7d\
-\xb8\xda\x57\x52\x6f\x06\xcf\x4b\x56\xab\xd4\x0e\x6d\x8b\xed\x4c\
-\x46\xe9\xc2\xb2\xc6\x8d\x26\x75\xa6\xf2\xd5\xa8\xa2\x58\xd5\x30\
-\x6d\x88\xfb\x4a\x61\xf6\xfe\xe3\xcc\x2c\xb6\xb4\xff\x00\xa7\x1f\
-\xf2\x3d\x3a\xf2\x6c\x3b\xa3\xa1\xd5\x1b\x4f\xee\xbe\xdf\xce\x71\
-\x0d\xdd\x74\xf6\xa3\x6a\x3a\x04\x97\x59\x61\x65\x0f\x3f\x69\x9a\
-\xea\x54\x5a\x77\xa4\x50\x82\x85\x00\xa0\x46\x05\x69\x97\xb3\x8f\
-\x3c\x11\xed\xf4\xfb\x7e\x3f\xfc\x45\xb4\xea\x10\xe3\x6e\x21\x48\
-\x5a\x16\x90\xa4\xa9\x2a\x05\x2a\x4a\x81\xa8\x52\x54\x0d\x08\xc4\
-\x0f\xdc\x3f\xcb\xcd\xba\xf8\xde\xd1\x6b\x1b\xc5\xbe\x0f\x99\x9d\
-\xbe\xd3\x8c\xad\xdb\x4c\x58\xb2\x25\xb2\xc4\xbd\x54\xbb\x63\x4a\
-\x0c\xa2\x0b\xb1\xdc\x5b\x8e\x14\x20\x29\xb9\x69\x42\xea\x12\xa5\
-\x63\x4b\x6e\x9e\xd8\xea\x3b\x76\xa9\xd1\xba\xba\xd7\x1a\xe9\x69\
-\xba\xdb\x5f\x43\xed\xa9\xb7\xdb\x0a\x5c\x67\xc2\x14\x55\x1e\x5c\
-\x57\x2a\xdb\xad\x2c\x05\xb6\xe2\x4a\x48\x04\x7f\x03\xda\x8f\x69\
-\xe5\xea\xfd\x83\xd5\x8e\x3a\xe3\xff\x00\xe5\xb6\xbe\xfd\x36\xc3\
-\x1d\xd5\xba\x4a\xdc\x6e\x44\x08\xcf\x21\x92\xc2\xdc\x35\x50\x48\
-\x4e\x55\xa5\x2b\x84\x31\xb7\x5b\xa3\xa4\x7c\xc9\x69\x68\x4f\xbb\
-\x21\xbb\x06\xe5\x21\xfb\x7e\xa6\x11\x1a\x55\x53\x02\x36\xa2\x63\
-\xa9\xe5\x29\xe6\xea\x52\x5e\xfb\xa5\x2a\xa0\xad\x32\x12\x2d\xde\
-\x68\xfc\xb8\xee\xf6\xc9\xcb\xb7\xbe\x21\xcb\xbe\xc4\xb3\x3d\xac\
-\x74\x9c\x89\x1d\x7f\x6f\xae\xdf\x3e\xd6\xd7\xe6\x3d\x19\x4a\x3f\
-\x49\xfb\x04\x91\x4e\x79\x08\x68\xd0\x3b\xc1\xa4\x66\xdc\xee\x08\
-\xea\x63\x4f\xdc\xee\x2d\x58\xf5\x15\x69\xf5\x25\x56\x4b\xb9\x85\
-\x70\x4b\x88\x1c\x7e\x83\x4c\x05\xa1\xc4\x2d\x04\x02\x95\xb6\xa0\
-\xb4\xa8\x76\x85\x24\x90\x41\xc2\x4f\x2c\xfe\x54\x1e\x8e\xee\xcc\
-\xbd\xf8\x19\xd2\xa7\xb3\xb3\x8e\x09\x26\x80\x02\x49\x3c\x80\x15\
-\x27\xd8\x31\xbb\x9b\xcc\xd4\x7f\xf3\xdb\x4d\xe4\x9f\x6f\xed\xfb\
-\x59\xa5\x2e\xdf\x93\xf9\x76\x71\xb8\x4f\x99\xa6\xfc\xa8\xcd\x92\
-\xa8\xe8\x99\x16\x6d\xc6\x63\x4a\xfb\x79\xd5\x90\x54\x73\x03\x00\
-\x81\xdc\x7c\x29\x97\x1a\xd7\x2f\xfa\x3e\xbf\xaf\x86\x2a\x6a\x69\
-\xeb\xf1\xc7\xdb\x79\x0d\xba\x85\x82\x95\x21\xc4\x25\x69\x50\x3c\
-\x41\x4a\xaa\x0a\x71\x76\xd2\x3b\xe3\xb6\x36\x67\x2f\x13\x2d\xef\
-\x44\xb6\x6b\xbb\x1c\x28\x96\xcd\x5f\x65\x7c\xb0\xe3\x31\x25\x45\
-\xba\x34\xc7\x5c\x8f\xc2\x52\xfa\x9b\x6d\xe0\xe3\x60\xf2\xc3\x5a\
-\x6b\xcb\xa6\xf2\x5d\x35\x56\xc7\x6e\xcc\x69\x97\xbd\x39\x1f\x57\
-\x5a\x97\x71\xd0\x7a\xa6\x03\x4f\x21\x12\x2d\x57\x9b\x02\xe4\x7f\
-\x8f\x8d\xa9\x20\x22\xa8\x5b\x8c\x90\xfa\x5b\x25\x41\x54\x5f\x52\
-\x9b\xf3\xc1\xb5\x9a\x43\x44\xed\x0c\xeb\xdc\xc8\xcf\xee\x46\xd3\
-\xed\xb3\x77\x1b\x5e\xdf\x6b\xb6\xde\x5d\x6f\xef\xdd\x2d\xb2\xe5\
-\x3e\x93\x2e\xec\x4f\xdd\x55\x48\x42\x5e\xfa\x93\xd2\xa2\x14\x9d\
-\x2b\xbe\x1b\x41\x74\x43\x73\x64\xdb\xe2\xb1\xad\xf4\x6c\xa7\x10\
-\x2f\x3a\x3b\x52\x06\x40\x9d\x6b\x9c\xcd\x43\x8a\x60\x48\x4a\x8b\
-\x0e\xf4\x80\xeb\x74\x34\x06\xa9\x19\x1c\x87\x77\xbb\x3a\xd7\x2c\
-\x78\xff\x00\xf1\xf5\x06\x88\xd6\x36\x88\x57\xfd\x31\xaa\x2d\x33\
-\x6c\x97\xcb\x45\xc5\x86\xe4\xc3\xb8\x5b\x6e\x11\xd7\x1a\x54\x77\
-\xda\x71\x2a\x42\x92\xe3\x4e\x11\xdc\x70\xdd\xb8\xc1\xd4\x7b\x83\
-\xe4\x2f\x78\x75\x73\x89\x4d\xc9\xb9\x12\xa7\x4b\xd9\x69\xb2\xde\
-\x52\x98\x0e\xc6\x21\x68\x53\x09\x0e\x80\xa7\x3e\x95\x48\x6d\x19\
-\x92\xe2\x7e\xab\x06\xb6\xd1\x97\x88\x77\xed\x33\xa9\x6d\xb1\x6e\
-\xd6\x6b\xb4\x17\x52\xf4\x79\x70\x66\x32\x97\xd9\x71\x2a\x49\x34\
-\x3d\x2a\xa1\x07\x30\x6a\x0e\x63\xf8\x33\xc2\xe2\x5e\xed\x16\xdb\
-\xbc\x57\x01\x0e\x46\xb8\xc2\x8f\x31\x95\x83\x91\x05\x12\x1b\x70\
-\x52\x87\x0a\xba\x5e\x76\xb6\xdd\x60\xbe\xf5\x17\x63\xdf\x34\x8b\
-\xaf\xe9\xd9\xb1\xa4\xd7\xa9\x32\x1a\x36\xe7\x18\x6c\x38\x85\xe7\
-\xc2\x95\xee\xc3\xf7\x4f\x2b\xfe\x6f\xb7\x12\xeb\x1e\x1b\xec\xbd\
-\x6d\xd0\x3b\xa7\x3d\xbd\x4f\x62\x54\x36\xaa\x5d\xb4\xa9\x77\x46\
-\xe4\xa9\x31\x96\x90\x94\xb6\x5a\x2c\xad\xb0\x9f\xf5\x1a\x92\x5a\
-\xd3\x9e\x66\xbc\x9f\x5d\x6e\x56\xd8\xa8\x4a\x64\x6b\xdd\xa9\x95\
-\xf9\xf1\xa7\x21\x20\x07\x25\xc6\xb3\xc8\x79\xe6\x28\x94\x82\xa5\
-\x24\xcb\x4a\xa9\x5a\x27\x96\x22\xd9\xe2\x6e\x4d\x9f\x4a\x6a\xe9\
-\x4a\x69\xb1\xa2\xb5\xc3\xc9\xd2\xfa\x91\x0f\xbb\x50\x98\xc2\x15\
-\xd4\xb1\xf9\x0f\x85\x8a\x51\xa2\xbc\xf0\x97\x23\xbe\xcb\xed\x28\
-\x05\xa1\x6c\xb8\x87\x50\xa4\x91\x91\x0a\x41\x50\x20\xf1\x07\x1c\
-\xbc\x79\x7c\xfb\x31\xbd\xfb\xeb\xa8\x1c\x6d\x10\x76\xe3\x6e\xf5\
-\x15\xf9\x96\xdd\x7d\x11\xbf\x36\xe8\xd4\x07\x59\xb3\x5b\x90\xf2\
-\xfe\x94\x48\xb8\xdd\x5d\x65\x96\xf2\x24\xad\x60\x00\x4e\x58\x89\
-\xba\x9a\xae\x03\xf1\x75\xdf\x99\x3d\x67\xa9\x37\x8b\x51\xbf\x35\
-\xd7\x64\xce\x90\xc5\xfa\x7b\xa6\xd6\xeb\xd2\x1e\xab\x8b\x4c\xa8\
-\x68\x0f\x8e\x00\x97\x8a\xa9\x55\x1f\x46\x54\xf1\xa6\x79\x9c\xff\
-\x00\x83\xbb\x97\xf1\xd0\xf3\xf5\xf9\x62\x1e\xdf\x79\xa3\xd9\xed\
-\x31\xbb\x5a\x62\xdd\x37\xfc\x8d\xae\x2d\xf1\x12\x58\x9b\x6b\x9b\
-\xd3\xd0\xa7\xed\xd7\x6b\x74\x88\x77\x38\x5f\x71\x19\x2c\x36\xf2\
-\x52\xb1\x92\x81\xc6\xb7\xd8\x3d\x31\xe4\xfb\x67\xed\xba\x5e\xef\
-\xa7\x2f\x11\xe2\x3c\xc6\x95\x83\x2f\x55\xc5\xba\xc9\x82\xe3\x70\
-\xee\xb1\x35\x6c\xf4\x4a\xd4\x4d\xdc\xa2\xbf\xd0\xa6\xd6\x64\x9a\
-\x52\x84\x14\x92\x0c\x3f\x3c\xde\x44\x75\x4d\xff\x00\x71\xf6\xab\
-\x4e\x59\x6d\xf2\xfc\xd1\x6c\xc6\xb2\x9c\x99\x4c\x3d\x6a\x76\x5b\
-\x2a\xb8\x5f\xad\xe3\xee\xb2\x85\xc1\x63\xee\xfd\xa4\x7d\xb0\x64\
-\x44\x59\x0b\x05\x68\x52\xfa\x77\x4a\xd9\x60\xda\x9b\xee\xd2\x6a\
-\xfd\xab\x6a\xcd\x2a\xe3\x6b\xbb\xde\xe0\xde\xe2\x5e\x6d\xf7\x64\
-\xad\x06\x5d\xbd\xe8\xec\x44\x79\xa5\xc5\x90\xd8\x0e\x20\xa1\x49\
-\x09\x75\x04\x38\xa3\xd4\x94\xfc\xff\x00\xf9\x1a\x97\x6c\xf7\x16\
-\xc5\x12\xff\x00\xa5\xb5\x45\xbd\xe8\x13\xe1\xca\x69\x0e\x14\x7d\
-\xd4\x90\xdc\xb8\xab\x52\x4a\x98\x99\x15\xca\x2d\xb7\x13\x45\x25\
-\x40\x1c\x42\xdb\x7d\xda\x72\x7e\xe0\xfe\xdf\xbb\xab\xaa\x1b\x8f\
-\xa3\x35\xf9\x6e\x44\x99\xdb\x4b\x74\xba\xba\x02\xa3\xcf\x5f\x5a\
-\x91\x12\x23\x4f\x2c\xb9\x25\x90\x3a\x5e\x4f\x53\xcc\xfd\x41\x6d\
-\x9b\x4e\xa5\xd3\x97\x48\x37\x9b\x15\xf2\x04\x5b\x9d\xa6\xed\x6e\
-\x90\xd4\xa8\x37\x08\x33\x1a\x4b\xf1\xe4\xc6\x90\xca\x94\xd3\xad\
-\x3a\xd2\xc1\x04\x12\x0d\x7f\x83\x2e\x38\x03\x2a\x57\x32\x3f\xfb\
-\x78\x0e\x7e\x87\x7f\xca\x18\x62\x2f\x42\xbe\xef\xe6\xfd\xaf\xb1\
-\xd1\x4f\xaf\xab\xef\x7d\x1d\x3d\x38\x93\x1b\x7b\xf5\x46\x81\xd3\
-\x1a\xc5\xcb\x92\x83\x77\x1d\x23\x0f\x53\x4d\xd4\xd1\xee\xff\x00\
-\x68\x82\xa6\x58\xd1\x56\x6b\xb4\x85\xbe\x06\x64\x16\xd4\x2b\x4a\
-\xe7\x4c\x46\xbd\x7e\xdf\xde\x74\x37\xb6\xf3\x09\x96\xa3\x3a\xf6\
-\x8b\xde\x7d\xa2\xdf\x48\xfa\x0a\x5d\xb5\x21\xc5\x44\x8f\x06\xfd\
-\xac\x76\xde\xdf\xa5\xdb\x4b\x86\x89\xab\x2a\x42\x82\x28\x4a\x86\
-\x58\xb5\x5a\x37\xa7\xca\x25\xaf\x57\xbc\x0b\xed\x5c\xf5\x86\xd7\
-\xee\xd6\xd5\x5b\xe3\x28\x36\x12\x98\xf2\x11\xa7\x75\x9e\xb4\xb2\
-\xcd\x09\x92\x6a\x48\x0e\x75\x20\x7f\xdb\x5c\x68\x1d\x1b\x72\xd9\
-\x5d\x4b\xb4\xfe\x57\xaf\x7b\xb3\xa0\xd7\xe6\x83\x77\xf5\x16\xa4\
-\xdb\x4d\x42\x8d\x1b\xa2\xdb\xd4\x16\xf4\x5a\xd9\x5e\x96\xd0\x1a\
-\xf3\x55\xeb\x5b\xac\x79\x37\xf7\x58\x5b\x8a\xb7\xdb\xa5\x74\x96\
-\x90\x15\x40\xa3\x8d\xa7\x8d\xb5\xb3\xa2\x5c\xf6\xe6\x3e\x81\xd2\
-\xcc\xe8\xbb\x8c\x16\x5e\x8f\x12\x76\x9d\x6e\xcf\x11\x16\xb9\x6c\
-\x31\x21\x98\xd2\x19\x43\xf1\x42\x54\x12\xe3\x68\x5a\x6b\x45\x24\
-\x1a\x8c\x1a\x83\x4f\x67\xb8\xd0\x9e\x38\x19\x57\xc3\xd4\x63\xe5\
-\xfd\x3f\x8c\x7a\xfb\xfd\x02\x9d\xbf\x0f\x4a\xba\xfa\x69\xce\xb4\
-\xcc\x53\x3a\xf6\x0c\x6b\xdb\x5e\xcc\xe9\x5d\x4b\x75\xd3\x37\x4d\
-\x59\xa5\xff\x00\xf7\x4e\xa4\xb1\x4f\xb1\x31\x03\x4c\xed\x74\x59\
-\x45\xc9\xe6\xf3\x0a\x5d\xde\x25\xfa\x75\xbe\xe5\x74\x31\x5b\x57\
-\xe0\xc5\x94\x1b\x00\x97\xba\x11\x99\xb1\x6e\xf7\xed\xeb\xbd\x51\
-\x37\x3b\xcd\xd3\x17\x6e\x9d\xcd\xf2\x98\xbd\x1f\xb8\x3a\x7a\xd7\
-\x37\x6d\x12\xe3\x7f\x71\xeb\x9e\xe7\x6a\x8d\x37\x60\xd9\x44\xb8\
-\xbf\xa8\x38\x89\x5a\x85\x92\x0f\x4a\x9a\x57\xdd\x08\x41\xd3\x77\
-\xed\xd7\xda\xeb\xb6\xcf\x6b\xe9\x76\xe8\xe7\x53\x68\x6b\xa6\xa1\
-\xd1\xba\xa5\xcb\x4d\xcd\x28\x09\x94\x88\xd7\xbd\x0d\xa8\xf5\x35\
-\x8e\x6c\x45\xba\x09\x69\x48\x91\xd5\xd0\x47\x52\x41\xa8\xc0\xf0\
-\x1f\xfc\x8d\x76\xc7\x9a\xe9\x3a\x4a\x16\xcb\xbd\x6a\x75\xbd\x53\
-\x37\x58\x21\x2e\x5b\xe2\x21\x79\x47\x91\x15\xb4\x35\x22\x6a\xee\
-\x8d\x3e\x52\x63\x88\xad\xae\x41\x78\x27\xed\xa4\xaa\x98\xb7\x37\
-\xe4\xde\x3d\xfb\xce\x3f\xed\xfd\xaa\xaf\x2e\x7f\x83\x7e\xfe\xe4\
-\x8d\xa8\xd6\x7b\x5b\x19\x6a\x40\x27\x49\x27\x7e\x17\xb6\xee\x6a\
-\xbd\x33\x1d\x0a\x25\x02\xde\x99\x0c\xac\x82\x10\x42\xba\x8a\xbf\
-\x2b\xf0\x24\xfe\x57\xe3\x7d\xef\xf1\xdf\x72\x17\xe5\x7d\xef\xb7\
-\xd7\xf8\x9f\x77\xf2\xbf\x03\xef\xf5\x7d\x1d\x5f\x7b\xed\x57\x3e\
-\xaa\x67\x8f\xff\xd9\
-\x00\x00\x3a\x8c\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
-\x00\x00\x20\x00\x49\x44\x41\x54\x78\x9c\xed\xdd\x79\x98\x65\x55\
-\x79\xa8\xf1\xb7\x9a\x1e\x68\xa6\x66\x90\x99\x46\x66\xb4\x99\xa4\
-\x51\x40\x46\x07\x12\x51\x01\x45\x05\x45\x23\xd1\x78\x83\x1a\x35\
-\x9a\x6b\xae\x53\xbc\x89\x37\xc9\x4d\xbc\x57\x13\x83\x8a\x82\xa8\
-\x08\x18\x9c\x00\x11\xc4\xe1\x6a\xb4\x9c\x31\x0c\x32\x08\xca\x3c\
-\x34\x34\x63\x83\x34\xf4\xdc\x5d\x7d\xff\x58\x55\xe9\xa2\xe9\xa1\
-\xce\x39\x7b\xed\x6f\xaf\xbd\xdf\xdf\xf3\x7c\x4f\x15\x3c\x70\xce\
-\x57\xeb\xac\xbd\xf7\x77\xd6\x5e\x7b\x2d\x90\x24\x49\x92\x24\x49\
-\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\
-\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\
-\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\
-\x92\x24\x49\x92\x24\x49\x92\x24\xa9\x25\x86\xa2\x13\x90\xd4\x97\
-\xc9\xc0\xe6\xab\xc5\x16\xc0\x26\xc0\x46\xc0\xf4\xd1\x9f\x63\xbf\
-\x4f\x1d\xfd\x7f\x36\x18\xf7\x73\x83\xd1\xd7\x5a\xb6\x9e\x58\x08\
-\x3c\x0e\xcc\x5f\xc3\xcf\xb1\x58\x91\xf1\x6f\x95\x94\x81\x05\x80\
-\xd4\x2c\x53\x80\x9d\x80\x5d\x80\x5d\x47\x7f\xdf\x16\xd8\x66\xb5\
-\x9f\x33\x68\xce\xf1\xbb\x12\x98\x07\x3c\x30\x2e\xe6\x02\x0f\x8e\
-\xfe\xfe\xe0\xe8\x3f\xdf\x4d\x2a\x26\x24\x35\x40\x53\x4e\x20\x52\
-\x57\x4c\x02\x76\x60\xd5\x05\x7e\xd7\xd1\xdf\xc7\xfe\x79\x27\xd2\
-\x37\xf4\x36\x5a\x49\x2a\x08\xee\x18\x17\x77\x8e\xfb\x39\x17\x18\
-\x09\xcb\x4e\xea\x18\x0b\x00\x29\x8f\x29\xc0\x9e\xc0\x2c\x60\x9f\
-\xd1\x9f\xb3\x46\xff\xdd\xb4\xc0\xbc\x9a\x6c\x01\x70\xe3\xb8\xf8\
-\xed\x68\xcc\x25\x15\x0f\x92\x2a\x64\x01\x20\x0d\x6e\x33\x60\x7f\
-\xe0\xc0\x71\x31\x8b\x74\xdf\x5d\x83\x7b\x9c\x55\xc5\xc0\x55\xa3\
-\xf1\x5b\x60\x79\x64\x52\x52\xe9\x2c\x00\xa4\xde\x0c\x01\x7b\x03\
-\x87\x01\x87\x8f\xc6\x5e\x78\x2c\xd5\x6d\x11\x70\x0d\xa9\x18\xf8\
-\xcf\xd1\x9f\xb7\xe2\x48\x81\x34\x61\x9e\xb4\xa4\x75\x9b\x06\x3c\
-\x97\x55\x17\xfb\xc3\x80\x67\x84\x66\xa4\xb5\xf9\x03\x70\x05\xf0\
-\x93\xd1\xb8\x8a\xf4\x14\x83\xa4\x35\xb0\x00\x90\x9e\x6a\x33\xe0\
-\x05\xc0\x11\xa4\x0b\xfe\x41\x78\xcf\xbe\x54\x0b\x80\x5f\x00\x3f\
-\x05\x86\x81\x2b\x81\xa5\x91\x09\x49\x4d\x62\x01\xa0\xae\x1b\x02\
-\xf6\x03\x5e\x0a\x1c\x4b\xba\xe8\x4f\x09\xcd\x48\xb9\x2c\x04\x7e\
-\x09\x7c\x1f\xf8\x0e\x70\x53\x6c\x3a\x52\x2c\x0b\x00\x75\xd1\xe6\
-\xc0\x31\xa4\x8b\xfe\x4b\x81\xed\x63\xd3\x51\x90\x39\xc0\xe5\xc0\
-\x77\x81\x1f\x01\x4f\xc6\xa6\x23\xd5\xcb\x02\x40\x5d\x30\x04\x3c\
-\x87\x55\xdf\xf2\x9f\x4f\x7b\x9f\xb5\x57\x7f\x96\x00\x3f\x23\x15\
-\x03\xdf\x02\x6e\x8f\x4d\x47\xca\xcf\x02\x40\x6d\x36\x1b\x38\x79\
-\x34\x76\x0d\xce\x45\x65\xb9\x06\xb8\x10\xb8\x08\xb8\x25\x38\x17\
-\x29\x0b\x0b\x00\xb5\xcd\xfe\xac\xba\xe8\xef\x19\x9c\x8b\xda\xe1\
-\x7a\x52\x21\x70\x21\xce\x1b\x50\x8b\x58\x00\xa8\x0d\xf6\x01\x4e\
-\x02\x5e\x0b\x3c\x2b\x38\x17\xb5\xdb\x8d\xc0\xd7\x80\xf3\x81\xbb\
-\x62\x53\x91\x06\x63\x01\xa0\x52\xcd\x04\xfe\x94\x74\xd1\xdf\x37\
-\x38\x17\x75\xcf\x4a\xd2\xe3\x85\xe7\x91\x46\x06\xe6\xc7\xa6\x23\
-\x49\xed\x36\x05\x38\x91\x34\x73\x7b\x39\xe9\x24\x6c\x18\xd1\xb1\
-\x00\xf8\x77\xe0\x25\xac\xda\x62\x59\x6a\x3c\x47\x00\x54\x82\x3d\
-\x80\xb7\x00\x6f\x02\xb6\x8b\x4d\x45\x5a\xa7\xb9\xc0\x97\x80\xcf\
-\x91\xb6\x3f\x96\x24\xf5\x68\x1a\xf0\x3a\xe0\x87\xa4\x2d\x62\xa3\
-\xbf\xe5\x19\x46\x2f\xb1\x1c\xb8\x94\xf4\xe8\xa9\xa3\x02\x6a\x24\
-\x47\x00\xd4\x34\xcf\x02\x4e\x03\xde\x88\x6b\xee\xab\x1d\xee\x06\
-\x3e\x0b\x9c\x03\x3c\x14\x9c\x8b\x24\x35\xce\x0b\x80\xcb\xf0\xdb\
-\xbe\xd1\xde\x58\x02\x5c\x00\x1c\x8a\x24\x75\xdc\x64\xd2\x30\xff\
-\x95\xc4\x9f\x9c\x0d\xa3\xce\xf8\x19\x70\x02\x30\x09\x49\xea\x90\
-\x19\xc0\x7b\x48\xcf\x51\x47\x9f\x88\x0d\x23\x32\x6e\x06\xde\x0a\
-\x4c\x47\xaa\x99\x73\x00\x54\xa7\x1d\x81\xbf\x04\xde\x46\xda\x76\
-\x57\x52\xf2\x30\x70\x06\xf0\x99\xd1\xdf\x25\xa9\x15\xf6\x02\xce\
-\x25\xdd\x03\x8d\xfe\xc6\x65\x18\x4d\x8e\x05\xc0\xbf\xe2\xe3\xae\
-\x92\x0a\xb7\x1b\x69\xe6\xf3\x32\xe2\x4f\xac\x86\x51\x52\x2c\x24\
-\x15\x02\x3b\x20\x49\x05\x99\x09\x9c\x05\x2c\x25\xfe\x44\x6a\x18\
-\x25\xc7\x22\xe0\xdf\x48\xb7\xcf\x24\xa9\xb1\xb6\x07\x3e\x09\x2c\
-\x26\xfe\xc4\x69\x18\x6d\x8a\x45\xc0\xe9\x38\x22\xa0\x0a\x39\x09\
-\x50\x55\xd8\x06\x78\x1f\xf0\x17\x38\x9b\x59\xca\x69\xec\xd6\xc0\
-\xc7\x70\x03\x22\x49\x81\x66\x00\xff\x04\x3c\x49\xfc\x37\x24\xc3\
-\xe8\x52\x3c\x4c\x7a\xa2\x66\x1a\x92\x54\xa3\x0d\x48\xcb\xf5\x3e\
-\x48\xfc\x89\xd0\x30\xba\x1c\x77\x90\xb6\xc4\x76\x34\x57\x52\x76\
-\xc7\x00\xd7\x12\x7f\xe2\x33\x0c\x63\x55\x5c\x09\xbc\x08\x49\xca\
-\x60\x0f\xe0\x42\xe2\x4f\x74\x86\x61\xac\x3d\x2e\x06\x76\x41\x9a\
-\x00\xb7\xa9\xd4\xfa\x6c\x02\xfc\x1d\xf0\x65\x60\xbf\xe0\x5c\x24\
-\xad\xdb\xb3\x49\x4b\x0b\x4f\x26\x8d\x0a\x2c\x8b\x4d\x47\x4d\xe6\
-\x7d\x23\xad\xcd\x24\xd2\x96\xbc\xff\x84\x8f\x1e\x49\x25\xba\x07\
-\x78\x37\x70\x49\x74\x22\x6a\x26\x0b\x00\xad\xc9\x81\xc0\x99\xc0\
-\xc1\xd1\x89\x48\x1a\xd8\x0f\x81\x77\x92\x36\x1e\x92\xfe\x8b\xb7\
-\x00\x34\xde\x74\xe0\xef\x81\x2f\x91\x56\xf3\x93\x54\xbe\xdd\x48\
-\x4f\xed\x4c\x07\x7e\x09\x2c\x8f\x4d\x47\x4d\xe1\x08\x80\xc6\x1c\
-\x0d\x9c\x0d\xec\x19\x9d\x88\xa4\x6c\x6e\x01\xde\x0e\xfc\x28\x3a\
-\x11\xc5\x9b\x14\x9d\x80\xc2\x6d\x41\x5a\xb7\xff\xc7\x78\xf1\x97\
-\xda\x6e\x2f\xd2\x2d\x81\x33\x49\x0b\x79\xa9\xc3\x1c\x01\xe8\xb6\
-\x57\x91\xf6\x20\x77\xeb\x51\xa9\x7b\xe6\x92\xe6\x06\x7c\x33\x3a\
-\x11\xc5\x70\x04\xa0\x9b\x76\x20\x3d\xd3\x7f\x11\x5e\xfc\xa5\xae\
-\xda\x81\xb4\x6e\xc0\x85\xa4\x8d\xbc\xd4\x31\x8e\x00\x74\xcf\x9b\
-\x80\x4f\x00\x9b\x07\xe7\x21\xa9\x39\xe6\x91\x36\xf3\xfa\x7a\x74\
-\x22\xaa\x8f\x05\x40\x77\x6c\x01\x7c\x9e\x34\xec\x2f\x49\x6b\x72\
-\x3e\x69\xed\x80\xc7\xa2\x13\x51\x7e\x16\x00\xdd\xf0\x22\x7c\xb4\
-\x4f\xd2\xc4\xdc\x0b\x9c\x4a\x9a\x18\xac\x16\xb3\x00\x68\xb7\xa9\
-\xc0\xff\x02\xde\x87\xf3\x3d\xda\x62\x25\xe9\xdb\xd9\x03\xc0\xfd\
-\xa3\x3f\x1f\x04\x1e\x1f\x8d\xf9\xa3\x31\xfe\xf7\xc5\xa4\x25\x61\
-\xd7\x14\x43\xa4\x2d\x65\xa7\xae\xf6\x73\xda\xb8\x7f\x9e\x4a\x9a\
-\x31\xbe\x15\xb0\x35\xb0\x25\xf0\x8c\x71\x3f\xb7\x1a\x17\x53\xf2\
-\xfd\xe9\xaa\xd1\x08\xe9\x56\xe1\x87\x49\xfd\x47\x2d\x64\x01\xd0\
-\x5e\x7b\x03\x17\x00\xb3\xa3\x13\x51\x4f\x96\x01\x73\x80\x3b\x49\
-\x5b\xbd\x8e\xc5\xdd\xa4\x0b\xfe\x83\xc0\x92\xb0\xec\xd6\x6d\x12\
-\x69\x32\xd9\x2e\xc0\xae\xa3\xb1\xcb\xb8\x7f\x9e\x49\x5a\xa3\x5e\
-\xe5\xb8\x09\x38\x05\xb8\x3e\x3a\x11\x55\xcf\x02\xa0\x9d\xfe\x9c\
-\x54\xbd\x6f\x1c\x9d\x88\xd6\x6a\x11\xf0\x3b\xe0\x46\xe0\xb7\xa3\
-\x3f\x6f\x22\x5d\xfc\xdb\xba\x52\xdb\x64\x60\x27\xd2\xce\x92\x07\
-\x90\x36\x97\xda\x17\x98\x45\x5a\xa5\x4e\xcd\xb4\x98\x34\x2f\xe0\
-\x73\xd1\x89\xa8\x5a\x16\x00\xed\xb2\x15\x69\xa2\xdf\x2b\xa3\x13\
-\xd1\x53\xcc\x03\xae\x22\xed\xce\x76\x35\xe9\x62\x7f\x3b\x69\x98\
-\x55\x69\x49\xf2\xbd\x48\x05\xc1\xfe\xa4\xa2\x60\x7f\xd2\xa8\x81\
-\x9a\xe3\x2b\xc0\xdb\x48\xb7\x95\xd4\x02\x16\x00\xed\x71\x38\xe9\
-\x00\x75\xa2\x5f\xac\xc5\xa4\x8b\xfd\x7f\x92\x2e\xf8\x57\x92\x86\
-\xf0\x57\x46\x26\x55\xa8\x6d\x81\x23\x48\x7d\xfb\x70\xe0\x39\xa4\
-\xf9\x08\x8a\x73\x1b\x70\x32\xf0\x9b\xe8\x44\x34\x38\x0b\x80\x76\
-\xf8\x73\xd2\x8a\x7e\x4e\xc0\xaa\xdf\x22\xe0\xd7\xc0\x4f\x80\x61\
-\xe0\x0a\x9c\x34\x95\xcb\x46\xa4\x1d\x2a\x0f\x23\x15\x04\x87\x92\
-\x26\x22\xaa\x5e\xde\x12\x90\x1a\x60\x3a\x69\xc8\x7f\xa5\x51\x5b\
-\x2c\x07\x7e\x01\xfc\x2d\x70\x24\x69\xa6\xbc\x62\x4c\x02\x0e\x22\
-\xcd\x54\xff\x39\x69\x02\x65\x74\xff\xe8\x52\x7c\x0d\xd8\x74\xbd\
-\x9f\x92\xa4\xca\xed\x4c\x1a\x86\x8b\x3e\x09\x74\x21\x1e\x04\xce\
-\x03\x5e\x87\xdf\x38\x9b\x6c\x0b\xd2\xf0\xf4\x17\x81\xfb\x88\xef\
-\x37\x5d\x88\xdf\x92\x26\x75\x4a\xaa\xc9\xb1\xc0\xc3\xc4\x1f\xfc\
-\x6d\x8e\x1b\x80\x8f\x00\xcf\xc5\x35\x14\x4a\x34\x44\x9a\x33\xf0\
-\x41\xe0\x97\xa4\x09\x97\xd1\x7d\xaa\xad\xf1\x28\xf0\xc7\x13\xfb\
-\x58\x24\xf5\x6b\x08\xf8\x00\xb0\x82\xf8\x83\xbe\x8d\x71\x0d\xf0\
-\x37\xa4\x35\x14\xd4\x2e\x33\x81\xbf\x26\x4d\xce\xb4\x18\xa8\x3e\
-\x96\x8f\xb6\xaf\xa4\x0c\x36\x23\xed\xdc\x15\x7d\xa0\xb7\x2d\xae\
-\x05\xde\x0f\xec\x3e\xf1\x8f\x42\x85\xdb\x8d\x54\x48\x5f\x4b\x7c\
-\xff\x6b\x5b\x7c\x99\x34\x59\x53\x52\x45\x76\x26\xad\xc4\x15\x7d\
-\x70\xb7\x25\xe6\x02\x1f\x27\x3d\x6b\xae\x6e\xdb\x9b\x34\xa1\xf3\
-\x66\xe2\xfb\x65\x5b\xe2\x37\xa4\x73\x96\xa4\x01\x1d\x8c\x13\x9a\
-\xaa\x88\x85\xa4\xa5\x91\x5f\x8a\xcb\xd1\xea\xe9\x86\x80\xa3\x49\
-\xbb\xe1\x2d\x20\xbe\xbf\x96\x1e\x0f\x00\x87\xf4\xf4\x09\x48\x7a\
-\x8a\x97\xe3\xc9\x68\xd0\xb8\x01\x78\x17\x69\x33\x1b\x69\x22\x36\
-\x27\xf5\x19\x6f\x11\x0c\x16\x0b\x80\x13\x7b\x6c\x7b\x49\xc0\x3b\
-\x49\x13\x6b\xa2\x0f\xe2\x12\x63\x31\x69\x55\xc4\xa3\x7b\x6e\x75\
-\xe9\xa9\x0e\x01\xce\x06\x9e\x20\xbe\x5f\x97\x18\x2b\x80\xf7\xf4\
-\xdc\xea\x52\x47\x4d\x22\xdd\x9f\x8e\x3e\x70\x4b\x8c\x7b\x80\x0f\
-\x91\xb6\xac\x95\xaa\xb4\x29\xf0\x57\xc0\x5d\xc4\xf7\xf3\x12\xe3\
-\x4c\xd2\x9e\x0f\x92\xd6\x62\x3a\x70\x21\xf1\x07\x6b\x69\x71\x0d\
-\xf0\x27\xb8\x14\xb2\xf2\x9b\x4c\xda\x1e\xf7\x2a\xe2\xfb\x7d\x69\
-\x71\x09\xee\x50\x2a\xad\xd1\x36\xc0\xaf\x88\x3f\x48\x4b\x89\x11\
-\xe0\xbb\xc0\x31\xfd\x34\xb6\x54\x81\x17\x02\x97\xe3\xba\x02\xbd\
-\xc4\x55\xa4\x4d\x9e\x24\x8d\xda\x95\xb4\xcb\x56\xf4\xc1\x59\x42\
-\x2c\x03\xce\x25\x6d\x1d\x2b\x35\xc1\x2c\xe0\x0b\xa4\xb9\x27\xd1\
-\xc7\x47\x09\x71\x0b\xb0\x4b\x3f\x0d\x2d\xb5\xcd\x2c\x60\x0e\xf1\
-\x07\x65\xd3\x63\x19\x70\x0e\xae\x3b\xae\xe6\x9a\x49\xba\xd7\xbd\
-\x84\xf8\xe3\xa5\xe9\x31\x07\x57\xdc\x54\xc7\x1d\x00\x3c\x44\xfc\
-\xc1\xd8\xe4\xf0\xc2\xaf\xd2\xec\x4a\xda\x90\xc8\xdd\x09\xd7\x1d\
-\x0f\x92\x76\x73\x94\x3a\xe7\x08\x60\x1e\xf1\x07\x61\x53\x63\x39\
-\xe9\x24\xea\x12\xbd\x2a\xd5\x1e\xa4\xa5\x71\x7d\x9c\x77\xed\xf1\
-\x38\x70\x54\xbf\x0d\x2c\x95\xe8\x68\xe0\x49\xe2\x0f\xbe\xa6\xc6\
-\xa5\xa4\x5b\x23\x52\x1b\xcc\x02\xbe\x8e\x9b\x78\xad\x2d\x16\x02\
-\x2f\xeb\xbb\x75\xa5\x82\xb8\xba\xdf\xda\xe3\x17\xc0\x91\xfd\x37\
-\xad\xd4\x68\x07\x02\xc3\xc4\x1f\x67\x4d\x8c\xa5\xc0\x6b\xfa\x6e\
-\x59\xa9\x00\x27\xe2\x04\xa1\x35\xc5\xcd\xc0\xab\x07\x68\x57\xa9\
-\x24\x27\x01\x77\x10\x7f\xdc\x35\x2d\x96\x8d\xb6\x8d\xd4\x3a\x6f\
-\xc0\x49\x41\xab\xc7\xe3\xc0\x7b\x71\x01\x1f\x75\xcf\x86\xc0\x87\
-\x71\x89\xe1\xd5\x63\x19\x8e\x04\xa8\x65\xde\x80\xf7\xff\xc6\xc7\
-\x08\x70\x1e\xb0\xfd\x20\x8d\x2a\xb5\xc0\x8e\xa4\x63\xc1\xf3\xc3\
-\xaa\x58\x0a\xbc\x6a\x90\x46\x95\x9a\xe2\xd5\xf8\xcd\x7f\x7c\xfc\
-\x27\x70\xd8\x40\x2d\x2a\xb5\xcf\x41\xb8\x12\xe8\xf8\x58\x8a\x3b\
-\x09\xaa\x70\xc7\xe2\x3d\xff\xb1\x78\x0c\x78\x3b\x69\xb3\x23\x49\
-\x4f\x37\x09\x78\x07\xf0\x07\xe2\x8f\xd7\x26\xc4\x52\xe0\x95\x03\
-\xb5\xa8\x14\xe4\x68\x9c\xed\x3f\x16\x17\x03\x3b\x0c\xd6\x9c\x52\
-\x67\xec\x00\x5c\x46\xfc\x71\xdb\x84\x58\x02\x9c\x30\x58\x73\x4a\
-\xf5\x7a\x3e\x30\x9f\xf8\x83\x27\x3a\xee\xc5\xd9\xfd\x52\xbf\x5e\
-\x07\x3c\x40\xfc\x71\x1c\x1d\x8b\x49\x1b\x2f\x49\x8d\x77\x00\x69\
-\xb8\x3b\xfa\xa0\x89\x8c\x11\xe0\x6c\x60\xc6\x80\x6d\x29\x75\xdd\
-\x96\xa4\x15\x31\xbb\xbe\xe3\xe0\x7c\xe0\xd0\x01\xdb\x52\xca\xea\
-\x59\xa4\xf5\xad\xa3\x0f\x96\xc8\xb8\x13\xab\x75\xa9\x6a\x2f\x00\
-\x6e\x27\xfe\xf8\x8e\x8c\x79\xb8\x81\x90\x1a\x6a\x37\xd2\x90\x77\
-\xf4\x41\x12\x19\xe7\x02\x9b\x0d\xda\x90\x92\xd6\x68\x53\xd2\xc6\
-\x58\xd1\xc7\x79\x64\xdc\x4d\xda\x75\x51\x6a\x8c\x6d\xe8\x76\x75\
-\xfe\x20\xce\xd6\x95\xea\xf2\x6a\xba\xbd\x91\xd8\x4d\xc0\xd6\x03\
-\xb7\xa2\x54\x81\xe9\xc0\x15\xc4\x1f\x14\x51\xf1\x1d\x52\x01\x24\
-\xa9\x3e\x3b\x01\x3f\x26\xfe\xf8\x8f\x8a\x2b\x81\x4d\x06\x6e\x45\
-\x69\x00\x93\x80\x8b\x88\x3f\x18\x22\x62\x31\xe9\x99\xe5\xa1\x81\
-\x5b\x51\x52\x3f\x26\x01\x1f\xa4\xbb\x6b\x8d\x7c\x17\x98\x3c\x70\
-\x2b\x4a\x7d\x3a\x9d\xf8\x83\x20\x22\x7e\x0f\xcc\xae\xa0\xfd\x24\
-\x0d\x6e\x36\x69\x43\xad\xe8\xf3\x42\x44\x7c\xb6\x82\xf6\x93\x7a\
-\xf6\x0e\xe2\x3b\x7f\x44\xfc\x3b\x0e\xbd\x49\x4d\xb3\x31\x70\x01\
-\xf1\xe7\x87\x88\x78\x6f\x05\xed\x27\x4d\xd8\x71\xc0\x72\xe2\x3b\
-\x7e\x9d\xb1\x90\x54\xf4\x48\x6a\xae\xf7\x90\x96\xd0\x8d\x3e\x5f\
-\xd4\x19\x2b\x70\xdf\x00\xd5\x64\x36\xdd\xdb\xc2\xf3\x36\x60\xff\
-\x2a\x1a\x4f\x52\x76\x47\x01\xf7\x11\x7f\xde\xa8\x33\x16\x00\xcf\
-\xab\xa2\xf1\xa4\xb5\xd9\x19\x98\x4b\x7c\x67\xaf\x33\x7e\x48\x5a\
-\x8d\x4c\x52\x39\xb6\x03\x7e\x4a\xfc\xf9\xa3\xce\xb8\x1f\x78\x66\
-\x15\x8d\x27\xad\x6e\x33\xe0\x06\xe2\x3b\x79\x9d\xf1\x09\x9c\x65\
-\xdb\x46\x33\x80\xbd\x48\x5b\xd0\xce\x06\xf6\xc4\x05\x9c\xda\x68\
-\x0a\x70\x06\xf1\xe7\x91\x3a\xe3\xb7\xa4\x05\x93\xa4\xca\x0c\x01\
-\xdf\x24\xbe\x73\xd7\x15\x0b\x80\x53\x2b\x69\x39\x35\xc1\x81\xc0\
-\x87\x80\xef\xb3\xee\xcd\x65\x1e\x00\xbe\x47\x7a\xb4\xec\x39\x21\
-\x99\x2a\x87\x37\x90\xe6\xf0\x44\x9f\x57\xea\x8a\x8b\x71\xdb\x71\
-\x55\xe8\x83\xc4\x77\xea\xba\x62\x0e\xe9\x82\xa1\xb2\xcd\x00\xfe\
-\x3b\x69\xd5\xb4\x7e\xfb\xc2\x4d\xa3\xaf\xe1\xe8\x40\xf9\x0e\xa1\
-\x5b\xfb\x94\x7c\xb4\x9a\x66\x53\xd7\xfd\x11\xdd\x99\xf1\x7f\x0d\
-\x69\x2f\x72\x95\x6b\x23\xe0\xef\x80\xc7\xa9\xae\x5f\x3c\x0e\xfc\
-\xed\xe8\x6b\xab\x5c\xbb\x01\xbf\x23\xfe\x3c\x53\x47\x8c\x00\xc7\
-\x56\xd3\x6c\xea\xaa\x67\x02\x8f\x10\xdf\x99\xeb\x88\xef\xe0\xbd\
-\xb3\xd2\xfd\x31\x69\x04\x27\x57\x1f\xb9\x07\x78\x59\x6d\x7f\x8d\
-\x72\xd8\x92\x34\xb1\x37\xfa\x7c\x53\x47\xcc\x03\x76\xaf\xa6\xd9\
-\xd4\x35\x1b\x02\x57\x11\xdf\x89\xeb\x88\x33\x70\xb2\x5f\xc9\x36\
-\x00\x3e\x4e\x3d\x7b\xc6\x8f\x00\x1f\x1b\x7d\x4f\x95\x69\x0a\x70\
-\x1e\xf1\xe7\x9d\x3a\xe2\x3a\xd2\x22\x49\x52\x4f\xbe\x48\x7c\xe7\
-\xad\xe3\x64\xfe\x81\xaa\x1a\x4c\x21\x36\x06\x2e\xa5\xfe\xbe\x73\
-\x39\x9e\x58\x4b\x36\x04\xfc\x03\xf1\xe7\xa0\x3a\xe2\x82\x8a\xda\
-\x4c\x1d\xf1\x56\xe2\x3b\x6d\xee\x58\x0c\x9c\x52\x55\x83\x29\xc4\
-\xc6\xc0\x30\x71\x7d\x68\x18\x8b\x80\xd2\xbd\x99\x6e\xac\x1c\xf8\
-\xee\xaa\x1a\x4c\xed\xf6\x7c\xd2\xc5\x31\xba\xc3\xe6\x8c\x05\xc0\
-\x31\x55\x35\x98\x42\x44\x5f\xfc\xc7\x62\x18\x8b\x80\xd2\x1d\x0f\
-\x2c\x22\xbe\x2f\xe5\x8c\xc5\xa4\x75\x2f\xa4\xb5\xda\x1a\xb8\x97\
-\xf8\xce\x9a\x33\xfe\x00\x1c\x59\x55\x83\x29\x44\x53\x2e\xfe\x63\
-\x31\x8c\x45\x40\xe9\x5e\x4c\xfb\x97\x38\xbf\x15\x1f\x69\xd5\x3a\
-\x7c\x8b\xf8\x4e\x9a\x33\xee\xc7\x6d\x7c\x4b\xd7\xb4\x8b\xff\x58\
-\x0c\x63\x11\x50\xba\x43\x49\x5f\x10\xa2\xfb\x52\xce\x70\x3e\x80\
-\xd6\xa8\xed\xf7\xfd\xef\x21\x2d\xf9\xaa\x72\x35\xf5\xe2\x3f\x16\
-\xc3\x58\x04\x94\x6e\x36\xeb\x5e\x2d\xb2\x0d\xf1\x96\xca\x5a\x4b\
-\xad\xf0\x2c\xd2\x7d\xf1\xe8\x8e\x99\x2b\x6e\xc3\x4d\x32\x4a\xd7\
-\xf4\x8b\xff\x58\x0c\x63\x11\x50\xba\xbd\x68\xf7\x6e\x82\x0b\x80\
-\x59\x95\xb5\x96\x8a\x36\x15\xb8\x9a\xf8\x4e\x99\x2b\xee\x24\xed\
-\x62\xa8\x72\x95\x72\xf1\x1f\x8b\x61\x60\x93\x0c\xed\xa0\xfa\xec\
-\x4e\x3a\x77\x44\xf7\xa5\x5c\x71\x03\x30\xbd\xb2\xd6\x52\xb1\xfe\
-\x0f\xf1\x9d\x31\x57\xdc\x0e\xec\x52\x59\x4b\x29\x42\x69\x17\xff\
-\xb1\xf8\x19\x16\x01\xa5\xdb\x99\x34\x7a\x18\xdd\x97\x72\xc5\x67\
-\xaa\x6b\x2a\x95\xe8\x58\x60\x05\xf1\x1d\x31\x47\xdc\x81\xdf\xfc\
-\x4b\xb7\x29\x65\x5e\xfc\xc7\xc2\x22\xa0\x7c\xbb\xd0\xde\xdb\x01\
-\x23\xc0\x71\x95\xb5\x94\x8a\xb2\x15\x69\x56\x7c\x74\x27\xcc\x11\
-\xf7\xe0\x3d\xff\xd2\x6d\x4a\xba\x80\x46\xf7\xa5\x41\xe3\x67\x38\
-\x27\xa0\x74\xb3\x80\x87\x88\xef\x4b\x39\x62\x2e\xb0\x79\x75\x4d\
-\xa5\x52\x5c\x44\x7c\xe7\xcb\x11\xf7\x02\x7b\x54\xd8\x4e\xaa\x5f\
-\x5b\x2e\xfe\x63\x31\x8c\x45\x40\xe9\x0e\x04\x1e\x23\xbe\x2f\xe5\
-\x88\x73\x2b\x6c\x27\x15\xe0\xcf\x88\xef\x74\x39\xe2\x31\x60\x9f\
-\x0a\xdb\x49\xf5\x6b\xdb\xc5\x7f\x2c\x86\xf1\x76\x40\xe9\x0e\x03\
-\xe6\x13\xdf\x97\x72\xc4\x89\x15\xb6\x93\x1a\x6c\x47\xda\xb9\xd8\
-\xc5\x02\xe0\x88\x0a\xdb\x49\xf5\xdb\x98\x76\x5e\xfc\xc7\xc2\xdb\
-\x01\xe5\x3b\x1a\x58\x48\x7c\x5f\xaa\x3a\x1e\x24\xad\x04\xab\x96\
-\xbb\x84\xf8\xce\x56\x75\x2c\x05\x5e\x5e\x65\x23\xa9\x76\xa5\x4f\
-\xf8\x9b\x68\x0c\x63\x11\x50\xba\x97\xd3\xce\x0d\x84\xbe\x51\x65\
-\x23\xa9\x79\x4e\x25\xbe\x93\x55\x1d\x2b\x80\x37\x54\xd9\x48\xaa\
-\x5d\xdb\xbf\xf9\xaf\x1e\xc3\x78\x3b\xa0\x74\x6f\x26\xbe\x1f\xe5\
-\x08\x77\x48\x6d\xa9\xad\x68\xe7\x12\x97\x6e\x73\x59\xb6\xae\x7c\
-\xf3\x5f\x3d\x7c\x44\xb0\x7c\x1f\x21\xbe\x1f\x55\x1d\x0f\x00\xcf\
-\xa8\xb0\x8d\xd4\x10\xe7\x11\xdf\xb9\xaa\x8e\xd3\x2b\x6d\x21\xd5\
-\xad\xad\x13\xfe\x26\x1a\xce\x09\x28\xdb\x10\xf0\x65\xe2\xfb\x51\
-\xd5\x71\x5e\x95\x8d\xa4\x78\xc7\x90\x16\x7d\x88\xee\x58\x55\xc6\
-\xb7\x81\x0d\xaa\x6c\x24\xd5\xaa\xeb\x17\xff\xb1\x18\xc6\x91\x80\
-\x92\x4d\x03\x7e\x4c\x7c\x3f\xaa\x32\x46\x80\xa3\xaa\x6c\x24\xc5\
-\x99\x4e\x5a\x12\x37\xba\x53\x55\x19\x57\xe1\x49\xb3\x64\x5e\xfc\
-\x9f\x1a\xde\x0e\x28\xdb\x16\xc0\xef\x88\xef\x47\x55\xc6\xef\x48\
-\xc5\x8d\x0a\xd7\xb6\xb5\xfe\xef\x01\x76\xa8\xb4\x85\x54\xa7\xae\
-\x4d\xf8\x9b\x68\x78\x3b\xa0\x6c\xbb\x91\x1e\xa5\x8b\xee\x47\x55\
-\xc6\x47\x2b\x6d\x21\xd5\xee\x40\x60\x19\xf1\x1d\xa9\xaa\x78\x12\
-\xd8\xbf\xd2\x16\x52\x9d\xba\x3a\xe1\x6f\xa2\x31\x8c\x23\x01\x25\
-\x3b\x84\x76\xad\x11\xb0\x14\xd8\xbb\xd2\x16\x52\x6d\x36\x00\xae\
-\x24\xbe\x13\x55\x15\x23\xc0\x6b\x2b\x6d\x21\xd5\xc9\x6f\xfe\x13\
-\x0b\x47\x02\xca\xf6\x46\xe2\xfb\x50\x95\x31\x4c\x9a\xec\xa8\xc2\
-\xbc\x9b\xf8\xce\x53\x65\x7c\xac\xda\xe6\x51\x8d\xfc\xe6\xdf\xfb\
-\x49\xd7\x22\xa0\x5c\x1f\x25\xbe\x0f\x55\x19\xa7\x56\xdb\x3c\xca\
-\x6d\x33\xe0\x61\xe2\x3b\x4e\x55\xf1\x43\x9c\xf1\x5f\x2a\xbf\xf9\
-\xf7\x17\xc3\x58\x04\x94\x6a\x32\xf0\x0b\xe2\xfb\x50\x55\x71\x2f\
-\xde\x9a\x2a\xca\xe9\xc4\x77\x9a\xaa\xe2\x0e\x5c\x98\xa2\x54\x7e\
-\xf3\x1f\x2c\x86\xf1\xc4\x5b\xaa\x1d\x68\xd7\x76\xeb\x4e\x08\x2c\
-\xc4\xee\xb4\x67\x9d\xea\x85\xc0\x73\xaa\x6d\x1e\xd5\xc4\x6f\xfe\
-\xd5\x84\x8f\x08\x96\xeb\x28\xda\x33\x09\x7b\x21\xb0\x73\xb5\xcd\
-\xa3\x1c\x2e\x23\xbe\xb3\x54\x15\x6f\xae\xb8\x6d\x54\x8f\x8d\xf1\
-\x9b\x7f\x95\x61\x11\x50\xae\xf7\x10\xdf\x7f\xaa\x8a\xaf\x56\xdc\
-\x36\xaa\xd8\x8b\x88\xef\x24\x55\xc5\xf9\x15\xb7\x8d\xea\xe1\xb0\
-\x7f\x9e\xf0\xe9\x80\x72\x5d\x40\x7c\xff\xa9\x22\x46\x80\x23\x2b\
-\x6e\x1b\x55\x64\x32\x70\x1d\xf1\x9d\xa4\x8a\xb8\x85\x74\x21\x51\
-\x59\x1c\xf6\xcf\x1b\xc3\x38\x12\x50\xa2\x8d\x81\x9b\x89\xef\x3f\
-\x55\xc4\x35\xc0\xa4\x6a\x9b\x47\x55\x68\xcb\x63\x7f\x0b\x81\xd9\
-\x15\xb7\x8d\xf2\xf3\x9b\x7f\x3d\xe1\x48\x40\x99\x9e\x4b\x7b\xe6\
-\x66\x79\x6b\xb6\x61\x36\x07\xe6\x11\xdf\x31\xaa\x08\x9f\x39\x2d\
-\x8f\x6b\xfb\xd7\x1b\xc3\x58\x04\x94\xe8\x03\xc4\xf7\x9d\x2a\xe2\
-\x6e\x60\xc3\x8a\xdb\x46\x03\x68\xcb\xc2\x13\x97\x54\xdd\x30\xca\
-\xce\x61\xff\x98\x18\xc6\xdb\x01\xa5\x99\x44\x7b\x76\x0e\x7c\x7f\
-\xc5\x6d\xa3\x3e\x6d\x4f\x5a\x23\x3f\xba\x43\x0c\x1a\xf7\xe3\xf3\
-\xfe\xa5\x71\xb6\x7f\x6c\x78\x3b\xa0\x3c\x33\x81\x47\x89\xef\x3b\
-\x83\xc6\x23\x38\x4f\xab\x11\xce\x22\xbe\x33\x54\x11\x27\x54\xdd\
-\x30\xca\xca\x8b\x7f\x33\x62\x18\x47\x02\x4a\x73\x32\xf1\xfd\xa6\
-\x8a\xf8\x48\xc5\xed\xa2\x1e\xed\x00\x2c\x21\xbe\x23\x0c\x1a\xe7\
-\x54\xdd\x30\xca\xca\x8b\x7f\xb3\xc2\x91\x80\xf2\xb4\xe1\x8b\xdb\
-\x7c\x60\xbb\xaa\x1b\x46\x13\xf7\x69\xe2\x3b\xc1\xa0\x71\x1b\x30\
-\xa3\xea\x86\x51\x36\x5e\xfc\x9b\x19\xc3\x38\x12\x50\x92\x4d\x81\
-\xdb\x89\xef\x37\x83\xc6\x59\x55\x37\x8c\x26\x66\x77\xca\xff\xf6\
-\x3f\x02\x1c\x51\x75\xc3\x28\x1b\x2f\xfe\xcd\x0e\x47\x02\xca\xf2\
-\x62\xd2\x39\x30\xba\xdf\x0c\x12\x4b\x70\x89\xe0\x10\xe7\x11\xff\
-\xe1\x0f\x1a\x9f\xaa\xbc\x55\x94\x8b\xcf\xf9\x97\x11\xc3\x58\x04\
-\x94\xa4\x0d\xb7\x02\x1c\x05\xa8\xd9\x9e\x94\xbf\xa8\xc4\x5d\x38\
-\x64\x59\x0a\x1f\xf5\x2b\x2b\x86\xb1\x08\x28\xc5\xe6\xa4\xed\x76\
-\xa3\xfb\xcc\x20\xb1\x04\xd8\xa9\xea\x86\xd1\xda\x7d\x9d\xf8\x0f\
-\x7d\xd0\x78\x79\xe5\xad\xa2\x1c\x1c\xf6\x2f\x33\x86\xb1\x08\x28\
-\xc5\xf1\xc4\xf7\x97\x41\xc3\x51\x80\x9a\xec\x0d\xac\x20\xfe\x03\
-\x1f\x24\x2e\xac\xbc\x55\x94\x83\x17\xff\xb2\x63\x18\x47\xd9\x4a\
-\x71\x11\xf1\xfd\x65\x90\x58\x0c\x6c\x53\x79\xab\xe8\x69\x4a\xbf\
-\xf7\x3f\x8f\xf4\xf8\xa2\x9a\xcd\x8b\x7f\x3b\xc2\x89\x81\x65\xd8\
-\x9e\xf4\x58\x5d\x74\x7f\x19\x24\xfe\xb9\xf2\x56\xd1\x53\xec\x4c\
-\xf9\xf7\xfe\x5d\xeb\xbf\xf9\xbc\xf8\xb7\x2b\x86\x71\x24\xa0\x04\
-\xef\x20\xbe\xaf\x0c\x12\x8f\x03\x5b\x56\xde\x2a\xfa\x2f\xa7\x13\
-\xff\x21\x0f\x12\xbf\x02\x86\x2a\x6f\x15\x55\xc9\x8b\x7f\x3b\xc3\
-\x91\x80\xe6\x9b\x04\x5c\x41\x7c\x5f\x19\x24\x3e\x5a\x79\xab\x08\
-\x80\x2d\x28\x7b\x88\x68\x05\x69\x4b\x4c\x35\x97\x8f\xfa\xb5\x3b\
-\x86\xb1\x08\x68\xba\x83\x29\x7b\x6d\x80\xc7\x71\xb4\x29\x8b\x8f\
-\x10\xff\xe1\x0e\x12\x5f\xa8\xbc\x45\x54\x25\x1f\xf5\xeb\x46\x0c\
-\x63\x11\xd0\x74\xe7\x12\xdf\x4f\x06\x89\xf7\x54\xdf\x24\xdd\x36\
-\x05\x98\x4b\xfc\x07\xdb\x6f\x3c\x8e\x6b\x46\x37\x99\xdf\xfc\xbb\
-\x15\xc3\x58\x04\x34\xd9\x0e\xc0\x13\xc4\xf7\x93\x7e\xe3\x76\xd2\
-\xed\x0c\x55\xe4\x54\xe2\x3f\xd4\x41\xe2\x7d\xd5\x37\x89\x2a\xb2\
-\x29\x7e\xf3\xef\x62\x0c\xe3\x50\x6d\x93\x7d\x88\xf8\x3e\x32\x48\
-\xbc\xb2\xfa\x26\xe9\xae\xdf\x10\xff\x81\xf6\x1b\x37\x02\xd3\xaa\
-\x6f\x12\x55\xc0\x61\xff\x6e\xc7\xcf\xb0\x08\x68\xaa\x0d\x29\x7b\
-\xb3\xa0\x1f\x57\xdf\x24\xdd\xf4\x42\xe2\x3f\xcc\x41\xe2\x98\xea\
-\x9b\x44\x15\x70\xd8\xdf\x58\x89\x45\x40\x93\x95\xbe\x42\xe0\x21\
-\xd5\x37\x49\xf7\x7c\x9b\xf8\x0f\xb2\xdf\x18\xae\xbe\x39\x54\x01\
-\xbf\xf9\x1b\xe3\xc3\x47\x04\x9b\x6b\x98\xf8\xfe\xd1\x6f\x7c\xbd\
-\xfa\xe6\xe8\x96\x67\x53\xf6\x23\x21\x87\x55\xdf\x24\x1a\x90\xdf\
-\xfc\x8d\x35\xc5\x30\x8e\x04\x34\xd1\x81\x94\x7b\x0d\x58\x02\x6c\
-\x5b\x7d\x93\x74\xc7\x27\x88\xff\x10\xfb\x8d\x4b\x33\xb4\x87\x06\
-\xe3\x37\x7f\x63\x5d\xe1\x48\x40\x33\x95\xbc\xf9\xdb\x47\xaa\x6f\
-\x8e\x6e\xd8\x08\x78\x84\xf8\x0f\xb0\x9f\x58\x0e\xec\x57\x7d\x93\
-\x68\x00\xae\xf0\x67\x4c\x24\x86\x71\x24\xa0\x69\x66\x51\xee\x06\
-\x70\xf7\x93\x1e\x63\x57\x8f\x4e\x23\xfe\xc3\xeb\x37\xdc\x1a\xb2\
-\x59\xbc\xf8\x1b\xbd\x84\x23\x01\xcd\x73\x3e\xf1\xfd\xa2\xdf\x38\
-\x29\x43\x7b\xb4\xde\x55\xc4\x7f\x70\xfd\xc4\x12\xd2\xa6\x45\x6a\
-\x06\xef\xf9\x1b\xfd\xc4\x30\x8e\x04\x34\xc9\x9e\xc0\x32\xe2\xfb\
-\x45\x3f\xf1\x83\x0c\xed\xd1\x6a\x7b\x10\xff\xa1\xf5\x1b\x9f\xcd\
-\xd0\x1e\xea\x8f\xf7\xfc\x8d\x41\xc2\x91\x80\x66\x39\x8b\xf8\x3e\
-\xd1\x4f\xac\x00\x76\xca\xd0\x1e\xad\xf5\x51\xe2\x3f\xb4\x7e\x62\
-\x29\xb0\x4b\xf5\xcd\xa1\x3e\x38\xec\x6f\x54\x11\xc3\x58\x04\x34\
-\xc5\xce\xa4\x11\xd6\xe8\x3e\xd1\x4f\xfc\xcf\x0c\xed\xd1\x4a\x53\
-\x48\x13\x27\xa2\x3f\xb0\x7e\xe2\x9c\x0c\xed\xa1\xde\x39\xec\x6f\
-\x54\x19\xc3\x58\x04\x34\xc5\x99\xc4\xf7\x87\x7e\xe2\x4e\x60\x83\
-\x0c\xed\xd1\x3a\x27\x11\xff\x61\xf5\x13\x2b\x80\xbd\x33\xb4\x87\
-\x7a\xe3\xb0\xbf\x91\x23\x86\xb1\x08\x68\x82\x99\xc0\x62\xe2\xfb\
-\x43\x3f\x71\x7c\x86\xf6\x68\x9d\x1f\x10\xff\x41\xf5\x13\x5f\xcd\
-\xd1\x18\xea\x89\xc3\xfe\x46\xce\x18\xc6\x89\x81\x4d\xf0\x05\xe2\
-\xfb\x42\x3f\xe1\xca\x80\xeb\xb1\x33\x65\x3e\xef\x39\x02\xec\x9f\
-\xa1\x3d\x34\x71\x5e\xfc\x8d\x3a\xc2\x89\x81\xf1\x66\x51\xe6\xea\
-\x80\x4b\x80\xad\x32\xb4\x47\xdf\x9a\xb6\x67\xf1\x9b\x68\x5e\x4e\
-\x13\x71\x19\x70\x7d\x74\x12\x1d\xb6\x29\x70\x39\x70\x74\x74\x22\
-\x6a\xbd\x23\x48\x7d\xcd\x22\x20\xce\x4d\xa4\xcf\xa0\x34\x53\x81\
-\xd7\x44\x27\xd1\x64\xbf\x25\xbe\x4a\xeb\x27\x8e\xcc\xd1\x18\x9a\
-\x10\xef\xf9\x1b\x11\x31\x8c\x45\x40\xa4\x23\x88\xef\x03\xfd\xf6\
-\x1b\xad\xc1\xbe\xc4\x7f\x38\xfd\xc4\xd5\x39\x1a\x43\x13\x32\x05\
-\xf8\x0e\xf1\x7d\xc0\xe8\x66\x7c\x17\x97\x79\x8d\x54\xe2\x62\x71\
-\x8d\x5a\x13\xa0\x49\xc3\xed\x27\x47\x27\xd0\xa7\xd3\xa3\x13\xe8\
-\xb0\x33\x81\x97\x46\x27\xa1\xce\x3a\x96\xd4\x07\x15\xe3\x5f\xa2\
-\x13\xe8\xc3\x24\xe0\xb5\xd1\x49\x34\xd1\xef\x89\xaf\xce\x7a\x8d\
-\x39\xc0\xb4\x1c\x8d\xa1\xf5\x3a\x95\xf8\xcf\xbf\xce\x28\xe9\xf6\
-\x58\x49\xb9\x56\x11\x6f\x42\x11\x26\x03\x77\x11\xff\xf9\xf7\x1a\
-\x57\x65\x68\x8b\xa2\x95\x7a\x3f\xe7\xfd\x39\x1a\x43\xeb\xb5\x13\
-\xf0\x04\xf1\x9f\x7f\x5d\xf1\x19\xd2\x08\x59\x74\x1e\x13\x8d\x93\
-\x81\x4f\x35\x20\x8f\xba\xe2\x09\x1a\x34\xac\xdb\x31\x7f\x45\xfc\
-\xe7\xdf\x4f\xec\x95\xa3\x31\x7a\xd5\x94\x5b\x00\x25\xee\x96\xb4\
-\x04\x57\xfe\x8b\xf2\x71\xba\xf3\x3c\xf6\x59\xc0\x3b\x48\x27\x8d\
-\x52\xac\x04\xfe\x12\x38\x23\x3a\x91\x9a\x6c\x42\x99\xc3\xd1\x6d\
-\xf0\x79\xe0\xc9\xe8\x24\xfa\x70\x4a\x74\x02\x4d\x31\x44\x99\xc3\
-\x38\x5f\xaa\xbe\x29\x34\x01\x07\x12\xff\xd9\xd7\x15\x9f\x26\x1d\
-\x1f\x50\xd6\x0a\x99\x63\x05\xfd\x10\xa9\x08\x88\xce\xa7\x8e\x18\
-\x21\xf5\x4d\xd5\xef\x6c\xe2\x3f\xff\x5e\xe3\xf7\x59\x5a\xa2\x40\
-\xa5\x0e\xff\x1f\x9e\xa3\x31\xb4\x5e\x5f\x21\xfe\xb3\xaf\x23\xce\
-\x60\xd5\xc5\x1f\xca\x2c\x00\x18\xfd\x1b\x4a\x3c\x41\xf7\x13\xae\
-\xf4\x16\xe3\x10\xe2\x3f\xfb\x7e\x62\x9f\x1c\x8d\xd1\x8b\x26\xdc\
-\x02\x28\x71\xf8\xff\x26\xe0\x17\xd1\x49\x74\xd0\x56\xc0\xab\xa3\
-\x93\xa8\xc1\x67\x81\x77\x92\x4e\x12\xa5\x5b\x09\xbc\x15\xf8\x62\
-\x74\x22\x35\x78\x25\xb0\x75\x74\x12\x1d\xf4\x6b\xe0\x86\xe8\x24\
-\xfa\x70\x42\x74\x02\xd1\x05\xc0\x10\x70\x62\x70\x0e\xfd\xf8\x7c\
-\x74\x02\x1d\xf5\x1a\xda\xff\xdc\xf5\x99\x94\x77\xcf\x7f\x7d\x46\
-\x80\x3f\xa7\xfd\xb7\xcd\xa6\x50\xe6\x17\x9a\x36\x38\x3b\x3a\x81\
-\x3e\xbc\x22\x3a\x81\x68\x07\x11\x3f\x0c\xd3\x6b\x2c\x06\x9e\x91\
-\xa3\x31\xb4\x5e\xdf\x22\xfe\xf3\xcf\x19\x5f\xe2\xa9\xc3\xfe\xe3\
-\x95\x7a\x0b\x60\xbc\x49\xa3\x7f\x63\x74\x7e\x39\xe3\xb2\xb5\xfc\
-\xed\xca\x6b\x0b\x60\x01\xf1\x9f\x7f\x2f\xb1\x02\xd8\x31\x47\x63\
-\x4c\x54\xf4\x08\xc0\xb1\xc1\xef\xdf\x8f\x4b\x80\x47\xa2\x93\xe8\
-\xa0\x49\xa4\xf9\x22\x6d\x75\x2e\xf0\x16\xd2\x89\xa1\xad\x46\x48\
-\x7f\xe3\xf9\xd1\x89\x64\x74\x14\xe9\xf9\x74\xd5\xeb\x31\xe0\xcb\
-\xd1\x49\xf4\x68\x12\xc1\x7b\x03\x44\x17\x00\x25\xae\xe2\xe6\xf0\
-\x7f\x8c\x99\xc0\x96\xd1\x49\x64\xf2\xef\xa4\x0b\xe3\x8a\xe8\x44\
-\x6a\xb0\x02\x78\x33\x70\x5e\x74\x22\x99\x6c\x06\xec\x12\x9d\x44\
-\x47\x7d\x2e\x3a\x81\x3e\x1c\x17\xf9\xe6\x91\x05\xc0\x16\xc0\xa1\
-\x81\xef\xdf\x8f\xbb\x81\x1f\x45\x27\xd1\x51\x7b\x44\x27\x90\xc9\
-\xf9\xc0\x9f\xd2\x8d\x8b\xff\x98\x15\xc0\x9f\xd1\xde\x91\x80\x3d\
-\xa3\x13\xe8\xa8\xab\x81\x5b\xa2\x93\xe8\xd1\x11\x04\x6e\x2a\x15\
-\x59\x00\x1c\x0f\x6c\x10\xf8\xfe\xfd\xf8\x2a\x69\x18\x53\xf5\x6b\
-\xe3\xec\xea\x2f\x93\xbe\x0d\x77\xe9\xe2\x3f\x66\x6c\x24\xe0\xab\
-\xd1\x89\x64\xb0\x7d\x74\x02\x1d\x56\xda\x6d\x80\x0d\x09\xbc\x15\
-\x1e\x59\x00\x84\x0e\x7d\xf4\xe9\x82\xe8\x04\x3a\x6c\xb3\xe8\x04\
-\x2a\xf6\x65\xd2\x1a\xf2\x5d\xbc\xf8\x8f\x59\x01\xbc\x91\x74\x0b\
-\xa4\x4d\xba\xb2\x4a\x65\x13\x7d\x2d\x3a\x81\x3e\xbc\x2c\xea\x8d\
-\xa3\x0a\x80\x21\xe0\x05\x41\xef\xdd\xaf\x1b\x81\xeb\xa3\x93\x50\
-\x2b\xfc\x3b\x5e\xfc\xc7\x2c\x27\xdd\x02\xb1\xb8\x56\x15\x6e\x01\
-\xae\x8d\x4e\xa2\x47\x7f\x14\xf5\xc6\x51\x05\xc0\x01\x94\x37\xa4\
-\xfb\x95\xe8\x04\x3a\xee\x89\xe8\x04\x2a\x72\x11\xdd\xbb\xe7\xbf\
-\x3e\x2b\x48\xbb\x3b\x5e\x14\x9d\x48\x45\x4a\x5c\x9b\xbe\x4d\x4a\
-\x1b\x05\x98\x09\xec\x1d\xf1\xc6\x51\x05\x40\x89\x8f\xff\x59\x00\
-\xc4\x7a\x38\x3a\x81\x0a\x5c\x4c\xda\x04\xc4\x8b\xff\xd3\xad\x20\
-\xb5\xcd\xc5\xd1\x89\x54\xe0\x81\xe8\x04\x3a\xee\xeb\x94\xf7\x38\
-\x6d\xc8\x28\x80\x05\xc0\xc4\xfc\x1a\xb8\x23\x3a\x89\x8e\xbb\x35\
-\x3a\x81\x01\x5d\x02\xbc\x0e\x58\x16\x9d\x48\x83\x2d\x23\xb5\xd1\
-\x25\xd1\x89\x0c\xa8\xb4\x99\xe8\x6d\x73\x07\xf0\xcb\xe8\x24\x7a\
-\x74\x4c\xc4\x9b\x46\x14\x00\x33\x28\x6f\x23\x9d\x6f\x44\x27\x20\
-\xe6\x00\x8f\x46\x27\xd1\xa7\x4b\x80\xd7\xe2\xc5\x7f\x22\x96\x91\
-\xda\xea\xd2\xe8\x44\xfa\xf4\x04\x69\x77\x53\xc5\x2a\xed\x9c\xfd\
-\x42\x02\x16\x90\x8a\x28\x00\x42\xfe\xd0\x01\x7d\x2b\x3a\x01\x31\
-\x02\xfc\x3c\x3a\x89\x3e\x5c\x46\xba\xa0\x2d\x8d\x4e\xa4\x20\x4b\
-\x49\xcb\x09\x97\xb8\xac\xee\x4f\x48\x13\x1b\x15\xeb\x62\xca\xba\
-\x0d\xb0\x19\x70\x70\xdd\x6f\x1a\x51\x00\x94\xb6\x9c\xeb\x4d\xc0\
-\x6d\xd1\x49\x08\x80\xef\x46\x27\xd0\xa3\x6f\x91\x2e\x64\x5e\xfc\
-\x7b\x37\x56\x04\x94\x36\x12\xf0\xbd\xe8\x04\x04\xa4\x11\xc3\x2b\
-\xa2\x93\xe8\x51\xed\xb7\x01\x22\x0a\x80\xc3\x02\xde\x73\x10\xa5\
-\x9d\x80\xda\xec\x1b\x94\x33\x8c\xfe\x1d\xe0\x64\x60\x49\x74\x22\
-\x05\x5b\x42\x59\x45\xc0\x72\xd2\x04\x34\x35\x43\x29\xfd\x66\x4c\
-\xeb\x0b\x80\xe9\xa4\x1d\x00\x4b\xe2\xf0\x7f\x73\xcc\xa3\x8c\x59\
-\xe2\xdf\x03\x5e\x85\xdf\xfc\xab\x50\xd2\xed\x80\x4b\x68\xc7\xd3\
-\x2a\x6d\x51\xda\x68\xcc\xf3\x80\xa9\xd1\x49\xe4\x74\x24\xf1\x5b\
-\x30\xf6\x12\xf7\x13\xbf\x61\x92\x9e\x6a\x36\xf1\xfd\x62\x5d\x71\
-\x19\x69\x79\xcf\xaa\xb5\x61\x3b\xe0\x41\x4c\x25\x9d\xd0\xa3\xff\
-\xb6\x75\xc5\xec\x0c\x7f\xb7\xfa\x37\x04\xdc\x43\x7c\xbf\xe8\x25\
-\x9e\x9f\xa5\x25\xd6\xa2\xee\x8b\x5b\x69\xb3\xff\x2f\xc3\xb5\xff\
-\x9b\xe6\x1a\x9a\x3b\xc3\xf7\x07\xa4\xed\x3d\x17\x47\x27\xd2\x42\
-\x4b\x81\x13\x49\x6d\xdc\x44\x17\x92\xfa\xa6\x9a\x63\x25\xe5\xcd\
-\x1b\xb2\x00\x68\x90\xd2\x3a\x4f\x57\xbc\x17\x58\x10\x9d\xc4\x6a\
-\x7e\x00\xbc\x02\xef\xf9\xe7\xb4\x88\xd4\xc6\x3f\x8c\x4e\x64\x35\
-\x0b\x80\xff\x1e\x9d\x84\xd6\xe8\xdb\xd1\x09\xf4\xa8\xb4\x49\xf2\
-\x13\x36\x04\x3c\x42\xfc\x10\xcb\x44\x63\x39\xb0\x79\x96\x96\x50\
-\x15\xde\x4c\x7c\x1f\x19\x8b\x1f\x90\xe6\xb7\xe4\xd4\xf5\x5b\x00\
-\xe3\x6d\x04\xfc\x47\x03\xfe\xce\xb1\x78\x73\xde\x3f\x57\x03\xd8\
-\x84\x74\x2e\x8f\xee\x23\x13\x8d\xfb\xf3\x34\x43\xbc\x59\xc4\x37\
-\x6e\x2f\xf1\xab\x3c\xcd\xa0\x0a\x9d\x43\x7c\x3f\xf9\x11\xe9\x82\
-\x94\x9b\x05\xc0\x53\x6d\x44\x1a\x09\x88\xfe\x5b\xcf\xc9\xfd\x87\
-\x6a\x60\x3f\x27\xbe\x9f\xf4\x12\xbb\xe5\x69\x86\xa7\xab\xf3\x16\
-\x40\x69\x8f\xff\x35\x6d\x98\x51\x4f\x77\x1a\xb1\x33\x7d\x87\x81\
-\xe3\x81\x85\x81\x39\x74\xd5\x42\xe0\x04\xd2\x67\x10\xe5\x7b\xa4\
-\x3e\xa8\x66\x2b\xed\x56\x6e\x6d\xb7\xca\xeb\x2c\x00\x4a\xbb\xff\
-\x6f\x01\xd0\x7c\xcb\x48\x93\xee\x22\x0e\xf0\xef\x02\xc7\xd1\xbc\
-\xb9\x08\x5d\xb2\x90\xf4\x19\x44\x7c\xfe\xdf\x23\xf5\xbd\x52\xd6\
-\xa5\xe8\xb2\xd2\x1e\x07\xac\x75\x22\x60\x5d\x6e\x26\x7e\x68\x65\
-\xa2\xf1\x24\x2d\x7f\x1e\xb3\x65\xa6\x00\x5f\xa2\xbe\xfe\xf1\x85\
-\xd1\xf7\xac\x93\xb7\x00\xd6\x6e\x0a\x70\x6e\x45\xb9\x4f\x24\xce\
-\xa1\xfe\xcf\x5f\xfd\x9b\x04\x3c\x46\xfc\x71\x31\xd1\xb8\x3a\x4f\
-\x33\xc4\xd9\x94\xf4\x38\x5d\x74\xc3\x4e\x34\x2e\xcf\xd3\x0c\xca\
-\xec\xcd\xa4\xcd\x58\x72\xf5\x8b\x27\x48\xfb\xd6\x47\xb0\x00\x58\
-\xbf\xff\x46\x2a\xde\x73\xfd\x5d\x4f\x02\x7f\x56\xdb\x5f\xa3\x2a\
-\x5d\x4e\xfc\x71\x31\xd1\x58\x42\x4d\x05\x66\x5d\xb7\x00\xf6\x21\
-\x3d\x05\x50\x8a\x9f\x45\x27\xa0\xbe\x9c\x43\x9a\x6c\x9a\x63\x9d\
-\x80\xaf\x01\xcf\x06\xce\xcb\xf0\xda\xaa\xc6\xe7\x49\xe7\x9a\x6f\
-\x66\x78\xed\x8b\x48\x7d\xeb\x8b\x19\x5e\x5b\xf9\x95\xb4\x3d\xf0\
-\x54\xd2\xb9\xa6\x35\x4e\x23\xbe\xaa\xea\x25\x8e\xcc\xd3\x0c\xaa\
-\xd1\x41\xc0\x57\x49\x0b\xc8\xf4\xdb\x0f\x96\x02\x5f\x01\x0e\xac\
-\x39\xf7\x35\x71\x04\xa0\x37\x07\x93\x2e\xda\xcb\xe8\xff\xef\x58\
-\x36\xfa\x1a\xcf\xad\x39\x77\x55\xef\x68\xe2\x8f\x8b\x5e\xe2\x4f\
-\xf3\x34\x43\x8c\x4f\x13\xdf\xa0\x13\x8d\x45\xe4\x7f\xa6\x5b\xf5\
-\x79\x06\xf0\x36\xd2\x9e\x0e\xf3\x58\xff\xe7\x3f\x8f\xb4\xa6\xfb\
-\x5b\x81\xad\x02\xf2\x5d\x1b\x0b\x80\xfe\x6c\x03\xbc\x9b\x34\x51\
-\x70\x22\xb7\x87\xe6\x8f\xfe\xb7\x7f\x39\xfa\xff\xaa\x1d\x36\x62\
-\xb0\x2f\x03\x75\xc7\x27\xf2\x34\xc3\x53\x4d\xae\xe3\x4d\x80\xfd\
-\x6a\x7a\x9f\x2a\x5c\x4d\x2a\x02\xd4\x0e\x8f\x00\x67\x8e\xc6\x24\
-\x60\x26\xb0\x27\xb0\x2d\xb0\xf1\xe8\x7f\xb3\x00\x78\x80\xb4\xed\
-\xf3\x1c\x5c\xfe\xb9\x4d\x1e\x02\x4e\x1f\x8d\xc9\xa4\x67\xac\xf7\
-\x22\x5d\xdc\x37\x1d\xfd\x6f\x9e\x04\x1e\x04\x6e\x01\xee\x20\x2d\
-\x1c\xa3\x76\x59\x48\x3a\xb7\x1f\x1a\x9d\xc8\x04\x3d\xa7\x8e\x37\
-\xa9\xa3\x00\x18\x02\xf6\xaf\xe1\x7d\xaa\xf2\xf3\xe8\x04\x94\xcd\
-\x08\x70\xf7\x68\xa8\x7b\x96\x93\x2e\xf2\xb7\x44\x27\xa2\x10\xbf\
-\xc2\x02\xe0\x29\xea\x98\x04\x38\x8b\xb2\x96\xd4\xfd\x45\x74\x02\
-\x92\xa4\xca\x95\xf4\xe5\x6e\x73\x60\xd7\xdc\x6f\x52\x57\x01\x50\
-\x92\x2b\xa3\x13\x90\x24\x55\xae\xb4\x2f\x77\xd9\x47\x01\xea\x28\
-\x00\xf6\xa9\xe1\x3d\xaa\x32\x97\x74\x2f\x58\x92\xd4\x2e\x0f\x02\
-\x77\x46\x27\xd1\x83\x67\xe5\x7e\x83\x3a\x0a\x80\x83\x6a\x78\x8f\
-\xaa\xfc\x26\x3a\x01\x49\x52\x36\xd7\x47\x27\xd0\x83\xbd\x72\xbf\
-\x81\xb7\x00\x9e\xea\xda\xe8\x04\x24\x49\xd9\xdc\x10\x9d\x40\x0f\
-\x8a\x1f\x01\x98\x02\xec\x9c\xf9\x3d\xaa\x64\x01\x20\x49\xed\xe5\
-\x08\xc0\x38\xb9\x0b\x80\x67\x52\xdf\x5a\x03\x55\xf0\x16\x80\x24\
-\xb5\x57\x49\x23\x00\x5b\x92\x16\x32\xcb\x26\x77\x01\xb0\x47\xe6\
-\xd7\xaf\xd2\x7c\xd2\x22\x20\x92\xa4\x76\xba\x15\x58\x1c\x9d\x44\
-\x0f\xf6\xce\xf9\xe2\xb9\x0b\x80\xdd\x33\xbf\x7e\x95\xae\x23\x2d\
-\xc1\x28\x49\x6a\xa7\x15\xc0\x8d\xd1\x49\xf4\xa0\xe8\x02\xa0\xa4\
-\x11\x80\x9b\xa2\x13\x90\x24\x65\x57\xd2\x6d\x80\xac\xf3\x00\x2c\
-\x00\x56\x71\x79\x50\x49\x6a\xbf\x92\x0a\x80\xac\xd7\xd0\xdc\x05\
-\x40\xf6\xa5\x0c\x2b\x74\x73\x74\x02\x92\xa4\xec\x4a\x7a\x12\x60\
-\xa7\x9c\x2f\x9e\xbb\x00\x28\xe9\x11\x40\x0b\x00\x49\x6a\xbf\xdb\
-\xa2\x13\xe8\x41\xd6\x6b\x68\xce\x02\x60\x06\xab\xb6\xdb\x6c\xba\
-\xa5\xc0\x5d\xd1\x49\x48\x92\xb2\xbb\x97\x72\xb6\x7c\xde\x0e\x98\
-\x9a\xeb\xc5\x73\x16\x00\x59\x87\x2e\x2a\xe6\x1e\xe0\x92\xd4\x0d\
-\xcb\x81\x39\xd1\x49\x4c\xd0\x10\xb0\x63\xae\x17\xcf\x59\x00\x3c\
-\x33\xe3\x6b\x57\xcd\xe1\x7f\x49\xea\x8e\x92\x36\x05\x9a\x99\xeb\
-\x85\x1d\x01\x48\xee\x8a\x4e\x40\x92\x54\x9b\xbb\xa2\x13\xe8\x41\
-\xb6\x79\x00\x39\x0b\x80\x1d\x32\xbe\x76\xd5\xee\x89\x4e\x40\x92\
-\x54\x1b\x47\x00\xc8\x5b\x00\x6c\x9d\xf1\xb5\xab\x76\x6f\x74\x02\
-\x92\xa4\xda\xdc\x15\x9d\x40\x0f\x8a\x9c\x03\x50\xd2\x08\x80\x05\
-\x80\x24\x75\x47\x49\x23\x00\xdb\xe5\x7a\x61\x47\x00\x92\xbb\xa3\
-\x13\x90\x24\xd5\xa6\xa4\x02\x20\xdb\x8e\x80\x39\x0b\x80\x6d\x32\
-\xbe\x76\x95\x96\x03\x0f\x44\x27\x21\x49\xaa\xcd\xfd\xc0\xb2\xe8\
-\x24\x26\x68\xab\x5c\x2f\x9c\xb3\x00\xd8\x3e\xe3\x6b\x57\xe9\x01\
-\xd2\x0e\x51\x92\xa4\x6e\x58\x09\xcc\x8b\x4e\x62\x82\x8a\x2b\x00\
-\xa6\x02\x9b\x64\x7a\xed\xaa\xdd\x1f\x9d\x80\x24\xa9\x76\x16\x00\
-\x99\x5e\x77\xf3\x4c\xaf\x9b\x43\x29\x9d\x40\x92\x54\x9d\x52\xce\
-\xfd\x53\xc9\xb4\xac\xbe\x05\x00\x3c\x12\x9d\x80\x24\xa9\x76\xa5\
-\x14\x00\x90\x69\x14\xc0\x02\xa0\xac\x4e\x20\x49\xaa\x46\x49\xe7\
-\xfe\x2c\x4f\xd5\x59\x00\x94\xd5\x09\x24\x49\xd5\x78\x38\x3a\x81\
-\x1e\xcc\xc8\xf1\xa2\x16\x00\x16\x00\x92\xd4\x45\x25\x9d\xfb\x2d\
-\x00\x32\x71\x0e\x80\x24\x75\x4f\x49\x05\xc0\x94\x1c\x2f\x9a\xab\
-\x00\xc8\x92\x6c\x26\x7f\x88\x4e\x40\x92\x54\xbb\x92\x0a\x80\xcd\
-\x72\xbc\x68\xae\x02\xa0\x94\x35\x00\x00\x96\x46\x27\x20\x49\xaa\
-\xdd\xc2\xe8\x04\x7a\x30\x3d\xc7\x8b\xe6\x2a\x00\xb2\x24\x9b\xc9\
-\x13\xd1\x09\x48\x92\x6a\x57\xd2\xe8\xef\x86\x39\x5e\x34\x57\x01\
-\x90\x25\xd9\x4c\x4a\xaa\x02\x25\x49\xdd\x53\xd4\x24\xc0\x2c\xab\
-\x16\x65\xb2\x24\x3a\x01\x49\x52\xed\x16\x47\x27\xd0\x83\xa9\x39\
-\x5e\x34\x57\x01\x30\x39\xd3\xeb\xe6\x50\xd2\x30\x90\x24\xa9\x1a\
-\x8b\xa2\x13\xe8\x41\x51\x4b\x01\x97\xa4\x94\x2d\x21\x25\x49\xaa\
-\x8c\x05\x80\x93\x00\x25\xa9\x8b\x1e\x8f\x4e\x20\x5a\xae\x02\x20\
-\xcb\x33\x8b\x92\x24\x55\x64\x24\x3a\x81\x68\xb9\x0a\x80\x0d\x32\
-\xbd\xae\x24\x49\x55\xe8\xfc\xed\x5f\x6f\x01\x48\x92\xba\xe8\xc9\
-\xe8\x04\xa2\x59\x00\x48\x92\xd4\x41\xb9\x0a\x80\xce\xdf\x5b\x91\
-\x24\x35\x5a\x49\x7b\xd6\x64\x91\xab\x00\xe8\xfc\xec\x4a\x49\x52\
-\xa3\x95\xb4\x67\xcd\xc6\x39\x5e\xd4\x5b\x00\x99\x56\x58\x92\x24\
-\xa9\x22\x59\x46\xd5\x2d\x00\x32\x55\x56\x92\x24\x55\x24\xcb\xaa\
-\x85\xb9\x0a\x80\x92\x96\x58\x74\x04\x40\x92\xba\xa7\xa4\xf5\x6a\
-\xb2\xec\x59\x93\xab\x00\x28\x69\x93\x05\x47\x00\x24\xa9\x7b\x4a\
-\x5a\xaf\x26\xcb\xae\xb5\xde\x02\x70\x04\x40\x92\xba\xa8\xa4\xa7\
-\x00\x96\xe6\x78\xd1\x5c\x05\xc0\xca\x4c\xaf\x9b\x83\x23\x00\x92\
-\xd4\x3d\x25\xdd\x02\x58\x90\xe3\x45\x73\x15\x00\x25\x6d\xb1\xeb\
-\x08\x80\x24\x75\xcf\x8c\xe8\x04\x7a\x90\x65\xd9\x62\xd7\x01\x80\
-\xcd\xa3\x13\x90\x24\xd5\xae\xa4\x02\x20\xcb\xb2\xc5\xb9\x0a\x80\
-\xf9\x99\x5e\x37\x87\x2d\xa3\x13\x67\x22\x1d\xd8\x00\x00\x1a\x47\
-\x49\x44\x41\x54\x90\x24\xd5\xae\xa4\x5b\x00\xcb\x73\xbc\xa8\x05\
-\x80\x05\x80\x24\x75\x51\x49\x05\x40\x96\xdb\xea\xb9\x0a\x80\x27\
-\x32\xbd\x6e\x0e\x5b\x44\x27\x20\x49\xaa\x5d\x49\x05\xc0\xa3\x39\
-\x5e\xd4\x11\x00\x47\x00\x24\xa9\x8b\x4a\x9a\xff\x55\x54\x01\x50\
-\xd2\x24\x40\x47\x00\x24\xa9\x7b\xb6\x89\x4e\xa0\x07\x45\x15\x00\
-\x25\x3d\x06\xe8\x08\x80\x24\x75\xcf\x0e\xd1\x09\xf4\xa0\xa8\x02\
-\xa0\xa4\x5b\x00\xdb\x45\x27\x20\x49\xaa\x5d\x29\xe7\xfe\xc5\x14\
-\xb6\x14\xf0\x72\x32\x55\x2c\x19\xec\x18\x9d\x80\x24\xa9\x76\xdb\
-\x46\x27\x30\x41\x8f\xe5\x7a\xe1\x9c\x7b\x01\x3c\x90\xf1\xb5\xab\
-\xb4\x2d\x65\xad\x09\x2d\x49\x1a\xcc\x34\x60\xab\xe8\x24\x26\x28\
-\xdb\x97\xe9\x9c\x05\xc0\x43\x19\x5f\xbb\x4a\x93\x28\x67\x28\x48\
-\x92\x34\xb8\xad\xa3\x13\xe8\x41\x91\x05\xc0\x7d\x19\x5f\xbb\x6a\
-\x33\xa3\x13\x90\x24\xd5\x66\xa7\xe8\x04\x7a\x70\x6f\xae\x17\xce\
-\x59\x00\x3c\x9c\xf1\xb5\xab\x56\xd2\x6c\x50\x49\xd2\x60\x76\x8e\
-\x4e\xa0\x07\xf7\xe7\x7a\xe1\x9c\x05\xc0\xdc\x8c\xaf\x5d\x35\x27\
-\x02\x4a\x52\x77\xec\x16\x9d\x40\x0f\xe6\xe4\x7a\xe1\x9c\x05\xc0\
-\x83\x19\x5f\xbb\x6a\xbb\x47\x27\x20\x49\xaa\x4d\x49\x05\x40\xb6\
-\x2f\xd3\x16\x00\xc9\x1e\xd1\x09\x48\x92\x6a\xb3\x6b\x74\x02\x3d\
-\xc8\x36\x9f\xce\x49\x80\x89\x05\x80\x24\x75\x47\x49\x23\x00\x45\
-\x4e\x02\xbc\x33\xe3\x6b\x57\x6d\x17\x60\x72\x74\x12\x92\xa4\xec\
-\x26\x53\xd6\x93\x5f\x45\x4e\x02\x5c\x40\x39\x6b\x01\x4c\x21\x15\
-\x01\x92\xa4\x76\x9b\x49\x39\x8b\xbf\x3d\x00\x2c\xcd\xf5\xe2\x39\
-\x0b\x00\x80\x3b\x32\xbf\x7e\x95\xbc\x0d\x20\x49\xed\xf7\xec\xe8\
-\x04\x7a\x70\x4f\xce\x17\xb7\x00\x58\x65\xcf\xe8\x04\x24\x49\xd9\
-\xed\x1b\x9d\x40\x0f\x6e\xcd\xf9\xe2\xb9\x0b\x80\x92\xe6\x01\xec\
-\x17\x9d\x80\x24\x29\xbb\x7d\xa2\x13\xe8\xc1\x6d\x39\x5f\xdc\x11\
-\x80\x55\x0e\x88\x4e\x40\x92\x94\x9d\x23\x00\xa3\x2c\x00\x56\xd9\
-\x87\xfc\xed\x21\x49\x8a\x33\x89\xb2\xe6\x00\x14\x5d\x00\x94\x74\
-\x0b\x60\x63\x5c\x11\x50\x92\xda\x6c\x37\x60\x7a\x74\x12\x3d\x28\
-\xfa\x16\xc0\x1c\xd2\xe3\x80\xa5\xf0\x36\x80\x24\xb5\x57\x49\x73\
-\xbd\x1e\x25\xe3\x56\xc0\x90\xbf\x00\x18\x01\xae\xcd\xfc\x1e\x55\
-\xda\x3f\x3a\x01\x49\x52\x36\xb3\xa3\x13\xe8\x41\xd6\xe1\x7f\xa8\
-\xe7\x9e\xf7\x8d\x35\xbc\x47\x55\x1c\x01\x90\xa4\xf6\x7a\x5e\x74\
-\x02\x3d\xb8\x25\xf7\x1b\xd4\x51\x00\xdc\x54\xc3\x7b\x54\xe5\x10\
-\x60\x28\x3a\x09\x49\x52\x16\x25\x15\x00\xbf\xcd\xfd\x06\x8e\x00\
-\x3c\xd5\xb6\xc0\xac\xe8\x24\x24\x49\x95\xdb\x1d\xd8\x32\x3a\x89\
-\x1e\x5c\x97\xfb\x0d\x1c\x01\x78\xba\x83\xa2\x13\x90\x24\x55\xae\
-\xa4\x6f\xff\x00\x37\xe4\x7e\x83\x3a\x0a\x80\xb9\xc0\x93\x35\xbc\
-\x4f\x55\x0e\x8f\x4e\x40\x92\x54\xb9\x92\x0a\x80\x47\x48\xd7\xce\
-\xac\xea\x5a\xf8\xa6\xa4\x51\x80\x23\xa2\x13\x90\x24\x55\xee\xe0\
-\xe8\x04\x7a\x70\x7d\x1d\x6f\x52\x57\x01\x90\x7d\x28\xa3\x42\x7b\
-\x01\x53\xa3\x93\x90\x24\x55\x66\x43\xe0\xb9\xd1\x49\xf4\xa0\x55\
-\x05\xc0\x35\x35\xbd\x4f\x15\x26\xe3\x3c\x00\x49\x6a\x93\x43\x49\
-\x45\x40\x29\x6a\xf9\xd2\x5c\x57\x01\x70\x65\x4d\xef\x53\x95\x17\
-\x46\x27\x20\x49\xaa\xcc\xd1\xd1\x09\xf4\xa8\x55\x23\x00\xd7\x01\
-\x4b\x6a\x7a\xaf\x2a\x58\x00\x48\x52\x7b\x94\x54\x00\x2c\xa1\x65\
-\x05\xc0\x52\x6a\x78\xa6\xb1\x42\x87\x01\xd3\xa2\x93\x90\x24\x0d\
-\x6c\x1a\xe9\x16\x40\x29\xae\x21\x5d\x33\xb3\xab\x73\xfb\xdb\x92\
-\x6e\x03\x6c\x44\x5a\x15\x50\x92\x54\xb6\x83\x29\x6b\x07\xc0\x5f\
-\xd7\xf5\x46\x16\x00\x6b\xf7\xa2\xe8\x04\x24\x49\x03\x2b\xed\x96\
-\xae\x05\x40\x03\x94\xd6\x69\x24\x49\x4f\xf7\x92\xe8\x04\x7a\xf4\
-\xab\xba\xde\xa8\xce\x02\xe0\xf7\xc0\xfc\x1a\xdf\x6f\x50\x87\x02\
-\x9b\x45\x27\x21\x49\xea\xdb\x76\x94\x75\x3b\xf7\x01\xe0\xee\xba\
-\xde\xac\xce\x02\x60\x04\xf8\xcf\x1a\xdf\x6f\x50\x53\x81\x3f\x8e\
-\x4e\x42\x92\xd4\xb7\x13\x80\x0d\xa2\x93\xe8\x41\x6d\xc3\xff\x50\
-\x6f\x01\x00\xf0\x93\x9a\xdf\x6f\x50\x2f\x8b\x4e\x40\x92\xd4\xb7\
-\x63\xa2\x13\xe8\xd1\x15\x75\xbe\x59\xdd\x05\xc0\x70\xcd\xef\x37\
-\xa8\x97\x51\x7f\x1b\x49\x92\x06\x37\x89\xf2\xe6\x72\xfd\xbc\xce\
-\x37\xab\xfb\xe2\x76\x25\xb0\xa8\xe6\xf7\x1c\xc4\xb6\x94\xb5\x7e\
-\xb4\x24\x29\x99\x0d\x3c\x23\x3a\x89\x1e\x2c\xa0\xe6\xdb\xe4\x75\
-\x17\x00\x4b\xa8\x79\x88\xa3\x02\xc7\x45\x27\x20\x49\xea\x59\x69\
-\xe7\xee\x5f\x50\xd3\x02\x40\x63\x22\x86\xb7\x4b\x9b\x07\xf0\xf2\
-\xe8\x04\x24\x49\x3d\x7b\x75\x74\x02\x3d\xfa\x71\xdd\x6f\x18\x51\
-\x00\x0c\x07\xbc\xe7\x20\x66\x03\xbb\x46\x27\x21\x49\x9a\xb0\x67\
-\x03\xfb\x46\x27\xd1\xa3\x1f\xd5\xfd\x86\x11\x05\xc0\xaf\x81\xc5\
-\x01\xef\x3b\x88\x93\xa3\x13\x90\x24\x4d\xd8\x6b\xa3\x13\xe8\xd1\
-\x7c\xe0\xea\xba\xdf\x34\xa2\x00\x58\x4c\x79\xf3\x00\x4e\x8a\x4e\
-\x40\x92\x34\x61\xa5\x9d\xb3\x7f\x02\xac\xa8\xfb\x4d\xa3\x1e\x71\
-\xfb\x7e\xd0\xfb\xf6\xeb\x20\x60\xf7\xe8\x24\x24\x49\xeb\xb5\x3b\
-\x30\x2b\x3a\x89\x1e\xd5\x7e\xff\x1f\xe2\x0a\x80\xef\x06\xbd\xef\
-\x20\x4a\xab\x28\x25\xa9\x8b\x5e\x13\x9d\x40\x1f\xfe\x23\xe2\x4d\
-\xa3\x0a\x80\xeb\x80\x39\x41\xef\xdd\x2f\xe7\x01\x48\x52\xf3\x9d\
-\x12\x9d\x40\x8f\xe6\x00\xd7\x47\xbc\x71\xe4\x2a\x77\xdf\x0c\x7c\
-\xef\x7e\x1c\x08\xec\x1d\x9d\x84\x24\x69\xad\xf6\x07\x0e\x88\x4e\
-\xa2\x47\x97\x47\xbd\x71\x64\x01\x70\x59\xe0\x7b\xf7\xeb\x4f\xa3\
-\x13\x90\x24\xad\xd5\xa9\xd1\x09\xf4\xe1\xdb\x51\x6f\x1c\x59\x00\
-\xfc\x12\x58\x16\xf8\xfe\xfd\x78\x23\xee\x0d\x20\x49\x4d\x34\x05\
-\x78\x7d\x74\x12\x3d\x7a\x82\x80\xe7\xff\xc7\x44\x5e\xcc\x16\x52\
-\xf3\xc6\x07\x15\xd8\x89\xf2\x76\x97\x92\xa4\x2e\x78\x25\xb0\x7d\
-\x74\x12\x3d\xfa\x1e\x81\xfb\xe3\x44\x7f\x9b\x2d\xf1\x69\x00\x6f\
-\x03\x48\x52\xf3\x38\xfc\xdf\xa3\xe8\x02\xa0\xb4\x89\x80\x00\x27\
-\x02\x33\xa2\x93\x90\x24\xfd\x97\x19\x94\x39\x3a\x1b\xba\x26\x4e\
-\x74\x01\x70\x1b\x69\x07\xa4\x92\x4c\xa7\xbc\x65\x26\x25\xa9\xcd\
-\x4e\x05\x36\x8c\x4e\xa2\x47\xd7\x02\x0f\x46\x26\x10\x5d\x00\x00\
-\x7c\x23\x3a\x81\x3e\x9c\x16\x9d\x80\x24\xe9\xbf\xbc\x2d\x3a\x81\
-\x3e\x5c\x14\x9d\x40\x13\x0a\x80\x12\x1f\x07\x3c\x08\x38\x34\x3a\
-\x09\x49\x12\x47\x53\xde\xd2\xbf\xd0\x80\x2f\xbf\x4d\x28\x00\xee\
-\x00\x6e\x8a\x4e\xa2\x0f\xef\x88\x4e\x40\x92\xc4\xdb\xa3\x13\xe8\
-\xc3\x75\xc0\xcd\xd1\x49\x34\xa1\x00\x80\x06\x54\x42\x7d\x38\x09\
-\xd8\x31\x3a\x09\x49\xea\xb0\x6d\x49\x13\xb3\x4b\xd3\x88\x6b\x9e\
-\x05\x40\xff\xa6\x01\xef\x8a\x4e\x42\x92\x3a\xec\x2d\xc0\xd4\xe8\
-\x24\xfa\xf0\xf5\xe8\x04\xa0\x39\x05\xc0\x8d\xc0\xed\xd1\x49\xf4\
-\xe1\x54\x60\x83\xe8\x24\x24\xa9\x83\xa6\x50\xe6\xe4\xbf\x6b\x81\
-\x5b\xa3\x93\x80\xe6\x14\x00\x00\x17\x44\x27\xd0\x87\xed\x49\xab\
-\x4f\x49\x92\xea\xf5\x5a\x60\x66\x74\x12\x7d\x68\xc4\xb7\x7f\x68\
-\x56\x01\x70\x7e\x74\x02\x7d\xfa\x1f\xd1\x09\x48\x52\xc7\x0c\x01\
-\xef\x8d\x4e\xa2\x4f\x8d\xb9\xe5\xdd\xa4\x02\xe0\x56\xe0\x57\xd1\
-\x49\xf4\xe1\x10\xe0\xa8\xe8\x24\x24\xa9\x43\x8e\x03\x9e\x13\x9d\
-\x44\x1f\x7e\x41\x5a\x00\xaf\x11\x9a\x54\x00\x00\x9c\x17\x9d\x40\
-\x9f\xde\x17\x9d\x80\x24\x75\xc8\xfb\xa3\x13\xe8\xd3\xb9\xd1\x09\
-\x8c\xd7\xb4\x02\xe0\x6b\xa4\x5d\x02\x4b\xf3\x32\x60\xdf\xe8\x24\
-\x24\xa9\x03\xf6\x03\x0e\x8f\x4e\xa2\x0f\x4f\x92\xae\x71\x8d\xd1\
-\xb4\x02\xe0\x31\x1a\xb0\x3c\x62\x1f\x86\x70\x2e\x80\x24\xd5\xe1\
-\xaf\xa3\x13\xe8\xd3\x05\xc0\xfc\xe8\x24\xc6\x6b\x5a\x01\x00\xe5\
-\xde\x06\x38\x85\x32\x67\xa4\x4a\x52\x29\xf6\x00\x5e\x1f\x9d\x44\
-\x9f\x1a\x37\xd1\xbd\x89\x05\xc0\x8f\x81\x87\xa2\x93\xe8\xc3\x14\
-\xe0\x83\xd1\x49\x48\x52\x8b\x7d\x18\x98\x1c\x9d\x44\x1f\xee\x01\
-\x7e\x19\x9d\xc4\xea\x9a\x58\x00\xac\xa0\xdc\x51\x80\xb7\x00\xcf\
-\x8c\x4e\x42\x92\x5a\x68\x2f\xe0\x0d\xd1\x49\xf4\xe9\x3c\x60\x24\
-\x3a\x89\xd5\x35\xb1\x00\x00\x38\x8b\x54\x08\x94\x66\x2a\xf0\x37\
-\xd1\x49\x48\x52\x0b\xfd\x23\x65\x7e\xfb\x5f\x49\xc3\x66\xff\x8f\
-\x69\x6a\x01\x70\x1b\x70\x71\x74\x12\x7d\x7a\x13\xb0\x67\x74\x12\
-\x92\xd4\x22\xbb\x01\xaf\x8e\x4e\xa2\x4f\x97\xd3\xa0\x67\xff\xc7\
-\x6b\x6a\x01\x00\xf0\xb9\xe8\x04\xfa\x34\x05\xf8\xdf\xd1\x49\x48\
-\x52\x8b\x7c\x98\x66\x5f\xaf\xd6\xe5\xf4\xe8\x04\xd6\xa6\xc9\x0d\
-\xfa\x23\xe0\xbe\xe8\x24\xfa\xf4\x6a\x1c\x05\x90\xa4\x2a\xcc\x22\
-\x6d\xbc\x56\xa2\xbb\x49\xd7\xb2\x46\x6a\x72\x01\x30\x02\x9c\x1d\
-\x9d\x44\x9f\x26\x01\xff\x10\x9d\x84\x24\xb5\xc0\x47\x29\x77\xd7\
-\xd5\x33\x69\xe0\xe4\xbf\x52\xec\x00\x2c\x23\x4d\xa2\x28\x2d\x46\
-\x48\xfb\x04\x48\x55\x38\x89\xf8\x3e\x3d\xd1\x38\x29\x53\x1b\xa8\
-\x7b\x8e\x24\xbe\x3f\xf7\x1b\x0b\x81\xad\xab\x6f\x92\xea\x34\x79\
-\x04\x00\x60\x2e\x70\x69\x74\x12\x7d\x1a\x02\x3e\x3e\xfa\x53\x92\
-\xd4\x9b\x21\xe0\xff\x46\x27\x31\x80\xf3\x81\x87\xa3\x93\x58\x97\
-\xa6\x17\x00\xd0\xe0\x09\x14\x13\x70\x04\xf0\x9a\xe8\x24\x24\xa9\
-\x40\x6f\x04\x0e\x8d\x4e\x62\x00\x8d\x9f\xc8\x5e\x42\x01\xf0\x53\
-\xca\xdc\x26\x78\xcc\x3f\x92\x9e\x0c\x90\x24\x4d\xcc\x14\xe0\xef\
-\xa3\x93\x18\xc0\x55\xc0\xd5\xd1\x49\xac\x4f\x09\x05\x00\xc0\x3f\
-\x47\x27\x30\x80\xbd\x80\xd3\xa2\x93\x90\xa4\x82\xfc\x25\x65\xaf\
-\xaa\xfa\xb1\xe8\x04\xda\x64\x12\x70\x33\xf1\x93\x3a\xfa\x8d\x87\
-\x81\x2d\x2b\x6f\x15\x75\x89\x93\x00\xd5\x15\xdb\x03\x8f\x13\xdf\
-\x8f\xfb\x8d\xdb\x28\xe4\xa9\x85\x52\x46\x00\x46\x80\x7f\x89\x4e\
-\x62\x00\xcf\x00\xfe\x29\x3a\x09\x49\x2a\xc0\xff\x01\x36\x8b\x4e\
-\x62\x00\xff\x4a\x99\x4b\xd9\x37\xda\xc6\xc0\x23\xc4\x57\x77\xfd\
-\xc6\x0a\xe0\x79\x95\xb7\x8a\xba\xc2\x11\x00\x75\xc1\xe1\xa4\x2f\
-\x7c\xd1\x7d\xb8\xdf\xb8\x0f\x98\x5e\x79\xab\x64\x52\xca\x08\x00\
-\xc0\x02\xe0\xd3\xd1\x49\x0c\x60\x12\xf0\x19\x0a\x19\x1a\x92\xa4\
-\x9a\x6d\x00\x7c\x8a\xb2\x1f\x9d\xfe\xbf\xc0\xa2\xe8\x24\x26\xaa\
-\xa4\x02\x00\xd2\x05\x74\x49\x74\x12\x03\x78\x2e\xf0\xce\xe8\x24\
-\x24\xa9\x81\x4e\x03\x0e\x8c\x4e\x62\x00\x0b\x80\x73\xa2\x93\xe8\
-\x45\x69\x05\xc0\x43\xc0\xe7\xa3\x93\x18\xd0\x47\x68\xf8\xea\x50\
-\x92\x54\xb3\x9d\x28\x7f\x9e\xd4\xe7\x81\xf9\xd1\x49\xf4\xa2\xb4\
-\x02\x00\xd2\xba\xd0\x8b\xa3\x93\x18\xc0\xe6\xa4\x15\x02\x25\x49\
-\xc9\x67\x49\xe7\xc6\x52\x2d\x26\x4d\xfe\x2b\x4a\x89\x05\xc0\xbd\
-\x14\xb0\xc2\xd2\x7a\x9c\x0a\xbc\x22\x3a\x09\x49\x6a\x80\x53\x81\
-\xe3\xa2\x93\x18\xd0\xe7\x80\x7b\xa2\x93\xe8\x8a\x99\xa4\x89\x16\
-\xd1\x33\x3e\x07\x89\xb9\x94\xfd\xa8\x8b\xea\xe5\x53\x00\x6a\xa3\
-\xad\x80\xfb\x89\xef\xb3\x83\xc4\x62\xd2\x2d\x8c\xe2\x94\x38\x02\
-\x00\x30\x87\xf2\x47\x01\xb6\x27\x3d\xef\x2a\x49\x5d\xf5\x09\x60\
-\xbb\xe8\x24\x06\x74\x36\x69\x64\x5a\x35\x9a\x49\x7a\x22\x20\xba\
-\xfa\x1b\x24\x46\x80\x17\x57\xdd\x30\x6a\x25\x47\x00\xd4\x36\x2f\
-\xa4\xec\x67\xfe\x57\x92\xb6\xfc\xdd\xa1\xea\x86\xa9\x4b\xa9\x23\
-\x00\x90\x46\x01\xce\x89\x4e\x62\x40\x43\xa4\xea\x71\xa3\xe8\x44\
-\x24\xa9\x46\x5b\x90\xce\xdf\x25\x3f\xf3\x0f\xf0\x49\xd2\xed\xdc\
-\x22\x95\x5c\x00\x40\xda\x24\xa8\xe4\x27\x02\x00\x76\x25\x3d\xd9\
-\x20\x49\x5d\x71\x16\x65\x6f\xf6\x03\xe9\xdb\x7f\xc9\x4b\xd4\x17\
-\x5f\x00\xdc\x0d\x9c\x1e\x9d\x44\x05\xde\x09\xbc\x34\x3a\x09\x49\
-\xaa\xc1\xab\x69\xc7\x6d\xa2\xcf\x92\x36\x7a\x53\xa0\x2d\x80\x47\
-\x89\xbf\x17\x34\x68\x3c\x00\x6c\x53\x71\xdb\xa8\x3d\x9c\x03\xa0\
-\x36\xd8\x91\x74\xd1\x8c\xee\xa3\x83\xc6\x63\xa4\x4d\xde\x8a\x56\
-\xfa\x08\x00\xa4\x0f\xe2\x9f\xa3\x93\xa8\xc0\xb6\xc0\x17\x28\xff\
-\x9e\x98\x24\xad\xc9\x10\xf0\x45\x5a\x70\xe1\x24\xad\xe8\xfa\x48\
-\x74\x12\x4a\x36\x04\xee\x20\xbe\x2a\xac\x22\xde\x5d\x71\xdb\xa8\
-\x1d\x1c\x01\x50\xe9\xde\x41\x7c\xdf\xac\x22\xee\x02\xa6\x56\xdb\
-\x34\x31\xda\x30\x02\x00\x69\x22\xe0\xfb\xa3\x93\xa8\xc8\x47\x81\
-\x59\xd1\x49\x48\x52\x85\x0e\xa1\xf0\x09\x73\xe3\x7c\x08\x58\x1a\
-\x9d\x44\x15\xda\x52\x00\x00\x5c\x04\x5c\x17\x9d\x44\x05\x36\x04\
-\xbe\x06\x6c\x1c\x9d\x88\x24\x55\x60\x33\xd2\x39\x6d\x5a\x74\x22\
-\x15\xf8\x25\xf0\x95\xe8\x24\xaa\xd2\xa6\x02\x60\x84\xf6\x8c\x02\
-\xec\x4b\x7a\x4c\x46\x92\x4a\x77\x36\xe5\x3f\xf2\x37\xe6\xbd\xa4\
-\xdb\x00\xad\xd0\xa6\x02\x00\xe0\xfb\xc0\xb7\xa3\x93\xa8\xc8\x1b\
-\x48\xfb\x63\x4b\x52\xa9\xfe\x02\x38\x39\x3a\x89\x8a\x5c\x0a\x5c\
-\x11\x9d\x84\xd6\x6d\x77\xca\xdf\x28\x68\x2c\x16\x91\xee\x9d\x49\
-\x4e\x02\x54\x69\x0e\xa4\x3d\xe7\xe2\xc5\xc0\xb3\xaa\x6d\x9e\x78\
-\x6d\x1b\x01\x00\xb8\x9d\xf6\x6c\xb2\xb3\x21\xf0\x75\xd2\x5a\x07\
-\x92\x54\x8a\xad\x48\xf3\xb2\x36\x8c\x4e\xa4\x22\x1f\x05\x7e\x1f\
-\x9d\x84\x26\x66\x23\xd2\xa3\x1a\xd1\x55\x63\x55\x71\x29\xed\x2c\
-\xd6\x34\x71\x8e\x00\xa8\x14\x53\x80\x1f\x12\xdf\x0f\xab\x8a\xbb\
-\x68\xe9\x7e\x2d\x6d\xbd\xa8\x2c\x04\xde\x15\x9d\x44\x85\x8e\x07\
-\xfe\x21\x3a\x09\x49\x9a\x80\x4f\xd3\xae\x5d\x4e\xdf\x45\xba\xa6\
-\xa8\x30\x3f\x22\xbe\x7a\xac\x2a\x46\x80\x53\xaa\x6d\x1e\x15\xc4\
-\x11\x00\x95\xe0\x54\xe2\xfb\x5f\x95\xf1\xfd\x6a\x9b\x47\x75\xda\
-\x07\x58\x46\x7c\x27\xaa\x2a\x16\x01\x07\x57\xda\x42\x2a\x85\x05\
-\x80\x9a\xee\x79\xb4\x67\xd2\xdf\xd8\xf9\x76\xaf\x4a\x5b\xa8\x61\
-\xda\x7a\x0b\x60\xcc\x8d\xc0\xbf\x45\x27\x51\xa1\x0d\x81\x4b\x80\
-\x9d\xa3\x13\x91\xa4\x71\x76\x00\x2e\xa6\x3d\x93\xfe\x20\x4d\x26\
-\xbf\x25\x3a\x09\x0d\x66\x23\xd2\xec\xcd\xe8\x6a\xb2\xca\xf8\x0d\
-\x2d\x9d\x94\xa2\xb5\x72\x04\x40\x4d\xb5\x19\xe9\x9c\x14\xdd\xef\
-\xaa\x8c\x3b\x81\xe9\x55\x36\x52\x13\xb5\x7d\x04\x00\xd2\xe4\x8d\
-\x3f\x27\x7d\xa8\x6d\xf1\x1c\xe0\x7c\xba\xf1\xf9\x49\x6a\xae\xc9\
-\xc0\x85\xa4\x73\x52\x5b\xac\x04\xde\x4e\xba\x05\xd0\x6a\x5d\xb9\
-\x80\xfc\x8c\xb4\x1c\x65\x9b\xbc\x0a\xf8\x64\x74\x12\x92\x3a\xed\
-\x0c\xe0\x8f\xa2\x93\xa8\xd8\xd9\xc0\xf7\xa2\x93\x50\xb5\x36\x07\
-\xe6\x10\x3f\xb4\x54\x75\x7c\xb0\xca\x46\x52\x63\x79\x0b\x40\x4d\
-\xf3\x11\xe2\xfb\x5a\xd5\x31\x97\x74\xad\x50\x0b\x1d\x4f\x7c\x07\
-\xab\x3a\x46\x48\x8f\xde\xa8\xdd\x5e\x41\x7c\x5f\x9b\x68\x9c\x90\
-\xa9\x0d\xd4\x1c\xa7\x90\xce\x3d\xd1\x7d\xad\xea\x78\x65\x95\x8d\
-\xa4\xe6\xf9\x26\xf1\x9d\xac\xea\x58\x0a\xbc\xb4\xca\x46\x52\xe3\
-\x1c\x43\x7c\x3f\x9b\x68\xbc\x28\x53\x1b\xa8\x19\x5e\x0a\x2c\x21\
-\xbe\x9f\x55\x1d\xee\xc0\xda\x01\x3b\x00\xf3\x88\xef\x6c\x55\xc7\
-\x93\xa4\xe7\x70\xd5\x4e\xfb\x11\xdf\xc7\x26\x1a\xb3\x32\xb5\x81\
-\xe2\xbd\x08\x58\x40\x7c\x1f\xab\x3a\x1e\xc2\x3d\x57\x3a\xe3\xb5\
-\xc4\x77\xb8\x1c\x31\x0f\x38\xa0\xc2\x76\x52\x73\x6c\x08\xac\x20\
-\xbe\x8f\xad\x2f\x96\x03\xd3\x32\xb5\x81\x62\xcd\x06\x9e\x20\xbe\
-\x8f\xe5\x08\xe7\xad\x74\xcc\x59\xc4\x77\xba\x1c\xf1\x10\x7e\x03\
-\x6b\xab\x12\xd6\xb3\xb8\x29\xdb\x5f\xaf\x48\xfb\x92\xce\x2d\xd1\
-\xfd\x2b\x47\x5c\x58\x61\x3b\xa9\x10\x33\x80\x7b\x88\xef\x7c\x39\
-\x62\x2e\xb0\x67\x75\x4d\xa5\x86\x38\x93\xf8\xbe\xb5\xbe\x38\x23\
-\xdb\x5f\xaf\x28\xcf\x24\x9d\x53\xa2\xfb\x56\x8e\x98\x43\xda\xba\
-\x58\x1d\xf4\x62\xda\x39\x93\x75\x25\xa9\xb8\xd9\xbd\xba\xa6\x52\
-\x03\x9c\x48\x7c\xbf\x5a\x5f\xf8\x04\x40\xbb\xec\x0a\xdc\x41\x7c\
-\xbf\xca\x11\x2b\x70\xc2\x6a\xe7\x9d\x4e\x7c\x47\xcc\x15\x77\x01\
-\x3b\x55\xd6\x52\x8a\x36\x8d\x66\x4f\x60\x7d\x04\x98\x9a\xed\xaf\
-\x57\xdd\x76\x01\xee\x26\xbe\x5f\xe5\x8a\x8f\x57\xd6\x52\x2a\xd6\
-\x74\xd2\x7d\xcb\xe8\xce\x98\x2b\x6e\x27\x55\xf1\x6a\x87\x4f\x10\
-\xdf\xa7\xd6\x16\xff\x92\xf1\xef\x56\xbd\x76\x23\x7d\x81\x88\xee\
-\x53\xb9\xe2\x5a\x9c\xac\xaa\x51\xb3\x81\xc5\xc4\x77\xca\x5c\x31\
-\x07\xe7\x04\xb4\xc5\x4c\x9a\xf9\x0c\xf6\x62\x60\xc7\x8c\x7f\xb7\
-\xea\xb3\x3b\xed\x9d\x1f\xb5\x92\xb4\x3f\x8c\x13\xa5\xf5\x14\xef\
-\x24\xbe\x63\xe6\x8c\xb9\xc0\x3e\x95\xb5\x96\x22\x35\xf1\xb6\x95\
-\xc3\xa9\xed\xb0\x07\xed\xbe\xf8\xaf\x24\x9d\xeb\xa5\xa7\xb9\x90\
-\xf8\xce\x99\x33\x1e\xc2\x75\x02\xda\x60\x06\xcd\x9a\x95\x7d\x2f\
-\xb0\x69\xd6\xbf\x58\x75\x38\x10\xb8\x9f\xf8\xfe\x94\x33\xbe\x05\
-\x0c\x55\xd5\x60\x6a\x97\x19\xc0\xad\xc4\x77\xd2\x9c\x31\x0f\x57\
-\x0c\x6c\x83\x97\xd0\x8c\x85\x81\x56\x90\x96\x29\x56\xd9\x8e\x00\
-\xfe\x40\x7c\x7f\xca\x19\xb7\xe3\x6a\x7f\x5a\x8f\xb6\xcf\x07\x58\
-\x49\x5a\xcd\xeb\xd8\xaa\x1a\x4c\x61\xfe\x9e\xf8\xbe\xf4\xb7\xd9\
-\xff\x4a\xe5\xf6\x32\xda\xb9\xbc\xef\xf8\x58\x44\x3a\xb7\x4b\xeb\
-\xd5\xf6\xf9\x00\x2b\x49\x1b\x08\xb9\x8b\x60\xd9\x86\x80\x2f\x12\
-\xd7\x87\x3e\x8f\xc3\xa9\xa5\x7b\x13\xe9\x5c\x10\x7d\x3e\xca\x1d\
-\xa7\x55\xd4\x5e\xea\x88\x6f\x10\xdf\x69\x73\xc7\x08\xf0\x81\xaa\
-\x1a\x4c\x21\x36\x20\xa6\x08\x38\x7b\xf4\xbd\x55\xae\x77\xd3\xde\
-\x85\xd0\xc6\xc7\xb9\x55\x35\x98\xba\x63\x06\x65\xac\xbd\x5e\x45\
-\x7c\x16\x98\x54\x4d\xb3\x29\xc0\x10\xe9\x76\x40\x1d\x73\x02\x96\
-\x03\x7f\x87\xdf\xfc\x4b\x36\x99\xf6\xee\x85\xb2\x7a\x5c\x07\x6c\
-\x54\x4d\xb3\xa9\x6b\x9e\x45\xfb\x27\xc6\x8c\xc5\x45\xc0\xc6\xd5\
-\x34\x9b\x82\xbc\x84\xbc\x4f\x07\xdc\x07\xbc\xb0\xb6\xbf\x46\x39\
-\x6c\x02\x7c\x87\xf8\xf3\x4d\x1d\x31\x1f\xd8\xab\x9a\x66\x53\x57\
-\x1d\x47\x33\x66\x5b\xd7\x11\xd7\xe0\x62\x2e\xa5\xdb\x0c\xf8\x37\
-\xaa\x5d\x2c\x68\x31\xf0\xaf\xa3\xaf\xad\x72\xed\x04\xfc\x86\xf8\
-\xf3\x4c\x1d\xb1\x82\xb4\x77\x86\x34\xb0\xbf\x21\xbe\x43\xd7\x15\
-\x73\x81\x43\xaa\x69\x36\x05\x9a\x49\x2a\x04\x06\xd9\x3b\xe0\x11\
-\xd2\xd2\xc3\xee\x27\x51\xbe\xd9\xa4\x11\x9c\xe8\xf3\x4b\x5d\xf1\
-\xfe\x6a\x9a\x4d\x4a\xf7\x3b\xbb\x30\x29\x70\x2c\x16\x01\xaf\xaf\
-\xa4\xe5\x14\x6d\x1a\xe9\x9b\xd0\x99\xa4\x39\x2d\xeb\x1a\xcd\x5a\
-\x31\xfa\xdf\x9c\x09\xbc\x12\x37\xf6\x69\x8b\xd7\x01\x4f\x12\x7f\
-\x5e\xa9\x2b\xbe\x82\x73\x54\x54\xb1\x4d\x80\xeb\x89\xef\xdc\x75\
-\xc5\x08\xf0\x8f\x38\x39\xb0\x6d\xa6\x03\xfb\x91\xb6\xc2\x7e\xc5\
-\x68\xbc\x78\xf4\xdf\x6d\x18\x98\x97\xaa\x37\x19\xf8\x18\xf1\xe7\
-\x92\x3a\xe3\x4a\x52\x1f\x97\x2a\xb7\x1b\x69\x58\x34\xba\x93\xd7\
-\x19\x97\x02\x5b\x55\xd1\x78\x92\x6a\xb3\x35\xf0\x1f\xc4\x9f\x3f\
-\xea\x8c\x7b\x70\x0e\x93\x32\x3b\x92\xf6\xaf\x14\xb8\x7a\xdc\x05\
-\x1c\x54\x41\xdb\x49\xca\x6f\x36\x70\x37\xf1\xe7\x8d\x3a\x63\x21\
-\x69\x2f\x03\x29\xbb\xd7\xd1\x8d\x05\x34\xc6\xc7\x62\x5c\x4d\x4b\
-\x6a\xba\x37\x93\x2e\x86\xd1\xe7\x8b\x3a\x63\x04\x38\xa5\x8a\xc6\
-\x93\x26\xea\x03\xc4\x77\xfc\x88\xb8\x00\xd7\x0b\x90\x9a\x66\x53\
-\xe0\x7c\xe2\xcf\x0f\x11\xf1\xe1\x0a\xda\x4f\xea\xd9\x19\xc4\x77\
-\xfe\x88\xb8\x01\x98\x55\x41\xfb\x49\x1a\xdc\x6c\xe0\x16\xe2\xcf\
-\x0b\x11\xf1\xd9\x0a\xda\x4f\xea\xcb\x06\x74\x67\x55\xad\xd5\x63\
-\x21\xf0\x17\xf8\xb8\x8d\x14\x65\x08\x78\x17\xdd\x9b\x93\x34\x16\
-\xdf\xc4\xfd\x28\x14\x6c\x13\xd2\x0a\x7a\xd1\x07\x43\x54\x5c\x06\
-\x6c\x37\x70\x2b\x4a\xea\xc5\x36\xc0\x25\xc4\x1f\xff\x51\xf1\x53\
-\x7c\xdc\x4f\x0d\xb1\x03\x70\x07\xf1\x07\x45\x54\x3c\x48\x5a\x32\
-\x59\x52\x7e\xaf\x02\x1e\x22\xfe\xb8\x8f\x8a\x9b\x80\x2d\x06\x6e\
-\x45\xa9\x42\xbb\x93\x77\x23\x96\xa6\xc7\x08\xf0\x49\x9c\x20\x28\
-\xe5\x32\x03\x38\x87\xf8\x63\x3d\x32\xee\x03\x9e\x39\x68\x43\x4a\
-\x39\xec\xcb\x60\x6b\xaf\xb7\x21\xee\x00\x5e\x30\x60\x3b\x4a\x7a\
-\xaa\x97\xd0\xbd\x67\xfb\x57\x8f\x47\x80\x03\x06\x6d\x48\x29\xa7\
-\x43\x48\xdb\x50\x46\x1f\x2c\x91\x31\x42\x9a\x9d\xbb\xf9\x80\x6d\
-\x29\x75\xdd\x26\xc0\xa7\xe8\xde\xba\x23\xab\xc7\x7c\xe0\xb9\x03\
-\xb6\xa5\x54\x8b\x17\xd0\xdd\x99\xb9\xe3\xe3\x5e\xe0\xd8\xc1\x9a\
-\x52\xea\xac\x13\xf0\x5b\xff\x4a\x60\x01\x70\xd4\x80\x6d\x29\xd5\
-\xea\x95\xc0\x32\xe2\x0f\x9e\x26\xc4\xb9\xa4\xb5\xc9\x25\xad\xdf\
-\x8e\xc0\x85\xc4\x1f\xb7\x4d\x88\x45\xc0\x1f\x0d\xd6\x9c\x52\x8c\
-\x37\x02\xcb\x89\x3f\x88\x9a\x10\xf3\x80\xb7\xe1\x73\xbb\xd2\xda\
-\x4c\x02\xde\x01\x3c\x4e\xfc\xf1\xda\x84\x58\x8c\x4f\x17\xa9\x70\
-\xaf\xc3\x22\x60\x7c\x5c\x45\x9a\x27\x21\x69\x95\x83\x81\x5f\x11\
-\x7f\x7c\x36\x25\x96\x01\xc7\x0f\xd4\xa2\x52\x43\x38\x12\xf0\xd4\
-\x58\x01\x9c\x09\x6c\x39\x48\xa3\x4a\x2d\xb0\x3d\xf0\x05\xd2\x31\
-\x11\x7d\x5c\x36\x25\x56\x00\x7f\x32\x48\xa3\x4a\x4d\xf3\x06\x2c\
-\x02\x56\x8f\x87\x49\x43\x9e\x53\x06\x68\x57\xa9\x44\xd3\x80\xf7\
-\xe1\x13\x43\xab\xc7\x32\xbc\xf8\xab\xa5\x4e\xc1\x89\x81\x6b\x8a\
-\x9b\x49\x93\x26\xdd\x57\x40\x5d\xf0\x0a\xe0\x56\xe2\x8f\xbb\xa6\
-\xc5\x52\xe0\x35\x03\xb4\xab\xd4\x78\xaf\xc1\x22\x60\x6d\xf1\x4b\
-\x9c\x1f\xa0\xf6\x3a\x0c\x18\x26\xfe\x38\x6b\x62\x2c\xc2\x09\x7f\
-\xea\x88\x93\x70\x9d\x80\xb5\xc5\x08\xf0\x15\x60\xcf\xbe\x5b\x57\
-\x6a\x96\xe7\x00\x97\x12\x7f\x6c\x35\x35\x9e\x00\x8e\xe9\xbb\x75\
-\xa5\x02\x1d\x43\x5a\xe0\x22\xfa\xe0\x6b\x6a\x2c\x03\xbe\x08\xec\
-\xd6\x6f\x03\x4b\xc1\x76\x07\xce\xc7\x09\x7e\xeb\x8a\xf9\xa4\x91\
-\x11\xa9\x73\x9e\x8f\x7b\x07\xac\x2f\x96\x02\x67\xe1\x06\x20\x2a\
-\xc7\x2e\xa4\xa5\xb0\x97\x12\x7f\xfc\x34\x39\x1e\xc3\x5b\x7e\xea\
-\xb8\x7d\x49\x3b\x5c\x45\x1f\x8c\x4d\x8f\x25\xc0\x67\x80\x99\xfd\
-\x35\xb3\x94\xdd\xde\xa4\xdd\xfa\xbc\xf0\xaf\x3f\xee\xc1\x8d\x7d\
-\x24\x00\x76\xc5\x59\xc1\x13\x8d\xa5\xa4\xa5\x85\xf7\xed\xab\xa5\
-\xa5\xea\xed\x0f\x7c\x15\x1f\xf3\x9d\x68\xfc\x0e\xd8\xa9\xaf\x96\
-\x96\x5a\x6a\x3b\xe0\x5a\xe2\x0f\xce\x52\x62\x04\xf8\x36\x6e\x12\
-\xa2\x38\x47\x02\xdf\xc2\x9d\xfa\x7a\x89\x9f\x01\x5b\xf5\xd3\xd8\
-\x52\xdb\x6d\x0e\xfc\x90\xf8\x83\xb4\xb4\xf8\x35\xf0\x6a\xdc\x67\
-\x40\xf9\x6d\x08\x9c\x0a\x5c\x4d\x7c\xbf\x2f\x2d\x2e\x01\xa6\xf7\
-\xde\xe4\x52\x77\x4c\x21\xdd\x47\x8c\x3e\x58\x4b\x8c\xbb\x81\x0f\
-\x01\xdb\xf6\xdc\xea\xd2\xba\x6d\x0b\xfc\x1d\xf0\x20\xf1\xfd\xbc\
-\xc4\xf8\x24\x16\xe8\xd2\x84\xfd\x0d\x0e\x2d\xf6\x1b\x8b\x49\x8f\
-\x5f\x1d\xda\x73\xab\x4b\xab\x0c\x01\x87\x03\x5f\xc2\x75\x3b\xfa\
-\x8d\x11\xe0\xc3\x3d\xb6\xbb\x24\xe0\xb5\xb8\x56\xc0\xa0\x71\x0d\
-\x70\x1a\x30\xa3\xc7\xb6\x57\x77\x6d\x0d\xfc\x15\x69\xb2\x5a\x74\
-\xff\x2d\x39\x16\x01\xaf\xef\xb1\xed\x25\x8d\xf3\x3c\xe0\x21\xe2\
-\x0f\xe6\xd2\x63\x21\x70\x01\xf0\xc7\x38\x14\xa9\xa7\x9b\x04\xbc\
-\x98\x34\x9b\x7f\x09\xf1\xfd\xb5\xf4\xb8\x8f\xb4\xc5\xb1\xa4\x01\
-\xed\x06\xdc\x44\xfc\x41\xdd\x96\x98\x03\xfc\x6f\xd2\x73\xdb\xea\
-\xb6\xfd\x81\x7f\x06\xee\x22\xbe\x5f\xb6\x25\x7e\x0d\xec\xd8\xc3\
-\x67\x20\x69\x3d\x66\xe0\x7a\xe2\x39\xe2\x6a\xe0\x03\xa4\x65\x5b\
-\xd5\x0d\xbb\x93\xe6\xd8\x58\x54\x57\x1f\x5f\xc5\x99\xfe\x52\x16\
-\x93\x80\x8f\xe0\xda\xe2\xb9\xe2\x4a\xe0\xfd\xb8\xff\x40\x1b\xed\
-\x05\xbc\x17\xb8\x02\x27\xd7\xe6\x88\x11\xe0\x7f\xe2\x96\xde\x52\
-\x76\xc7\x03\x7f\x20\xfe\xa0\x6f\x6b\x8c\x90\x46\x06\xfe\x17\xe9\
-\x3e\xe6\xa4\x89\x7d\x2c\x6a\x90\x49\xa4\xa7\x40\xfe\x09\xb8\x91\
-\xf8\x3e\xd5\xe6\x78\x1c\x78\xd5\xc4\x3e\x16\x49\x55\xd8\x1b\xf8\
-\x2d\xf1\x07\x7f\x17\xe2\x01\xe0\x0b\xc0\x6b\x80\xcd\x26\xf2\xe1\
-\x28\xc4\x16\xc0\x89\xc0\xe7\x80\xfb\x89\xef\x37\x5d\x88\x1b\x70\
-\xeb\x6e\x29\xc4\x26\xc0\xc5\xc4\x9f\x04\xba\x14\x4b\x80\x9f\x90\
-\x6e\xc5\x1c\x05\x4c\x5b\xdf\x87\xa4\x6c\xa6\x01\x47\x03\xff\x00\
-\xfc\x0a\xd7\xe2\xaf\x3b\xbe\x04\x6c\xbc\xbe\x0f\x49\x52\x3e\x43\
-\xa4\xfb\xd6\xee\x40\x16\x13\x0b\x80\xff\x07\x7c\x90\xb4\xbd\xf3\
-\xd4\x75\x7f\x5c\x1a\xc0\x74\xd2\xfa\xfb\x1f\x00\x2e\x07\x9e\x24\
-\xfe\xf3\xef\x62\x2c\x04\xde\xba\x9e\xcf\x4a\x05\x70\xc2\x46\x7b\
-\x1c\x0c\x7c\x1d\x78\x66\x74\x22\x1d\xb7\x18\xf8\x0d\xe9\x51\xa8\
-\x2b\x46\x7f\xde\x15\x99\x50\xc1\xb6\x07\x0e\x1b\x8d\xc3\x81\x03\
-\xb1\xc0\x8a\x76\x07\xe9\x7e\xff\x75\xd1\x89\x68\x70\x16\x00\xed\
-\xb2\x05\xe9\x5e\xf5\x89\xd1\x89\xe8\x29\x1e\x22\x15\x03\xd7\x92\
-\xee\x99\x5e\x4b\x3a\x91\x8e\x44\x26\xd5\x20\x43\xa4\x27\x2f\x0e\
-\x04\x9e\x33\x1a\x07\x02\x3b\x44\x26\xa5\xa7\xb9\x8c\xb4\x11\xd2\
-\x1f\xa2\x13\x51\x35\x2c\x00\xda\xe9\x2f\x80\x8f\xe3\xf3\xb8\x4d\
-\xb6\x80\x54\x0c\x5c\x4f\x9a\xa5\x7e\x0b\x70\x1b\x69\x43\xa3\x65\
-\x81\x79\xe5\x34\x19\xd8\x95\xf4\x48\xde\x5e\xa4\x89\xac\xb3\x80\
-\x03\x70\x72\x65\x93\x2d\x22\xdd\x66\xfc\x34\xe9\x16\x80\x5a\xc2\
-\x02\xa0\xbd\xf6\x25\xdd\x12\x78\x76\x74\x22\xea\xc9\x72\xe0\x4e\
-\xe0\x56\x52\x41\x70\x07\x69\x59\xd5\xb1\xb8\x9f\xe6\x16\x08\x1b\
-\x90\x86\xed\x67\xae\x16\xbb\x90\x2e\xf8\xbb\xe3\x10\x7e\x69\xae\
-\x03\xde\x40\x2a\x52\xd5\x32\x16\x00\xed\xb6\x31\x70\x3a\xf0\x96\
-\xe8\x44\x54\x99\x11\xd2\x2d\x85\x7b\x49\x8f\x27\x3e\x0a\x3c\xb6\
-\xda\xcf\x47\x81\xf9\xa4\x6f\x6e\x8b\x48\xf3\x12\xc6\x7e\x2e\x64\
-\x55\x01\x31\x34\x2e\x26\x8d\xfe\x9c\x0c\x6c\x34\x2e\x36\x1e\xf7\
-\xfb\x66\xc0\x56\xc0\x33\xd6\xf0\x73\x1b\xd2\x90\xfd\xe4\x4c\x7f\
-\xb7\xea\x35\x02\xfc\x1b\x69\x7b\xed\x25\xc1\xb9\x28\x13\x0b\x80\
-\x6e\x38\x8e\xf4\x6c\xf4\xf6\xd1\x89\x48\x6a\xbc\x39\xa4\x2f\x0d\
-\x3f\x88\x4e\x44\x79\xb9\xc2\x59\x37\x7c\x1b\xd8\x8f\x74\x4b\x40\
-\x92\xd6\xe6\x9b\xa4\x39\x19\x5e\xfc\x3b\xc0\x02\xa0\x3b\xe6\x01\
-\xaf\x05\x5e\x37\xfa\xbb\x24\x8d\x99\x07\xfc\x09\xe9\x11\xbf\xc7\
-\x82\x73\x51\x4d\xbc\x05\xd0\x4d\xdb\x03\x67\x03\x2f\x8f\x4e\x44\
-\x52\xb8\x6f\x00\xef\x02\x1e\x8c\x4e\x44\xf5\x72\x04\xa0\x9b\xee\
-\x27\xcd\x0b\x78\x33\xf0\x48\x70\x2e\x92\x62\x3c\x00\xbc\x02\x38\
-\x19\x2f\xfe\x9d\xb4\x41\x74\x02\x0a\x75\x2d\xf0\x45\xd2\xec\xed\
-\xfd\x83\x73\x91\x54\x9f\xf3\x81\x13\x48\xe7\x00\x75\x94\xb7\x00\
-\x34\xe6\x18\xd2\x42\x1f\x7b\x47\x27\x22\x29\x9b\x7b\x80\xb7\x01\
-\xdf\x8d\x4e\x44\xf1\x1c\x01\xd0\x98\x3b\x48\xf3\x02\x86\x80\x43\
-\xf0\x79\x6e\xa9\x4d\x96\x02\x1f\x23\x4d\x04\xbe\x29\x38\x17\x35\
-\x84\x23\x00\x5a\x93\xbd\x49\x7b\x0a\x1c\x1e\x9d\x88\xa4\x81\x7d\
-\x0f\xf8\x2b\xe0\xf7\xd1\x89\xa8\x59\x9c\x04\xa8\x35\xb9\x99\xb4\
-\xed\xea\x9b\x80\xb9\xb1\xa9\x48\xea\xd3\x7d\xa4\xc7\x7e\x5f\x8a\
-\x17\x7f\xad\x81\xb7\x00\xb4\x2e\xd7\x91\x56\x10\x1c\x02\x9e\x87\
-\xb7\x05\xa4\x12\x2c\x03\x3e\x41\x9a\xdd\x7f\x4d\x70\x2e\x92\x5a\
-\x60\x37\xe0\x62\xd2\x6e\x60\x86\x61\x34\x33\x2e\xc3\x0d\xc0\x34\
-\x41\xce\x01\x50\xaf\x5e\x48\xda\x24\xc4\xc7\x06\xa5\xe6\xb8\x06\
-\xf8\x6b\xe0\xc7\xd1\x89\x48\x6a\xb7\x0d\x80\xb7\x92\xee\x31\x46\
-\x7f\xe3\x31\x8c\x2e\xc7\x5d\xc0\x1b\x71\x3e\x97\xa4\x9a\x4d\x07\
-\xde\x47\x5a\x47\x3c\xfa\x44\x68\x18\x5d\x8a\x3f\x00\x1f\x00\x36\
-\x44\xea\x93\x93\x00\x35\x88\xe5\xc0\x2f\x80\xb3\x48\xfb\x87\xcf\
-\x06\xa6\x86\x66\x24\xb5\xdb\x22\xd2\x82\x5d\x27\x01\xff\x8f\x74\
-\x0c\x4a\x52\xb8\x6d\x49\x27\xa7\x25\xc4\x7f\x43\x32\x8c\x36\xc5\
-\x42\xe0\x74\xd2\x46\x5e\x92\xd4\x58\xbb\x92\x16\x12\xb2\x10\x30\
-\x8c\xc1\x62\x31\x70\x06\x5e\xf8\x25\x15\x66\x26\x69\x44\x60\x11\
-\xf1\x27\x52\xc3\x28\x29\x96\x92\x6e\xad\xed\x8c\x24\x15\x6c\x3b\
-\xd2\x3a\xe4\x4f\x10\x7f\x62\x35\x8c\x26\xc7\x02\xe0\x53\xc0\x2e\
-\x48\x99\xb9\x0e\x80\xea\xb4\x15\xf0\x6e\xe0\x9d\xc0\x16\xc1\xb9\
-\x48\x4d\xf2\x30\x69\xa8\xff\x0c\xe0\x91\xe0\x5c\x24\x29\x9b\xcd\
-\x48\x8b\x96\xdc\x45\xfc\x37\x2e\xc3\x88\x8c\xdb\x48\x05\xf1\x46\
-\x48\x52\x87\x6c\x00\xbc\x06\xf8\x29\xf1\x27\x62\xc3\xa8\x33\xae\
-\x22\x6d\xd4\xe3\xa3\xd8\x92\x3a\x6f\x36\x70\x1e\x69\xd6\x73\xf4\
-\xc9\xd9\x30\x72\xc4\x62\xe0\xcb\xc0\xf3\x91\x1a\xc0\x39\x00\x6a\
-\x9a\xed\x80\xb7\x03\xa7\x8d\xfe\x2e\x95\xee\x6e\xe0\x6c\xe0\xf3\
-\xc0\x83\xc1\xb9\x48\x52\xe3\x4d\x01\x4e\x04\xbe\x43\x5a\xed\x2c\
-\xfa\xdb\x9b\x61\xf4\x12\x23\xc0\x0f\x49\x7d\xd8\x61\x7e\x35\x92\
-\x23\x00\x2a\xc1\x4e\xc0\x5b\x80\x3f\xc3\xe7\xa2\xd5\x6c\xf7\x02\
-\xe7\x03\xe7\x02\x37\x07\xe7\x22\x49\xad\x31\x09\x38\x16\xb8\x88\
-\xb4\x50\x4a\xf4\xb7\x3c\xc3\x58\x49\x5a\xe8\xea\x2b\xc0\x4b\xf0\
-\xdb\xbe\x0a\xe2\x08\x80\x4a\xb5\x35\x70\x32\x70\x0a\x70\x18\xf6\
-\x65\xd5\xef\x0a\xe0\x4b\xc0\xd7\x48\xbb\xf3\x49\x45\xf1\xa4\xa9\
-\x36\xd8\x99\x54\x08\x9c\x02\x1c\x10\x9c\x8b\xda\xed\x06\xe0\xeb\
-\xa3\x71\x4b\x70\x2e\xd2\x40\x2c\x00\xd4\x36\xb3\x80\xd7\x93\x9e\
-\xb1\xde\x3d\x38\x17\xb5\xc3\x8d\xac\xba\xe8\xff\x3e\x38\x17\xa9\
-\x32\x16\x00\x6a\xb3\x03\x80\x57\x02\xc7\x93\xd6\x19\xb0\xbf\x6b\
-\xa2\x6e\x04\x2e\x24\x5d\xf4\x6f\x0a\xce\x45\xca\xc2\x13\xa2\xba\
-\x62\x26\x70\x02\xa9\x20\x38\x0a\x98\x1a\x9b\x8e\x1a\x66\x09\x30\
-\x0c\x5c\x0e\x7c\x1b\xb8\x33\x34\x1b\xa9\x06\x16\x00\xea\xa2\x19\
-\xc0\xcb\x46\xe3\xc5\xb8\xd7\x7a\x57\xdd\x47\x5a\x67\xe2\x72\xd2\
-\x33\xfb\x0b\x62\xd3\x91\xea\x65\x01\xa0\xae\x1b\x02\xf6\x05\x8e\
-\x19\x8d\xa3\x80\x4d\x42\x33\x52\x2e\x4f\x02\x3f\x03\x7e\x4c\xba\
-\xe0\x5f\x4b\x7a\x8c\x4f\xea\x24\x0b\x00\xe9\xa9\xa6\x02\x87\x92\
-\x8a\x81\x17\x03\xcf\xc5\xdb\x05\xa5\x5a\x04\xfc\x0a\xf8\x11\xe9\
-\xa2\x7f\x25\xb0\x2c\x34\x23\xa9\x41\x2c\x00\xa4\x75\x9b\x4e\x2a\
-\x02\x0e\x27\xad\x37\xf0\x7c\xe0\x19\xa1\x19\x69\x6d\x1e\x24\x5d\
-\xe4\x7f\x0d\xfc\x9c\xf4\x9c\xfe\xe2\xd0\x8c\xa4\x06\xb3\x00\x90\
-\x7a\x33\x04\xec\xc5\xaa\x82\xe0\x60\xe0\x59\xa4\xbd\x0b\x54\x9f\
-\x25\xc0\x75\xa4\x8b\xfc\xaf\x47\xe3\xf6\xd0\x8c\xa4\xc2\x58\x00\
-\x48\x83\xdb\x10\xd8\x8f\xf4\xd8\xe1\x81\xa3\x3f\x0f\xc0\xb9\x04\
-\x55\x99\x07\xfc\x16\xb8\x7e\x34\xae\x1b\xfd\xb9\x24\x32\x29\xa9\
-\x74\x16\x00\x52\x1e\x93\x80\x3d\x81\xfd\x81\x67\x93\x46\x0d\x9e\
-\x35\xfa\xef\x36\x0b\xcc\xab\xc9\xe6\x03\xb7\x91\x36\xd1\xb9\x81\
-\x55\x17\xfc\x39\x91\x49\x49\x6d\x65\x01\x20\xd5\x6f\x7b\x60\xef\
-\x71\xb1\x3b\x69\x39\xe3\x1d\x49\xf3\x0b\xda\x7c\x5c\x3e\x0a\xdc\
-\x45\xba\xd0\xdf\x3a\x1a\xb7\x8d\xc6\x83\x71\x69\x49\xdd\xd3\xe6\
-\x13\x8d\x54\xa2\xe9\xa4\x45\x8b\xc6\x62\xa7\xd1\xd8\x86\x54\x1c\
-\x6c\x35\xfa\x73\x4b\x60\x72\x50\x8e\xab\x5b\x4e\xda\x0c\xe7\x51\
-\xd2\x70\xfd\x5c\xd2\x33\xf6\x63\x71\xef\xb8\xdf\x17\x05\xe5\x28\
-\x69\x35\x16\x00\x52\x99\x26\x01\x9b\xb3\xaa\x28\xd8\x12\xd8\x68\
-\x5c\x6c\xbc\xda\x3f\x6f\x44\x2a\x18\x26\x8d\xfe\xff\x43\xab\xc5\
-\x98\xc5\xa3\xb1\x68\xdc\xcf\xf1\xbf\x3f\x41\xba\xd0\x3f\x36\xee\
-\xe7\x7c\x7c\x9e\x5e\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\
-\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\
-\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\
-\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\
-\x49\x92\x24\x49\x51\xfe\x3f\x33\x5a\x1a\x4b\x5a\x99\x52\x6e\x00\
-\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-"
-
-qt_resource_name = b"\
-\x00\x03\
-\x00\x00\x70\x37\
-\x00\x69\
-\x00\x6d\x00\x67\
-\x00\x0e\
-\x07\x55\x66\xc7\
-\x00\x63\
-\x00\x68\x00\x65\x00\x63\x00\x6b\x00\x5f\x00\x69\x00\x63\x00\x6f\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x08\
-\x0a\x61\x5c\x87\
-\x00\x69\
-\x00\x63\x00\x6f\x00\x6e\x00\x2e\x00\x6a\x00\x70\x00\x67\
-\x00\x0e\
-\x0d\x8c\xe6\x87\
-\x00\x61\
-\x00\x72\x00\x72\x00\x6f\x00\x77\x00\x5f\x00\x69\x00\x63\x00\x6f\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
-"
-
-qt_resource_struct_v1 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x03\x00\x00\x00\x02\
-\x00\x00\x00\x0c\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x00\x2e\x00\x00\x00\x00\x00\x01\x00\x00\x52\x55\
-\x00\x00\x00\x44\x00\x00\x00\x00\x00\x01\x00\x01\x43\x8f\
-"
-
-qt_resource_struct_v2 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x03\x00\x00\x00\x02\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x0c\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x93\x7a\x0e\x45\x2a\
-\x00\x00\x00\x2e\x00\x00\x00\x00\x00\x01\x00\x00\x52\x55\
-\x00\x00\x01\x93\x93\x00\x13\x60\
-\x00\x00\x00\x44\x00\x00\x00\x00\x00\x01\x00\x01\x43\x8f\
-\x00\x00\x01\x93\x7a\x0e\x03\x4a\
-"
-
-qt_version = [int(v) for v in QtCore.qVersion().split('.')]
-if qt_version < [5, 8, 0]:
-    rcc_version = 1
-    qt_resource_struct = qt_resource_struct_v1
-else:
-    rcc_version = 2
-    qt_resource_struct = qt_resource_struct_v2
-
-def qInitResources():
-    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-qInitResources()
@@ -0,0 +1,223 @@
+# SoundBlocks Configurator, command line
+#
+# Verifies and uploads .sbc files without the editor (and without Qt), for
+# scripted show setups and headless controllers:
+#
+#   python sbcli.py verify show.sbc
+#   python sbcli.py upload show.sbc --iface eth0 --jobs 32 --ack
+#   python sbcli.py discover --iface eth0
+#
+# It compiles through the .sbcc cache and uploads with the same engine,
+# state and pacing sidecars as the editor. The upload engine and the
+# interface list are only imported by the commands that need them, so
+# verify starts fast.
+#
+# Exit status: 0 success, 1 errors in the file, 2 bad usage, 3 network
+# errors or modules left unprogrammed.
+
+import argparse
+import sys
+import sbcompiler
+
+EXIT_ERRORS = 1
+EXIT_USAGE = 2
+EXIT_UPLOAD = 3
+
+
+def fail(status, message):
+    print('Error: ' + message, file=sys.stderr)
+    sys.exit(status)
+
+
+def compile_file(args):
+    try:
+        program = sbcompiler.compile_file(args.file, sbcompiler.MAX_ERRORS,
+                                          cache=not args.no_cache)
+    except (OSError, UnicodeDecodeError) as e:
+        fail(EXIT_ERRORS, str(e))
+    for diagnostic in program.diagnostics:
+        print(diagnostic, file=sys.stderr)
+    if program.truncated:
+        print('Too many errors, stopped after ' + str(len(program.diagnostics)) + '.',
+              file=sys.stderr)
+    if program.error:
+        sys.exit(EXIT_ERRORS)
+    return program
+
+
+def local_address(args):
+    # IP of the interface to upload from: --ip, --iface or the first
+    # interface with an IPv4 address other than loopback
+    if args.ip:
+        return args.ip
+    import sbnet
+    interfaces = sbnet.scan(loopback=bool(args.iface))
+    if args.iface:
+        interfaces = [i for i in interfaces if i.name == args.iface]
+    if interfaces:
+        return interfaces[0].address
+    try:
+        import netifaces
+    except ImportError:
+        fail(EXIT_USAGE, 'netifaces is not installed, give the address with --ip')
+    fail(EXIT_USAGE, 'no IPv4 address on ' + (args.iface or 'any interface'))
+
+
+def rate(text):
+    value = float(text)
+    if not 0 < value < float('inf'):
+        raise argparse.ArgumentTypeError('must be a positive number of messages/s')
+    return value
+
+
+def defaults(args, sbupload):
+    # Options left unset take the engine's defaults
+    for name in ('port', 'ack_port', 'jobs', 'delay'):
+        if getattr(args, name, 0) is None:
+            setattr(args, name, getattr(sbupload, name.upper()))
+
+
+def network_of(args, local):
+    return args.network or local[0:local.rfind('.')+1]
+
+
+def verify(args):
+    program = compile_file(args)
+    if not args.quiet:
+        print('Verified... OK. ' + str(len(program.keylist)) + ' modules' +
+              (' (cached)' if program.cached else '') + '.')
+
+
+def upload(args):
+    import asyncio
+    import sbupload
+
+    defaults(args, sbupload)
+    program = compile_file(args)
+    send, receive, keylist = program.send, program.receive, program.keylist
+    local = local_address(args)
+    network = network_of(args, local)
+
+    # Only modules whose program changed since the last upload
+
+    state = sbupload.load_state(args.file)
+    hashes = state.setdefault(network, dict())
+    if not args.force:
+        changed = sbupload.changed_modules(keylist, send, receive, hashes)
+        if len(changed) < len(keylist) and not args.quiet:
+            print('Unchanged, not uploaded: ' +
+                  ', '.join(str(k) for k in keylist if k not in changed))
+        keylist = changed
+    if not keylist:
+        if not args.quiet:
+            print('All modules are up to date.')
+        return
+
+    def progress(k, address, _):
+        if address == '/initprog':
+            print(str(k) + ': ' + network + str(k))
+
+    pacing = sbupload.load_pacing(args.file)
+    if args.rate is not None:
+        pacing.rate = args.rate
+    uploader = sbupload.Uploader(network, port=args.port, jobs=args.jobs,
+                                 delay=args.delay, ack=args.ack, local=local,
+                                 ack_port=args.ack_port, bundle=args.bundle,
+                                 discover=args.skip_offline, pacing=pacing,
+                                 progress=None if args.quiet else progress)
+    try:
+        asyncio.run(uploader.run(send, receive, keylist))
+    except OSError as e:
+        fail(EXIT_UPLOAD, str(e))
+    except KeyboardInterrupt:
+        fail(EXIT_UPLOAD, 'upload interrupted')
+
+    if uploader.programmed:
+        for k in uploader.programmed:
+            hashes[str(k)] = sbupload.program_hash(k, send, receive)
+        try:
+            sbupload.save_state(args.file, state)
+        except OSError as e:
+            print('Error: ' + str(e), file=sys.stderr)
+
+    if uploader.unconfirmed and not args.quiet:
+        print('Sent without acks, uploaded again next time: ' +
+              ', '.join(str(k) for k in sorted(uploader.unconfirmed)))
+    for k, address in uploader.missed:
+        print(str(k) + ': no ack for ' + address, file=sys.stderr)
+    if uploader.uncommitted:
+        print('Not committed, old program kept: ' +
+              ', '.join(str(k) for k in sorted(uploader.uncommitted)), file=sys.stderr)
+    for k, error in uploader.failed:
+        print(str(k) + ': not sent, ' + error, file=sys.stderr)
+    if uploader.offline:
+        print('Offline, not programmed: ' + ', '.join(str(k) for k in uploader.offline),
+              file=sys.stderr)
+    if uploader.missed or uploader.offline or uploader.failed:
+        sys.exit(EXIT_UPLOAD)
+    if not args.quiet:
+        print('Uploaded... OK.')
+
+
+def discover(args):
+    import asyncio
+    import sbupload
+
+    defaults(args, sbupload)
+    local = local_address(args)
+    network = network_of(args, local)
+    try:
+        alive = asyncio.run(sbupload.discover(network, local, args.ack_port, args.port))
+    except OSError as e:
+        fail(EXIT_UPLOAD, str(e))
+    for k in alive:
+        print(network + str(k))
+    if not args.quiet:
+        print(str(len(alive)) + ' modules online.', file=sys.stderr)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='sbcli', description='SoundBlocks Configurator')
+    commands = parser.add_subparsers(dest='command', metavar='command')
+    commands.required = True
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('-q', '--quiet', action='store_true', help='only print errors')
+
+    network = argparse.ArgumentParser(add_help=False)
+    network.add_argument('--iface', help='network interface to use (default: the first one)')
+    network.add_argument('--ip', help='local IP address to use, instead of --iface')
+    network.add_argument('--network', help='network prefix of the modules, e.g. 192.168.1. '
+                                           '(default: the one of the local address)')
+    network.add_argument('--port', type=int, help='OSC port of the modules (default 12000)')
+    network.add_argument('--ack-port', type=int, help='port for acks (default 12001)')
+
+    source = argparse.ArgumentParser(add_help=False)
+    source.add_argument('file', help='.sbc file')
+    source.add_argument('--no-cache', action='store_true', help='ignore the .sbcc cache')
+
+    command = commands.add_parser('verify', parents=[common, source], help='check a .sbc file')
+    command.set_defaults(function=verify)
+
+    command = commands.add_parser('upload', parents=[common, source, network],
+                                  help='verify a .sbc file and program the modules')
+    command.add_argument('--jobs', type=int, help='modules programmed at the same time (default 16)')
+    command.add_argument('--ack', action='store_true', help='wait for acknowledgements')
+    command.add_argument('--bundle', action='store_true', help='send programs as OSC bundles')
+    command.add_argument('--skip-offline', action='store_true', help='skip modules that do not answer a ping')
+    command.add_argument('--force', action='store_true', help='upload unchanged modules too')
+    command.add_argument('--delay', type=float, help='ack timeout, in seconds (default 0.5)')
+    command.add_argument('--rate', type=rate, help='messages/s per module without acks')
+    command.set_defaults(function=upload)
+
+    command = commands.add_parser('discover', parents=[common, network], help='list the modules online')
+    command.set_defaults(function=discover)
+
+    args = parser.parse_args(argv)
+    if getattr(args, 'iface', None) and args.ip:
+        parser.error('--iface and --ip are exclusive')
+    args.function(args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,589 @@
+# SoundBlocks configuration compiler
+#
+# Turns .sbc text into the send and receive tables uploaded to the modules.
+# This module does not import Qt, so the editor, command line tools and
+# benchmarks all compile through the same code.
+#
+# Each line goes through three stages:
+#
+#   parse_line  one scan with a precompiled grammar classifies the line and
+#               captures its fields (syntax errors are located by tokenizing
+#               the line, which only happens for lines that don't parse)
+#   validate    checks names and numeric ranges
+#   encode      packs the /send or /receive row into bytes
+#
+# compile_line runs the three of them, and link collects the lines into
+# the per-module tables of a Program. A table is a Rows: the rows of one
+# module packed one after the other in a bytearray, so a large installation
+# costs a few bytes per row instead of a list of ints.
+#
+# Programs compiled without errors can be cached in a .sbcc file next to
+# the source, keyed by a hash of the text and the compiler VERSION, so an
+# unchanged file is not parsed again.
+
+import hashlib
+import json
+import os
+import re
+import struct
+
+VERSION = 3     # bump whenever parsing or encoding changes; voids the caches
+
+SENSORS = ['t1','t2','t3','t4','t5','t6','t7','ax','ay','az','gx','gy','gz','yaw','pitch','roll']
+ACTUATORS = ['dfPlay', 'dfPause', 'dfStop', 'dfResume', 'dfSetEq', 'dfVolume', 'dfPlayStop', 'dfPlayPause', 'dfPlayTouch']
+
+# Firmware codes of the vocabularies, the one place the parser, the encoder,
+# the emulator and the editor look names up. The position of a name in the
+# lists above is its code: sensors are sent as one bit each in the 16-bit
+# /send mask and as their index in /receive; actuators as their index.
+
+SENSOR_BITS = {name: 1 << n for n, name in enumerate(SENSORS)}
+SENSOR_CODES = {name: n for n, name in enumerate(SENSORS)}
+ACTUATOR_CODES = {name: n for n, name in enumerate(ACTUATORS)}
+
+# Diagnostic codes: E0xx about the file, E1xx syntax, E2xx values
+
+MESSAGES = {
+    'E001': 'empty file',
+    'E100': 'syntax error',
+    'E101': 'Send ID must be a number',
+    'E102': 'Receive ID must be a number',
+    'E103': 'sensor list cannot be empty',
+    'E104': 'sensor must be valid',
+    'E105': 'action cannot be empty',
+    'E106': 'map must be [max] or [min,max]',
+    'E201': 'IP must be between 2-254',
+    'E202': 'Receive ID must be between 2-254',
+    'E203': 'maximum 3 ID ranges',
+    'E204': 'action must be valid',
+    'E205': 'map value must be between 0-127',
+    'E206': 'Send ID must be between 2-254',
+}
+
+# Diagnostics reported by the interactive tools before giving up
+
+MAX_ERRORS = 200
+
+SEND_WIDTH = 8      # bytes in a /send row
+RECEIVE_WIDTH = 5   # bytes in a /receive row
+
+_SEND_ROW = struct.Struct('>H6B')
+_RECEIVE_ROW = struct.Struct('5B')
+
+# Line kinds
+
+BLANK = 0       # empty line or comment
+SEND = 1
+RECEIVE = 2
+INVALID = 3
+
+# Grammar of a whole line. Names are checked against the vocabularies by
+# validate, so a misspelled sensor is reported on the name itself.
+
+_LINE = re.compile(r'''
+    (?P<send>\d{1,3})->
+        (?P<sensors>[A-Za-z_]\w*(?:,[A-Za-z_]\w*)*):
+        \s*(?P<ids>\d+(?:-\d+)?(?:,\d+(?:-\d+)?)*)\s*(?:\#.*)?
+  | (?P<receive>\d{1,3})<-
+        (?P<sensor>[A-Za-z_]\w*):(?P<source>\d{1,3})@(?P<actuator>[A-Za-z_]\w*)
+        (?:\[(?:(?P<map1>\d+),)?(?P<map2>\d+)\])?\s*(?:\#.*)?
+  | \s*(?:\#.*)?
+''', re.VERBOSE)
+
+# Tokens of a line
+
+_TOKEN = re.compile(r'''
+    (?P<comment>\#.*)
+  | (?P<space>\s+)
+  | (?P<arrow>->|<-)
+  | (?P<number>\d+)
+  | (?P<name>[A-Za-z_]\w*)
+  | (?P<punct>[:,@\[\]-])
+  | (?P<error>.)
+''', re.VERBOSE)
+
+
+class Token:
+    __slots__ = ('kind', 'text', 'start', 'end')
+
+    def __init__(self, kind, text, start, end):
+        self.kind = kind
+        self.text = text
+        self.start = start
+        self.end = end
+
+    def __repr__(self):
+        return 'Token(%r, %r, %d, %d)' % (self.kind, self.text, self.start, self.end)
+
+
+def tokenize(text):
+    return [Token(m.lastgroup, m.group(), m.start(), m.end())
+            for m in _TOKEN.finditer(text)]
+
+
+class Diagnostic:
+    # A compile error. line is 1-based, or 0 when it is not about a line;
+    # start and end are the 0-based column span of the offending text and
+    # code is one of MESSAGES.
+
+    def __init__(self, line, start, end, code, text=''):
+        self.line = line
+        self.start = start
+        self.end = end
+        self.code = code
+        self.text = text
+
+    @property
+    def message(self):
+        return MESSAGES[self.code]
+
+    def __str__(self):
+        if self.line == 0:
+            return 'Error ' + self.code + ': ' + self.message + '.'
+        return ('Error ' + self.code + ': ' + self.message + '. In line ' +
+                str(self.line) + ', column ' + str(self.start + 1) +
+                ' "' + self.text + '"')
+
+    def __repr__(self):
+        return 'Diagnostic(%d, %d, %d, %r)' % (self.line, self.start, self.end, self.code)
+
+
+class Statement:
+    # A parsed line: its kind, the grammar match and its groups and, for
+    # INVALID lines, the (start, end, code) of the syntax error.
+
+    __slots__ = ('kind', 'text', 'match', 'fields', 'error')
+
+    def __init__(self, kind, text, match=None, error=None):
+        self.kind = kind
+        self.text = text
+        self.match = match
+        self.fields = match.groups() if match else None
+        self.error = error
+
+
+class Line:
+    # A compiled line: the module it programs, its encoded row and its
+    # errors as (start, end, code). Lines don't know their number, so
+    # they can be reused wherever the same text appears.
+
+    __slots__ = ('kind', 'k', 'row', 'errors')
+
+    def __init__(self, kind, k=None, row=None, errors=()):
+        self.kind = kind
+        self.k = k
+        self.row = row
+        self.errors = errors
+
+
+class Rows:
+    # Table of fixed-width rows packed in a bytearray. Iterating yields each
+    # row as bytes; it compares equal to another Rows with the same bytes or
+    # to a list of rows with the same values.
+
+    __slots__ = ('width', 'data')
+
+    def __init__(self, width, data=b''):
+        self.width = width
+        self.data = bytearray(data)
+
+    def append(self, row):
+        self.data += row
+
+    def __len__(self):
+        return len(self.data) // self.width
+
+    def __getitem__(self, n):
+        if n < 0:
+            n += len(self)
+        if not 0 <= n < len(self):
+            raise IndexError('row index out of range')
+        return bytes(self.data[n * self.width:(n + 1) * self.width])
+
+    def __iter__(self):
+        data = bytes(self.data)
+        width = self.width
+        for n in range(0, len(data), width):
+            yield data[n:n + width]
+
+    def tolist(self):
+        return [list(row) for row in self]
+
+    def __eq__(self, other):
+        if isinstance(other, Rows):
+            return self.width == other.width and self.data == other.data
+        try:
+            return self.tolist() == [list(row) for row in other]
+        except TypeError:
+            return NotImplemented
+
+    def __repr__(self):
+        return 'Rows(%d, %r)' % (self.width, bytes(self.data))
+
+
+class Program:
+    # Compiled configuration.
+    #
+    # send[k] holds the 8-byte /send rows of module k: sensor bits (2 bytes)
+    # followed by three ID ranges. receive[k] holds the 5-byte /receive rows:
+    # sensor, sending module, actuator and the two map values (255 = unset).
+    # Both are Rows. keylist is the sorted list of modules to program.
+
+    def __init__(self):
+        self.send = dict()
+        self.receive = dict()
+        self.keylist = list()
+        self.diagnostics = list()
+        # True when max_errors cut the diagnostics short
+        self.truncated = False
+        # True when loaded from a .sbcc cache instead of compiled
+        self.cached = False
+
+    @property
+    def error(self):
+        return len(self.diagnostics) > 0
+
+
+# Parse
+
+def parse_line(text):
+    m = _LINE.fullmatch(text)
+    if m is None:
+        return Statement(INVALID, text, error=_syntax_error(text))
+    kind = m.lastindex
+    if kind is None:
+        return Statement(BLANK, text)
+    return Statement(SEND if kind <= 3 else RECEIVE, text, m)
+
+
+def _syntax_error(text):
+    # Walks the tokens of a line that doesn't match the grammar and returns
+    # the (start, end, code) of the first thing that is wrong.
+    tokens = [t for t in tokenize(text) if t.kind != 'comment']
+    while tokens and tokens[-1].kind == 'space':
+        tokens.pop()
+    everything = (tokens[0].start, tokens[-1].end, 'E100')
+    arrows = [t for t in tokens if t.kind == 'arrow']
+    if not arrows:
+        return everything
+    arrow = arrows[0]
+    send = arrow.text == '->'
+    head = tokens[:tokens.index(arrow)]
+    if len(head) != 1 or head[0].kind != 'number' or len(head[0].text) > 3:
+        code = 'E101' if send else 'E102'
+        return (head[0].start if head else arrow.start,
+                head[-1].end if head else arrow.end, code)
+
+    rest = tokens[tokens.index(arrow) + 1:]
+    n = 0
+
+    def at(kind, text=None):
+        return (n < len(rest) and rest[n].kind == kind and
+                (text is None or rest[n].text == text))
+
+    def here(code):
+        if n < len(rest):
+            return (rest[n].start, rest[n].end, code)
+        return (len(text), len(text), code)
+
+    if send:
+        if at('punct', ':'):
+            return here('E103')
+        while True:
+            if not at('name'):
+                return here('E104')
+            n += 1
+            if not at('punct', ','):
+                break
+            n += 1
+        if not at('punct', ':'):
+            return here('E100')
+        n += 1
+        if at('space'):
+            n += 1
+        if n == len(rest):
+            return here('E102')
+        while True:
+            if not at('number'):
+                return here('E102')
+            n += 1
+            if at('punct', '-'):
+                n += 1
+                if not at('number'):
+                    return here('E100')
+                n += 1
+            if not at('punct', ','):
+                break
+            n += 1
+    else:
+        if at('punct', ':'):
+            return here('E104')
+        if not at('name'):
+            return here('E104')
+        n += 1
+        if not at('punct', ':'):
+            return here('E100')
+        n += 1
+        if not at('number') or len(rest[n].text) > 3:
+            return here('E101')
+        n += 1
+        if not at('punct', '@'):
+            return here('E100')
+        n += 1
+        if not at('name'):
+            return here('E105')
+        n += 1
+        if at('punct', '['):
+            start = rest[n].start
+            n += 1
+            if at('number'):
+                n += 1
+                if at('punct', ','):
+                    n += 1
+                    if at('number'):
+                        n += 1
+            if not at('punct', ']'):
+                end = rest[n].end if n < len(rest) else len(text)
+                return (start, end, 'E106')
+            n += 1
+    if at('space'):
+        n += 1
+    if n < len(rest):
+        return (rest[n].start, rest[-1].end, 'E100')
+    return everything
+
+
+# Validate
+
+def validate(statement):
+    kind = statement.kind
+    if kind == INVALID:
+        return [statement.error]
+    if kind == SEND:
+        k, sensors, ids = statement.fields[:3]
+        if not 2 <= int(k) <= 254:
+            return _errors(statement)
+        for sensor in sensors.split(','):
+            if sensor not in SENSOR_CODES:
+                return _errors(statement)
+        spans = ids.split(',')
+        if len(spans) > 3:
+            return _errors(statement)
+        for span in spans:
+            for value in span.split('-'):
+                if not 2 <= int(value) <= 254:
+                    return _errors(statement)
+    elif kind == RECEIVE:
+        _, _, _, k, sensor, source, actuator, map1, map2 = statement.fields
+        if (not 2 <= int(k) <= 254 or sensor not in SENSOR_CODES or
+                not 2 <= int(source) <= 254 or
+                actuator not in ACTUATOR_CODES or
+                (map1 is not None and int(map1) > 127) or
+                (map2 is not None and int(map2) > 127)):
+            return _errors(statement)
+    return ()
+
+
+def _errors(statement):
+    # Locates every semantic error of a statement that failed validate
+    m = statement.match
+    errors = list()
+    if statement.kind == SEND:
+        if int(m.group('send')) < 2 or int(m.group('send')) > 254:
+            errors.append((m.start('send'), m.end('send'), 'E206'))
+        start = m.start('sensors')
+        for sensor in m.group('sensors').split(','):
+            if sensor not in SENSOR_CODES:
+                errors.append((start, start + len(sensor), 'E104'))
+            start += len(sensor) + 1
+        spans = m.group('ids').split(',')
+        if len(spans) > 3:
+            start = m.start('ids') + len(','.join(spans[:3])) + 1
+            errors.append((start, m.end('ids'), 'E203'))
+        start = m.start('ids')
+        for span in spans[:3]:
+            for value in span.split('-'):
+                if int(value) < 2 or int(value) > 254:
+                    errors.append((start, start + len(value), 'E201'))
+                start += len(value) + 1
+    else:
+        if int(m.group('receive')) < 2 or int(m.group('receive')) > 254:
+            errors.append((m.start('receive'), m.end('receive'),
+                           'E202'))
+        if m.group('sensor') not in SENSOR_CODES:
+            errors.append((m.start('sensor'), m.end('sensor'), 'E104'))
+        if int(m.group('source')) < 2 or int(m.group('source')) > 254:
+            errors.append((m.start('source'), m.end('source'), 'E206'))
+        if m.group('actuator') not in ACTUATOR_CODES:
+            errors.append((m.start('actuator'), m.end('actuator'), 'E204'))
+        for group in ('map1', 'map2'):
+            if m.group(group) is not None and int(m.group(group)) > 127:
+                errors.append((m.start(group), m.end(group),
+                               'E205'))
+    return errors
+
+
+# Encode
+
+def encode(statement):
+    if statement.kind == SEND:
+        k, sensors, ids = statement.fields[:3]
+        bits = 0
+        for sensor in sensors.split(','):
+            bits |= SENSOR_BITS[sensor]
+        ranges = ()
+        for span in ids.split(','):
+            first, _, last = span.partition('-')
+            first = int(first)
+            ranges += (first, int(last) if last else first)
+        return int(k), _SEND_ROW.pack(bits, *(ranges + (0,) * (6 - len(ranges))))
+    _, _, _, k, sensor, source, actuator, map1, map2 = statement.fields
+    return int(k), _RECEIVE_ROW.pack(SENSOR_CODES[sensor], int(source), ACTUATOR_CODES[actuator],
+                                     255 if map1 is None else int(map1),
+                                     255 if map2 is None else int(map2))
+
+
+# Compile
+
+def compile_line(text):
+    statement = parse_line(text)
+    if statement.kind == BLANK:
+        return Line(BLANK)
+    errors = validate(statement)
+    if errors:
+        return Line(INVALID, errors=errors)
+    k, row = encode(statement)
+    return Line(statement.kind, k, row)
+
+
+def link(lines, texts, max_errors=None):
+    # Builds the Program from the compiled lines (and their source texts,
+    # used for the diagnostics). Every error of every line is reported,
+    # up to max_errors; the tables are only filled when there are none.
+    program = Program()
+    if len(lines) == 0:
+        program.diagnostics.append(Diagnostic(0, 0, 0, 'E001'))
+        return program
+    diagnostics = program.diagnostics
+    send = dict()
+    receive = dict()
+    for n, line in enumerate(lines):
+        if line.kind == SEND:
+            rows = send.get(line.k)
+            if rows is None:
+                rows = send[line.k] = Rows(SEND_WIDTH)
+            rows.append(line.row)
+        elif line.kind == RECEIVE:
+            rows = receive.get(line.k)
+            if rows is None:
+                rows = receive[line.k] = Rows(RECEIVE_WIDTH)
+            rows.append(line.row)
+        elif line.kind == INVALID:
+            for start, end, code in line.errors:
+                if max_errors is not None and len(diagnostics) >= max_errors:
+                    program.truncated = True
+                    return program
+                diagnostics.append(Diagnostic(n+1, start, end, code, texts[n]))
+    if diagnostics:
+        return program
+    program.send = send
+    program.receive = receive
+    program.keylist = sorted(send.keys() | receive.keys())
+    return program
+
+
+class IncrementalCompiler:
+    # Keeps the compiled lines of a document that is being edited. splice
+    # mirrors each edit (the lines from first on, removed lines replaced by
+    # the new texts) and compile only compiles the lines touched since the
+    # last call before linking.
+
+    def __init__(self, texts=()):
+        self.reset(texts)
+
+    def reset(self, texts):
+        self.texts = list(texts)
+        self.lines = [None] * len(self.texts)
+
+    def splice(self, first, removed, texts):
+        self.texts[first:first + removed] = texts
+        self.lines[first:first + removed] = [None] * len(texts)
+
+    def compile(self, max_errors=None):
+        lines = self.lines
+        texts = self.texts
+        for n, line in enumerate(lines):
+            if line is None:
+                lines[n] = compile_line(texts[n])
+        # A document always has one (maybe empty) block
+        if texts == ['']:
+            return link([], [])
+        return link(lines, texts, max_errors)
+
+
+def compile_text(text, max_errors=None):
+    texts = text.splitlines()
+    return link([compile_line(t) for t in texts], texts, max_errors)
+
+
+def compile_stream(stream, max_errors=None):
+    return compile_text(stream.read(), max_errors)
+
+
+def compile_file(path, max_errors=None, cache=False):
+    with open(path, 'r') as f:
+        if cache:
+            return compile_cached(path, f.read(), max_errors)
+        return compile_stream(f, max_errors)
+
+
+# Cache
+
+def cache_path(path):
+    return os.path.splitext(path)[0] + '.sbcc'
+
+
+def source_hash(text):
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+def load_cache(path, text):
+    # Program cached for text next to path, or None when the cache is
+    # missing, broken, of another text or of another compiler version
+    try:
+        with open(cache_path(path), 'r') as f:
+            cache = json.load(f)
+        if cache['version'] != VERSION or cache['source'] != source_hash(text):
+            return None
+        program = Program()
+        program.send = {int(k): Rows(SEND_WIDTH, bytes.fromhex(rows))
+                        for k, rows in cache['send'].items()}
+        program.receive = {int(k): Rows(RECEIVE_WIDTH, bytes.fromhex(rows))
+                           for k, rows in cache['receive'].items()}
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+    program.keylist = sorted(program.send.keys() | program.receive.keys())
+    program.cached = True
+    return program
+
+
+def save_cache(path, text, program):
+    cache = dict(version=VERSION, source=source_hash(text),
+                 send={str(k): rows.data.hex() for k, rows in program.send.items()},
+                 receive={str(k): rows.data.hex() for k, rows in program.receive.items()})
+    with open(cache_path(path), 'w') as f:
+        json.dump(cache, f, sort_keys=True)
+
+
+def compile_cached(path, text, max_errors=None):
+    # compile_text through the cache of path. A cache that can't be written
+    # only costs the next compile.
+    program = load_cache(path, text)
+    if program is None:
+        program = compile_text(text, max_errors)
+        if not program.error:
+            try:
+                save_cache(path, text, program)
+            except OSError:
+                pass
+    return program
@@ -0,0 +1,198 @@
+# SoundBlocks module emulator
+#
+# Binds one virtual module per ID on <network><id>:12000, speaks the
+# /initprog, /send, /receive, /commit and /endprog protocol, keeps the
+# committed tables and acknowledges messages the way the firmware does when
+# acks are enabled, for single messages and for bundles. Latency, jitter,
+# loss and reordering can be injected to test uploads and their pacing
+# without hardware.
+#
+#   python sbemulator.py --ids 2-254 --latency 0.005 --loss 0.01
+#
+# Any 127.0.0.x address works on Linux; other systems need loopback aliases
+# (or an alias network given with --network).
+
+import argparse
+import asyncio
+import random
+import time
+from pythonosc.osc_message_builder import OscMessageBuilder
+from pythonosc.osc_packet import OscPacket, ParseError
+from sbcompiler import SENSORS, ACTUATORS, SENSOR_BITS
+import sbupload
+
+
+def decode_send(k, row):
+    # .sbc line equivalent to a /send row
+    bits = row[0] << 8 | row[1]
+    sensors = [s for s, bit in SENSOR_BITS.items() if bits & bit]
+    ranges = list()
+    for a, b in zip(row[2::2], row[3::2]):
+        if a:
+            ranges.append(str(a) if a == b else str(a) + '-' + str(b))
+    return str(k) + '->' + ','.join(sensors) + ':' + ','.join(ranges)
+
+
+def decode_receive(k, row):
+    # .sbc line equivalent to a /receive row
+    sensor, id_out, actuator, map1, map2 = row
+    line = str(k) + '<-' + SENSORS[sensor] + ':' + str(id_out) + '@' + ACTUATORS[actuator]
+    if map2 != 255:
+        line += '[' + (str(map1) + ',' if map1 != 255 else '') + str(map2) + ']'
+    return line
+
+
+def parse_ids(text):
+    # "2-254" or "101,105-108"
+    ids = list()
+    for part in text.split(','):
+        a, _, b = part.partition('-')
+        ids.extend(range(int(a), int(b or a) + 1))
+    return ids
+
+
+class Module(asyncio.DatagramProtocol):
+    def __init__(self, k, emulator):
+        self.k = k
+        self.emulator = emulator
+        self.transport = None
+        # Tables being programmed and tables of the last /commit
+        self.pending_send = list()
+        self.pending_receive = list()
+        self.send = list()
+        self.receive = list()
+        self.commits = 0
+        self.received = 0
+        self.dropped = 0
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, addr):
+        emulator = self.emulator
+        if emulator.loss and emulator.random.random() < emulator.loss:
+            self.dropped += 1
+            return
+        delay = emulator.latency
+        if emulator.jitter:
+            delay += emulator.random.uniform(0, emulator.jitter)
+        if emulator.reorder and emulator.random.random() < emulator.reorder:
+            # Hold the packet back so the following ones overtake it
+            delay += 2 * (emulator.latency + emulator.jitter) + 0.005
+        if delay > 0:
+            asyncio.get_running_loop().call_later(delay, self.process, data, addr)
+        else:
+            self.process(data, addr)
+
+    def process(self, data, addr):
+        try:
+            packet = OscPacket(data)
+        except ParseError:
+            return
+        self.received += 1
+        acked = None
+        trace = self.emulator.trace
+        for timed in packet.messages:
+            message = timed.message
+            address = message.address
+            if trace is not None:
+                trace.append((time.perf_counter(), self.k, address))
+            if address == '/initprog':
+                self.pending_send = list()
+                self.pending_receive = list()
+            elif address == '/send':
+                self.pending_send.append(list(message.params))
+            elif address == '/receive':
+                self.pending_receive.append(list(message.params))
+            elif address == '/commit':
+                self.send = self.pending_send
+                self.receive = self.pending_receive
+                self.commits += 1
+            if address in sbupload.ACKED:
+                acked = address
+        # One ack per datagram, for its last acknowledgeable message
+        if self.emulator.ack and acked and not self.transport.is_closing():
+            builder = OscMessageBuilder('/ack')
+            builder.add_arg(acked)
+            self.transport.sendto(builder.build().dgram,
+                                  (addr[0], self.emulator.ack_port))
+
+    def decoded(self):
+        # Committed program as .sbc lines
+        return ([decode_send(self.k, row) for row in self.send] +
+                [decode_receive(self.k, row) for row in self.receive])
+
+
+class Emulator:
+    def __init__(self, network='127.0.0.', ids=range(2, 255), port=sbupload.PORT,
+                 ack=True, ack_port=sbupload.ACK_PORT, latency=0.0, jitter=0.0,
+                 loss=0.0, reorder=0.0, seed=None):
+        self.network = network
+        self.ids = list(ids)
+        self.port = port
+        self.ack = ack
+        self.ack_port = ack_port
+        self.latency = latency
+        self.jitter = jitter
+        self.loss = loss
+        self.reorder = reorder
+        self.random = random.Random(seed)
+        # (time, module, address) of every message processed, when a list
+        self.trace = None
+        self.modules = dict()
+        self.transports = list()
+
+    async def start(self):
+        loop = asyncio.get_running_loop()
+        for k in self.ids:
+            transport, self.modules[k] = await loop.create_datagram_endpoint(
+                lambda k=k: Module(k, self), local_addr=(self.network + str(k), self.port))
+            self.transports.append(transport)
+        return self
+
+    def close(self):
+        for transport in self.transports:
+            transport.close()
+        self.transports = list()
+
+    def decoded(self):
+        # Committed programs of every module, as .sbc lines
+        lines = list()
+        for k in sorted(self.modules):
+            lines.extend(self.modules[k].decoded())
+        return lines
+
+
+async def main(args):
+    emulator = Emulator(args.network, parse_ids(args.ids), args.port,
+                        not args.no_ack, args.ack_port, args.latency,
+                        args.jitter, args.loss, args.reorder, args.seed)
+    await emulator.start()
+    print('Emulating ' + str(len(emulator.ids)) + ' modules on ' +
+          args.network + args.ids + ':' + str(args.port))
+    try:
+        await asyncio.Event().wait()
+    finally:
+        emulator.close()
+        if args.dump:
+            for line in emulator.decoded():
+                print(line)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='SoundBlocks module emulator')
+    parser.add_argument('--network', default='127.0.0.', help='network prefix (default 127.0.0.)')
+    parser.add_argument('--ids', default='2-254', help='module IDs, e.g. 2-254 or 101,105-108')
+    parser.add_argument('--port', type=int, default=sbupload.PORT)
+    parser.add_argument('--ack-port', type=int, default=sbupload.ACK_PORT)
+    parser.add_argument('--no-ack', action='store_true', help='do not acknowledge messages')
+    parser.add_argument('--latency', type=float, default=0.0, help='processing delay, in seconds')
+    parser.add_argument('--jitter', type=float, default=0.0, help='random extra delay, in seconds')
+    parser.add_argument('--loss', type=float, default=0.0, help='probability of dropping a packet')
+    parser.add_argument('--reorder', type=float, default=0.0, help='probability of delivering a packet late')
+    parser.add_argument('--seed', type=int, help='random seed for repeatable impairments')
+    parser.add_argument('--dump', action='store_true', help='print the committed programs on exit')
+    try:
+        asyncio.run(main(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,193 @@
+# Syntax highlighter for .sbc files
+#
+# Colors every line from the compiler's own tokens (module IDs, arrows,
+# sensors, actuators, ranges, maps and comments) and underlines the errors
+# compile_line finds in it, so the colors never disagree with verify.
+#
+# QSyntaxHighlighter only calls highlightBlock for the blocks an edit
+# touched, and .sbc lines don't depend on each other, so a block is never
+# rehighlighted because of its neighbours. Big changes (opening or pasting
+# thousands of lines) are the exception: after SLICE seconds of
+# highlighting in one go the remaining blocks are only marked PENDING, and
+# a timer highlights them in slices of the same length, the visible ones
+# first, between the events of the GUI.
+
+import time
+from PyQt5.QtCore import QTimer
+from PyQt5.QtGui import QSyntaxHighlighter, QTextCharFormat, QColor, QFont
+import sbcompiler
+
+SLICE = 0.02        # seconds of highlighting between events
+
+DONE = 0            # block states
+PENDING = 1
+
+COLORS = {
+    'module': ('#00007f', True),
+    'arrow': ('#7f007f', True),
+    'sensor': ('#006400', False),
+    'actuator': ('#00607f', False),
+    'range': ('#a04000', False),
+    'map': ('#7f3f00', False),
+    'comment': ('#808080', False),
+}
+
+
+def spans(text):
+    # (start, end, role) of the tokens of a line that get a color. Numbers
+    # and some punctuation take their role from the part of the line they
+    # are in: head, sensors, ids (send), source (receive), actuator or map.
+    out = list()
+    part = 'head'
+    send = True
+    for token in sbcompiler.tokenize(text):
+        kind = token.kind
+        role = None
+        if kind == 'comment':
+            role = 'comment'
+        elif kind == 'arrow':
+            role = 'arrow'
+            send = token.text == '->'
+            part = 'sensors'
+        elif kind == 'number':
+            if part in ('head', 'source'):
+                role = 'module'
+            elif part == 'ids':
+                role = 'range'
+            elif part == 'map':
+                role = 'map'
+        elif kind == 'name':
+            if part == 'sensors' and token.text in sbcompiler.SENSOR_CODES:
+                role = 'sensor'
+            elif part == 'actuator' and token.text in sbcompiler.ACTUATOR_CODES:
+                role = 'actuator'
+        elif kind == 'punct':
+            if token.text == ':' and part == 'sensors':
+                part = 'ids' if send else 'source'
+            elif token.text == '@' and part == 'source':
+                part = 'actuator'
+            elif token.text in '[]' and part in ('actuator', 'map'):
+                role = 'map'
+                part = 'map' if token.text == '[' else 'end'
+            elif token.text == '-' and part == 'ids':
+                role = 'range'
+        if role:
+            out.append((token.start, token.end, role))
+    return out
+
+
+class Highlighter(QSyntaxHighlighter):
+    # view is the QPlainTextEdit showing the document, if any: its
+    # visible blocks are caught up first.
+
+    def __init__(self, document, view=None):
+        super().__init__(document)
+        self.view = view
+        self.formats = dict()
+        for role, (color, bold) in COLORS.items():
+            f = QTextCharFormat()
+            f.setForeground(QColor(color))
+            if bold:
+                f.setFontWeight(QFont.Bold)
+            if role == 'comment':
+                f.setFontItalic(True)
+            self.formats[role] = f
+
+        self.started = None             # start of the current slice
+        self.deferring = False          # the slice is over
+        self.next = 0                   # no PENDING block before this one
+        self.timer = QTimer(self)
+        self.timer.setInterval(0)
+        self.timer.timeout.connect(self.catch_up)
+        document.contentsChange.connect(self.document_changed)
+
+    def highlightBlock(self, text):
+        if self.deferring:
+            self.setCurrentBlockState(PENDING)
+            return
+        now = time.perf_counter()
+        if self.started is None:
+            # First block since the GUI got control back
+            self.started = now
+            QTimer.singleShot(0, self.end_slice)
+        elif now - self.started > SLICE:
+            self.deferring = True
+            self.next = min(self.next, self.currentBlock().blockNumber())
+            self.timer.start()
+            self.setCurrentBlockState(PENDING)
+            return
+
+        for start, end, role in spans(text):
+            self.setFormat(start, end - start, self.formats[role])
+        line = sbcompiler.compile_line(text)
+        for start, end, _ in line.errors:
+            if end <= start:
+                start, end = 0, len(text)
+            self.underline(start, end)
+        self.setCurrentBlockState(DONE)
+
+    def underline(self, start, end):
+        # Adds a red wavy underline to the colors already set
+        while start < end:
+            current = self.format(start)
+            run = start + 1
+            while run < end and self.format(run) == current:
+                run += 1
+            f = QTextCharFormat(current)
+            f.setUnderlineStyle(QTextCharFormat.WaveUnderline)
+            f.setUnderlineColor(QColor('red'))
+            self.setFormat(start, run - start, f)
+            start = run
+
+    def end_slice(self):
+        self.started = None
+        self.deferring = False
+
+    def document_changed(self, position, removed, added):
+        # Runs after Qt has highlighted the blocks of the change, so the
+        # next change starts a slice of its own. Removed lines shift the
+        # PENDING blocks after them up.
+        self.end_slice()
+        document = self.document()
+        if document is None:
+            return
+        block = document.findBlock(position)
+        if block.isValid():
+            self.next = min(self.next, block.blockNumber())
+
+    def catch_up(self):
+        # Highlights PENDING blocks for one slice. Highlighting a block
+        # changes its state, so Qt goes on with the next one by itself
+        # until the slice is over.
+        self.end_slice()
+        self.started = time.perf_counter()
+        QTimer.singleShot(0, self.end_slice)
+        for block in self.visible_blocks():
+            if block.userState() == PENDING:
+                self.rehighlightBlock(block)
+        block = self.document().findBlockByNumber(self.next)
+        while block.isValid():
+            if time.perf_counter() - self.started > SLICE:
+                self.next = block.blockNumber()
+                return
+            if block.userState() == PENDING:
+                self.rehighlightBlock(block)
+                if block.userState() == PENDING:
+                    # Out of time before starting it
+                    self.next = block.blockNumber()
+                    return
+            block = block.next()
+        self.next = self.document().blockCount()
+        self.timer.stop()
+
+    def visible_blocks(self):
+        if self.view is None:
+            return
+        block = self.view.firstVisibleBlock()
+        offset = self.view.contentOffset()
+        height = self.view.viewport().height()
+        while block.isValid():
+            if self.view.blockBoundingGeometry(block).translated(offset).top() > height:
+                break
+            yield block
+            block = block.next()
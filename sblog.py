@@ -0,0 +1,86 @@
+# Console log sink
+#
+# The console used to get one insertPlainText, plus a scroll to the bottom,
+# per message: a layout pass for every row of a big upload, and a document
+# growing without limit. ConsoleLog collects the messages and appends them
+# all at once every FLUSH_INTERVAL ms, keeps only the last MAX_BLOCKS lines
+# on screen and, if asked, mirrors every message to a rotating .sblog file
+# next to the .sbc (LOG_BYTES each, LOG_BACKUPS old ones kept).
+
+import logging
+import logging.handlers
+import os
+from PyQt5.QtCore import QObject, QTimer
+
+FLUSH_INTERVAL = 50         # ms
+MAX_BLOCKS = 5000           # console lines kept
+LOG_BYTES = 1000000
+LOG_BACKUPS = 3
+
+
+def log_path(path):
+    return os.path.splitext(path)[0] + '.sblog'
+
+
+class ConsoleLog(QObject):
+
+    def __init__(self, console, interval=FLUSH_INTERVAL, max_blocks=MAX_BLOCKS):
+        super().__init__(console)
+        self.console = console
+        self.console.setMaximumBlockCount(max_blocks)
+        self.pending = list()
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(interval)
+        self.timer.timeout.connect(self.flush)
+        self.path = None
+        self.handler = None
+        self.logger = logging.getLogger('sblog.%x' % id(self))
+        self.logger.propagate = False
+        self.logger.setLevel(logging.INFO)
+
+    def write(self, text):
+        # One or more lines; a leading '\n' leaves a blank line before them
+        self.pending.append(text)
+        if self.handler:
+            self.logger.info(text.strip('\n'))
+        if not self.timer.isActive():
+            self.timer.start()
+
+    def flush(self):
+        self.timer.stop()
+        if not self.pending:
+            return
+        text = '\n'.join(self.pending)
+        self.pending = list()
+        self.console.appendPlainText(text)
+        scrollbar = self.console.verticalScrollBar()
+        scrollbar.setSliderPosition(scrollbar.maximum())
+
+    def clear(self):
+        self.timer.stop()
+        self.pending = list()
+        self.console.clear()
+
+    def set_file(self, path):
+        # Mirrors the messages to path (rotated), or stops if None. Raises
+        # OSError if the file can't be opened.
+        if path == self.path:
+            return
+        if self.handler:
+            self.logger.removeHandler(self.handler)
+            self.handler.close()
+            self.handler = None
+            self.path = None
+        if path:
+            handler = logging.handlers.RotatingFileHandler(path, maxBytes=LOG_BYTES,
+                                                           backupCount=LOG_BACKUPS,
+                                                           encoding='utf-8')
+            handler.setFormatter(logging.Formatter('%(asctime)s %(message)s'))
+            self.logger.addHandler(handler)
+            self.handler = handler
+            self.path = path
+
+    def close(self):
+        self.flush()
+        self.set_file(None)
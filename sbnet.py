@@ -0,0 +1,121 @@
+# Network interface inventory
+#
+# Lists the IPv4 addresses the configurator can upload from and watches
+# for changes (cables plugged, Wi-Fi joining or leaving). On Linux the
+# watcher sleeps on an rtnetlink socket subscribed to link and IPv4
+# address events; elsewhere, or if that socket can't be opened, it polls
+# every POLL_INTERVAL seconds. Either way it rescans and reports the new
+# inventory only when it differs from the last one it reported.
+#
+# Qt-free; sbworkers.InterfaceWorker runs the watcher for the editor.
+
+import select
+import socket
+
+POLL_INTERVAL = 5.0     # seconds between scans without rtnetlink
+SETTLE = 0.3            # seconds of quiet after an event before rescanning
+
+# rtnetlink multicast groups (linux/rtnetlink.h)
+
+NETLINK_ROUTE = 0
+RTMGRP_LINK = 0x1
+RTMGRP_IPV4_IFADDR = 0x10
+
+
+class Interface:
+    # An IPv4 address of a network interface
+
+    __slots__ = ('name', 'address', 'netmask')
+
+    def __init__(self, name, address, netmask=None):
+        self.name = name
+        self.address = address
+        self.netmask = netmask
+
+    @property
+    def network(self):
+        # Prefix the modules' addresses are built on, e.g. 192.168.1.
+        return self.address[0:self.address.rfind('.')+1]
+
+    def __eq__(self, other):
+        return (isinstance(other, Interface) and
+                (self.name, self.address, self.netmask) ==
+                (other.name, other.address, other.netmask))
+
+    def __hash__(self):
+        return hash((self.name, self.address))
+
+    def __repr__(self):
+        return 'Interface(%r, %r, %r)' % (self.name, self.address, self.netmask)
+
+
+def scan(loopback=False):
+    # Every IPv4 address of every interface, in the order the system lists
+    # them; loopback addresses only if asked for. Empty when there are none
+    # (or netifaces is missing).
+    try:
+        import netifaces
+    except ImportError:
+        return list()
+    interfaces = list()
+    for name in netifaces.interfaces():
+        try:
+            addrs = netifaces.ifaddresses(name)
+        except ValueError:
+            # Gone since it was listed
+            continue
+        for addr in addrs.get(netifaces.AF_INET, ()):
+            address = addr.get('addr')
+            if address and (loopback or not address.startswith('127.')):
+                interfaces.append(Interface(name, address, addr.get('netmask')))
+    return interfaces
+
+
+def _netlink():
+    # Socket subscribed to link and address changes, or None
+    try:
+        sock = socket.socket(socket.AF_NETLINK, socket.SOCK_RAW, NETLINK_ROUTE)
+    except (AttributeError, OSError):
+        return None
+    try:
+        sock.bind((0, RTMGRP_LINK | RTMGRP_IPV4_IFADDR))
+    except OSError:
+        sock.close()
+        return None
+    sock.setblocking(False)
+    return sock
+
+
+def _drain(sock, timeout):
+    # Waits until the events stop for timeout seconds, reading them all
+    while select.select([sock], [], [], timeout)[0]:
+        try:
+            while sock.recv(65536):
+                pass
+        except BlockingIOError:
+            pass
+
+
+def watch(changed, stop, poll=POLL_INTERVAL):
+    # Calls changed(interfaces) with a fresh scan, and then again every time
+    # the inventory changes, until the stop Event is set. Blocks; run it on
+    # its own thread.
+    current = scan()
+    changed(current)
+    sock = _netlink()
+    try:
+        while not stop.is_set():
+            if sock is not None:
+                # Wake up now and then to notice stop
+                if not select.select([sock], [], [], 0.5)[0]:
+                    continue
+                _drain(sock, SETTLE)
+            elif stop.wait(poll):
+                break
+            interfaces = scan()
+            if interfaces != current:
+                current = interfaces
+                changed(current)
+    finally:
+        if sock is not None:
+            sock.close()
@@ -0,0 +1,564 @@
+# SoundBlocks upload engine
+#
+# Programs the modules of an installation concurrently. Every module gets
+# its messages in strict order (/initprog, /send rows, /receive rows,
+# /commit, /endprog), but up to `jobs` modules are programmed at the same
+# time, so the total time follows the slowest module instead of the sum
+# of all of them.
+#
+# Optionally the modules acknowledge /initprog, /send, /receive and /commit
+# by replying "/ack <address>" to ACK_PORT on the uploader's host. With acks
+# enabled the next message goes out as soon as the ack arrives, and DELAY is
+# only the timeout used when it doesn't. A module that misses an ack before
+# /commit gets nothing more, so it keeps its old program.
+#
+# Datagrams are paced by token buckets, one per module and optionally one
+# for the whole upload, configured by a Pacing. Without acks a module gets
+# a fixed rate (one datagram every DELAY seconds by default). With acks the
+# rates adapt AIMD style: they grow a little with every ack and are cut on
+# a loss or when the round trip grows well past the best one seen (the
+# global rate only on the latter, a loss is one module's problem).
+#
+# All the traffic of an upload goes through one Transport: a single
+# non-blocking UDP socket bound to the selected interface that addresses
+# the modules with sendto and receives their acks (and anything else they
+# send) on the same port.
+#
+# Modules that support acks also answer "/ping" with "/ack /ping". A
+# discovery sweep pings a whole /24 at once and keeps the responders for
+# DISCOVERY_TTL seconds; uploads can use it to skip offline modules.
+#
+# In bundle mode everything up to /commit travels in as few OSC bundles as
+# fit in MTU bytes each, followed by /endprog on its own. A module acks a
+# bundle once, for the last message in it that would be acked on its own.
+
+import asyncio
+import hashlib
+import json
+import math
+import os
+import struct
+import time
+from pythonosc.osc_bundle_builder import OscBundleBuilder, IMMEDIATELY
+from pythonosc.osc_message import OscMessage, ParseError
+from pythonosc.osc_message_builder import OscMessageBuilder
+
+PORT = 12000        # OSC port of the modules
+ACK_PORT = 12001    # port where the uploader listens for acks
+DELAY = 0.5         # pause after each message (ack timeout), in seconds
+JOBS = 16           # modules programmed at the same time
+MTU = 1472          # largest bundle, in bytes (UDP payload on Ethernet)
+DISCOVERY_TIMEOUT = 1.0     # time to wait for pings, in seconds
+DISCOVERY_TTL = 30.0        # time a sweep stays valid, in seconds
+
+ACKED = ('/initprog', '/send', '/receive', '/commit', '/ping')
+
+# AIMD parameters of the adaptive rates
+
+INCREASE = 1.0      # datagrams per second added on each ack
+DECREASE = 0.5      # rate multiplier on a loss
+QUEUEING = 0.9      # rate multiplier when the round trip is growing
+RTT_GROWTH = 2.0    # round trip (smoothed) over the best one that counts as growing
+RTT_SLACK = 0.002   # ... plus this much, in seconds
+
+
+class Pacing:
+    # Rate limits of an installation, in datagrams per second.
+    #
+    # rate          each module, without acks
+    # ack_rate      each module with acks, the most it can adapt up to
+    # global_rate   all the modules together (0 = unlimited); adapts too
+    # minimum       the least an adaptive rate can be cut to
+    # adaptive      adapt the rates when acks are available
+
+    def __init__(self, rate=1/DELAY, ack_rate=200.0, global_rate=0.0,
+                 minimum=1.0, adaptive=True):
+        self.rate = rate
+        self.ack_rate = ack_rate
+        self.global_rate = global_rate
+        self.minimum = minimum
+        self.adaptive = adaptive
+
+    def to_dict(self):
+        return dict(vars(self))
+
+    @classmethod
+    def from_dict(cls, values):
+        # Values of the wrong type, and rates that can't be paced, keep
+        # their defaults
+        pacing = cls()
+        for key, value in values.items():
+            if not hasattr(pacing, key):
+                continue
+            try:
+                value = type(getattr(pacing, key))(value)
+            except (TypeError, ValueError):
+                continue
+            if key != 'adaptive' and not valid_rate(value, key == 'global_rate'):
+                continue
+            setattr(pacing, key, value)
+        return pacing
+
+
+def valid_rate(rate, unlimited=False):
+    # Finite and positive, or 0 where that means unlimited
+    return math.isfinite(rate) and (rate > 0 or unlimited and rate == 0)
+
+
+class RateLimiter:
+    # Token bucket. With adaptive set, acked() and lost() move the rate
+    # between minimum and maximum. Like TCP, the rate is cut at most once
+    # per round trip, so a burst of losses counts as one.
+
+    def __init__(self, rate, burst=1.0, minimum=None, maximum=None,
+                 adaptive=False):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.stamp = time.monotonic()
+        self.minimum = min(minimum or rate, rate)
+        self.maximum = max(maximum or rate, rate)
+        self.adaptive = adaptive
+        self.srtt = None
+        self.best = None
+        self.cut = 0.0
+
+    async def acquire(self):
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.stamp) * self.rate)
+            self.stamp = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def acked(self, rtt):
+        self.best = rtt if self.best is None else min(self.best, rtt)
+        self.srtt = rtt if self.srtt is None else 0.875 * self.srtt + 0.125 * rtt
+        if not self.adaptive:
+            return
+        if self.srtt > RTT_GROWTH * self.best + RTT_SLACK:
+            self.decrease(QUEUEING)
+        else:
+            self.rate = min(self.maximum, self.rate + INCREASE)
+
+    def lost(self):
+        if self.adaptive:
+            self.decrease(DECREASE)
+
+    def decrease(self, factor):
+        now = time.monotonic()
+        if now - self.cut >= (self.srtt or 0.0):
+            self.rate = max(self.minimum, self.rate * factor)
+            self.cut = now
+
+
+def program_messages(k, send, receive):
+    # Ordered list of (address, args) that programs module k
+    messages = [('/initprog', 0)]
+    for m in send.get(k, ()):
+        messages.append(('/send', m))
+    for m in receive.get(k, ()):
+        messages.append(('/receive', m))
+    messages.append(('/commit', 0))
+    messages.append(('/endprog', 0))
+    return messages
+
+
+# Wire format
+#
+# Every message carries int32 arguments only, so its datagram is a fixed
+# header (address and type tags) followed by the packed ints. Headers are
+# built once per address and argument count.
+
+_formats = dict()   # (address, count) -> (header, struct)
+
+_BUNDLE = OscBundleBuilder(IMMEDIATELY).build().dgram   # '#bundle' and time tag
+_SIZE = struct.Struct('>i')
+
+
+def message_dgram(address, args):
+    # Datagram of address with an int, a list of ints or a packed row
+    if isinstance(args, int):
+        args = (args,)
+    wire = _formats.get((address, len(args)))
+    if wire is None:
+        builder = OscMessageBuilder(address)
+        for _ in args:
+            builder.add_arg(0, 'i')
+        header = builder.build().dgram[:-4 * len(args)]
+        wire = _formats[(address, len(args))] = (header, struct.Struct('>%di' % len(args)))
+    header, packer = wire
+    return header + packer.pack(*args)
+
+
+def bundle_dgram(dgrams):
+    return _BUNDLE + b''.join(_SIZE.pack(len(dgram)) + dgram for dgram in dgrams)
+
+
+def program_packets(k, send, receive, bundle=False, mtu=MTU):
+    # Ordered list of (dgram, messages) that programs module k: dgram is
+    # the OSC message or bundle to send and messages the (address, args)
+    # it carries.
+    messages = program_messages(k, send, receive)
+    if not bundle:
+        return [(message_dgram(address, args), [(address, args)])
+                for address, args in messages]
+    packets = list()
+    dgrams = None
+    for address, args in messages[:-1]:
+        dgram = message_dgram(address, args)
+        # Bundle header (16) plus a size prefix (4) per element
+        if dgrams is None or size + 4 + len(dgram) > mtu:
+            if dgrams is not None:
+                packets.append((bundle_dgram(dgrams), carried))
+            dgrams = list()
+            size = len(_BUNDLE)
+            carried = list()
+        dgrams.append(dgram)
+        size += 4 + len(dgram)
+        carried.append((address, args))
+    packets.append((bundle_dgram(dgrams), carried))
+    address, args = messages[-1]
+    packets.append((message_dgram(address, args), [(address, args)]))
+    return packets
+
+
+class Transport(asyncio.DatagramProtocol):
+    # Shared socket of an upload. Acks resolve the future of the message
+    # waiting for them, matched by module IP and acknowledged address. A
+    # module never has more than one message in flight, and the uploader
+    # gives up on it at its first missed ack, so a late ack can't be taken
+    # for a newer message's. Any other OSC message is handed to
+    # telemetry(ip, message).
+
+    def __init__(self, port=PORT, telemetry=None):
+        self.port = port
+        self.telemetry = telemetry
+        self.transport = None
+        self.waiting = dict()
+        self.error = None
+
+    @classmethod
+    async def open(cls, local='0.0.0.0', local_port=0, **kwargs):
+        loop = asyncio.get_running_loop()
+        _, protocol = await loop.create_datagram_endpoint(
+            lambda: cls(**kwargs), local_addr=(local, local_port))
+        return protocol
+
+    def close(self):
+        self.transport.close()
+
+    async def wait_closed(self):
+        # The socket is released one loop iteration after close()
+        await self.closed
+
+    def connection_made(self, transport):
+        self.transport = transport
+        self.closed = asyncio.get_running_loop().create_future()
+
+    def connection_lost(self, exc):
+        if not self.closed.done():
+            self.closed.set_result(True)
+
+    def send(self, ip, dgram):
+        # Returns the error if the datagram could not be sent (a bad
+        # address, the interface gone). asyncio reports a failed sendto
+        # through error_received before sendto returns.
+        self.error = None
+        self.transport.sendto(dgram, (ip, self.port))
+        return self.error
+
+    def error_received(self, exc):
+        self.error = exc
+
+    def expect(self, ip, address):
+        future = asyncio.get_running_loop().create_future()
+        self.waiting[(ip, address)] = future
+        return future
+
+    def datagram_received(self, data, addr):
+        try:
+            message = OscMessage(data)
+        except ParseError:
+            return
+        if message.address == '/ack' and message.params:
+            future = self.waiting.pop((addr[0], message.params[0]), None)
+            if future and not future.done():
+                future.set_result(True)
+        elif self.telemetry:
+            self.telemetry(addr[0], message)
+
+
+class Uploader:
+    def __init__(self, network, port=PORT, jobs=JOBS, delay=DELAY,
+                 ack=False, local='0.0.0.0', ack_port=ACK_PORT,
+                 bundle=False, discover=False, pacing=None, progress=None,
+                 telemetry=None):
+        self.network = network
+        self.port = port
+        self.jobs = max(1, jobs)
+        self.delay = delay
+        self.pacing = pacing or Pacing(rate=1/delay)
+        self.limiter = None
+        self.bundle = bundle
+        self.discover = discover
+        self.ack = ack
+        self.local = local
+        self.ack_port = ack_port
+        # progress(k, address, args) is called after every message sent
+        self.progress = progress
+        self.telemetry = telemetry
+        # (k, address) of the messages whose ack timed out
+        self.missed = list()
+        # Modules left out because the upload was cancelled
+        self.skipped = list()
+        # Modules known to be programmed: every ack came back or, without
+        # acks, they answered the discovery sweep
+        self.programmed = list()
+        # Modules sent to without acks or a sweep; they may not even exist
+        self.unconfirmed = list()
+        # Modules left out because they didn't answer the discovery sweep
+        self.offline = list()
+        # Modules stopped before /commit by a missed ack; they keep their
+        # old program
+        self.uncommitted = list()
+        # (k, error) of the modules a datagram couldn't be sent to
+        self.failed = list()
+        self.cancelled = False
+        self.aborted = False
+        self.transport = None
+        # Seconds spent in each phase of run(): open, discovery, upload, close
+        self.phases = dict()
+
+    def cancel(self):
+        # Modules already being programmed are finished, the rest skipped.
+        # Safe to call from another thread.
+        self.cancelled = True
+
+    def abort(self):
+        # Stops every module between two messages, leaving the ones in
+        # progress uncommitted (they keep their old program). Safe to call
+        # from another thread.
+        self.cancelled = True
+        self.aborted = True
+
+    def module_limiter(self):
+        pacing = self.pacing
+        if self.ack:
+            return RateLimiter(pacing.ack_rate, minimum=pacing.minimum,
+                               adaptive=pacing.adaptive)
+        return RateLimiter(pacing.rate)
+
+    async def wait_ack(self, ip, k, address, future, limiter, sent):
+        try:
+            await asyncio.wait_for(future, self.delay)
+        except asyncio.TimeoutError:
+            self.transport.waiting.pop((ip, address), None)
+            self.missed.append((k, address))
+            # A loss is blamed on the module alone; the global rate only
+            # backs off when round trips grow, i.e. when the network queues
+            limiter.lost()
+            return False
+        rtt = time.monotonic() - sent
+        limiter.acked(rtt)
+        if self.limiter:
+            self.limiter.acked(rtt)
+        return True
+
+    async def upload_module(self, k, packets, semaphore):
+        async with semaphore:
+            if self.cancelled:
+                self.skipped.append(k)
+                return
+            ip = self.network + str(k)
+            limiter = self.module_limiter()
+            complete = True
+            for dgram, messages in packets:
+                acked = [address for address, _ in messages if address in ACKED]
+                address = acked[-1] if acked else messages[-1][0]
+                await limiter.acquire()
+                if self.limiter:
+                    await self.limiter.acquire()
+                if self.aborted:
+                    self.skipped.append(k)
+                    return
+                future = None
+                if self.ack and acked:
+                    future = self.transport.expect(ip, address)
+                error = self.transport.send(ip, dgram)
+                if error:
+                    self.transport.waiting.pop((ip, address), None)
+                    self.failed.append((k, str(error)))
+                    return
+                sent = time.monotonic()
+                if self.progress:
+                    for message_address, args in messages:
+                        self.progress(k, message_address, args)
+                if future:
+                    if not await self.wait_ack(ip, k, address, future, limiter, sent):
+                        complete = False
+                        if address != '/commit':
+                            # Committing with a row missing would be worse
+                            # than keeping the old program
+                            self.uncommitted.append(k)
+                            return
+            if complete and (self.ack or self.discover):
+                self.programmed.append(k)
+            elif complete:
+                self.unconfirmed.append(k)
+
+    def phase(self, name, start):
+        now = time.perf_counter()
+        self.phases[name] = self.phases.get(name, 0.0) + now - start
+        return now
+
+    async def run(self, send, receive, keylist):
+        start = time.perf_counter()
+        # Acks come back to ack_port; without them any free port will do
+        self.transport = await Transport.open(
+            self.local, self.ack_port if self.ack or self.discover else 0,
+            port=self.port, telemetry=self.telemetry)
+        start = self.phase('open', start)
+        pacing = self.pacing
+        if pacing.global_rate > 0:
+            self.limiter = RateLimiter(pacing.global_rate, burst=self.jobs,
+                                       minimum=min(pacing.minimum, pacing.global_rate),
+                                       adaptive=self.ack and pacing.adaptive)
+        try:
+            if self.discover:
+                alive = cached_sweep(self.network)
+                if alive is None:
+                    alive = await sweep(self.transport, self.network)
+                self.offline = [k for k in keylist if k not in alive]
+                keylist = [k for k in keylist if k in alive]
+                start = self.phase('discovery', start)
+            semaphore = asyncio.Semaphore(self.jobs)
+            await asyncio.gather(*(
+                self.upload_module(k, program_packets(k, send, receive,
+                                                      self.bundle),
+                                   semaphore)
+                for k in keylist))
+            start = self.phase('upload', start)
+        finally:
+            self.transport.close()
+            await self.transport.wait_closed()
+            self.transport = None
+            self.phase('close', start)
+
+
+# Discovery
+
+_sweeps = dict()    # network -> (time, modules that answered)
+
+
+async def sweep(transport, network, ids=range(2, 255),
+                timeout=DISCOVERY_TIMEOUT, attempts=2):
+    # Pings every module at once, twice for the ones that stay silent, and
+    # returns the sorted list of those that answered.
+    alive = set()
+    pending = list(ids)
+    ping = message_dgram('/ping', 0)
+    for attempt in range(attempts):
+        if not pending:
+            break
+        futures = dict()
+        for k in pending:
+            futures[transport.expect(network + str(k), '/ping')] = k
+            transport.send(network + str(k), ping)
+        await asyncio.wait(futures, timeout=timeout / attempts)
+        for future, k in futures.items():
+            if future.done():
+                alive.add(k)
+            else:
+                transport.waiting.pop((network + str(k), '/ping'), None)
+        pending = [k for k in pending if k not in alive]
+    _sweeps[network] = (time.monotonic(), alive)
+    return sorted(alive)
+
+
+def cached_sweep(network, ttl=DISCOVERY_TTL):
+    # Modules found by the last sweep of network, or None if it is too old
+    entry = _sweeps.get(network)
+    if entry and time.monotonic() - entry[0] < ttl:
+        return sorted(entry[1])
+    return None
+
+
+async def discover(network, local='0.0.0.0', ack_port=ACK_PORT, port=PORT,
+                   ttl=DISCOVERY_TTL, **kwargs):
+    alive = cached_sweep(network, ttl)
+    if alive is None:
+        transport = await Transport.open(local, ack_port, port=port)
+        try:
+            alive = await sweep(transport, network, **kwargs)
+        finally:
+            transport.close()
+            await transport.wait_closed()
+    return alive
+
+
+# Differential uploads
+#
+# The state sidecar of a .sbc file records, per network, a hash of the
+# program last uploaded successfully to each module, so modules whose
+# program didn't change can be left alone.
+
+def program_hash(k, send, receive):
+    digest = hashlib.sha1()
+    for row in send.get(k, ()):
+        digest.update(b'S' + bytes(row))
+    for row in receive.get(k, ()):
+        digest.update(b'R' + bytes(row))
+    return digest.hexdigest()
+
+
+def state_path(path):
+    return os.path.splitext(path)[0] + '.sbstate'
+
+
+def load_state(path):
+    # {network: {module: hash}}; a missing or broken sidecar is empty
+    try:
+        with open(state_path(path), 'r') as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return dict()
+    return state if isinstance(state, dict) else dict()
+
+
+def save_state(path, state):
+    with open(state_path(path), 'w') as f:
+        json.dump(state, f, indent=1, sort_keys=True)
+
+
+def pacing_path(path):
+    return os.path.splitext(path)[0] + '.sbpacing'
+
+
+def load_pacing(path):
+    # Pacing of the installation in path; defaults if it has none
+    try:
+        with open(pacing_path(path), 'r') as f:
+            values = json.load(f)
+        return Pacing.from_dict(values)
+    except (OSError, ValueError, TypeError, AttributeError):
+        return Pacing()
+
+
+def save_pacing(path, pacing):
+    with open(pacing_path(path), 'w') as f:
+        json.dump(pacing.to_dict(), f, indent=1, sort_keys=True)
+
+
+def changed_modules(keylist, send, receive, hashes):
+    # Modules of keylist whose program is not the one recorded in hashes
+    return [k for k in keylist
+            if hashes.get(str(k)) != program_hash(k, send, receive)]
+
+
+def upload(network, send, receive, keylist, **kwargs):
+    uploader = Uploader(network, **kwargs)
+    asyncio.run(uploader.run(send, receive, keylist))
+    return uploader
@@ -0,0 +1,94 @@
+# Background workers of the configurator
+#
+# QObjects meant to be moved to their own QThread, so compiling and
+# uploading never run on the GUI thread.
+#
+# The upload engine (asyncio and python-osc) is only imported by
+# UploadWorker, when it first runs, so the editor can start validating
+# without loading it.
+
+import threading
+from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot
+import sbcompiler
+import sbnet
+
+
+class ValidationWorker(QObject):
+    # Mirrors the editor's document in an IncrementalCompiler and compiles
+    # it on request. Edits and requests arrive through queued signals, in
+    # the order the GUI sent them; every result carries the revision of the
+    # document it was compiled from.
+
+    compiled = pyqtSignal(int, object)
+
+    def __init__(self):
+        super().__init__()
+        self.compiler = sbcompiler.IncrementalCompiler([''])
+
+    @pyqtSlot(list)
+    def reset(self, texts):
+        self.compiler.reset(texts)
+
+    @pyqtSlot(int, int, list)
+    def splice(self, first, removed, texts):
+        self.compiler.splice(first, removed, texts)
+
+    @pyqtSlot(int)
+    def compile(self, revision):
+        self.compiled.emit(revision, self.compiler.compile(sbcompiler.MAX_ERRORS))
+
+
+class UploadWorker(QObject):
+    # Runs an sbupload.Uploader, or a discovery sweep, on its own asyncio
+    # loop. The uploader's progress callback should be the progress
+    # signal's emit, so every message sent is reported to the GUI thread;
+    # cancelling is done by calling uploader.cancel() directly.
+
+    progress = pyqtSignal(int, str, object)
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+    discovered = pyqtSignal(str, list)
+    discover_failed = pyqtSignal(str, str)
+
+    @pyqtSlot(object, object, object, object)
+    def run(self, uploader, send, receive, keylist):
+        import asyncio
+        try:
+            asyncio.run(uploader.run(send, receive, keylist))
+        except Exception as e:
+            # Whatever happens the GUI must hear the upload is over
+            self.failed.emit(str(e) or type(e).__name__)
+        else:
+            self.finished.emit(uploader)
+
+    @pyqtSlot(str, str, float)
+    def discover(self, network, local, ttl):
+        # Runs on the same thread as uploads, so they never compete for
+        # the ack port
+        import asyncio
+        import sbupload
+        try:
+            alive = asyncio.run(sbupload.discover(network, local, ttl=ttl))
+        except Exception as e:
+            self.discover_failed.emit(network, str(e) or type(e).__name__)
+        else:
+            self.discovered.emit(network, alive)
+
+
+class InterfaceWorker(QObject):
+    # Runs the sbnet watcher, which keeps its thread busy until stop() is
+    # called (from any thread). changed carries the first scan and then
+    # every inventory that differs from the previous one.
+
+    changed = pyqtSignal(list)
+
+    def __init__(self):
+        super().__init__()
+        self.stopping = threading.Event()
+
+    @pyqtSlot()
+    def watch(self):
+        sbnet.watch(self.changed.emit, self.stopping)
+
+    def stop(self):
+        self.stopping.set()